@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Versioned name alias tables.
+
+Alternate spellings that the generators map by hand (Wikipedia PC names,
+India Post district names) live in JSON files under scripts/aliases/, one per
+entity type, keyed by state code:
+
+  {
+    "version": 1,
+    "entity": "pc_name",
+    "states": {
+      "TN": {"tiruvallur": "thiruvallur", ...},
+      ...
+    }
+  }
+
+Keys starting with "_" are comments. Each file is compiled once into a
+(state, alias) -> canonical dict; lookups without a state fall back to the
+union of all states. Every hit is counted, so a run can report aliases that
+never fired and are candidates for pruning:
+
+  pc_aliases = load_aliases("pc_names")
+  pc_aliases.resolve("TN", "tiruvallur")   -> 'thiruvallur'
+  print_alias_usage(pc_aliases)
+"""
+
+import json
+import os
+from collections import Counter
+
+from build_manifest import file_digest
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ALIAS_DIR = os.path.join(SCRIPT_DIR, "aliases")
+ALIAS_VERSION = 1
+
+
+class AliasTable:
+    """Compiled per-state alias lookup with usage counts."""
+
+    def __init__(self, path):
+        self.path = path
+        self.digest = file_digest(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get("version") != ALIAS_VERSION:
+            raise ValueError(f"{path}: unsupported alias file version {data.get('version')!r}")
+        self.entity = data.get("entity", os.path.splitext(os.path.basename(path))[0])
+
+        self._by_state = {}   # (state code, alias) -> canonical
+        self._any_state = {}  # alias -> (state code, canonical), for callers without a state
+        for state, aliases in data["states"].items():
+            for alias, canonical in aliases.items():
+                if alias.startswith("_"):
+                    continue
+                if alias == canonical:
+                    raise ValueError(f"{path}: {state} alias {alias!r} maps to itself")
+                self._by_state[(state, alias)] = canonical
+                self._any_state.setdefault(alias, (state, canonical))
+        self.hits = Counter()  # (state code, alias) -> lookups that used it
+
+    def __len__(self):
+        return len(self._by_state)
+
+    def resolve(self, state, name):
+        """Canonical spelling of name in state (a code, or None), else name."""
+        if state is not None:
+            canonical = self._by_state.get((state, name))
+            if canonical is None:
+                return name
+            self.hits[(state, name)] += 1
+            return canonical
+        entry = self._any_state.get(name)
+        if entry is None:
+            return name
+        self.hits[(entry[0], name)] += 1
+        return entry[1]
+
+    def unused(self):
+        """Sorted [(state code, alias)] that no lookup used in this run."""
+        return sorted(key for key in self._by_state if key not in self.hits)
+
+
+_tables = {}
+
+
+def load_aliases(entity, alias_dir=ALIAS_DIR):
+    """The AliasTable for scripts/aliases/<entity>.json, loaded once per process."""
+    path = os.path.join(alias_dir, f"{entity}.json")
+    if path not in _tables:
+        _tables[path] = AliasTable(path)
+    return _tables[path]
+
+
+def print_alias_usage(table):
+    """Report which aliases fired and which look dead."""
+    unused = table.unused()
+    print(f"  {table.entity} aliases: {len(table) - len(unused)}/{len(table)} used")
+    for (state, alias), count in sorted(table.hits.items()):
+        print(f"    {state}: {alias} ({count}x)")
+    if unused:
+        print(f"  Unused {table.entity} aliases (candidates for pruning):")
+        for state, alias in unused:
+            print(f"    {state}: {alias}")
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark and regression check for the page extractors.
+
+Runs extract_constituency_names, extract_ac_districts and extract_ac_to_pc
+over the frozen pages in scripts/fixtures/wiki (see make_bench_fixtures.py),
+with the parsed-records memo turned off so every run is a real parse, and
+reports throughput in rows/sec and pages/sec (best of --repeat runs).
+
+Results are compared with scripts/fixtures/bench_baseline.json. The run
+fails (exit 1) when an extractor returns no rows or a different number of
+rows than the baseline, or when its pages/sec drops more than --max-slowdown
+below it. Every fixture page has every column, so an empty projection is a
+parse failure, and --update-baseline refuses to record one.
+Speeds are machine-dependent: refresh the baseline on the machine that runs
+the check with --update-baseline.
+
+Usage:
+  python scripts/bench_extractors.py
+  python scripts/bench_extractors.py --repeat 50 --max-slowdown 0.2
+  python scripts/bench_extractors.py --update-baseline
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+
+from constituency_table import set_records_cache
+from generate_assembly_data import extract_constituency_names
+from generate_district_mapping import extract_ac_districts
+from generate_pc_ac_mapping import extract_ac_to_pc
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(SCRIPT_DIR, "fixtures", "wiki")
+BASELINE_PATH = os.path.join(SCRIPT_DIR, "fixtures", "bench_baseline.json")
+
+# (fixture, state name, AC count)
+FIXTURES = [
+    ("uttar_pradesh", "Uttar Pradesh", 403),
+    ("karnataka", "Karnataka", 224),
+    ("assam", "Assam", 126),
+]
+
+
+def _district_rows(page, count, state):
+    by_number, by_name = extract_ac_districts(page, count, state)
+    return len(by_number) + len(by_name)
+
+
+# extractor name -> fn(page, count, state) returning the number of rows extracted
+EXTRACTORS = {
+    "names": lambda page, count, state: len(extract_constituency_names(page, count, state) or ()),
+    "districts": _district_rows,
+    "ac_to_pc": lambda page, count, state: len(extract_ac_to_pc(page, count)),
+}
+
+
+def best_of(fn, repeat):
+    """Best time of repeat calls, with the GC paused as timeit does."""
+    best = float('inf')
+    result = None
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - t0)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return best, result
+
+
+def run(repeat):
+    """{fixture: {extractor: {"rows", "ms", "rows_per_sec", "pages_per_sec"}}}."""
+    set_records_cache(False)
+    results = {}
+    for fixture, state, count in FIXTURES:
+        with open(os.path.join(FIXTURE_DIR, f"{fixture}.html"), 'r', encoding='utf-8') as f:
+            page = f.read()
+        results[fixture] = {}
+        for name, extract in EXTRACTORS.items():
+            seconds, rows = best_of(lambda: extract(page, count, state), repeat)
+            results[fixture][name] = {
+                "rows": rows,
+                "ms": round(seconds * 1000, 3),
+                "rows_per_sec": round(rows / seconds) if seconds else 0,
+                "pages_per_sec": round(1 / seconds, 1) if seconds else 0,
+            }
+    return results
+
+
+def empty_projections(results):
+    """[(fixture, extractor, problem)] for extractors that returned no rows."""
+    return [(fixture, name, "extracted no rows")
+            for fixture, by_extractor in results.items()
+            for name, result in by_extractor.items() if not result["rows"]]
+
+
+def compare(results, baseline, max_slowdown):
+    """[(fixture, extractor, problem)] for results that regressed."""
+    problems = empty_projections(results)
+    for fixture, by_extractor in results.items():
+        for name, result in by_extractor.items():
+            expected = baseline.get(fixture, {}).get(name)
+            if expected is None:
+                problems.append((fixture, name, "not in baseline"))
+                continue
+            if result["rows"] != expected["rows"]:
+                problems.append((fixture, name,
+                                 f"extracted {result['rows']} rows, baseline {expected['rows']}"))
+            floor = expected["pages_per_sec"] * (1 - max_slowdown)
+            if result["pages_per_sec"] < floor:
+                problems.append((fixture, name,
+                                 f"{result['pages_per_sec']} pages/sec, below {floor:.1f} "
+                                 f"(baseline {expected['pages_per_sec']})"))
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the extractors on frozen pages.")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per page, best time reported")
+    parser.add_argument("--max-slowdown", type=float, default=0.3,
+                        help="fail when pages/sec falls this fraction below the baseline (default: 0.3)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON path")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write this run's results as the new baseline")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    print(f"{'page':<15} {'extractor':<10} {'rows':>5} {'ms':>8} {'rows/sec':>10} {'pages/sec':>10}")
+    for fixture, by_extractor in results.items():
+        for name, r in by_extractor.items():
+            print(f"{fixture:<15} {name:<10} {r['rows']:>5} {r['ms']:>8.2f} "
+                  f"{r['rows_per_sec']:>10} {r['pages_per_sec']:>10.1f}")
+
+    if args.update_baseline:
+        empty = empty_projections(results)
+        if empty:
+            print(f"\nNot writing a baseline: {', '.join(f'{f} {n}' for f, n, _ in empty)} extracted no rows")
+            return 1
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+            f.write("\n")
+        print(f"\nWrote baseline to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except OSError:
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline first")
+        return 1
+
+    problems = compare(results, baseline, args.max_slowdown)
+    if problems:
+        print(f"\n{len(problems)} regressions against {os.path.relpath(args.baseline)}:")
+        for fixture, name, problem in problems:
+            print(f"  {fixture} {name}: {problem}")
+        return 1
+    print(f"\nNo regressions against {os.path.relpath(args.baseline)} "
+          f"(max slowdown {args.max_slowdown:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark constituency geometry tiling: tile sizes and build time.
+
+Builds full-size synthetic PC and AC boundary files (make_geometry_fixture.py,
+all states) in a temporary directory, or takes real ones, then runs
+generate_constituency_geometry.py's stages on each without writing assets:
+read and project, shared-border simplification, then every tiling in
+TILINGS. Per tiling it reports the tile count, tile sizes (raw and gzip)
+and the mean bytes fetched to show one state, i.e. the tiles whose bbox
+intersects the state's.
+
+Usage:
+  python scripts/bench_geometry_tiles.py
+  python scripts/bench_geometry_tiles.py --pc pcs.geojson --ac acs.geojson
+"""
+
+import argparse
+import gzip
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+from data_assets import encode_json
+from generate_constituency_geometry import build_geometry, build_tiles, load_features, tile_by_state
+from make_geometry_fixture import build_fixture, write_geojson
+from simplify_map_paths import parse_path
+
+# (label, tiling, max features per quadtree tile)
+TILINGS = [
+    ("state", "state", None),
+    ("quad-16", "quadtree", 16),
+    ("quad-64", "quadtree", 64),
+    ("quad-256", "quadtree", 256),
+]
+
+
+def _intersects(a, b):
+    return a[0] <= b[2] and a[2] >= b[0] and a[1] <= b[3] and a[3] >= b[1]
+
+
+def bench_level(path, level, tolerance, min_area):
+    """Print one level's build times and a row per tiling."""
+    args = argparse.Namespace(id_field="id", number_field=None, state_field="state")
+    start = time.perf_counter()
+    features, _ = load_features(path, level, args, {})
+    read_s = time.perf_counter() - start
+    start = time.perf_counter()
+    geometry = build_geometry(features, tolerance, min_area)
+    simplify_s = time.perf_counter() - start
+    points = sum(len(ring) for row, _ in geometry for ring in parse_path(row["path"]))
+    print(f"\n{level.upper()}: {len(features)} features from {os.path.basename(path)} "
+          f"({os.path.getsize(path) / 1024:.0f} KB); read+project {read_s:.2f}s, "
+          f"topology+simplify {simplify_s:.2f}s, {points} points")
+
+    state_views = [bbox for bbox, _ in tile_by_state(geometry).values()]
+    print(f"  {'tiling':<9} {'tiles':>5} {'min KB':>7} {'med KB':>7} {'max KB':>7} {'total KB':>9} "
+          f"{'gzip KB':>8} {'state view KB':>14} {'tile s':>7}")
+    for label, tiling, max_features in TILINGS:
+        start = time.perf_counter()
+        tiles = build_tiles(geometry, tiling, max_features)
+        payloads = {key: encode_json(rows) for key, (_, rows) in tiles.items()}
+        tile_s = time.perf_counter() - start
+        sizes = [len(p) for p in payloads.values()]
+        gzipped = sum(len(gzip.compress(p)) for p in payloads.values())
+        view_bytes = [sum(len(payloads[key]) for key, (bbox, _) in tiles.items() if _intersects(bbox, view))
+                      for view in state_views]
+        print(f"  {label:<9} {len(tiles):>5} {min(sizes) / 1024:>7.1f} {statistics.median(sizes) / 1024:>7.1f} "
+              f"{max(sizes) / 1024:>7.1f} {sum(sizes) / 1024:>9.1f} {gzipped / 1024:>8.1f} "
+              f"{statistics.mean(view_bytes) / 1024:>14.1f} {tile_s:>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark constituency geometry tiling.")
+    parser.add_argument("--pc", help="PC boundary GeoJSON (default: synthetic, all states)")
+    parser.add_argument("--ac", help="AC boundary GeoJSON (default: synthetic, all states)")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="simplification tolerance (default: 0.15)")
+    parser.add_argument("--min-area", type=float, default=0.05, help="smallest unshared ring kept (default: 0.05)")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="geometry-tiles-bench-")
+    try:
+        paths = {"pc": args.pc, "ac": args.ac}
+        for level in ("pc", "ac"):
+            if not paths[level]:
+                start = time.perf_counter()
+                paths[level] = os.path.join(tmp_dir, f"{level}_boundaries.geojson")
+                write_geojson(paths[level], build_fixture(level))
+                print(f"  built in {time.perf_counter() - start:.1f}s")
+        for level in ("pc", "ac"):
+            bench_level(paths[level], level, args.tolerance, args.min_area)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
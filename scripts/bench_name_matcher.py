@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark PC name matching: the legacy global-dict + substring scan vs.
+name_matcher.NameMatcher as used by generate_pc_ac_mapping.
+
+Builds a pipeline-shaped workload from constituencies.js: 8 AC rows per PC,
+each carrying the PC name as Wikipedia might spell it (verbatim, with
+"(SC)", upper-cased with hyphens as spaces, or with one letter dropped).
+Reports lookups that resolve to the right PC, to a wrong PC, or to none.
+
+Usage:
+  python scripts/bench_name_matcher.py
+"""
+
+import random
+import time
+
+from canonical_store import read_lok_sabha_js
+from generate_pc_ac_mapping import (
+    MIN_PC_MATCH_SCORE, normalize_pc_name, state_code_of,
+)
+from aliases import load_aliases
+from name_matcher import NameMatcher
+
+
+def legacy_matcher(pcs):
+    """The pre-NameMatcher lookup, kept for comparison."""
+    pc_aliases = load_aliases("pc_names")
+    lok_sabha = {pc.name: pc.id for pc in pcs}
+    pc_name_to_id = {}
+    for name, pc_id in lok_sabha.items():
+        pc_name_to_id[name.lower()] = pc_id
+        pc_name_to_id[normalize_pc_name(name).lower()] = pc_id
+
+    def match(state_code, pc_name):
+        pc_name_norm = normalize_pc_name(pc_name).lower()
+        pc_name_norm = pc_aliases.resolve(None, pc_name_norm)
+        pc_id = pc_name_to_id.get(pc_name_norm)
+        if not pc_id:
+            for name, pid in pc_name_to_id.items():
+                if pid.startswith(state_code + '-') and (
+                    name == pc_name_norm or pc_name_norm in name or name in pc_name_norm
+                ):
+                    return pid
+        return pc_id
+    return match
+
+
+def indexed_matcher(pcs):
+    pc_aliases = load_aliases("pc_names")
+    matcher = NameMatcher()
+    for pc in pcs:
+        matcher.add(state_code_of(pc.id), normalize_pc_name(pc.name), pc.id)
+    memo = {}
+
+    def match(state_code, pc_name):
+        key = (state_code, pc_name)
+        if key not in memo:
+            pc_name_norm = normalize_pc_name(pc_name).lower()
+            pc_name_norm = pc_aliases.resolve(state_code, pc_name_norm)
+            memo[key] = matcher.match(state_code, pc_name_norm, MIN_PC_MATCH_SCORE)
+        m = memo[key]
+        return m.value if m and not m.ambiguous else None
+    return match
+
+
+def build_workload(pcs, rows_per_pc=8, seed=1):
+    rng = random.Random(seed)
+    queries = []
+    for pc in pcs:
+        name = pc.name
+        variants = [name, name + " (SC)", name.replace('-', ' ').upper()]
+        if len(name) > 6:
+            i = rng.randrange(1, len(name) - 1)
+            variants.append(name[:i] + name[i + 1:])
+        for _ in range(rows_per_pc):
+            queries.append((state_code_of(pc.id), rng.choice(variants), pc.id))
+    return queries
+
+
+def main():
+    pcs = read_lok_sabha_js()
+    queries = build_workload(pcs)
+    print(f"{len(queries)} AC rows over {len(pcs)} PCs")
+    print(f"{'matcher':<9} {'ms':>7} {'correct':>8} {'wrong':>6} {'unmatched':>10}")
+    for label, factory in (("legacy", legacy_matcher), ("indexed", indexed_matcher)):
+        start = time.perf_counter()
+        match = factory(pcs)
+        results = [match(code, name) for code, name, _ in queries]
+        elapsed = (time.perf_counter() - start) * 1000
+        correct = sum(r == expected for r, (_, _, expected) in zip(results, queries))
+        wrong = sum(r is not None and r != expected for r, (_, _, expected) in zip(results, queries))
+        print(f"{label:<9} {elapsed:>7.1f} {correct:>8} {wrong:>6} {len(queries) - correct - wrong:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark pincodeDistricts.js encodings: size, parse time and lookup speed.
+
+Renders the same PIN table with every encoding in PIN_ENCODINGS, then, in a
+fresh node process per encoding, times the module import and a lookup pass
+over every listed PIN plus as many random 6-digit PINs. Lookups of listed PINs
+must agree across encodings; the number of unlisted PINs that resolve (only
+possible with gap-filling ranges) is reported.
+
+Usage:
+  python scripts/bench_pin_encoding.py                  # synthetic full-size CSV
+  python scripts/bench_pin_encoding.py pincode.csv      # a real directory file
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+
+from bench_pincode_loader import write_synthetic_csv
+from build_manifest import join_lines
+from generate_district_mapping import PIN_ENCODINGS, PIN_STATE_NAMES
+from pincode_loader import load_pin_districts
+
+NODE_HARNESS = r"""
+const [modulePath, pinsPath, rounds] = process.argv.slice(2);
+const { listed, random } = JSON.parse(require('fs').readFileSync(pinsPath, 'utf8'));
+const t0 = performance.now();
+import(modulePath).then(({ lookupPinDistrict }) => {
+  const parseMs = performance.now() - t0;
+  const resolved = listed.map((p) => {
+    const r = lookupPinDistrict(p);
+    return r && r.district + '|' + r.state;
+  });
+  let unlistedHits = 0;
+  for (const p of random) if (lookupPinDistrict(p)) unlistedHits++;
+  const t1 = performance.now();
+  let hits = 0;
+  for (let n = 0; n < rounds; n++) {
+    for (const p of listed) if (lookupPinDistrict(p)) hits++;
+    for (const p of random) if (lookupPinDistrict(p)) hits++;
+  }
+  const lookupMs = performance.now() - t1;
+  const lookups = rounds * (listed.length + random.length);
+  console.log(JSON.stringify({ parseMs, nsPerLookup: lookupMs * 1e6 / lookups,
+                               unlistedHits, resolved }));
+});
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PIN map encodings.")
+    parser.add_argument("csv", nargs="?", help="pincode CSV (default: synthetic)")
+    parser.add_argument("--rounds", type=int, default=20, help="lookup passes (default: 20)")
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp(prefix="pin-encoding-bench-")
+    try:
+        csv_path = args.csv
+        if not csv_path:
+            csv_path = os.path.join(tmp_dir, "pincode_full.csv")
+            write_synthetic_csv(csv_path)
+        rows = list(load_pin_districts(csv_path, PIN_STATE_NAMES).items())
+        listed = {pin for pin, _, _ in rows}
+        rng = random.Random(11)
+        unlisted = []
+        while len(unlisted) < len(rows):
+            pin = rng.randrange(100000, 1000000)
+            if pin not in listed:
+                unlisted.append(pin)
+
+        pins_path = os.path.join(tmp_dir, "pins.json")
+        with open(pins_path, 'w') as f:
+            json.dump({"listed": sorted(listed), "random": unlisted}, f)
+        harness_path = os.path.join(tmp_dir, "harness.cjs")
+        with open(harness_path, 'w') as f:
+            f.write(NODE_HARNESS)
+
+        print(f"{len(rows)} listed PINs, {len(unlisted)} unlisted probes, {args.rounds} rounds")
+        print(f"{'encoding':<13} {'bytes':>9} {'gzip':>8} {'parse ms':>9} "
+              f"{'ns/lookup':>10} {'unlisted hits':>14}")
+        reference = None
+        for encoding, render in PIN_ENCODINGS.items():
+            content = "".join(join_lines(render(rows)[0]))
+            module_path = os.path.join(tmp_dir, f"pincodeDistricts.{encoding}.mjs")
+            with open(module_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            raw = content.encode('utf-8')
+            out = subprocess.run(
+                ["node", harness_path, module_path, pins_path, str(args.rounds)],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(out)
+            if reference is None:
+                reference = result["resolved"]
+            elif result["resolved"] != reference:
+                raise SystemExit(f"{encoding}: listed PIN lookups differ from {next(iter(PIN_ENCODINGS))}")
+            print(f"{encoding:<13} {len(raw):>9} {len(gzip.compress(raw)):>8} "
+                  f"{result['parseMs']:>9.1f} {result['nsPerLookup']:>10.0f} "
+                  f"{result['unlistedHits']:>14}")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark PIN directory loading: legacy DictReader dict-of-dicts vs.
+pincode_loader.load_pin_districts.
+
+Each loader runs in its own child process so peak RSS (ru_maxrss) is measured
+per loader rather than for the benchmark as a whole. The child then loads a
+second time under tracemalloc to report the peak Python heap of the load
+itself, which RSS rounds away on small inputs.
+
+Usage:
+  python scripts/bench_pincode_loader.py                # synthetic full-size CSV
+  python scripts/bench_pincode_loader.py pincode.csv    # a real directory file
+"""
+
+import argparse
+import csv
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+COLUMNS = ["circlename", "regionname", "divisionname", "officename", "pincode",
+           "officetype", "delivery", "district", "statename", "latitude", "longitude"]
+
+
+def write_synthetic_csv(path, rows=155000, pins=19300, seed=7):
+    """Write an India Post-shaped CSV: ~8 post offices per PIN, ~1% conflicts."""
+    from generate_district_mapping import PIN_STATE_NAMES
+
+    rng = random.Random(seed)
+    states = list(PIN_STATE_NAMES)
+    # ~25 districts per state; like the real directory, PINs are clustered by
+    # state and mostly by district, with ~5% of PINs out of their block
+    districts = [(f"District {s[:3]}{i:02d}", s) for s in states for i in range(25)]
+    pin_list = sorted(rng.sample(range(110000, 860000), pins))
+    per_state = len(pin_list) // len(states) + 1
+    pin_district = {}
+    for i, pin in enumerate(pin_list):
+        state = states[min(i // per_state, len(states) - 1)]
+        block = (i % per_state) * 25 // per_state
+        if rng.random() < 0.05:
+            block = rng.randrange(25)
+        pin_district[pin] = (f"District {state[:3]}{block:02d}", state)
+
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for n in range(rows):
+            pin = pin_list[n % pins] if n < pins else rng.choice(pin_list)
+            district, state = pin_district[pin]
+            if rng.random() < 0.01:
+                district, state = rng.choice(districts)
+            writer.writerow([
+                f"{state.title()} Circle", "Region", "Division", f"Office {n} B.O",
+                pin, "BO", "Delivery", district.upper() if n % 2 else district, state,
+                f"{rng.uniform(8, 35):.4f}", f"{rng.uniform(68, 97):.4f}",
+            ])
+
+
+def legacy_load(csv_path):
+    """The pre-pincode_loader build_pincode_to_district, kept for comparison."""
+    from generate_district_mapping import PIN_STATE_NAMES
+
+    pin_to_district = {}
+    with open(csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            pin = row['pincode'].strip()
+            district = row['district'].strip().title()
+            state = PIN_STATE_NAMES.get(row['statename'].strip())
+            if not state or not pin or len(pin) != 6:
+                continue
+            if pin not in pin_to_district:
+                pin_to_district[pin] = {'district': district, 'state': state}
+    return pin_to_district
+
+
+def streaming_load(csv_path):
+    from generate_district_mapping import PIN_STATE_NAMES
+    from pincode_loader import load_pin_districts
+
+    return load_pin_districts(csv_path, PIN_STATE_NAMES)
+
+
+def run_child(loader, csv_path):
+    """Load in this process and print 'seconds pins max_rss_kb heap_peak_kb'."""
+    load = {"legacy": legacy_load, "streaming": streaming_load}[loader]
+    start = time.perf_counter()
+    result = load(csv_path)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    pins = len(result)
+    del result
+
+    tracemalloc.start()
+    load(csv_path)
+    heap_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{elapsed:.4f} {pins} {peak} {heap_peak // 1024}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PIN directory loaders.")
+    parser.add_argument("csv", nargs="?", help="pincode CSV (default: synthetic)")
+    parser.add_argument("--rows", type=int, default=155000)
+    parser.add_argument("--pins", type=int, default=19300)
+    parser.add_argument("--child", choices=["legacy", "streaming"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.csv)
+        return
+
+    tmp_dir = None
+    csv_path = args.csv
+    if not csv_path:
+        tmp_dir = tempfile.mkdtemp(prefix="pincode-bench-")
+        csv_path = os.path.join(tmp_dir, "pincode_full.csv")
+        write_synthetic_csv(csv_path, args.rows, args.pins)
+    print(f"{csv_path}: {os.path.getsize(csv_path) / 1024 / 1024:.1f} MB")
+
+    print(f"{'loader':<10} {'load s':>8} {'PINs':>7} {'peak RSS MB':>12} {'heap peak MB':>13}")
+    for loader in ("legacy", "streaming"):
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), csv_path, "--child", loader],
+            cwd=SCRIPT_DIR, check=True, capture_output=True, text=True,
+        ).stdout.split()
+        seconds, pins, peak_kb, heap_kb = float(out[0]), int(out[1]), int(out[2]), int(out[3])
+        print(f"{loader:<10} {seconds:>8.3f} {pins:>7} {peak_kb / 1024:>12.1f} {heap_kb / 1024:>13.1f}")
+
+    if tmp_dir:
+        os.remove(csv_path)
+        os.rmdir(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
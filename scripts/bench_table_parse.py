@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark table parsing: legacy regex scraping vs. the streaming extractor.
+
+Times, per page, the full row-building pass that extract_ac_to_pc and
+extract_ac_districts used to do (regex <tr> findall, regex cells, parse_cell
+per cell, rowspan carry) against html_tables.iter_table_rows.
+
+Usage:
+  python scripts/bench_table_parse.py                  # every page in the wiki cache
+  python scripts/bench_table_parse.py page1.html ...   # specific HTML files
+"""
+
+import argparse
+import html as html_module
+import os
+import re
+import sys
+import time
+
+from html_tables import iter_table_rows
+from wiki_fetch import get_cache
+
+
+def legacy_parse_cell(cell_html):
+    attrs_match = re.match(r'<t[hd]([^>]*)>', cell_html)
+    attrs = attrs_match.group(1) if attrs_match else ''
+    rowspan = 1
+    rs_match = re.search(r'rowspan\s*=\s*["\']?(\d+)', attrs)
+    if rs_match:
+        rowspan = int(rs_match.group(1))
+    inner = re.sub(r'^<t[hd][^>]*>', '', cell_html)
+    inner = re.sub(r'</t[hd]>$', '', inner)
+    text = re.sub(r'<[^>]+>', '', inner).strip()
+    text = html_module.unescape(text)
+    text = re.sub(r'\[\d+\]', '', text).strip()
+    return text, rowspan
+
+
+def legacy_rows(page_html):
+    """The pre-html_tables row builder, kept verbatim for comparison."""
+    rows = re.findall(r'<tr[^>]*>(.*?)</tr>', page_html, re.DOTALL)
+    carry = {}
+    out = []
+    for row_html in rows:
+        cells_raw = re.findall(r'<t[hd][^>]*>.*?</t[hd]>', row_html, re.DOTALL)
+        full_row = []
+        col_idx = 0
+        cell_idx = 0
+        while col_idx < 12:
+            if col_idx in carry:
+                val, remaining = carry[col_idx]
+                full_row.append(val)
+                remaining -= 1
+                if remaining <= 0:
+                    del carry[col_idx]
+                else:
+                    carry[col_idx] = (val, remaining)
+                col_idx += 1
+            elif cell_idx < len(cells_raw):
+                text, rowspan = legacy_parse_cell(cells_raw[cell_idx])
+                full_row.append(text)
+                if rowspan > 1:
+                    carry[col_idx] = (text, rowspan - 1)
+                cell_idx += 1
+                col_idx += 1
+            else:
+                break
+        out.append(full_row)
+    return out
+
+
+def streaming_rows(page_html):
+    return [row.texts for row in iter_table_rows(page_html)]
+
+
+def best_of(fn, arg, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(arg)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def cached_pages():
+    cache = get_cache()
+    pages = []
+    for url in sorted(cache._index):
+        body = cache.fetch(url)
+        if body:
+            pages.append((url.rsplit('/', 1)[-1], body.decode('utf-8', errors='replace')))
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark legacy vs. streaming table parsing.")
+    parser.add_argument("files", nargs="*", help="HTML files (default: all cached Wikipedia pages)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per page, best time reported")
+    args = parser.parse_args()
+
+    if args.files:
+        pages = []
+        for path in args.files:
+            with open(path, 'r', encoding='utf-8') as f:
+                pages.append((os.path.basename(path), f.read()))
+    else:
+        pages = cached_pages()
+    if not pages:
+        print("No pages to benchmark (cache is empty; pass HTML files explicitly)")
+        return 1
+
+    print(f"{'page':<60} {'KB':>6} {'rows':>6} {'legacy ms':>10} {'stream ms':>10} {'speedup':>8}")
+    total_legacy = total_stream = 0.0
+    for name, page in pages:
+        t_legacy, rows_legacy = best_of(legacy_rows, page, args.repeat)
+        t_stream, rows_stream = best_of(streaming_rows, page, args.repeat)
+        total_legacy += t_legacy
+        total_stream += t_stream
+        print(f"{name[:60]:<60} {len(page) / 1024:>6.0f} {len(rows_stream):>6} "
+              f"{t_legacy * 1000:>10.2f} {t_stream * 1000:>10.2f} "
+              f"{t_legacy / t_stream if t_stream else 0:>7.1f}x")
+
+    print(f"\n{len(pages)} pages: legacy {total_legacy * 1000:.1f} ms, "
+          f"streaming {total_stream * 1000:.1f} ms "
+          f"({total_legacy / total_stream if total_stream else 0:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Build manifest for incremental regeneration.
+
+Records, per generated output, the SHA-256 of every state's source page and
+of every state's rendered section:
+
+  {
+    "version": 1,
+    "outputs": {
+      "pcToAcMapping.js": {
+        "inputs":   {"constituencies.js": "<sha>"},
+        "sources":  {"AP": "<page sha>", ...},
+        "sections": {"AP": "<section sha>", ...},
+        "file": "<sha of the whole output>"
+      }
+    }
+  }
+
+A generator asks which states' pages changed since the last run, re-parses
+only those, reuses the existing output for the rest, and skips the write when
+the rendered file is byte-identical to what is on disk. Outputs are written
+with write_if_changed(), which replaces a file atomically (temp file, fsync,
+rename), so an interrupted run never leaves a truncated data file behind.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MANIFEST_PATH = os.path.join(SCRIPT_DIR, ".cache", "manifest.json")
+MANIFEST_VERSION = 1
+
+
+def digest(data):
+    """SHA-256 hex digest of a str or bytes value."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path):
+    """SHA-256 of a file's bytes, or None if it does not exist."""
+    h = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+@contextmanager
+def file_lock(path):
+    """Exclusive advisory lock on path + ".lock", across processes."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path + ".lock", 'a') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _read_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get("version") == MANIFEST_VERSION:
+            return data
+    except (OSError, ValueError):
+        pass
+    return {"version": MANIFEST_VERSION, "outputs": {}}
+
+
+class BuildManifest:
+    """Per-output record of source and section hashes from the last run."""
+
+    def __init__(self, path=DEFAULT_MANIFEST_PATH):
+        self.path = path
+        self.data = _read_manifest(path)
+        self._updated = set()  # outputs this run recorded, merged back on save
+
+    def output(self, name):
+        return self.data["outputs"].setdefault(
+            name, {"inputs": {}, "sources": {}, "sections": {}, "file": None}
+        )
+
+    def inputs_changed(self, name, inputs):
+        """True if any whole-run input (e.g. constituencies.js) changed."""
+        return self.output(name)["inputs"] != inputs
+
+    def changed_sources(self, name, source_digests):
+        """Return the set of keys whose source digest differs from last run."""
+        previous = self.output(name)["sources"]
+        return {key for key, sha in source_digests.items() if previous.get(key) != sha}
+
+    def changed_sections(self, name, section_digests):
+        """Return keys whose rendered section digest differs from last run."""
+        previous = self.output(name)["sections"]
+        return {key for key, sha in section_digests.items() if previous.get(key) != sha}
+
+    def update(self, name, inputs=None, source_digests=None, section_digests=None, file_sha=None):
+        self._updated.add(name)
+        out = self.output(name)
+        if inputs is not None:
+            out["inputs"] = dict(inputs)
+        if source_digests is not None:
+            out["sources"].update(source_digests)
+        if section_digests is not None:
+            out["sections"] = dict(section_digests)
+        if file_sha is not None:
+            out["file"] = file_sha
+
+    def save(self):
+        """Write the outputs updated by this run, keeping entries that other
+        generators (possibly running concurrently) saved meanwhile."""
+        with file_lock(self.path):
+            data = _read_manifest(self.path)
+            for name in self._updated:
+                data["outputs"][name] = self.data["outputs"][name]
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        self.data = data
+
+
+class SectionHasher:
+    """Per-section SHA-256 of lines as an emitter streams them.
+
+    A section's digest equals digest("\\n".join(its lines)), so streamed
+    outputs record the same section hashes as rendered ones.
+    """
+
+    def __init__(self):
+        self._hashes = {}
+
+    def add(self, key, line):
+        h = self._hashes.get(key)
+        if h is None:
+            h = self._hashes[key] = hashlib.sha256()
+        else:
+            h.update(b"\n")
+        h.update(line.encode('utf-8'))
+
+    def digests(self):
+        return {key: h.hexdigest() for key, h in self._hashes.items()}
+
+
+def join_lines(lines):
+    """Stream lines as "\\n".join(lines) would, one chunk per line."""
+    lines = iter(lines)
+    for line in lines:
+        yield line
+        break
+    for line in lines:
+        yield "\n" + line
+
+
+def _fsync_dir(path):
+    """Persist a rename in path's directory (not supported everywhere)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_if_changed(path, content):
+    """Atomically replace path with content unless it already holds these bytes.
+
+    content is a str, bytes, or an iterable of str/bytes chunks, which is
+    streamed. It goes to a temp file in the same directory, is fsynced and
+    renamed over path, so readers (and an interrupted run) only ever see
+    the old file or the complete new one. Returns True if the file was written.
+    """
+    old_sha = file_digest(path)
+    if isinstance(content, (str, bytes)):
+        if old_sha == digest(content):
+            return False
+        content = (content,)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp",
+                                    dir=directory)
+    try:
+        h = hashlib.sha256()
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in content:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                h.update(chunk)
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        if h.hexdigest() == old_sha:
+            os.remove(tmp_path)
+            return False
+        # mkstemp creates 0600; keep the mode a plain open() would give
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_dir(directory)
+    return True
+
+
+def add_incremental_arguments(parser):
+    group = parser.add_argument_group("Incremental regeneration")
+    group.add_argument("--force", action="store_true",
+                       help="re-parse every state even if its source page is unchanged")
+    group.add_argument("--manifest", default=DEFAULT_MANIFEST_PATH,
+                       help="build manifest path (default: scripts/.cache/manifest.json)")
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Canonical intermediate dataset for the generator pipeline (SQLite).
+
+The generators used to recover their inputs by regex-parsing the JavaScript
+files written by earlier runs. Instead, every stage now reads and writes this
+database, and the JS files under src/data are emitted from it:
+
+  states(code, name, ac_count)
+  pcs(id, name, state)                  Lok Sabha constituencies
+  pc_pin_prefixes(pc_id, prefix)        3-digit PIN prefixes per PC
+  acs(id, state_code, ac_no, name, state, district, reservation)
+  pc_ac(pc_id, ac_id)                   PC -> AC edges
+  pin_districts(pin, district, state)   6-digit PIN -> district
+
+On a fresh checkout the database does not exist yet; open_store() imports the
+checked-in JS files once (import_from_js) so incremental runs have a baseline.
+The import runs under a lock on the database file and is recorded by a
+'seeded' meta row written after every table, so generators opening the
+store concurrently (see pipeline.py) never see a half-seeded store.
+"""
+
+import os
+import re
+import sqlite3
+from collections import namedtuple
+
+from build_manifest import file_lock
+from string_table import AC_KEY_BASE, ac_id, check_table_digest, js_tokens, read_string_table_js
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.join(SCRIPT_DIR, "..")
+DATA_DIR = os.path.join(PROJECT_DIR, "src", "data")
+DEFAULT_DB_PATH = os.path.join(SCRIPT_DIR, "build", "canonical.sqlite")
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS states (
+    code TEXT PRIMARY KEY, name TEXT NOT NULL UNIQUE, ac_count INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS pcs (
+    id TEXT PRIMARY KEY, name TEXT NOT NULL, state TEXT NOT NULL, seq INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS pc_pin_prefixes (
+    pc_id TEXT NOT NULL, prefix TEXT NOT NULL, seq INTEGER NOT NULL,
+    PRIMARY KEY (pc_id, prefix));
+CREATE TABLE IF NOT EXISTS acs (
+    id TEXT PRIMARY KEY, state_code TEXT NOT NULL, ac_no INTEGER NOT NULL,
+    name TEXT NOT NULL, state TEXT NOT NULL, district TEXT, reservation TEXT,
+    seq INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS pc_ac (
+    pc_id TEXT NOT NULL, ac_id TEXT NOT NULL, PRIMARY KEY (pc_id, ac_id));
+CREATE TABLE IF NOT EXISTS pin_districts (
+    pin INTEGER PRIMARY KEY, district TEXT NOT NULL, state TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS acs_state ON acs (state_code, ac_no);
+CREATE INDEX IF NOT EXISTS pc_ac_ac ON pc_ac (ac_id);
+"""
+
+State = namedtuple('State', ['code', 'name', 'ac_count'])
+Pc = namedtuple('Pc', ['id', 'name', 'state', 'pin_ranges'])
+Ac = namedtuple('Ac', ['id', 'name', 'state', 'ac_no', 'district', 'reservation'])
+PinDistrict = namedtuple('PinDistrict', ['pin', 'district', 'state'])
+
+
+class CanonicalStore:
+    """Typed access to the canonical SQLite dataset."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        self.conn.execute("INSERT OR IGNORE INTO meta VALUES ('schema_version', ?)",
+                          (str(SCHEMA_VERSION),))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def is_empty(self):
+        return self.conn.execute("SELECT COUNT(*) FROM acs").fetchone()[0] == 0
+
+    def is_seeded(self):
+        """Whether the one-time import (or an older store's first run) completed."""
+        if self.conn.execute("SELECT 1 FROM meta WHERE key = 'seeded'").fetchone():
+            return True
+        # Stores written before the meta row existed: every table populated
+        return not self.is_empty() and self.conn.execute("SELECT 1 FROM pc_ac LIMIT 1").fetchone() is not None
+
+    def mark_seeded(self):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('seeded', '1')")
+
+    # -- loaders -------------------------------------------------------------
+
+    def load_states(self):
+        return [State(*r) for r in self.conn.execute(
+            "SELECT code, name, ac_count FROM states ORDER BY rowid")]
+
+    def load_pcs(self):
+        prefixes = {}
+        for pc_id, prefix in self.conn.execute(
+                "SELECT pc_id, prefix FROM pc_pin_prefixes ORDER BY pc_id, seq"):
+            prefixes.setdefault(pc_id, []).append(prefix)
+        return [Pc(pc_id, name, state, prefixes.get(pc_id, []))
+                for pc_id, name, state in self.conn.execute(
+                    "SELECT id, name, state FROM pcs ORDER BY seq")]
+
+    def load_acs(self):
+        return [Ac(*r) for r in self.conn.execute(
+            "SELECT id, name, state, ac_no, district, reservation FROM acs ORDER BY seq")]
+
+    def iter_ac_entries(self):
+        """ACs as generator entry dicts (id, name, state, acNo[, district]),
+        streamed from a cursor in output order."""
+        for ac, name, state, ac_no, district in self.conn.execute(
+                "SELECT id, name, state, ac_no, district FROM acs ORDER BY seq"):
+            entry = {'id': ac, 'name': name, 'state': state, 'acNo': ac_no}
+            if district:
+                entry['district'] = district
+            yield entry
+
+    def load_ac_entries(self):
+        return list(self.iter_ac_entries())
+
+    def count_acs_by_state(self):
+        """{state name: AC count}, in output order."""
+        return dict(self.conn.execute(
+            "SELECT state, COUNT(*) FROM acs GROUP BY state ORDER BY MIN(seq)"))
+
+    def load_pc_to_ac(self):
+        """PC ID -> sorted list of AC IDs."""
+        mapping = {}
+        for pc_id, ac in self.conn.execute(
+                "SELECT pc_id, ac_id FROM pc_ac ORDER BY pc_id, ac_id"):
+            mapping.setdefault(pc_id, []).append(ac)
+        return mapping
+
+    def load_pin_districts(self):
+        return [PinDistrict(*r) for r in self.conn.execute(
+            "SELECT pin, district, state FROM pin_districts ORDER BY pin")]
+
+    # -- writers -------------------------------------------------------------
+
+    def save_states(self, states):
+        """states: iterable of (code, name, ac_count, ...) config tuples."""
+        with self.conn:
+            self.conn.execute("DELETE FROM states")
+            self.conn.executemany("INSERT INTO states VALUES (?, ?, ?)",
+                                  [tuple(s[:3]) for s in states])
+
+    def save_pcs(self, pcs):
+        with self.conn:
+            self.conn.execute("DELETE FROM pcs")
+            self.conn.execute("DELETE FROM pc_pin_prefixes")
+            for seq, pc in enumerate(pcs):
+                self.conn.execute("INSERT INTO pcs VALUES (?, ?, ?, ?)",
+                                  (pc.id, pc.name, pc.state, seq))
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO pc_pin_prefixes VALUES (?, ?, ?)",
+                    [(pc.id, prefix, i) for i, prefix in enumerate(pc.pin_ranges)])
+
+    def save_acs(self, entries):
+        """Replace the AC table from generator entries.
+
+        entries are dicts with id/name/state/acNo and optional district and
+        reservation. A missing district keeps the value already stored, so the
+        names stage does not wipe districts written by the district stage.
+        """
+        with self.conn:
+            ids = []
+            for seq, e in enumerate(entries):
+                ids.append((e['id'],))
+                self.conn.execute(
+                    """INSERT INTO acs VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT(id) DO UPDATE SET
+                         state_code = excluded.state_code, ac_no = excluded.ac_no,
+                         name = excluded.name, state = excluded.state, seq = excluded.seq,
+                         district = COALESCE(excluded.district, acs.district),
+                         reservation = COALESCE(excluded.reservation, acs.reservation)""",
+                    (e['id'], e['id'].split('-', 1)[0], e['acNo'], e['name'], e['state'],
+                     e.get('district'), e.get('reservation'), seq))
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep_ids (id TEXT PRIMARY KEY)")
+            self.conn.execute("DELETE FROM keep_ids")
+            self.conn.executemany("INSERT OR IGNORE INTO keep_ids VALUES (?)", ids)
+            self.conn.execute("DELETE FROM acs WHERE id NOT IN (SELECT id FROM keep_ids)")
+
+    def save_pc_to_ac(self, pc_to_ac):
+        with self.conn:
+            self.conn.execute("DELETE FROM pc_ac")
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO pc_ac VALUES (?, ?)",
+                [(pc_id, ac) for pc_id, ac_ids in pc_to_ac.items() for ac in ac_ids])
+
+    def save_pin_districts(self, rows):
+        """rows: iterable of (pin, district, state), e.g. PinDistrictTable.items()."""
+        with self.conn:
+            self.conn.execute("DELETE FROM pin_districts")
+            self.conn.executemany("INSERT INTO pin_districts VALUES (?, ?, ?)", rows)
+
+
+# -- one-time import from the checked-in JS files --------------------------------
+
+def read_lok_sabha_js(path=os.path.join(DATA_DIR, "constituencies.js")):
+    """Parse constituencies.js (a hand-maintained source file) into Pc tuples."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    pcs = []
+    for match in re.finditer(
+        r'\{ id: "([^"]+)", name: "([^"]+)", state: "([^"]+)", pinRanges: \[([^\]]*)\]',
+        content
+    ):
+        pcs.append(Pc(match.group(1), match.group(2), match.group(3),
+                      re.findall(r'"(\d+)"', match.group(4))))
+    return pcs
+
+
+def read_assembly_js(path=os.path.join(DATA_DIR, "assemblyConstituencies.js")):
+    entries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    if "const _a = [" in content:
+        return _decode_assembly_js(content, os.path.join(os.path.dirname(path), "stringTable.js"))
+    # One object literal per AC, as written before dictionary encoding
+    # (with or without district)
+    for match in re.finditer(
+        r'\{ id: "([^"]+)", name: \'((?:[^\'\\]|\\.)*)\', state: \'([^\']*)\','
+        r'(?:\s*district: \'((?:[^\'\\]|\\.)*)\',)?\s*acNo: (\d+) \}',
+        content
+    ):
+        entry = {
+            'id': match.group(1),
+            'name': match.group(2).replace("\\'", "'"),
+            'state': match.group(3),
+            'acNo': int(match.group(5)),
+        }
+        if match.group(4):
+            entry['district'] = match.group(4).replace("\\'", "'")
+        entries.append(entry)
+    return entries
+
+
+def _decode_assembly_js(content, table_path):
+    """Entries from the dictionary-encoded format (see string_table.py)."""
+    check_table_digest(content, "assemblyConstituencies.js", table_path)
+    strings = read_string_table_js(table_path)
+    acs = js_tokens(content, "_a")
+    states = js_tokens(content, "_st")
+    entries = []
+    k = 0
+    for i in range(0, len(states), 3):
+        state, code = strings[states[i]], strings[states[i + 1]]
+        for ac_no in range(1, states[i + 2] + 1):
+            entry = {'id': ac_id(code, ac_no), 'name': acs[k], 'state': state, 'acNo': ac_no}
+            if acs[k + 1] >= 0:
+                entry['district'] = strings[acs[k + 1]]
+            entries.append(entry)
+            k += 2
+    return entries
+
+
+def read_pc_to_ac_js(path=os.path.join(DATA_DIR, "pcToAcMapping.js")):
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    pc_to_ac = {}
+    if "const _m = [" in content:
+        table_path = os.path.join(os.path.dirname(path), "stringTable.js")
+        check_table_digest(content, "pcToAcMapping.js", table_path)
+        strings = read_string_table_js(table_path)
+        values = js_tokens(content, "_m")
+        i = 0
+        while i < len(values):
+            keys = values[i + 2:i + 2 + values[i + 1]]
+            pc_to_ac[strings[values[i]]] = [
+                ac_id(strings[key // AC_KEY_BASE], key % AC_KEY_BASE) for key in keys]
+            i += 2 + values[i + 1]
+        return pc_to_ac
+    for match in re.finditer(r"^  '([^']+)': \[([^\]]*)\],$", content, re.MULTILINE):
+        pc_to_ac[match.group(1)] = re.findall(r"'([^']+)'", match.group(2))
+    return pc_to_ac
+
+
+def import_from_js(store):
+    """Seed an empty store from the JS files currently in src/data."""
+    print(f"Seeding {os.path.relpath(store.path)} from src/data/*.js...")
+    store.save_pcs(read_lok_sabha_js())
+    store.save_acs(read_assembly_js())
+    mapping_path = os.path.join(DATA_DIR, "pcToAcMapping.js")
+    if os.path.exists(mapping_path):
+        store.save_pc_to_ac(read_pc_to_ac_js(mapping_path))
+    store.mark_seeded()
+
+
+def open_store(path=None, states=None):
+    """Open the canonical store, seeding it from src/data on first use.
+
+    constituencies.js is a hand-maintained input, so the PC table is refreshed
+    from it on every open.
+    """
+    path = path or DEFAULT_DB_PATH
+    store = CanonicalStore(path)
+    if path == ':memory:':
+        import_from_js(store)
+    else:
+        # Check and seed under one lock: a second process waits here and then
+        # finds the store fully seeded
+        with file_lock(path):
+            if not store.is_seeded():
+                import_from_js(store)
+            else:
+                store.save_pcs(read_lok_sabha_js())
+    if states is not None:
+        store.save_states(states)
+    return store
+
+
+def add_store_arguments(parser):
+    parser.add_argument("--db", default=None,
+                        help="canonical dataset path (default: scripts/build/canonical.sqlite)")
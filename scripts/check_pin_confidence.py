@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Regression check: the confidence tags of generate_pin_constituencies.py.
+
+Resolves a handful of PINs against a small synthetic state, one per
+CONFIDENCE_LEVELS case, and compares the (confidence, PCs, ACs) each gets
+with the expected one. In particular a district that spans several PCs but
+is narrowed to one by the PIN's 3-digit prefix must be "district+prefix",
+not "exact". Exits 1 on any mismatch.
+
+Usage:
+  python scripts/check_pin_confidence.py
+"""
+
+import sys
+
+from canonical_store import Ac
+from generate_pin_constituencies import CONFIDENCE_LEVELS, build_district_index, resolve_pin_candidates
+
+# Goa: district Alpha lies in GA-01 only, Beta in GA-01 and GA-02, Gamma in
+# GA-01, GA-02 and GA-03
+ACS = [
+    Ac("GA-AC-001", "One", "Goa", 1, "Alpha", None),
+    Ac("GA-AC-002", "Two", "Goa", 2, "Beta", None),
+    Ac("GA-AC-003", "Three", "Goa", 3, "Beta", None),
+    Ac("GA-AC-004", "Four", "Goa", 4, "Gamma", None),
+    Ac("GA-AC-005", "Five", "Goa", 5, "Gamma", None),
+    Ac("GA-AC-006", "Six", "Goa", 6, "Gamma", None),
+]
+PC_TO_AC = {
+    "GA-01": ["GA-AC-001", "GA-AC-002", "GA-AC-004"],
+    "GA-02": ["GA-AC-003", "GA-AC-005"],
+    "GA-03": ["GA-AC-006"],
+}
+PREFIX_PCS = {"403": ["GA-01"], "404": ["GA-01", "GA-02"], "405": ["GA-04"]}
+
+# (pin, district, state) -> (confidence, PC IDs, AC IDs)
+CASES = [
+    ((403001, "Alpha", "Goa"), ("exact", ("GA-01",), ("GA-AC-001",))),
+    ((403002, "Beta", "Goa"), ("district+prefix", ("GA-01",), ("GA-AC-002",))),
+    ((405001, "Beta", "Goa"), ("district", ("GA-01", "GA-02"), ("GA-AC-002", "GA-AC-003"))),
+    ((404001, "Gamma", "Goa"), ("district", ("GA-01", "GA-02"), ("GA-AC-004", "GA-AC-005"))),
+    ((405002, "Delta", "Goa"), ("prefix", ("GA-04",), ())),
+]
+
+
+def main():
+    district_index = build_district_index(ACS, PC_TO_AC)
+    rows = [case[0] for case in CASES]
+    resolved = {pin: (confidence, pc_ids, ac_ids) for pin, confidence, pc_ids, ac_ids
+                in resolve_pin_candidates(rows, district_index, PREFIX_PCS, PC_TO_AC)}
+
+    problems = []
+    for (pin, district, state), expected in CASES:
+        got = resolved.get(pin)
+        if got != expected:
+            problems.append(f"{pin} ({district}, {state}): expected {expected}, got {got}")
+    missing = set(CONFIDENCE_LEVELS) - {expected[0] for _, expected in CASES}
+    if missing:
+        problems.append(f"no case for confidence levels: {', '.join(sorted(missing))}")
+
+    if problems:
+        print(f"{len(problems)} problems:")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+    print(f"All {len(CASES)} PINs resolved with the expected confidence")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
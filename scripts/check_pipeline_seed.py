@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Regression check: concurrent stages against an empty canonical store.
+
+On a fresh checkout the assembly and pc_ac stages start side by side and
+both open scripts/build/canonical.sqlite before it exists. This copies
+scripts/ and src/data/ into a temporary project without .cache or build,
+then, offline:
+
+  1. starts generate_assembly_data.py and generate_pc_ac_mapping.py at the
+     same moment against the empty store (open_store's seeding lock), and
+  2. runs `pipeline.py assembly pc_ac` in a second fresh copy (the
+     pipeline seeds the store before fanning out).
+
+Each run must leave the store with every PC -> AC edge of the checked-in
+pcToAcMapping.js, and the generated pcToAcMapping.js must decode to the
+same mapping. Exits 1 on any mismatch.
+
+Usage:
+  python scripts/check_pipeline_seed.py
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from canonical_store import CanonicalStore, read_pc_to_ac_js
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.join(SCRIPT_DIR, "..")
+
+
+def copy_project(dest):
+    """scripts/ and src/data/ under dest, without caches or a store."""
+    shutil.copytree(SCRIPT_DIR, os.path.join(dest, "scripts"),
+                    ignore=shutil.ignore_patterns(".cache", "build", "__pycache__", "fixtures"))
+    shutil.copytree(os.path.join(PROJECT_DIR, "src", "data"), os.path.join(dest, "src", "data"))
+
+
+def run_concurrently(project, commands):
+    """Start every command at once; returns [(command, exit code, output)]."""
+    procs = [(command, subprocess.Popen(command, cwd=project, stdout=subprocess.PIPE,
+                                        stderr=subprocess.STDOUT, text=True))
+             for command in commands]
+    return [(command, proc.wait(), proc.stdout.read()) for command, proc in procs]
+
+
+def check(project, label, expected):
+    """Problems with the store and pcToAcMapping.js left in project."""
+    problems = []
+    store = CanonicalStore(os.path.join(project, "scripts", "build", "canonical.sqlite"))
+    stored = store.load_pc_to_ac()
+    store.close()
+    if stored != expected:
+        problems.append(f"{label}: store has {len(stored)} mapped PCs, expected {len(expected)}")
+    written = read_pc_to_ac_js(os.path.join(project, "src", "data", "pcToAcMapping.js"))
+    if written != expected:
+        problems.append(f"{label}: pcToAcMapping.js has {len(written)} mapped PCs, expected {len(expected)}")
+    return problems
+
+
+def main():
+    expected = read_pc_to_ac_js()
+    python = sys.executable
+    problems = []
+    tmp_dir = tempfile.mkdtemp(prefix="pipeline-seed-check-")
+    try:
+        runs = {
+            "generators": [[python, "scripts/generate_assembly_data.py", "--offline"],
+                           [python, "scripts/generate_pc_ac_mapping.py", "--offline"]],
+            "pipeline": [[python, "scripts/pipeline.py", "--offline", "--parallel", "2",
+                          "assembly", "pc_ac"]],
+        }
+        for label, commands in runs.items():
+            project = os.path.join(tmp_dir, label)
+            copy_project(project)
+            for command, code, output in run_concurrently(project, commands):
+                if code != 0:
+                    problems.append(f"{label}: {' '.join(command[1:])} exited {code}:\n{output}")
+            problems.extend(check(project, label, expected))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    if problems:
+        print(f"{len(problems)} problems:")
+        for problem in problems:
+            print(f"  {problem}")
+        return 1
+    print(f"Concurrent stages on an empty store kept all {len(expected)} mapped PCs")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
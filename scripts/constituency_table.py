@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Constituency table model shared by the generator scripts.
+
+A "List of constituencies of the X Legislative Assembly" page is parsed once
+into table sections, one per header row, each holding one AcRecord per row:
+
+    TableSection(columns=('name', 'reservation', 'district', 'pc'), records=[
+        AcRecord(number=12, name='Behat', reservation='SC',
+                 district='Saharanpur', pc='Saharanpur'), ...])
+
+generate_assembly_data (names), generate_district_mapping (District column)
+and generate_pc_ac_mapping (Lok Sabha column) are all projections of these
+sections, so header detection lives in one place. Each projection reads the
+section that has the column it needs (see select_records). Parsed records are cached on
+disk next to the page cache, keyed by the SHA-256 of the page, so the three
+scripts (and re-runs) parse each page once.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from html_tables import iter_table_rows
+from run_profile import add_state_time, stage
+from run_profile import count as profile_count
+from wiki_fetch import fetch_wiki_page, get_cache
+
+# number: AC number, or None for tables without numbered rows (e.g. Karnataka)
+# reservation: 'SC', 'ST' or None
+# district, pc: cleaned column text, or None when the table has no such column
+AcRecord = namedtuple('AcRecord', ['number', 'name', 'reservation', 'district', 'pc'])
+
+# columns: the fields ('name', 'reservation', 'district', 'pc') the section's
+# header row names; records: its AcRecords in page order
+TableSection = namedtuple('TableSection', ['columns', 'records'])
+
+# Bump when parsing changes so cached records are rebuilt
+RECORDS_VERSION = 2
+
+# An AC list names at least one of these besides number and name; a seat
+# summary ("No. | Name | Assembly seats") names none
+AC_LIST_COLUMNS = ('reservation', 'district', 'pc')
+
+HEADER_NUMBER_MARKERS = ('#', 'no', 'no.', 's.no', 'sl.no', 'sl. no.', 'sl. no')
+PLACEHOLDER_VALUES = ('SC', 'ST', 'NONE', 'GEN', 'GENERAL', '')
+AC_NUMBER_RE = re.compile(r'^\d{1,3}$')
+
+
+def _is_header(lower_row):
+    return any(
+        c in HEADER_NUMBER_MARKERS or 'name' in c or 'constituency' in c
+        for c in lower_row
+    )
+
+
+def _find_columns(lower_row):
+    """Map each field to its column index in a header row (None if absent).
+
+    The AC number is in the first column unless the header puts a number
+    marker elsewhere (e.g. "District | No. | Name | ...").
+    """
+    cols = {'number': None, 'name': None, 'reservation': None, 'district': None, 'pc': None}
+    for ci, cell_text in enumerate(lower_row):
+        if cols['number'] is None and cell_text in HEADER_NUMBER_MARKERS:
+            cols['number'] = ci
+        elif cols['pc'] is None and ('lok sabha' in cell_text or 'parliamentary' in cell_text):
+            cols['pc'] = ci
+        elif cols['district'] is None and cell_text.startswith('district'):
+            cols['district'] = ci
+        elif cols['reservation'] is None and (
+            'reserv' in cell_text or 'category' in cell_text or 'sc/st' in cell_text
+        ):
+            cols['reservation'] = ci
+        elif cols['name'] is None and ci > 0 and ('name' in cell_text or 'constituency' in cell_text):
+            cols['name'] = ci
+    columns = tuple(field for field in ('name', 'reservation', 'district', 'pc')
+                    if cols[field] is not None)
+    if cols['number'] is None:
+        cols['number'] = 0
+    if cols['name'] is None:
+        cols['name'] = cols['number'] + 1
+    return cols, columns
+
+
+def _clean_district(text):
+    # If comma-separated (e.g. "District1, District2"), take the first
+    if ',' in text:
+        text = text.split(',')[0].strip()
+    # Remove parenthetical info and "district" suffix
+    text = re.sub(r'\s*\([^)]*\)\s*', '', text).strip()
+    text = re.sub(r'\s+district$', '', text, flags=re.IGNORECASE).strip()
+    text = re.sub(r'\s*\[\d+\]\s*', '', text).strip()
+    if len(text) > 1 and not text.isdigit() and text.upper() not in PLACEHOLDER_VALUES:
+        return text
+    return None
+
+
+def _clean_pc(text):
+    text = re.sub(r'\s*\([^)]*\)\s*', '', text).strip()
+    text = re.sub(r'\s*\[\d+\]\s*', '', text).strip()
+    if len(text) > 1 and not text.isdigit() and text.upper() not in PLACEHOLDER_VALUES:
+        return text
+    return None
+
+
+def _clean_reservation(text):
+    text = text.upper()
+    if 'ST' in re.findall(r'\b(SC|ST)\b', text):
+        return 'ST'
+    if 'SC' in re.findall(r'\b(SC|ST)\b', text):
+        return 'SC'
+    return None
+
+
+def _cell(cells, idx):
+    return cells[idx] if idx is not None and idx < len(cells) else None
+
+
+def parse_constituency_table(page_html, expected_count):
+    """Parse a constituency list page into a list of TableSections.
+
+    Every header row (one with '#'/'No.'/'Name'/'Constituency' markers) starts
+    a new section. Pages such as Assam carry several tables (a seat summary,
+    the current and the pre-delimitation list); select_records picks one
+    per projection.
+    """
+    if not page_html:
+        return []
+
+    sections = []
+    cols = None
+    for row in iter_table_rows(page_html):
+        cells = row.cells
+        if len(cells) < 3:
+            continue
+
+        lower_row = [c.text.lower() for c in cells]
+        if _is_header(lower_row):
+            cols, columns = _find_columns(lower_row)
+            sections.append(TableSection(columns, []))
+            continue
+        if cols is None:
+            continue
+
+        num_text = cells[cols['number']].text if cols['number'] < len(cells) else ''
+        number = None
+        if AC_NUMBER_RE.match(num_text):
+            number = int(num_text)
+            if number < 1 or number > expected_count + 5:
+                continue
+
+        name_cell = _cell(cells, cols['name'])
+        name = (name_cell.link or name_cell.text) if name_cell else ''
+        if not name or len(name) <= 1 or name.isdigit():
+            continue
+
+        reservation_cell = _cell(cells, cols['reservation'])
+        district_cell = _cell(cells, cols['district'])
+        pc_cell = _cell(cells, cols['pc'])
+        sections[-1].records.append(AcRecord(
+            number,
+            name,
+            _clean_reservation(reservation_cell.text) if reservation_cell else None,
+            _clean_district(district_cell.text) if district_cell else None,
+            _clean_pc(pc_cell.text) if pc_cell else None,
+        ))
+
+    return sections
+
+
+def select_records(sections, needed):
+    """The records of the section a projection reads.
+
+    Sections whose header names one of the `needed` columns are preferred,
+    so a seat summary or a table without the column is never taken for the
+    AC list. Among those, the first with more than 10 numbered rows wins
+    (pre-delimitation tables follow the current one), falling back to the
+    one with the most rows.
+    """
+    candidates = [s for s in sections if any(c in s.columns for c in needed)] or sections
+    if not candidates:
+        return []
+    for section in candidates:
+        if sum(1 for r in section.records if r.number is not None) > 10:
+            return section.records
+    return max(candidates, key=lambda s: len(s.records)).records
+
+
+def _row_count(sections):
+    return sum(len(s.records) for s in sections)
+
+
+_memo = {}
+_memo_lock = threading.Lock()
+_records_cache_enabled = True
+
+
+def set_records_cache(enabled):
+    """Turn the parsed-records memo on or off (benchmarks time real parses)."""
+    global _records_cache_enabled
+    _records_cache_enabled = enabled
+
+
+def _records_path(page_sha, expected_count):
+    cache_dir = os.path.join(os.path.dirname(get_cache().cache_dir), "records")
+    return os.path.join(cache_dir, f"{page_sha}-{expected_count}-v{RECORDS_VERSION}.json")
+
+
+def _read_records(page_sha, expected_count):
+    """Sections from the on-disk cache, or None."""
+    try:
+        with open(_records_path(page_sha, expected_count), 'r', encoding='utf-8') as f:
+            return _sections_from_plain(json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _write_records(page_sha, expected_count, sections):
+    path = _records_path(page_sha, expected_count)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(_sections_to_plain(sections), f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _sections_to_plain(sections):
+    """Sections as JSON-able (and picklable) lists."""
+    return [[list(s.columns), [list(r) for r in s.records]] for s in sections]
+
+
+def _sections_from_plain(plain):
+    return [TableSection(tuple(columns), [AcRecord(*r) for r in records])
+            for columns, records in plain]
+
+
+def parse_page_records(page_html, expected_count):
+    """parse_constituency_table with an in-process and on-disk memo."""
+    if not page_html:
+        return []
+    if not _records_cache_enabled:
+        sections = parse_constituency_table(page_html, expected_count)
+        profile_count(pages_parsed=1, html_bytes_parsed=len(page_html), rows_parsed=_row_count(sections))
+        return sections
+    page_sha = hashlib.sha256(page_html.encode('utf-8')).hexdigest()
+    key = (page_sha, expected_count)
+    with _memo_lock:
+        if key in _memo:
+            profile_count(records_memo_hits=1, rows_parsed=_row_count(_memo[key]))
+            return _memo[key]
+
+    sections = _read_records(page_sha, expected_count)
+    if sections is not None:
+        profile_count(records_cache_hits=1)
+    else:
+        sections = parse_constituency_table(page_html, expected_count)
+        profile_count(pages_parsed=1, html_bytes_parsed=len(page_html))
+        _write_records(page_sha, expected_count, sections)
+
+    with _memo_lock:
+        _memo[key] = sections
+    profile_count(rows_parsed=_row_count(sections))
+    return sections
+
+
+def _parse_in_worker(page_bytes, expected_count):
+    """Runs in a worker process: page bytes in, (seconds, plain lists) out."""
+    start = time.perf_counter()
+    sections = parse_constituency_table(page_bytes.decode('utf-8'), expected_count)
+    return time.perf_counter() - start, _sections_to_plain(sections)
+
+
+def warm_records(pages, jobs=1):
+    """Parse [(state code, page_html, expected_count)] ahead of parse_page_records.
+
+    Pages not already memoized or cached on disk are parsed in a pool of
+    `jobs` processes and memoized, so the later parse_page_records calls
+    (and every projection of them) return exactly what a serial run would.
+    Parsing is CPU-bound, so threads would serialize on the GIL. With
+    jobs <= 1 this does nothing and pages are parsed in-process on demand.
+    """
+    if jobs <= 1 or not _records_cache_enabled:
+        return
+    todo = {}  # (page_sha, expected_count) -> (state code, page_html)
+    for code, page_html, expected_count in pages:
+        if not page_html:
+            continue
+        key = (hashlib.sha256(page_html.encode('utf-8')).hexdigest(), expected_count)
+        with _memo_lock:
+            if key in _memo or key in todo:
+                continue
+        records = _read_records(*key)
+        if records is not None:
+            with _memo_lock:
+                _memo[key] = records
+            continue
+        todo[key] = (code, page_html)
+    if not todo:
+        return
+
+    # Largest pages first, so one big state does not finish last on its own
+    keys = sorted(todo, key=lambda key: -len(todo[key][1]))
+    with stage("parse"), ProcessPoolExecutor(max_workers=min(jobs, len(keys))) as pool:
+        futures = [pool.submit(_parse_in_worker, todo[key][1].encode('utf-8'), key[1])
+                   for key in keys]
+        for key, future in zip(keys, futures):
+            seconds, plain = future.result()
+            sections = _sections_from_plain(plain)
+            _write_records(*key, sections)
+            with _memo_lock:
+                _memo[key] = sections
+            # Rows are counted when parse_page_records hands them out
+            code, page_html = todo[key]
+            profile_count(pages_parsed=1, html_bytes_parsed=len(page_html))
+            add_state_time("parse", code, seconds, pages_parsed=1, html_bytes_parsed=len(page_html))
+
+
+def load_state_records(slug, expected_count):
+    """Fetch (through the page cache) and parse a state's list page."""
+    return parse_page_records(fetch_wiki_page(slug), expected_count)
+
+
+# -- projections -------------------------------------------------------------
+
+def ac_names(sections):
+    """AC number -> constituency name (first row wins for duplicate numbers)."""
+    names = {}
+    for r in select_records(sections, AC_LIST_COLUMNS):
+        if r.number is not None:
+            names.setdefault(r.number, r.name)
+    return names
+
+
+def ac_districts(sections):
+    """(AC number -> district, name -> district for unnumbered rows)."""
+    by_number = {}
+    by_name = {}
+    for r in select_records(sections, ('district',)):
+        if not r.district:
+            continue
+        if r.number is not None:
+            by_number[r.number] = r.district
+        else:
+            by_name[r.name] = r.district
+    return by_number, by_name
+
+
+def ac_to_pc(sections):
+    """AC number -> Lok Sabha constituency name."""
+    return {r.number: r.pc for r in select_records(sections, ('pc',))
+            if r.number is not None and r.pc}
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Content-hashed JSON / binary data assets for the frontend.
+
+Besides the JS literal modules in src/data, the generators can emit their
+datasets as static files the app fetches at runtime:
+
+  public/data/<name>.<hash>.json   plain JSON, parsed with JSON.parse
+  public/data/<name>.<hash>.bin    columnar binary table (see encode_table)
+
+The hash is the first 10 hex digits of the file's SHA-256, so a file's URL
+changes whenever its content does and the files can be cached forever. Older
+versions of the same asset are removed, and src/data/dataAssets.js maps each
+asset name to its current file; src/utils/dataAssets.js loads and decodes them.
+
+Sharded datasets are split per state code so the app fetches only the state
+it shows:
+
+  public/data/<name>/<code>.<hash>.json|bin   one shard per state
+  public/data/<name>Index.<hash>.json         {"states": {code: {state, count,
+                                               bytes, file}}, "total": n}
+
+Tiled datasets (constituency map geometry) are split by area instead, and
+the index records each tile's bounding box so the app fetches what is in view:
+
+  public/data/<name>/<key>.<hash>.json        one tile
+  public/data/<name>Index.<hash>.json         {"tiles": {key: {bbox, count,
+                                               bytes, file}}, "total": n, ...}
+
+Binary layout (little-endian):
+
+  b"JTB1" | uint32 header length | header JSON | pad to 4 | columns
+
+The header holds the row count, a string table and, per field, its type
+("str" or "uint"), typed-array kind and byte offset from the start of the
+column data. A "str" column stores string-table index + 1, with 0 for a
+missing value. Each column is padded to 4 bytes so the decoder can view it
+in place with a typed array.
+"""
+
+import json
+import os
+import re
+import struct
+import sys
+from array import array
+
+from build_manifest import digest, write_if_changed
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.join(SCRIPT_DIR, "..")
+ASSET_DIR = os.path.join(PROJECT_DIR, "public", "data")
+ASSET_INDEX_PATH = os.path.join(PROJECT_DIR, "src", "data", "dataAssets.js")
+
+FORMATS = ("js", "json", "binary")
+BINARY_MAGIC = b"JTB1"
+
+# Field layouts of the datasets emitted as binary tables
+ASSEMBLY_FIELDS = [("id", "str"), ("name", "str"), ("state", "str"),
+                   ("district", "str"), ("acNo", "uint")]
+PC_TO_AC_FIELDS = [("pc", "str"), ("ac", "str")]
+
+_ARRAY_KINDS = [("B", "Uint8", 0xFF), ("H", "Uint16", 0xFFFF), ("I", "Uint32", 0xFFFFFFFF)]
+
+
+def _pad4(data):
+    return data + b"\0" * (-len(data) % 4)
+
+
+def encode_table(rows, fields, group_by=None):
+    """Encode rows (dicts) as a columnar binary table.
+
+    fields: [(name, "str" | "uint"), ...]. group_by=(key, value) tells the
+    decoder to return {row[key]: [row[value], ...]} instead of a row list.
+    """
+    rows = list(rows)
+    strings = []
+    string_index = {}
+    columns = []
+    for name, kind in fields:
+        values = []
+        for row in rows:
+            value = row.get(name)
+            if kind == "str":
+                if value is None or value == "":
+                    value = 0
+                else:
+                    idx = string_index.get(value)
+                    if idx is None:
+                        idx = string_index[value] = len(strings)
+                        strings.append(value)
+                    value = idx + 1
+            values.append(value)
+        columns.append(values)
+
+    header_fields = []
+    data = b""
+    for (name, kind), values in zip(fields, columns):
+        largest = max(values, default=0)
+        code, array_name = next((c, a) for c, a, limit in _ARRAY_KINDS if largest <= limit)
+        column = array(code, values)
+        if sys.byteorder != "little":
+            column.byteswap()
+        header_fields.append({"name": name, "type": kind, "array": array_name,
+                              "offset": len(data)})
+        data += _pad4(column.tobytes())
+
+    header = {"rows": len(rows), "strings": strings, "fields": header_fields}
+    if group_by:
+        header["groupBy"] = {"key": group_by[0], "value": group_by[1]}
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return _pad4(BINARY_MAGIC + struct.pack("<I", len(header_bytes)) + header_bytes) + data
+
+
+def encode_json(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_asset(name, payload, ext, asset_dir=ASSET_DIR, verbose=True):
+    """Write payload as <name>.<hash>.<ext> and drop older versions.
+
+    Returns the written path.
+    """
+    os.makedirs(asset_dir, exist_ok=True)
+    filename = f"{name}.{digest(payload)[:10]}.{ext}"
+    path = os.path.join(asset_dir, filename)
+    stale = re.compile(re.escape(name) + r"\.[0-9a-f]{10}\.(json|bin)$")
+    for existing in os.listdir(asset_dir):
+        if existing != filename and stale.match(existing):
+            os.remove(os.path.join(asset_dir, existing))
+
+    if os.path.exists(path):
+        if verbose:
+            print(f"{path} unchanged, not rewritten")
+    else:
+        write_if_changed(path, payload)
+        if verbose:
+            print(f"Wrote {path} ({len(payload) / 1024:.0f} KB)")
+    return path
+
+
+def write_asset_index(asset_dir=ASSET_DIR, index_path=ASSET_INDEX_PATH):
+    """Regenerate src/data/dataAssets.js from the files in asset_dir."""
+    assets = {}
+    if os.path.isdir(asset_dir):
+        for filename in sorted(os.listdir(asset_dir)):
+            match = re.match(r"(.+)\.[0-9a-f]{10}\.(json|bin)$", filename)
+            if match:
+                assets[match.group(1)] = f"data/{filename}"
+
+    lines = [
+        "// Content-hashed data assets under public/data, by name",
+        "// Generated by scripts/data_assets.py; load with src/utils/dataAssets.js",
+        "",
+        "const dataAssets = {",
+    ]
+    lines.extend(f"  {name}: '{path}'," for name, path in assets.items())
+    lines.append("};")
+    lines.append("")
+    lines.append("export default dataAssets;")
+    lines.append("")
+    write_if_changed(index_path, "\n".join(lines))
+
+
+def write_dataset(name, fmt, obj=None, rows=None, fields=None, group_by=None):
+    """Emit a dataset as a json or binary asset; returns the asset path.
+
+    JSON assets are obj serialized as-is; binary assets are rows encoded
+    with encode_table(rows, fields, group_by).
+    """
+    path = write_asset(name, *_encode(fmt, obj, rows, fields, group_by))
+    write_asset_index()
+    return path
+
+
+def _encode(fmt, obj, rows, fields, group_by=None):
+    """(payload, extension) for a json or binary asset."""
+    if fmt == "json":
+        return encode_json(obj), "json"
+    if fmt == "binary":
+        return encode_table(rows, fields, group_by), "bin"
+    raise ValueError(f"not an asset format: {fmt}")
+
+
+def write_sharded_dataset(name, shards, fmt, fields=None):
+    """Emit one asset per state plus a <name>Index asset; returns the index path.
+
+    shards: {state_code: (state_name, rows)}, rows being dicts. Shards of
+    states no longer present are removed.
+    """
+    shard_dir = os.path.join(ASSET_DIR, name)
+    index = {"states": {}, "total": 0}
+    for code in sorted(shards):
+        state, rows = shards[code]
+        payload, ext = _encode(fmt, rows, rows, fields)
+        path = write_asset(code, payload, ext, shard_dir, verbose=False)
+        index["states"][code] = {
+            "state": state,
+            "count": len(rows),
+            "bytes": len(payload),
+            "file": f"data/{name}/{os.path.basename(path)}",
+        }
+        index["total"] += len(rows)
+
+    live = {os.path.basename(entry["file"]) for entry in index["states"].values()}
+    for existing in os.listdir(shard_dir) if os.path.isdir(shard_dir) else ():
+        if existing not in live:
+            os.remove(os.path.join(shard_dir, existing))
+    sizes = [entry["bytes"] for entry in index["states"].values()] or [0]
+    print(f"Wrote {len(index['states'])} {name} shards to {shard_dir} "
+          f"({min(sizes) / 1024:.0f}-{max(sizes) / 1024:.0f} KB, {sum(sizes) / 1024:.0f} KB total)")
+
+    path = write_asset(f"{name}Index", encode_json(index), "json")
+    write_asset_index()
+    return path
+
+
+def write_tiled_dataset(name, tiles, meta=None):
+    """Emit one JSON asset per tile plus a <name>Index asset; returns the index path.
+
+    tiles: {key: (bbox, rows)}, bbox being [x0, y0, x1, y1]. The index lists
+    every tile's bbox so the app can fetch just the tiles in view; meta is
+    copied into it. Tiles no longer present are removed.
+    """
+    tile_dir = os.path.join(ASSET_DIR, name)
+    index = dict(meta or {})
+    index["tiles"] = {}
+    index["total"] = 0
+    for key, (bbox, rows) in tiles.items():
+        payload = encode_json(rows)
+        path = write_asset(key, payload, "json", tile_dir, verbose=False)
+        index["tiles"][key] = {
+            "bbox": [round(v, 1) for v in bbox],
+            "count": len(rows),
+            "bytes": len(payload),
+            "file": f"data/{name}/{os.path.basename(path)}",
+        }
+        index["total"] += len(rows)
+
+    live = {os.path.basename(entry["file"]) for entry in index["tiles"].values()}
+    for existing in os.listdir(tile_dir) if os.path.isdir(tile_dir) else ():
+        if existing not in live:
+            os.remove(os.path.join(tile_dir, existing))
+    sizes = [entry["bytes"] for entry in index["tiles"].values()] or [0]
+    print(f"Wrote {len(index['tiles'])} {name} tiles to {tile_dir} "
+          f"({min(sizes) / 1024:.0f}-{max(sizes) / 1024:.0f} KB, {sum(sizes) / 1024:.0f} KB total)")
+
+    path = write_asset(f"{name}Index", encode_json(index), "json")
+    write_asset_index()
+    return path
+
+
+def shard_by_state(entries):
+    """Group entries with AC-style IDs ("AP-AC-001") by state code."""
+    shards = {}
+    for e in entries:
+        code = e["id"].split("-", 1)[0]
+        shards.setdefault(code, (e["state"], []))[1].append(e)
+    return shards
+
+
+def write_assembly_asset(entries, fmt, shard=False):
+    """assemblyConstituencies as a json or binary asset, or per-state shards.
+
+    Shards of a "js" run are written as JSON.
+    """
+    if shard:
+        return write_sharded_dataset("assemblyConstituencies", shard_by_state(entries),
+                                     "binary" if fmt == "binary" else "json",
+                                     fields=ASSEMBLY_FIELDS)
+    return write_dataset("assemblyConstituencies", fmt, obj=entries,
+                         rows=entries, fields=ASSEMBLY_FIELDS)
+
+
+def write_pc_to_ac_asset(pc_to_ac, fmt):
+    """pcToAcMapping as a json or binary asset."""
+    rows = [{"pc": pc_id, "ac": ac_id}
+            for pc_id in sorted(pc_to_ac) for ac_id in pc_to_ac[pc_id]]
+    return write_dataset("pcToAcMapping", fmt, obj=pc_to_ac,
+                         rows=rows, fields=PC_TO_AC_FIELDS, group_by=("pc", "ac"))
+
+
+def add_format_arguments(parser):
+    parser.add_argument("--format", choices=FORMATS, default="js",
+                        help="output format: JS module in src/data (default), or a "
+                             "content-hashed json/binary asset in public/data")
+    parser.add_argument("--shard", action="store_true",
+                        help="split the output into one asset per state plus an index "
+                             "(JSON unless --format binary)")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Per-entry diffs between a generated data file and the version it replaces.
+
+Before a writer replaces assemblyConstituencies.js or pcToAcMapping.js it
+reads the old file back (canonical_store's readers) and compares entries by
+ID, so a run reports what changed in the data rather than only whether the
+file did:
+
+  {"added": ["AP-AC-176"], "removed": [],
+   "renamed": [{"id": "AP-AC-012", "from": "Tuni", "to": "Thuni"}],
+   "redistricted": [{"id": "AP-AC-040", "from": "Krishna", "to": "NTR"}]}
+
+For pcToAcMapping.js, "moved" lists ACs now mapped to a different PC.
+Diffs are printed and added to the run report (see run_profile.py) under
+"diffs", keyed by output file name.
+"""
+
+import os
+
+from run_profile import current_profile
+
+
+def read_old(path, reader):
+    """reader(path) for the file about to be replaced, or None if there is none."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return reader(path)
+    except (OSError, ValueError):
+        return None
+
+
+def diff_acs(old_entries, new_entries):
+    """Added, removed, renamed and redistricted ACs between two entry lists."""
+    old = {e['id']: e for e in old_entries}
+    new = {e['id']: e for e in new_entries}
+    renamed = []
+    redistricted = []
+    for ac_id in sorted(old.keys() & new.keys()):
+        before, after = old[ac_id], new[ac_id]
+        if before['name'] != after['name']:
+            renamed.append({"id": ac_id, "from": before['name'], "to": after['name']})
+        if before.get('district') != after.get('district'):
+            redistricted.append({"id": ac_id, "from": before.get('district'),
+                                 "to": after.get('district')})
+    return {
+        "added": sorted(new.keys() - old.keys()),
+        "removed": sorted(old.keys() - new.keys()),
+        "renamed": renamed,
+        "redistricted": redistricted,
+    }
+
+
+def _ac_to_pc(pc_to_ac):
+    return {ac_id: pc_id for pc_id, ac_ids in pc_to_ac.items() for ac_id in ac_ids}
+
+
+def diff_pc_to_ac(old_mapping, new_mapping):
+    """ACs added to, removed from, or moved between PCs, and PCs added/removed."""
+    old, new = _ac_to_pc(old_mapping), _ac_to_pc(new_mapping)
+    return {
+        "added": sorted(new.keys() - old.keys()),
+        "removed": sorted(old.keys() - new.keys()),
+        "moved": [{"id": ac_id, "from": old[ac_id], "to": new[ac_id]}
+                  for ac_id in sorted(old.keys() & new.keys()) if old[ac_id] != new[ac_id]],
+        "pcs_added": sorted(new_mapping.keys() - old_mapping.keys()),
+        "pcs_removed": sorted(old_mapping.keys() - new_mapping.keys()),
+    }
+
+
+def report_diff(name, diff, limit=10):
+    """Print a diff (first `limit` items per kind) and add it to the run report."""
+    current_profile().add_diff(name, diff)
+    if not any(diff.values()):
+        print(f"  {name}: no entry changes")
+        return
+    print(f"  {name}: " + ", ".join(f"{len(items)} {kind}"
+                                    for kind, items in diff.items() if items))
+    for kind, items in diff.items():
+        for item in items[:limit]:
+            if isinstance(item, dict):
+                print(f"    {kind:<12} {item['id']}: {item['from']} -> {item['to']}")
+            else:
+                print(f"    {kind:<12} {item}")
+        if len(items) > limit:
+            print(f"    {kind:<12} ... and {len(items) - limit} more")
@@ -4,10 +4,22 @@ Generate assemblyConstituencies.js from Wikipedia data.
 Fetches constituency lists from Wikipedia for each Indian state.
 """
 
-import json
+import argparse
+import os
 import re
-import urllib.request
-import html
+
+from build_manifest import BuildManifest, add_incremental_arguments, digest, file_digest
+from constituency_table import ac_names, parse_page_records, warm_records
+from canonical_store import add_store_arguments, open_store
+from data_assets import add_format_arguments
+from generate_district_mapping import write_assembly_js
+from run_profile import add_profile_arguments, finish_run, stage, start_run
+from string_table import shared_table
+from wiki_fetch import (
+    add_fetch_arguments, configure_from_args, fetch_wiki_page, map_states, print_cache_stats,
+)
+
+OUTPUT_NAME = "assemblyConstituencies.js"
 
 # State config: (state_code, state_name_in_app, num_constituencies, wikipedia_slug)
 STATES = [
@@ -44,31 +56,11 @@ STATES = [
     ("PY", "Puducherry", 30, "Puducherry_Legislative_Assembly"),
 ]
 
-def fetch_wiki_page(slug):
-    """Fetch raw HTML from Wikipedia."""
-    url = f"https://en.wikipedia.org/wiki/{slug}"
-    req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-    try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            return resp.read().decode("utf-8", errors="replace")
-    except Exception as e:
-        print(f"  Failed to fetch {slug}: {e}")
-        return None
-
-def extract_constituency_names(page_html, expected_count, state_name):
-    """Try to extract constituency names from Wikipedia page HTML."""
+def resolve_list_page(page_html, state_name):
+    """Follow the assembly page's "List of constituencies" link, if any."""
     if not page_html:
         return None
 
-    names = []
-
-    # Strategy 1: Look for numbered constituency entries in tables
-    # Wikipedia assembly pages typically have tables with constituency numbers and names
-    # Pattern: <td>NUMBER</td>...<td>NAME</td> or similar
-
-    # Try finding table rows with constituency data
-    # Look for patterns like: >1<...>ConstituencyName< or >1.<...>ConstituencyName<
-
     # First try: look for "List_of_constituencies" link in the page
     list_match = re.search(r'href="/wiki/(List_of_constituencies_of_the_' + re.escape(state_name.replace(' ', '_')) + r'[^"]*)"', page_html)
     if not list_match:
@@ -79,43 +71,24 @@ def extract_constituency_names(page_html, expected_count, state_name):
         list_slug = list_match.group(1)
         list_html = fetch_wiki_page(list_slug)
         if list_html:
-            page_html = list_html
-
-    # Extract from table rows - look for patterns with constituency numbers
-    # Common pattern: <td>NUM</td><td><a ...>NAME</a></td>
-    rows = re.findall(r'<tr[^>]*>(.*?)</tr>', page_html, re.DOTALL)
-
-    for row in rows:
-        cells = re.findall(r'<td[^>]*>(.*?)</td>', row, re.DOTALL)
-        if len(cells) >= 2:
-            # Check if first cell is a number
-            num_text = re.sub(r'<[^>]+>', '', cells[0]).strip()
-            if re.match(r'^\d{1,3}$', num_text):
-                num = int(num_text)
-                if 1 <= num <= expected_count + 5:
-                    # Second cell should be the name
-                    name_html = cells[1]
-                    # Extract text, preferring link text
-                    link_match = re.search(r'<a[^>]*>([^<]+)</a>', name_html)
-                    if link_match:
-                        name = link_match.group(1).strip()
-                    else:
-                        name = re.sub(r'<[^>]+>', '', name_html).strip()
-
-                    name = html.unescape(name)
-                    if name and len(name) > 1 and not name.isdigit():
-                        names.append((num, name))
+            return list_html
+    return page_html
+
+def extract_constituency_names(page_html, expected_count, state_name):
+    """Try to extract constituency names from Wikipedia page HTML."""
+    page_html = resolve_list_page(page_html, state_name)
+    return names_from_list_page(page_html, expected_count)
+
+def names_from_list_page(page_html, expected_count):
+    """Constituency names from an already-resolved list page."""
+    if not page_html:
+        return None
+
+    # Numbered rows of the constituency table, shared with the other generators
+    names = sorted(ac_names(parse_page_records(page_html, expected_count)).items())
 
     if len(names) >= expected_count * 0.8:
-        # Sort by number and deduplicate
-        names.sort(key=lambda x: x[0])
-        seen = set()
-        unique = []
-        for num, name in names:
-            if num not in seen:
-                seen.add(num)
-                unique.append((num, name))
-        return unique[:expected_count]
+        return names[:expected_count]
 
     return None
 
@@ -127,16 +100,53 @@ def title_case_name(name):
     name = name.strip()
     return name
 
-def generate_entries():
-    """Generate all assembly constituency entries."""
+def generate_entries(workers=1, existing=None, previous_sources=None, jobs=1):
+    """Generate all assembly constituency entries.
+
+    States whose list page digest matches previous_sources keep their entries
+    from `existing` instead of being re-parsed. Returns (entries, digests).
+    """
+    existing = existing or []
+    previous_sources = previous_sources or {}
+    existing_by_state = {}
+    for e in existing:
+        existing_by_state.setdefault(e["state"], []).append(e)
+
+    def fetch_state_page(state_cfg):
+        """Fetch one state's list page (runs on a worker thread).
+
+        Returns (page digest, page), with a None page when it is unchanged.
+        """
+        code, state, count, slug = state_cfg
+        with stage("fetch", code):
+            page = resolve_list_page(fetch_wiki_page(slug), state)
+        if not page:
+            return None, None
+        page_sha = digest(page)
+        if previous_sources.get(code) == page_sha and state in existing_by_state:
+            return page_sha, None
+        return page_sha, page
+
     all_entries = []
+    source_digests = {}
+
+    state_pages = map_states(fetch_state_page, STATES, workers=workers)
+    # With jobs > 1, pages are parsed up front in that many processes
+    warm_records([(cfg[0], page, cfg[2]) for cfg, (_, page) in zip(STATES, state_pages)], jobs)
 
-    for code, state, count, slug in STATES:
+    for (code, state, count, slug), (page_sha, page) in zip(STATES, state_pages):
         print(f"Processing {state} ({count} constituencies)...")
+        if page_sha:
+            source_digests[code] = page_sha
 
-        page = fetch_wiki_page(slug)
-        names = extract_constituency_names(page, count, state)
+        if (page_sha and page is None) or (page_sha is None and state in existing_by_state):
+            print(f"  Source {'unchanged' if page_sha else 'unavailable'}, keeping existing entries")
+            for e in existing_by_state[state]:
+                all_entries.append({k: e[k] for k in ("id", "name", "state", "acNo")})
+            continue
 
+        with stage("parse", code):
+            names = names_from_list_page(page, count)
         if names and len(names) >= count * 0.8:
             print(f"  Found {len(names)} names from Wikipedia")
             # Fill any gaps
@@ -167,45 +177,40 @@ def generate_entries():
                 }
                 all_entries.append(entry)
 
-    return all_entries
-
-def write_js_file(entries, output_path):
-    """Write the JavaScript data file."""
-    lines = [
-        "// India's Vidhan Sabha (State Assembly) constituencies",
-        "// Data compiled from Election Commission of India records",
-        f"// Total: {len(entries)} constituencies across {len(STATES)} states/UTs",
-        "",
-        "const assemblyConstituencies = [",
-    ]
-
-    current_state = None
-    for e in entries:
-        if e["state"] != current_state:
-            current_state = e["state"]
-            state_count = sum(1 for x in entries if x["state"] == current_state)
-            lines.append(f"  // {current_state} ({state_count})")
-
-        name_escaped = e["name"].replace("'", "\\'")
-        lines.append(
-            f'  {{ id: "{e["id"]}", name: \'{name_escaped}\', state: \'{e["state"]}\', acNo: {e["acNo"]} }},'
-        )
-
-    lines.append("];")
-    lines.append("")
-    lines.append("export default assemblyConstituencies;")
-    lines.append("")
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-
-    print(f"\nWrote {len(entries)} entries to {output_path}")
+    return all_entries, source_digests
 
 if __name__ == "__main__":
-    import os
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_fetch_arguments(parser)
+    add_incremental_arguments(parser)
+    add_store_arguments(parser)
+    add_format_arguments(parser)
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_run("generate_assembly_data", args)
+    configure_from_args(args)
+    store = open_store(args.db, STATES)
+
     script_dir = os.path.dirname(os.path.abspath(__file__))
     output = os.path.join(script_dir, "..", "src", "data", "assemblyConstituencies.js")
 
-    entries = generate_entries()
-    write_js_file(entries, output)
+    manifest = BuildManifest(args.manifest)
+    previous_sources = {} if args.force else manifest.output(OUTPUT_NAME)["sources"]
+    existing = store.load_ac_entries()
+
+    entries, source_digests = generate_entries(
+        workers=args.workers, existing=existing, previous_sources=previous_sources, jobs=args.jobs)
+    with stage("emit"):
+        store.save_acs(entries)
+        section_digests, output = write_assembly_js(
+            store.iter_ac_entries(), store.count_acs_by_state(), shared_table(store),
+            output, args.format, args.shard, store=store)
+    changed = manifest.changed_sections(OUTPUT_NAME, section_digests)
+    if changed:
+        print(f"  Changed states: {', '.join(sorted(changed))}")
+    manifest.update(OUTPUT_NAME, source_digests=source_digests, section_digests=section_digests,
+                    file_sha=file_digest(output))
+    manifest.save()
+    print_cache_stats()
+    finish_run(args)
     print("Done!")
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Generate tiled PC or AC boundary geometry for the map.
+
+indiaMapPaths.js only has states. This takes a constituency boundary file,
+GeoJSON or an ESRI shapefile in lon/lat (WGS84), and writes map-ready tiles:
+
+  1. Read each feature and key it by PC or AC ID ("AP-01", "AP-AC-001"):
+     either an ID property (--id-field) or a state name/code property plus
+     a constituency number (--state-field, --number-field), as in the
+     DataMeet shapefiles. Features with the same ID are merged.
+  2. Check the IDs against the canonical store. Unknown IDs are dropped and
+     store IDs without geometry are listed (--strict fails the run on either).
+  3. Project into the state map's viewBox: Mercator, fitted to India's
+     extent as indiaMapPaths.js is (its aspect ratio matches to 0.2%), on a
+     grid of 1/100 viewBox units.
+  4. Simplify and quantize as simplify_map_paths.py does, with borders shared
+     between constituencies kept identical on both sides, to integers in
+     1/10 viewBox units (constituencies are much smaller than states).
+  5. Cut into tiles, per state (--tiles state, keyed by state code) or by a
+     quadtree over the viewBox (--tiles quadtree, keyed "q0213...", each
+     tile holding at most --max-features constituencies by label point).
+
+Tiles are content-hashed JSON assets (see data_assets.py):
+
+  public/data/<level>Geometry/<key>.<hash>.json
+      [{ id, path, labelX, labelY }, ...]        coordinates in 1/scale units
+  public/data/<level>GeometryIndex.<hash>.json
+      {"level": "pc", "tiling": "state", "scale": 10, "viewBox": [...],
+       "tiles": {key: {bbox, count, bytes, file}}, "total": n}
+
+Tile bboxes are in viewBox units; loadTilesInView() in
+src/utils/dataAssets.js fetches only the tiles intersecting the view.
+
+make_geometry_fixture.py writes synthetic inputs in this format, and
+bench_geometry_tiles.py compares tilings for size and build time.
+
+Usage:
+  python scripts/generate_constituency_geometry.py scripts/fixtures/geo/pc_boundaries.geojson
+  python scripts/generate_constituency_geometry.py acs.shp --state-field ST_NAME --number-field AC_NO
+  python scripts/generate_constituency_geometry.py acs.geojson --tiles quadtree --max-features 64
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+from collections import namedtuple
+
+from canonical_store import add_store_arguments, open_store
+from data_assets import write_tiled_dataset
+from generate_assembly_data import STATES
+from run_profile import add_profile_arguments, count, finish_run, stage, start_run
+from simplify_map_paths import Lod, Topology, format_path, ring_area, simplify_states
+from string_table import ac_id, split_ac_id
+
+# India's extent (west, south, east, north) and where indiaMapPaths.js puts it
+MAP_LONLAT_BOUNDS = (68.11, 6.75, 97.41, 37.09)
+MAP_VIEWBOX_BOUNDS = (1.0, 1.0, 999.0, 1134.9)
+VIEW_BOX = (0, 0, 1000, 1136)
+
+GRID = 100        # working precision, per viewBox unit
+TILE_SCALE = 10   # tile coordinate precision, per viewBox unit
+
+TILINGS = ("state", "quadtree")
+QUADTREE_MAX_DEPTH = 12
+
+PC_ID_RE = re.compile(r"^([A-Z]{2})-(\d{2})$")
+
+# rings: closed rings of integer grid points, open (first point not repeated)
+Feature = namedtuple('Feature', ['id', 'rings'])
+
+
+def _mercator_y(lat):
+    return math.log(math.tan(math.pi / 4 + math.radians(lat) / 2))
+
+
+def project(lon, lat):
+    """(x, y) in viewBox units for a lon/lat point."""
+    west, south, east, north = MAP_LONLAT_BOUNDS
+    x0, y0, x1, y1 = MAP_VIEWBOX_BOUNDS
+    x = x0 + (lon - west) / (east - west) * (x1 - x0)
+    y = y0 + (_mercator_y(north) - _mercator_y(lat)) / (_mercator_y(north) - _mercator_y(south)) * (y1 - y0)
+    return x, y
+
+
+def unproject(x, y):
+    """(lon, lat) for a viewBox point; the inverse of project()."""
+    west, south, east, north = MAP_LONLAT_BOUNDS
+    x0, y0, x1, y1 = MAP_VIEWBOX_BOUNDS
+    lon = west + (x - x0) / (x1 - x0) * (east - west)
+    m = _mercator_y(north) - (y - y0) / (y1 - y0) * (_mercator_y(north) - _mercator_y(south))
+    return lon, math.degrees(2 * math.atan(math.exp(m)) - math.pi / 2)
+
+
+def geometry_rings(geometry):
+    """Every ring of a GeoJSON Polygon or MultiPolygon, as lon/lat lists."""
+    if geometry is None:
+        return []
+    if geometry["type"] == "Polygon":
+        return list(geometry["coordinates"])
+    if geometry["type"] == "MultiPolygon":
+        return [ring for polygon in geometry["coordinates"] for ring in polygon]
+    raise ValueError(f"unsupported geometry type {geometry['type']!r}")
+
+
+def read_geojson(path):
+    """(properties, rings) per feature of a GeoJSON FeatureCollection."""
+    with open(path, 'r', encoding='utf-8') as f:
+        collection = json.load(f)
+    for feature in collection.get("features", []):
+        yield feature.get("properties") or {}, geometry_rings(feature.get("geometry"))
+
+
+def read_shapefile(path):
+    """(properties, rings) per record of an ESRI shapefile (needs pyshp)."""
+    try:
+        import shapefile
+    except ImportError:
+        sys.exit("Reading shapefiles needs pyshp (pip install pyshp), or convert to GeoJSON")
+    with shapefile.Reader(path) as reader:
+        for record in reader.iterShapeRecords():
+            points, parts = record.shape.points, list(record.shape.parts) + [len(record.shape.points)]
+            rings = [points[a:b] for a, b in zip(parts, parts[1:])]
+            yield record.record.as_dict(), rings
+
+
+def read_boundaries(path):
+    if path.lower().endswith(".shp"):
+        return read_shapefile(path)
+    return read_geojson(path)
+
+
+def state_codes(pcs):
+    """{state name or code, casefolded: code} for STATES and every PC's state."""
+    codes = {}
+    for code, name, *_ in STATES:
+        codes[name.casefold()] = code
+    for pc in pcs:
+        codes.setdefault(pc.state.casefold(), pc.id[:2])
+    for code in set(codes.values()):
+        codes[code.casefold()] = code
+    return codes
+
+
+def feature_id(properties, level, args, codes):
+    """The PC or AC ID of a feature, or None if its properties give none."""
+    if not args.number_field:
+        value = properties.get(args.id_field)
+        return str(value).strip() if value is not None else None
+    code = codes.get(str(properties.get(args.state_field, "")).strip().casefold())
+    try:
+        number = int(properties.get(args.number_field))
+    except (TypeError, ValueError):
+        return None
+    if code is None:
+        return None
+    return ac_id(code, number) if level == "ac" else f"{code}-{number:02d}"
+
+
+def id_level(text):
+    """"pc" or "ac" for a well-formed ID, else None."""
+    if PC_ID_RE.match(text):
+        return "pc"
+    try:
+        split_ac_id(text)
+        return "ac"
+    except ValueError:
+        return None
+
+
+def grid_ring(ring):
+    """A lon/lat ring as an open ring of integer grid points, or None."""
+    points = []
+    for lon, lat, *_ in ring:
+        x, y = project(lon, lat)
+        point = (round(x * GRID), round(y * GRID))
+        if not points or point != points[-1]:
+            points.append(point)
+    while len(points) > 1 and points[0] == points[-1]:
+        points.pop()
+    return points if len(points) >= 3 else None
+
+
+def load_features(path, level, args, codes):
+    """(Features in file order, features without an ID) from a boundary file.
+
+    Rings are projected onto the grid; features sharing an ID are merged.
+    """
+    rings_by_id = {}
+    no_id = 0
+    for properties, rings in read_boundaries(path):
+        fid = feature_id(properties, level, args, codes)
+        if not fid:
+            no_id += 1
+            continue
+        grid_rings = rings_by_id.setdefault(fid, [])
+        for ring in rings:
+            points = grid_ring(ring)
+            if points:
+                grid_rings.append(points)
+    features = [Feature(fid, rings) for fid, rings in rings_by_id.items() if rings]
+    return features, no_id
+
+
+def centroid(ring):
+    """Area centroid of an open ring (vertex mean if it has no area)."""
+    area = ring_area(ring)
+    if not area:
+        return (sum(x for x, _ in ring) / len(ring), sum(y for _, y in ring) / len(ring))
+    cx = cy = 0.0
+    for i, (x1, y1) in enumerate(ring):
+        x2, y2 = ring[(i + 1) % len(ring)]
+        cross = x1 * y2 - x2 * y1
+        cx += (x1 + x2) * cross
+        cy += (y1 + y2) * cross
+    return cx / (6 * area), cy / (6 * area)
+
+
+def build_geometry(features, tolerance, min_area):
+    """Simplified rows plus their viewBox bboxes, in feature order.
+
+    Returns [(row, bbox)], row being { id, path, labelX, labelY } in
+    1/TILE_SCALE units, bbox [x0, y0, x1, y1] in viewBox units.
+    """
+    with stage("topology"):
+        topology = Topology(features)
+        count(arcs=len(topology.arcs),
+              shared_arcs=sum(1 for users in topology.arc_rings if len(users) > 1))
+    with stage("simplify"):
+        lod = Lod("tiles", tolerance, min_area)
+        simplified = simplify_states(features, topology, lod, GRID, TILE_SCALE)
+        count(points=sum(len(ring) for rings in simplified for ring in rings))
+    out = []
+    for feature, rings in zip(features, simplified):
+        rings = [ring for ring in rings if len(ring) >= 3] or rings
+        if not rings:
+            continue
+        label_x, label_y = centroid(max(rings, key=lambda ring: abs(ring_area(ring))))
+        xs = [x for ring in rings for x, _ in ring]
+        ys = [y for ring in rings for _, y in ring]
+        row = {"id": feature.id, "path": format_path(rings),
+               "labelX": round(label_x), "labelY": round(label_y)}
+        bbox = [min(xs) / TILE_SCALE, min(ys) / TILE_SCALE, max(xs) / TILE_SCALE, max(ys) / TILE_SCALE]
+        out.append((row, bbox))
+    return out
+
+
+def _union(bboxes):
+    return [min(b[0] for b in bboxes), min(b[1] for b in bboxes),
+            max(b[2] for b in bboxes), max(b[3] for b in bboxes)]
+
+
+def tile_by_state(geometry):
+    """{state code: (bbox, rows)}."""
+    groups = {}
+    for row, bbox in geometry:
+        groups.setdefault(row["id"][:2], []).append((row, bbox))
+    return {code: (_union([b for _, b in items]), [row for row, _ in items])
+            for code, items in sorted(groups.items())}
+
+
+def tile_by_quadtree(geometry, max_features, bounds=VIEW_BOX):
+    """{quadkey: (bbox, rows)}: quadrants split until each holds max_features.
+
+    Constituencies go to the quadrant holding their label point; a tile's
+    bbox is the union of its constituencies' bboxes, so it may extend past
+    its quadrant.
+    """
+    tiles = {}
+
+    def split(items, x0, y0, x1, y1, key):
+        if len(items) <= max_features or len(key) > QUADTREE_MAX_DEPTH:
+            tiles[key] = (_union([b for _, b in items]), [row for row, _ in items])
+            return
+        mx, my = (x0 + x1) / 2, (y0 + y1) / 2
+        quadrants = [[], [], [], []]
+        for row, bbox in items:
+            x, y = row["labelX"] / TILE_SCALE, row["labelY"] / TILE_SCALE
+            quadrants[(x >= mx) + 2 * (y >= my)].append((row, bbox))
+        for q, (qx0, qy0, qx1, qy1) in enumerate([(x0, y0, mx, my), (mx, y0, x1, my),
+                                                   (x0, my, mx, y1), (mx, my, x1, y1)]):
+            if quadrants[q]:
+                split(quadrants[q], qx0, qy0, qx1, qy1, key + str(q))
+
+    if geometry:
+        split(list(geometry), *bounds, "q")
+    return dict(sorted(tiles.items()))
+
+
+def build_tiles(geometry, tiling, max_features):
+    if tiling == "state":
+        return tile_by_state(geometry)
+    return tile_by_quadtree(geometry, max_features)
+
+
+def check_ids(ids, known):
+    """(unknown IDs, {state code: [IDs without geometry]})."""
+    unknown = sorted(set(ids) - known)
+    missing = {}
+    for fid in sorted(known - set(ids)):
+        missing.setdefault(fid[:2], []).append(fid)
+    return unknown, missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate tiled PC/AC boundary geometry for the map.")
+    parser.add_argument("input", help="boundary file: .geojson/.json, or .shp (needs pyshp)")
+    parser.add_argument("--level", choices=["pc", "ac"], default=None,
+                        help="constituency level (default: inferred from the IDs)")
+    parser.add_argument("--id-field", default="id", help="property holding the PC/AC ID (default: id)")
+    parser.add_argument("--state-field", default="state",
+                        help="with --number-field: property holding the state name or code")
+    parser.add_argument("--number-field", default=None,
+                        help="build IDs from --state-field and this constituency number property")
+    parser.add_argument("--tiles", choices=TILINGS, default="state", help="tiling (default: state)")
+    parser.add_argument("--max-features", type=int, default=64,
+                        help="constituencies per quadtree tile (default: 64)")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="simplification tolerance in viewBox units (default: 0.15)")
+    parser.add_argument("--min-area", type=float, default=0.05,
+                        help="drop unshared rings smaller than this, in viewBox units² (default: 0.05)")
+    parser.add_argument("--strict", action="store_true",
+                        help="exit with an error on unknown IDs or constituencies without geometry")
+    add_store_arguments(parser)
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_run("generate_constituency_geometry", args)
+
+    store = open_store(args.db, STATES)
+    pcs = store.load_pcs()
+    codes = state_codes(pcs)
+    level = args.level
+    if level is None and args.number_field:
+        parser.error("--level is required with --number-field")
+
+    with stage("read"):
+        features, no_id = load_features(args.input, level, args, codes)
+        if level is None:
+            levels = {id_level(f.id) for f in features} - {None}
+            if len(levels) != 1:
+                parser.error(f"cannot infer --level from the IDs in {args.input}")
+            level = levels.pop()
+        count(features=len(features), rings=sum(len(f.rings) for f in features))
+    print(f"Read {len(features)} {level.upper()} features from {args.input}"
+          + (f" ({no_id} without an ID, skipped)" if no_id else ""))
+
+    known = {pc.id for pc in pcs} if level == "pc" else {ac.id for ac in store.load_acs()}
+    unknown, missing = check_ids([f.id for f in features], known)
+    if unknown:
+        print(f"  {len(unknown)} IDs not in the canonical store, dropped: {', '.join(unknown[:10])}"
+              + (" ..." if len(unknown) > 10 else ""))
+        features = [f for f in features if f.id in known]
+    if missing:
+        by_state = [f"{code} {len(ids)}" for code, ids in missing.items()]
+        print(f"  {sum(len(ids) for ids in missing.values())} {level.upper()}s in {len(missing)} states "
+              f"have no geometry: {', '.join(by_state[:8])}" + (" ..." if len(by_state) > 8 else ""))
+
+    geometry = build_geometry(features, args.tolerance, args.min_area)
+    with stage("tile"):
+        tiles = build_tiles(geometry, args.tiles, args.max_features)
+    with stage("emit"):
+        meta = {"level": level, "tiling": args.tiles, "scale": TILE_SCALE, "viewBox": list(VIEW_BOX)}
+        write_tiled_dataset(f"{level}Geometry", tiles, meta)
+    finish_run(args)
+    return 1 if args.strict and (unknown or missing) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
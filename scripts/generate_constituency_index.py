@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Generate reverse indexes over the PC → AC mapping.
+
+pcToAcMapping.js answers "which ACs make up this PC"; the app also needs the
+other directions, which it used to rebuild by walking the mapping. This
+precomputes them:
+
+  AC → PC            pcForAc('AP-AC-001')                    'AP-02'
+  district → ACs     acsInDistrict('Andhra Pradesh', 'Srikakulam')
+  district → PCs     pcsInDistrict('Andhra Pradesh', 'Srikakulam')
+
+Everything is stored as integer arrays over the shared string table
+(stringTable.js, see string_table.py), which already holds each PC ID,
+state and district once. ACs are numbered in assemblyConstituencies.js
+order:
+
+  _ak  AC number -> AC ID as a number (acId() turns it back into the ID)
+  _ap  AC number -> string index of its PC ID, -1 if the AC is in no PC
+  _d   district number -> [string index of name, string index of state], flattened
+  _da  district -> AC numbers, as offsets (_dao, one per district plus one) into _da
+  _dp  district -> PC string indexes, likewise with _dpo
+
+Lookup maps from ID to number are built once at module load, so every
+lookup is a Map get plus an array read. Districts are keyed by state and
+name, since names repeat across states (Aurangabad is in Bihar and
+Maharashtra).
+
+Inputs come from the canonical store, so run this after
+generate_pc_ac_mapping.py and generate_district_mapping.py (pipeline.py does).
+
+Output: src/data/constituencyIndex.js
+"""
+
+import argparse
+import os
+
+from build_manifest import join_lines, write_if_changed
+from canonical_store import add_store_arguments, open_store
+from generate_assembly_data import STATES
+from generate_district_mapping import js_number_array
+from string_table import js_table_import, shared_table, write_string_table
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.join(SCRIPT_DIR, "..")
+OUTPUT_PATH = os.path.join(PROJECT_DIR, "src", "data", "constituencyIndex.js")
+
+
+def build_reverse_index(table, acs, pc_to_ac):
+    """Integer arrays for the reverse lookups over the shared string table.
+
+    table from string_table.shared_table(); acs as canonical_store.Ac tuples.
+    Returns {array name: [ints]}.
+    """
+    ac_no = {}
+    for ac in acs:
+        ac_no[ac.id] = len(ac_no)
+
+    ac_pc = [-1] * len(acs)
+    for pc_id, ac_ids in pc_to_ac.items():
+        if pc_id not in table:
+            continue
+        for ac_id in ac_ids:
+            if ac_id in ac_no:
+                ac_pc[ac_no[ac_id]] = table.index(pc_id)
+
+    # (state, district) -> AC numbers, districts in order of their first AC
+    districts = {}
+    for ac in acs:
+        if ac.district:
+            districts.setdefault((ac.state, ac.district), []).append(ac_no[ac.id])
+
+    arrays = {
+        "_ak": [table.ac_key(ac.id) for ac in acs],
+        "_ap": ac_pc,
+        "_d": [], "_dao": [0], "_da": [], "_dpo": [0], "_dp": [],
+    }
+    for (state, district), numbers in districts.items():
+        arrays["_d"] += [table.index(district), table.index(state)]
+        arrays["_da"] += numbers
+        arrays["_dao"].append(len(arrays["_da"]))
+        pc_refs = sorted({ac_pc[n] for n in numbers if ac_pc[n] >= 0})
+        arrays["_dp"] += pc_refs
+        arrays["_dpo"].append(len(arrays["_dp"]))
+    return arrays
+
+
+def render_reverse_index_js(arrays, pc_count, table):
+    """Stream the index as constituencyIndex.js lines."""
+    yield "// Reverse indexes over pcToAcMapping: AC → PC, district → ACs, district → PCs"
+    yield "// Generated by scripts/generate_constituency_index.py; see it for the layout"
+    yield (f"// {pc_count} PCs, {len(arrays['_ap'])} ACs, {len(arrays['_d']) // 2} districts")
+    yield ""
+    yield from js_table_import(table, ["acId"])
+    yield ""
+    for name in ("_ak", "_ap", "_d", "_dao", "_da", "_dpo", "_dp"):
+        yield from js_number_array(name, arrays[name])
+    yield ""
+    yield "const _acNo = new Map();"
+    yield "for (let i = 0; i < _ak.length; i++) _acNo.set(acId(_ak[i]), i);"
+    yield "const _districtNo = new Map();"
+    yield "for (let i = 0; i < _d.length; i += 2) _districtNo.set(`${_s[_d[i + 1]]}|${_s[_d[i]]}`, i >> 1);"
+    yield ""
+    yield "function _range(offsets, values, decode, d) {"
+    yield "  const out = [];"
+    yield "  if (d === undefined) return out;"
+    yield "  for (let k = offsets[d]; k < offsets[d + 1]; k++) out.push(decode(values[k]));"
+    yield "  return out;"
+    yield "}"
+    yield ""
+    yield "// PC ID of an AC, or null"
+    yield "export function pcForAc(acId) {"
+    yield "  const i = _acNo.get(acId);"
+    yield "  return i === undefined || _ap[i] < 0 ? null : _s[_ap[i]];"
+    yield "}"
+    yield ""
+    yield "// AC IDs in a district, in AC number order"
+    yield "export function acsInDistrict(state, district) {"
+    yield "  return _range(_dao, _da, (n) => acId(_ak[n]), _districtNo.get(`${state}|${district}`));"
+    yield "}"
+    yield ""
+    yield "// PC IDs covering any AC of a district"
+    yield "export function pcsInDistrict(state, district) {"
+    yield "  return _range(_dpo, _dp, (i) => _s[i], _districtNo.get(`${state}|${district}`));"
+    yield "}"
+    yield ""
+    yield "export default { pcForAc, acsInDistrict, pcsInDistrict };"
+    yield ""
+
+
+def render_module(store, table):
+    """constituencyIndex.js from the canonical store (string_table.DEPENDENTS)."""
+    arrays = build_reverse_index(table, store.load_acs(), store.load_pc_to_ac())
+    return render_reverse_index_js(arrays, len(store.load_pcs()), table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the AC → PC and district reverse indexes.")
+    add_store_arguments(parser)
+    args = parser.parse_args()
+    store = open_store(args.db, STATES)
+
+    pcs = store.load_pcs()
+    acs = store.load_acs()
+    table = shared_table(store)
+    arrays = build_reverse_index(table, acs, store.load_pc_to_ac())
+    unmapped = arrays["_ap"].count(-1)
+    print(f"Indexed {len(acs)} ACs ({unmapped} in no PC), {len(arrays['_d']) // 2} districts "
+          f"over {len(table.strings)} shared strings")
+
+    # Refers to districts, so the full table is (re)written with it
+    write_string_table(table, store, own=os.path.basename(OUTPUT_PATH))
+    if write_if_changed(OUTPUT_PATH, join_lines(render_reverse_index_js(arrays, len(pcs), table))):
+        print(f"Wrote {OUTPUT_PATH} ({os.path.getsize(OUTPUT_PATH) / 1024:.0f} KB)")
+    else:
+        print(f"{OUTPUT_PATH} unchanged, not rewritten")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,17 +9,34 @@ Step 3: Generate two JS data files:
   - pincodeDistricts.js mapping PIN codes to districts
 """
 
-import csv
-import json
+import argparse
 import re
-import urllib.request
-import html as html_module
 import os
-import time
+from functools import lru_cache
+
+from aliases import load_aliases, print_alias_usage
+from build_manifest import (
+    BuildManifest, SectionHasher, add_incremental_arguments, digest, file_digest, join_lines,
+    write_if_changed,
+)
+from canonical_store import add_store_arguments, open_store, read_assembly_js
+from data_assets import add_format_arguments, write_assembly_asset
+from data_diff import diff_acs, read_old, report_diff
+from constituency_table import ac_districts, parse_page_records, warm_records
+from pincode_loader import encode_pin_ranges, load_pin_districts
+from run_profile import add_profile_arguments, finish_run, stage, start_run
+from run_profile import count as profile_count
+from string_table import ac_id, js_string, js_table_import, shared_table, split_ac_id, write_string_table
+from wiki_fetch import (
+    add_fetch_arguments, configure_from_args, fetch_wiki_page, map_states, print_cache_stats,
+)
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.join(SCRIPT_DIR, "..")
 
+# Manifest key: this script owns the district fields of assemblyConstituencies.js
+OUTPUT_NAME = "assemblyConstituencies.js:districts"
+
 # State config: (state_code, state_name_in_app, num_acs, wikipedia_list_slug)
 STATES = [
     ("AP", "Andhra Pradesh", 175, "List_of_constituencies_of_the_Andhra_Pradesh_Legislative_Assembly"),
@@ -54,45 +71,43 @@ STATES = [
     ("JK", "Jammu & Kashmir", 90, "List_of_constituencies_of_the_Jammu_and_Kashmir_Legislative_Assembly"),
     ("PY", "Puducherry", 30, "List_of_constituencies_of_the_Puducherry_Legislative_Assembly"),
 ]
-
-
-def fetch_wiki_page(slug, retries=3):
-    """Fetch raw HTML from Wikipedia with retries."""
-    url = f"https://en.wikipedia.org/wiki/{slug}"
-    for attempt in range(retries):
-        try:
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            with urllib.request.urlopen(req, timeout=20) as resp:
-                return resp.read().decode("utf-8", errors="replace")
-        except Exception as e:
-            if attempt < retries - 1:
-                print(f"    Retry {attempt + 1}/{retries} for {slug}: {e}")
-                time.sleep(2)
-            else:
-                print(f"  Failed to fetch {slug}: {e}")
-                return None
-
-
-def parse_cell(cell_html):
-    """Parse a single table cell, extracting text and rowspan."""
-    attrs_match = re.match(r'<t[hd]([^>]*)>', cell_html)
-    attrs = attrs_match.group(1) if attrs_match else ''
-
-    rowspan = 1
-    rs_match = re.search(r'rowspan\s*=\s*["\']?(\d+)', attrs)
-    if rs_match:
-        rowspan = int(rs_match.group(1))
-
-    # Extract text content
-    # Remove the opening tag
-    inner = re.sub(r'^<t[hd][^>]*>', '', cell_html)
-    inner = re.sub(r'</t[hd]>$', '', inner)
-    text = re.sub(r'<[^>]+>', '', inner).strip()
-    text = html_module.unescape(text)
-    # Remove footnote markers
-    text = re.sub(r'\[\d+\]', '', text).strip()
-
-    return text, rowspan
+STATE_CODES = {name: code for code, name, _, _ in STATES}
+
+
+# State name mapping: PIN data uses ALL CAPS, our app uses Title Case
+PIN_STATE_NAMES = {
+    "ANDHRA PRADESH": "Andhra Pradesh",
+    "ARUNACHAL PRADESH": "Arunachal Pradesh",
+    "ASSAM": "Assam",
+    "BIHAR": "Bihar",
+    "CHHATTISGARH": "Chhattisgarh",
+    "GOA": "Goa",
+    "GUJARAT": "Gujarat",
+    "HARYANA": "Haryana",
+    "HIMACHAL PRADESH": "Himachal Pradesh",
+    "JHARKHAND": "Jharkhand",
+    "KARNATAKA": "Karnataka",
+    "KERALA": "Kerala",
+    "MADHYA PRADESH": "Madhya Pradesh",
+    "MAHARASHTRA": "Maharashtra",
+    "MANIPUR": "Manipur",
+    "MEGHALAYA": "Meghalaya",
+    "MIZORAM": "Mizoram",
+    "NAGALAND": "Nagaland",
+    "ODISHA": "Odisha",
+    "PUNJAB": "Punjab",
+    "RAJASTHAN": "Rajasthan",
+    "SIKKIM": "Sikkim",
+    "TAMIL NADU": "Tamil Nadu",
+    "TELANGANA": "Telangana",
+    "TRIPURA": "Tripura",
+    "UTTAR PRADESH": "Uttar Pradesh",
+    "UTTARAKHAND": "Uttarakhand",
+    "WEST BENGAL": "West Bengal",
+    "DELHI": "NCT of Delhi",
+    "JAMMU AND KASHMIR": "Jammu & Kashmir",
+    "PUDUCHERRY": "Puducherry",
+}
 
 
 def extract_ac_districts(page_html, expected_count, state_name):
@@ -101,364 +116,325 @@ def extract_ac_districts(page_html, expected_count, state_name):
     Tables typically have columns like:
     [Number, Name, Category/Reservation, District, Lok Sabha]
 
-    The District column uses rowspan to span multiple ACs.
+    Returns (ac_number -> district, ac_name -> district); the second covers
+    tables without row numbers (e.g. Karnataka) and is matched by name later.
     """
-    if not page_html:
-        return {}
-
-    # Find all table cells including their tags for proper rowspan parsing
-    rows = re.findall(r'<tr[^>]*>(.*?)</tr>', page_html, re.DOTALL)
-
-    results = {}  # ac_number -> district
-    name_to_district = {}  # ac_name -> district (for tables without numbers)
-    carry = {}    # column_index -> (value, remaining_rows)
-    district_col = None  # Auto-detect which column is the district
-    header_detected = False
-
-    for row_html in rows:
-        # Find all cells in this row (both th and td)
-        cells_raw = re.findall(r'<t[hd][^>]*>.*?</t[hd]>', row_html, re.DOTALL)
-
-        # Build the full row by interleaving carried-over rowspan values
-        full_row = []
-        col_idx = 0
-        cell_idx = 0
-
-        while col_idx < 12:
-            if col_idx in carry:
-                val, remaining = carry[col_idx]
-                full_row.append(val)
-                remaining -= 1
-                if remaining <= 0:
-                    del carry[col_idx]
-                else:
-                    carry[col_idx] = (val, remaining)
-                col_idx += 1
-            elif cell_idx < len(cells_raw):
-                text, rowspan = parse_cell(cells_raw[cell_idx])
-                full_row.append(text)
-                if rowspan > 1:
-                    carry[col_idx] = (text, rowspan - 1)
-                cell_idx += 1
-                col_idx += 1
-            else:
-                break
-
-        if len(full_row) < 3:
-            continue
-
-        # Detect header row to find district column
-        # Check for header-like rows that contain "district" or "district(s)"
-        # Must look like a proper table header (>=3 columns, has '#' or 'name' or 'constituency')
-        lower_row = [c.lower() for c in full_row]
-        if len(lower_row) >= 3:
-            district_header_idx = None
-            has_header_markers = any(
-                c in ('#', 'no', 'no.', 's.no', 'sl.no', 'sl. no.', 'sl. no')
-                or 'name' in c or 'constituency' in c
-                for c in lower_row
-            )
-            if has_header_markers:
-                for ci, cell_text in enumerate(lower_row):
-                    if cell_text.startswith('district'):
-                        district_header_idx = ci
-                        break
-            if district_header_idx is not None:
-                new_col = district_header_idx
-                district_col = new_col
-                header_detected = True
-                carry = {}
-                results = {}
-                name_to_district = {}
-                continue
-
-        if district_col is None:
-            continue
-
-        # Check if first cell is a constituency number
-        num_text = full_row[0].strip()
-        has_number = re.match(r'^\d{1,3}$', num_text)
-
-        if has_number:
-            num = int(num_text)
-            if num < 1 or num > expected_count + 5:
-                continue
-
-            # Get district from the known column
-            if district_col < len(full_row):
-                district = full_row[district_col].strip()
-                # If comma-separated (e.g. "District1, District2"), take the first
-                if ',' in district:
-                    district = district.split(',')[0].strip()
-                # Remove parenthetical info and "district" suffix
-                district = re.sub(r'\s*\([^)]*\)\s*', '', district).strip()
-                district = re.sub(r'\s+district$', '', district, flags=re.IGNORECASE).strip()
-                district = re.sub(r'\s*\[\d+\]\s*', '', district).strip()
-                if district and len(district) > 1 and not district.isdigit():
-                    if district.upper() not in ('SC', 'ST', 'NONE', 'GEN', 'GENERAL'):
-                        results[num] = district
-        else:
-            # Some tables don't have row numbers (e.g., Karnataka)
-            # Use name_col (col 1) to find the constituency name,
-            # and match by name to assign ac_number later
-            if len(full_row) > district_col:
-                name = full_row[1].strip() if len(full_row) > 1 else ''
-                district = full_row[district_col].strip()
-                if ',' in district:
-                    district = district.split(',')[0].strip()
-                district = re.sub(r'\s*\([^)]*\)\s*', '', district).strip()
-                district = re.sub(r'\s+district$', '', district, flags=re.IGNORECASE).strip()
-                district = re.sub(r'\s*\[\d+\]\s*', '', district).strip()
-                if name and district and len(district) > 1 and not district.isdigit():
-                    if district.upper() not in ('SC', 'ST', 'NONE', 'GEN', 'GENERAL', ''):
-                        name_to_district[name] = district
-
-    return results, name_to_district
-
-
-def read_existing_assembly_data():
-    """Read existing assemblyConstituencies.js to get current entries."""
-    path = os.path.join(PROJECT_DIR, "src", "data", "assemblyConstituencies.js")
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    entries = []
-    # Match both old format (without district) and new format (with district)
-    for match in re.finditer(
-        r'\{ id: "([^"]+)", name: \'([^\']*)\', state: \'([^\']*)\','
-        r'(?:\s*district: \'([^\']*)\',)?\s*acNo: (\d+) \}',
-        content
-    ):
-        entry = {
-            'id': match.group(1),
-            'name': match.group(2),
-            'state': match.group(3),
-            'acNo': int(match.group(5)),
-        }
-        if match.group(4):
-            entry['district'] = match.group(4)
-        entries.append(entry)
-    return entries
+    return ac_districts(parse_page_records(page_html, expected_count))
 
 
 def build_pincode_to_district():
-    """Read the India Post CSV and build PIN → district mapping."""
+    """Stream the India Post CSV into a compact PIN → district table."""
     csv_path = os.path.join(SCRIPT_DIR, "pincode_full.csv")
+    return load_pin_districts(csv_path, PIN_STATE_NAMES)
+
+
+_DISTRICT_SUFFIX_RE = re.compile(r'\s+(DISTRICT|DIST)\.?$')
+_SPACES_RE = re.compile(r'\s+')
+
 
-    # State name mapping: PIN data uses ALL CAPS, our app uses Title Case
-    state_map = {
-        "ANDHRA PRADESH": "Andhra Pradesh",
-        "ARUNACHAL PRADESH": "Arunachal Pradesh",
-        "ASSAM": "Assam",
-        "BIHAR": "Bihar",
-        "CHHATTISGARH": "Chhattisgarh",
-        "GOA": "Goa",
-        "GUJARAT": "Gujarat",
-        "HARYANA": "Haryana",
-        "HIMACHAL PRADESH": "Himachal Pradesh",
-        "JHARKHAND": "Jharkhand",
-        "KARNATAKA": "Karnataka",
-        "KERALA": "Kerala",
-        "MADHYA PRADESH": "Madhya Pradesh",
-        "MAHARASHTRA": "Maharashtra",
-        "MANIPUR": "Manipur",
-        "MEGHALAYA": "Meghalaya",
-        "MIZORAM": "Mizoram",
-        "NAGALAND": "Nagaland",
-        "ODISHA": "Odisha",
-        "PUNJAB": "Punjab",
-        "RAJASTHAN": "Rajasthan",
-        "SIKKIM": "Sikkim",
-        "TAMIL NADU": "Tamil Nadu",
-        "TELANGANA": "Telangana",
-        "TRIPURA": "Tripura",
-        "UTTAR PRADESH": "Uttar Pradesh",
-        "UTTARAKHAND": "Uttarakhand",
-        "WEST BENGAL": "West Bengal",
-        "DELHI": "NCT of Delhi",
-        "JAMMU AND KASHMIR": "Jammu & Kashmir",
-        "PUDUCHERRY": "Puducherry",
-    }
-
-    pin_to_district = {}  # pin -> {district, state}
-
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            pin = row['pincode'].strip()
-            district = row['district'].strip().title()  # Normalize to Title Case
-            state_raw = row['statename'].strip()
-            state = state_map.get(state_raw)
-
-            if not state or not pin or len(pin) != 6:
-                continue
-
-            # Use first occurrence (they should all be same district for same pin)
-            if pin not in pin_to_district:
-                pin_to_district[pin] = {'district': district, 'state': state}
-
-    return pin_to_district
-
-
-def normalize_district_name(name):
-    """Normalize district name for matching across datasets."""
+@lru_cache(maxsize=None)
+def normalize_district_name(name, state=None):
+    """Normalize district name for matching across datasets.
+
+    state is the app state name; alternate spellings are looked up per state
+    in scripts/aliases/district_names.json (all states when it is None).
+    """
     name = name.upper().strip()
     # Remove common suffixes
-    name = re.sub(r'\s+(DISTRICT|DIST)\.?$', '', name)
+    name = _DISTRICT_SUFFIX_RE.sub('', name)
     # Normalize spacing
-    name = re.sub(r'\s+', ' ', name)
-    # Common alternate spellings
-    replacements = {
-        'AHMADABAD': 'AHMEDABAD',
-        'BANGALORE URBAN': 'BENGALURU URBAN',
-        'BANGALORE RURAL': 'BENGALURU RURAL',
-        'BELLARY': 'BALLARI',
-        'BIJAPUR': 'VIJAYAPURA',
-        'GULBARGA': 'KALABURAGI',
-        'MYSORE': 'MYSURU',
-        'SHIMOGA': 'SHIVAMOGGA',
-        'TUMKUR': 'TUMAKURU',
-        'RAICHUR': 'RAICHUR',
-        'BELGAUM': 'BELAGAVI',
-        'MANGALORE': 'DAKSHINA KANNADA',
-        'PONDICHERRY': 'PUDUCHERRY',
-        'BANAS KANTHA': 'BANASKANTHA',
-        'SABAR KANTHA': 'SABARKANTHA',
-        'PANCH MAHALS': 'PANCHMAHAL',
-        'THE DANGS': 'DANG',
-        'MAHESANA': 'MEHSANA',
-        'KACHCHH': 'KUTCH',
-        'BALESHWAR': 'BALASORE',
-        'ANUGUL': 'ANGUL',
-        'JAGATSINGHPUR': 'JAGATSINGHAPUR',
-        'KEONJHAR': 'KENDUJHAR',
-        'MAYURBHANJ': 'MAYURBHANJ',
-        'SUBARNAPUR': 'SONEPUR',
-        'BAUDH': 'BOUDH',
-    }
-    for old, new in replacements.items():
-        if name == old:
-            name = new
-            break
-    return name
-
-
-def write_assembly_data_with_districts(entries, output_path):
-    """Write updated assemblyConstituencies.js with district field."""
-    states_count = {}
-    for e in entries:
-        states_count[e['state']] = states_count.get(e['state'], 0) + 1
+    name = _SPACES_RE.sub(' ', name)
+    return load_aliases("district_names").resolve(STATE_CODES.get(state), name)
 
-    lines = [
-        "// India's Vidhan Sabha (State Assembly) constituencies",
-        "// Data compiled from Election Commission of India records",
-        f"// Total: {len(entries)} constituencies across {len(states_count)} states/UTs",
-        "",
-        "const assemblyConstituencies = [",
-    ]
-
-    current_state = None
-    for e in entries:
-        if e['state'] != current_state:
-            current_state = e['state']
-            count = states_count[current_state]
-            lines.append(f"  // {current_state} ({count})")
 
-        name_esc = e['name'].replace("'", "\\'")
-        district_esc = e.get('district', '').replace("'", "\\'")
+# ACs per line in the encoded assemblyConstituencies.js
+ACS_PER_LINE = 6
 
-        if district_esc:
-            lines.append(
-                f'  {{ id: "{e["id"]}", name: \'{name_esc}\', state: \'{e["state"]}\', '
-                f'district: \'{district_esc}\', acNo: {e["acNo"]} }},'
-            )
-        else:
-            lines.append(
-                f'  {{ id: "{e["id"]}", name: \'{name_esc}\', state: \'{e["state"]}\', '
-                f'acNo: {e["acNo"]} }},'
-            )
 
-    lines.append("];")
-    lines.append("")
-    lines.append("export default assemblyConstituencies;")
-    lines.append("")
+def emit_assembly_js(entries, state_counts, table, hasher):
+    """Stream assemblyConstituencies.js as lines, dictionary-encoded.
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines))
+    entries: entry dicts grouped by state with acNo running 1..n, e.g.
+    store.iter_ac_entries(). state_counts: {state: AC count}, precomputed
+    (store.count_acs_by_state()) for the header and per-state comments.
+    States and districts are written as indexes into the shared string table
+    (string_table.py) and IDs are rebuilt from state code and AC number, so
+    each AC costs its name and a district index. The module decodes to the
+    same array of { id, name, state, district, acNo } objects as before.
+    Each state's lines are fed to hasher for the build manifest.
+    """
+    yield "// India's Vidhan Sabha (State Assembly) constituencies"
+    yield "// Data compiled from Election Commission of India records"
+    yield (f"// Total: {sum(state_counts.values())} constituencies "
+           f"across {len(state_counts)} states/UTs")
+    yield "// Dictionary-encoded against stringTable.js; decoded once below"
+    yield ""
+    yield from js_table_import(table)
+    yield ""
+    yield "// Per AC, in order: name, district (string index, -1 if unknown)"
+    yield "const _a = ["
+    states = []  # (state, code) in output order
+    row = []
+    for e in entries:
+        if not states or e['state'] != states[-1][0]:
+            if row:
+                line = "  " + ",".join(row) + ","
+                hasher.add(states[-1][0], line)
+                yield line
+                row = []
+            states.append((e['state'], split_ac_id(e['id'])[0]))
+            line = f"  // {e['state']} ({state_counts[e['state']]})"
+            hasher.add(e['state'], line)
+            yield line
+            ac_no = 0
+        ac_no += 1
+        if e['acNo'] != ac_no or e['id'] != ac_id(states[-1][1], ac_no):
+            raise ValueError(f"{e['id']}: {e['state']} ACs must be numbered 1..n in order")
+        district = table.index(e['district']) if e.get('district') else -1
+        row.append(f"{js_string(e['name'])},{district}")
+        if len(row) == ACS_PER_LINE:
+            line = "  " + ",".join(row) + ","
+            hasher.add(e['state'], line)
+            yield line
+            row = []
+    if row:
+        line = "  " + ",".join(row) + ","
+        hasher.add(states[-1][0], line)
+        yield line
+    yield "];"
+    yield ""
+    yield "// Per state: name, code (string indexes), AC count; ACs are numbered 1..count"
+    yield "const _st = ["
+    for state, code in states:
+        line = f"  {table.index(state)},{table.index(code)},{state_counts[state]},"
+        hasher.add(state, line)
+        yield line
+    yield "];"
+    yield ""
+    yield "const assemblyConstituencies = [];"
+    yield "for (let i = 0, k = 0; i < _st.length; i += 3) {"
+    yield "  const state = _s[_st[i]];"
+    yield "  const code = _s[_st[i + 1]];"
+    yield "  for (let acNo = 1; acNo <= _st[i + 2]; acNo++, k += 2) {"
+    yield "    const entry = { id: `${code}-AC-${String(acNo).padStart(3, '0')}`, name: _a[k], state };"
+    yield "    if (_a[k + 1] >= 0) entry.district = _s[_a[k + 1]];"
+    yield "    entry.acNo = acNo;"
+    yield "    assemblyConstituencies.push(entry);"
+    yield "  }"
+    yield "}"
+    yield ""
+    yield "export default assemblyConstituencies;"
+    yield ""
+
+
+def render_module(store, table):
+    """assemblyConstituencies.js from the canonical store (string_table.DEPENDENTS)."""
+    return emit_assembly_js(store.iter_ac_entries(), store.count_acs_by_state(), table, SectionHasher())
+
+
+def write_assembly_js(entries, state_counts, table, output_path, fmt="js", shard=False, store=None):
+    """Stream entries to assemblyConstituencies.js, or to assets.
+
+    table is the shared string table (string_table.shared_table), written
+    alongside; with store, the other modules encoded against it are
+    re-rendered if the new table leaves them stale. Skips the write when the content is unchanged and reports the
+    per-entry diff against the replaced file. With fmt "json" or "binary", or
+    with shard, writes content-hashed assets instead of output_path. Returns
+    ({state: section digest}, path written).
+    """
+    hasher = SectionHasher()
+    if fmt != "js" or shard:
+        entries = list(entries)
+        for _ in emit_assembly_js(entries, state_counts, table, hasher):
+            pass
+        return hasher.digests(), write_assembly_asset(entries, fmt, shard)
+
+    total = sum(state_counts.values())
+    # Read the old file before its string table is replaced
+    old_entries = read_old(output_path, read_assembly_js)
+    write_string_table(table, store, own=os.path.basename(output_path))
+    lines = emit_assembly_js(entries, state_counts, table, hasher)
+    if write_if_changed(output_path, join_lines(lines)):
+        print(f"Wrote {total} entries to {output_path}")
+        if old_entries is not None:
+            report_diff(os.path.basename(output_path),
+                        diff_acs(old_entries, read_assembly_js(output_path)))
+    else:
+        print(f"{output_path} unchanged, not rewritten")
+    return hasher.digests(), output_path
+
+
+def _js_district_table(districts):
+    yield "// Districts: [name, state]"
+    yield "const _d = ["
+    for d, s in districts:
+        d_esc = d.replace("'", "\\'")
+        s_esc = s.replace("'", "\\'")
+        yield f"  ['{d_esc}','{s_esc}'],"
+    yield "];"
 
-    print(f"Wrote {len(entries)} entries to {output_path}")
 
+def js_number_array(name, values, per_line=24):
+    yield f"const {name} = ["
+    values = list(values)
+    for i in range(0, len(values), per_line):
+        yield "  " + ",".join(str(v) for v in values[i:i + per_line]) + ","
+    yield "];"
 
-def write_pincode_district_map(pin_to_district, output_path):
-    """Write compact PIN code → district mapping as JS file.
 
-    Uses indexed format for compression:
-    - districts: array of [district, state] pairs
-    - pins: object mapping PIN code to district index
+def render_pin_keys_js(pin_rows):
+    """Render pin_rows as one object key per PIN: _p = { 110001:0, ... }.
 
-    Since many consecutive PIN codes map to the same district,
-    we also check if simple object format is compact enough.
+    Returns (lines, PIN count, district count); lines is a generator.
     """
-    # Build district index
     districts = []
     district_to_idx = {}
-
-    for pin in sorted(pin_to_district.keys()):
-        data = pin_to_district[pin]
-        key = f"{data['district']}|{data['state']}"
+    for _, district, state in pin_rows:
+        key = (district, state)
         if key not in district_to_idx:
             district_to_idx[key] = len(districts)
-            districts.append((data['district'], data['state']))
+            districts.append(key)
+
+    def lines():
+        yield "// PIN code to district mapping (compact indexed format)"
+        yield "// Source: India Post All India Pincode Directory"
+        yield f"// {len(pin_rows)} PIN codes, {len(districts)} unique districts"
+        yield ""
+        yield from _js_district_table(districts)
+        yield ""
+        yield "// PIN code -> district index"
+        yield "const _p = {"
+        for pin, district, state in pin_rows:
+            yield f"  {pin:06d}:{district_to_idx[(district, state)]},"
+        yield "};"
+        yield ""
+        yield "// Lookup function: returns { district, state } or null"
+        yield "export function lookupPinDistrict(pin) {"
+        yield "  const idx = _p[pin];"
+        yield "  if (idx === undefined) return null;"
+        yield "  const [d, s] = _d[idx];"
+        yield "  return { district: d, state: s };"
+        yield "}"
+        yield ""
+        yield "export default { lookupPinDistrict };"
+        yield ""
+
+    return lines(), len(pin_rows), len(districts)
+
+
+def render_range_search_js(starts, lengths, indexes):
+    """JS lines declaring interval arrays and a binary search over them.
+
+    _s holds interval starts delta-encoded against the previous start (decoded
+    once at module load), _l interval lengths and _i the value index of each
+    interval. _find(pin) returns the value index covering pin, or -1.
+    """
+    deltas = [b - a for a, b in zip([0] + list(starts), starts)]
+    yield "// Ranges: start (delta from previous start), length, value index"
+    yield from js_number_array("_s", deltas)
+    yield from js_number_array("_l", lengths)
+    yield from js_number_array("_i", indexes)
+    yield "for (let i = 1; i < _s.length; i++) _s[i] += _s[i - 1];"
+    yield ""
+    yield "function _find(pin) {"
+    yield "  const p = Number(pin);"
+    yield "  let lo = 0;"
+    yield "  let hi = _s.length - 1;"
+    yield "  while (lo <= hi) {"
+    yield "    const mid = (lo + hi) >> 1;"
+    yield "    if (_s[mid] <= p) lo = mid + 1;"
+    yield "    else hi = mid - 1;"
+    yield "  }"
+    yield "  return hi < 0 || p >= _s[hi] + _l[hi] ? -1 : _i[hi];"
+    yield "}"
+
+
+def render_pin_ranges_js(pin_rows, fill_gaps=False):
+    """Render pin_rows as interval arrays searched with a binary search.
+
+    Returns (lines, PIN count, district count); lines is a generator.
+    """
+    districts, starts, lengths, indexes = encode_pin_ranges(pin_rows, fill_gaps)
+
+    def lines():
+        yield "// PIN code to district mapping (range-encoded)"
+        yield "// Source: India Post All India Pincode Directory"
+        yield f"// {len(pin_rows)} PIN codes in {len(starts)} ranges, {len(districts)} unique districts"
+        if fill_gaps:
+            yield "// Unlisted PINs inside a district's range resolve to that district"
+        yield ""
+        yield from _js_district_table(districts)
+        yield ""
+        yield from render_range_search_js(starts, lengths, indexes)
+        yield ""
+        yield "// Lookup function: returns { district, state } or null"
+        yield "export function lookupPinDistrict(pin) {"
+        yield "  const idx = _find(pin);"
+        yield "  if (idx < 0) return null;"
+        yield "  const [d, s] = _d[idx];"
+        yield "  return { district: d, state: s };"
+        yield "}"
+        yield ""
+        yield "export default { lookupPinDistrict };"
+        yield ""
+
+    return lines(), len(pin_rows), len(districts)
+
+
+PIN_ENCODINGS = {
+    "exact-ranges": render_pin_ranges_js,
+    "filled-ranges": lambda rows: render_pin_ranges_js(rows, fill_gaps=True),
+    "keys": render_pin_keys_js,
+}
+
+
+def write_pincode_district_map(pin_rows, output_path, encoding="exact-ranges"):
+    """Write compact PIN code → district mapping as JS file.
 
-    lines = [
-        "// PIN code to district mapping (compact indexed format)",
-        "// Source: India Post All India Pincode Directory",
-        f"// {len(pin_to_district)} PIN codes, {len(districts)} unique districts",
-        "",
-        "// Districts: [name, state]",
-        "const _d = [",
-    ]
+    pin_rows: a list of (pin, district, state) tuples in ascending PIN order.
 
-    for d, s in districts:
-        d_esc = d.replace("'", "\\'")
-        s_esc = s.replace("'", "\\'")
-        lines.append(f"  ['{d_esc}','{s_esc}'],")
-
-    lines.append("];")
-    lines.append("")
-    lines.append("// PIN code -> district index")
-    lines.append("const _p = {")
-
-    for pin in sorted(pin_to_district.keys()):
-        data = pin_to_district[pin]
-        key = f"{data['district']}|{data['state']}"
-        idx = district_to_idx[key]
-        lines.append(f"  {pin}:{idx},")
-
-    lines.append("};")
-    lines.append("")
-    lines.append("// Lookup function: returns { district, state } or null")
-    lines.append("export function lookupPinDistrict(pin) {")
-    lines.append("  const idx = _p[pin];")
-    lines.append("  if (idx === undefined) return null;")
-    lines.append("  const [d, s] = _d[idx];")
-    lines.append("  return { district: d, state: s };")
-    lines.append("}")
-    lines.append("")
-    lines.append("export default { lookupPinDistrict };")
-    lines.append("")
-
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines))
+    Encodings (see PIN_ENCODINGS):
+    - exact-ranges: runs of consecutive listed PINs of the same district
+      collapse into one (start, length, district) interval
+    - filled-ranges: intervals also span the unlisted PINs between a
+      district's listed ones, which then resolve to it instead of null;
+      smaller, but opt-in for that reason
+    - keys: one object key per PIN, the original format
+    """
+    lines, pin_count, district_count = PIN_ENCODINGS[encoding](pin_rows)
+
+    if not write_if_changed(output_path, join_lines(lines)):
+        print(f"{output_path} unchanged, not rewritten")
+        return
 
     size_kb = os.path.getsize(output_path) / 1024
-    print(f"Wrote {len(pin_to_district)} PIN codes ({len(districts)} districts) to {output_path} ({size_kb:.0f} KB)")
+    print(f"Wrote {pin_count} PIN codes ({district_count} districts, {encoding}) "
+          f"to {output_path} ({size_kb:.0f} KB)")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate district mapping data for assembly constituencies.")
+    add_fetch_arguments(parser)
+    add_incremental_arguments(parser)
+    add_store_arguments(parser)
+    add_format_arguments(parser)
+    parser.add_argument("--pin-encoding", choices=sorted(PIN_ENCODINGS), default="exact-ranges",
+                        help="pincodeDistricts.js format (default: exact-ranges; filled-ranges "
+                             "also resolves unlisted PINs between a district's own)")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_run("generate_district_mapping", args)
+    configure_from_args(args)
+    store = open_store(args.db, STATES)
+
+    manifest = BuildManifest(args.manifest)
+    output_ac = os.path.join(PROJECT_DIR, "src", "data", "assemblyConstituencies.js")
+    previous_sources = {} if args.force else manifest.output(OUTPUT_NAME)["sources"]
+    source_digests = {}
+
     # Step 1: Read existing assembly data
     print("Reading existing assembly constituency data...")
-    entries = read_existing_assembly_data()
+    entries = store.load_ac_entries()
     print(f"  Found {len(entries)} entries")
 
     # Step 2: Scrape Wikipedia for district data
@@ -473,76 +449,130 @@ def main():
     total_with_district = 0
     total_without = 0
 
-    for code, state, count, slug in STATES:
+    def fetch_state(state_cfg):
+        """Returns (page digest, page), with a None page to keep existing districts."""
+        code, state, count, slug = state_cfg
+        with stage("fetch", code):
+            page = fetch_wiki_page(slug)
+        if not page:
+            return None, None
+        page_sha = digest(page)
+        if previous_sources.get(code) == page_sha:
+            return page_sha, None
+        return page_sha, page
+
+    state_pages = map_states(fetch_state, STATES, workers=args.workers)
+    # With --jobs N, pages are parsed up front in N processes
+    warm_records([(cfg[0], page, cfg[2]) for cfg, (_, page) in zip(STATES, state_pages)], args.jobs)
+
+    def keep_existing(state):
+        """Count the districts the state's entries already carry; returns how many."""
+        nonlocal total_with_district, total_without
+        kept = sum(1 for e in state_entry_map.get(state, {}).values() if 'district' in e)
+        total_with_district += kept
+        total_without += len(state_entry_map.get(state, {})) - kept
+        return kept
+
+    for (code, state, count, slug), (page_sha, page) in zip(STATES, state_pages):
         print(f"\n  {state} ({count} ACs)...")
-        page = fetch_wiki_page(slug)
 
-        if not page:
-            print(f"    Failed to fetch page")
-            total_without += count
+        if page_sha is None:
+            # Stored districts are kept, as for an unchanged source
+            print(f"    Failed to fetch page, keeping {keep_existing(state)} existing districts")
             continue
 
-        ac_districts, name_districts = extract_ac_districts(page, count, state)
+        source_digests[code] = page_sha
+        if page is None:
+            # Entries read from the existing file already carry these districts
+            print(f"    Source unchanged, keeping {keep_existing(state)} existing districts")
+            continue
 
-        # Match by name for tables without AC numbers
-        if name_districts and state in state_entry_map:
-            for ac_no, entry in state_entry_map[state].items():
-                if ac_no not in ac_districts:
-                    # Try fuzzy name match
-                    name = entry['name']
-                    if name in name_districts:
-                        ac_districts[ac_no] = name_districts[name]
-                    else:
-                        # Try case-insensitive
-                        name_lower = name.lower()
-                        for wiki_name, dist in name_districts.items():
-                            if wiki_name.lower() == name_lower:
-                                ac_districts[ac_no] = dist
-                                break
-
-        print(f"    Found districts for {len(ac_districts)}/{count} ACs")
+        with stage("parse", code):
+            districts_by_no, name_districts = ac_districts(parse_page_records(page, count))
+
+        with stage("match", code):
+            # Match by name for tables without AC numbers
+            if name_districts and state in state_entry_map:
+                for ac_no, entry in state_entry_map[state].items():
+                    if ac_no not in districts_by_no:
+                        # Try fuzzy name match
+                        name = entry['name']
+                        if name in name_districts:
+                            districts_by_no[ac_no] = name_districts[name]
+                        else:
+                            # Try case-insensitive
+                            name_lower = name.lower()
+                            for wiki_name, dist in name_districts.items():
+                                if wiki_name.lower() == name_lower:
+                                    districts_by_no[ac_no] = dist
+                                    break
+
+        print(f"    Found districts for {len(districts_by_no)}/{count} ACs")
 
         if state in state_entry_map:
             for ac_no, entry in state_entry_map[state].items():
-                if ac_no in ac_districts:
-                    entry['district'] = ac_districts[ac_no]
+                if ac_no in districts_by_no:
+                    entry['district'] = districts_by_no[ac_no]
                     total_with_district += 1
                 else:
                     total_without += 1
 
-        time.sleep(1)  # Be nice to Wikipedia
+    print_cache_stats()
 
     print(f"\nDistrict coverage: {total_with_district}/{total_with_district + total_without} "
           f"({100 * total_with_district / (total_with_district + total_without):.1f}%)")
 
-    # Step 3: Write updated assembly data
-    output_ac = os.path.join(PROJECT_DIR, "src", "data", "assemblyConstituencies.js")
-    write_assembly_data_with_districts(entries, output_ac)
+    # Step 3: Persist districts, then emit assembly data from the canonical store
+    with stage("emit"):
+        store.save_acs(entries)
+        section_digests, output_ac = write_assembly_js(
+            store.iter_ac_entries(), store.count_acs_by_state(), shared_table(store),
+            output_ac, args.format, args.shard, store=store)
+    changed = manifest.changed_sections(OUTPUT_NAME, section_digests)
+    if changed:
+        print(f"  Changed states: {', '.join(sorted(changed))}")
+    manifest.update(OUTPUT_NAME, source_digests=source_digests, section_digests=section_digests,
+                    file_sha=file_digest(output_ac))
+    manifest.save()
 
     # Step 4: Build PIN → district mapping
-    print("\nBuilding PIN code to district mapping...")
-    pin_to_district = build_pincode_to_district()
-    print(f"  Found {len(pin_to_district)} unique PIN codes")
+    if not os.path.exists(os.path.join(SCRIPT_DIR, "pincode_full.csv")):
+        print("\nscripts/pincode_full.csv not found, skipping PIN code mapping")
+        finish_run(args)
+        return
 
+    print("\nBuilding PIN code to district mapping...")
+    with stage("pins"):
+        pin_table = build_pincode_to_district()
+        profile_count(rows_parsed=pin_table.rows_read)
+    print(f"  Read {pin_table.rows_read} rows ({pin_table.rows_skipped} skipped): "
+          f"{len(pin_table)} unique PIN codes, {len(pin_table.districts)} districts")
+    conflicts = pin_table.conflict_report()
+    if conflicts:
+        print(f"  {len(conflicts)} PIN codes span several districts (kept the first):")
+        for pin, districts in conflicts[:10]:
+            print(f"    {pin}: {' / '.join(f'{d} ({s})' for d, s in districts)}")
     output_pin = os.path.join(PROJECT_DIR, "src", "data", "pincodeDistricts.js")
-    write_pincode_district_map(pin_to_district, output_pin)
+    with stage("emit"):
+        store.save_pin_districts(pin_table.items())
+        write_pincode_district_map(store.load_pin_districts(), output_pin, args.pin_encoding)
 
     # Step 5: Verify district name matching
     print("\nVerifying district name matching...")
-    ac_districts = set()
+    ac_district_names = set()
     for e in entries:
         if 'district' in e:
-            ac_districts.add(normalize_district_name(e['district']))
+            ac_district_names.add(normalize_district_name(e['district'], e['state']))
 
     pin_districts = set()
-    for data in pin_to_district.values():
-        pin_districts.add(normalize_district_name(data['district']))
+    for district, state in pin_table.districts:
+        pin_districts.add(normalize_district_name(district, state))
 
-    matching = ac_districts & pin_districts
-    ac_only = ac_districts - pin_districts
-    pin_only = pin_districts - ac_districts
+    matching = ac_district_names & pin_districts
+    ac_only = ac_district_names - pin_districts
+    pin_only = pin_districts - ac_district_names
 
-    print(f"  AC districts: {len(ac_districts)}")
+    print(f"  AC districts: {len(ac_district_names)}")
     print(f"  PIN districts: {len(pin_districts)}")
     print(f"  Matching: {len(matching)}")
     print(f"  AC only (no PIN match): {len(ac_only)}")
@@ -553,6 +583,8 @@ def main():
     if pin_only:
         for d in sorted(list(pin_only))[:20]:
             print(f"    {d}")
+    print_alias_usage(load_aliases("district_names"))
+    finish_run(args)
 
 
 if __name__ == "__main__":
@@ -9,15 +9,32 @@ Output: src/data/pcToAcMapping.js
 Maps our existing Lok Sabha constituency IDs to lists of Assembly constituency IDs.
 """
 
+import argparse
 import re
-import urllib.request
-import html as html_module
 import os
-import time
-import json
+import sys
+
+from aliases import load_aliases, print_alias_usage
+from build_manifest import (
+    BuildManifest, SectionHasher, add_incremental_arguments, digest, file_digest, join_lines,
+    write_if_changed,
+)
+from canonical_store import add_store_arguments, open_store, read_pc_to_ac_js
+from data_assets import add_format_arguments, write_pc_to_ac_asset
+from data_diff import diff_pc_to_ac, read_old, report_diff
+from name_matcher import NameMatcher
+from run_profile import add_profile_arguments, finish_run, stage, start_run
+from string_table import js_table_import, shared_table, write_string_table
+from constituency_table import ac_to_pc, parse_page_records, warm_records
+from wiki_fetch import (
+    add_fetch_arguments, configure_from_args, fetch_wiki_page, map_states, print_cache_stats,
+)
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.join(SCRIPT_DIR, "..")
+LOK_SABHA_PATH = os.path.join(PROJECT_DIR, "src", "data", "constituencies.js")
+OUTPUT_PATH = os.path.join(PROJECT_DIR, "src", "data", "pcToAcMapping.js")
+OUTPUT_NAME = "pcToAcMapping.js"
 
 # State config: code, name, AC count, Wikipedia slug
 STATES = [
@@ -55,142 +72,63 @@ STATES = [
 ]
 
 
-def fetch_wiki_page(slug, retries=3):
-    url = f"https://en.wikipedia.org/wiki/{slug}"
-    for attempt in range(retries):
-        try:
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            with urllib.request.urlopen(req, timeout=20) as resp:
-                return resp.read().decode("utf-8", errors="replace")
-        except Exception as e:
-            if attempt < retries - 1:
-                print(f"    Retry {attempt + 1}: {e}")
-                time.sleep(2)
-            else:
-                print(f"    FAILED: {e}")
-                return None
-
-
-def parse_cell(cell_html):
-    attrs_match = re.match(r'<t[hd]([^>]*)>', cell_html)
-    attrs = attrs_match.group(1) if attrs_match else ''
-    rowspan = 1
-    rs_match = re.search(r'rowspan\s*=\s*["\']?(\d+)', attrs)
-    if rs_match:
-        rowspan = int(rs_match.group(1))
-    inner = re.sub(r'^<t[hd][^>]*>', '', cell_html)
-    inner = re.sub(r'</t[hd]>$', '', inner)
-    text = re.sub(r'<[^>]+>', '', inner).strip()
-    text = html_module.unescape(text)
-    text = re.sub(r'\[\d+\]', '', text).strip()
-    return text, rowspan
-
-
 def extract_ac_to_pc(page_html, expected_count):
     """Extract AC number → Lok Sabha constituency name mapping."""
-    if not page_html:
-        return {}
-
-    rows = re.findall(r'<tr[^>]*>(.*?)</tr>', page_html, re.DOTALL)
-    results = {}  # ac_no -> pc_name
-    carry = {}
-    ls_col = None  # Column index of Lok Sabha constituency
-
-    for row_html in rows:
-        cells_raw = re.findall(r'<t[hd][^>]*>.*?</t[hd]>', row_html, re.DOTALL)
-
-        full_row = []
-        col_idx = 0
-        cell_idx = 0
-        while col_idx < 12:
-            if col_idx in carry:
-                val, remaining = carry[col_idx]
-                full_row.append(val)
-                remaining -= 1
-                if remaining <= 0:
-                    del carry[col_idx]
-                else:
-                    carry[col_idx] = (val, remaining)
-                col_idx += 1
-            elif cell_idx < len(cells_raw):
-                text, rowspan = parse_cell(cells_raw[cell_idx])
-                full_row.append(text)
-                if rowspan > 1:
-                    carry[col_idx] = (text, rowspan - 1)
-                cell_idx += 1
-                col_idx += 1
-            else:
-                break
+    return ac_to_pc(parse_page_records(page_html, expected_count))
 
-        if len(full_row) < 3:
-            continue
 
-        # Detect header with Lok Sabha column
-        lower_row = [c.lower() for c in full_row]
-        if len(lower_row) >= 3:
-            has_header_markers = any(
-                c in ('#', 'no', 'no.', 's.no', 'sl.no', 'sl. no.', 'sl. no')
-                or 'name' in c or 'constituency' in c
-                for c in lower_row
-            )
-            if has_header_markers:
-                new_ls_col = None
-                for ci, cell_text in enumerate(lower_row):
-                    if 'lok sabha' in cell_text or 'parliamentary' in cell_text:
-                        new_ls_col = ci
-                        break
-                if new_ls_col is not None:
-                    # Don't reset if we already have significant results
-                    # (prevents second table headers from wiping good data)
-                    if len(results) > 10:
-                        # Skip this table, keep existing results
-                        ls_col = None
-                    else:
-                        ls_col = new_ls_col
-                        carry = {}
-                        results = {}
-                    continue
-
-        if ls_col is None:
-            continue
+def read_lok_sabha_data(store):
+    """Lok Sabha PCs from the canonical store as (name, id) pairs.
 
-        # Extract AC number and PC name
-        num_text = full_row[0].strip()
-        if not re.match(r'^\d{1,3}$', num_text):
-            continue
+    A list rather than a name -> id dict: names repeat across states
+    (Aurangabad, Hamirpur, Maharajganj) and a dict kept only the last.
+    """
+    return [(pc.name, pc.id) for pc in store.load_pcs()]
 
-        num = int(num_text)
-        if num < 1 or num > expected_count + 5:
-            continue
 
-        if ls_col < len(full_row):
-            pc_name = full_row[ls_col].strip()
-            # Clean up
-            pc_name = re.sub(r'\s*\([^)]*\)\s*', '', pc_name).strip()
-            pc_name = re.sub(r'\s*\[\d+\]\s*', '', pc_name).strip()
-            if pc_name and len(pc_name) > 1 and not pc_name.isdigit():
-                if pc_name.upper() not in ('SC', 'ST', 'NONE', 'GEN', 'GENERAL'):
-                    results[num] = pc_name
+def state_code_of(constituency_id):
+    """'AP-01' / 'AP-AC-001' -> 'AP'."""
+    return constituency_id.split('-', 1)[0]
 
-    return results
 
+def render_module(store, table):
+    """pcToAcMapping.js from the canonical store (string_table.DEPENDENTS)."""
+    return emit_pc_to_ac_js(store.load_pc_to_ac(), table, SectionHasher())
 
-def read_lok_sabha_data():
-    """Read existing constituencies.js Lok Sabha data."""
-    path = os.path.join(PROJECT_DIR, "src", "data", "constituencies.js")
-    with open(path, 'r') as f:
-        content = f.read()
 
-    pcs = {}  # name -> id (e.g., "Araku" -> "AP-01")
-    for match in re.finditer(
-        r'\{ id: "([^"]+)", name: "([^"]+)", state: "([^"]+)"',
-        content
-    ):
-        pc_id = match.group(1)
-        pc_name = match.group(2)
-        pcs[pc_name] = pc_id
+def emit_pc_to_ac_js(pc_to_ac, table, hasher):
+    """Stream pcToAcMapping.js as lines, PCs in ID order.
 
-    return pcs
+    PC IDs are written as indexes into the shared string table and AC IDs as
+    numbers (string_table.AC_KEY_BASE); the module decodes to the same
+    { PC ID: [AC IDs] } object as before. Each state code's lines are fed to
+    hasher for the build manifest.
+    """
+    total_acs = sum(len(v) for v in pc_to_ac.values())
+    yield "// Parliamentary Constituency → Assembly Constituency mapping"
+    yield "// Each Lok Sabha PC ID maps to its constituent Vidhan Sabha AC IDs"
+    yield f"// {len(pc_to_ac)} PCs mapped, {total_acs} ACs total"
+    yield "// Dictionary-encoded against stringTable.js; decoded once below"
+    yield ""
+    yield from js_table_import(table, ["acId"], stable=True)
+    yield ""
+    yield "// Per PC: PC ID (string index), AC count, then its ACs as numbers"
+    yield "const _m = ["
+    for pc_id in sorted(pc_to_ac):
+        ac_ids = pc_to_ac[pc_id]
+        line = (f"  {table.index(pc_id)},{len(ac_ids)},"
+                + "".join(f"{table.ac_key(a)}," for a in ac_ids))
+        hasher.add(state_code_of(pc_id), line)
+        yield line
+    yield "];"
+    yield ""
+    yield "const pcToAcMapping = {};"
+    yield "for (let i = 0; i < _m.length; i += 2 + _m[i + 1]) {"
+    yield "  pcToAcMapping[_s[_m[i]]] = _m.slice(i + 2, i + 2 + _m[i + 1]).map(acId);"
+    yield "}"
+    yield ""
+    yield "export default pcToAcMapping;"
+    yield ""
 
 
 def normalize_pc_name(name):
@@ -206,105 +144,119 @@ def normalize_pc_name(name):
     return name
 
 
-# Manual overrides for PC name mismatches between Wikipedia and our data
-PC_NAME_ALIASES = {
-    # Wikipedia name -> our constituency.js name
-    'tiruvallur': 'thiruvallur',
-    'kanniyakumari': 'kanyakumari',
-    'kanchipuram': 'kancheepuram',
-    'dharamapuri': 'dharmapuri',
-    'viluppuram': 'villupuram',
-    'davangere': 'davanagere',
-    'udupi chikmagalur': 'udupi-chikmagalur',
-    'vadakara': 'vatakara',
-    'mandsour': 'mandsaur',
-    'narmadapuram': 'hoshangabad',
-    'bhubaneshwar': 'bhubaneswar',
-    'palamu': 'palamau',
-    'mahabubnagar': 'mahbubnagar',
-    'peddapalli': 'peddapalle',
-    'ayodhya': 'faizabad',
-    'bagpat': 'baghpat',
-    'hatkanangle': 'hatkanangale',
-    'karauli-dholpur': 'karauli-dholpur',
-    'anantnag - rajouri': 'anantnag-rajouri',
-    'anantnag-rajouri': 'anantnag-rajouri',
-    'bhiwani-mahendragarh': 'bhiwani-mahendragarh',
-    # Assam: 2024 delimitation new names → old names in our data
-    'guwahati': 'gauhati',
-    'nagaon': 'nowgong',
-    'kaziranga': 'kaliabor',
-    'sonitpur': 'tezpur',
-    'darrang-udalguri': 'mangaldoi',
-    'diphu': 'autonomous district',
-    # Uttar Pradesh
-    'aonla': 'bareilly',
-    # West Bengal
-    'beharampore': 'baharampur',
-    'berhampore': 'baharampur',
-    'bardhaman-durgapur': 'bardhaman-durgapur',
-    'jaynagar': 'joynagar',
-}
+# Fuzzy matches scoring below this are left unmatched
+MIN_PC_MATCH_SCORE = 0.7
+
+# A run mapping fewer PCs than this fraction of the previous mapping is
+# refused (nothing is written) unless --allow-shrink is given
+MIN_KEPT_FRACTION = 0.9
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate Parliamentary Constituency → Assembly Constituency mapping.")
+    add_fetch_arguments(parser)
+    add_incremental_arguments(parser)
+    add_store_arguments(parser)
+    add_format_arguments(parser)
+    parser.add_argument("--allow-shrink", action="store_true",
+                        help=f"write the mapping even if it has fewer than {MIN_KEPT_FRACTION:.0%} "
+                             f"of the previous mapping's PCs")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_run("generate_pc_ac_mapping", args)
+    configure_from_args(args)
+    store = open_store(args.db, STATES)
+
+    manifest = BuildManifest(args.manifest)
+    # Manual overrides for PC name mismatches between Wikipedia and our data
+    pc_aliases = load_aliases("pc_names")
+    inputs = {"constituencies.js": file_digest(LOK_SABHA_PATH), "pc_names.json": pc_aliases.digest}
+    existing = store.load_pc_to_ac()
+    # A changed constituencies.js can change every match, so re-process all states
+    force = args.force or not existing or manifest.inputs_changed(OUTPUT_NAME, inputs)
+    previous_sources = manifest.output(OUTPUT_NAME)["sources"]
+
     # Read existing Lok Sabha data for ID matching
     print("Reading Lok Sabha constituency data...")
-    lok_sabha = read_lok_sabha_data()
+    lok_sabha = read_lok_sabha_data(store)
     print(f"  Found {len(lok_sabha)} PCs")
 
-    # Build reverse lookup: normalized name -> ID
-    pc_name_to_id = {}
-    for name, pc_id in lok_sabha.items():
-        pc_name_to_id[name.lower()] = pc_id
-        # Also add without common variations
-        pc_name_to_id[normalize_pc_name(name).lower()] = pc_id
+    # Index PC names per state for exact and fuzzy lookup
+    pc_matcher = NameMatcher()
+    for name, pc_id in lok_sabha:
+        pc_matcher.add(state_code_of(pc_id), normalize_pc_name(name), pc_id)
 
     # Scrape Wikipedia for AC → PC mapping
     print("\nScraping Wikipedia for AC→PC mappings...")
 
     # ac_no → pc_name per state
     all_ac_to_pc = {}  # (state_code, ac_no) -> pc_name
-
-    for code, state, count, slug in STATES:
+    reused_states = set()  # states whose existing output is kept as-is
+    missing_states = []  # states with neither a page nor an existing mapping
+    existing_states = {state_code_of(pc_id) for pc_id in existing}
+    source_digests = {}
+
+    def fetch_state(state_cfg):
+        """Returns (page digest, page), or a None page to reuse the existing mapping."""
+        code, state, count, slug = state_cfg
+        with stage("fetch", code):
+            page = fetch_wiki_page(slug)
+        if not page:
+            return None, None
+        page_sha = digest(page)
+        if not force and previous_sources.get(code) == page_sha:
+            return page_sha, None
+        return page_sha, page
+
+    state_pages = map_states(fetch_state, STATES, workers=args.workers)
+    # With --jobs N, pages are parsed up front in N processes
+    warm_records([(cfg[0], page, cfg[2]) for cfg, (_, page) in zip(STATES, state_pages)], args.jobs)
+
+    for (code, state, count, slug), (page_sha, page) in zip(STATES, state_pages):
         print(f"\n  {state} ({count} ACs)...")
-        page = fetch_wiki_page(slug)
-        ac_to_pc = extract_ac_to_pc(page, count)
-        print(f"    Found PC mapping for {len(ac_to_pc)}/{count} ACs")
+        if page is None:
+            if page_sha:
+                source_digests[code] = page_sha
+                print("    Source unchanged, keeping existing mapping")
+            elif code in existing_states:
+                print("    Failed to fetch page, keeping existing mapping")
+            else:
+                print("    Failed to fetch page and no existing mapping to keep")
+                missing_states.append(code)
+                continue
+            reused_states.add(code)
+            continue
+
+        source_digests[code] = page_sha
+        with stage("parse", code):
+            state_ac_to_pc = ac_to_pc(parse_page_records(page, count))
+        print(f"    Found PC mapping for {len(state_ac_to_pc)}/{count} ACs")
 
-        for ac_no, pc_name in ac_to_pc.items():
+        for ac_no, pc_name in state_ac_to_pc.items():
             all_ac_to_pc[(code, ac_no)] = pc_name
 
-        time.sleep(1)
+    print_cache_stats()
 
     # Build the mapping: PC ID -> [AC IDs]
     pc_to_ac = {}  # pc_id -> [ac_id, ...]
     unmatched_pcs = set()
     total_matched = 0
     total_unmatched = 0
+    pc_matches = {}  # (state_code, pc_name) -> Match or None
 
     for (state_code, ac_no), pc_name in all_ac_to_pc.items():
         ac_id = f"{state_code}-AC-{ac_no:03d}"
 
-        # Match PC name to our Lok Sabha ID
-        pc_name_norm = normalize_pc_name(pc_name).lower()
-
-        # Check alias first
-        if pc_name_norm in PC_NAME_ALIASES:
-            pc_name_norm = PC_NAME_ALIASES[pc_name_norm]
-
-        pc_id = pc_name_to_id.get(pc_name_norm)
-
-        if not pc_id:
-            # Try partial match within the same state
-            for name, pid in pc_name_to_id.items():
-                if pid.startswith(state_code + '-') and (
-                    name == pc_name_norm or
-                    pc_name_norm in name or
-                    name in pc_name_norm
-                ):
-                    pc_id = pid
-                    break
+        # Match PC name to our Lok Sabha ID, once per distinct name
+        key = (state_code, pc_name)
+        if key not in pc_matches:
+            with stage("match", state_code):
+                pc_name_norm = normalize_pc_name(pc_name).lower()
+                # Check alias first
+                pc_name_norm = pc_aliases.resolve(state_code, pc_name_norm)
+                pc_matches[key] = pc_matcher.match(state_code, pc_name_norm, MIN_PC_MATCH_SCORE)
+        match = pc_matches[key]
+        pc_id = match.value if match and not match.ambiguous else None
 
         if pc_id:
             if pc_id not in pc_to_ac:
@@ -315,7 +267,7 @@ def main():
             unmatched_pcs.add((state_code, pc_name))
             total_unmatched += 1
 
-    print(f"\n\nResults:")
+    print("\n\nResults:")
     print(f"  PCs with AC mappings: {len(pc_to_ac)}")
     print(f"  ACs matched to PCs: {total_matched}")
     print(f"  ACs unmatched: {total_unmatched}")
@@ -323,43 +275,76 @@ def main():
     if unmatched_pcs:
         print(f"\n  Unmatched PC names ({len(unmatched_pcs)}):")
         for code, name in sorted(unmatched_pcs):
-            print(f"    {code}: {name}")
+            match = pc_matches[(code, name)]
+            if match and match.ambiguous:
+                print(f"    {code}: {name} (ambiguous: {match.name} / {match.runner_up}, "
+                      f"score {match.score:.2f})")
+            else:
+                print(f"    {code}: {name}")
+
+    fuzzy = sorted((key, m) for key, m in pc_matches.items()
+                   if m and m.score < 1.0 and not m.ambiguous)
+    if fuzzy:
+        print(f"\n  Fuzzy PC name matches ({len(fuzzy)}):")
+        for (code, name), m in fuzzy:
+            print(f"    {code}: {name} -> {m.name} ({m.score:.2f})")
+    print()
+    print_alias_usage(pc_aliases)
 
     # Sort AC IDs within each PC
     for pc_id in pc_to_ac:
         pc_to_ac[pc_id].sort()
 
-    # Write output
-    output_path = os.path.join(PROJECT_DIR, "src", "data", "pcToAcMapping.js")
-
-    lines = [
-        "// Parliamentary Constituency → Assembly Constituency mapping",
-        "// Each Lok Sabha PC ID maps to its constituent Vidhan Sabha AC IDs",
-        f"// {len(pc_to_ac)} PCs mapped, {total_matched} ACs total",
-        "",
-        "const pcToAcMapping = {",
-    ]
-
-    for pc_id in sorted(pc_to_ac.keys()):
-        ac_ids = pc_to_ac[pc_id]
-        ac_str = ', '.join(f"'{a}'" for a in ac_ids)
-        lines.append(f"  '{pc_id}': [{ac_str}],")
-
-    lines.append("};")
-    lines.append("")
-    lines.append("export default pcToAcMapping;")
-    lines.append("")
-
-    with open(output_path, 'w') as f:
-        f.write("\n".join(lines))
+    # Splice the existing sections of unchanged states back in
+    for pc_id, ac_ids in existing.items():
+        if state_code_of(pc_id) in reused_states:
+            pc_to_ac[pc_id] = ac_ids
+
+    # Never replace a good mapping with an empty or gutted one
+    previous = existing or read_old(OUTPUT_PATH, read_pc_to_ac_js) or {}
+    if missing_states:
+        print(f"  No mapping for {len(missing_states)} states: {', '.join(missing_states)}")
+    if not pc_to_ac or (not args.allow_shrink and len(pc_to_ac) < MIN_KEPT_FRACTION * len(previous)):
+        sys.exit(f"Refusing to write a mapping of {len(pc_to_ac)} PCs over the previous "
+                 f"{len(previous)}; nothing was written"
+                 + (" (see --allow-shrink)" if pc_to_ac else ""))
+
+    # Persist, then emit from the canonical store
+    with stage("emit"):
+        store.save_pc_to_ac(pc_to_ac)
+        pc_to_ac = store.load_pc_to_ac()
+        table = shared_table(store)
+        hasher = SectionHasher()
+        if args.format != "js":
+            for _ in emit_pc_to_ac_js(pc_to_ac, table, hasher):
+                pass
+            file_sha = file_digest(write_pc_to_ac_asset(pc_to_ac, args.format))
+            changed = manifest.changed_sections(OUTPUT_NAME, hasher.digests())
+        else:
+            old_mapping = read_old(OUTPUT_PATH, read_pc_to_ac_js)
+            # PC and AC references only use the table's stable prefix
+            write_string_table(table, store, stable_only=True, own=os.path.basename(OUTPUT_PATH))
+            written = write_if_changed(OUTPUT_PATH, join_lines(emit_pc_to_ac_js(pc_to_ac, table, hasher)))
+            file_sha = file_digest(OUTPUT_PATH)
+            changed = manifest.changed_sections(OUTPUT_NAME, hasher.digests())
+            if written:
+                size_kb = os.path.getsize(OUTPUT_PATH) / 1024
+                print(f"\nWrote {OUTPUT_PATH} ({size_kb:.0f} KB), "
+                      f"changed sections: {', '.join(sorted(changed)) or 'header only'}")
+                if old_mapping is not None:
+                    report_diff(OUTPUT_NAME, diff_pc_to_ac(old_mapping, pc_to_ac))
+            else:
+                print(f"\n{OUTPUT_PATH} unchanged, not rewritten")
 
-    size_kb = os.path.getsize(output_path) / 1024
-    print(f"\nWrote {output_path} ({size_kb:.0f} KB)")
+    manifest.update(OUTPUT_NAME, inputs=inputs, source_digests=source_digests,
+                    section_digests=hasher.digests(), file_sha=file_sha)
+    manifest.save()
 
     # Verify: check average ACs per PC
     ac_counts = [len(v) for v in pc_to_ac.values()]
     if ac_counts:
         print(f"  ACs per PC: min={min(ac_counts)}, max={max(ac_counts)}, avg={sum(ac_counts)/len(ac_counts):.1f}")
+    finish_run(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Generate the 6-digit PIN → candidate constituency index.
+
+Joins the canonical store's PIN → district table with AC districts (through
+normalize_district_name) and the PC → AC mapping:
+
+  PIN → (state, district) → ACs in that district → their PCs
+
+and, where that leaves several PCs, keeps those whose pinRanges also list the
+PIN's 3-digit prefix. Each PIN gets a confidence tag:
+
+  exact            the district resolves to a single PC
+  district+prefix  the district spans 2+ PCs, and only one of them lists the
+                   PIN's prefix; that PC (and its ACs in the district) is kept
+  district         the district spans 2+ PCs and the prefix leaves 2+ of them;
+                   those (all of them when the prefix rules none out) and
+                   their ACs are listed
+  prefix           the district matched no AC; candidates are the prefix's PCs
+
+Run after generate_district_mapping.py, which fills the store's PIN and AC
+district tables.
+
+Output: src/data/pinConstituencies.js with lookupPinConstituencies(pin).
+PC and AC IDs are encoded against the shared string table (string_table.py).
+"""
+
+import argparse
+import os
+from collections import Counter
+
+from aliases import load_aliases, print_alias_usage
+from build_manifest import join_lines, write_if_changed
+from canonical_store import add_store_arguments, open_store
+from generate_district_mapping import normalize_district_name, render_range_search_js
+from pincode_loader import encode_pin_ranges
+from string_table import js_table_import, shared_table, write_string_table
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.join(SCRIPT_DIR, "..")
+OUTPUT_PATH = os.path.join(PROJECT_DIR, "src", "data", "pinConstituencies.js")
+
+CONFIDENCE_LEVELS = ("exact", "district+prefix", "district", "prefix")
+
+
+def build_district_index(acs, pc_to_ac):
+    """(state, normalized district) -> ([AC IDs], [PC IDs]), both sorted."""
+    ac_to_pc = {ac_id: pc_id for pc_id, ac_ids in pc_to_ac.items() for ac_id in ac_ids}
+    index = {}
+    for ac in acs:
+        if not ac.district:
+            continue
+        ac_ids, pc_ids = index.setdefault((ac.state, normalize_district_name(ac.district, ac.state)),
+                                          ([], []))
+        ac_ids.append(ac.id)
+        pc_id = ac_to_pc.get(ac.id)
+        if pc_id and pc_id not in pc_ids:
+            pc_ids.append(pc_id)
+    for ac_ids, pc_ids in index.values():
+        ac_ids.sort()
+        pc_ids.sort()
+    return index
+
+
+def resolve_pin_candidates(pin_rows, district_index, prefix_pcs, pc_to_ac):
+    """Yield (pin, confidence, pc_ids, ac_ids) for each (pin, district, state) row.
+
+    prefix_pcs: 3-digit prefix -> [PC IDs] from constituencies.js pinRanges.
+    Rows that resolve to nothing are skipped.
+    """
+    for pin, district, state in pin_rows:
+        match = district_index.get((state, normalize_district_name(district, state)))
+        in_prefix = prefix_pcs.get(f"{pin:06d}"[:3], [])
+        if match:
+            ac_ids, pc_ids = match
+            narrowed = [pc_id for pc_id in pc_ids if pc_id in in_prefix]
+            if len(pc_ids) == 1:
+                confidence = "exact"
+            elif len(narrowed) == 1:
+                confidence = "district+prefix"
+            else:
+                confidence = "district"
+            if narrowed and len(narrowed) < len(pc_ids):
+                allowed = {ac_id for pc_id in narrowed for ac_id in pc_to_ac.get(pc_id, [])}
+                pc_ids = narrowed
+                ac_ids = [ac_id for ac_id in ac_ids if ac_id in allowed]
+            yield pin, confidence, tuple(pc_ids), tuple(ac_ids)
+        elif in_prefix:
+            yield pin, "prefix", tuple(in_prefix), ()
+
+
+def store_pin_candidates(store, pin_rows):
+    """resolve_pin_candidates() over the canonical store's ACs, PCs and mapping, as a list."""
+    pc_to_ac = store.load_pc_to_ac()
+    district_index = build_district_index(store.load_acs(), pc_to_ac)
+    prefix_pcs = {}
+    for pc in store.load_pcs():
+        for prefix in pc.pin_ranges:
+            prefix_pcs.setdefault(prefix, []).append(pc.id)
+    return list(resolve_pin_candidates(pin_rows, district_index, prefix_pcs, pc_to_ac))
+
+
+def render_pin_constituencies_js(candidate_rows, table):
+    """Range-encode (pin, confidence, pc_ids, ac_ids) rows as a JS module.
+
+    PC IDs are written as shared string table indexes and AC IDs as numbers
+    (see string_table.py). Returns (lines, confidence counts); lines is a
+    generator.
+    """
+    candidate_rows = list(candidate_rows)
+    groups, starts, lengths, indexes = encode_pin_ranges(candidate_rows)
+    confidence_counts = Counter(row[1] for row in candidate_rows)
+
+    def lines():
+        yield "// 6-digit PIN → candidate constituencies (PIN → district → ACs/PCs join)"
+        yield "// Generated by scripts/generate_pin_constituencies.py"
+        yield (f"// {len(candidate_rows)} PIN codes in {len(starts)} ranges, {len(groups)} candidate sets; "
+               + ", ".join(f"{level} {confidence_counts[level]}" for level in CONFIDENCE_LEVELS))
+        yield ""
+        yield from js_table_import(table, ["acId"], stable=True)
+        yield ""
+        yield f"const _c = [{','.join(repr(level) for level in CONFIDENCE_LEVELS)}];"
+        yield ""
+        yield "// Candidate sets: [confidence index, [PC string indexes], [AC keys]]"
+        yield "const _g = ["
+        for confidence, pc_ids, ac_ids in groups:
+            pcs_js = ",".join(str(table.index(pc_id)) for pc_id in pc_ids)
+            acs_js = ",".join(str(table.ac_key(ac_id)) for ac_id in ac_ids)
+            yield f"  [{CONFIDENCE_LEVELS.index(confidence)},[{pcs_js}],[{acs_js}]],"
+        yield "];"
+        yield ""
+        yield from render_range_search_js(starts, lengths, indexes)
+        yield ""
+        yield "// Returns { confidence, pcIds, acIds } or null"
+        yield "export function lookupPinConstituencies(pin) {"
+        yield "  const idx = _find(pin);"
+        yield "  if (idx < 0) return null;"
+        yield "  const [c, pcs, acs] = _g[idx];"
+        yield "  return { confidence: _c[c], pcIds: pcs.map((i) => _s[i]), acIds: acs.map(acId) };"
+        yield "}"
+        yield ""
+        yield "export default { lookupPinConstituencies };"
+        yield ""
+
+    return lines(), confidence_counts
+
+
+def render_module(store, table):
+    """pinConstituencies.js from the canonical store (string_table.DEPENDENTS)."""
+    pin_rows = store.load_pin_districts()
+    if not pin_rows:
+        return None
+    return render_pin_constituencies_js(store_pin_candidates(store, pin_rows), table)[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the 6-digit PIN → candidate constituency index.")
+    add_store_arguments(parser)
+    args = parser.parse_args()
+    store = open_store(args.db)
+
+    pin_rows = store.load_pin_districts()
+    if not pin_rows:
+        print("No PIN districts in the canonical store; run generate_district_mapping.py first")
+        return
+
+    print(f"Joining {len(pin_rows)} PIN codes with the store's AC districts...")
+    candidate_rows = store_pin_candidates(store, pin_rows)
+    table = shared_table(store)
+    lines, confidence_counts = render_pin_constituencies_js(candidate_rows, table)
+
+    pc_counts = Counter(len(row[2]) for row in candidate_rows)
+    print(f"  Resolved {len(candidate_rows)}/{len(pin_rows)} PIN codes: "
+          + ", ".join(f"{level} {confidence_counts[level]}" for level in CONFIDENCE_LEVELS))
+    print("  Candidate PCs per PIN: "
+          + ", ".join(f"{n}: {pc_counts[n]}" for n in sorted(pc_counts)))
+
+    # PC and AC references only use the table's stable prefix
+    write_string_table(table, store, stable_only=True, own=os.path.basename(OUTPUT_PATH))
+    if write_if_changed(OUTPUT_PATH, join_lines(lines)):
+        print(f"Wrote {OUTPUT_PATH} ({os.path.getsize(OUTPUT_PATH) / 1024:.0f} KB)")
+    else:
+        print(f"{OUTPUT_PATH} unchanged, not rewritten")
+    print_alias_usage(load_aliases("district_names"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Generate the PIN prefix → Lok Sabha PC → Assembly AC lookup index.
+
+PincodeLookup used to answer every keystroke by filtering all 543 PCs on
+their pinRanges, walking pcToAcMapping and sorting the ACs. This precomputes
+the answer for every 3-digit prefix listed in constituencies.js:
+
+  '110': [[PC IDs in constituencies.js order],
+          [[PC ID, [AC IDs]], ...]]        ACs sorted by state, then name;
+                                           groups in order of their first AC
+
+Inputs come from the canonical store (PCs, ACs, PC → AC edges). Every prefix
+must resolve to at least one PC and, where the PCs are mapped, to their ACs;
+unresolved prefixes are reported (and fail the run with --strict).
+
+Output: src/data/pinPrefixIndex.js, or a content-hashed asset with --format json
+"""
+
+import argparse
+import os
+import sys
+import unicodedata
+
+from build_manifest import join_lines, write_if_changed
+from canonical_store import add_store_arguments, open_store
+from data_assets import write_dataset
+from generate_assembly_data import STATES
+from string_table import js_table_import, shared_table, write_string_table
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.join(SCRIPT_DIR, "..")
+OUTPUT_PATH = os.path.join(PROJECT_DIR, "src", "data", "pinPrefixIndex.js")
+
+
+def collation_key(text):
+    """Approximate String.localeCompare order: accents and case are secondary."""
+    base = unicodedata.normalize("NFKD", text)
+    base = "".join(ch for ch in base if not unicodedata.combining(ch))
+    return base.casefold(), text
+
+
+def build_prefix_index(pcs, acs, pc_to_ac):
+    """{prefix: (pc_ids, [(pc_id, ac_ids), ...])} for every pinRanges prefix.
+
+    pcs in constituencies.js order; acs as canonical_store.Ac tuples.
+    """
+    ac_by_id = {ac.id: ac for ac in acs}
+    pcs_by_prefix = {}
+    for pc in pcs:
+        for prefix in pc.pin_ranges:
+            pc_ids = pcs_by_prefix.setdefault(prefix, [])
+            if pc.id not in pc_ids:
+                pc_ids.append(pc.id)
+
+    index = {}
+    for prefix in sorted(pcs_by_prefix):
+        pc_ids = pcs_by_prefix[prefix]
+        ac_pc = {}
+        for pc_id in pc_ids:
+            for ac_id in pc_to_ac.get(pc_id, []):
+                if ac_id in ac_by_id:
+                    ac_pc[ac_id] = pc_id
+        ordered = sorted(ac_pc, key=lambda ac_id: (collation_key(ac_by_id[ac_id].state),
+                                                   collation_key(ac_by_id[ac_id].name)))
+        groups = {}
+        for ac_id in ordered:
+            groups.setdefault(ac_pc[ac_id], []).append(ac_id)
+        index[prefix] = (pc_ids, list(groups.items()))
+    return index
+
+
+def verify_prefix_index(index, pcs):
+    """Return [(prefix, problem), ...] for prefixes that do not fully resolve."""
+    problems = []
+    for pc in pcs:
+        for prefix in pc.pin_ranges:
+            if len(prefix) != 3 or not prefix.isdigit():
+                problems.append((prefix, f"{pc.id} has a malformed pinRanges entry"))
+            elif prefix not in index or pc.id not in index[prefix][0]:
+                problems.append((prefix, f"{pc.id} missing from index"))
+    for prefix, (pc_ids, groups) in sorted(index.items()):
+        if not groups:
+            problems.append((prefix, f"no ACs mapped for {', '.join(pc_ids)}"))
+    return problems
+
+
+def render_prefix_index_js(index, table):
+    """Stream the index as pinPrefixIndex.js lines.
+
+    PC IDs are written as shared string table indexes and AC IDs as numbers
+    (see string_table.py); the module decodes them back at load.
+    """
+    total_groups = sum(len(groups) for _, groups in index.values())
+    yield "// PIN prefix → Lok Sabha PC → Assembly AC lookup index"
+    yield "// prefix: [PC IDs in constituencies.js order, [[PC ID, [AC IDs]], ...]]"
+    yield "// ACs are pre-sorted by state, then name; PC groups follow their first AC"
+    yield f"// {len(index)} prefixes, {total_groups} PC groups"
+    yield "// Dictionary-encoded against stringTable.js; decoded once below"
+    yield ""
+    yield from js_table_import(table, ["acId"], stable=True)
+    yield ""
+    yield "const _p = {"
+    for prefix, (pc_ids, groups) in index.items():
+        pcs_js = ",".join(str(table.index(pc_id)) for pc_id in pc_ids)
+        groups_js = ",".join(
+            f"[{table.index(pc_id)},[{','.join(str(table.ac_key(ac_id)) for ac_id in ac_ids)}]]"
+            for pc_id, ac_ids in groups
+        )
+        yield f"  '{prefix}': [[{pcs_js}],[{groups_js}]],"
+    yield "};"
+    yield ""
+    yield "const pinPrefixIndex = {};"
+    yield "for (const prefix in _p) {"
+    yield "  const [pcs, groups] = _p[prefix];"
+    yield "  pinPrefixIndex[prefix] = ["
+    yield "    pcs.map((i) => _s[i]),"
+    yield "    groups.map(([pc, acs]) => [_s[pc], acs.map(acId)]),"
+    yield "  ];"
+    yield "}"
+    yield ""
+    yield "export default pinPrefixIndex;"
+    yield ""
+
+
+def render_module(store, table):
+    """pinPrefixIndex.js from the canonical store (string_table.DEPENDENTS)."""
+    return render_prefix_index_js(build_prefix_index(store.load_pcs(), store.load_acs(), store.load_pc_to_ac()),
+                                  table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the PIN prefix → PC → AC lookup index.")
+    add_store_arguments(parser)
+    parser.add_argument("--format", choices=["js", "json"], default="js",
+                        help="JS module in src/data (default) or a content-hashed JSON asset")
+    parser.add_argument("--strict", action="store_true",
+                        help="exit with an error if any prefix does not resolve")
+    args = parser.parse_args()
+    store = open_store(args.db, STATES)
+
+    pcs = store.load_pcs()
+    index = build_prefix_index(pcs, store.load_acs(), store.load_pc_to_ac())
+    print(f"Indexed {len(index)} PIN prefixes from {len(pcs)} PCs")
+
+    if args.format == "json":
+        write_dataset("pinPrefixIndex", "json",
+                      obj={prefix: [pc_ids, groups] for prefix, (pc_ids, groups) in index.items()})
+    else:
+        table = shared_table(store)
+        # PC and AC references only use the table's stable prefix
+        write_string_table(table, store, stable_only=True, own=os.path.basename(OUTPUT_PATH))
+        if write_if_changed(OUTPUT_PATH, join_lines(render_prefix_index_js(index, table))):
+            print(f"Wrote {OUTPUT_PATH} ({os.path.getsize(OUTPUT_PATH) / 1024:.0f} KB)")
+        else:
+            print(f"{OUTPUT_PATH} unchanged, not rewritten")
+
+    problems = verify_prefix_index(index, pcs)
+    if problems:
+        print(f"\n{len(problems)} PIN prefixes do not fully resolve:")
+        for prefix, problem in problems:
+            print(f"  {prefix}: {problem}")
+        if args.strict:
+            sys.exit(1)
+    else:
+        print("All pinRanges prefixes resolve to PCs and ACs")
+
+
+if __name__ == "__main__":
+    main()
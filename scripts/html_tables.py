@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Single-pass streaming extractor for HTML tables.
+
+Replaces the regex scraping (`<tr>` findall, then `<td>` findall per row, then
+tag-stripping per cell) that the generator scripts used on Wikipedia pages.
+The page is fed through the stdlib HTMLParser once; rows are emitted as soon
+as their </tr> is seen, with rowspan/colspan already expanded into a flat
+list of cells. Nested tables are tracked on a stack, so an inner table's rows
+are emitted separately and never corrupt the outer table's columns.
+
+    for row in iter_table_rows(page_html):
+        row.table     # index of the table in document order
+        row.cells     # [Cell(text, link, header), ...] after span expansion
+        row.texts     # [cell.text, ...]
+"""
+
+import html
+import re
+from collections import deque, namedtuple
+from html.parser import HTMLParser
+
+# text:   cell text, whitespace-collapsed, footnote markers removed
+# link:   text of the first <a> in the cell (None if the cell has no link)
+# header: True for <th>, False for <td>
+Cell = namedtuple('Cell', ['text', 'link', 'header'])
+
+
+class Row(namedtuple('Row', ['table', 'cells'])):
+    __slots__ = ()
+
+    @property
+    def texts(self):
+        return [c.text for c in self.cells]
+
+    @property
+    def is_header(self):
+        return bool(self.cells) and all(c.header for c in self.cells)
+
+
+FOOTNOTE_RE = re.compile(r'\[\d+\]')
+MAX_SPAN = 1000  # Guard against malformed rowspan="99999"
+SKIP_TAGS = ('style', 'script')
+
+
+def _span(attrs, name):
+    for key, value in attrs:
+        if key == name and value:
+            digits = re.match(r'\s*(\d+)', value)
+            if digits:
+                return max(1, min(int(digits.group(1)), MAX_SPAN))
+    return 1
+
+
+def _clean(parts):
+    text = ''.join(parts)
+    if '&' in text:
+        text = html.unescape(text)
+    text = ' '.join(text.split())
+    if '[' in text:
+        text = ' '.join(FOOTNOTE_RE.sub('', text).split())
+    return text
+
+
+class _TableState:
+    """Parse state for one (possibly nested) <table>."""
+
+    __slots__ = ('index', 'carry', 'row', 'cell')
+
+    def __init__(self, index):
+        self.index = index
+        self.carry = {}   # column -> [Cell, remaining_rows]
+        self.row = None   # list of (Cell, rowspan, colspan) for the open <tr>
+        self.cell = None  # dict for the open <td>/<th>
+
+
+class TableExtractor(HTMLParser):
+    """HTMLParser that turns <table> markup into expanded Row tuples.
+
+    Completed rows accumulate in `self.rows` (a deque) so callers can drain
+    them between feed() calls.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.rows = deque()
+        self._tables = []
+        self._table_count = 0
+        self._skip_depth = 0  # inside <style>/<script>/<sup class="reference">
+
+    # -- cell / row lifecycle -----------------------------------------------
+
+    def _close_cell(self, table):
+        cell = table.cell
+        if cell is None:
+            return
+        table.cell = None
+        if table.row is None:
+            table.row = []
+        link = _clean(cell['link']) if cell['link'] is not None else None
+        table.row.append((Cell(_clean(cell['text']), link, cell['header']),
+                          cell['rowspan'], cell['colspan']))
+
+    def _close_row(self, table):
+        self._close_cell(table)
+        raw = table.row
+        if raw is None:
+            return
+        table.row = None
+
+        carry = table.carry
+        cells = []
+        col = 0
+        i = 0
+        while i < len(raw) or col in carry:
+            if col in carry:
+                held = carry[col]
+                cells.append(held[0])
+                held[1] -= 1
+                if held[1] <= 0:
+                    del carry[col]
+                col += 1
+                continue
+            cell, rowspan, colspan = raw[i]
+            i += 1
+            for _ in range(colspan):
+                cells.append(cell)
+                if rowspan > 1:
+                    carry[col] = [cell, rowspan - 1]
+                col += 1
+
+        if cells:
+            self.rows.append(Row(table.index, cells))
+
+    # -- HTMLParser hooks ---------------------------------------------------
+
+    def handle_starttag(self, tag, attrs):
+        if self._skip_depth:
+            if tag in SKIP_TAGS or tag == 'sup':
+                self._skip_depth += 1
+            return
+        if tag in SKIP_TAGS:
+            self._skip_depth = 1
+            return
+
+        if tag == 'table':
+            self._tables.append(_TableState(self._table_count))
+            self._table_count += 1
+            return
+        if not self._tables:
+            return
+        table = self._tables[-1]
+
+        if tag == 'tr':
+            self._close_row(table)
+            table.row = []
+        elif tag in ('td', 'th'):
+            self._close_cell(table)
+            table.cell = {
+                'text': [], 'link': None, 'in_link': False,
+                'header': tag == 'th',
+                'rowspan': _span(attrs, 'rowspan'),
+                'colspan': _span(attrs, 'colspan'),
+            }
+        elif table.cell is not None:
+            if tag == 'a' and table.cell['link'] is None:
+                table.cell['link'] = []
+                table.cell['in_link'] = True
+            elif tag == 'sup' and 'reference' in (dict(attrs).get('class') or ''):
+                self._skip_depth = 1
+            elif tag == 'br':
+                table.cell['text'].append(' ')
+
+    def handle_endtag(self, tag):
+        if self._skip_depth:
+            if tag in SKIP_TAGS or tag == 'sup':
+                self._skip_depth -= 1
+            return
+        if not self._tables:
+            return
+        table = self._tables[-1]
+
+        if tag == 'table':
+            self._close_row(table)
+            self._tables.pop()
+        elif tag == 'tr':
+            self._close_row(table)
+        elif tag in ('td', 'th'):
+            self._close_cell(table)
+        elif tag == 'a' and table.cell is not None:
+            table.cell['in_link'] = False
+
+    def handle_data(self, data):
+        if self._skip_depth or not self._tables:
+            return
+        cell = self._tables[-1].cell
+        if cell is None:
+            return
+        cell['text'].append(data)
+        if cell['in_link']:
+            cell['link'].append(data)
+
+    # Entities are left in place (convert_charrefs=False, which lets the
+    # tokenizer skip its per-chunk entity scan) and decoded once per cell.
+    def handle_entityref(self, name):
+        self.handle_data(f'&{name};')
+
+    def handle_charref(self, name):
+        self.handle_data(f'&#{name};')
+
+    def close(self):
+        super().close()
+        while self._tables:
+            self._close_row(self._tables.pop())
+
+
+TABLE_TAG_RE = re.compile(r'<(/?)table\b', re.IGNORECASE)
+
+
+def iter_table_regions(page_html):
+    """Yield (start, end) offsets of each top-level <table>…</table> block.
+
+    Most of a Wikipedia page is prose, infobox markup and references; only
+    the table blocks need to go through the (pure Python) HTML tokenizer.
+    """
+    depth = 0
+    start = 0
+    for m in TABLE_TAG_RE.finditer(page_html):
+        if m.group(1):
+            if depth == 0:
+                continue  # Stray </table>
+            depth -= 1
+            if depth == 0:
+                end = page_html.find('>', m.end())
+                end = len(page_html) if end < 0 else end + 1
+                yield start, end
+        else:
+            if depth == 0:
+                start = m.start()
+            depth += 1
+    if depth:
+        yield start, len(page_html)
+
+
+def iter_table_rows(page_html, chunk_size=64 * 1024):
+    """Yield expanded Rows from every table in page_html, in document order."""
+    if not page_html:
+        return
+    parser = TableExtractor()
+    for region_start, region_end in iter_table_regions(page_html):
+        for start in range(region_start, region_end, chunk_size):
+            parser.feed(page_html[start:min(start + chunk_size, region_end)])
+            while parser.rows:
+                yield parser.rows.popleft()
+    parser.close()
+    while parser.rows:
+        yield parser.rows.popleft()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Rebuild the frozen Wikipedia-shaped pages used by bench_extractors.py.
+
+The pages are reconstructed from the checked-in data (assemblyConstituencies.js,
+pcToAcMapping.js, constituencies.js) in the markup Wikipedia serves for
+"List of constituencies" pages: a wikitable with <th> headers, linked names,
+citation superscripts and rowspan'd District / Lok Sabha cells. Each page
+covers one layout the extractors must handle:
+
+  uttar_pradesh.html  403 numbered rows, the largest single table
+  karnataka.html      District first, the AC number in the second column
+  assam.html          a seat summary table (one numbered row per PC, 14),
+                      the current table and the pre-delimitation table,
+                      in that order
+
+Reservation categories are not in the checked-in data; every 6th AC is
+marked SC and every 20th ST so the column is exercised.
+
+The fixtures are committed; re-run this only when the page layout the
+benchmark models should change, then refresh the baseline with
+`bench_extractors.py --update-baseline`.
+
+Usage:
+  python scripts/make_bench_fixtures.py
+"""
+
+import html
+import os
+
+from canonical_store import read_assembly_js, read_lok_sabha_js, read_pc_to_ac_js
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(SCRIPT_DIR, "fixtures", "wiki")
+
+
+def link(text):
+    slug = html.escape(text.replace(' ', '_'), quote=True)
+    return f'<a href="/wiki/{slug}" title="{html.escape(text, quote=True)}">{html.escape(text)}</a>'
+
+
+def cite(n):
+    return f'<sup id="cite_ref-{n}" class="reference"><a href="#cite_note-{n}">[{n}]</a></sup>'
+
+
+def reservation(ac_no):
+    if ac_no % 20 == 0:
+        return "ST"
+    if ac_no % 6 == 0:
+        return "SC"
+    return "None"
+
+
+def span_counts(values):
+    """Per row, the rowspan of a merged cell starting there (0 = covered)."""
+    spans = [0] * len(values)
+    i = 0
+    while i < len(values):
+        j = i
+        while j < len(values) and values[j] == values[i]:
+            j += 1
+        spans[i] = j - i
+        i = j
+    return spans
+
+
+def merged_cell(value, span):
+    if span == 0:
+        return None
+    attrs = f' rowspan="{span}"' if span > 1 else ''
+    return f'<td{attrs}>{link(value)}</td>'
+
+
+def state_rows(state):
+    """[(ac_no, name, district, pc_name)] for a state, in AC number order."""
+    pc_names = {pc.id: pc.name for pc in read_lok_sabha_js()}
+    ac_pc = {ac_id: pc_names[pc_id] for pc_id, ac_ids in read_pc_to_ac_js().items()
+             for ac_id in ac_ids if pc_id in pc_names}
+    rows = []
+    for e in read_assembly_js():
+        if e['state'] != state:
+            continue
+        pc_name = ac_pc.get(e['id'], "")
+        # Karnataka carries no districts in the app data; its PCs stand in
+        rows.append((e['acNo'], e['name'], e.get('district') or pc_name, pc_name))
+    rows.sort()
+    return rows
+
+
+def page(title, tables):
+    return "\n".join([
+        "<!DOCTYPE html>",
+        '<html class="client-nojs" lang="en" dir="ltr">',
+        f"<head><meta charset=\"UTF-8\"><title>{html.escape(title)} - Wikipedia</title></head>",
+        '<body class="mediawiki ltr skin-vector">',
+        f'<h1 id="firstHeading" class="firstHeading">{html.escape(title)}</h1>',
+        '<div id="mw-content-text" class="mw-body-content"><div class="mw-parser-output">',
+        f"<p>The <b>{html.escape(title)}</b> lists the assembly constituencies.{cite(1)}</p>",
+        *tables,
+        '<div class="reflist"><ol class="references">'
+        '<li id="cite_note-1">Delimitation of Parliamentary and Assembly Constituencies Order</li>'
+        '</ol></div>',
+        "</div></div>",
+        "</body>",
+        "</html>",
+        "",
+    ])
+
+
+def numbered_table(rows, caption=None):
+    """No. | Name | Reserved for | District | Lok Sabha, District and PC merged."""
+    out = ['<table class="wikitable sortable">']
+    if caption:
+        out.append(f"<caption>{html.escape(caption)}</caption>")
+    out.append("<tbody><tr><th>No.</th><th>Name</th><th>Reserved for "
+               "(SC/ST/None)</th><th>District</th><th>Lok Sabha constituency</th></tr>")
+    district_spans = span_counts([r[2] for r in rows])
+    pc_spans = span_counts([r[3] for r in rows])
+    for i, (ac_no, name, district, pc_name) in enumerate(rows):
+        cells = [f"<td>{ac_no}</td>", f"<td>{link(name)}{cite(1) if ac_no % 50 == 0 else ''}</td>",
+                 f"<td>{reservation(ac_no)}</td>"]
+        for cell in (merged_cell(district, district_spans[i]), merged_cell(pc_name, pc_spans[i])):
+            if cell:
+                cells.append(cell)
+        out.append("<tr>" + "".join(cells) + "</tr>")
+    out.append("</tbody></table>")
+    return "\n".join(out)
+
+
+def district_first_table(rows):
+    """District | No. | Constituency | Reserved for | Lok Sabha: no leading AC number."""
+    out = ['<table class="wikitable">',
+           "<tbody><tr><th>District</th><th>No.</th><th>Constituency</th><th>Reserved for "
+           "(SC/ST/None)</th><th>Lok Sabha constituency</th></tr>"]
+    district_spans = span_counts([r[2] for r in rows])
+    pc_spans = span_counts([r[3] for r in rows])
+    for i, (ac_no, name, district, pc_name) in enumerate(rows):
+        cells = []
+        district_cell = merged_cell(district, district_spans[i])
+        if district_cell:
+            cells.append(district_cell)
+        cells.append(f"<td>{ac_no}</td>")
+        cells.append(f"<td>{link(name)}</td>")
+        cells.append(f"<td>{reservation(ac_no)}</td>")
+        pc_cell = merged_cell(pc_name, pc_spans[i])
+        if pc_cell:
+            cells.append(pc_cell)
+        out.append("<tr>" + "".join(cells) + "</tr>")
+    out.append("</tbody></table>")
+    return "\n".join(out)
+
+
+def summary_table(rows):
+    """A No. | Name | Seats table, one row per PC, that must not be taken for the list."""
+    seats = {}
+    for _, _, _, pc_name in rows:
+        seats[pc_name] = seats.get(pc_name, 0) + 1
+    out = ['<table class="wikitable">',
+           "<tbody><tr><th>No.</th><th>Name</th><th>Assembly seats</th></tr>"]
+    for i, (pc_name, n) in enumerate(sorted(seats.items()), 1):
+        out.append(f"<tr><td>{i}</td><td>{link(pc_name)}</td><td>{n}</td></tr>")
+    out.append("</tbody></table>")
+    return "\n".join(out)
+
+
+def write_fixture(name, content):
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    path = os.path.join(FIXTURE_DIR, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    print(f"Wrote {os.path.relpath(path)} ({len(content.encode('utf-8')) / 1024:.0f} KB)")
+
+
+def main():
+    up = state_rows("Uttar Pradesh")
+    write_fixture("uttar_pradesh.html", page(
+        "List of constituencies of Uttar Pradesh Legislative Assembly",
+        ["<h2>Constituencies</h2>", numbered_table(up)]))
+
+    ka = state_rows("Karnataka")
+    write_fixture("karnataka.html", page(
+        "List of constituencies of the Karnataka Legislative Assembly",
+        ["<h2>Constituencies</h2>", district_first_table(ka)]))
+
+    assam = state_rows("Assam")
+    # Pre-delimitation names: the same seats under older spellings
+    old = [(ac_no, f"{name} (old)", district, pc_name) for ac_no, name, district, pc_name in assam]
+    write_fixture("assam.html", page(
+        "List of constituencies of the Assam Legislative Assembly",
+        ["<h2>Lok Sabha constituencies</h2>", summary_table(assam),
+         "<h2>Constituencies</h2>", numbered_table(assam),
+         "<h2>Constituencies before 2023 delimitation</h2>",
+         numbered_table(old, caption="Constituencies (2008-2023)")]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Rebuild the synthetic constituency boundary fixtures.
+
+No PC or AC boundary data is checked in, so generate_constituency_geometry.py
+and bench_geometry_tiles.py run on stand-ins built from the state map. Each
+state's outline in indiaMapPaths.js is cut into one cell per PC (or AC) by
+recursive bisection: split across the longer side of the bounding box at the
+line that divides the area in proportion to the IDs on each side, until
+every cell holds one ID. Cells on either side of a cut, and states on
+either side of a border, get the same vertices, as in real boundary files.
+
+Straight cuts would leave nothing to simplify, so all points are then
+displaced by a smooth warp (at most WARP_AMPLITUDE viewBox units), after
+straight edges get a vertex every DENSIFY_STEP units at fixed positions,
+which gives the cut lines a river-like wiggle. The cells are unprojected to
+lon/lat and written as GeoJSON with {id, name, state} properties:
+
+  scripts/fixtures/geo/pc_boundaries.geojson
+  scripts/fixtures/geo/ac_boundaries.geojson
+
+The committed fixtures cover FIXTURE_STATES, a few small neighbouring
+states; the benchmark builds all of India in a temporary directory.
+
+Usage:
+  python scripts/make_geometry_fixture.py
+  python scripts/make_geometry_fixture.py --states all --out-dir /tmp/geo
+"""
+
+import argparse
+import json
+import math
+import os
+
+from canonical_store import read_assembly_js, read_lok_sabha_js
+from generate_constituency_geometry import unproject
+from simplify_map_paths import SCALE, read_map_paths, ring_area
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(SCRIPT_DIR, "fixtures", "geo")
+FIXTURE_STATES = ("DL", "HR", "GA")
+
+DENSIFY_STEP = 1.0
+WARP_AMPLITUDE = 0.6
+WARP_WAVELENGTH = 12.0
+BISECT_ITERATIONS = 40
+
+
+def clip_ring(ring, axis, cut, keep_low):
+    """Sutherland–Hodgman clip of a ring to coordinate[axis] <= cut (or >=).
+
+    Crossing points are computed from the edge in ring order, so both sides
+    of a cut get bit-identical vertices.
+    """
+    def inside(point):
+        return point[axis] <= cut if keep_low else point[axis] >= cut
+
+    out = []
+    for i, end in enumerate(ring):
+        start = ring[i - 1]
+        if inside(end) != inside(start):
+            t = (cut - start[axis]) / (end[axis] - start[axis])
+            other = start[1 - axis] + t * (end[1 - axis] - start[1 - axis])
+            out.append((cut, other) if axis == 0 else (other, cut))
+        if inside(end):
+            out.append(end)
+    return out
+
+
+def clip(rings, axis, cut, keep_low):
+    clipped = (clip_ring(ring, axis, cut, keep_low) for ring in rings)
+    return [ring for ring in clipped if len(ring) >= 3]
+
+
+def area(rings):
+    return abs(sum(ring_area(ring) for ring in rings))
+
+
+def bisect_cells(rings, ids):
+    """{id: rings}, cutting rings into one equal-area cell per ID."""
+    if len(ids) == 1:
+        return {ids[0]: rings}
+    xs = [x for ring in rings for x, _ in ring]
+    ys = [y for ring in rings for _, y in ring]
+    axis = 0 if max(xs) - min(xs) >= max(ys) - min(ys) else 1
+    low, high = (min(xs), max(xs)) if axis == 0 else (min(ys), max(ys))
+    half = len(ids) // 2
+    target = area(rings) * half / len(ids)
+    for _ in range(BISECT_ITERATIONS):
+        cut = (low + high) / 2
+        if area(clip(rings, axis, cut, True)) < target:
+            low = cut
+        else:
+            high = cut
+    cut = (low + high) / 2
+    cells = bisect_cells(clip(rings, axis, cut, True), ids[:half])
+    cells.update(bisect_cells(clip(rings, axis, cut, False), ids[half:]))
+    return cells
+
+
+def densify(ring, step=DENSIFY_STEP):
+    """Vertices at multiples of step along horizontal and vertical edges.
+
+    The positions depend only on the line, not the edge's endpoints, so an
+    edge split on one side of a cut still matches the other side.
+    """
+    out = []
+    for i, start in enumerate(ring):
+        end = ring[(i + 1) % len(ring)]
+        out.append(start)
+        axis = 1 if start[0] == end[0] else 0 if start[1] == end[1] else None
+        if axis is None:
+            continue
+        a, b = start[axis], end[axis]
+        k_range = range(math.floor(a / step) + 1, math.ceil(b / step)) if a < b else \
+            range(math.ceil(a / step) - 1, math.floor(b / step), -1)
+        for k in k_range:
+            out.append((start[0], k * step) if axis == 1 else (k * step, start[1]))
+    return out
+
+
+def warp(point):
+    x, y = point
+    return (x + WARP_AMPLITUDE * math.sin(2 * math.pi * y / WARP_WAVELENGTH + 1.3),
+            y + WARP_AMPLITUDE * math.sin(2 * math.pi * x / WARP_WAVELENGTH + 0.7))
+
+
+def lonlat_ring(ring):
+    """A viewBox ring as a closed GeoJSON ring of rounded lon/lat."""
+    points = [[round(v, 5) for v in unproject(*warp(point))] for point in densify(ring)]
+    return points + [points[0]]
+
+
+def ids_by_state(level):
+    """{state name: [(id, name)]} from the checked-in data."""
+    groups = {}
+    if level == "pc":
+        for pc in read_lok_sabha_js():
+            groups.setdefault(pc.state, []).append((pc.id, pc.name))
+    else:
+        for e in read_assembly_js():
+            groups.setdefault(e['state'], []).append((e['id'], e['name']))
+    return groups
+
+
+def build_fixture(level, codes=None):
+    """GeoJSON features for one level; codes limits the states (None: all)."""
+    map_states = {state.name: state for state in read_map_paths()}
+    features = []
+    for state, members in ids_by_state(level).items():
+        if codes is not None and members[0][0][:2] not in codes:
+            continue
+        if state not in map_states:
+            continue
+        outline = [[(x / SCALE, y / SCALE) for x, y in ring] for ring in map_states[state].rings]
+        names = dict(members)
+        cells = bisect_cells(outline, [fid for fid, _ in members])
+        for fid, rings in cells.items():
+            features.append({
+                "type": "Feature",
+                "properties": {"id": fid, "name": names[fid], "state": state},
+                "geometry": {"type": "MultiPolygon", "coordinates": [[lonlat_ring(ring)] for ring in rings]},
+            })
+    return features
+
+
+def write_geojson(path, features):
+    """One feature per line, so fixture changes diff readably."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"type":"FeatureCollection","features":[\n')
+        f.write(",\n".join(json.dumps(feature, ensure_ascii=False, separators=(",", ":"))
+                           for feature in features))
+        f.write("\n]}\n")
+    print(f"Wrote {len(features)} features to {path} ({os.path.getsize(path) / 1024:.0f} KB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the synthetic constituency boundary fixtures.")
+    parser.add_argument("--states", default=",".join(FIXTURE_STATES),
+                        help=f"state codes, or 'all' (default: {','.join(FIXTURE_STATES)})")
+    parser.add_argument("--out-dir", default=FIXTURE_DIR, help="output directory (default: scripts/fixtures/geo)")
+    args = parser.parse_args()
+    codes = None if args.states == "all" else set(args.states.split(","))
+    for level in ("pc", "ac"):
+        write_geojson(os.path.join(args.out_dir, f"{level}_boundaries.geojson"), build_fixture(level, codes))
+
+
+if __name__ == "__main__":
+    main()
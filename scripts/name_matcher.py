@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Indexed fuzzy name matching.
+
+Names are added per scope (e.g. a state code) and indexed by character
+trigrams. A query only scores the few names that share the most trigrams with
+it, instead of scanning every name with substring checks:
+
+  matcher = NameMatcher()
+  matcher.add("WB", "Bardhaman Purba", "WB-38")
+  matcher.add("WB", "Bardhaman-Durgapur", "WB-39")
+  matcher.match("WB", "Bardhaman Durgapur")
+  -> Match(value='WB-39', name='Bardhaman-Durgapur', score=1.0, ambiguous=False, ...)
+
+Scores are in [0, 1]: the better of the edit-distance similarity of the
+folded names and their word-token overlap. A match is flagged ambiguous when
+a different value scores within `tie_margin` of the best one.
+"""
+
+import re
+from collections import Counter, namedtuple
+
+Match = namedtuple('Match', ['value', 'name', 'score', 'ambiguous', 'runner_up'])
+
+
+def fold_name(name):
+    """Lower-case, with punctuation and runs of spaces collapsed to one space."""
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", name.lower()).split())
+
+
+def trigrams(folded):
+    padded = f"  {folded} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b):
+    """Levenshtein distance between two strings."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def similarity(query, name):
+    """Score two folded names in [0, 1]."""
+    if query == name:
+        return 1.0
+    longest = max(len(query), len(name))
+    edit_score = 1.0 - edit_distance(query, name) / longest if longest else 0.0
+    query_tokens, name_tokens = set(query.split()), set(name.split())
+    token_score = len(query_tokens & name_tokens) / len(query_tokens | name_tokens)
+    return max(edit_score, token_score)
+
+
+class NameMatcher:
+    """Trigram inverted index of names per scope, scored by edit distance."""
+
+    def __init__(self, candidates=8, tie_margin=0.02):
+        self.candidates = candidates      # names scored per query
+        self.tie_margin = tie_margin
+        self._entries = {}                # scope -> [(folded, name, value)]
+        self._index = {}                  # scope -> trigram -> [entry index]
+        self._exact = {}                  # (scope, folded) -> [entry index]
+
+    def add(self, scope, name, value):
+        folded = fold_name(name)
+        entries = self._entries.setdefault(scope, [])
+        index = self._index.setdefault(scope, {})
+        self._exact.setdefault((scope, folded), []).append(len(entries))
+        for gram in trigrams(folded):
+            index.setdefault(gram, []).append(len(entries))
+        entries.append((folded, name, value))
+
+    def match(self, scope, query, min_score=0.0):
+        """Best Match for query among scope's names, or None below min_score."""
+        folded = fold_name(query)
+        entries = self._entries.get(scope, [])
+        exact = self._exact.get((scope, folded))
+        if exact:
+            # The same name registered for several values is a tie
+            first = entries[exact[0]]
+            other = next((entries[i] for i in exact if entries[i][2] != first[2]), None)
+            return Match(first[2], first[1], 1.0, other is not None, other and other[1])
+
+        index = self._index.get(scope, {})
+        shared = Counter()
+        for gram in trigrams(folded):
+            shared.update(index.get(gram, ()))
+        top = shared.most_common(self.candidates)
+        # Only names sharing at least half as many trigrams as the best are scored
+        cutoff = top[0][1] / 2 if top else 0
+        scored = sorted(
+            ((similarity(folded, entries[i][0]), i) for i, count in top if count >= cutoff),
+            reverse=True,
+        )
+        if not scored or scored[0][0] < min_score:
+            return None
+
+        best_score, best = scored[0]
+        runner_up = next(((s, i) for s, i in scored[1:] if entries[i][2] != entries[best][2]), None)
+        ambiguous = runner_up is not None and best_score - runner_up[0] <= self.tie_margin
+        return Match(entries[best][2], entries[best][1], best_score, ambiguous,
+                     entries[runner_up[1]][1] if runner_up else None)
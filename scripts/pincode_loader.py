@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Streaming, memory-bounded loader for the India Post pincode directory CSV.
+
+The directory has ~150k post-office rows for ~19k unique PIN codes. Instead
+of a dict of dicts keyed by PIN string, the loader keeps:
+
+  - districts: one interned (district, state) tuple per unique district
+  - codes:     array('H') with one slot per possible 6-digit PIN, holding the
+               district index (NO_DISTRICT for unused PINs) — 1.8 MB flat
+
+Rows are read with csv.reader one at a time; .title() and the state lookup run
+once per unique (district, state) spelling, not once per row. PINs whose post
+offices disagree on the district are reported in `conflicts` rather than
+silently resolved (the first district seen is kept, as before).
+"""
+
+import csv
+from array import array
+
+PIN_BASE = 100000            # Smallest valid 6-digit PIN
+PIN_SPAN = 900000            # 100000..999999
+NO_DISTRICT = 0xFFFF
+
+
+class PinDistrictTable:
+    """Compact PIN -> (district, state) table."""
+
+    def __init__(self):
+        self.districts = []          # index -> (district, state)
+        self.codes = array('H', [NO_DISTRICT]) * PIN_SPAN
+        self.conflicts = {}          # pin -> set of district indexes
+        self.rows_read = 0
+        self.rows_skipped = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def get(self, pin):
+        """(district, state) for an int or str PIN, or None."""
+        slot = int(pin) - PIN_BASE
+        if not 0 <= slot < PIN_SPAN:
+            return None
+        idx = self.codes[slot]
+        return None if idx == NO_DISTRICT else self.districts[idx]
+
+    def items(self):
+        """Yield (pin, district, state) in ascending PIN order."""
+        districts = self.districts
+        for slot, idx in enumerate(self.codes):
+            if idx != NO_DISTRICT:
+                district, state = districts[idx]
+                yield slot + PIN_BASE, district, state
+
+    def conflict_report(self):
+        """[(pin, [(district, state), ...]), ...] sorted by PIN."""
+        return [
+            (pin, [self.districts[i] for i in sorted(idxs)])
+            for pin, idxs in sorted(self.conflicts.items())
+        ]
+
+
+def load_pin_districts(csv_path, state_map):
+    """Stream csv_path into a PinDistrictTable.
+
+    state_map maps the directory's upper-case state names to the app's state
+    names; rows for states not in the map are skipped.
+    """
+    table = PinDistrictTable()
+    codes = table.codes
+    interned = {}   # (raw district, raw state) -> index, or None to skip
+    entry_index = {}  # (district, state) -> index
+
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = [h.strip().lower() for h in next(reader)]
+        pin_col = header.index('pincode')
+        district_col = header.index('district')
+        state_col = header.index('statename')
+        width = max(pin_col, district_col, state_col)
+
+        for row in reader:
+            table.rows_read += 1
+            if len(row) <= width:
+                table.rows_skipped += 1
+                continue
+            pin = row[pin_col].strip()
+            if len(pin) != 6 or not pin.isdigit():
+                table.rows_skipped += 1
+                continue
+
+            key = (row[district_col], row[state_col])
+            idx = interned.get(key, -1)
+            if idx == -1:
+                state = state_map.get(key[1].strip())
+                if state:
+                    # Normalize to Title Case once per spelling
+                    entry = (key[0].strip().title(), state)
+                    idx = entry_index.get(entry)
+                    if idx is None:
+                        idx = entry_index[entry] = len(table.districts)
+                        table.districts.append(entry)
+                else:
+                    idx = None
+                interned[key] = idx
+            if idx is None:
+                table.rows_skipped += 1
+                continue
+
+            slot = int(pin) - PIN_BASE
+            current = codes[slot]
+            if current == NO_DISTRICT:
+                codes[slot] = idx
+                table._count += 1
+            elif current != idx:
+                table.conflicts.setdefault(slot + PIN_BASE, {current}).add(idx)
+
+    return table
+
+
+def encode_pin_ranges(pin_rows, fill_gaps=False):
+    """Range-encode sorted (pin, district, state) rows.
+
+    Returns (districts, starts, lengths, indexes): each interval covers PINs
+    start..start+length-1 and maps them to districts[index]; only listed
+    PINs are covered. With fill_gaps (opt-in), an interval also spans
+    unlisted PINs up to the next listed PIN of the same district, so a
+    district's block costs one interval instead of one per contiguous run,
+    but unlisted PINs inside it then resolve to that district.
+
+    Any (pin, *value) rows work; "districts" is then the list of distinct
+    value tuples.
+    """
+    districts = []
+    district_to_idx = {}
+    starts, lengths, indexes = array('i'), array('i'), array('H')
+    last_pin = None
+
+    for pin, *value in pin_rows:
+        key = tuple(value)
+        idx = district_to_idx.get(key)
+        if idx is None:
+            idx = district_to_idx[key] = len(districts)
+            districts.append(key)
+        if indexes and indexes[-1] == idx and (fill_gaps or pin == last_pin + 1):
+            lengths[-1] = pin - starts[-1] + 1
+        else:
+            starts.append(pin)
+            lengths.append(1)
+            indexes.append(idx)
+        last_pin = pin
+
+    return districts, starts, lengths, indexes
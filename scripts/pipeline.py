@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Run the data generators as one make-style pipeline.
+
+Each generator is a stage with declared inputs, outputs and upstream stages:
+
+  assembly            generate_assembly_data.py      -> assemblyConstituencies.js
+  pc_ac               generate_pc_ac_mapping.py      -> pcToAcMapping.js
+  districts           generate_district_mapping.py   -> district fields, pincodeDistricts.js
+                      (after assembly)
+  pin_prefix          generate_pin_prefix_index.py   -> pinPrefixIndex.js
+                      (after assembly, pc_ac)
+  pin_constituencies  generate_pin_constituencies.py -> pinConstituencies.js
+                      (after districts, pc_ac)
+  constituency_index  generate_constituency_index.py -> constituencyIndex.js
+                      (after districts, pc_ac)
+  validate            validate_data.py --strict      -> .cache/validation.json
+                      (after districts, pc_ac, pin_prefix, constituency_index;
+                      fails on issues not in fixtures/validation_baseline.json)
+  map_lod             simplify_map_paths.py          -> indiaMapPaths{High,Medium,Low}.js
+
+The generated modules share src/data/stringTable.js (see string_table.py).
+Stages that refer to districts rewrite it and list it as an output; pc_ac
+and pin_prefix only use its stable prefix, which their inputs determine.
+A stage that changes the table also re-encodes the other modules it
+would leave stale (string_table.refresh_dependents), and validate fails if
+any module's recorded table digest still does not match.
+
+Stages whose upstream stages have finished run as separate processes, up to
+--parallel at a time, so assembly and pc_ac scrape concurrently. Their
+requests share one rate limit: wiki_fetch keeps its token bucket in a
+locked file next to the page cache, and --rps is passed to every scraping
+stage. On a fresh checkout the canonical store is seeded once, before any
+stage starts, so concurrent stages all find it seeded.
+
+A stage is skipped when nothing it depends on changed since its last
+successful run: its input files, its script and the scripts/ modules it
+imports, the stamps (output digests) of its upstream stages, and, for
+scraping stages, its Wikipedia pages. Pages count as unchanged only when
+every one is in the page cache within the TTL (or --offline), since any
+other fetch may return new content. State is kept in
+scripts/.cache/pipeline.json; stage logs go to scripts/.cache/pipeline/.
+
+Usage:
+  python scripts/pipeline.py                    # everything that is out of date
+  python scripts/pipeline.py pin_prefix         # a stage and its upstream stages
+  python scripts/pipeline.py --dry-run
+  python scripts/pipeline.py --force --offline
+"""
+
+import argparse
+import ast
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import namedtuple
+
+from build_manifest import digest, file_digest
+from canonical_store import open_store
+from wiki_fetch import DEFAULT_RPS, DEFAULT_WORKERS, configure, wiki_url
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.normpath(os.path.join(SCRIPT_DIR, ".."))
+STATE_PATH = os.path.join(SCRIPT_DIR, ".cache", "pipeline.json")
+LOG_DIR = os.path.join(SCRIPT_DIR, ".cache", "pipeline")
+STATE_VERSION = 1
+
+# inputs/outputs: paths relative to the project root
+# pages: modules whose STATES slugs are the Wikipedia pages the stage scrapes
+# scrapes: whether the script takes the fetch and incremental flags
+# store: whether the script reads the canonical store (takes --db)
+Stage = namedtuple('Stage', ['name', 'script', 'after', 'inputs', 'outputs', 'pages', 'scrapes', 'store'],
+                   defaults=(True,))
+
+STAGES = [
+    Stage("assembly", "generate_assembly_data.py", (),
+          (),
+          ("src/data/assemblyConstituencies.js", "src/data/stringTable.js"),
+          # The assembly pages, and the list pages they link to
+          ("generate_assembly_data", "generate_district_mapping"), True),
+    Stage("pc_ac", "generate_pc_ac_mapping.py", (),
+          ("src/data/constituencies.js", "scripts/aliases/pc_names.json"),
+          ("src/data/pcToAcMapping.js",),
+          ("generate_pc_ac_mapping",), True),
+    Stage("districts", "generate_district_mapping.py", ("assembly",),
+          ("scripts/pincode_full.csv", "scripts/aliases/district_names.json"),
+          ("src/data/assemblyConstituencies.js", "src/data/pincodeDistricts.js",
+           "src/data/stringTable.js"),
+          ("generate_district_mapping",), True),
+    Stage("pin_prefix", "generate_pin_prefix_index.py", ("assembly", "pc_ac"),
+          ("src/data/constituencies.js",),
+          ("src/data/pinPrefixIndex.js",),
+          (), False),
+    Stage("pin_constituencies", "generate_pin_constituencies.py", ("districts", "pc_ac"),
+          ("scripts/aliases/district_names.json",),
+          ("src/data/pinConstituencies.js",),
+          (), False),
+    Stage("constituency_index", "generate_constituency_index.py", ("districts", "pc_ac"),
+          ("src/data/constituencies.js",),
+          ("src/data/constituencyIndex.js", "src/data/stringTable.js"),
+          (), False),
+    Stage("validate", "validate_data.py", ("districts", "pc_ac", "pin_prefix", "constituency_index"),
+          ("src/data/constituencies.js", "scripts/fixtures/validation_baseline.json"),
+          ("scripts/.cache/validation.json",),
+          (), False),
+    Stage("map_lod", "simplify_map_paths.py", (),
+          ("src/data/indiaMapPaths.js",),
+          ("src/data/indiaMapPathsHigh.js", "src/data/indiaMapPathsMedium.js",
+           "src/data/indiaMapPathsLow.js"),
+          (), False, False),
+]
+STAGES_BY_NAME = {stage.name: stage for stage in STAGES}
+
+
+def local_imports(script, seen=None):
+    """script plus every scripts/ module it imports, transitively."""
+    seen = set() if seen is None else seen
+    if script in seen:
+        return seen
+    seen.add(script)
+    with open(os.path.join(SCRIPT_DIR, script), 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            module = name.split('.')[0] + ".py"
+            if os.path.exists(os.path.join(SCRIPT_DIR, module)):
+                local_imports(module, seen)
+    return seen
+
+
+def pages_digest(stage, cache):
+    """Digest of the stage's cached pages, or None if any would be fetched."""
+    shas = []
+    for module in stage.pages:
+        for state_cfg in importlib.import_module(module).STATES:
+            sha = cache.fresh_digest(wiki_url(state_cfg[3]))
+            if sha is None:
+                return None
+            shas.append(sha)
+    return digest(",".join(shas))
+
+
+def stage_inputs(stage, stamps, cache):
+    """{input key: digest} for everything the stage's output depends on."""
+    inputs = {path: file_digest(os.path.join(PROJECT_DIR, path)) for path in stage.inputs}
+    inputs["code"] = digest(",".join(
+        f"{script}:{file_digest(os.path.join(SCRIPT_DIR, script))}"
+        for script in sorted(local_imports(stage.script))))
+    for upstream in stage.after:
+        inputs[f"after:{upstream}"] = stamps.get(upstream)
+    if stage.pages:
+        inputs["pages"] = pages_digest(stage, cache)
+    return inputs
+
+
+def out_of_date(stage, inputs, record):
+    """Why the stage must run, or None if it is up to date."""
+    if not record:
+        return "never run"
+    if stage.pages and inputs["pages"] is None:
+        return "source pages not freshly cached"
+    changed = sorted(key for key in set(inputs) | set(record["inputs"])
+                     if inputs.get(key) != record["inputs"].get(key))
+    if changed:
+        return "changed: " + ", ".join(changed)
+    missing = [path for path, sha in record["outputs"].items()
+               if sha and not os.path.exists(os.path.join(PROJECT_DIR, path))]
+    if missing:
+        return "missing: " + ", ".join(missing)
+    return None
+
+
+def select_stages(names):
+    """The named stages and everything upstream of them, in pipeline order."""
+    if not names:
+        return list(STAGES)
+    wanted = set()
+
+    def visit(name):
+        if name not in wanted:
+            wanted.add(name)
+            for upstream in STAGES_BY_NAME[name].after:
+                visit(upstream)
+    for name in names:
+        visit(name)
+    return [stage for stage in STAGES if stage.name in wanted]
+
+
+def load_state(path=STATE_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get("version") == STATE_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {"version": STATE_VERSION, "stages": {}}
+
+
+def save_state(state, path=STATE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def stage_command(stage, args):
+    command = [sys.executable, os.path.join(SCRIPT_DIR, stage.script)]
+    if args.db and stage.store:
+        command += ["--db", args.db]
+    if stage.name == "validate":
+        # Fail the run on any issue the validation baseline does not allow
+        command.append("--strict")
+    if stage.scrapes:
+        command += ["--workers", str(args.workers), "--jobs", str(args.jobs)]
+        if args.rps is not None:
+            command += ["--rps", str(args.rps)]
+        if args.offline:
+            command.append("--offline")
+        if args.force:
+            command.append("--force")
+    return command
+
+
+def run_pipeline(stages, args, cache):
+    """Run or skip each stage; returns the names of stages that failed."""
+    state = load_state(args.state)
+    records = state["stages"]
+    stamps = {name: record.get("stamp") for name, record in records.items()}
+    pending = list(stages)
+    running = {}   # name -> (stage, Popen, log file, start time, inputs)
+    finished = set()
+    failed = set()
+    os.makedirs(LOG_DIR, exist_ok=True)
+    if not args.dry_run and any(stage.store for stage in stages):
+        # Seed a fresh store here, before stages open it side by side
+        open_store(args.db).close()
+
+    while pending or running:
+        for stage in list(pending):
+            if any(upstream in failed for upstream in stage.after):
+                print(f"[{stage.name}] blocked by a failed upstream stage")
+                failed.add(stage.name)
+                pending.remove(stage)
+                continue
+            if not all(upstream in finished for upstream in stage.after):
+                continue
+            if len(running) >= args.parallel:
+                break
+
+            inputs = stage_inputs(stage, stamps, cache)
+            reason = "forced" if args.force else out_of_date(stage, inputs, records.get(stage.name))
+            pending.remove(stage)
+            if reason is None:
+                print(f"[{stage.name}] up to date, skipped")
+                finished.add(stage.name)
+                continue
+            if args.dry_run:
+                print(f"[{stage.name}] would run ({reason})")
+                # Downstream stages would see a new stamp
+                stamps[stage.name] = None
+                finished.add(stage.name)
+                continue
+
+            log_path = os.path.join(LOG_DIR, f"{stage.name}.log")
+            log = open(log_path, 'w', encoding='utf-8')
+            print(f"[{stage.name}] running ({reason}), log: {os.path.relpath(log_path)}")
+            process = subprocess.Popen(stage_command(stage, args), cwd=SCRIPT_DIR,
+                                       stdout=log, stderr=subprocess.STDOUT)
+            running[stage.name] = (stage, process, log, time.perf_counter(), inputs)
+
+        for name, (stage, process, log, start, inputs) in list(running.items()):
+            if process.poll() is None:
+                continue
+            del running[name]
+            log.close()
+            elapsed = time.perf_counter() - start
+            if process.returncode != 0:
+                print(f"[{name}] FAILED (exit {process.returncode}) after {elapsed:.1f}s; "
+                      f"last lines of {os.path.relpath(log.name)}:")
+                with open(log.name, 'r', encoding='utf-8', errors='replace') as f:
+                    for line in f.readlines()[-20:]:
+                        print(f"    {line.rstrip()}")
+                failed.add(name)
+                continue
+
+            outputs = {path: file_digest(os.path.join(PROJECT_DIR, path)) for path in stage.outputs}
+            stamps[name] = digest(json.dumps(outputs, sort_keys=True))
+            records[name] = {"inputs": inputs, "outputs": outputs, "stamp": stamps[name],
+                             "finished_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                             "seconds": round(elapsed, 2)}
+            save_state(state, args.state)
+            finished.add(name)
+            print(f"[{name}] done in {elapsed:.1f}s")
+            if args.verbose:
+                with open(log.name, 'r', encoding='utf-8', errors='replace') as f:
+                    for line in f:
+                        print(f"    {line.rstrip()}")
+
+        if running:
+            time.sleep(0.1)
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the data generators as a dependency-ordered pipeline.")
+    parser.add_argument("stages", nargs="*", metavar="stage", help="stages to bring up to date, with their upstream "
+                        f"stages (default: all of {', '.join(s.name for s in STAGES)})")
+    parser.add_argument("--parallel", type=int, default=2,
+                        help="stages run at once (default: 2)")
+    parser.add_argument("--force", action="store_true",
+                        help="run every selected stage, and pass --force to the generators")
+    parser.add_argument("--dry-run", action="store_true", help="show what would run")
+    parser.add_argument("--verbose", action="store_true", help="echo each stage's log when it finishes")
+    parser.add_argument("--offline", action="store_true",
+                        help="pass --offline to scraping stages; cached pages count as fresh")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"--workers for scraping stages (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="--jobs (parsing processes) for scraping stages (default: 1)")
+    parser.add_argument("--rps", type=float, default=None,
+                        help=f"global network requests per second, shared by all scraping "
+                             f"stages (default: {DEFAULT_RPS:g})")
+    parser.add_argument("--db", default=None, help="canonical store path passed to every stage")
+    parser.add_argument("--state", default=STATE_PATH,
+                        help="pipeline state path (default: scripts/.cache/pipeline.json)")
+    args = parser.parse_args()
+    unknown = [name for name in args.stages if name not in STAGES_BY_NAME]
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(unknown)}")
+
+    cache = configure(offline=args.offline or None)
+    stages = select_stages(args.stages)
+    start = time.perf_counter()
+    failed = run_pipeline(stages, args, cache)
+    print(f"\nPipeline {'failed' if failed else 'finished'} in "
+          f"{time.perf_counter() - start:.1f}s"
+          + (f"; failed: {', '.join(s.name for s in stages if s.name in failed)}" if failed else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
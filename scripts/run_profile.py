@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Per-stage, per-state instrumentation for the generator scripts.
+
+Generators wrap their work in named stages, optionally per state:
+
+  with stage("fetch", code):
+      page = fetch_wiki_page(slug)
+  with stage("parse", code):
+      records = parse_page_records(page, count)
+
+Each stage records its call count, busy time (summed over threads), wall
+span (first start to last end) and the process peak RSS when it ended.
+Shared layers add counters to whichever stage is active on the calling
+thread: wiki_fetch counts cache hits, revalidations, downloads and bytes
+fetched; constituency_table counts pages and rows parsed.
+
+At the end of a run, finish_run() prints a summary and writes a JSON report:
+
+  {
+    "version": 1,
+    "script": "generate_pc_ac_mapping",
+    "started_at": "2024-06-01T10:00:00Z",
+    "argv": [...],
+    "wall_s": 12.3,
+    "peak_rss_kb": 81234,
+    "stages": {"fetch": {"calls": 31, "busy_s": 9.1, "wall_s": 3.2,
+                         "peak_rss_kb": 61234, "hits": 31, "bytes_fetched": 0}, ...},
+    "states": {"AP": {"fetch": {...}, "parse": {"rows_parsed": 175, ...}}, ...},
+    "diffs": {"pcToAcMapping.js": {"added": [...], "moved": [...], ...}}
+  }
+
+Reports go to scripts/.cache/runs/<script>-<timestamp>.json by default, so
+runs can be compared over time. --cprofile PATH also dumps cProfile stats
+(read them with `python -m pstats PATH`).
+"""
+
+import cProfile
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_REPORT_DIR = os.path.join(SCRIPT_DIR, ".cache", "runs")
+REPORT_VERSION = 1
+
+
+def peak_rss_kb():
+    """Process high-water mark RSS in KB (ru_maxrss is bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class RunProfile:
+    """Stage timings and counters for one generator run."""
+
+    def __init__(self, script):
+        self.script = script
+        self.started_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        self._start = time.perf_counter()
+        self.stages = {}   # stage -> {calls, busy_s, first, last, peak_rss_kb, counters...}
+        self.states = {}   # state -> stage -> {calls, busy_s, counters...}
+        self.diffs = {}    # output name -> per-entry diff (see data_diff.py)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.profiler = None
+
+    def _records(self, name, state):
+        record = self.stages.setdefault(name, {"calls": 0, "busy_s": 0.0})
+        if state is None:
+            return (record,)
+        return record, self.states.setdefault(state, {}).setdefault(
+            name, {"calls": 0, "busy_s": 0.0})
+
+    @contextmanager
+    def stage(self, name, state=None):
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append((name, state))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            stack.pop()
+            with self._lock:
+                for record in self._records(name, state):
+                    record["calls"] += 1
+                    record["busy_s"] += end - start
+                record = self.stages[name]
+                record["first"] = min(record.get("first", start), start)
+                record["last"] = max(record.get("last", end), end)
+                record["peak_rss_kb"] = peak_rss_kb()
+
+    def count(self, **counters):
+        """Add counters to the stage (and state) active on this thread."""
+        stack = self._local.__dict__.get("stack")
+        name, state = stack[-1] if stack else ("other", None)
+        with self._lock:
+            for record in self._records(name, state):
+                for key, n in counters.items():
+                    record[key] = record.get(key, 0) + n
+
+    def add_state_time(self, name, state, seconds, **counters):
+        """Credit time measured elsewhere (e.g. in a worker process) to a state."""
+        with self._lock:
+            record = self.states.setdefault(state, {}).setdefault(name, {"calls": 0, "busy_s": 0.0})
+            record["calls"] += 1
+            record["busy_s"] += seconds
+            for key, n in counters.items():
+                record[key] = record.get(key, 0) + n
+
+    def add_diff(self, name, diff):
+        with self._lock:
+            self.diffs[name] = diff
+
+    def report(self):
+        stages = {}
+        for name, record in self.stages.items():
+            record = dict(record)
+            first, last = record.pop("first", None), record.pop("last", None)
+            record["busy_s"] = round(record["busy_s"], 4)
+            record["wall_s"] = round(last - first, 4) if first is not None else 0.0
+            stages[name] = record
+        states = {
+            state: {name: dict(record, busy_s=round(record["busy_s"], 4))
+                    for name, record in by_stage.items()}
+            for state, by_stage in sorted(self.states.items())
+        }
+        return {
+            "version": REPORT_VERSION,
+            "script": self.script,
+            "started_at": self.started_at,
+            "argv": sys.argv[1:],
+            "wall_s": round(time.perf_counter() - self._start, 4),
+            "peak_rss_kb": peak_rss_kb(),
+            "stages": stages,
+            "states": states,
+            "diffs": self.diffs,
+        }
+
+    def print_summary(self, report=None):
+        report = report or self.report()
+        print(f"\nRun profile ({report['wall_s']:.2f}s wall, "
+              f"peak RSS {report['peak_rss_kb'] / 1024:.0f} MB):")
+        print(f"  {'stage':<10} {'calls':>6} {'wall s':>8} {'busy s':>8}  counters")
+        for name, record in report["stages"].items():
+            counters = ", ".join(f"{key} {value}" for key, value in record.items()
+                                 if key not in ("calls", "busy_s", "wall_s", "peak_rss_kb"))
+            print(f"  {name:<10} {record['calls']:>6} {record['wall_s']:>8.2f} "
+                  f"{record['busy_s']:>8.2f}  {counters}")
+        slowest = sorted(((sum(r["busy_s"] for r in by_stage.values()), state)
+                          for state, by_stage in report["states"].items()), reverse=True)
+        if slowest:
+            print("  Slowest states: " + ", ".join(f"{state} {busy:.2f}s"
+                                                 for busy, state in slowest[:5]))
+
+
+_current = RunProfile(None)
+
+
+def current_profile():
+    return _current
+
+
+def stage(name, state=None):
+    """Time a block as `name` (and `state`) in the current run's profile."""
+    return _current.stage(name, state)
+
+
+def count(**counters):
+    _current.count(**counters)
+
+
+def add_state_time(name, state, seconds, **counters):
+    _current.add_state_time(name, state, seconds, **counters)
+
+
+def add_profile_arguments(parser):
+    """Register the run report and cProfile flags shared by the generators."""
+    group = parser.add_argument_group("Profiling")
+    group.add_argument("--report", default=None,
+                       help="JSON run report path (default: scripts/.cache/runs/<script>-<time>.json)")
+    group.add_argument("--cprofile", default=None, metavar="PATH",
+                       help="also write cProfile stats to PATH")
+
+
+def start_run(script, args=None):
+    """Begin profiling a generator run; pair with finish_run()."""
+    global _current
+    _current = RunProfile(script)
+    if args is not None and args.cprofile:
+        _current.profiler = cProfile.Profile()
+        _current.profiler.enable()
+    return _current
+
+
+def finish_run(args=None):
+    """Stop profiling, print the summary and write the JSON report."""
+    profile = _current
+    if profile.profiler is not None:
+        profile.profiler.disable()
+        profile.profiler.dump_stats(args.cprofile)
+        print(f"Wrote cProfile stats to {args.cprofile}")
+    report = profile.report()
+    profile.print_summary(report)
+
+    path = args.report if args is not None and args.report else os.path.join(
+        DEFAULT_REPORT_DIR,
+        f"{profile.script}-{profile.started_at.replace(':', '').replace('-', '')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=1)
+        f.write("\n")
+    print(f"Wrote run report to {path}")
+    return report
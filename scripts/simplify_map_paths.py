@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Generate simplified, integer-quantized level-of-detail variants of the map.
+
+src/data/indiaMapPaths.js holds full-precision (0.1 unit) SVG paths for every
+state and UT, far more detail than IndiaMap.jsx can show at a 460px-wide
+1000×1136 viewBox. This derives smaller variants from it:
+
+  1. Parse each path (M/m/L/l/z) into closed rings of integer tenths.
+  2. Split the rings into arcs at junctions, the points where a border
+     between two states starts or ends, as TopoJSON does. A border shared by
+     two states becomes one arc used by both rings, in opposite directions.
+  3. Simplify each arc once with Douglas–Peucker, keeping its endpoints.
+     Both neighbours see the identical simplified border, so there are no
+     gaps or overlaps along state lines at any tolerance. Two arcs between
+     the same junctions are never both reduced to the same straight segment,
+     which would collapse the sliver between them.
+  4. Round to integer viewBox units and drop repeated points.
+  5. Drop rings that touch no other state (islands, coastal specks) whose
+     area falls below the level's minimum; each state keeps its largest ring.
+
+Each level is written as a module with the same shape as indiaMapPaths.js
+({ name, path, labelX, labelY }), paths as relative commands:
+
+  src/data/indiaMapPathsHigh.js     tolerance 0.3, for large or zoomed maps
+  src/data/indiaMapPathsMedium.js   tolerance 0.8, what IndiaMap.jsx renders
+  src/data/indiaMapPathsLow.js      tolerance 2, for thumbnails
+
+Tolerances and areas are in viewBox units. A table of rings, points, path
+bytes and area error per level is printed and added to the run report.
+
+Usage:
+  python scripts/simplify_map_paths.py
+  python scripts/simplify_map_paths.py --lod medium
+"""
+
+import argparse
+import os
+import re
+import sys
+from collections import namedtuple
+
+from build_manifest import join_lines, write_if_changed
+from run_profile import add_profile_arguments, count, finish_run, stage, start_run
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(SCRIPT_DIR, "..", "src", "data")
+INPUT_PATH = os.path.join(DATA_DIR, "indiaMapPaths.js")
+
+# Source coordinates have one decimal; rings are held in integer tenths
+SCALE = 10
+
+# tolerance: Douglas–Peucker distance; min_area: smallest unshared ring kept
+Lod = namedtuple('Lod', ['name', 'tolerance', 'min_area'])
+LODS = [
+    Lod("high", 0.3, 0.5),
+    Lod("medium", 0.8, 2.0),
+    Lod("low", 2.0, 12.0),
+]
+LODS_BY_NAME = {lod.name: lod for lod in LODS}
+
+# source_bytes: length of the original path string
+MapState = namedtuple('MapState', ['name', 'rings', 'label_x', 'label_y', 'source_bytes'])
+
+_ENTRY_RE = re.compile(
+    r'name: "(?P<name>[^"]*)",\s*path: "(?P<path>[^"]*)",\s*'
+    r'labelX: (?P<x>[-\d.]+), labelY: (?P<y>[-\d.]+),')
+_PATH_TOKEN_RE = re.compile(r'[A-Za-z]|-?(?:\d+\.?\d*|\.\d+)')
+
+
+def lod_output_path(lod):
+    return os.path.join(DATA_DIR, f"indiaMapPaths{lod.name.capitalize()}.js")
+
+
+def parse_path(path):
+    """Closed rings of (x, y) in tenths for an SVG path of M/m/L/l/z commands.
+
+    Each ring is open: its first point is not repeated at the end.
+    """
+    tokens = _PATH_TOKEN_RE.findall(path)
+    rings = []
+    ring = None
+    cmd = None
+    x = y = start_x = start_y = 0
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token.isalpha():
+            cmd = token
+            i += 1
+            if cmd in "Zz":
+                if ring:
+                    rings.append(ring)
+                ring = None
+                x, y = start_x, start_y
+            elif cmd not in "MmLl":
+                raise ValueError(f"unsupported path command {cmd!r}")
+            continue
+        if cmd is None or cmd in "Zz" or i + 1 >= len(tokens):
+            raise ValueError(f"stray coordinate {token!r} in path")
+        dx = round(float(token) * SCALE)
+        dy = round(float(tokens[i + 1]) * SCALE)
+        i += 2
+        if cmd in "ml":
+            dx, dy = x + dx, y + dy
+        x, y = dx, dy
+        if cmd in "Mm":
+            if ring:
+                rings.append(ring)
+            ring = [(x, y)]
+            start_x, start_y = x, y
+            # Further pairs after a moveto are linetos
+            cmd = "l" if cmd == "m" else "L"
+        elif ring is None:
+            raise ValueError("lineto before moveto in path")
+        elif (x, y) != ring[-1]:
+            ring.append((x, y))
+    if ring:
+        rings.append(ring)
+    for ring in rings:
+        if len(ring) > 1 and ring[0] == ring[-1]:
+            ring.pop()
+    return rings
+
+
+def read_map_paths(path=INPUT_PATH):
+    """MapState tuples for every entry of indiaMapPaths.js, in file order."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    states = [MapState(m.group('name'), parse_path(m.group('path')), m.group('x'), m.group('y'),
+                       len(m.group('path')))
+              for m in _ENTRY_RE.finditer(content)]
+    if not states:
+        raise ValueError(f"no map entries found in {path}")
+    return states
+
+
+def ring_area(ring):
+    """Signed shoelace area of an open ring, in its own units squared."""
+    total = 0
+    for i, (x1, y1) in enumerate(ring):
+        x2, y2 = ring[(i + 1) % len(ring)]
+        total += x1 * y2 - x2 * y1
+    return total / 2
+
+
+def find_junctions(rings):
+    """Points where the rings meeting there change.
+
+    A point is a junction when two of its occurrences have different
+    neighbours, e.g. where a coastline meets a land border.
+    """
+    neighbours = {}
+    junctions = set()
+    for ring in rings:
+        n = len(ring)
+        for i, point in enumerate(ring):
+            pair = frozenset((ring[i - 1], ring[(i + 1) % n]))
+            seen = neighbours.setdefault(point, pair)
+            if seen != pair:
+                junctions.add(point)
+    return junctions
+
+
+def canonical_arc(points):
+    """(key, reversed): the arc in a direction shared by both of its users."""
+    key = tuple(points)
+    backwards = key[::-1]
+    return (backwards, True) if backwards < key else (key, False)
+
+
+def canonical_loop(ring):
+    """(key, reversed) for a ring with no junctions, as a closed arc.
+
+    The loop starts at its smallest point and runs in whichever direction
+    gives the smaller tuple, so the same loop always has the same key.
+    """
+    start = ring.index(min(ring))
+    forward = tuple(ring[start:] + ring[:start + 1])
+    backward = forward[::-1]
+    return (backward, True) if backward < forward else (forward, False)
+
+
+class Topology:
+    """Rings as sequences of shared arcs.
+
+    arcs: canonical point tuples; arc_rings: per arc, the (state index, ring
+    index) pairs using it; rings[state index] is a list of rings, each a list
+    of (arc index, reversed).
+    """
+
+    def __init__(self, states):
+        all_rings = [ring for state in states for ring in state.rings]
+        junctions = find_junctions(all_rings)
+        self.arcs = []
+        self.arc_rings = []
+        arc_index = {}
+        self.rings = []
+        for state_no, state in enumerate(states):
+            state_rings = []
+            for ring_no, ring in enumerate(state.rings):
+                parts = []
+                cuts = [i for i, point in enumerate(ring) if point in junctions]
+                if not cuts:
+                    pieces = [canonical_loop(ring)]
+                else:
+                    # Start at the first junction so no arc wraps the ring start
+                    rotated = ring[cuts[0]:] + ring[:cuts[0]]
+                    cuts = [i - cuts[0] for i in cuts] + [len(ring)]
+                    rotated.append(rotated[0])
+                    pieces = [canonical_arc(rotated[a:b + 1]) for a, b in zip(cuts, cuts[1:])]
+                for key, backwards in pieces:
+                    idx = arc_index.get(key)
+                    if idx is None:
+                        idx = arc_index[key] = len(self.arcs)
+                        self.arcs.append(key)
+                        self.arc_rings.append(set())
+                    self.arc_rings[idx].add((state_no, ring_no))
+                    parts.append((idx, backwards))
+                state_rings.append(parts)
+            self.rings.append(state_rings)
+
+    def shared(self, parts):
+        """Whether a ring shares any arc with another ring.
+
+        An arc a ring traces out and back (a spit or a river mouth) is not
+        shared.
+        """
+        return any(len(self.arc_rings[idx]) > 1 for idx, _ in parts)
+
+
+def _segment_distance_sq(point, a, b):
+    """Squared distance from point to segment a-b (a point if a == b)."""
+    (px, py), (ax, ay), (bx, by) = point, a, b
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    if length_sq:
+        t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length_sq))
+        ax, ay = ax + t * dx, ay + t * dy
+    return (px - ax) ** 2 + (py - ay) ** 2
+
+
+def farthest_point(points, first, last):
+    """(index, squared distance) of the point farthest from first-last."""
+    best, best_sq = None, -1.0
+    for i in range(first + 1, last):
+        dist_sq = _segment_distance_sq(points[i], points[first], points[last])
+        if dist_sq > best_sq:
+            best, best_sq = i, dist_sq
+    return best, best_sq
+
+
+def douglas_peucker(points, tolerance):
+    """Indexes of points kept by Douglas–Peucker; the endpoints always are."""
+    keep = {0, len(points) - 1}
+    tolerance_sq = tolerance * tolerance
+    pending = [(0, len(points) - 1)]
+    while pending:
+        first, last = pending.pop()
+        if last - first < 2:
+            continue
+        i, dist_sq = farthest_point(points, first, last)
+        if dist_sq > tolerance_sq:
+            keep.add(i)
+            pending.append((first, i))
+            pending.append((i, last))
+    return sorted(keep)
+
+
+def quantize(points, step=SCALE):
+    """Round grid points to multiples of step, in steps, dropping repeats.
+
+    With the default step, tenths become integer viewBox units.
+    """
+    half = step // 2
+    out = []
+    for x, y in points:
+        point = ((x + half) // step, (y + half) // step)
+        if not out or point != out[-1]:
+            out.append(point)
+    return out
+
+
+def simplify_arcs(topology, tolerance, step=SCALE):
+    """Each arc simplified and quantized (see quantize); endpoints are kept.
+
+    tolerance is in the topology's grid units.
+    """
+    kept = [douglas_peucker(arc, tolerance) for arc in topology.arcs]
+    # Arcs between the same two junctions must not all become the same segment
+    straight = {}
+    for idx, arc in enumerate(topology.arcs):
+        if len(kept[idx]) == 2 and len(arc) > 2:
+            ends = frozenset((arc[0], arc[-1]))
+            if ends in straight:
+                kept[idx] = sorted(kept[idx] + [farthest_point(arc, 0, len(arc) - 1)[0]])
+            else:
+                straight[ends] = idx
+    return [quantize([arc[i] for i in indexes], step) for arc, indexes in zip(topology.arcs, kept)]
+
+
+def assemble_ring(parts, arcs):
+    """An open ring of integer points from (arc index, reversed) parts."""
+    ring = []
+    for idx, backwards in parts:
+        arc = arcs[idx][::-1] if backwards else arcs[idx]
+        ring.extend(arc[1:] if ring else arc)
+    if len(ring) > 1 and ring[0] == ring[-1]:
+        ring.pop()
+    return ring
+
+
+def simplify_states(states, topology, lod, grid=SCALE, scale=1):
+    """[[ring, ...] per state] at one level of detail.
+
+    Rings come in as integers in 1/grid viewBox units and go out in 1/scale
+    units; lod's tolerance and min_area are in viewBox units. Works for any
+    objects with .rings, not just MapState.
+    """
+    arcs = simplify_arcs(topology, lod.tolerance * grid, grid // scale)
+    min_area = lod.min_area * scale * scale
+    out = []
+    for state, ring_parts in zip(states, topology.rings):
+        largest = max(range(len(state.rings)), key=lambda i: abs(ring_area(state.rings[i])))
+        rings = []
+        for i, parts in enumerate(ring_parts):
+            ring = assemble_ring(parts, arcs)
+            if i != largest and not topology.shared(parts) and (
+                    len(ring) < 3 or abs(ring_area(ring)) < min_area):
+                continue
+            if len(ring) >= 2:
+                rings.append(ring)
+        out.append(rings)
+    return out
+
+
+def _coords(values):
+    """Numbers separated as in the source paths: a minus sign needs no space."""
+    text = ""
+    for value in values:
+        if text and value >= 0:
+            text += " "
+        text += str(value)
+    return text
+
+
+def format_path(rings):
+    """SVG path data: M for the first ring, m relative to the last ring's start."""
+    parts = []
+    start = None
+    for ring in rings:
+        x, y = ring[0]
+        if start is None:
+            head = f"M{_coords((x, y))}"
+        else:
+            head = f"m{_coords((x - start[0], y - start[1]))}"
+        start = (x, y)
+        deltas = []
+        for nx, ny in ring[1:]:
+            deltas += [nx - x, ny - y]
+            x, y = nx, ny
+        parts.append(head + (f"l{_coords(deltas)}" if deltas else "") + "z")
+    return " ".join(parts)
+
+
+def render_map_paths_js(states, paths, lod, stats):
+    """Stream one level as a module shaped like indiaMapPaths.js."""
+    yield f"// India state and UT paths, simplified ({lod.name} level of detail)"
+    yield "// Generated by scripts/simplify_map_paths.py from indiaMapPaths.js; see it for the method"
+    yield f"// viewBox: 0 0 1000 1136, integer coordinates, tolerance {lod.tolerance}"
+    yield (f"// {stats['rings']} rings, {stats['points']} points "
+           f"(source: {stats['source_rings']} rings, {stats['source_points']} points)")
+    yield ""
+    yield "const indiaMapPaths = ["
+    for state, path in zip(states, paths):
+        yield "  {"
+        yield f'    name: "{state.name}",'
+        yield f'    path: "{path}",'
+        yield f"    labelX: {state.label_x}, labelY: {state.label_y},"
+        yield "  },"
+    yield "];"
+    yield ""
+    yield "export default indiaMapPaths;"
+    yield ""
+
+
+def area_error(states, lod_rings):
+    """(total, worst, worst state): relative change in ring area.
+
+    total is summed over the whole map; worst is the largest change for one
+    state, which for the tiniest UTs is mostly quantization.
+    """
+    changed = total = worst = 0.0
+    worst_name = None
+    for state, rings in zip(states, lod_rings):
+        before = abs(sum(ring_area(ring) for ring in state.rings)) / (SCALE * SCALE)
+        after = abs(sum(ring_area(ring) for ring in rings))
+        changed += abs(after - before)
+        total += before
+        if before and abs(after - before) / before > worst:
+            worst, worst_name = abs(after - before) / before, state.name
+    return changed / total, worst, worst_name
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate simplified levels of detail of the India map.")
+    parser.add_argument("--input", default=INPUT_PATH, help="source paths module (default: src/data/indiaMapPaths.js)")
+    parser.add_argument("--lod", action="append", choices=sorted(LODS_BY_NAME),
+                        help="level to generate (repeatable; default: all)")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    start_run("simplify_map_paths", args)
+
+    with stage("parse"):
+        states = read_map_paths(args.input)
+    with stage("topology"):
+        topology = Topology(states)
+        shared = sum(1 for users in topology.arc_rings if len(users) > 1)
+        count(arcs=len(topology.arcs), shared_arcs=shared)
+    source_rings = sum(len(state.rings) for state in states)
+    source_points = sum(len(ring) for state in states for ring in state.rings)
+    source_bytes = sum(state.source_bytes for state in states)
+    print(f"Read {len(states)} states: {source_rings} rings, {source_points} points, "
+          f"{len(topology.arcs)} arcs ({shared} shared borders)")
+
+    rows = []
+    for lod in [LODS_BY_NAME[name] for name in args.lod] if args.lod else LODS:
+        with stage("simplify", lod.name):
+            lod_rings = simplify_states(states, topology, lod)
+            paths = [format_path(rings) for rings in lod_rings]
+            stats = {
+                "rings": sum(len(rings) for rings in lod_rings),
+                "points": sum(len(ring) for rings in lod_rings for ring in rings),
+                "source_rings": source_rings,
+                "source_points": source_points,
+            }
+            errors = area_error(states, lod_rings)
+        with stage("emit", lod.name):
+            output = lod_output_path(lod)
+            written = write_if_changed(output, join_lines(render_map_paths_js(states, paths, lod, stats)))
+            path_bytes = sum(len(path) for path in paths)
+            count(rings=stats["rings"], points=stats["points"], path_bytes=path_bytes,
+                  file_bytes=os.path.getsize(output))
+        rows.append((lod, stats, path_bytes, os.path.getsize(output), errors, written))
+
+    print(f"\n  {'level':<8} {'tol':>4} {'rings':>6} {'points':>7} {'path KB':>8} {'file KB':>8} "
+          f"{'area err':>9}  worst state")
+    print(f"  {'source':<8} {'':>4} {source_rings:>6} {source_points:>7} {source_bytes / 1024:>8.1f} "
+          f"{os.path.getsize(args.input) / 1024:>8.1f} {'':>9}")
+    for lod, stats, path_bytes, file_bytes, (error, worst, worst_name), written in rows:
+        print(f"  {lod.name:<8} {lod.tolerance:>4} {stats['rings']:>6} {stats['points']:>7} "
+              f"{path_bytes / 1024:>8.1f} {file_bytes / 1024:>8.1f} {error:>9.2%}  "
+              f"{worst:.1%} {worst_name}{'' if written else '  (unchanged)'}")
+    finish_run(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
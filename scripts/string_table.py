@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Shared string table for the generated src/data modules.
+
+assemblyConstituencies.js, pcToAcMapping.js, pinPrefixIndex.js and
+constituencyIndex.js refer to states, state codes, PC IDs and districts by
+their index in one table, src/data/stringTable.js, instead of repeating the
+strings. The table is built from the canonical store in a fixed order:
+
+  state names, state codes       STATES order
+  PC IDs                         constituencies.js order
+  districts                      sorted
+
+The first three blocks depend only on STATES and constituencies.js, so
+their indexes are stable across runs; only district indexes move when the
+scraped districts change. Writers that refer to districts rewrite the table
+with their output; the others only check that its stable prefix still
+matches (write_string_table(..., stable_only=True)), so generators running
+concurrently never replace each other's district block.
+
+AC IDs are not stored as strings at all: "UP-AC-042" is the number
+<index of "UP"> * AC_KEY_BASE + 42. stringTable.js exports acId(key) to
+turn one back into an ID.
+
+A module's indexes are only valid against the table it was generated with,
+and the district block is rebuilt by whichever writer runs last. So
+stringTable.js records two digests, tableDigest (all strings) and
+stableDigest (the stable prefix), and every dependent module records the
+one it relies on: modules that refer to districts record tableDigest, the
+others stableDigest. The modules do not check them at runtime. Instead
+write_string_table() re-renders, from the canonical store, every module in
+DEPENDENTS whose recorded digest no longer matches the table it has just
+written, and validate_data.py reports any that are still stale
+(stale_modules()). canonical_store's readers refuse to decode a stale
+module (check_table_digest()).
+"""
+
+import importlib
+import os
+import re
+
+from build_manifest import digest, join_lines, write_if_changed
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+STRING_TABLE_PATH = os.path.join(SCRIPT_DIR, "..", "src", "data", "stringTable.js")
+AC_KEY_BASE = 1000
+
+_AC_ID_RE = re.compile(r"^([A-Z]{2})-AC-(\d{3})$")
+_JS_TOKEN_RE = re.compile(r"'((?:[^'\\]|\\.)*)'|(-?\d+)")
+_JS_ESCAPE_RE = re.compile(r"\\(.)")
+_DIGEST_CHECK_RE = re.compile(r"^// Encoded against stringTable\.js (tableDigest|stableDigest) ([0-9a-f]+)$",
+                              re.MULTILINE)
+_DIGEST_EXPORT_RE = re.compile(r"^// (tableDigest|stableDigest) ([0-9a-f]+)$", re.MULTILINE)
+
+# Modules encoded against the table: (file in src/data, generator, stable prefix
+# only). Each generator has render_module(store, table), which returns the
+# module's lines, or None when the store has nothing to render it from.
+DEPENDENTS = (
+    ("assemblyConstituencies.js", "generate_district_mapping", False),
+    ("pcToAcMapping.js", "generate_pc_ac_mapping", True),
+    ("pinPrefixIndex.js", "generate_pin_prefix_index", True),
+    ("pinConstituencies.js", "generate_pin_constituencies", True),
+    ("constituencyIndex.js", "generate_constituency_index", False),
+)
+
+
+class StringTable:
+    """Interns strings, handing out their index in first-seen order."""
+
+    def __init__(self, strings=()):
+        self.strings = []
+        self._index = {}
+        self.stable_size = 0  # length of the run-independent prefix
+        for text in strings:
+            self.ref(text)
+
+    def ref(self, text):
+        idx = self._index.get(text)
+        if idx is None:
+            idx = self._index[text] = len(self.strings)
+            self.strings.append(text)
+        return idx
+
+    def __contains__(self, text):
+        return text in self._index
+
+    def index(self, text):
+        """Index of a string already in the table (KeyError otherwise)."""
+        return self._index[text]
+
+    def ac_key(self, ac_id):
+        """"UP-AC-042" -> index("UP") * AC_KEY_BASE + 42."""
+        code, ac_no = split_ac_id(ac_id)
+        return self._index[code] * AC_KEY_BASE + ac_no
+
+    def ac_id(self, key):
+        return ac_id(self.strings[key // AC_KEY_BASE], key % AC_KEY_BASE)
+
+    def digest(self, stable=False):
+        """Short SHA-256 of the table, or of its stable prefix."""
+        strings = self.strings[:self.stable_size] if stable else self.strings
+        return digest("\n".join(strings))[:10]
+
+
+def ac_id(code, ac_no):
+    return f"{code}-AC-{ac_no:03d}"
+
+
+def split_ac_id(text):
+    """"UP-AC-042" -> ("UP", 42)."""
+    match = _AC_ID_RE.match(text)
+    if not match:
+        raise ValueError(f"not an AC ID: {text!r}")
+    return match.group(1), int(match.group(2))
+
+
+def shared_table(store):
+    """The table for the store's current contents (see the module docstring)."""
+    table = StringTable()
+    states = store.load_states()
+    for state in states:
+        table.ref(state.name)
+    for state in states:
+        table.ref(state.code)
+    for pc in store.load_pcs():
+        table.ref(pc.id)
+    table.stable_size = len(table.strings)
+    for district in sorted({ac.district for ac in store.load_acs() if ac.district}):
+        table.ref(district)
+    return table
+
+
+def js_string(text):
+    return "'" + text.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def js_string_array(name, strings, per_line=8):
+    yield f"const {name} = ["
+    escaped = [js_string(s) for s in strings]
+    for i in range(0, len(escaped), per_line):
+        yield "  " + ",".join(escaped[i:i + per_line]) + ","
+    yield "];"
+
+
+def js_tokens(content, name):
+    """The string and integer literals of `const name = [...]` in a JS file."""
+    start = content.index(f"const {name} = [")
+    end = content.index("\n];", start)
+    tokens = []
+    for line in content[start:end].splitlines()[1:]:
+        if line.lstrip().startswith("//"):
+            continue
+        for match in _JS_TOKEN_RE.finditer(line):
+            if match.group(1) is not None:
+                tokens.append(_JS_ESCAPE_RE.sub(r"\1", match.group(1)))
+            else:
+                tokens.append(int(match.group(2)))
+    return tokens
+
+
+def js_table_import(table, names=(), stable=False):
+    """The stringTable.js import of a dependent module, and its digest.
+
+    names: exports imported besides the default one. stable: the module only
+    refers to the stable prefix, so a new district block leaves it valid.
+    """
+    check = "stableDigest" if stable else "tableDigest"
+    yield (f"import _s, {{ {', '.join(names)} }} from './stringTable';" if names
+           else "import _s from './stringTable';")
+    yield f"// Encoded against stringTable.js {check} {table.digest(stable)}"
+
+
+def render_string_table_js(table):
+    yield "// Shared string table for the generated data modules"
+    yield "// Generated by scripts/string_table.py: states, state codes, PC IDs, then districts"
+    yield f"// {len(table.strings)} strings, first {table.stable_size} stable across runs"
+    yield ""
+    yield from js_string_array("strings", table.strings)
+    yield ""
+    yield f"// AC IDs are stored as numbers: state code index * {AC_KEY_BASE} + AC number"
+    yield "export function acId(key) {"
+    yield (f"  return `${{strings[Math.floor(key / {AC_KEY_BASE})]}}-AC-"
+           f"${{String(key % {AC_KEY_BASE}).padStart(3, '0')}}`;")
+    yield "}"
+    yield ""
+    yield "// Digests recorded by the dependent modules (checked by scripts/validate_data.py)"
+    yield f"// tableDigest {table.digest()}"
+    yield f"// stableDigest {table.digest(stable=True)}"
+    yield ""
+    yield "export default strings;"
+    yield ""
+
+
+def read_string_table_js(path=STRING_TABLE_PATH):
+    with open(path, 'r', encoding='utf-8') as f:
+        return js_tokens(f.read(), "strings")
+
+
+def check_table_digest(content, module, table_path=STRING_TABLE_PATH):
+    """Raise ValueError unless a module's recorded digest matches the table."""
+    match = _DIGEST_CHECK_RE.search(content)
+    if match is None:
+        raise ValueError(f"{module} records no stringTable.js digest")
+    with open(table_path, 'r', encoding='utf-8') as f:
+        exported = dict(_DIGEST_EXPORT_RE.findall(f.read()))
+    kind, recorded = match.groups()
+    if exported.get(kind) != recorded:
+        raise ValueError(f"{module} was generated against another stringTable.js "
+                         f"({kind} {recorded}, table has {exported.get(kind)}); regenerate it")
+
+
+def stale_modules(data_dir, table_path=None):
+    """[(module, problem)] for the modules in data_dir out of date with the table."""
+    table_path = table_path or os.path.join(data_dir, "stringTable.js")
+    stale = []
+    for name in sorted(os.listdir(data_dir)):
+        if not name.endswith(".js") or name == "stringTable.js":
+            continue
+        with open(os.path.join(data_dir, name), 'r', encoding='utf-8') as f:
+            content = f.read()
+        if "from './stringTable'" not in content:
+            continue
+        try:
+            check_table_digest(content, name, table_path)
+        except (OSError, ValueError) as e:
+            stale.append((name, str(e)))
+    return stale
+
+
+def refresh_dependents(store, table, data_dir, skip=()):
+    """Re-render the DEPENDENTS in data_dir that are stale against table.
+
+    skip: modules the caller writes itself. Returns the names rewritten.
+    """
+    table_path = os.path.join(data_dir, "stringTable.js")
+    refreshed = []
+    for name, generator, stable in DEPENDENTS:
+        path = os.path.join(data_dir, name)
+        if name in skip or not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        try:
+            check_table_digest(content, name, table_path)
+            continue
+        except ValueError:
+            pass
+        lines = importlib.import_module(generator).render_module(store, table)
+        if lines is None:
+            print(f"  {name} is stale against stringTable.js and the store cannot rebuild it; "
+                  f"run {generator}.py")
+            continue
+        write_if_changed(path, join_lines(lines))
+        refreshed.append(name)
+    if refreshed:
+        print(f"  Re-encoded against the new stringTable.js: {', '.join(refreshed)}")
+    return refreshed
+
+
+def write_string_table(table, store=None, path=STRING_TABLE_PATH, stable_only=False, own=None):
+    """Write stringTable.js; returns True if it was written.
+
+    With stable_only, an existing table is kept as long as its stable prefix
+    (states, codes, PCs) matches, for writers that never refer to districts.
+    When the table is written and store is given, the other dependent
+    modules next to it are brought up to date (refresh_dependents); own is
+    the module the caller is about to write itself.
+    """
+    if stable_only:
+        try:
+            existing = read_string_table_js(path)
+        except (OSError, ValueError):
+            existing = None
+        if existing is not None and existing[:table.stable_size] == table.strings[:table.stable_size]:
+            return False
+    if not write_if_changed(path, join_lines(render_string_table_js(table))):
+        return False
+    if store is not None:
+        refresh_dependents(store, table, os.path.dirname(path), skip=(own,))
+    return True
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Cross-dataset consistency checks for the generated data.
+
+Loads constituencies.js, assemblyConstituencies.js and pcToAcMapping.js once
+into dict indexes, then checks each invariant in a single pass:
+
+  duplicate_ac      an AC ID appears more than once in assemblyConstituencies.js
+  unknown_pc        pcToAcMapping.js has a PC that constituencies.js lacks
+  unknown_ac        pcToAcMapping.js lists an AC that assemblyConstituencies.js lacks
+  unmapped_pc       a PC in constituencies.js has no ACs
+  unmapped_ac       an AC belongs to no PC
+  multi_pc_ac       an AC belongs to more than one PC
+  state_mismatch    a PC and one of its ACs are in different states
+  state_count       a state's AC count differs from STATES
+  placeholder_name  an AC still has a "<state> AC-N" placeholder name
+  stale_table       a src/data module's string indexes were generated against
+                    another stringTable.js (checked on the JS files, also
+                    with --db)
+
+The report is JSON and deterministic for the same inputs:
+
+  {
+    "version": 1,
+    "inputs": {"constituencies.js": "<sha>", ...},
+    "totals": {"pcs": 543, "acs": 4123, "mapped_pcs": 532, "mapped_acs": 4123},
+    "checks": {"unmapped_pc": {"count": 11, "issues": [{"id": "BR-19", ...}]}, ...},
+    "ok": false
+  }
+
+With --db, the canonical store is checked instead of the JS files.
+
+Some issues are known and accepted (PCs Wikipedia lists under another name,
+a few cross-state mappings). scripts/fixtures/validation_baseline.json lists
+them per check; --strict fails only on issues not in it, so regressions
+fail the pipeline's validate stage while the known ones do not. Refresh it
+with --update-baseline after reviewing the report. stale_table issues are
+never allowed.
+
+Usage:
+  python scripts/validate_data.py
+  python scripts/validate_data.py --db scripts/build/canonical.sqlite
+  python scripts/validate_data.py --strict          # exit 1 on any issue not in the baseline
+  python scripts/validate_data.py --update-baseline # accept the current issues
+  python scripts/validate_data.py --report out.json --limit 20
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+from build_manifest import file_digest, write_if_changed
+from canonical_store import (
+    DATA_DIR, CanonicalStore, read_assembly_js, read_lok_sabha_js, read_pc_to_ac_js,
+)
+from generate_assembly_data import STATES
+from string_table import stale_modules
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_REPORT_PATH = os.path.join(SCRIPT_DIR, ".cache", "validation.json")
+BASELINE_PATH = os.path.join(SCRIPT_DIR, "fixtures", "validation_baseline.json")
+REPORT_VERSION = 1
+
+CHECKS = [
+    "duplicate_ac", "unknown_pc", "unknown_ac", "unmapped_pc", "unmapped_ac",
+    "multi_pc_ac", "state_mismatch", "state_count", "placeholder_name", "stale_table",
+]
+
+# Checks whose issues the baseline may never allow
+NEVER_ALLOWED = ("stale_table",)
+
+PLACEHOLDER_RE = re.compile(r"^(?P<state>.+) AC-(?P<n>\d+)$")
+
+
+def validate(pcs, acs, pc_to_ac, states=STATES):
+    """{check: [issue dict]} for the three datasets.
+
+    pcs: Pc tuples; acs: entry dicts; pc_to_ac: {PC ID: [AC IDs]};
+    states: (code, name, AC count, ...) tuples.
+    """
+    issues = {check: [] for check in CHECKS}
+    pc_by_id = {pc.id: pc for pc in pcs}
+    ac_by_id = {}
+    for e in acs:
+        if e['id'] in ac_by_id:
+            issues["duplicate_ac"].append({"id": e['id'], "name": e['name']})
+        else:
+            ac_by_id[e['id']] = e
+
+    pcs_of_ac = {}
+    for pc_id, ac_ids in pc_to_ac.items():
+        pc = pc_by_id.get(pc_id)
+        if pc is None:
+            issues["unknown_pc"].append({"id": pc_id, "acs": len(ac_ids)})
+        for ac_id in ac_ids:
+            pcs_of_ac.setdefault(ac_id, []).append(pc_id)
+            ac = ac_by_id.get(ac_id)
+            if ac is None:
+                issues["unknown_ac"].append({"id": ac_id, "pc": pc_id})
+            elif pc is not None and ac['state'] != pc.state:
+                issues["state_mismatch"].append(
+                    {"id": ac_id, "pc": pc_id, "ac_state": ac['state'], "pc_state": pc.state})
+
+    for pc in pcs:
+        if not pc_to_ac.get(pc.id):
+            issues["unmapped_pc"].append({"id": pc.id, "name": pc.name, "state": pc.state})
+
+    ac_counts = {}
+    for ac_id, e in ac_by_id.items():
+        ac_counts[e['state']] = ac_counts.get(e['state'], 0) + 1
+        mapped = pcs_of_ac.get(ac_id, ())
+        if not mapped:
+            issues["unmapped_ac"].append({"id": ac_id, "name": e['name'], "state": e['state']})
+        elif len(mapped) > 1:
+            issues["multi_pc_ac"].append({"id": ac_id, "pcs": mapped})
+        match = PLACEHOLDER_RE.match(e['name'])
+        if match and match.group('state') == e['state']:
+            issues["placeholder_name"].append({"id": ac_id, "name": e['name']})
+
+    for code, name, expected, *_ in states:
+        found = ac_counts.get(name, 0)
+        if found != expected:
+            issues["state_count"].append(
+                {"state": code, "name": name, "expected": expected, "found": found})
+    return issues
+
+
+def _issue_key(issue):
+    return json.dumps(issue, sort_keys=True, ensure_ascii=False)
+
+
+def load_baseline(path):
+    """{check: set of issue keys} the baseline allows; empty if there is none."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            allowed = json.load(f)["allowed"]
+    except (OSError, ValueError, KeyError):
+        return {}
+    return {check: {_issue_key(issue) for issue in found}
+            for check, found in allowed.items() if check not in NEVER_ALLOWED}
+
+
+def write_baseline(path, issues):
+    allowed = {check: sorted(found, key=_issue_key) for check, found in issues.items()
+               if found and check not in NEVER_ALLOWED}
+    write_if_changed(path, json.dumps({"version": REPORT_VERSION, "allowed": allowed},
+                                      indent=1, sort_keys=True, ensure_ascii=False) + "\n")
+
+
+def new_issues(issues, baseline):
+    """{check: [issue]} for the issues the baseline does not allow."""
+    return {check: [issue for issue in found if _issue_key(issue) not in baseline.get(check, ())]
+            for check, found in issues.items()}
+
+
+def build_report(issues, inputs, totals, limit=None, new=None):
+    """The JSON report; limit caps the issues listed per check (counts stay exact).
+
+    new: new_issues() of issues; "new" counts them and "ok" ignores the rest.
+    """
+    new = issues if new is None else new
+    return {
+        "version": REPORT_VERSION,
+        "inputs": inputs,
+        "totals": totals,
+        "checks": {check: {"count": len(found), "new": len(new[check]),
+                           "issues": found if limit is None else found[:limit]}
+                   for check, found in issues.items()},
+        "ok": not any(new.values()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the generated datasets against each other.")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="directory with the JS data files")
+    parser.add_argument("--db", default=None, help="check this canonical store instead of the JS files")
+    parser.add_argument("--report", default=DEFAULT_REPORT_PATH,
+                        help="JSON report path (default: scripts/.cache/validation.json)")
+    parser.add_argument("--limit", type=int, default=None,
+                        help="list at most this many issues per check in the report")
+    parser.add_argument("--strict", action="store_true",
+                        help="exit with an error on any issue the baseline does not allow")
+    parser.add_argument("--baseline", default=BASELINE_PATH,
+                        help="known issues to allow (default: scripts/fixtures/validation_baseline.json)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write this run's issues as the new baseline")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.db:
+        paths = {os.path.basename(args.db): args.db}
+        store = CanonicalStore(args.db)
+        pcs, acs, pc_to_ac = store.load_pcs(), store.load_ac_entries(), store.load_pc_to_ac()
+        store.close()
+    else:
+        paths = {name: os.path.join(args.data_dir, name) for name in
+                 ("constituencies.js", "assemblyConstituencies.js", "pcToAcMapping.js")}
+        pcs = read_lok_sabha_js(paths["constituencies.js"])
+        try:
+            acs = read_assembly_js(paths["assemblyConstituencies.js"])
+            pc_to_ac = read_pc_to_ac_js(paths["pcToAcMapping.js"])
+        except ValueError as e:
+            # Indexes into the wrong string table cannot be decoded at all
+            sys.exit(f"Cannot load the JS datasets: {e}")
+    loaded = time.perf_counter()
+    issues = validate(pcs, acs, pc_to_ac)
+    issues["stale_table"] = [{"module": module, "problem": problem}
+                             for module, problem in stale_modules(args.data_dir)]
+    checked = time.perf_counter()
+
+    totals = {"pcs": len(pcs), "acs": len(acs), "mapped_pcs": len(pc_to_ac),
+              "mapped_acs": sum(len(ac_ids) for ac_ids in pc_to_ac.values())}
+    if args.update_baseline:
+        write_baseline(args.baseline, issues)
+        print(f"Wrote baseline to {args.baseline}")
+    new = new_issues(issues, load_baseline(args.baseline))
+    report = build_report(issues, {name: file_digest(path) for name, path in paths.items()},
+                          totals, args.limit, new)
+    write_if_changed(args.report, json.dumps(report, indent=1, ensure_ascii=False) + "\n")
+
+    print(f"Validated {totals['pcs']} PCs, {totals['acs']} ACs, {totals['mapped_pcs']} mapped PCs "
+          f"(load {(loaded - start) * 1000:.0f} ms, checks {(checked - loaded) * 1000:.0f} ms)")
+    for check in CHECKS:
+        found = issues[check]
+        allowed = len(found) - len(new[check])
+        print(f"  {check:<17} {'ok' if not found else len(found)}"
+              + (f" ({allowed} allowed by baseline)" if allowed else ""))
+        shown = new[check] or found
+        for issue in shown[:3]:
+            print(f"    {json.dumps(issue, ensure_ascii=False)}")
+        if len(shown) > 3:
+            print(f"    ... and {len(shown) - 3} more{' new' if new[check] else ''}")
+    print(f"Wrote {args.report}")
+    return 1 if args.strict and not report["ok"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
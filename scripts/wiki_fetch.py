@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Shared Wikipedia fetch layer with an on-disk HTTP cache.
+
+All generator scripts fetch the same "List of constituencies" pages. This module
+keeps one content-addressed cache for all of them:
+
+  <cache_dir>/index.json        URL -> {sha256, etag, last_modified, fetched_at, ...}
+  <cache_dir>/objects/ab/abcd…  page bodies, named by the SHA-256 of their bytes
+
+A cached page younger than the TTL is served without touching the network. Older
+pages are revalidated with If-None-Match / If-Modified-Since, so an unchanged page
+costs one 304 response. The objects directory is kept under a size budget by
+evicting the least recently used pages.
+
+Offline mode serves only from the cache (regardless of age) and never opens a
+connection, so the data pipeline can be rebuilt on a machine without network.
+
+Network requests go through one token bucket kept next to the cache
+(<cache_dir>/ratelimit.json, under a file lock), so scraping states
+concurrently (see map_states), or running several generators at once (see
+pipeline.py), still holds one global requests-per-second limit.
+
+Configuration comes from command-line flags (see add_fetch_arguments) or the
+environment: JANAWAAZ_CACHE_DIR, JANAWAAZ_CACHE_TTL, JANAWAAZ_CACHE_MAX_MB,
+JANAWAAZ_OFFLINE=1, JANAWAAZ_RPS.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import urllib.error
+import urllib.request
+
+from build_manifest import file_lock
+from run_profile import count as profile_count
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+WIKI_BASE_URL = "https://en.wikipedia.org/wiki/"
+USER_AGENT = "Mozilla/5.0"
+
+DEFAULT_CACHE_DIR = os.path.join(SCRIPT_DIR, ".cache", "wiki")
+DEFAULT_TTL = 7 * 24 * 3600          # seconds before a cached page is revalidated
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_RPS = 1.0                    # be nice to Wikipedia: global network requests/sec
+DEFAULT_BURST = 2
+DEFAULT_WORKERS = 4
+
+
+class TokenBucket:
+    """Thread-safe token bucket holding a global request rate.
+
+    Up to `burst` requests may start back to back; after that callers are
+    spaced 1/rate seconds apart, no matter how many threads are waiting.
+    """
+
+    def __init__(self, rate=DEFAULT_RPS, burst=DEFAULT_BURST):
+        self.rate = rate
+        self.capacity = max(1.0, float(burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SharedTokenBucket(TokenBucket):
+    """TokenBucket whose state lives in a file, shared by every process using it.
+
+    The token count and its timestamp (wall clock, comparable across
+    processes) are read and written under file_lock, so generators running
+    side by side draw from one bucket instead of each getting the full rate.
+    """
+
+    def __init__(self, state_path, rate=DEFAULT_RPS, burst=DEFAULT_BURST):
+        super().__init__(rate, burst)
+        self.state_path = state_path
+
+    def _load(self, now):
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return float(state["tokens"]), min(float(state["updated"]), now)
+        except (OSError, ValueError, KeyError, TypeError):
+            return self.capacity, now
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock, file_lock(self.state_path):
+                now = time.time()
+                tokens, updated = self._load(now)
+                tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+                taken = tokens >= 1
+                if taken:
+                    tokens -= 1
+                with open(self.state_path, 'w', encoding='utf-8') as f:
+                    json.dump({"tokens": tokens, "updated": now}, f)
+                wait = 0 if taken else (1 - tokens) / self.rate
+            if taken:
+                return
+            time.sleep(wait)
+
+
+class PageCache:
+    """Content-addressed on-disk cache for fetched pages."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL,
+                 max_bytes=DEFAULT_MAX_BYTES, offline=False, rate_limiter=None):
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "bytes_fetched": 0}
+        self.rate_limiter = rate_limiter or TokenBucket()
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+        self._touched = set()  # URLs whose entries this process changed
+
+    # -- index -------------------------------------------------------------
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        """Write the index, merging entries other processes saved meanwhile.
+
+        Only URLs this process fetched, touched or evicted override the copy
+        on disk, so generators sharing the cache concurrently do not drop
+        each other's pages.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with file_lock(self.index_path):
+            index = self._load_index()
+            for url in self._touched:
+                if url in self._index:
+                    index[url] = self._index[url]
+                else:
+                    index.pop(url, None)
+            tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+        self._index = index
+
+    def _object_path(self, sha):
+        return os.path.join(self.objects_dir, sha[:2], sha)
+
+    def _read_object(self, sha):
+        try:
+            with open(self._object_path(sha), 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+        # Guard against truncated or tampered objects
+        if hashlib.sha256(body).hexdigest() != sha:
+            return None
+        return body
+
+    def _write_object(self, body):
+        sha = hashlib.sha256(body).hexdigest()
+        path = self._object_path(sha)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        return sha
+
+    # -- eviction ----------------------------------------------------------
+
+    def _evict(self):
+        """Drop least recently used pages until the objects fit in max_bytes."""
+        sizes = {}
+        for entry in self._index.values():
+            sizes[entry['sha256']] = entry.get('size', 0)
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+
+        by_age = sorted(self._index.items(), key=lambda kv: kv[1].get('last_access', 0))
+        for url, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            del self._index[url]
+            self._touched.add(url)
+            sha = entry['sha256']
+            if any(e['sha256'] == sha for e in self._index.values()):
+                continue  # Another URL still references these bytes
+            try:
+                os.remove(self._object_path(sha))
+            except OSError:
+                pass
+            total -= sizes.get(sha, 0)
+
+    # -- fetching ----------------------------------------------------------
+
+    def _request(self, url, entry):
+        """Perform one HTTP GET. Returns (status, body, headers)."""
+        headers = {"User-Agent": USER_AGENT}
+        if entry:
+            if entry.get('etag'):
+                headers["If-None-Match"] = entry['etag']
+            if entry.get('last_modified'):
+                headers["If-Modified-Since"] = entry['last_modified']
+        req = urllib.request.Request(url, headers=headers)
+        self.rate_limiter.acquire()
+        try:
+            with urllib.request.urlopen(req, timeout=20) as resp:
+                return resp.status, resp.read(), resp.headers
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return 304, None, e.headers
+            raise
+
+    def fetch(self, url, retries=3):
+        """Return the body of url as bytes, or None if unavailable."""
+        now = time.time()
+        with self._lock:
+            entry = self._index.get(url)
+            cached = self._read_object(entry['sha256']) if entry else None
+            if cached is None:
+                entry = None
+
+            if entry and (self.offline or now - entry['fetched_at'] < self.ttl):
+                entry['last_access'] = now
+                self._touched.add(url)
+                self.stats['hits'] += 1
+                profile_count(cache_hits=1)
+                return cached
+
+        if self.offline:
+            print(f"    Offline: {url} is not cached")
+            profile_count(fetch_failures=1)
+            return None
+
+        for attempt in range(retries):
+            try:
+                status, body, headers = self._request(url, entry)
+                break
+            except Exception as e:
+                if attempt < retries - 1:
+                    print(f"    Retry {attempt + 1}/{retries} for {url}: {e}")
+                    time.sleep(2)
+                elif cached is not None:
+                    print(f"    Failed to revalidate {url}, serving stale copy: {e}")
+                    profile_count(stale_served=1)
+                    return cached
+                else:
+                    print(f"  Failed to fetch {url}: {e}")
+                    profile_count(fetch_failures=1)
+                    return None
+
+        with self._lock:
+            if status == 304:
+                self.stats['revalidated'] += 1
+                profile_count(cache_revalidated=1)
+                entry['fetched_at'] = now
+                entry['last_access'] = now
+                self._touched.add(url)
+                self._save_index()
+                return cached
+
+            self.stats['misses'] += 1
+            self.stats['bytes_fetched'] += len(body)
+            profile_count(downloads=1, bytes_fetched=len(body))
+            sha = self._write_object(body)
+            self._index[url] = {
+                'sha256': sha,
+                'size': len(body),
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'fetched_at': now,
+                'last_access': now,
+            }
+            self._touched.add(url)
+            self._evict()
+            self._save_index()
+            return body
+
+    def digest(self, url):
+        """Return the SHA-256 of the cached body for url, if any."""
+        entry = self._index.get(url)
+        return entry['sha256'] if entry else None
+
+    def fresh_digest(self, url):
+        """SHA-256 of url's cached body if a fetch now would not touch the
+        network (cached within the TTL, or offline), else None."""
+        entry = self._index.get(url)
+        if entry and (self.offline or time.time() - entry['fetched_at'] < self.ttl):
+            return entry['sha256']
+        return None
+
+    def flush(self):
+        """Persist access times recorded by cache hits."""
+        with self._lock:
+            if self._index:
+                self._save_index()
+
+
+_default_cache = None
+
+
+def configure(cache_dir=None, ttl=None, max_bytes=None, offline=None, rps=None):
+    """Set up the process-wide cache used by fetch_wiki_page."""
+    global _default_cache
+    env = os.environ
+    if cache_dir is None:
+        cache_dir = env.get("JANAWAAZ_CACHE_DIR", DEFAULT_CACHE_DIR)
+    if ttl is None:
+        ttl = float(env.get("JANAWAAZ_CACHE_TTL", DEFAULT_TTL))
+    if max_bytes is None:
+        max_mb = env.get("JANAWAAZ_CACHE_MAX_MB")
+        max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+    if offline is None:
+        offline = env.get("JANAWAAZ_OFFLINE", "") not in ("", "0")
+    if rps is None:
+        rps = float(env.get("JANAWAAZ_RPS", DEFAULT_RPS))
+    limiter = SharedTokenBucket(os.path.join(cache_dir, "ratelimit.json"), rps, max(DEFAULT_BURST, rps))
+    _default_cache = PageCache(cache_dir, ttl, max_bytes, offline, rate_limiter=limiter)
+    return _default_cache
+
+
+def get_cache():
+    if _default_cache is None:
+        configure()
+    return _default_cache
+
+
+def wiki_url(slug):
+    return f"{WIKI_BASE_URL}{slug}"
+
+
+def fetch_wiki_page(slug, retries=3):
+    """Fetch raw HTML for a Wikipedia page, going through the shared cache."""
+    body = get_cache().fetch(wiki_url(slug), retries=retries)
+    if body is None:
+        return None
+    return body.decode("utf-8", errors="replace")
+
+
+def map_states(fn, states, workers=DEFAULT_WORKERS):
+    """Apply fn to every state config on a bounded thread pool.
+
+    Results come back in the same order as `states`, whatever order the
+    workers finish in, so generated output stays deterministic. Network
+    politeness is enforced by the cache's token bucket, not by sleeping here.
+    """
+    states = list(states)
+    if workers <= 1:
+        return [fn(s) for s in states]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, states))
+
+
+def add_fetch_arguments(parser):
+    """Register the cache and concurrency flags shared by all generator scripts."""
+    group = parser.add_argument_group("Wikipedia cache")
+    group.add_argument("--offline", action="store_true", default=None,
+                       help="serve pages only from the local cache, never hit the network")
+    group.add_argument("--cache-dir", default=None,
+                       help="cache directory (default: scripts/.cache/wiki)")
+    group.add_argument("--cache-ttl", type=float, default=None,
+                       help="seconds before a cached page is revalidated (default: 7 days)")
+    group.add_argument("--cache-max-mb", type=float, default=None,
+                       help="evict least recently used pages beyond this size (default: 256)")
+
+    group = parser.add_argument_group("Scraping")
+    group.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                       help=f"states fetched concurrently (default: {DEFAULT_WORKERS})")
+    group.add_argument("--jobs", type=int, default=1,
+                       help="processes parsing pages in parallel (default: 1, parse in-process)")
+    group.add_argument("--rps", type=float, default=None,
+                       help=f"global network requests per second (default: {DEFAULT_RPS:g})")
+
+
+def configure_from_args(args):
+    max_bytes = None
+    if args.cache_max_mb is not None:
+        max_bytes = int(args.cache_max_mb * 1024 * 1024)
+    return configure(cache_dir=args.cache_dir, ttl=args.cache_ttl,
+                     max_bytes=max_bytes, offline=args.offline, rps=args.rps)
+
+
+def print_cache_stats():
+    cache = get_cache()
+    cache.flush()
+    s = cache.stats
+    print(f"\nCache: {s['hits']} hits, {s['revalidated']} revalidated, "
+          f"{s['misses']} downloaded ({s['bytes_fetched'] / 1024:.0f} KB)")
@@ -1,5 +1,5 @@
 import { useState, useMemo } from 'react';
-import indiaMapPaths from '../data/indiaMapPaths';
+import indiaMapPaths from '../data/indiaMapPathsMedium';
 
 const styles = {
   container: {
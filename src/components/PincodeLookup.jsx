@@ -4,7 +4,8 @@ import { Search, MapPin, ChevronRight } from 'lucide-react';
 import { useApp } from '../context/AppContext';
 import constituencies from '../data/constituencies';
 import assemblyConstituencies from '../data/assemblyConstituencies';
-import pcToAcMapping from '../data/pcToAcMapping';
+import pinPrefixIndex from '../data/pinPrefixIndex';
+import { pcForAc } from '../data/constituencyIndex';
 import { CONSTITUENCY_TYPES } from '../utils/constituencyHelpers';
 
 const styles = {
@@ -149,7 +150,9 @@ const styles = {
   },
 };
 
-// Build AC lookup by ID for fast access
+// Build PC and AC lookups by ID for fast access
+const pcById = {};
+constituencies.forEach(c => { pcById[c.id] = c; });
 const acById = {};
 assemblyConstituencies.forEach(c => { acById[c.id] = c; });
 
@@ -164,53 +167,26 @@ export default function PincodeLookup() {
   const isVidhanSabha = constituencyType === CONSTITUENCY_TYPES.VIDHAN_SABHA;
   const activeDataset = isVidhanSabha ? assemblyConstituencies : constituencies;
 
+  // Precomputed by scripts/generate_pin_prefix_index.py:
+  // [PC IDs, [[PC ID, AC IDs sorted by state, then name], ...]]
+  const prefixEntry = pincode.length >= 3 ? pinPrefixIndex[pincode.slice(0, 3)] : undefined;
+
   // For Lok Sabha: direct PIN → constituency match via pinRanges
-  const lokSabhaMatches = useMemo(() => {
-    if (pincode.length < 3) return [];
-    const prefix = pincode.slice(0, 3);
-    return constituencies.filter(c =>
-      c.pinRanges.some(range => range === prefix)
-    );
-  }, [pincode]);
+  const lokSabhaMatches = useMemo(
+    () => (prefixEntry ? prefixEntry[0].map(id => pcById[id]) : []),
+    [prefixEntry]
+  );
 
   // For Vidhan Sabha: PIN → Lok Sabha PCs → Assembly Constituencies
   // Each Lok Sabha PC is composed of 5-9 specific Assembly Constituencies
   const vidhanSabhaMatches = useMemo(() => {
-    if (pincode.length < 3 || lokSabhaMatches.length === 0) return [];
-
-    // Collect all AC IDs from matched Lok Sabha constituencies
-    const acIds = new Set();
-    lokSabhaMatches.forEach(pc => {
-      const acs = pcToAcMapping[pc.id];
-      if (acs) {
-        acs.forEach(acId => acIds.add(acId));
-      }
-    });
-
-    // Look up full AC objects
-    const results = [];
-    acIds.forEach(acId => {
-      const ac = acById[acId];
-      if (ac) results.push(ac);
-    });
-
-    // Sort by state, then name
-    results.sort((a, b) => a.state.localeCompare(b.state) || a.name.localeCompare(b.name));
-    return results;
-  }, [pincode, lokSabhaMatches]);
-
-  // Build a reverse mapping for display: AC ID → PC name
-  const acToPcName = useMemo(() => {
-    if (!isVidhanSabha || lokSabhaMatches.length === 0) return {};
-    const map = {};
-    lokSabhaMatches.forEach(pc => {
-      const acs = pcToAcMapping[pc.id];
-      if (acs) {
-        acs.forEach(acId => { map[acId] = pc.name; });
-      }
+    if (!prefixEntry) return [];
+    const ids = new Set();
+    prefixEntry[1].forEach(([, acIds]) => {
+      acIds.forEach(acId => ids.add(acId));
     });
-    return map;
-  }, [isVidhanSabha, lokSabhaMatches]);
+    return [...ids].map(id => acById[id]).filter(Boolean);
+  }, [prefixEntry]);
 
   const matches = isVidhanSabha ? vidhanSabhaMatches : lokSabhaMatches;
   const hasResults = matches.length > 0;
@@ -235,7 +211,8 @@ export default function PincodeLookup() {
   const groupByPC = (list) => {
     const grouped = {};
     list.forEach(c => {
-      const pcName = acToPcName[c.id] || c.state;
+      const pcId = pcForAc(c.id);
+      const pcName = pcId ? pcById[pcId].name : c.state;
       if (!grouped[pcName]) grouped[pcName] = [];
       grouped[pcName].push(c);
     });
@@ -1,4162 +1,788 @@
 // India's Vidhan Sabha (State Assembly) constituencies
 // Data compiled from Election Commission of India records
 // Total: 4123 constituencies across 31 states/UTs
+// Dictionary-encoded against stringTable.js; decoded once below
 
-const assemblyConstituencies = [
+import _s from './stringTable';
+// Encoded against stringTable.js tableDigest 05cb28c7c3
+
+// Per AC, in order: name, district (string index, -1 if unknown)
+const _a = [
   // Andhra Pradesh (175)
-  { id: "AP-AC-001", name: 'Srikakulam', state: 'Andhra Pradesh', district: 'Srikakulam', acNo: 1 },
-  { id: "AP-AC-002", name: 'Vizianagaram', state: 'Andhra Pradesh', district: 'Srikakulam', acNo: 2 },
-  { id: "AP-AC-003", name: 'Parvathipuram Manyam', state: 'Andhra Pradesh', district: 'Srikakulam', acNo: 3 },
-  { id: "AP-AC-004", name: 'Visakhapatnam', state: 'Andhra Pradesh', district: 'Srikakulam', acNo: 4 },
-  { id: "AP-AC-005", name: 'Anakapalli', state: 'Andhra Pradesh', district: 'Srikakulam', acNo: 5 },
-  { id: "AP-AC-006", name: 'Alluri Sitharama Raju', state: 'Andhra Pradesh', district: 'Srikakulam', acNo: 6 },
-  { id: "AP-AC-007", name: 'Kakinada', state: 'Andhra Pradesh', district: 'Srikakulam', acNo: 7 },
-  { id: "AP-AC-008", name: 'East Godavari', state: 'Andhra Pradesh', district: 'Srikakulam', acNo: 8 },
-  { id: "AP-AC-009", name: 'Konaseema', state: 'Andhra Pradesh', district: 'Vizianagaram', acNo: 9 },
-  { id: "AP-AC-010", name: 'West Godavari', state: 'Andhra Pradesh', district: 'Parvathipuram Manyam', acNo: 10 },
-  { id: "AP-AC-011", name: 'Eluru', state: 'Andhra Pradesh', district: 'Parvathipuram Manyam', acNo: 11 },
-  { id: "AP-AC-012", name: 'NTR', state: 'Andhra Pradesh', district: 'Parvathipuram Manyam', acNo: 12 },
-  { id: "AP-AC-013", name: 'Krishna', state: 'Andhra Pradesh', district: 'Parvathipuram Manyam', acNo: 13 },
-  { id: "AP-AC-014", name: 'Guntur', state: 'Andhra Pradesh', district: 'Vizianagaram', acNo: 14 },
-  { id: "AP-AC-015", name: 'Palnadu', state: 'Andhra Pradesh', district: 'Vizianagaram', acNo: 15 },
-  { id: "AP-AC-016", name: 'Bapatla', state: 'Andhra Pradesh', district: 'Vizianagaram', acNo: 16 },
-  { id: "AP-AC-017", name: 'Prakasam', state: 'Andhra Pradesh', district: 'Vizianagaram', acNo: 17 },
-  { id: "AP-AC-018", name: 'Nellore', state: 'Andhra Pradesh', district: 'Vizianagaram', acNo: 18 },
-  { id: "AP-AC-019", name: 'Tirupati', state: 'Andhra Pradesh', district: 'Vizianagaram', acNo: 19 },
-  { id: "AP-AC-020", name: 'Chittoor', state: 'Andhra Pradesh', district: 'Visakhapatnam', acNo: 20 },
-  { id: "AP-AC-021", name: 'Annamayya', state: 'Andhra Pradesh', district: 'Visakhapatnam', acNo: 21 },
-  { id: "AP-AC-022", name: 'YSR Kadapa', state: 'Andhra Pradesh', district: 'Visakhapatnam', acNo: 22 },
-  { id: "AP-AC-023", name: 'Nandyal', state: 'Andhra Pradesh', district: 'Visakhapatnam', acNo: 23 },
-  { id: "AP-AC-024", name: 'Kurnool', state: 'Andhra Pradesh', district: 'Visakhapatnam', acNo: 24 },
-  { id: "AP-AC-025", name: 'Ananthapuramu', state: 'Andhra Pradesh', district: 'Visakhapatnam', acNo: 25 },
-  { id: "AP-AC-026", name: 'Sri Sathya Sai', state: 'Andhra Pradesh', district: 'Anakapalli', acNo: 26 },
-  { id: "AP-AC-027", name: 'Polavaram', state: 'Andhra Pradesh', district: 'Anakapalli', acNo: 27 },
-  { id: "AP-AC-028", name: 'Markapuram', state: 'Andhra Pradesh', district: 'Alluri Sitharama Raju', acNo: 28 },
-  { id: "AP-AC-029", name: 'Paderu', state: 'Andhra Pradesh', district: 'Alluri Sitharama Raju', acNo: 29 },
-  { id: "AP-AC-030", name: 'Anakapalle', state: 'Andhra Pradesh', district: 'Anakapalli', acNo: 30 },
-  { id: "AP-AC-031", name: 'Pendurthi', state: 'Andhra Pradesh', district: 'Anakapalli', acNo: 31 },
-  { id: "AP-AC-032", name: 'Elamanchili', state: 'Andhra Pradesh', district: 'Anakapalli', acNo: 32 },
-  { id: "AP-AC-033", name: 'Payakaraopet', state: 'Andhra Pradesh', district: 'Anakapalli', acNo: 33 },
-  { id: "AP-AC-034", name: 'Narsipatnam', state: 'Andhra Pradesh', district: 'Anakapalli', acNo: 34 },
-  { id: "AP-AC-035", name: 'Tuni', state: 'Andhra Pradesh', district: 'Kakinada', acNo: 35 },
-  { id: "AP-AC-036", name: 'Prathipadu', state: 'Andhra Pradesh', district: 'Kakinada', acNo: 36 },
-  { id: "AP-AC-037", name: 'Pithapuram', state: 'Andhra Pradesh', district: 'Kakinada', acNo: 37 },
-  { id: "AP-AC-038", name: 'Kakinada Rural', state: 'Andhra Pradesh', district: 'Kakinada', acNo: 38 },
-  { id: "AP-AC-039", name: 'Peddapuram', state: 'Andhra Pradesh', district: 'Kakinada', acNo: 39 },
-  { id: "AP-AC-040", name: 'Anaparthy', state: 'Andhra Pradesh', district: 'East Godavari', acNo: 40 },
-  { id: "AP-AC-041", name: 'Kakinada City', state: 'Andhra Pradesh', district: 'Kakinada', acNo: 41 },
-  { id: "AP-AC-042", name: 'Ramachandrapuram', state: 'Andhra Pradesh', district: 'Konaseema', acNo: 42 },
-  { id: "AP-AC-043", name: 'Mummidivaram', state: 'Andhra Pradesh', district: 'Konaseema', acNo: 43 },
-  { id: "AP-AC-044", name: 'Amalapuram', state: 'Andhra Pradesh', district: 'Konaseema', acNo: 44 },
-  { id: "AP-AC-045", name: 'Razole', state: 'Andhra Pradesh', district: 'Konaseema', acNo: 45 },
-  { id: "AP-AC-046", name: 'Gannavaram', state: 'Andhra Pradesh', district: 'Konaseema', acNo: 46 },
-  { id: "AP-AC-047", name: 'Kothapeta', state: 'Andhra Pradesh', district: 'Konaseema', acNo: 47 },
-  { id: "AP-AC-048", name: 'Mandapeta', state: 'Andhra Pradesh', district: 'Konaseema', acNo: 48 },
-  { id: "AP-AC-049", name: 'Rajanagaram', state: 'Andhra Pradesh', district: 'East Godavari', acNo: 49 },
-  { id: "AP-AC-050", name: 'Rajahmundry City', state: 'Andhra Pradesh', district: 'East Godavari', acNo: 50 },
-  { id: "AP-AC-051", name: 'Rajahmundry Rural', state: 'Andhra Pradesh', district: 'East Godavari', acNo: 51 },
-  { id: "AP-AC-052", name: 'Jaggampeta', state: 'Andhra Pradesh', district: 'Kakinada', acNo: 52 },
-  { id: "AP-AC-053", name: 'Rampachodavaram', state: 'Andhra Pradesh', district: 'Polavaram', acNo: 53 },
-  { id: "AP-AC-054", name: 'Kovvur', state: 'Andhra Pradesh', district: 'East Godavari', acNo: 54 },
-  { id: "AP-AC-055", name: 'Nidadavole', state: 'Andhra Pradesh', district: 'East Godavari', acNo: 55 },
-  { id: "AP-AC-056", name: 'Achanta', state: 'Andhra Pradesh', district: 'West Godavari', acNo: 56 },
-  { id: "AP-AC-057", name: 'Palakollu', state: 'Andhra Pradesh', district: 'West Godavari', acNo: 57 },
-  { id: "AP-AC-058", name: 'Narasapuram', state: 'Andhra Pradesh', district: 'West Godavari', acNo: 58 },
-  { id: "AP-AC-059", name: 'Bhimavaram', state: 'Andhra Pradesh', district: 'West Godavari', acNo: 59 },
-  { id: "AP-AC-060", name: 'Undi', state: 'Andhra Pradesh', district: 'West Godavari', acNo: 60 },
-  { id: "AP-AC-061", name: 'Tanuku', state: 'Andhra Pradesh', district: 'West Godavari', acNo: 61 },
-  { id: "AP-AC-062", name: 'Tadepalligudem', state: 'Andhra Pradesh', district: 'West Godavari', acNo: 62 },
-  { id: "AP-AC-063", name: 'Unguturu', state: 'Andhra Pradesh', district: 'Eluru', acNo: 63 },
-  { id: "AP-AC-064", name: 'Denduluru', state: 'Andhra Pradesh', district: 'Eluru', acNo: 64 },
-  { id: "AP-AC-065", name: 'Eluru', state: 'Andhra Pradesh', district: 'Eluru', acNo: 65 },
-  { id: "AP-AC-066", name: 'Gopalapuram', state: 'Andhra Pradesh', district: 'East Godavari', acNo: 66 },
-  { id: "AP-AC-067", name: 'Polavaram', state: 'Andhra Pradesh', district: 'Eluru', acNo: 67 },
-  { id: "AP-AC-068", name: 'Chintalapudi', state: 'Andhra Pradesh', district: 'Eluru', acNo: 68 },
-  { id: "AP-AC-069", name: 'Tiruvuru', state: 'Andhra Pradesh', district: 'NTR', acNo: 69 },
-  { id: "AP-AC-070", name: 'Nuzvid', state: 'Andhra Pradesh', district: 'Eluru', acNo: 70 },
-  { id: "AP-AC-071", name: 'Gannavaram', state: 'Andhra Pradesh', district: 'Krishna', acNo: 71 },
-  { id: "AP-AC-072", name: 'Gudivada', state: 'Andhra Pradesh', district: 'Krishna', acNo: 72 },
-  { id: "AP-AC-073", name: 'Kaikalur', state: 'Andhra Pradesh', district: 'Eluru', acNo: 73 },
-  { id: "AP-AC-074", name: 'Pedana', state: 'Andhra Pradesh', district: 'Krishna', acNo: 74 },
-  { id: "AP-AC-075", name: 'Machilipatnam', state: 'Andhra Pradesh', district: 'Krishna', acNo: 75 },
-  { id: "AP-AC-076", name: 'Avanigadda', state: 'Andhra Pradesh', district: 'Krishna', acNo: 76 },
-  { id: "AP-AC-077", name: 'Pamarru', state: 'Andhra Pradesh', district: 'Krishna', acNo: 77 },
-  { id: "AP-AC-078", name: 'Penamaluru', state: 'Andhra Pradesh', district: 'Krishna', acNo: 78 },
-  { id: "AP-AC-079", name: 'Vijayawada West', state: 'Andhra Pradesh', district: 'NTR', acNo: 79 },
-  { id: "AP-AC-080", name: 'Vijayawada Central', state: 'Andhra Pradesh', district: 'NTR', acNo: 80 },
-  { id: "AP-AC-081", name: 'Vijayawada East', state: 'Andhra Pradesh', district: 'NTR', acNo: 81 },
-  { id: "AP-AC-082", name: 'Mylavaram', state: 'Andhra Pradesh', district: 'NTR', acNo: 82 },
-  { id: "AP-AC-083", name: 'Nandigama', state: 'Andhra Pradesh', district: 'NTR', acNo: 83 },
-  { id: "AP-AC-084", name: 'Jaggayyapeta', state: 'Andhra Pradesh', district: 'NTR', acNo: 84 },
-  { id: "AP-AC-085", name: 'Pedakurapadu', state: 'Andhra Pradesh', district: 'Palnadu', acNo: 85 },
-  { id: "AP-AC-086", name: 'Tadikonda', state: 'Andhra Pradesh', district: 'Guntur', acNo: 86 },
-  { id: "AP-AC-087", name: 'Mangalagiri', state: 'Andhra Pradesh', district: 'Guntur', acNo: 87 },
-  { id: "AP-AC-088", name: 'Ponnuru', state: 'Andhra Pradesh', district: 'Guntur', acNo: 88 },
-  { id: "AP-AC-089", name: 'Vemuru', state: 'Andhra Pradesh', district: 'Bapatla', acNo: 89 },
-  { id: "AP-AC-090", name: 'Repalle', state: 'Andhra Pradesh', district: 'Bapatla', acNo: 90 },
-  { id: "AP-AC-091", name: 'Tenali', state: 'Andhra Pradesh', district: 'Guntur', acNo: 91 },
-  { id: "AP-AC-092", name: 'Bapatla', state: 'Andhra Pradesh', district: 'Bapatla', acNo: 92 },
-  { id: "AP-AC-093", name: 'Prathipadu', state: 'Andhra Pradesh', district: 'Guntur', acNo: 93 },
-  { id: "AP-AC-094", name: 'Guntur West', state: 'Andhra Pradesh', district: 'Guntur', acNo: 94 },
-  { id: "AP-AC-095", name: 'Guntur East', state: 'Andhra Pradesh', district: 'Guntur', acNo: 95 },
-  { id: "AP-AC-096", name: 'Chilakaluripet', state: 'Andhra Pradesh', district: 'Palnadu', acNo: 96 },
-  { id: "AP-AC-097", name: 'Narasaraopet', state: 'Andhra Pradesh', district: 'Palnadu', acNo: 97 },
-  { id: "AP-AC-098", name: 'Sattenapalle', state: 'Andhra Pradesh', district: 'Palnadu', acNo: 98 },
-  { id: "AP-AC-099", name: 'Vinukonda', state: 'Andhra Pradesh', district: 'Palnadu', acNo: 99 },
-  { id: "AP-AC-100", name: 'Gurajala', state: 'Andhra Pradesh', district: 'Palnadu', acNo: 100 },
-  { id: "AP-AC-101", name: 'Macherla', state: 'Andhra Pradesh', district: 'Palnadu', acNo: 101 },
-  { id: "AP-AC-102", name: 'Yerragondapalem', state: 'Andhra Pradesh', district: 'Markapuram', acNo: 102 },
-  { id: "AP-AC-103", name: 'Darsi', state: 'Andhra Pradesh', district: 'Prakasam', acNo: 103 },
-  { id: "AP-AC-104", name: 'Parchur', state: 'Andhra Pradesh', district: 'Bapatla', acNo: 104 },
-  { id: "AP-AC-105", name: 'Addanki', state: 'Andhra Pradesh', district: 'Prakasam', acNo: 105 },
-  { id: "AP-AC-106", name: 'Chirala', state: 'Andhra Pradesh', district: 'Bapatla', acNo: 106 },
-  { id: "AP-AC-107", name: 'Santhanuthalapadu', state: 'Andhra Pradesh', district: 'Prakasam', acNo: 107 },
-  { id: "AP-AC-108", name: 'Ongole', state: 'Andhra Pradesh', district: 'Prakasam', acNo: 108 },
-  { id: "AP-AC-109", name: 'Kandukur', state: 'Andhra Pradesh', district: 'Prakasam', acNo: 109 },
-  { id: "AP-AC-110", name: 'Kondapi', state: 'Andhra Pradesh', district: 'Prakasam', acNo: 110 },
-  { id: "AP-AC-111", name: 'Markapuram', state: 'Andhra Pradesh', district: 'Markapuram', acNo: 111 },
-  { id: "AP-AC-112", name: 'Giddalur', state: 'Andhra Pradesh', district: 'Markapuram', acNo: 112 },
-  { id: "AP-AC-113", name: 'Kanigiri', state: 'Andhra Pradesh', district: 'Markapuram', acNo: 113 },
-  { id: "AP-AC-114", name: 'Kavali', state: 'Andhra Pradesh', district: 'Nellore', acNo: 114 },
-  { id: "AP-AC-115", name: 'Atmakur', state: 'Andhra Pradesh', district: 'Nellore', acNo: 115 },
-  { id: "AP-AC-116", name: 'Kovur', state: 'Andhra Pradesh', district: 'Nellore', acNo: 116 },
-  { id: "AP-AC-117", name: 'Nellore City', state: 'Andhra Pradesh', district: 'Nellore', acNo: 117 },
-  { id: "AP-AC-118", name: 'Nellore Rural', state: 'Andhra Pradesh', district: 'Nellore', acNo: 118 },
-  { id: "AP-AC-119", name: 'Sarvepalli', state: 'Andhra Pradesh', district: 'Nellore', acNo: 119 },
-  { id: "AP-AC-120", name: 'Gudur', state: 'Andhra Pradesh', district: 'Nellore', acNo: 120 },
-  { id: "AP-AC-121", name: 'Sullurpeta', state: 'Andhra Pradesh', district: 'Tirupati', acNo: 121 },
-  { id: "AP-AC-122", name: 'Venkatagiri', state: 'Andhra Pradesh', district: 'Tirupati', acNo: 122 },
-  { id: "AP-AC-123", name: 'Udayagiri', state: 'Andhra Pradesh', district: 'Nellore', acNo: 123 },
-  { id: "AP-AC-124", name: 'Badvel', state: 'Andhra Pradesh', district: 'YSR Kadapa', acNo: 124 },
-  { id: "AP-AC-125", name: 'Rajampet', state: 'Andhra Pradesh', district: 'YSR Kadapa', acNo: 125 },
-  { id: "AP-AC-126", name: 'Kadapa', state: 'Andhra Pradesh', district: 'YSR Kadapa', acNo: 126 },
-  { id: "AP-AC-127", name: 'Kodur', state: 'Andhra Pradesh', district: 'Tirupati', acNo: 127 },
-  { id: "AP-AC-128", name: 'Rayachoti', state: 'Andhra Pradesh', district: 'Annamayya', acNo: 128 },
-  { id: "AP-AC-129", name: 'Pulivendla', state: 'Andhra Pradesh', district: 'YSR Kadapa', acNo: 129 },
-  { id: "AP-AC-130", name: 'Kamalapuram', state: 'Andhra Pradesh', district: 'YSR Kadapa', acNo: 130 },
-  { id: "AP-AC-131", name: 'Jammalamadugu', state: 'Andhra Pradesh', district: 'YSR Kadapa', acNo: 131 },
-  { id: "AP-AC-132", name: 'Proddatur', state: 'Andhra Pradesh', district: 'YSR Kadapa', acNo: 132 },
-  { id: "AP-AC-133", name: 'Mydukur', state: 'Andhra Pradesh', district: 'YSR Kadapa', acNo: 133 },
-  { id: "AP-AC-134", name: 'Allagadda', state: 'Andhra Pradesh', district: 'Nandyal', acNo: 134 },
-  { id: "AP-AC-135", name: 'Srisailam', state: 'Andhra Pradesh', district: 'Nandyal', acNo: 135 },
-  { id: "AP-AC-136", name: 'Nandikotkur', state: 'Andhra Pradesh', district: 'Nandyal', acNo: 136 },
-  { id: "AP-AC-137", name: 'Kurnool', state: 'Andhra Pradesh', district: 'Kurnool', acNo: 137 },
-  { id: "AP-AC-138", name: 'Panyam', state: 'Andhra Pradesh', district: 'Nandyal', acNo: 138 },
-  { id: "AP-AC-139", name: 'Nandyal', state: 'Andhra Pradesh', district: 'Nandyal', acNo: 139 },
-  { id: "AP-AC-140", name: 'Banaganapalle', state: 'Andhra Pradesh', district: 'Nandyal', acNo: 140 },
-  { id: "AP-AC-141", name: 'Dhone', state: 'Andhra Pradesh', district: 'Nandyal', acNo: 141 },
-  { id: "AP-AC-142", name: 'Pattikonda', state: 'Andhra Pradesh', district: 'Kurnool', acNo: 142 },
-  { id: "AP-AC-143", name: 'Kodumur', state: 'Andhra Pradesh', district: 'Kurnool', acNo: 143 },
-  { id: "AP-AC-144", name: 'Yemmiganur', state: 'Andhra Pradesh', district: 'Kurnool', acNo: 144 },
-  { id: "AP-AC-145", name: 'Mantralayam', state: 'Andhra Pradesh', district: 'Kurnool', acNo: 145 },
-  { id: "AP-AC-146", name: 'Adoni', state: 'Andhra Pradesh', district: 'Kurnool', acNo: 146 },
-  { id: "AP-AC-147", name: 'Alur', state: 'Andhra Pradesh', district: 'Kurnool', acNo: 147 },
-  { id: "AP-AC-148", name: 'Rayadurg', state: 'Andhra Pradesh', district: 'Ananthapuramu', acNo: 148 },
-  { id: "AP-AC-149", name: 'Uravakonda', state: 'Andhra Pradesh', district: 'Ananthapuramu', acNo: 149 },
-  { id: "AP-AC-150", name: 'Guntakal', state: 'Andhra Pradesh', district: 'Ananthapuramu', acNo: 150 },
-  { id: "AP-AC-151", name: 'Tadipatri', state: 'Andhra Pradesh', district: 'Ananthapuramu', acNo: 151 },
-  { id: "AP-AC-152", name: 'Singanamala', state: 'Andhra Pradesh', district: 'Ananthapuramu', acNo: 152 },
-  { id: "AP-AC-153", name: 'Anantapur Urban', state: 'Andhra Pradesh', district: 'Ananthapuramu', acNo: 153 },
-  { id: "AP-AC-154", name: 'Kalyandurg', state: 'Andhra Pradesh', district: 'Ananthapuramu', acNo: 154 },
-  { id: "AP-AC-155", name: 'Raptadu', state: 'Andhra Pradesh', district: 'Ananthapuramu', acNo: 155 },
-  { id: "AP-AC-156", name: 'Madakasira', state: 'Andhra Pradesh', district: 'Sri Sathya Sai', acNo: 156 },
-  { id: "AP-AC-157", name: 'Hindupur', state: 'Andhra Pradesh', district: 'Sri Sathya Sai', acNo: 157 },
-  { id: "AP-AC-158", name: 'Penukonda', state: 'Andhra Pradesh', district: 'Sri Sathya Sai', acNo: 158 },
-  { id: "AP-AC-159", name: 'Puttaparthi', state: 'Andhra Pradesh', district: 'Sri Sathya Sai', acNo: 159 },
-  { id: "AP-AC-160", name: 'Dharmavaram', state: 'Andhra Pradesh', district: 'Sri Sathya Sai', acNo: 160 },
-  { id: "AP-AC-161", name: 'Kadiri', state: 'Andhra Pradesh', district: 'Sri Sathya Sai', acNo: 161 },
-  { id: "AP-AC-162", name: 'Thamballapalle', state: 'Andhra Pradesh', district: 'Annamayya', acNo: 162 },
-  { id: "AP-AC-163", name: 'Pileru', state: 'Andhra Pradesh', district: 'Annamayya', acNo: 163 },
-  { id: "AP-AC-164", name: 'Madanapalle', state: 'Andhra Pradesh', district: 'Annamayya', acNo: 164 },
-  { id: "AP-AC-165", name: 'Punganur', state: 'Andhra Pradesh', district: 'Annamayya', acNo: 165 },
-  { id: "AP-AC-166", name: 'Chandragiri', state: 'Andhra Pradesh', district: 'Tirupati', acNo: 166 },
-  { id: "AP-AC-167", name: 'Tirupati', state: 'Andhra Pradesh', district: 'Tirupati', acNo: 167 },
-  { id: "AP-AC-168", name: 'Srikalahasti', state: 'Andhra Pradesh', district: 'Tirupati', acNo: 168 },
-  { id: "AP-AC-169", name: 'Sathyavedu', state: 'Andhra Pradesh', district: 'Tirupati', acNo: 169 },
-  { id: "AP-AC-170", name: 'Nagari', state: 'Andhra Pradesh', district: 'Chittoor', acNo: 170 },
-  { id: "AP-AC-171", name: 'Gangadhara Nellore', state: 'Andhra Pradesh', district: 'Chittoor', acNo: 171 },
-  { id: "AP-AC-172", name: 'Chittoor', state: 'Andhra Pradesh', district: 'Chittoor', acNo: 172 },
-  { id: "AP-AC-173", name: 'Puthalapattu', state: 'Andhra Pradesh', district: 'Chittoor', acNo: 173 },
-  { id: "AP-AC-174", name: 'Palamaner', state: 'Andhra Pradesh', district: 'Chittoor', acNo: 174 },
-  { id: "AP-AC-175", name: 'Kuppam', state: 'Andhra Pradesh', district: 'Chittoor', acNo: 175 },
+  'Srikakulam',1225,'Vizianagaram',1225,'Parvathipuram Manyam',1225,'Visakhapatnam',1225,'Anakapalli',1225,'Alluri Sitharama Raju',1225,
+  'Kakinada',1225,'East Godavari',1225,'Konaseema',1286,'West Godavari',1094,'Eluru',1094,'NTR',1094,
+  'Krishna',1094,'Guntur',1286,'Palnadu',1286,'Bapatla',1286,'Prakasam',1286,'Nellore',1286,
+  'Tirupati',1286,'Chittoor',1285,'Annamayya',1285,'YSR Kadapa',1285,'Nandyal',1285,'Kurnool',1285,
+  'Ananthapuramu',1285,'Sri Sathya Sai',626,'Polavaram',626,'Markapuram',617,'Paderu',617,'Anakapalle',626,
+  'Pendurthi',626,'Elamanchili',626,'Payakaraopet',626,'Narsipatnam',626,'Tuni',890,'Prathipadu',890,
+  'Pithapuram',890,'Kakinada Rural',890,'Peddapuram',890,'Anaparthy',777,'Kakinada City',890,'Ramachandrapuram',946,
+  'Mummidivaram',946,'Amalapuram',946,'Razole',946,'Gannavaram',946,'Kothapeta',946,'Mandapeta',946,
+  'Rajanagaram',777,'Rajahmundry City',777,'Rajahmundry Rural',777,'Jaggampeta',890,'Rampachodavaram',1108,'Kovvur',777,
+  'Nidadavole',777,'Achanta',1294,'Palakollu',1294,'Narasapuram',1294,'Bhimavaram',1294,'Undi',1294,
+  'Tanuku',1294,'Tadepalligudem',1294,'Unguturu',784,'Denduluru',784,'Eluru',784,'Gopalapuram',777,
+  'Polavaram',784,'Chintalapudi',784,'Tiruvuru',1036,'Nuzvid',784,'Gannavaram',956,'Gudivada',956,
+  'Kaikalur',784,'Pedana',956,'Machilipatnam',956,'Avanigadda',956,'Pamarru',956,'Penamaluru',956,
+  'Vijayawada West',1036,'Vijayawada Central',1036,'Vijayawada East',1036,'Mylavaram',1036,'Nandigama',1036,'Jaggayyapeta',1036,
+  'Pedakurapadu',1086,'Tadikonda',825,'Mangalagiri',825,'Ponnuru',825,'Vemuru',660,'Repalle',660,
+  'Tenali',825,'Bapatla',660,'Prathipadu',825,'Guntur West',825,'Guntur East',825,'Chilakaluripet',1086,
+  'Narasaraopet',1086,'Sattenapalle',1086,'Vinukonda',1086,'Gurajala',1086,'Macherla',1086,'Yerragondapalem',1011,
+  'Darsi',1111,'Parchur',660,'Addanki',1111,'Chirala',660,'Santhanuthalapadu',1111,'Ongole',1111,
+  'Kandukur',1111,'Kondapi',1111,'Markapuram',1011,'Giddalur',1011,'Kanigiri',1011,'Kavali',1063,
+  'Atmakur',1063,'Kovur',1063,'Nellore City',1063,'Nellore Rural',1063,'Sarvepalli',1063,'Gudur',1063,
+  'Sullurpeta',1256,'Venkatagiri',1256,'Udayagiri',1063,'Badvel',1303,'Rajampet',1303,'Kadapa',1303,
+  'Kodur',1256,'Rayachoti',631,'Pulivendla',1303,'Kamalapuram',1303,'Jammalamadugu',1303,'Proddatur',1303,
+  'Mydukur',1303,'Allagadda',1052,'Srisailam',1052,'Nandikotkur',1052,'Kurnool',961,'Panyam',1052,
+  'Nandyal',1052,'Banaganapalle',1052,'Dhone',1052,'Pattikonda',961,'Kodumur',961,'Yemmiganur',961,
+  'Mantralayam',961,'Adoni',961,'Alur',961,'Rayadurg',628,'Uravakonda',628,'Guntakal',628,
+  'Tadipatri',628,'Singanamala',628,'Anantapur Urban',628,'Kalyandurg',628,'Raptadu',628,'Madakasira',1224,
+  'Hindupur',1224,'Penukonda',1224,'Puttaparthi',1224,'Dharmavaram',1224,'Kadiri',1224,'Thamballapalle',631,
+  'Pileru',631,'Madanapalle',631,'Punganur',631,'Chandragiri',1256,'Tirupati',1256,'Srikalahasti',1256,
+  'Sathyavedu',1256,'Nagari',727,'Gangadhara Nellore',727,'Chittoor',727,'Puthalapattu',727,'Palamaner',727,
+  'Kuppam',727,
   // Arunachal Pradesh (60)
-  { id: "AR-AC-001", name: 'Lumla', state: 'Arunachal Pradesh', district: 'Tawang', acNo: 1 },
-  { id: "AR-AC-002", name: 'Tawang', state: 'Arunachal Pradesh', district: 'Tawang', acNo: 2 },
-  { id: "AR-AC-003", name: 'Mukto', state: 'Arunachal Pradesh', district: 'Tawang', acNo: 3 },
-  { id: "AR-AC-004", name: 'Dirang', state: 'Arunachal Pradesh', district: 'West Kameng', acNo: 4 },
-  { id: "AR-AC-005", name: 'Kalaktang', state: 'Arunachal Pradesh', district: 'West Kameng', acNo: 5 },
-  { id: "AR-AC-006", name: 'Thrizino-Buragaon', state: 'Arunachal Pradesh', district: 'West Kameng', acNo: 6 },
-  { id: "AR-AC-007", name: 'Bomdila', state: 'Arunachal Pradesh', district: 'West Kameng', acNo: 7 },
-  { id: "AR-AC-008", name: 'Bameng', state: 'Arunachal Pradesh', district: 'Bichom', acNo: 8 },
-  { id: "AR-AC-009", name: 'Chayangtajo', state: 'Arunachal Pradesh', district: 'East Kameng', acNo: 9 },
-  { id: "AR-AC-010", name: 'Seppa East', state: 'Arunachal Pradesh', district: 'East Kameng', acNo: 10 },
-  { id: "AR-AC-011", name: 'Seppa West', state: 'Arunachal Pradesh', district: 'East Kameng', acNo: 11 },
-  { id: "AR-AC-012", name: 'Pakke-Kessang', state: 'Arunachal Pradesh', district: 'Pakke-Kessang', acNo: 12 },
-  { id: "AR-AC-013", name: 'Itanagar', state: 'Arunachal Pradesh', district: 'Papum Pare', acNo: 13 },
-  { id: "AR-AC-014", name: 'Doimukh', state: 'Arunachal Pradesh', district: 'Papum Pare', acNo: 14 },
-  { id: "AR-AC-015", name: 'Sagalee', state: 'Arunachal Pradesh', district: 'Papum Pare', acNo: 15 },
-  { id: "AR-AC-016", name: 'Yachuli', state: 'Arunachal Pradesh', district: 'Keyi Panyor', acNo: 16 },
-  { id: "AR-AC-017", name: 'Ziro–Hapoli', state: 'Arunachal Pradesh', district: 'Lower Subansiri', acNo: 17 },
-  { id: "AR-AC-018", name: 'Palin', state: 'Arunachal Pradesh', district: 'Kra-Daadi', acNo: 18 },
-  { id: "AR-AC-019", name: 'Nyapin', state: 'Arunachal Pradesh', district: 'Kurung Kumey', acNo: 19 },
-  { id: "AR-AC-020", name: 'Tali', state: 'Arunachal Pradesh', district: 'Kra-Daadi', acNo: 20 },
-  { id: "AR-AC-021", name: 'Koloriang', state: 'Arunachal Pradesh', district: 'Kurung Kumey', acNo: 21 },
-  { id: "AR-AC-022", name: 'Nacho', state: 'Arunachal Pradesh', district: 'Upper Subansiri', acNo: 22 },
-  { id: "AR-AC-023", name: 'Taliha', state: 'Arunachal Pradesh', district: 'Upper Subansiri', acNo: 23 },
-  { id: "AR-AC-024", name: 'Daporijo', state: 'Arunachal Pradesh', district: 'Upper Subansiri', acNo: 24 },
-  { id: "AR-AC-025", name: 'Raga', state: 'Arunachal Pradesh', district: 'Kamle', acNo: 25 },
-  { id: "AR-AC-026", name: 'Dumporijo', state: 'Arunachal Pradesh', district: 'Upper Subansiri', acNo: 26 },
-  { id: "AR-AC-027", name: 'Liromoba', state: 'Arunachal Pradesh', district: 'West Siang', acNo: 27 },
-  { id: "AR-AC-028", name: 'Likabali', state: 'Arunachal Pradesh', district: 'Lower Siang', acNo: 28 },
-  { id: "AR-AC-029", name: 'Basar', state: 'Arunachal Pradesh', district: 'Lepa Rada', acNo: 29 },
-  { id: "AR-AC-030", name: 'Along West', state: 'Arunachal Pradesh', district: 'West Siang', acNo: 30 },
-  { id: "AR-AC-031", name: 'Along East', state: 'Arunachal Pradesh', district: 'West Siang', acNo: 31 },
-  { id: "AR-AC-032", name: 'Rumgong', state: 'Arunachal Pradesh', district: 'Siang', acNo: 32 },
-  { id: "AR-AC-033", name: 'Mechuka', state: 'Arunachal Pradesh', district: 'Shi Yomi', acNo: 33 },
-  { id: "AR-AC-034", name: 'Tuting–Yingkiong', state: 'Arunachal Pradesh', district: 'Upper Siang', acNo: 34 },
-  { id: "AR-AC-035", name: 'Pangin', state: 'Arunachal Pradesh', district: 'Siang', acNo: 35 },
-  { id: "AR-AC-036", name: 'Nari-Koyu', state: 'Arunachal Pradesh', district: 'Lower Siang', acNo: 36 },
-  { id: "AR-AC-037", name: 'Pasighat West', state: 'Arunachal Pradesh', district: 'East Siang', acNo: 37 },
-  { id: "AR-AC-038", name: 'Pasighat East', state: 'Arunachal Pradesh', district: 'East Siang', acNo: 38 },
-  { id: "AR-AC-039", name: 'Mebo', state: 'Arunachal Pradesh', district: 'East Siang', acNo: 39 },
-  { id: "AR-AC-040", name: 'Mariyang-Geku', state: 'Arunachal Pradesh', district: 'Upper Siang', acNo: 40 },
-  { id: "AR-AC-041", name: 'Anini', state: 'Arunachal Pradesh', district: 'Dibang Valley', acNo: 41 },
-  { id: "AR-AC-042", name: 'Dambuk', state: 'Arunachal Pradesh', district: 'Lower Dibang Valley', acNo: 42 },
-  { id: "AR-AC-043", name: 'Roing', state: 'Arunachal Pradesh', district: 'Lower Dibang Valley', acNo: 43 },
-  { id: "AR-AC-044", name: 'Tezu', state: 'Arunachal Pradesh', district: 'Lohit', acNo: 44 },
-  { id: "AR-AC-045", name: 'Hayuliang', state: 'Arunachal Pradesh', district: 'Anjaw', acNo: 45 },
-  { id: "AR-AC-046", name: 'Chowkham', state: 'Arunachal Pradesh', district: 'Namsai', acNo: 46 },
-  { id: "AR-AC-047", name: 'Namsai', state: 'Arunachal Pradesh', district: 'Namsai', acNo: 47 },
-  { id: "AR-AC-048", name: 'Lekang', state: 'Arunachal Pradesh', district: 'Namsai', acNo: 48 },
-  { id: "AR-AC-049", name: 'Bordumsa-Diyun', state: 'Arunachal Pradesh', district: 'Changlang', acNo: 49 },
-  { id: "AR-AC-050", name: 'Miao', state: 'Arunachal Pradesh', district: 'Changlang', acNo: 50 },
-  { id: "AR-AC-051", name: 'Nampong', state: 'Arunachal Pradesh', district: 'Changlang', acNo: 51 },
-  { id: "AR-AC-052", name: 'Changlang South', state: 'Arunachal Pradesh', district: 'Changlang', acNo: 52 },
-  { id: "AR-AC-053", name: 'Changlang North', state: 'Arunachal Pradesh', district: 'Changlang', acNo: 53 },
-  { id: "AR-AC-054", name: 'Namsang', state: 'Arunachal Pradesh', district: 'Tirap', acNo: 54 },
-  { id: "AR-AC-055", name: 'Khonsa East', state: 'Arunachal Pradesh', district: 'Tirap', acNo: 55 },
-  { id: "AR-AC-056", name: 'Khonsa West', state: 'Arunachal Pradesh', district: 'Tirap', acNo: 56 },
-  { id: "AR-AC-057", name: 'Borduria–Bagapani', state: 'Arunachal Pradesh', district: 'Tirap', acNo: 57 },
-  { id: "AR-AC-058", name: 'Kanubari', state: 'Arunachal Pradesh', district: 'Longding', acNo: 58 },
-  { id: "AR-AC-059", name: 'Longding–Pumao', state: 'Arunachal Pradesh', district: 'Longding', acNo: 59 },
-  { id: "AR-AC-060", name: 'Pongchau-Wakka', state: 'Arunachal Pradesh', district: 'Longding', acNo: 60 },
+  'Lumla',1240,'Tawang',1240,'Mukto',1240,'Dirang',1296,'Kalaktang',1296,'Thrizino-Buragaon',1296,
+  'Bomdila',1296,'Bameng',690,'Chayangtajo',779,'Seppa East',779,'Seppa West',779,'Pakke-Kessang',1079,
+  'Itanagar',1092,'Doimukh',1092,'Sagalee',1092,'Yachuli',923,'Ziro–Hapoli',980,'Palin',955,
+  'Nyapin',963,'Tali',955,'Koloriang',963,'Nacho',1273,'Taliha',1273,'Daporijo',1273,
+  'Raga',895,'Dumporijo',1273,'Liromoba',1299,'Likabali',979,'Basar',973,'Along West',1299,
+  'Along East',1299,'Rumgong',1191,'Mechuka',1186,'Tuting–Yingkiong',1272,'Pangin',1191,'Nari-Koyu',979,
+  'Pasighat West',781,'Pasighat East',781,'Mebo',781,'Mariyang-Geku',1272,'Anini',762,'Dambuk',978,
+  'Roing',978,'Tezu',975,'Hayuliang',630,'Chowkham',1049,'Namsai',1049,'Lekang',1049,
+  'Bordumsa-Diyun',716,'Miao',716,'Nampong',716,'Changlang South',716,'Changlang North',716,'Namsang',1253,
+  'Khonsa East',1253,'Khonsa West',1253,'Borduria–Bagapani',1253,'Kanubari',976,'Longding–Pumao',976,'Pongchau-Wakka',976,
   // Assam (126)
-  { id: "AS-AC-001", name: 'Gossaigaon', state: 'Assam', district: 'Karimganj', acNo: 1 },
-  { id: "AS-AC-002", name: 'Dotma', state: 'Assam', district: 'Karimganj', acNo: 2 },
-  { id: "AS-AC-003", name: 'Kokrajhar', state: 'Assam', district: 'Karimganj', acNo: 3 },
-  { id: "AS-AC-004", name: 'Baokhungri', state: 'Assam', district: 'Karimganj', acNo: 4 },
-  { id: "AS-AC-005", name: 'Parbatjhora', state: 'Assam', district: 'Karimganj', acNo: 5 },
-  { id: "AS-AC-006", name: 'Golakganj', state: 'Assam', district: 'Hailakandi', acNo: 6 },
-  { id: "AS-AC-007", name: 'Gauripur', state: 'Assam', district: 'Hailakandi', acNo: 7 },
-  { id: "AS-AC-008", name: 'Dhubri', state: 'Assam', district: 'Hailakandi', acNo: 8 },
-  { id: "AS-AC-009", name: 'Birsing Jarua', state: 'Assam', district: 'Cachar', acNo: 9 },
-  { id: "AS-AC-010", name: 'Bilasipara', state: 'Assam', district: 'Cachar', acNo: 10 },
-  { id: "AS-AC-011", name: 'Mankachar', state: 'Assam', district: 'Cachar', acNo: 11 },
-  { id: "AS-AC-012", name: 'Jaleshwar', state: 'Assam', district: 'Cachar', acNo: 12 },
-  { id: "AS-AC-013", name: 'Goalpara West', state: 'Assam', district: 'Cachar', acNo: 13 },
-  { id: "AS-AC-014", name: 'Goalpara East', state: 'Assam', district: 'Cachar', acNo: 14 },
-  { id: "AS-AC-015", name: 'Dudhnai', state: 'Assam', district: 'Cachar', acNo: 15 },
-  { id: "AS-AC-016", name: 'Abhayapuri', state: 'Assam', district: 'Dima Hasao', acNo: 16 },
-  { id: "AS-AC-017", name: 'Srijangram', state: 'Assam', district: 'Karbi Anglong', acNo: 17 },
-  { id: "AS-AC-018", name: 'Bongaigaon', state: 'Assam', district: 'Karbi Anglong', acNo: 18 },
-  { id: "AS-AC-019", name: 'Sidli–Chirang', state: 'Assam', district: 'Karbi Anglong', acNo: 19 },
-  { id: "AS-AC-020", name: 'Bijni', state: 'Assam', district: 'West Karbi Anglong', acNo: 20 },
-  { id: "AS-AC-021", name: 'Bhowanipur–Sorbhog', state: 'Assam', district: 'South Salmara Mankachar', acNo: 21 },
-  { id: "AS-AC-022", name: 'Mandia', state: 'Assam', district: 'South Salmara Mankachar', acNo: 22 },
-  { id: "AS-AC-023", name: 'Chenga', state: 'Assam', district: 'Dhubri', acNo: 23 },
-  { id: "AS-AC-024", name: 'Barpeta', state: 'Assam', district: 'Dhubri', acNo: 24 },
-  { id: "AS-AC-025", name: 'Pakabetbari', state: 'Assam', district: 'Dhubri', acNo: 25 },
-  { id: "AS-AC-026", name: 'Bajali', state: 'Assam', district: 'Dhubri', acNo: 26 },
-  { id: "AS-AC-027", name: 'Chamaria', state: 'Assam', district: 'Dhubri', acNo: 27 },
-  { id: "AS-AC-028", name: 'Boko–Chaygaon', state: 'Assam', district: 'Kokrajhar', acNo: 28 },
-  { id: "AS-AC-029", name: 'Palasbari', state: 'Assam', district: 'Kokrajhar', acNo: 29 },
-  { id: "AS-AC-030", name: 'Hajo–Sualkuchi', state: 'Assam', district: 'Kokrajhar', acNo: 30 },
-  { id: "AS-AC-031", name: 'Rangiya', state: 'Assam', district: 'Chirang', acNo: 31 },
-  { id: "AS-AC-032", name: 'Kamalpur', state: 'Assam', district: 'Bongaigaon', acNo: 32 },
-  { id: "AS-AC-033", name: 'Dispur', state: 'Assam', district: 'Chirang', acNo: 33 },
-  { id: "AS-AC-034", name: 'Dimoria', state: 'Assam', district: 'Bongaigaon', acNo: 34 },
-  { id: "AS-AC-035", name: 'New Guwahati', state: 'Assam', district: 'Bongaigaon', acNo: 35 },
-  { id: "AS-AC-036", name: 'Guwahati Central', state: 'Assam', district: 'Goalpara', acNo: 36 },
-  { id: "AS-AC-037", name: 'Jalukbari', state: 'Assam', district: 'Goalpara', acNo: 37 },
-  { id: "AS-AC-038", name: 'Barkhetri', state: 'Assam', district: 'Goalpara', acNo: 38 },
-  { id: "AS-AC-039", name: 'Nalbari', state: 'Assam', district: 'Goalpara', acNo: 39 },
-  { id: "AS-AC-040", name: 'Tihu', state: 'Assam', district: 'Barpeta', acNo: 40 },
-  { id: "AS-AC-041", name: 'Manas', state: 'Assam', district: 'Bajali', acNo: 41 },
-  { id: "AS-AC-042", name: 'Baksa', state: 'Assam', district: 'Bajali', acNo: 42 },
-  { id: "AS-AC-043", name: 'Tamulpur', state: 'Assam', district: 'Barpeta', acNo: 43 },
-  { id: "AS-AC-044", name: 'Goreshwar', state: 'Assam', district: 'Barpeta', acNo: 44 },
-  { id: "AS-AC-045", name: 'Bhergaon', state: 'Assam', district: 'Barpeta', acNo: 45 },
-  { id: "AS-AC-046", name: 'Udalguri', state: 'Assam', district: 'Barpeta', acNo: 46 },
-  { id: "AS-AC-047", name: 'Majbat', state: 'Assam', district: 'Barpeta', acNo: 47 },
-  { id: "AS-AC-048", name: 'Tangla', state: 'Assam', district: 'Kamrup', acNo: 48 },
-  { id: "AS-AC-049", name: 'Sipajhar', state: 'Assam', district: 'Kamrup', acNo: 49 },
-  { id: "AS-AC-050", name: 'Mangaldai', state: 'Assam', district: 'Kamrup', acNo: 50 },
-  { id: "AS-AC-051", name: 'Dalgaon', state: 'Assam', district: 'Kamrup Metro', acNo: 51 },
-  { id: "AS-AC-052", name: 'Jagiroad', state: 'Assam', district: 'Kamrup Metro', acNo: 52 },
-  { id: "AS-AC-053", name: 'Laharighat', state: 'Assam', district: 'Kamrup Metro', acNo: 53 },
-  { id: "AS-AC-054", name: 'Morigaon', state: 'Assam', district: 'Kamrup Metro', acNo: 54 },
-  { id: "AS-AC-055", name: 'Dhing', state: 'Assam', district: 'Kamrup', acNo: 55 },
-  { id: "AS-AC-056", name: 'Rupohihat', state: 'Assam', district: 'Kamrup', acNo: 56 },
-  { id: "AS-AC-057", name: 'Kaliabor', state: 'Assam', district: 'Kamrup', acNo: 57 },
-  { id: "AS-AC-058", name: 'Samaguri', state: 'Assam', district: 'Baksa', acNo: 58 },
-  { id: "AS-AC-059", name: 'Barhampur', state: 'Assam', district: 'Nalbari', acNo: 59 },
-  { id: "AS-AC-060", name: 'Nagaon–Batadraba', state: 'Assam', district: 'Nalbari', acNo: 60 },
-  { id: "AS-AC-061", name: 'Raha', state: 'Assam', district: 'Nalbari', acNo: 61 },
-  { id: "AS-AC-062", name: 'Binnakandi', state: 'Assam', district: 'Baksa', acNo: 62 },
-  { id: "AS-AC-063", name: 'Hojai', state: 'Assam', district: 'Baksa', acNo: 63 },
-  { id: "AS-AC-064", name: 'Lumding', state: 'Assam', district: 'Udalguri', acNo: 64 },
-  { id: "AS-AC-065", name: 'Dhekiajuli', state: 'Assam', district: 'Darrang', acNo: 65 },
-  { id: "AS-AC-066", name: 'Barchalla', state: 'Assam', district: 'Darrang', acNo: 66 },
-  { id: "AS-AC-067", name: 'Tezpur', state: 'Assam', district: 'Darrang', acNo: 67 },
-  { id: "AS-AC-068", name: 'Rangapara', state: 'Assam', district: 'Darrang', acNo: 68 },
-  { id: "AS-AC-069", name: 'Naduar', state: 'Assam', district: 'Udalguri', acNo: 69 },
-  { id: "AS-AC-070", name: 'Biswanath', state: 'Assam', district: 'Udalguri', acNo: 70 },
-  { id: "AS-AC-071", name: 'Behali', state: 'Assam', district: 'Sonitpur', acNo: 71 },
-  { id: "AS-AC-072", name: 'Gohpur', state: 'Assam', district: 'Sonitpur', acNo: 72 },
-  { id: "AS-AC-073", name: 'Bihpuria', state: 'Assam', district: 'Sonitpur', acNo: 73 },
-  { id: "AS-AC-074", name: 'Rongonadi', state: 'Assam', district: 'Sonitpur', acNo: 74 },
-  { id: "AS-AC-075", name: 'Naoboicha', state: 'Assam', district: 'Sonitpur', acNo: 75 },
-  { id: "AS-AC-076", name: 'Lakhimpur', state: 'Assam', district: 'Biswanath', acNo: 76 },
-  { id: "AS-AC-077", name: 'Dhakuakhana', state: 'Assam', district: 'Biswanath', acNo: 77 },
-  { id: "AS-AC-078", name: 'Dhemaji', state: 'Assam', district: 'Biswanath', acNo: 78 },
-  { id: "AS-AC-079", name: 'Sissiborgaon', state: 'Assam', district: 'Marigaon', acNo: 79 },
-  { id: "AS-AC-080", name: 'Jonai', state: 'Assam', district: 'Marigaon', acNo: 80 },
-  { id: "AS-AC-081", name: 'Sadiya', state: 'Assam', district: 'Marigaon', acNo: 81 },
-  { id: "AS-AC-082", name: 'Doom Dooma', state: 'Assam', district: 'Nagaon', acNo: 82 },
-  { id: "AS-AC-083", name: 'Margherita', state: 'Assam', district: 'Nagaon', acNo: 83 },
-  { id: "AS-AC-084", name: 'Digboi', state: 'Assam', district: 'Nagaon', acNo: 84 },
-  { id: "AS-AC-085", name: 'Makum', state: 'Assam', district: 'Nagaon', acNo: 85 },
-  { id: "AS-AC-086", name: 'Tinsukia', state: 'Assam', district: 'Nagaon', acNo: 86 },
-  { id: "AS-AC-087", name: 'Chabua–Lahowal', state: 'Assam', district: 'Nagaon', acNo: 87 },
-  { id: "AS-AC-088", name: 'Dibrugarh', state: 'Assam', district: 'Nagaon', acNo: 88 },
-  { id: "AS-AC-089", name: 'Khowang', state: 'Assam', district: 'Nagaon', acNo: 89 },
-  { id: "AS-AC-090", name: 'Duliajan', state: 'Assam', district: 'Hojai', acNo: 90 },
-  { id: "AS-AC-091", name: 'Tingkhong', state: 'Assam', district: 'Hojai', acNo: 91 },
-  { id: "AS-AC-092", name: 'Naharkatia', state: 'Assam', district: 'Hojai', acNo: 92 },
-  { id: "AS-AC-093", name: 'Sonari', state: 'Assam', district: 'Golaghat', acNo: 93 },
-  { id: "AS-AC-094", name: 'Mahmora', state: 'Assam', district: 'Golaghat', acNo: 94 },
-  { id: "AS-AC-095", name: 'Demow', state: 'Assam', district: 'Golaghat', acNo: 95 },
-  { id: "AS-AC-096", name: 'Sibsagar', state: 'Assam', district: 'Golaghat', acNo: 96 },
-  { id: "AS-AC-097", name: 'Nazira', state: 'Assam', district: 'Golaghat', acNo: 97 },
-  { id: "AS-AC-098", name: 'Majuli', state: 'Assam', district: 'Jorhat', acNo: 98 },
-  { id: "AS-AC-099", name: 'Teok', state: 'Assam', district: 'Majuli', acNo: 99 },
-  { id: "AS-AC-100", name: 'Jorhat', state: 'Assam', district: 'Jorhat', acNo: 100 },
-  { id: "AS-AC-101", name: 'Mariani', state: 'Assam', district: 'Jorhat', acNo: 101 },
-  { id: "AS-AC-102", name: 'Titabor', state: 'Assam', district: 'Jorhat', acNo: 102 },
-  { id: "AS-AC-103", name: 'Golaghat', state: 'Assam', district: 'Sibsagar', acNo: 103 },
-  { id: "AS-AC-104", name: 'Dergaon', state: 'Assam', district: 'Sibsagar', acNo: 104 },
-  { id: "AS-AC-105", name: 'Bokakhat', state: 'Assam', district: 'Charaideo', acNo: 105 },
-  { id: "AS-AC-106", name: 'Khumtai', state: 'Assam', district: 'Charaideo', acNo: 106 },
-  { id: "AS-AC-107", name: 'Sarupathar', state: 'Assam', district: 'Sibsagar', acNo: 107 },
-  { id: "AS-AC-108", name: 'Bokajan', state: 'Assam', district: 'Sibsagar', acNo: 108 },
-  { id: "AS-AC-109", name: 'Howraghat', state: 'Assam', district: 'Lakhimpur', acNo: 109 },
-  { id: "AS-AC-110", name: 'Diphu', state: 'Assam', district: 'Lakhimpur', acNo: 110 },
-  { id: "AS-AC-111", name: 'Rongkhang', state: 'Assam', district: 'Lakhimpur', acNo: 111 },
-  { id: "AS-AC-112", name: 'Amri', state: 'Assam', district: 'Lakhimpur', acNo: 112 },
-  { id: "AS-AC-113", name: 'Haflong', state: 'Assam', district: 'Dhemaji', acNo: 113 },
-  { id: "AS-AC-114", name: 'Lakhipur', state: 'Assam', district: 'Dhemaji', acNo: 114 },
-  { id: "AS-AC-115", name: 'Udharbond', state: 'Assam', district: 'Dibrugarh', acNo: 115 },
-  { id: "AS-AC-116", name: 'Katigorah', state: 'Assam', district: 'Dibrugarh', acNo: 116 },
-  { id: "AS-AC-117", name: 'Borkhola', state: 'Assam', district: 'Dibrugarh', acNo: 117 },
-  { id: "AS-AC-118", name: 'Silchar', state: 'Assam', district: 'Dibrugarh', acNo: 118 },
-  { id: "AS-AC-119", name: 'Sonai', state: 'Assam', district: 'Dibrugarh', acNo: 119 },
-  { id: "AS-AC-120", name: 'Dholai', state: 'Assam', district: 'Dibrugarh', acNo: 120 },
-  { id: "AS-AC-121", name: 'Hailakandi', state: 'Assam', district: 'Dibrugarh', acNo: 121 },
-  { id: "AS-AC-122", name: 'Algapur–Katlicherra', state: 'Assam', district: 'Tinsukia', acNo: 122 },
-  { id: "AS-AC-123", name: 'Karimganj North', state: 'Assam', district: 'Tinsukia', acNo: 123 },
-  { id: "AS-AC-124", name: 'Karimganj South', state: 'Assam', district: 'Tinsukia', acNo: 124 },
-  { id: "AS-AC-125", name: 'Patharkandi', state: 'Assam', district: 'Tinsukia', acNo: 125 },
-  { id: "AS-AC-126", name: 'Ram Krishna Nagar', state: 'Assam', district: 'Tinsukia', acNo: 126 },
+  'Gossaigaon',910,'Dotma',910,'Kokrajhar',910,'Baokhungri',910,'Parbatjhora',910,'Golakganj',830,
+  'Gauripur',830,'Dhubri',830,'Birsing Jarua',709,'Bilasipara',709,'Mankachar',709,'Jaleshwar',709,
+  'Goalpara West',709,'Goalpara East',709,'Dudhnai',709,'Abhayapuri',765,'Srijangram',909,'Bongaigaon',909,
+  'Sidli–Chirang',909,'Bijni',1297,'Bhowanipur–Sorbhog',1219,'Mandia',1219,'Chenga',760,'Barpeta',760,
+  'Pakabetbari',760,'Bajali',760,'Chamaria',760,'Boko–Chaygaon',940,'Palasbari',940,'Hajo–Sualkuchi',940,
+  'Rangiya',725,'Kamalpur',699,'Dispur',725,'Dimoria',699,'New Guwahati',699,'Guwahati Central',815,
+  'Jalukbari',815,'Barkhetri',815,'Nalbari',815,'Tihu',668,'Manas',645,'Baksa',645,
+  'Tamulpur',668,'Goreshwar',668,'Bhergaon',668,'Udalguri',668,'Majbat',668,'Tangla',896,
+  'Sipajhar',896,'Mangaldai',896,'Dalgaon',897,'Jagiroad',897,'Laharighat',897,'Morigaon',897,
+  'Dhing',896,'Rupohihat',896,'Kaliabor',896,'Samaguri',646,'Barhampur',1045,'Nagaon–Batadraba',1045,
+  'Raha',1045,'Binnakandi',646,'Hojai',646,'Lumding',1264,'Dhekiajuli',744,'Barchalla',744,
+  'Tezpur',744,'Rangapara',744,'Naduar',1264,'Biswanath',1264,'Behali',1212,'Gohpur',1212,
+  'Bihpuria',1212,'Rongonadi',1212,'Naoboicha',1212,'Lakhimpur',697,'Dhakuakhana',697,'Dhemaji',697,
+  'Sissiborgaon',1010,'Jonai',1010,'Sadiya',1010,'Doom Dooma',1039,'Margherita',1039,'Digboi',1039,
+  'Makum',1039,'Tinsukia',1039,'Chabua–Lahowal',1039,'Dibrugarh',1039,'Khowang',1039,'Duliajan',842,
+  'Tingkhong',842,'Naharkatia',842,'Sonari',817,'Mahmora',817,'Demow',817,'Sibsagar',817,
+  'Nazira',817,'Majuli',884,'Teok',998,'Jorhat',884,'Mariani',884,'Titabor',884,
+  'Golaghat',1192,'Dergaon',1192,'Bokakhat',717,'Khumtai',717,'Sarupathar',1192,'Bokajan',1192,
+  'Howraghat',966,'Diphu',966,'Rongkhang',966,'Amri',966,'Haflong',757,'Lakhipur',757,
+  'Udharbond',763,'Katigorah',763,'Borkhola',763,'Silchar',763,'Sonai',763,'Dholai',763,
+  'Hailakandi',763,'Algapur–Katlicherra',1252,'Karimganj North',1252,'Karimganj South',1252,'Patharkandi',1252,'Ram Krishna Nagar',1252,
   // Bihar (243)
-  { id: "BR-AC-001", name: 'Valmiki Nagar', state: 'Bihar', district: 'West Champaran', acNo: 1 },
-  { id: "BR-AC-002", name: 'Ramnagar', state: 'Bihar', district: 'West Champaran', acNo: 2 },
-  { id: "BR-AC-003", name: 'Narkatiaganj', state: 'Bihar', district: 'West Champaran', acNo: 3 },
-  { id: "BR-AC-004", name: 'Bagaha', state: 'Bihar', district: 'West Champaran', acNo: 4 },
-  { id: "BR-AC-005", name: 'Lauriya', state: 'Bihar', district: 'West Champaran', acNo: 5 },
-  { id: "BR-AC-006", name: 'Nautan', state: 'Bihar', district: 'West Champaran', acNo: 6 },
-  { id: "BR-AC-007", name: 'Chanpatia', state: 'Bihar', district: 'West Champaran', acNo: 7 },
-  { id: "BR-AC-008", name: 'Bettiah', state: 'Bihar', district: 'West Champaran', acNo: 8 },
-  { id: "BR-AC-009", name: 'Sikta', state: 'Bihar', district: 'West Champaran', acNo: 9 },
-  { id: "BR-AC-010", name: 'Raxaul', state: 'Bihar', district: 'East Champaran', acNo: 10 },
-  { id: "BR-AC-011", name: 'Sugauli', state: 'Bihar', district: 'East Champaran', acNo: 11 },
-  { id: "BR-AC-012", name: 'Narkatiya', state: 'Bihar', district: 'East Champaran', acNo: 12 },
-  { id: "BR-AC-013", name: 'Harsidhi', state: 'Bihar', district: 'East Champaran', acNo: 13 },
-  { id: "BR-AC-014", name: 'Govindganj', state: 'Bihar', district: 'East Champaran', acNo: 14 },
-  { id: "BR-AC-015", name: 'Kesaria', state: 'Bihar', district: 'East Champaran', acNo: 15 },
-  { id: "BR-AC-016", name: 'Kalyanpur', state: 'Bihar', district: 'East Champaran', acNo: 16 },
-  { id: "BR-AC-017", name: 'Pipra', state: 'Bihar', district: 'East Champaran', acNo: 17 },
-  { id: "BR-AC-018", name: 'Madhuban', state: 'Bihar', district: 'East Champaran', acNo: 18 },
-  { id: "BR-AC-019", name: 'Motihari', state: 'Bihar', district: 'East Champaran', acNo: 19 },
-  { id: "BR-AC-020", name: 'Chiraia', state: 'Bihar', district: 'East Champaran', acNo: 20 },
-  { id: "BR-AC-021", name: 'Dhaka', state: 'Bihar', district: 'East Champaran', acNo: 21 },
-  { id: "BR-AC-022", name: 'Sheohar', state: 'Bihar', district: 'Sheohar', acNo: 22 },
-  { id: "BR-AC-023", name: 'Riga', state: 'Bihar', district: 'Sitamarhi', acNo: 23 },
-  { id: "BR-AC-024", name: 'Bathnaha', state: 'Bihar', district: 'Sitamarhi', acNo: 24 },
-  { id: "BR-AC-025", name: 'Parihar', state: 'Bihar', district: 'Sitamarhi', acNo: 25 },
-  { id: "BR-AC-026", name: 'Sursand', state: 'Bihar', district: 'Sitamarhi', acNo: 26 },
-  { id: "BR-AC-027", name: 'Bajpatti', state: 'Bihar', district: 'Sitamarhi', acNo: 27 },
-  { id: "BR-AC-028", name: 'Sitamarhi', state: 'Bihar', district: 'Sitamarhi', acNo: 28 },
-  { id: "BR-AC-029", name: 'Runnisaidpur', state: 'Bihar', district: 'Sitamarhi', acNo: 29 },
-  { id: "BR-AC-030", name: 'Belsand', state: 'Bihar', district: 'Sitamarhi', acNo: 30 },
-  { id: "BR-AC-031", name: 'Harlakhi', state: 'Bihar', district: 'Madhubani', acNo: 31 },
-  { id: "BR-AC-032", name: 'Benipatti', state: 'Bihar', district: 'Madhubani', acNo: 32 },
-  { id: "BR-AC-033", name: 'Khajauli', state: 'Bihar', district: 'Madhubani', acNo: 33 },
-  { id: "BR-AC-034", name: 'Babubarhi', state: 'Bihar', district: 'Madhubani', acNo: 34 },
-  { id: "BR-AC-035", name: 'Bisfi', state: 'Bihar', district: 'Madhubani', acNo: 35 },
-  { id: "BR-AC-036", name: 'Madhubani', state: 'Bihar', district: 'Madhubani', acNo: 36 },
-  { id: "BR-AC-037", name: 'Rajnagar', state: 'Bihar', district: 'Madhubani', acNo: 37 },
-  { id: "BR-AC-038", name: 'Jhanjharpur', state: 'Bihar', district: 'Madhubani', acNo: 38 },
-  { id: "BR-AC-039", name: 'Phulparas', state: 'Bihar', district: 'Madhubani', acNo: 39 },
-  { id: "BR-AC-040", name: 'Laukaha', state: 'Bihar', district: 'Madhubani', acNo: 40 },
-  { id: "BR-AC-041", name: 'Nirmali', state: 'Bihar', district: 'Supaul', acNo: 41 },
-  { id: "BR-AC-042", name: 'Pipra', state: 'Bihar', district: 'Supaul', acNo: 42 },
-  { id: "BR-AC-043", name: 'Supaul', state: 'Bihar', district: 'Supaul', acNo: 43 },
-  { id: "BR-AC-044", name: 'Triveniganj', state: 'Bihar', district: 'Supaul', acNo: 44 },
-  { id: "BR-AC-045", name: 'Chhatapur', state: 'Bihar', district: 'Supaul', acNo: 45 },
-  { id: "BR-AC-046", name: 'Narpatganj', state: 'Bihar', district: 'Araria', acNo: 46 },
-  { id: "BR-AC-047", name: 'Raniganj', state: 'Bihar', district: 'Araria', acNo: 47 },
-  { id: "BR-AC-048", name: 'Forbesganj', state: 'Bihar', district: 'Araria', acNo: 48 },
-  { id: "BR-AC-049", name: 'Araria', state: 'Bihar', district: 'Araria', acNo: 49 },
-  { id: "BR-AC-050", name: 'Jokihat', state: 'Bihar', district: 'Araria', acNo: 50 },
-  { id: "BR-AC-051", name: 'Sikti', state: 'Bihar', district: 'Araria', acNo: 51 },
-  { id: "BR-AC-052", name: 'Bahadurganj', state: 'Bihar', district: 'Kishanganj', acNo: 52 },
-  { id: "BR-AC-053", name: 'Thakurganj', state: 'Bihar', district: 'Kishanganj', acNo: 53 },
-  { id: "BR-AC-054", name: 'Kishanganj', state: 'Bihar', district: 'Kishanganj', acNo: 54 },
-  { id: "BR-AC-055", name: 'Kochadhaman', state: 'Bihar', district: 'Kishanganj', acNo: 55 },
-  { id: "BR-AC-056", name: 'Amour', state: 'Bihar', district: 'Purnia', acNo: 56 },
-  { id: "BR-AC-057", name: 'Baisi', state: 'Bihar', district: 'Purnia', acNo: 57 },
-  { id: "BR-AC-058", name: 'Kasba', state: 'Bihar', district: 'Purnia', acNo: 58 },
-  { id: "BR-AC-059", name: 'Banmankhi', state: 'Bihar', district: 'Purnia', acNo: 59 },
-  { id: "BR-AC-060", name: 'Rupauli', state: 'Bihar', district: 'Purnia', acNo: 60 },
-  { id: "BR-AC-061", name: 'Dhamdaha', state: 'Bihar', district: 'Purnia', acNo: 61 },
-  { id: "BR-AC-062", name: 'Purnia', state: 'Bihar', district: 'Purnia', acNo: 62 },
-  { id: "BR-AC-063", name: 'Katihar', state: 'Bihar', district: 'Katihar', acNo: 63 },
-  { id: "BR-AC-064", name: 'Kadwa', state: 'Bihar', district: 'Katihar', acNo: 64 },
-  { id: "BR-AC-065", name: 'Balrampur', state: 'Bihar', district: 'Katihar', acNo: 65 },
-  { id: "BR-AC-066", name: 'Pranpur', state: 'Bihar', district: 'Katihar', acNo: 66 },
-  { id: "BR-AC-067", name: 'Manihari', state: 'Bihar', district: 'Katihar', acNo: 67 },
-  { id: "BR-AC-068", name: 'Barari', state: 'Bihar', district: 'Katihar', acNo: 68 },
-  { id: "BR-AC-069", name: 'Korha', state: 'Bihar', district: 'Katihar', acNo: 69 },
-  { id: "BR-AC-070", name: 'Alamnagar', state: 'Bihar', district: 'Madhepura', acNo: 70 },
-  { id: "BR-AC-071", name: 'Bihariganj', state: 'Bihar', district: 'Madhepura', acNo: 71 },
-  { id: "BR-AC-072", name: 'Singheshwar', state: 'Bihar', district: 'Madhepura', acNo: 72 },
-  { id: "BR-AC-073", name: 'Madhepura', state: 'Bihar', district: 'Madhepura', acNo: 73 },
-  { id: "BR-AC-074", name: 'Sonbarsha', state: 'Bihar', district: 'Saharsa', acNo: 74 },
-  { id: "BR-AC-075", name: 'Saharsa', state: 'Bihar', district: 'Saharsa', acNo: 75 },
-  { id: "BR-AC-076", name: 'Simri Bakhtiarpur', state: 'Bihar', district: 'Saharsa', acNo: 76 },
-  { id: "BR-AC-077", name: 'Mahishi', state: 'Bihar', district: 'Saharsa', acNo: 77 },
-  { id: "BR-AC-078", name: 'Kusheshwar Asthan', state: 'Bihar', district: 'Darbhanga', acNo: 78 },
-  { id: "BR-AC-079", name: 'Gaura Bauram', state: 'Bihar', district: 'Darbhanga', acNo: 79 },
-  { id: "BR-AC-080", name: 'Benipur', state: 'Bihar', district: 'Darbhanga', acNo: 80 },
-  { id: "BR-AC-081", name: 'Alinagar', state: 'Bihar', district: 'Darbhanga', acNo: 81 },
-  { id: "BR-AC-082", name: 'Darbhanga Rural', state: 'Bihar', district: 'Darbhanga', acNo: 82 },
-  { id: "BR-AC-083", name: 'Darbhanga', state: 'Bihar', district: 'Darbhanga', acNo: 83 },
-  { id: "BR-AC-084", name: 'Hayaghat', state: 'Bihar', district: 'Darbhanga', acNo: 84 },
-  { id: "BR-AC-085", name: 'Bahadurpur', state: 'Bihar', district: 'Darbhanga', acNo: 85 },
-  { id: "BR-AC-086", name: 'Keoti', state: 'Bihar', district: 'Darbhanga', acNo: 86 },
-  { id: "BR-AC-087", name: 'Jale', state: 'Bihar', district: 'Darbhanga', acNo: 87 },
-  { id: "BR-AC-088", name: 'Gaighat', state: 'Bihar', district: 'Muzaffarpur', acNo: 88 },
-  { id: "BR-AC-089", name: 'Aurai', state: 'Bihar', district: 'Muzaffarpur', acNo: 89 },
-  { id: "BR-AC-090", name: 'Minapur', state: 'Bihar', district: 'Muzaffarpur', acNo: 90 },
-  { id: "BR-AC-091", name: 'Bochahan', state: 'Bihar', district: 'Muzaffarpur', acNo: 91 },
-  { id: "BR-AC-092", name: 'Sakra', state: 'Bihar', district: 'Muzaffarpur', acNo: 92 },
-  { id: "BR-AC-093", name: 'Kurhani', state: 'Bihar', district: 'Muzaffarpur', acNo: 93 },
-  { id: "BR-AC-094", name: 'Muzaffarpur', state: 'Bihar', district: 'Muzaffarpur', acNo: 94 },
-  { id: "BR-AC-095", name: 'Kanti', state: 'Bihar', district: 'Muzaffarpur', acNo: 95 },
-  { id: "BR-AC-096", name: 'Baruraj', state: 'Bihar', district: 'Muzaffarpur', acNo: 96 },
-  { id: "BR-AC-097", name: 'Paroo', state: 'Bihar', district: 'Muzaffarpur', acNo: 97 },
-  { id: "BR-AC-098", name: 'Sahebganj', state: 'Bihar', district: 'Muzaffarpur', acNo: 98 },
-  { id: "BR-AC-099", name: 'Baikunthpur', state: 'Bihar', district: 'Gopalganj', acNo: 99 },
-  { id: "BR-AC-100", name: 'Barauli', state: 'Bihar', district: 'Gopalganj', acNo: 100 },
-  { id: "BR-AC-101", name: 'Gopalganj', state: 'Bihar', district: 'Gopalganj', acNo: 101 },
-  { id: "BR-AC-102", name: 'Kuchaikote', state: 'Bihar', district: 'Gopalganj', acNo: 102 },
-  { id: "BR-AC-103", name: 'Bhore', state: 'Bihar', district: 'Gopalganj', acNo: 103 },
-  { id: "BR-AC-104", name: 'Hathua', state: 'Bihar', district: 'Gopalganj', acNo: 104 },
-  { id: "BR-AC-105", name: 'Siwan', state: 'Bihar', district: 'Siwan', acNo: 105 },
-  { id: "BR-AC-106", name: 'Ziradei', state: 'Bihar', district: 'Siwan', acNo: 106 },
-  { id: "BR-AC-107", name: 'Darauli', state: 'Bihar', district: 'Siwan', acNo: 107 },
-  { id: "BR-AC-108", name: 'Raghunathpur', state: 'Bihar', district: 'Siwan', acNo: 108 },
-  { id: "BR-AC-109", name: 'Daraunda', state: 'Bihar', district: 'Siwan', acNo: 109 },
-  { id: "BR-AC-110", name: 'Barharia', state: 'Bihar', district: 'Siwan', acNo: 110 },
-  { id: "BR-AC-111", name: 'Goriakothi', state: 'Bihar', district: 'Siwan', acNo: 111 },
-  { id: "BR-AC-112", name: 'Maharajganj', state: 'Bihar', district: 'Siwan', acNo: 112 },
-  { id: "BR-AC-113", name: 'Ekma', state: 'Bihar', district: 'Saran', acNo: 113 },
-  { id: "BR-AC-114", name: 'Manjhi', state: 'Bihar', district: 'Saran', acNo: 114 },
-  { id: "BR-AC-115", name: 'Baniapur', state: 'Bihar', district: 'Saran', acNo: 115 },
-  { id: "BR-AC-116", name: 'Taraiya', state: 'Bihar', district: 'Saran', acNo: 116 },
-  { id: "BR-AC-117", name: 'Marhaura', state: 'Bihar', district: 'Saran', acNo: 117 },
-  { id: "BR-AC-118", name: 'Chapra', state: 'Bihar', district: 'Saran', acNo: 118 },
-  { id: "BR-AC-119", name: 'Garkha', state: 'Bihar', district: 'Saran', acNo: 119 },
-  { id: "BR-AC-120", name: 'Amnour', state: 'Bihar', district: 'Saran', acNo: 120 },
-  { id: "BR-AC-121", name: 'Parsa', state: 'Bihar', district: 'Saran', acNo: 121 },
-  { id: "BR-AC-122", name: 'Sonpur', state: 'Bihar', district: 'Saran', acNo: 122 },
-  { id: "BR-AC-123", name: 'Hajipur', state: 'Bihar', district: 'Vaishali', acNo: 123 },
-  { id: "BR-AC-124", name: 'Lalganj', state: 'Bihar', district: 'Vaishali', acNo: 124 },
-  { id: "BR-AC-125", name: 'Vaishali', state: 'Bihar', district: 'Vaishali', acNo: 125 },
-  { id: "BR-AC-126", name: 'Mahua', state: 'Bihar', district: 'Vaishali', acNo: 126 },
-  { id: "BR-AC-127", name: 'Raja Pakar', state: 'Bihar', district: 'Vaishali', acNo: 127 },
-  { id: "BR-AC-128", name: 'Raghopur', state: 'Bihar', district: 'Vaishali', acNo: 128 },
-  { id: "BR-AC-129", name: 'Mahnar', state: 'Bihar', district: 'Vaishali', acNo: 129 },
-  { id: "BR-AC-130", name: 'Patepur', state: 'Bihar', district: 'Vaishali', acNo: 130 },
-  { id: "BR-AC-131", name: 'Kalyanpur', state: 'Bihar', district: 'Samastipur', acNo: 131 },
-  { id: "BR-AC-132", name: 'Warisnagar', state: 'Bihar', district: 'Samastipur', acNo: 132 },
-  { id: "BR-AC-133", name: 'Samastipur', state: 'Bihar', district: 'Samastipur', acNo: 133 },
-  { id: "BR-AC-134", name: 'Ujiarpur', state: 'Bihar', district: 'Samastipur', acNo: 134 },
-  { id: "BR-AC-135", name: 'Morwa', state: 'Bihar', district: 'Samastipur', acNo: 135 },
-  { id: "BR-AC-136", name: 'Sarairanjan', state: 'Bihar', district: 'Samastipur', acNo: 136 },
-  { id: "BR-AC-137", name: 'Mohiuddinnagar', state: 'Bihar', district: 'Samastipur', acNo: 137 },
-  { id: "BR-AC-138", name: 'Bibhutipur', state: 'Bihar', district: 'Samastipur', acNo: 138 },
-  { id: "BR-AC-139", name: 'Rosera', state: 'Bihar', district: 'Samastipur', acNo: 139 },
-  { id: "BR-AC-140", name: 'Hasanpur', state: 'Bihar', district: 'Samastipur', acNo: 140 },
-  { id: "BR-AC-141", name: 'Cheria-Bariarpur', state: 'Bihar', district: 'Begusarai', acNo: 141 },
-  { id: "BR-AC-142", name: 'Bachhwara', state: 'Bihar', district: 'Begusarai', acNo: 142 },
-  { id: "BR-AC-143", name: 'Teghra', state: 'Bihar', district: 'Begusarai', acNo: 143 },
-  { id: "BR-AC-144", name: 'Matihani', state: 'Bihar', district: 'Begusarai', acNo: 144 },
-  { id: "BR-AC-145", name: 'Sahebpur Kamal', state: 'Bihar', district: 'Begusarai', acNo: 145 },
-  { id: "BR-AC-146", name: 'Begusarai', state: 'Bihar', district: 'Begusarai', acNo: 146 },
-  { id: "BR-AC-147", name: 'Bakhri', state: 'Bihar', district: 'Begusarai', acNo: 147 },
-  { id: "BR-AC-148", name: 'Alauli', state: 'Bihar', district: 'Khagaria', acNo: 148 },
-  { id: "BR-AC-149", name: 'Khagaria', state: 'Bihar', district: 'Khagaria', acNo: 149 },
-  { id: "BR-AC-150", name: 'Beldaur', state: 'Bihar', district: 'Khagaria', acNo: 150 },
-  { id: "BR-AC-151", name: 'Parbatta', state: 'Bihar', district: 'Khagaria', acNo: 151 },
-  { id: "BR-AC-152", name: 'Bihpur', state: 'Bihar', district: 'Bhagalpur', acNo: 152 },
-  { id: "BR-AC-153", name: 'Gopalpur', state: 'Bihar', district: 'Bhagalpur', acNo: 153 },
-  { id: "BR-AC-154", name: 'Pirpainti', state: 'Bihar', district: 'Bhagalpur', acNo: 154 },
-  { id: "BR-AC-155", name: 'Kahalgaon', state: 'Bihar', district: 'Bhagalpur', acNo: 155 },
-  { id: "BR-AC-156", name: 'Bhagalpur', state: 'Bihar', district: 'Bhagalpur', acNo: 156 },
-  { id: "BR-AC-157", name: 'Sultanganj', state: 'Bihar', district: 'Bhagalpur', acNo: 157 },
-  { id: "BR-AC-158", name: 'Nathnagar', state: 'Bihar', district: 'Bhagalpur', acNo: 158 },
-  { id: "BR-AC-159", name: 'Amarpur', state: 'Bihar', district: 'Banka', acNo: 159 },
-  { id: "BR-AC-160", name: 'Dhoraiya', state: 'Bihar', district: 'Banka', acNo: 160 },
-  { id: "BR-AC-161", name: 'Banka', state: 'Bihar', district: 'Banka', acNo: 161 },
-  { id: "BR-AC-162", name: 'Katoria', state: 'Bihar', district: 'Banka', acNo: 162 },
-  { id: "BR-AC-163", name: 'Belhar', state: 'Bihar', district: 'Banka', acNo: 163 },
-  { id: "BR-AC-164", name: 'Tarapur', state: 'Bihar', district: 'Munger', acNo: 164 },
-  { id: "BR-AC-165", name: 'Munger', state: 'Bihar', district: 'Munger', acNo: 165 },
-  { id: "BR-AC-166", name: 'Jamalpur', state: 'Bihar', district: 'Munger', acNo: 166 },
-  { id: "BR-AC-167", name: 'Suryagarha', state: 'Bihar', district: 'Lakhisarai', acNo: 167 },
-  { id: "BR-AC-168", name: 'Lakhisarai', state: 'Bihar', district: 'Lakhisarai', acNo: 168 },
-  { id: "BR-AC-169", name: 'Sheikhpura', state: 'Bihar', district: 'Sheikhpura', acNo: 169 },
-  { id: "BR-AC-170", name: 'Barbigha', state: 'Bihar', district: 'Sheikhpura', acNo: 170 },
-  { id: "BR-AC-171", name: 'Asthawan', state: 'Bihar', district: 'Nalanda', acNo: 171 },
-  { id: "BR-AC-172", name: 'Biharsharif', state: 'Bihar', district: 'Nalanda', acNo: 172 },
-  { id: "BR-AC-173", name: 'Rajgir', state: 'Bihar', district: 'Nalanda', acNo: 173 },
-  { id: "BR-AC-174", name: 'Islampur', state: 'Bihar', district: 'Nalanda', acNo: 174 },
-  { id: "BR-AC-175", name: 'Hilsa', state: 'Bihar', district: 'Nalanda', acNo: 175 },
-  { id: "BR-AC-176", name: 'Nalanda', state: 'Bihar', district: 'Nalanda', acNo: 176 },
-  { id: "BR-AC-177", name: 'Harnaut', state: 'Bihar', district: 'Nalanda', acNo: 177 },
-  { id: "BR-AC-178", name: 'Mokama', state: 'Bihar', district: 'Patna', acNo: 178 },
-  { id: "BR-AC-179", name: 'Barh', state: 'Bihar', district: 'Patna', acNo: 179 },
-  { id: "BR-AC-180", name: 'Bakhtiarpur', state: 'Bihar', district: 'Patna', acNo: 180 },
-  { id: "BR-AC-181", name: 'Digha', state: 'Bihar', district: 'Patna', acNo: 181 },
-  { id: "BR-AC-182", name: 'Bankipur', state: 'Bihar', district: 'Patna', acNo: 182 },
-  { id: "BR-AC-183", name: 'Kumhrar', state: 'Bihar', district: 'Patna', acNo: 183 },
-  { id: "BR-AC-184", name: 'Patna Sahib', state: 'Bihar', district: 'Patna', acNo: 184 },
-  { id: "BR-AC-185", name: 'Fatuha', state: 'Bihar', district: 'Patna', acNo: 185 },
-  { id: "BR-AC-186", name: 'Danapur', state: 'Bihar', district: 'Patna', acNo: 186 },
-  { id: "BR-AC-187", name: 'Maner', state: 'Bihar', district: 'Patna', acNo: 187 },
-  { id: "BR-AC-188", name: 'Phulwari', state: 'Bihar', district: 'Patna', acNo: 188 },
-  { id: "BR-AC-189", name: 'Masaurhi', state: 'Bihar', district: 'Patna', acNo: 189 },
-  { id: "BR-AC-190", name: 'Paliganj', state: 'Bihar', district: 'Patna', acNo: 190 },
-  { id: "BR-AC-191", name: 'Bikram', state: 'Bihar', district: 'Patna', acNo: 191 },
-  { id: "BR-AC-192", name: 'Sandesh', state: 'Bihar', district: 'Bhojpur', acNo: 192 },
-  { id: "BR-AC-193", name: 'Barhara', state: 'Bihar', district: 'Bhojpur', acNo: 193 },
-  { id: "BR-AC-194", name: 'Arrah', state: 'Bihar', district: 'Bhojpur', acNo: 194 },
-  { id: "BR-AC-195", name: 'Agiaon', state: 'Bihar', district: 'Bhojpur', acNo: 195 },
-  { id: "BR-AC-196", name: 'Tarari', state: 'Bihar', district: 'Bhojpur', acNo: 196 },
-  { id: "BR-AC-197", name: 'Jagdishpur', state: 'Bihar', district: 'Bhojpur', acNo: 197 },
-  { id: "BR-AC-198", name: 'Shahpur', state: 'Bihar', district: 'Bhojpur', acNo: 198 },
-  { id: "BR-AC-199", name: 'Brahampur', state: 'Bihar', district: 'Buxar', acNo: 199 },
-  { id: "BR-AC-200", name: 'Buxar', state: 'Bihar', district: 'Buxar', acNo: 200 },
-  { id: "BR-AC-201", name: 'Dumraon', state: 'Bihar', district: 'Buxar', acNo: 201 },
-  { id: "BR-AC-202", name: 'Rajpur', state: 'Bihar', district: 'Buxar', acNo: 202 },
-  { id: "BR-AC-203", name: 'Ramgarh', state: 'Bihar', district: 'Kaimur', acNo: 203 },
-  { id: "BR-AC-204", name: 'Mohania', state: 'Bihar', district: 'Kaimur', acNo: 204 },
-  { id: "BR-AC-205", name: 'Bhabua', state: 'Bihar', district: 'Kaimur', acNo: 205 },
-  { id: "BR-AC-206", name: 'Chainpur', state: 'Bihar', district: 'Kaimur', acNo: 206 },
-  { id: "BR-AC-207", name: 'Chenari', state: 'Bihar', district: 'Rohtas', acNo: 207 },
-  { id: "BR-AC-208", name: 'Sasaram', state: 'Bihar', district: 'Rohtas', acNo: 208 },
-  { id: "BR-AC-209", name: 'Kargahar', state: 'Bihar', district: 'Rohtas', acNo: 209 },
-  { id: "BR-AC-210", name: 'Dinara', state: 'Bihar', district: 'Rohtas', acNo: 210 },
-  { id: "BR-AC-211", name: 'Nokha', state: 'Bihar', district: 'Rohtas', acNo: 211 },
-  { id: "BR-AC-212", name: 'Dehri', state: 'Bihar', district: 'Rohtas', acNo: 212 },
-  { id: "BR-AC-213", name: 'Karakat', state: 'Bihar', district: 'Rohtas', acNo: 213 },
-  { id: "BR-AC-214", name: 'Arwal', state: 'Bihar', district: 'Arwal', acNo: 214 },
-  { id: "BR-AC-215", name: 'Kurtha', state: 'Bihar', district: 'Arwal', acNo: 215 },
-  { id: "BR-AC-216", name: 'Jehanabad', state: 'Bihar', district: 'Jehanabad', acNo: 216 },
-  { id: "BR-AC-217", name: 'Ghosi', state: 'Bihar', district: 'Jehanabad', acNo: 217 },
-  { id: "BR-AC-218", name: 'Makhdumpur', state: 'Bihar', district: 'Jehanabad', acNo: 218 },
-  { id: "BR-AC-219", name: 'Goh', state: 'Bihar', district: 'Aurangabad', acNo: 219 },
-  { id: "BR-AC-220", name: 'Obra', state: 'Bihar', district: 'Aurangabad', acNo: 220 },
-  { id: "BR-AC-221", name: 'Nabinagar', state: 'Bihar', district: 'Aurangabad', acNo: 221 },
-  { id: "BR-AC-222", name: 'Kutumba', state: 'Bihar', district: 'Aurangabad', acNo: 222 },
-  { id: "BR-AC-223", name: 'Aurangabad', state: 'Bihar', district: 'Aurangabad', acNo: 223 },
-  { id: "BR-AC-224", name: 'Rafiganj', state: 'Bihar', district: 'Aurangabad', acNo: 224 },
-  { id: "BR-AC-225", name: 'Gurua', state: 'Bihar', district: 'Gaya', acNo: 225 },
-  { id: "BR-AC-226", name: 'Sherghati', state: 'Bihar', district: 'Gaya', acNo: 226 },
-  { id: "BR-AC-227", name: 'Imamganj', state: 'Bihar', district: 'Gaya', acNo: 227 },
-  { id: "BR-AC-228", name: 'Barachatti', state: 'Bihar', district: 'Gaya', acNo: 228 },
-  { id: "BR-AC-229", name: 'Bodh Gaya', state: 'Bihar', district: 'Gaya', acNo: 229 },
-  { id: "BR-AC-230", name: 'Gaya Town', state: 'Bihar', district: 'Gaya', acNo: 230 },
-  { id: "BR-AC-231", name: 'Tikari', state: 'Bihar', district: 'Gaya', acNo: 231 },
-  { id: "BR-AC-232", name: 'Belaganj', state: 'Bihar', district: 'Gaya', acNo: 232 },
-  { id: "BR-AC-233", name: 'Atri', state: 'Bihar', district: 'Gaya', acNo: 233 },
-  { id: "BR-AC-234", name: 'Wazirganj', state: 'Bihar', district: 'Gaya', acNo: 234 },
-  { id: "BR-AC-235", name: 'Rajauli', state: 'Bihar', district: 'Nawada', acNo: 235 },
-  { id: "BR-AC-236", name: 'Hisua', state: 'Bihar', district: 'Nawada', acNo: 236 },
-  { id: "BR-AC-237", name: 'Nawada', state: 'Bihar', district: 'Nawada', acNo: 237 },
-  { id: "BR-AC-238", name: 'Gobindpur', state: 'Bihar', district: 'Nawada', acNo: 238 },
-  { id: "BR-AC-239", name: 'Warsaliganj', state: 'Bihar', district: 'Nawada', acNo: 239 },
-  { id: "BR-AC-240", name: 'Sikandra', state: 'Bihar', district: 'Jamui', acNo: 240 },
-  { id: "BR-AC-241", name: 'Jamui', state: 'Bihar', district: 'Jamui', acNo: 241 },
-  { id: "BR-AC-242", name: 'Jhajha', state: 'Bihar', district: 'Jamui', acNo: 242 },
-  { id: "BR-AC-243", name: 'Chakai', state: 'Bihar', district: 'Jamui', acNo: 243 },
+  'Valmiki Nagar',1291,'Ramnagar',1291,'Narkatiaganj',1291,'Bagaha',1291,'Lauriya',1291,'Nautan',1291,
+  'Chanpatia',1291,'Bettiah',1291,'Sikta',1291,'Raxaul',774,'Sugauli',774,'Narkatiya',774,
+  'Harsidhi',774,'Govindganj',774,'Kesaria',774,'Kalyanpur',774,'Pipra',774,'Madhuban',774,
+  'Motihari',774,'Chiraia',774,'Dhaka',774,'Sheohar',1184,'Riga',1204,'Bathnaha',1204,
+  'Parihar',1204,'Sursand',1204,'Bajpatti',1204,'Sitamarhi',1204,'Runnisaidpur',1204,'Belsand',1204,
+  'Harlakhi',985,'Benipatti',985,'Khajauli',985,'Babubarhi',985,'Bisfi',985,'Madhubani',985,
+  'Rajnagar',985,'Jhanjharpur',985,'Phulparas',985,'Laukaha',985,'Nirmali',1231,'Pipra',1231,
+  'Supaul',1231,'Triveniganj',1231,'Chhatapur',1231,'Narpatganj',634,'Raniganj',634,'Forbesganj',634,
+  'Araria',634,'Jokihat',634,'Sikti',634,'Bahadurganj',936,'Thakurganj',936,'Kishanganj',936,
+  'Kochadhaman',936,'Amour',1119,'Baisi',1119,'Kasba',1119,'Banmankhi',1119,'Rupauli',1119,
+  'Dhamdaha',1119,'Purnia',1119,'Katihar',917,'Kadwa',917,'Balrampur',917,'Pranpur',917,
+  'Manihari',917,'Barari',917,'Korha',917,'Alamnagar',984,'Bihariganj',984,'Singheshwar',984,
+  'Madhepura',984,'Sonbarsha',1152,'Saharsa',1152,'Simri Bakhtiarpur',1152,'Mahishi',1152,'Kusheshwar Asthan',742,
+  'Gaura Bauram',742,'Benipur',742,'Alinagar',742,'Darbhanga Rural',742,'Darbhanga',742,'Hayaghat',742,
+  'Bahadurpur',742,'Keoti',742,'Jale',742,'Gaighat',1035,'Aurai',1035,'Minapur',1035,
+  'Bochahan',1035,'Sakra',1035,'Kurhani',1035,'Muzaffarpur',1035,'Kanti',1035,'Baruraj',1035,
+  'Paroo',1035,'Sahebganj',1035,'Baikunthpur',821,'Barauli',821,'Gopalganj',821,'Kuchaikote',821,
+  'Bhore',821,'Hathua',821,'Siwan',1207,'Ziradei',1207,'Darauli',1207,'Raghunathpur',1207,
+  'Daraunda',1207,'Barharia',1207,'Goriakothi',1207,'Maharajganj',1207,'Ekma',1167,'Manjhi',1167,
+  'Baniapur',1167,'Taraiya',1167,'Marhaura',1167,'Chapra',1167,'Garkha',1167,'Amnour',1167,
+  'Parsa',1167,'Sonpur',1167,'Hajipur',1276,'Lalganj',1276,'Vaishali',1276,'Mahua',1276,
+  'Raja Pakar',1276,'Raghopur',1276,'Mahnar',1276,'Patepur',1276,'Kalyanpur',1158,'Warisnagar',1158,
+  'Samastipur',1158,'Ujiarpur',1158,'Morwa',1158,'Sarairanjan',1158,'Mohiuddinnagar',1158,'Bibhutipur',1158,
+  'Rosera',1158,'Hasanpur',1158,'Cheria-Bariarpur',675,'Bachhwara',675,'Teghra',675,'Matihani',675,
+  'Sahebpur Kamal',675,'Begusarai',675,'Bakhri',675,'Alauli',924,'Khagaria',924,'Beldaur',924,
+  'Parbatta',924,'Bihpur',680,'Gopalpur',680,'Pirpainti',680,'Kahalgaon',680,'Bhagalpur',680,
+  'Sultanganj',680,'Nathnagar',680,'Amarpur',657,'Dhoraiya',657,'Banka',657,'Katoria',657,
+  'Belhar',657,'Tarapur',1032,'Munger',1032,'Jamalpur',1032,'Suryagarha',968,'Lakhisarai',968,
+  'Sheikhpura',1183,'Barbigha',1183,'Asthawan',1044,'Biharsharif',1044,'Rajgir',1044,'Islampur',1044,
+  'Hilsa',1044,'Nalanda',1044,'Harnaut',1044,'Mokama',1101,'Barh',1101,'Bakhtiarpur',1101,
+  'Digha',1101,'Bankipur',1101,'Kumhrar',1101,'Patna Sahib',1101,'Fatuha',1101,'Danapur',1101,
+  'Maner',1101,'Phulwari',1101,'Masaurhi',1101,'Paliganj',1101,'Bikram',1101,'Sandesh',688,
+  'Barhara',688,'Arrah',688,'Agiaon',688,'Tarari',688,'Jagdishpur',688,'Shahpur',688,
+  'Brahampur',708,'Buxar',708,'Dumraon',708,'Rajpur',708,'Ramgarh',888,'Mohania',888,
+  'Bhabua',888,'Chainpur',888,'Chenari',1146,'Sasaram',1146,'Kargahar',1146,'Dinara',1146,
+  'Nokha',1146,'Dehri',1146,'Karakat',1146,'Arwal',637,'Kurtha',637,'Jehanabad',872,
+  'Ghosi',872,'Makhdumpur',872,'Goh',640,'Obra',640,'Nabinagar',640,'Kutumba',640,
+  'Aurangabad',640,'Rafiganj',640,'Gurua',810,'Sherghati',810,'Imamganj',810,'Barachatti',810,
+  'Bodh Gaya',810,'Gaya Town',810,'Tikari',810,'Belaganj',810,'Atri',810,'Wazirganj',810,
+  'Rajauli',1060,'Hisua',1060,'Nawada',1060,'Gobindpur',1060,'Warsaliganj',1060,'Sikandra',866,
+  'Jamui',866,'Jhajha',866,'Chakai',866,
   // Chhattisgarh (90)
-  { id: "CG-AC-001", name: 'Bharatpur-Sonhat', state: 'Chhattisgarh', district: 'Manendragarh-Chirmiri-Bharatpur', acNo: 1 },
-  { id: "CG-AC-002", name: 'Manendragarh', state: 'Chhattisgarh', district: 'Manendragarh-Chirmiri-Bharatpur', acNo: 2 },
-  { id: "CG-AC-003", name: 'Baikunthpur', state: 'Chhattisgarh', district: 'Koriya', acNo: 3 },
-  { id: "CG-AC-004", name: 'Premnagar', state: 'Chhattisgarh', district: 'Surajpur', acNo: 4 },
-  { id: "CG-AC-005", name: 'Bhatgaon', state: 'Chhattisgarh', district: 'Surajpur', acNo: 5 },
-  { id: "CG-AC-006", name: 'Pratappur', state: 'Chhattisgarh', district: 'Balrampur', acNo: 6 },
-  { id: "CG-AC-007", name: 'Ramanujganj', state: 'Chhattisgarh', district: 'Balrampur', acNo: 7 },
-  { id: "CG-AC-008", name: 'Samri', state: 'Chhattisgarh', district: 'Balrampur', acNo: 8 },
-  { id: "CG-AC-009", name: 'Lundra', state: 'Chhattisgarh', district: 'Surguja', acNo: 9 },
-  { id: "CG-AC-010", name: 'Ambikapur', state: 'Chhattisgarh', district: 'Surguja', acNo: 10 },
-  { id: "CG-AC-011", name: 'Sitapur', state: 'Chhattisgarh', district: 'Surguja', acNo: 11 },
-  { id: "CG-AC-012", name: 'Jashpur', state: 'Chhattisgarh', district: 'Jashpur', acNo: 12 },
-  { id: "CG-AC-013", name: 'Kunkuri', state: 'Chhattisgarh', district: 'Jashpur', acNo: 13 },
-  { id: "CG-AC-014", name: 'Pathalgaon', state: 'Chhattisgarh', district: 'Jashpur', acNo: 14 },
-  { id: "CG-AC-015", name: 'Lailunga', state: 'Chhattisgarh', district: 'Raigarh', acNo: 15 },
-  { id: "CG-AC-016", name: 'Raigarh', state: 'Chhattisgarh', district: 'Raigarh', acNo: 16 },
-  { id: "CG-AC-017", name: 'Sarangarh', state: 'Chhattisgarh', district: 'Raigarh', acNo: 17 },
-  { id: "CG-AC-018", name: 'Kharsia', state: 'Chhattisgarh', district: 'Raigarh', acNo: 18 },
-  { id: "CG-AC-019", name: 'Dharamjaigarh', state: 'Chhattisgarh', district: 'Raigarh', acNo: 19 },
-  { id: "CG-AC-020", name: 'Rampur', state: 'Chhattisgarh', district: 'Korba', acNo: 20 },
-  { id: "CG-AC-021", name: 'Korba', state: 'Chhattisgarh', district: 'Korba', acNo: 21 },
-  { id: "CG-AC-022", name: 'Katghora', state: 'Chhattisgarh', district: 'Korba', acNo: 22 },
-  { id: "CG-AC-023", name: 'Pali-Tanakhar', state: 'Chhattisgarh', district: 'Korba', acNo: 23 },
-  { id: "CG-AC-024", name: 'Marwahi', state: 'Chhattisgarh', district: 'Gaurela-Pendra-Marwahi', acNo: 24 },
-  { id: "CG-AC-025", name: 'Kota', state: 'Chhattisgarh', district: 'Gaurela-Pendra-Marwahi', acNo: 25 },
-  { id: "CG-AC-026", name: 'Lormi', state: 'Chhattisgarh', district: 'Mungeli', acNo: 26 },
-  { id: "CG-AC-027", name: 'Mungeli', state: 'Chhattisgarh', district: 'Mungeli', acNo: 27 },
-  { id: "CG-AC-028", name: 'Takhatpur', state: 'Chhattisgarh', district: 'Bilaspur', acNo: 28 },
-  { id: "CG-AC-029", name: 'Bilha', state: 'Chhattisgarh', district: 'Bilaspur', acNo: 29 },
-  { id: "CG-AC-030", name: 'Bilaspur', state: 'Chhattisgarh', district: 'Bilaspur', acNo: 30 },
-  { id: "CG-AC-031", name: 'Beltara', state: 'Chhattisgarh', district: 'Bilaspur', acNo: 31 },
-  { id: "CG-AC-032", name: 'Masturi', state: 'Chhattisgarh', district: 'Bilaspur', acNo: 32 },
-  { id: "CG-AC-033", name: 'Akaltara', state: 'Chhattisgarh', district: 'Janjgir–Champa', acNo: 33 },
-  { id: "CG-AC-034", name: 'Janjgir-Champa', state: 'Chhattisgarh', district: 'Janjgir–Champa', acNo: 34 },
-  { id: "CG-AC-035", name: 'Sakti', state: 'Chhattisgarh', district: 'Janjgir–Champa', acNo: 35 },
-  { id: "CG-AC-036", name: 'Chandrapur', state: 'Chhattisgarh', district: 'Janjgir–Champa', acNo: 36 },
-  { id: "CG-AC-037", name: 'Jaijaipur', state: 'Chhattisgarh', district: 'Janjgir–Champa', acNo: 37 },
-  { id: "CG-AC-038", name: 'Pamgarh', state: 'Chhattisgarh', district: 'Janjgir–Champa', acNo: 38 },
-  { id: "CG-AC-039", name: 'Saraipali', state: 'Chhattisgarh', district: 'Mahasamund', acNo: 39 },
-  { id: "CG-AC-040", name: 'Basna', state: 'Chhattisgarh', district: 'Mahasamund', acNo: 40 },
-  { id: "CG-AC-041", name: 'Khallari', state: 'Chhattisgarh', district: 'Mahasamund', acNo: 41 },
-  { id: "CG-AC-042", name: 'Mahasamund', state: 'Chhattisgarh', district: 'Mahasamund', acNo: 42 },
-  { id: "CG-AC-043", name: 'Bilaigarh', state: 'Chhattisgarh', district: 'Baloda Bazar', acNo: 43 },
-  { id: "CG-AC-044", name: 'Kasdol', state: 'Chhattisgarh', district: 'Baloda Bazar', acNo: 44 },
-  { id: "CG-AC-045", name: 'Baloda Bazar', state: 'Chhattisgarh', district: 'Baloda Bazar', acNo: 45 },
-  { id: "CG-AC-046", name: 'Bhatapara', state: 'Chhattisgarh', district: 'Baloda Bazar', acNo: 46 },
-  { id: "CG-AC-047", name: 'Dharsiwa', state: 'Chhattisgarh', district: 'Raipur', acNo: 47 },
-  { id: "CG-AC-048", name: 'Raipur City Gramin', state: 'Chhattisgarh', district: 'Raipur', acNo: 48 },
-  { id: "CG-AC-049", name: 'Raipur City West', state: 'Chhattisgarh', district: 'Raipur', acNo: 49 },
-  { id: "CG-AC-050", name: 'Raipur City North', state: 'Chhattisgarh', district: 'Raipur', acNo: 50 },
-  { id: "CG-AC-051", name: 'Raipur City South', state: 'Chhattisgarh', district: 'Raipur', acNo: 51 },
-  { id: "CG-AC-052", name: 'Arang', state: 'Chhattisgarh', district: 'Raipur', acNo: 52 },
-  { id: "CG-AC-053", name: 'Abhanpur', state: 'Chhattisgarh', district: 'Raipur', acNo: 53 },
-  { id: "CG-AC-054", name: 'Rajim', state: 'Chhattisgarh', district: 'Gariaband', acNo: 54 },
-  { id: "CG-AC-055", name: 'Bindrawagarh', state: 'Chhattisgarh', district: 'Gariaband', acNo: 55 },
-  { id: "CG-AC-056", name: 'Sihawa', state: 'Chhattisgarh', district: 'Dhamtari', acNo: 56 },
-  { id: "CG-AC-057", name: 'Kurud', state: 'Chhattisgarh', district: 'Dhamtari', acNo: 57 },
-  { id: "CG-AC-058", name: 'Dhamtari', state: 'Chhattisgarh', district: 'Dhamtari', acNo: 58 },
-  { id: "CG-AC-059", name: 'Sanjari Balod', state: 'Chhattisgarh', district: 'Balod', acNo: 59 },
-  { id: "CG-AC-060", name: 'Dondi Lohara', state: 'Chhattisgarh', district: 'Balod', acNo: 60 },
-  { id: "CG-AC-061", name: 'Gunderdehi', state: 'Chhattisgarh', district: 'Balod', acNo: 61 },
-  { id: "CG-AC-062", name: 'Patan', state: 'Chhattisgarh', district: 'Durg', acNo: 62 },
-  { id: "CG-AC-063", name: 'Durg Gramin', state: 'Chhattisgarh', district: 'Durg', acNo: 63 },
-  { id: "CG-AC-064", name: 'Durg City', state: 'Chhattisgarh', district: 'Durg', acNo: 64 },
-  { id: "CG-AC-065", name: 'Bhilai Nagar', state: 'Chhattisgarh', district: 'Durg', acNo: 65 },
-  { id: "CG-AC-066", name: 'Vaishali Nagar', state: 'Chhattisgarh', district: 'Durg', acNo: 66 },
-  { id: "CG-AC-067", name: 'Ahiwara', state: 'Chhattisgarh', district: 'Durg', acNo: 67 },
-  { id: "CG-AC-068", name: 'Saja', state: 'Chhattisgarh', district: 'Bemetara', acNo: 68 },
-  { id: "CG-AC-069", name: 'Bemetara', state: 'Chhattisgarh', district: 'Bemetara', acNo: 69 },
-  { id: "CG-AC-070", name: 'Navagarh', state: 'Chhattisgarh', district: 'Bemetara', acNo: 70 },
-  { id: "CG-AC-071", name: 'Pandariya', state: 'Chhattisgarh', district: 'Kabirdham', acNo: 71 },
-  { id: "CG-AC-072", name: 'Kawardha', state: 'Chhattisgarh', district: 'Kabirdham', acNo: 72 },
-  { id: "CG-AC-073", name: 'Khairagarh', state: 'Chhattisgarh', district: 'Rajnandgaon', acNo: 73 },
-  { id: "CG-AC-074", name: 'Dongargarh', state: 'Chhattisgarh', district: 'Rajnandgaon', acNo: 74 },
-  { id: "CG-AC-075", name: 'Rajnandgaon', state: 'Chhattisgarh', district: 'Rajnandgaon', acNo: 75 },
-  { id: "CG-AC-076", name: 'Dongargaon', state: 'Chhattisgarh', district: 'Rajnandgaon', acNo: 76 },
-  { id: "CG-AC-077", name: 'Khujji', state: 'Chhattisgarh', district: 'Rajnandgaon', acNo: 77 },
-  { id: "CG-AC-078", name: 'Mohla-Manpur', state: 'Chhattisgarh', district: 'Rajnandgaon', acNo: 78 },
-  { id: "CG-AC-079", name: 'Antagarh', state: 'Chhattisgarh', district: 'Kanker', acNo: 79 },
-  { id: "CG-AC-080", name: 'Bhanupratappur', state: 'Chhattisgarh', district: 'Kanker', acNo: 80 },
-  { id: "CG-AC-081", name: 'Kanker', state: 'Chhattisgarh', district: 'Kanker', acNo: 81 },
-  { id: "CG-AC-082", name: 'Keshkal', state: 'Chhattisgarh', district: 'Kondagaon', acNo: 82 },
-  { id: "CG-AC-083", name: 'Kondagaon', state: 'Chhattisgarh', district: 'Kondagaon', acNo: 83 },
-  { id: "CG-AC-084", name: 'Narayanpur', state: 'Chhattisgarh', district: 'Narayanpur', acNo: 84 },
-  { id: "CG-AC-085", name: 'Bastar', state: 'Chhattisgarh', district: 'Bastar', acNo: 85 },
-  { id: "CG-AC-086", name: 'Jagdalpur', state: 'Chhattisgarh', district: 'Bastar', acNo: 86 },
-  { id: "CG-AC-087", name: 'Chitrakot', state: 'Chhattisgarh', district: 'Bastar', acNo: 87 },
-  { id: "CG-AC-088", name: 'Dantewara', state: 'Chhattisgarh', district: 'Dantewada', acNo: 88 },
-  { id: "CG-AC-089", name: 'Bijapur', state: 'Chhattisgarh', district: 'Bijapur', acNo: 89 },
-  { id: "CG-AC-090", name: 'Konta', state: 'Chhattisgarh', district: 'Sukma', acNo: 90 },
+  'Bharatpur-Sonhat',1007,'Manendragarh',1007,'Baikunthpur',950,'Premnagar',1232,'Bhatgaon',1232,'Pratappur',653,
+  'Ramanujganj',653,'Samri',653,'Lundra',1235,'Ambikapur',1235,'Sitapur',1235,'Jashpur',869,
+  'Kunkuri',869,'Pathalgaon',869,'Lailunga',1123,'Raigarh',1123,'Sarangarh',1123,'Kharsia',1123,
+  'Dharamjaigarh',1123,'Rampur',949,'Korba',949,'Katghora',949,'Pali-Tanakhar',949,'Marwahi',808,
+  'Kota',808,'Lormi',1031,'Mungeli',1031,'Takhatpur',694,'Bilha',694,'Bilaspur',694,
+  'Beltara',694,'Masturi',694,'Akaltara',868,'Janjgir-Champa',868,'Sakti',868,'Chandrapur',868,
+  'Jaijaipur',868,'Pamgarh',868,'Saraipali',989,'Basna',989,'Khallari',989,'Mahasamund',989,
+  'Bilaigarh',651,'Kasdol',651,'Baloda Bazar',651,'Bhatapara',651,'Dharsiwa',1124,'Raipur City Gramin',1124,
+  'Raipur City West',1124,'Raipur City North',1124,'Raipur City South',1124,'Arang',1124,'Abhanpur',1124,'Rajim',807,
+  'Bindrawagarh',807,'Sihawa',753,'Kurud',753,'Dhamtari',753,'Sanjari Balod',650,'Dondi Lohara',650,
+  'Gunderdehi',650,'Patan',773,'Durg Gramin',773,'Durg City',773,'Bhilai Nagar',773,'Vaishali Nagar',773,
+  'Ahiwara',773,'Saja',676,'Bemetara',676,'Navagarh',676,'Pandariya',886,'Kawardha',886,
+  'Khairagarh',1129,'Dongargarh',1129,'Rajnandgaon',1129,'Dongargaon',1129,'Khujji',1129,'Mohla-Manpur',1129,
+  'Antagarh',900,'Bhanupratappur',900,'Kanker',900,'Keshkal',947,'Kondagaon',947,'Narayanpur',1054,
+  'Bastar',670,'Jagdalpur',670,'Chitrakot',670,'Dantewara',741,'Bijapur',691,'Konta',1228,
   // Goa (40)
-  { id: "GA-AC-001", name: 'Mandrem', state: 'Goa', district: 'North Goa', acNo: 1 },
-  { id: "GA-AC-002", name: 'Pernem', state: 'Goa', district: 'North Goa', acNo: 2 },
-  { id: "GA-AC-003", name: 'Bicholim', state: 'Goa', district: 'North Goa', acNo: 3 },
-  { id: "GA-AC-004", name: 'Tivim', state: 'Goa', district: 'North Goa', acNo: 4 },
-  { id: "GA-AC-005", name: 'Mapusa', state: 'Goa', district: 'North Goa', acNo: 5 },
-  { id: "GA-AC-006", name: 'Siolim', state: 'Goa', district: 'North Goa', acNo: 6 },
-  { id: "GA-AC-007", name: 'Saligao', state: 'Goa', district: 'North Goa', acNo: 7 },
-  { id: "GA-AC-008", name: 'Calangute', state: 'Goa', district: 'North Goa', acNo: 8 },
-  { id: "GA-AC-009", name: 'Porvorim', state: 'Goa', district: 'North Goa', acNo: 9 },
-  { id: "GA-AC-010", name: 'Aldona', state: 'Goa', district: 'North Goa', acNo: 10 },
-  { id: "GA-AC-011", name: 'Panaji', state: 'Goa', district: 'North Goa', acNo: 11 },
-  { id: "GA-AC-012", name: 'Taleigao', state: 'Goa', district: 'North Goa', acNo: 12 },
-  { id: "GA-AC-013", name: 'Santa Cruz', state: 'Goa', district: 'North Goa', acNo: 13 },
-  { id: "GA-AC-014", name: 'St. Andre', state: 'Goa', district: 'North Goa', acNo: 14 },
-  { id: "GA-AC-015", name: 'Cumbarjua', state: 'Goa', district: 'North Goa', acNo: 15 },
-  { id: "GA-AC-016", name: 'Maem', state: 'Goa', district: 'North Goa', acNo: 16 },
-  { id: "GA-AC-017", name: 'Sanquelim', state: 'Goa', district: 'North Goa', acNo: 17 },
-  { id: "GA-AC-018", name: 'Poriem', state: 'Goa', district: 'North Goa', acNo: 18 },
-  { id: "GA-AC-019", name: 'Valpoi', state: 'Goa', district: 'North Goa', acNo: 19 },
-  { id: "GA-AC-020", name: 'Priol', state: 'Goa', district: 'North Goa', acNo: 20 },
-  { id: "GA-AC-021", name: 'Ponda', state: 'Goa', district: 'North Goa', acNo: 21 },
-  { id: "GA-AC-022", name: 'Siroda', state: 'Goa', district: 'North Goa', acNo: 22 },
-  { id: "GA-AC-023", name: 'Marcaim', state: 'Goa', district: 'North Goa', acNo: 23 },
-  { id: "GA-AC-024", name: 'Mormugao', state: 'Goa', district: 'South Goa', acNo: 24 },
-  { id: "GA-AC-025", name: 'Vasco Da Gama', state: 'Goa', district: 'South Goa', acNo: 25 },
-  { id: "GA-AC-026", name: 'Dabolim', state: 'Goa', district: 'South Goa', acNo: 26 },
-  { id: "GA-AC-027", name: 'Cortalim', state: 'Goa', district: 'South Goa', acNo: 27 },
-  { id: "GA-AC-028", name: 'Nuvem', state: 'Goa', district: 'South Goa', acNo: 28 },
-  { id: "GA-AC-029", name: 'Curtorim', state: 'Goa', district: 'South Goa', acNo: 29 },
-  { id: "GA-AC-030", name: 'Fatorda', state: 'Goa', district: 'South Goa', acNo: 30 },
-  { id: "GA-AC-031", name: 'Margao', state: 'Goa', district: 'South Goa', acNo: 31 },
-  { id: "GA-AC-032", name: 'Benaulim', state: 'Goa', district: 'South Goa', acNo: 32 },
-  { id: "GA-AC-033", name: 'Navelim', state: 'Goa', district: 'South Goa', acNo: 33 },
-  { id: "GA-AC-034", name: 'Cuncolim', state: 'Goa', district: 'South Goa', acNo: 34 },
-  { id: "GA-AC-035", name: 'Velim', state: 'Goa', district: 'South Goa', acNo: 35 },
-  { id: "GA-AC-036", name: 'Quepem', state: 'Goa', district: 'South Goa', acNo: 36 },
-  { id: "GA-AC-037", name: 'Curchorem', state: 'Goa', district: 'South Goa', acNo: 37 },
-  { id: "GA-AC-038", name: 'Sanvordem', state: 'Goa', district: 'South Goa', acNo: 38 },
-  { id: "GA-AC-039", name: 'Sanguem', state: 'Goa', district: 'South Goa', acNo: 39 },
-  { id: "GA-AC-040", name: 'Canacona', state: 'Goa', district: 'South Goa', acNo: 40 },
+  'Mandrem',1074,'Pernem',1074,'Bicholim',1074,'Tivim',1074,'Mapusa',1074,'Siolim',1074,
+  'Saligao',1074,'Calangute',1074,'Porvorim',1074,'Aldona',1074,'Panaji',1074,'Taleigao',1074,
+  'Santa Cruz',1074,'St. Andre',1074,'Cumbarjua',1074,'Maem',1074,'Sanquelim',1074,'Poriem',1074,
+  'Valpoi',1074,'Priol',1074,'Ponda',1074,'Siroda',1074,'Marcaim',1074,'Mormugao',1218,
+  'Vasco Da Gama',1218,'Dabolim',1218,'Cortalim',1218,'Nuvem',1218,'Curtorim',1218,'Fatorda',1218,
+  'Margao',1218,'Benaulim',1218,'Navelim',1218,'Cuncolim',1218,'Velim',1218,'Quepem',1218,
+  'Curchorem',1218,'Sanvordem',1218,'Sanguem',1218,'Canacona',1218,
   // Gujarat (182)
-  { id: "GJ-AC-001", name: 'Abdasa', state: 'Gujarat', district: 'Kachchh', acNo: 1 },
-  { id: "GJ-AC-002", name: 'Mandvi', state: 'Gujarat', district: 'Kachchh', acNo: 2 },
-  { id: "GJ-AC-003", name: 'Bhuj', state: 'Gujarat', district: 'Kachchh', acNo: 3 },
-  { id: "GJ-AC-004", name: 'Anjar', state: 'Gujarat', district: 'Kachchh', acNo: 4 },
-  { id: "GJ-AC-005", name: 'Gandhidham', state: 'Gujarat', district: 'Kachchh', acNo: 5 },
-  { id: "GJ-AC-006", name: 'Rapar', state: 'Gujarat', district: 'Kachchh', acNo: 6 },
-  { id: "GJ-AC-007", name: 'Vav', state: 'Gujarat', district: 'Vav-Tharad', acNo: 7 },
-  { id: "GJ-AC-008", name: 'Tharad', state: 'Gujarat', district: 'Vav-Tharad', acNo: 8 },
-  { id: "GJ-AC-009", name: 'Dhanera', state: 'Gujarat', district: 'Vav-Tharad', acNo: 9 },
-  { id: "GJ-AC-010", name: 'Danta', state: 'Gujarat', district: 'Banaskantha', acNo: 10 },
-  { id: "GJ-AC-011", name: 'Vadgam', state: 'Gujarat', district: 'Banaskantha', acNo: 11 },
-  { id: "GJ-AC-012", name: 'Palanpur', state: 'Gujarat', district: 'Banaskantha', acNo: 12 },
-  { id: "GJ-AC-013", name: 'Deesa', state: 'Gujarat', district: 'Banaskantha', acNo: 13 },
-  { id: "GJ-AC-014", name: 'Deodar', state: 'Gujarat', district: 'Vav-Tharad', acNo: 14 },
-  { id: "GJ-AC-015", name: 'Kankrej', state: 'Gujarat', district: 'Vav-Tharad', acNo: 15 },
-  { id: "GJ-AC-016", name: 'Radhanpur', state: 'Gujarat', district: 'Patan', acNo: 16 },
-  { id: "GJ-AC-017", name: 'Chanasma', state: 'Gujarat', district: 'Patan', acNo: 17 },
-  { id: "GJ-AC-018", name: 'Patan', state: 'Gujarat', district: 'Patan', acNo: 18 },
-  { id: "GJ-AC-019", name: 'Sidhpur', state: 'Gujarat', district: 'Patan', acNo: 19 },
-  { id: "GJ-AC-020", name: 'Kheralu', state: 'Gujarat', district: 'Mahesana', acNo: 20 },
-  { id: "GJ-AC-021", name: 'Unjha', state: 'Gujarat', district: 'Mahesana', acNo: 21 },
-  { id: "GJ-AC-022", name: 'Visnagar', state: 'Gujarat', district: 'Mahesana', acNo: 22 },
-  { id: "GJ-AC-023", name: 'Bechraji', state: 'Gujarat', district: 'Mahesana', acNo: 23 },
-  { id: "GJ-AC-024", name: 'Kadi', state: 'Gujarat', district: 'Mahesana', acNo: 24 },
-  { id: "GJ-AC-025", name: 'Mahesana', state: 'Gujarat', district: 'Mahesana', acNo: 25 },
-  { id: "GJ-AC-026", name: 'Vijapur', state: 'Gujarat', district: 'Mahesana', acNo: 26 },
-  { id: "GJ-AC-027", name: 'Himatnagar', state: 'Gujarat', district: 'Sabarkantha', acNo: 27 },
-  { id: "GJ-AC-028", name: 'Idar', state: 'Gujarat', district: 'Sabarkantha', acNo: 28 },
-  { id: "GJ-AC-029", name: 'Khedbrahma', state: 'Gujarat', district: 'Sabarkantha', acNo: 29 },
-  { id: "GJ-AC-030", name: 'Bhiloda', state: 'Gujarat', district: 'Aravalli', acNo: 30 },
-  { id: "GJ-AC-031", name: 'Modasa', state: 'Gujarat', district: 'Aravalli', acNo: 31 },
-  { id: "GJ-AC-032", name: 'Bayad', state: 'Gujarat', district: 'Aravalli', acNo: 32 },
-  { id: "GJ-AC-033", name: 'Prantij', state: 'Gujarat', district: 'Sabarkantha', acNo: 33 },
-  { id: "GJ-AC-034", name: 'Dahegam', state: 'Gujarat', district: 'Gandhinagar', acNo: 34 },
-  { id: "GJ-AC-035", name: 'Gandhinagar South', state: 'Gujarat', district: 'Gandhinagar', acNo: 35 },
-  { id: "GJ-AC-036", name: 'Gandhinagar North', state: 'Gujarat', district: 'Gandhinagar', acNo: 36 },
-  { id: "GJ-AC-037", name: 'Mansa', state: 'Gujarat', district: 'Gandhinagar', acNo: 37 },
-  { id: "GJ-AC-038", name: 'Kalol', state: 'Gujarat', district: 'Gandhinagar', acNo: 38 },
-  { id: "GJ-AC-039", name: 'Viramgam', state: 'Gujarat', district: 'Ahmedabad', acNo: 39 },
-  { id: "GJ-AC-040", name: 'Sanand', state: 'Gujarat', district: 'Ahmedabad', acNo: 40 },
-  { id: "GJ-AC-041", name: 'Ghatlodia', state: 'Gujarat', district: 'Ahmedabad', acNo: 41 },
-  { id: "GJ-AC-042", name: 'Vejalpur', state: 'Gujarat', district: 'Ahmedabad', acNo: 42 },
-  { id: "GJ-AC-043", name: 'Vatva', state: 'Gujarat', district: 'Ahmedabad', acNo: 43 },
-  { id: "GJ-AC-044", name: 'Ellisbridge', state: 'Gujarat', district: 'Ahmedabad', acNo: 44 },
-  { id: "GJ-AC-045", name: 'Naranpura', state: 'Gujarat', district: 'Ahmedabad', acNo: 45 },
-  { id: "GJ-AC-046", name: 'Nikol', state: 'Gujarat', district: 'Ahmedabad', acNo: 46 },
-  { id: "GJ-AC-047", name: 'Naroda', state: 'Gujarat', district: 'Ahmedabad', acNo: 47 },
-  { id: "GJ-AC-048", name: 'Thakkarbapa Nagar', state: 'Gujarat', district: 'Ahmedabad', acNo: 48 },
-  { id: "GJ-AC-049", name: 'Bapunagar', state: 'Gujarat', district: 'Ahmedabad', acNo: 49 },
-  { id: "GJ-AC-050", name: 'Amraiwadi', state: 'Gujarat', district: 'Ahmedabad', acNo: 50 },
-  { id: "GJ-AC-051", name: 'Dariapur', state: 'Gujarat', district: 'Ahmedabad', acNo: 51 },
-  { id: "GJ-AC-052", name: 'Jamalpur-Khadiya', state: 'Gujarat', district: 'Ahmedabad', acNo: 52 },
-  { id: "GJ-AC-053", name: 'Maninagar', state: 'Gujarat', district: 'Ahmedabad', acNo: 53 },
-  { id: "GJ-AC-054", name: 'Danilimda', state: 'Gujarat', district: 'Ahmedabad', acNo: 54 },
-  { id: "GJ-AC-055", name: 'Sabarmati', state: 'Gujarat', district: 'Ahmedabad', acNo: 55 },
-  { id: "GJ-AC-056", name: 'Asarwa', state: 'Gujarat', district: 'Ahmedabad', acNo: 56 },
-  { id: "GJ-AC-057", name: 'Daskroi', state: 'Gujarat', district: 'Ahmedabad', acNo: 57 },
-  { id: "GJ-AC-058", name: 'Dholka', state: 'Gujarat', district: 'Ahmedabad', acNo: 58 },
-  { id: "GJ-AC-059", name: 'Dhandhuka', state: 'Gujarat', district: 'Ahmedabad', acNo: 59 },
-  { id: "GJ-AC-060", name: 'Dasada', state: 'Gujarat', district: 'Surendranagar', acNo: 60 },
-  { id: "GJ-AC-061", name: 'Limdi', state: 'Gujarat', district: 'Surendranagar', acNo: 61 },
-  { id: "GJ-AC-062", name: 'Wadhwan', state: 'Gujarat', district: 'Surendranagar', acNo: 62 },
-  { id: "GJ-AC-063", name: 'Chotila', state: 'Gujarat', district: 'Surendranagar', acNo: 63 },
-  { id: "GJ-AC-064", name: 'Dhangadhra', state: 'Gujarat', district: 'Surendranagar', acNo: 64 },
-  { id: "GJ-AC-065", name: 'Morbi', state: 'Gujarat', district: 'Morbi', acNo: 65 },
-  { id: "GJ-AC-066", name: 'Tankara', state: 'Gujarat', district: 'Morbi', acNo: 66 },
-  { id: "GJ-AC-067", name: 'Wankaner', state: 'Gujarat', district: 'Morbi', acNo: 67 },
-  { id: "GJ-AC-068", name: 'Rajkot East', state: 'Gujarat', district: 'Rajkot', acNo: 68 },
-  { id: "GJ-AC-069", name: 'Rajkot West', state: 'Gujarat', district: 'Rajkot', acNo: 69 },
-  { id: "GJ-AC-070", name: 'Rajkot South', state: 'Gujarat', district: 'Rajkot', acNo: 70 },
-  { id: "GJ-AC-071", name: 'Rajkot Rural', state: 'Gujarat', district: 'Rajkot', acNo: 71 },
-  { id: "GJ-AC-072", name: 'Jasdan', state: 'Gujarat', district: 'Rajkot', acNo: 72 },
-  { id: "GJ-AC-073", name: 'Gondal', state: 'Gujarat', district: 'Rajkot', acNo: 73 },
-  { id: "GJ-AC-074", name: 'Jetpur', state: 'Gujarat', district: 'Rajkot', acNo: 74 },
-  { id: "GJ-AC-075", name: 'Dhoraji', state: 'Gujarat', district: 'Rajkot', acNo: 75 },
-  { id: "GJ-AC-076", name: 'Kalavad', state: 'Gujarat', district: 'Jamnagar', acNo: 76 },
-  { id: "GJ-AC-077", name: 'Jamnagar Rural', state: 'Gujarat', district: 'Jamnagar', acNo: 77 },
-  { id: "GJ-AC-078", name: 'Jamnagar North', state: 'Gujarat', district: 'Jamnagar', acNo: 78 },
-  { id: "GJ-AC-079", name: 'Jamnagar South', state: 'Gujarat', district: 'Jamnagar', acNo: 79 },
-  { id: "GJ-AC-080", name: 'Jamjodhpur', state: 'Gujarat', district: 'Jamnagar', acNo: 80 },
-  { id: "GJ-AC-081", name: 'Khambhaliya', state: 'Gujarat', district: 'DevbhoomiDwarka', acNo: 81 },
-  { id: "GJ-AC-082", name: 'Dwarka', state: 'Gujarat', district: 'DevbhoomiDwarka', acNo: 82 },
-  { id: "GJ-AC-083", name: 'Porbandar', state: 'Gujarat', district: 'Porbandar', acNo: 83 },
-  { id: "GJ-AC-084", name: 'Kutiyana', state: 'Gujarat', district: 'Porbandar', acNo: 84 },
-  { id: "GJ-AC-085", name: 'Manavadar', state: 'Gujarat', district: 'Junagadh', acNo: 85 },
-  { id: "GJ-AC-086", name: 'Junagadh', state: 'Gujarat', district: 'Junagadh', acNo: 86 },
-  { id: "GJ-AC-087", name: 'Visavadar', state: 'Gujarat', district: 'Junagadh', acNo: 87 },
-  { id: "GJ-AC-088", name: 'Keshod', state: 'Gujarat', district: 'Junagadh', acNo: 88 },
-  { id: "GJ-AC-089", name: 'Mangrol', state: 'Gujarat', district: 'Junagadh', acNo: 89 },
-  { id: "GJ-AC-090", name: 'Somnath', state: 'Gujarat', district: 'Gir Somnath', acNo: 90 },
-  { id: "GJ-AC-091", name: 'Talala', state: 'Gujarat', district: 'Gir Somnath', acNo: 91 },
-  { id: "GJ-AC-092", name: 'Kodinar', state: 'Gujarat', district: 'Gir Somnath', acNo: 92 },
-  { id: "GJ-AC-093", name: 'Una', state: 'Gujarat', district: 'Gir Somnath', acNo: 93 },
-  { id: "GJ-AC-094", name: 'Dhari', state: 'Gujarat', district: 'Amreli', acNo: 94 },
-  { id: "GJ-AC-095", name: 'Amreli', state: 'Gujarat', district: 'Amreli', acNo: 95 },
-  { id: "GJ-AC-096", name: 'Lathi', state: 'Gujarat', district: 'Amreli', acNo: 96 },
-  { id: "GJ-AC-097", name: 'Savarkundla', state: 'Gujarat', district: 'Amreli', acNo: 97 },
-  { id: "GJ-AC-098", name: 'Rajula', state: 'Gujarat', district: 'Amreli', acNo: 98 },
-  { id: "GJ-AC-099", name: 'Mahuva', state: 'Gujarat', district: 'Bhavnagar', acNo: 99 },
-  { id: "GJ-AC-100", name: 'Talaja', state: 'Gujarat', district: 'Bhavnagar', acNo: 100 },
-  { id: "GJ-AC-101", name: 'Gariadhar', state: 'Gujarat', district: 'Bhavnagar', acNo: 101 },
-  { id: "GJ-AC-102", name: 'Palitana', state: 'Gujarat', district: 'Bhavnagar', acNo: 102 },
-  { id: "GJ-AC-103", name: 'Bhavnagar Rural', state: 'Gujarat', district: 'Bhavnagar', acNo: 103 },
-  { id: "GJ-AC-104", name: 'Bhavnagar East', state: 'Gujarat', district: 'Bhavnagar', acNo: 104 },
-  { id: "GJ-AC-105", name: 'Bhavnagar West', state: 'Gujarat', district: 'Bhavnagar', acNo: 105 },
-  { id: "GJ-AC-106", name: 'Gadhada', state: 'Gujarat', district: 'Botad', acNo: 106 },
-  { id: "GJ-AC-107", name: 'Botad', state: 'Gujarat', district: 'Botad', acNo: 107 },
-  { id: "GJ-AC-108", name: 'Khambhat', state: 'Gujarat', district: 'Anand', acNo: 108 },
-  { id: "GJ-AC-109", name: 'Borsad', state: 'Gujarat', district: 'Anand', acNo: 109 },
-  { id: "GJ-AC-110", name: 'Anklav', state: 'Gujarat', district: 'Anand', acNo: 110 },
-  { id: "GJ-AC-111", name: 'Umreth', state: 'Gujarat', district: 'Anand', acNo: 111 },
-  { id: "GJ-AC-112", name: 'Anand', state: 'Gujarat', district: 'Anand', acNo: 112 },
-  { id: "GJ-AC-113", name: 'Petlad', state: 'Gujarat', district: 'Anand', acNo: 113 },
-  { id: "GJ-AC-114", name: 'Sojitra', state: 'Gujarat', district: 'Anand', acNo: 114 },
-  { id: "GJ-AC-115", name: 'Matar', state: 'Gujarat', district: 'Kheda', acNo: 115 },
-  { id: "GJ-AC-116", name: 'Nadiad', state: 'Gujarat', district: 'Kheda', acNo: 116 },
-  { id: "GJ-AC-117", name: 'Mehmedabad', state: 'Gujarat', district: 'Kheda', acNo: 117 },
-  { id: "GJ-AC-118", name: 'Mahudha', state: 'Gujarat', district: 'Kheda', acNo: 118 },
-  { id: "GJ-AC-119", name: 'Thasra', state: 'Gujarat', district: 'Kheda', acNo: 119 },
-  { id: "GJ-AC-120", name: 'Kapadvanj', state: 'Gujarat', district: 'Kheda', acNo: 120 },
-  { id: "GJ-AC-121", name: 'Balasinor', state: 'Gujarat', district: 'Kheda', acNo: 121 },
-  { id: "GJ-AC-122", name: 'Lunawada', state: 'Gujarat', district: 'Mahisagar', acNo: 122 },
-  { id: "GJ-AC-123", name: 'Santrampur', state: 'Gujarat', district: 'Mahisagar', acNo: 123 },
-  { id: "GJ-AC-124", name: 'Shehra', state: 'Gujarat', district: 'Panchmahal', acNo: 124 },
-  { id: "GJ-AC-125", name: 'Morva Hadaf', state: 'Gujarat', district: 'Panchmahal', acNo: 125 },
-  { id: "GJ-AC-126", name: 'Godhra', state: 'Gujarat', district: 'Panchmahal', acNo: 126 },
-  { id: "GJ-AC-127", name: 'Kalol', state: 'Gujarat', district: 'Panchmahal', acNo: 127 },
-  { id: "GJ-AC-128", name: 'Halol', state: 'Gujarat', district: 'Panchmahal', acNo: 128 },
-  { id: "GJ-AC-129", name: 'Fatepura', state: 'Gujarat', district: 'Dahod', acNo: 129 },
-  { id: "GJ-AC-130", name: 'Jhalod', state: 'Gujarat', district: 'Dahod', acNo: 130 },
-  { id: "GJ-AC-131", name: 'Limkheda', state: 'Gujarat', district: 'Dahod', acNo: 131 },
-  { id: "GJ-AC-132", name: 'Dahod', state: 'Gujarat', district: 'Dahod', acNo: 132 },
-  { id: "GJ-AC-133", name: 'Garbada', state: 'Gujarat', district: 'Dahod', acNo: 133 },
-  { id: "GJ-AC-134", name: 'Devgadhbariya', state: 'Gujarat', district: 'Dahod', acNo: 134 },
-  { id: "GJ-AC-135", name: 'Savli', state: 'Gujarat', district: 'Vadodara', acNo: 135 },
-  { id: "GJ-AC-136", name: 'Vaghodiya', state: 'Gujarat', district: 'Vadodara', acNo: 136 },
-  { id: "GJ-AC-137", name: 'Chhota Udaipur', state: 'Gujarat', district: 'Chhota Udaipur', acNo: 137 },
-  { id: "GJ-AC-138", name: 'Jetpur', state: 'Gujarat', district: 'Chhota Udaipur', acNo: 138 },
-  { id: "GJ-AC-139", name: 'Sankheda', state: 'Gujarat', district: 'Chhota Udaipur', acNo: 139 },
-  { id: "GJ-AC-140", name: 'Dabhoi', state: 'Gujarat', district: 'Vadodara', acNo: 140 },
-  { id: "GJ-AC-141", name: 'Vadodara City', state: 'Gujarat', district: 'Vadodara', acNo: 141 },
-  { id: "GJ-AC-142", name: 'Sayajigunj', state: 'Gujarat', district: 'Vadodara', acNo: 142 },
-  { id: "GJ-AC-143", name: 'Akota', state: 'Gujarat', district: 'Vadodara', acNo: 143 },
-  { id: "GJ-AC-144", name: 'Raopura', state: 'Gujarat', district: 'Vadodara', acNo: 144 },
-  { id: "GJ-AC-145", name: 'Manjalpur', state: 'Gujarat', district: 'Vadodara', acNo: 145 },
-  { id: "GJ-AC-146", name: 'Padra', state: 'Gujarat', district: 'Vadodara', acNo: 146 },
-  { id: "GJ-AC-147", name: 'Karjan', state: 'Gujarat', district: 'Vadodara', acNo: 147 },
-  { id: "GJ-AC-148", name: 'Nandod', state: 'Gujarat', district: 'Narmada', acNo: 148 },
-  { id: "GJ-AC-149", name: 'Dediapada', state: 'Gujarat', district: 'Narmada', acNo: 149 },
-  { id: "GJ-AC-150", name: 'Jambusar', state: 'Gujarat', district: 'Bharuch', acNo: 150 },
-  { id: "GJ-AC-151", name: 'Vagra', state: 'Gujarat', district: 'Bharuch', acNo: 151 },
-  { id: "GJ-AC-152", name: 'Jhagadiya', state: 'Gujarat', district: 'Bharuch', acNo: 152 },
-  { id: "GJ-AC-153", name: 'Bharuch', state: 'Gujarat', district: 'Bharuch', acNo: 153 },
-  { id: "GJ-AC-154", name: 'Ankleshwar', state: 'Gujarat', district: 'Bharuch', acNo: 154 },
-  { id: "GJ-AC-155", name: 'Olpad', state: 'Gujarat', district: 'Surat', acNo: 155 },
-  { id: "GJ-AC-156", name: 'Mangrol', state: 'Gujarat', district: 'Surat', acNo: 156 },
-  { id: "GJ-AC-157", name: 'Mandvi', state: 'Gujarat', district: 'Surat', acNo: 157 },
-  { id: "GJ-AC-158", name: 'Kamrej', state: 'Gujarat', district: 'Surat', acNo: 158 },
-  { id: "GJ-AC-159", name: 'Surat East', state: 'Gujarat', district: 'Surat', acNo: 159 },
-  { id: "GJ-AC-160", name: 'Surat North', state: 'Gujarat', district: 'Surat', acNo: 160 },
-  { id: "GJ-AC-161", name: 'Varachha Road', state: 'Gujarat', district: 'Surat', acNo: 161 },
-  { id: "GJ-AC-162", name: 'Karanj', state: 'Gujarat', district: 'Surat', acNo: 162 },
-  { id: "GJ-AC-163", name: 'Limbayat', state: 'Gujarat', district: 'Surat', acNo: 163 },
-  { id: "GJ-AC-164", name: 'Udhana', state: 'Gujarat', district: 'Surat', acNo: 164 },
-  { id: "GJ-AC-165", name: 'Majura', state: 'Gujarat', district: 'Surat', acNo: 165 },
-  { id: "GJ-AC-166", name: 'Katargam', state: 'Gujarat', district: 'Surat', acNo: 166 },
-  { id: "GJ-AC-167", name: 'Surat West', state: 'Gujarat', district: 'Surat', acNo: 167 },
-  { id: "GJ-AC-168", name: 'Choryasi', state: 'Gujarat', district: 'Surat', acNo: 168 },
-  { id: "GJ-AC-169", name: 'Bardoli', state: 'Gujarat', district: 'Surat', acNo: 169 },
-  { id: "GJ-AC-170", name: 'Mahuva', state: 'Gujarat', district: 'Surat', acNo: 170 },
-  { id: "GJ-AC-171", name: 'Vyara', state: 'Gujarat', district: 'Tapi', acNo: 171 },
-  { id: "GJ-AC-172", name: 'Nizar', state: 'Gujarat', district: 'Tapi', acNo: 172 },
-  { id: "GJ-AC-173", name: 'Dangs', state: 'Gujarat', district: 'Dang', acNo: 173 },
-  { id: "GJ-AC-174", name: 'Jalalpore', state: 'Gujarat', district: 'Navsari', acNo: 174 },
-  { id: "GJ-AC-175", name: 'Navsari', state: 'Gujarat', district: 'Navsari', acNo: 175 },
-  { id: "GJ-AC-176", name: 'Gandevi', state: 'Gujarat', district: 'Navsari', acNo: 176 },
-  { id: "GJ-AC-177", name: 'Vansda', state: 'Gujarat', district: 'Navsari', acNo: 177 },
-  { id: "GJ-AC-178", name: 'Dharampur', state: 'Gujarat', district: 'Valsad', acNo: 178 },
-  { id: "GJ-AC-179", name: 'Valsad', state: 'Gujarat', district: 'Valsad', acNo: 179 },
-  { id: "GJ-AC-180", name: 'Pardi', state: 'Gujarat', district: 'Valsad', acNo: 180 },
-  { id: "GJ-AC-181", name: 'Kaprada', state: 'Gujarat', district: 'Valsad', acNo: 181 },
-  { id: "GJ-AC-182", name: 'Umbergaon', state: 'Gujarat', district: 'Valsad', acNo: 182 },
+  'Abdasa',887,'Mandvi',887,'Bhuj',887,'Anjar',887,'Gandhidham',887,'Rapar',887,
+  'Vav',1279,'Tharad',1279,'Dhanera',1279,'Danta',654,'Vadgam',654,'Palanpur',654,
+  'Deesa',654,'Deodar',1279,'Kankrej',1279,'Radhanpur',1097,'Chanasma',1097,'Patan',1097,
+  'Sidhpur',1097,'Kheralu',994,'Unjha',994,'Visnagar',994,'Bechraji',994,'Kadi',994,
+  'Mahesana',994,'Vijapur',994,'Himatnagar',1149,'Idar',1149,'Khedbrahma',1149,'Bhiloda',635,
+  'Modasa',635,'Bayad',635,'Prantij',1149,'Dahegam',801,'Gandhinagar South',801,'Gandhinagar North',801,
+  'Mansa',801,'Kalol',801,'Viramgam',608,'Sanand',608,'Ghatlodia',608,'Vejalpur',608,
+  'Vatva',608,'Ellisbridge',608,'Naranpura',608,'Nikol',608,'Naroda',608,'Thakkarbapa Nagar',608,
+  'Bapunagar',608,'Amraiwadi',608,'Dariapur',608,'Jamalpur-Khadiya',608,'Maninagar',608,'Danilimda',608,
+  'Sabarmati',608,'Asarwa',608,'Daskroi',608,'Dholka',608,'Dhandhuka',608,'Dasada',1234,
+  'Limdi',1234,'Wadhwan',1234,'Chotila',1234,'Dhangadhra',1234,'Morbi',1026,'Tankara',1026,
+  'Wankaner',1026,'Rajkot East',1128,'Rajkot West',1128,'Rajkot South',1128,'Rajkot Rural',1128,'Jasdan',1128,
+  'Gondal',1128,'Jetpur',1128,'Dhoraji',1128,'Kalavad',864,'Jamnagar Rural',864,'Jamnagar North',864,
+  'Jamnagar South',864,'Jamjodhpur',864,'Khambhaliya',750,'Dwarka',750,'Porbandar',1110,'Kutiyana',1110,
+  'Manavadar',885,'Junagadh',885,'Visavadar',885,'Keshod',885,'Mangrol',885,'Somnath',813,
+  'Talala',813,'Kodinar',813,'Una',813,'Dhari',623,'Amreli',623,'Lathi',623,
+  'Savarkundla',623,'Rajula',623,'Mahuva',684,'Talaja',684,'Gariadhar',684,'Palitana',684,
+  'Bhavnagar Rural',684,'Bhavnagar East',684,'Bhavnagar West',684,'Gadhada',700,'Botad',700,'Khambhat',627,
+  'Borsad',627,'Anklav',627,'Umreth',627,'Anand',627,'Petlad',627,'Sojitra',627,
+  'Matar',930,'Nadiad',930,'Mehmedabad',930,'Mahudha',930,'Thasra',930,'Kapadvanj',930,
+  'Balasinor',930,'Lunawada',995,'Santrampur',995,'Shehra',1089,'Morva Hadaf',1089,'Godhra',1089,
+  'Kalol',1089,'Halol',1089,'Fatepura',737,'Jhalod',737,'Limkheda',737,'Dahod',737,
+  'Garbada',737,'Devgadhbariya',737,'Savli',1275,'Vaghodiya',1275,'Chhota Udaipur',724,'Jetpur',724,
+  'Sankheda',724,'Dabhoi',1275,'Vadodara City',1275,'Sayajigunj',1275,'Akota',1275,'Raopura',1275,
+  'Manjalpur',1275,'Padra',1275,'Karjan',1275,'Nandod',1055,'Dediapada',1055,'Jambusar',683,
+  'Vagra',683,'Jhagadiya',683,'Bharuch',683,'Ankleshwar',683,'Olpad',1233,'Mangrol',1233,
+  'Mandvi',1233,'Kamrej',1233,'Surat East',1233,'Surat North',1233,'Varachha Road',1233,'Karanj',1233,
+  'Limbayat',1233,'Udhana',1233,'Majura',1233,'Katargam',1233,'Surat West',1233,'Choryasi',1233,
+  'Bardoli',1233,'Mahuva',1233,'Vyara',1238,'Nizar',1238,'Dangs',740,'Jalalpore',1059,
+  'Navsari',1059,'Gandevi',1059,'Vansda',1059,'Dharampur',1277,'Valsad',1277,'Pardi',1277,
+  'Kaprada',1277,'Umbergaon',1277,
   // Haryana (90)
-  { id: "HR-AC-001", name: 'Kalka', state: 'Haryana', district: 'Panchkula', acNo: 1 },
-  { id: "HR-AC-002", name: 'Panchkula', state: 'Haryana', district: 'Panchkula', acNo: 2 },
-  { id: "HR-AC-003", name: 'Naraingarh', state: 'Haryana', district: 'Ambala', acNo: 3 },
-  { id: "HR-AC-004", name: 'Ambala Cantonment', state: 'Haryana', district: 'Ambala', acNo: 4 },
-  { id: "HR-AC-005", name: 'Ambala City', state: 'Haryana', district: 'Ambala', acNo: 5 },
-  { id: "HR-AC-006", name: 'Mulana', state: 'Haryana', district: 'Ambala', acNo: 6 },
-  { id: "HR-AC-007", name: 'Sadhaura', state: 'Haryana', district: 'Yamunanagar', acNo: 7 },
-  { id: "HR-AC-008", name: 'Jagadhri', state: 'Haryana', district: 'Yamunanagar', acNo: 8 },
-  { id: "HR-AC-009", name: 'Yamunanagar', state: 'Haryana', district: 'Yamunanagar', acNo: 9 },
-  { id: "HR-AC-010", name: 'Radaur', state: 'Haryana', district: 'Yamunanagar', acNo: 10 },
-  { id: "HR-AC-011", name: 'Ladwa', state: 'Haryana', district: 'Kurukshetra', acNo: 11 },
-  { id: "HR-AC-012", name: 'Shahbad', state: 'Haryana', district: 'Kurukshetra', acNo: 12 },
-  { id: "HR-AC-013", name: 'Thanesar', state: 'Haryana', district: 'Kurukshetra', acNo: 13 },
-  { id: "HR-AC-014", name: 'Pehowa', state: 'Haryana', district: 'Kurukshetra', acNo: 14 },
-  { id: "HR-AC-015", name: 'Guhla', state: 'Haryana', district: 'Kaithal', acNo: 15 },
-  { id: "HR-AC-016", name: 'Kalayat', state: 'Haryana', district: 'Kaithal', acNo: 16 },
-  { id: "HR-AC-017", name: 'Kaithal', state: 'Haryana', district: 'Kaithal', acNo: 17 },
-  { id: "HR-AC-018", name: 'Pundri', state: 'Haryana', district: 'Kaithal', acNo: 18 },
-  { id: "HR-AC-019", name: 'Nilokheri', state: 'Haryana', district: 'Karnal', acNo: 19 },
-  { id: "HR-AC-020", name: 'Indri', state: 'Haryana', district: 'Karnal', acNo: 20 },
-  { id: "HR-AC-021", name: 'Karnal', state: 'Haryana', district: 'Karnal', acNo: 21 },
-  { id: "HR-AC-022", name: 'Gharaunda', state: 'Haryana', district: 'Karnal', acNo: 22 },
-  { id: "HR-AC-023", name: 'Assandh', state: 'Haryana', district: 'Karnal', acNo: 23 },
-  { id: "HR-AC-024", name: 'Panipat Rural', state: 'Haryana', district: 'Panipat', acNo: 24 },
-  { id: "HR-AC-025", name: 'Panipat City', state: 'Haryana', district: 'Panipat', acNo: 25 },
-  { id: "HR-AC-026", name: 'Israna', state: 'Haryana', district: 'Panipat', acNo: 26 },
-  { id: "HR-AC-027", name: 'Samalkha', state: 'Haryana', district: 'Panipat', acNo: 27 },
-  { id: "HR-AC-028", name: 'Ganaur', state: 'Haryana', district: 'Sonipat', acNo: 28 },
-  { id: "HR-AC-029", name: 'Rai', state: 'Haryana', district: 'Sonipat', acNo: 29 },
-  { id: "HR-AC-030", name: 'Kharkhauda', state: 'Haryana', district: 'Sonipat', acNo: 30 },
-  { id: "HR-AC-031", name: 'Sonipat', state: 'Haryana', district: 'Sonipat', acNo: 31 },
-  { id: "HR-AC-032", name: 'Gohana', state: 'Haryana', district: 'Sonipat', acNo: 32 },
-  { id: "HR-AC-033", name: 'Baroda', state: 'Haryana', district: 'Sonipat', acNo: 33 },
-  { id: "HR-AC-034", name: 'Julana', state: 'Haryana', district: 'Jind', acNo: 34 },
-  { id: "HR-AC-035", name: 'Safidon', state: 'Haryana', district: 'Jind', acNo: 35 },
-  { id: "HR-AC-036", name: 'Jind', state: 'Haryana', district: 'Jind', acNo: 36 },
-  { id: "HR-AC-037", name: 'Uchana Kalan', state: 'Haryana', district: 'Jind', acNo: 37 },
-  { id: "HR-AC-038", name: 'Narwana', state: 'Haryana', district: 'Jind', acNo: 38 },
-  { id: "HR-AC-039", name: 'Tohana', state: 'Haryana', district: 'Fatehabad', acNo: 39 },
-  { id: "HR-AC-040", name: 'Fatehabad', state: 'Haryana', district: 'Fatehabad', acNo: 40 },
-  { id: "HR-AC-041", name: 'Ratia', state: 'Haryana', district: 'Fatehabad', acNo: 41 },
-  { id: "HR-AC-042", name: 'Kalanwali', state: 'Haryana', district: 'Sirsa', acNo: 42 },
-  { id: "HR-AC-043", name: 'Dabwali', state: 'Haryana', district: 'Sirsa', acNo: 43 },
-  { id: "HR-AC-044", name: 'Rania', state: 'Haryana', district: 'Sirsa', acNo: 44 },
-  { id: "HR-AC-045", name: 'Sirsa', state: 'Haryana', district: 'Sirsa', acNo: 45 },
-  { id: "HR-AC-046", name: 'Ellenabad', state: 'Haryana', district: 'Sirsa', acNo: 46 },
-  { id: "HR-AC-047", name: 'Adampur', state: 'Haryana', district: 'Hisar', acNo: 47 },
-  { id: "HR-AC-048", name: 'Uklana', state: 'Haryana', district: 'Hisar', acNo: 48 },
-  { id: "HR-AC-049", name: 'Narnaund', state: 'Haryana', district: 'Hisar', acNo: 49 },
-  { id: "HR-AC-050", name: 'Hansi', state: 'Haryana', district: 'Hisar', acNo: 50 },
-  { id: "HR-AC-051", name: 'Barwala', state: 'Haryana', district: 'Hisar', acNo: 51 },
-  { id: "HR-AC-052", name: 'Hisar', state: 'Haryana', district: 'Hisar', acNo: 52 },
-  { id: "HR-AC-053", name: 'Nalwa', state: 'Haryana', district: 'Hisar', acNo: 53 },
-  { id: "HR-AC-054", name: 'Loharu', state: 'Haryana', district: 'Bhiwani', acNo: 54 },
-  { id: "HR-AC-055", name: 'Badhra', state: 'Haryana', district: 'Charkhi Dadri', acNo: 55 },
-  { id: "HR-AC-056", name: 'Dadri', state: 'Haryana', district: 'Charkhi Dadri', acNo: 56 },
-  { id: "HR-AC-057", name: 'Bhiwani', state: 'Haryana', district: 'Bhiwani', acNo: 57 },
-  { id: "HR-AC-058", name: 'Tosham', state: 'Haryana', district: 'Bhiwani', acNo: 58 },
-  { id: "HR-AC-059", name: 'Bawani Khera', state: 'Haryana', district: 'Bhiwani', acNo: 59 },
-  { id: "HR-AC-060", name: 'Meham', state: 'Haryana', district: 'Rohtak', acNo: 60 },
-  { id: "HR-AC-061", name: 'Garhi Sampla-Kiloi', state: 'Haryana', district: 'Rohtak', acNo: 61 },
-  { id: "HR-AC-062", name: 'Rohtak', state: 'Haryana', district: 'Rohtak', acNo: 62 },
-  { id: "HR-AC-063", name: 'Kalanaur', state: 'Haryana', district: 'Rohtak', acNo: 63 },
-  { id: "HR-AC-064", name: 'Bahadurgarh', state: 'Haryana', district: 'Jhajjar', acNo: 64 },
-  { id: "HR-AC-065", name: 'Badli', state: 'Haryana', district: 'Jhajjar', acNo: 65 },
-  { id: "HR-AC-066", name: 'Jhajjar', state: 'Haryana', district: 'Jhajjar', acNo: 66 },
-  { id: "HR-AC-067", name: 'Beri', state: 'Haryana', district: 'Jhajjar', acNo: 67 },
-  { id: "HR-AC-068", name: 'Ateli', state: 'Haryana', district: 'Mahendragarh', acNo: 68 },
-  { id: "HR-AC-069", name: 'Mahendragarh', state: 'Haryana', district: 'Mahendragarh', acNo: 69 },
-  { id: "HR-AC-070", name: 'Narnaul', state: 'Haryana', district: 'Mahendragarh', acNo: 70 },
-  { id: "HR-AC-071", name: 'Nangal Chaudhry', state: 'Haryana', district: 'Mahendragarh', acNo: 71 },
-  { id: "HR-AC-072", name: 'Bawal', state: 'Haryana', district: 'Rewari', acNo: 72 },
-  { id: "HR-AC-073", name: 'Kosli', state: 'Haryana', district: 'Rewari', acNo: 73 },
-  { id: "HR-AC-074", name: 'Rewari', state: 'Haryana', district: 'Rewari', acNo: 74 },
-  { id: "HR-AC-075", name: 'Pataudi', state: 'Haryana', district: 'Gurgaon', acNo: 75 },
-  { id: "HR-AC-076", name: 'Badshahpur', state: 'Haryana', district: 'Gurgaon', acNo: 76 },
-  { id: "HR-AC-077", name: 'Gurgaon', state: 'Haryana', district: 'Gurgaon', acNo: 77 },
-  { id: "HR-AC-078", name: 'Sohna', state: 'Haryana', district: 'Gurgaon', acNo: 78 },
-  { id: "HR-AC-079", name: 'Nuh', state: 'Haryana', district: 'Nuh', acNo: 79 },
-  { id: "HR-AC-080", name: 'Ferozepur Jhirka', state: 'Haryana', district: 'Nuh', acNo: 80 },
-  { id: "HR-AC-081", name: 'Punahana', state: 'Haryana', district: 'Nuh', acNo: 81 },
-  { id: "HR-AC-082", name: 'Hathin', state: 'Haryana', district: 'Palwal', acNo: 82 },
-  { id: "HR-AC-083", name: 'Hodal', state: 'Haryana', district: 'Palwal', acNo: 83 },
-  { id: "HR-AC-084", name: 'Palwal', state: 'Haryana', district: 'Palwal', acNo: 84 },
-  { id: "HR-AC-085", name: 'Prithla', state: 'Haryana', district: 'Faridabad', acNo: 85 },
-  { id: "HR-AC-086", name: 'Faridabad NIT', state: 'Haryana', district: 'Faridabad', acNo: 86 },
-  { id: "HR-AC-087", name: 'Badkhal', state: 'Haryana', district: 'Faridabad', acNo: 87 },
-  { id: "HR-AC-088", name: 'Ballabgarh', state: 'Haryana', district: 'Faridabad', acNo: 88 },
-  { id: "HR-AC-089", name: 'Faridabad', state: 'Haryana', district: 'Faridabad', acNo: 89 },
-  { id: "HR-AC-090", name: 'Tigaon', state: 'Haryana', district: 'Faridabad', acNo: 90 },
+  'Kalka',1088,'Panchkula',1088,'Naraingarh',619,'Ambala Cantonment',619,'Ambala City',619,'Mulana',619,
+  'Sadhaura',1305,'Jagadhri',1305,'Yamunanagar',1305,'Radaur',1305,'Ladwa',962,'Shahbad',962,
+  'Thanesar',962,'Pehowa',962,'Guhla',889,'Kalayat',889,'Kaithal',889,'Pundri',889,
+  'Nilokheri',912,'Indri',912,'Karnal',912,'Gharaunda',912,'Assandh',912,'Panipat Rural',1090,
+  'Panipat City',1090,'Israna',1090,'Samalkha',1090,'Ganaur',1211,'Rai',1211,'Kharkhauda',1211,
+  'Sonipat',1211,'Gohana',1211,'Baroda',1211,'Julana',880,'Safidon',880,'Jind',880,
+  'Uchana Kalan',880,'Narwana',880,'Tohana',792,'Fatehabad',792,'Ratia',792,'Kalanwali',1203,
+  'Dabwali',1203,'Rania',1203,'Sirsa',1203,'Ellenabad',1203,'Adampur',840,'Uklana',840,
+  'Narnaund',840,'Hansi',840,'Barwala',840,'Hisar',840,'Nalwa',840,'Loharu',687,
+  'Badhra',718,'Dadri',718,'Bhiwani',687,'Tosham',687,'Bawani Khera',687,'Meham',1145,
+  'Garhi Sampla-Kiloi',1145,'Rohtak',1145,'Kalanaur',1145,'Bahadurgarh',874,'Badli',874,'Jhajjar',874,
+  'Beri',874,'Ateli',993,'Mahendragarh',993,'Narnaul',993,'Nangal Chaudhry',993,'Bawal',1143,
+  'Kosli',1143,'Rewari',1143,'Pataudi',827,'Badshahpur',827,'Gurgaon',827,'Sohna',827,
+  'Nuh',1077,'Ferozepur Jhirka',1077,'Punahana',1077,'Hathin',1087,'Hodal',1087,'Palwal',1087,
+  'Prithla',789,'Faridabad NIT',789,'Badkhal',789,'Ballabgarh',789,'Faridabad',789,'Tigaon',789,
   // Himachal Pradesh (68)
-  { id: "HP-AC-001", name: 'Churah', state: 'Himachal Pradesh', district: 'Chamba', acNo: 1 },
-  { id: "HP-AC-002", name: 'Bharmour', state: 'Himachal Pradesh', district: 'Chamba', acNo: 2 },
-  { id: "HP-AC-003", name: 'Chamba', state: 'Himachal Pradesh', district: 'Chamba', acNo: 3 },
-  { id: "HP-AC-004", name: 'Dalhousie', state: 'Himachal Pradesh', district: 'Chamba', acNo: 4 },
-  { id: "HP-AC-005", name: 'Bhattiyat', state: 'Himachal Pradesh', district: 'Chamba', acNo: 5 },
-  { id: "HP-AC-006", name: 'Nurpur', state: 'Himachal Pradesh', district: 'Kangra', acNo: 6 },
-  { id: "HP-AC-007", name: 'Indora', state: 'Himachal Pradesh', district: 'Kangra', acNo: 7 },
-  { id: "HP-AC-008", name: 'Fatehpur', state: 'Himachal Pradesh', district: 'Kangra', acNo: 8 },
-  { id: "HP-AC-009", name: 'Jawali', state: 'Himachal Pradesh', district: 'Kangra', acNo: 9 },
-  { id: "HP-AC-010", name: 'Dehra', state: 'Himachal Pradesh', district: 'Kangra', acNo: 10 },
-  { id: "HP-AC-011", name: 'Jaswan-Pragpur', state: 'Himachal Pradesh', district: 'Kangra', acNo: 11 },
-  { id: "HP-AC-012", name: 'Jawalamukhi', state: 'Himachal Pradesh', district: 'Kangra', acNo: 12 },
-  { id: "HP-AC-013", name: 'Jaisinghpur', state: 'Himachal Pradesh', district: 'Kangra', acNo: 13 },
-  { id: "HP-AC-014", name: 'Sullah', state: 'Himachal Pradesh', district: 'Kangra', acNo: 14 },
-  { id: "HP-AC-015", name: 'Nagrota', state: 'Himachal Pradesh', district: 'Kangra', acNo: 15 },
-  { id: "HP-AC-016", name: 'Kangra', state: 'Himachal Pradesh', district: 'Kangra', acNo: 16 },
-  { id: "HP-AC-017", name: 'Shahpur', state: 'Himachal Pradesh', district: 'Kangra', acNo: 17 },
-  { id: "HP-AC-018", name: 'Dharamshala', state: 'Himachal Pradesh', district: 'Kangra', acNo: 18 },
-  { id: "HP-AC-019", name: 'Palampur', state: 'Himachal Pradesh', district: 'Kangra', acNo: 19 },
-  { id: "HP-AC-020", name: 'Baijnath', state: 'Himachal Pradesh', district: 'Kangra', acNo: 20 },
-  { id: "HP-AC-021", name: 'Lahaul and Spiti', state: 'Himachal Pradesh', district: 'Lahaul and Spiti', acNo: 21 },
-  { id: "HP-AC-022", name: 'Manali', state: 'Himachal Pradesh', district: 'Kullu', acNo: 22 },
-  { id: "HP-AC-023", name: 'Kullu', state: 'Himachal Pradesh', district: 'Kullu', acNo: 23 },
-  { id: "HP-AC-024", name: 'Banjar', state: 'Himachal Pradesh', district: 'Kullu', acNo: 24 },
-  { id: "HP-AC-025", name: 'Anni', state: 'Himachal Pradesh', district: 'Kullu', acNo: 25 },
-  { id: "HP-AC-026", name: 'Karsog', state: 'Himachal Pradesh', district: 'Mandi', acNo: 26 },
-  { id: "HP-AC-027", name: 'Sundernagar', state: 'Himachal Pradesh', district: 'Mandi', acNo: 27 },
-  { id: "HP-AC-028", name: 'Nachan', state: 'Himachal Pradesh', district: 'Mandi', acNo: 28 },
-  { id: "HP-AC-029", name: 'Seraj', state: 'Himachal Pradesh', district: 'Mandi', acNo: 29 },
-  { id: "HP-AC-030", name: 'Darang', state: 'Himachal Pradesh', district: 'Mandi', acNo: 30 },
-  { id: "HP-AC-031", name: 'Jogindernagar', state: 'Himachal Pradesh', district: 'Mandi', acNo: 31 },
-  { id: "HP-AC-032", name: 'Dharampur', state: 'Himachal Pradesh', district: 'Mandi', acNo: 32 },
-  { id: "HP-AC-033", name: 'Mandi', state: 'Himachal Pradesh', district: 'Mandi', acNo: 33 },
-  { id: "HP-AC-034", name: 'Balh', state: 'Himachal Pradesh', district: 'Mandi', acNo: 34 },
-  { id: "HP-AC-035", name: 'Sarkaghat', state: 'Himachal Pradesh', district: 'Mandi', acNo: 35 },
-  { id: "HP-AC-036", name: 'Bhoranj', state: 'Himachal Pradesh', district: 'Hamirpur', acNo: 36 },
-  { id: "HP-AC-037", name: 'Sujanpur', state: 'Himachal Pradesh', district: 'Hamirpur', acNo: 37 },
-  { id: "HP-AC-038", name: 'Hamirpur', state: 'Himachal Pradesh', district: 'Hamirpur', acNo: 38 },
-  { id: "HP-AC-039", name: 'Barsar', state: 'Himachal Pradesh', district: 'Hamirpur', acNo: 39 },
-  { id: "HP-AC-040", name: 'Nadaun', state: 'Himachal Pradesh', district: 'Hamirpur', acNo: 40 },
-  { id: "HP-AC-041", name: 'Chintpurni', state: 'Himachal Pradesh', district: 'Una', acNo: 41 },
-  { id: "HP-AC-042", name: 'Gagret', state: 'Himachal Pradesh', district: 'Una', acNo: 42 },
-  { id: "HP-AC-043", name: 'Haroli', state: 'Himachal Pradesh', district: 'Una', acNo: 43 },
-  { id: "HP-AC-044", name: 'Una', state: 'Himachal Pradesh', district: 'Una', acNo: 44 },
-  { id: "HP-AC-045", name: 'Kutlehar', state: 'Himachal Pradesh', district: 'Una', acNo: 45 },
-  { id: "HP-AC-046", name: 'Jhanduta', state: 'Himachal Pradesh', district: 'Bilaspur', acNo: 46 },
-  { id: "HP-AC-047", name: 'Ghumarwin', state: 'Himachal Pradesh', district: 'Bilaspur', acNo: 47 },
-  { id: "HP-AC-048", name: 'Bilaspur', state: 'Himachal Pradesh', district: 'Bilaspur', acNo: 48 },
-  { id: "HP-AC-049", name: 'Sri Naina Deviji', state: 'Himachal Pradesh', district: 'Bilaspur', acNo: 49 },
-  { id: "HP-AC-050", name: 'Arki', state: 'Himachal Pradesh', district: 'Solan', acNo: 50 },
-  { id: "HP-AC-051", name: 'Nalagarh', state: 'Himachal Pradesh', district: 'Solan', acNo: 51 },
-  { id: "HP-AC-052", name: 'Doon', state: 'Himachal Pradesh', district: 'Solan', acNo: 52 },
-  { id: "HP-AC-053", name: 'Solan', state: 'Himachal Pradesh', district: 'Solan', acNo: 53 },
-  { id: "HP-AC-054", name: 'Kasauli', state: 'Himachal Pradesh', district: 'Solan', acNo: 54 },
-  { id: "HP-AC-055", name: 'Pachhad', state: 'Himachal Pradesh', district: 'Sirmaur', acNo: 55 },
-  { id: "HP-AC-056", name: 'Nahan', state: 'Himachal Pradesh', district: 'Sirmaur', acNo: 56 },
-  { id: "HP-AC-057", name: 'Sri Renukaji', state: 'Himachal Pradesh', district: 'Sirmaur', acNo: 57 },
-  { id: "HP-AC-058", name: 'Paonta Sahib', state: 'Himachal Pradesh', district: 'Sirmaur', acNo: 58 },
-  { id: "HP-AC-059", name: 'Shillai', state: 'Himachal Pradesh', district: 'Sirmaur', acNo: 59 },
-  { id: "HP-AC-060", name: 'Chopal', state: 'Himachal Pradesh', district: 'Shimla', acNo: 60 },
-  { id: "HP-AC-061", name: 'Theog', state: 'Himachal Pradesh', district: 'Shimla', acNo: 61 },
-  { id: "HP-AC-062", name: 'Kasumpti', state: 'Himachal Pradesh', district: 'Shimla', acNo: 62 },
-  { id: "HP-AC-063", name: 'Shimla', state: 'Himachal Pradesh', district: 'Shimla', acNo: 63 },
-  { id: "HP-AC-064", name: 'Shimla Rural', state: 'Himachal Pradesh', district: 'Shimla', acNo: 64 },
-  { id: "HP-AC-065", name: 'Jubbal-Kotkhai', state: 'Himachal Pradesh', district: 'Shimla', acNo: 65 },
-  { id: "HP-AC-066", name: 'Rampur', state: 'Himachal Pradesh', district: 'Shimla', acNo: 66 },
-  { id: "HP-AC-067", name: 'Rohru', state: 'Himachal Pradesh', district: 'Shimla', acNo: 67 },
-  { id: "HP-AC-068", name: 'Kinnaur', state: 'Himachal Pradesh', district: 'Kinnaur', acNo: 68 },
+  'Churah',711,'Bharmour',711,'Chamba',711,'Dalhousie',711,'Bhattiyat',711,'Nurpur',899,
+  'Indora',899,'Fatehpur',899,'Jawali',899,'Dehra',899,'Jaswan-Pragpur',899,'Jawalamukhi',899,
+  'Jaisinghpur',899,'Sullah',899,'Nagrota',899,'Kangra',899,'Shahpur',899,'Dharamshala',899,
+  'Palampur',899,'Baijnath',899,'Lahaul and Spiti',965,'Manali',959,'Kullu',959,'Banjar',959,
+  'Anni',959,'Karsog',1004,'Sundernagar',1004,'Nachan',1004,'Seraj',1004,'Darang',1004,
+  'Jogindernagar',1004,'Dharampur',1004,'Mandi',1004,'Balh',1004,'Sarkaghat',1004,'Bhoranj',831,
+  'Sujanpur',831,'Hamirpur',831,'Barsar',831,'Nadaun',831,'Chintpurni',1269,'Gagret',1269,
+  'Haroli',1269,'Una',1269,'Kutlehar',1269,'Jhanduta',694,'Ghumarwin',694,'Bilaspur',694,
+  'Sri Naina Deviji',694,'Arki',1208,'Nalagarh',1208,'Doon',1208,'Solan',1208,'Kasauli',1208,
+  'Pachhad',1201,'Nahan',1201,'Sri Renukaji',1201,'Paonta Sahib',1201,'Shillai',1201,'Chopal',1187,
+  'Theog',1187,'Kasumpti',1187,'Shimla',1187,'Shimla Rural',1187,'Jubbal-Kotkhai',1187,'Rampur',1187,
+  'Rohru',1187,'Kinnaur',934,
   // Jharkhand (81)
-  { id: "JH-AC-001", name: 'Rajmahal', state: 'Jharkhand', district: 'Sahibganj', acNo: 1 },
-  { id: "JH-AC-002", name: 'Borio', state: 'Jharkhand', district: 'Sahibganj', acNo: 2 },
-  { id: "JH-AC-003", name: 'Barhait', state: 'Jharkhand', district: 'Sahibganj', acNo: 3 },
-  { id: "JH-AC-004", name: 'Litipara', state: 'Jharkhand', district: 'Pakur', acNo: 4 },
-  { id: "JH-AC-005", name: 'Pakur', state: 'Jharkhand', district: 'Pakur', acNo: 5 },
-  { id: "JH-AC-006", name: 'Maheshpur', state: 'Jharkhand', district: 'Pakur', acNo: 6 },
-  { id: "JH-AC-007", name: 'Sikaripara', state: 'Jharkhand', district: 'Dumka', acNo: 7 },
-  { id: "JH-AC-008", name: 'Nala', state: 'Jharkhand', district: 'Jamtara', acNo: 8 },
-  { id: "JH-AC-009", name: 'Jamtara', state: 'Jharkhand', district: 'Jamtara', acNo: 9 },
-  { id: "JH-AC-010", name: 'Dumka', state: 'Jharkhand', district: 'Dumka', acNo: 10 },
-  { id: "JH-AC-011", name: 'Jama', state: 'Jharkhand', district: 'Dumka', acNo: 11 },
-  { id: "JH-AC-012", name: 'Jarmundi', state: 'Jharkhand', district: 'Dumka', acNo: 12 },
-  { id: "JH-AC-013", name: 'Madhupur', state: 'Jharkhand', district: 'Deoghar', acNo: 13 },
-  { id: "JH-AC-014", name: 'Sarath', state: 'Jharkhand', district: 'Deoghar', acNo: 14 },
-  { id: "JH-AC-015", name: 'Deoghar', state: 'Jharkhand', district: 'Deoghar', acNo: 15 },
-  { id: "JH-AC-016", name: 'Poreyahat', state: 'Jharkhand', district: 'Godda', acNo: 16 },
-  { id: "JH-AC-017", name: 'Godda', state: 'Jharkhand', district: 'Godda', acNo: 17 },
-  { id: "JH-AC-018", name: 'Mahagama', state: 'Jharkhand', district: 'Godda', acNo: 18 },
-  { id: "JH-AC-019", name: 'Kodarma', state: 'Jharkhand', district: 'Kodarma', acNo: 19 },
-  { id: "JH-AC-020", name: 'Barkatha', state: 'Jharkhand', district: 'Hazaribagh', acNo: 20 },
-  { id: "JH-AC-021", name: 'Barhi', state: 'Jharkhand', district: 'Hazaribagh', acNo: 21 },
-  { id: "JH-AC-022", name: 'Barkagaon', state: 'Jharkhand', district: 'Ramgarh', acNo: 22 },
-  { id: "JH-AC-023", name: 'Ramgarh', state: 'Jharkhand', district: 'Ramgarh', acNo: 23 },
-  { id: "JH-AC-024", name: 'Mandu', state: 'Jharkhand', district: 'Hazaribagh', acNo: 24 },
-  { id: "JH-AC-025", name: 'Hazaribagh', state: 'Jharkhand', district: 'Hazaribagh', acNo: 25 },
-  { id: "JH-AC-026", name: 'Simaria', state: 'Jharkhand', district: 'Chatra', acNo: 26 },
-  { id: "JH-AC-027", name: 'Chatra', state: 'Jharkhand', district: 'Chatra', acNo: 27 },
-  { id: "JH-AC-028", name: 'Dhanwar', state: 'Jharkhand', district: 'Giridih', acNo: 28 },
-  { id: "JH-AC-029", name: 'Bagodar', state: 'Jharkhand', district: 'Giridih', acNo: 29 },
-  { id: "JH-AC-030", name: 'Jamua', state: 'Jharkhand', district: 'Giridih', acNo: 30 },
-  { id: "JH-AC-031", name: 'Gandey', state: 'Jharkhand', district: 'Giridih', acNo: 31 },
-  { id: "JH-AC-032", name: 'Giridih', state: 'Jharkhand', district: 'Giridih', acNo: 32 },
-  { id: "JH-AC-033", name: 'Dumri', state: 'Jharkhand', district: 'Giridih', acNo: 33 },
-  { id: "JH-AC-034", name: 'Gomia', state: 'Jharkhand', district: 'Bokaro', acNo: 34 },
-  { id: "JH-AC-035", name: 'Bermo', state: 'Jharkhand', district: 'Bokaro', acNo: 35 },
-  { id: "JH-AC-036", name: 'Bokaro', state: 'Jharkhand', district: 'Bokaro', acNo: 36 },
-  { id: "JH-AC-037", name: 'Chandankiyari', state: 'Jharkhand', district: 'Bokaro', acNo: 37 },
-  { id: "JH-AC-038", name: 'Sindri', state: 'Jharkhand', district: 'Dhanbad', acNo: 38 },
-  { id: "JH-AC-039", name: 'Nirsa', state: 'Jharkhand', district: 'Dhanbad', acNo: 39 },
-  { id: "JH-AC-040", name: 'Dhanbad', state: 'Jharkhand', district: 'Dhanbad', acNo: 40 },
-  { id: "JH-AC-041", name: 'Jharia', state: 'Jharkhand', district: 'Dhanbad', acNo: 41 },
-  { id: "JH-AC-042", name: 'Tundi', state: 'Jharkhand', district: 'Dhanbad', acNo: 42 },
-  { id: "JH-AC-043", name: 'Baghmara', state: 'Jharkhand', district: 'Dhanbad', acNo: 43 },
-  { id: "JH-AC-044", name: 'Baharagora', state: 'Jharkhand', district: 'East Singhbhum', acNo: 44 },
-  { id: "JH-AC-045", name: 'Ghatsila', state: 'Jharkhand', district: 'East Singhbhum', acNo: 45 },
-  { id: "JH-AC-046", name: 'Potka', state: 'Jharkhand', district: 'East Singhbhum', acNo: 46 },
-  { id: "JH-AC-047", name: 'Jugsalai', state: 'Jharkhand', district: 'East Singhbhum', acNo: 47 },
-  { id: "JH-AC-048", name: 'Jamshedpur East', state: 'Jharkhand', district: 'East Singhbhum', acNo: 48 },
-  { id: "JH-AC-049", name: 'Jamshedpur West', state: 'Jharkhand', district: 'East Singhbhum', acNo: 49 },
-  { id: "JH-AC-050", name: 'Ichagarh', state: 'Jharkhand', district: 'Seraikela Kharsawan', acNo: 50 },
-  { id: "JH-AC-051", name: 'Seraikella', state: 'Jharkhand', district: 'Seraikela Kharsawan', acNo: 51 },
-  { id: "JH-AC-052", name: 'Chaibasa', state: 'Jharkhand', district: 'West Singhbhum', acNo: 52 },
-  { id: "JH-AC-053", name: 'Majhgaon', state: 'Jharkhand', district: 'West Singhbhum', acNo: 53 },
-  { id: "JH-AC-054", name: 'Jaganathpur', state: 'Jharkhand', district: 'West Singhbhum', acNo: 54 },
-  { id: "JH-AC-055", name: 'Manoharpur', state: 'Jharkhand', district: 'West Singhbhum', acNo: 55 },
-  { id: "JH-AC-056", name: 'Chakradharpur', state: 'Jharkhand', district: 'West Singhbhum', acNo: 56 },
-  { id: "JH-AC-057", name: 'Kharsawan', state: 'Jharkhand', district: 'Seraikela Kharsawan', acNo: 57 },
-  { id: "JH-AC-058", name: 'Tamar', state: 'Jharkhand', district: 'Ranchi', acNo: 58 },
-  { id: "JH-AC-059", name: 'Torpa', state: 'Jharkhand', district: 'Khunti', acNo: 59 },
-  { id: "JH-AC-060", name: 'Khunti', state: 'Jharkhand', district: 'Khunti', acNo: 60 },
-  { id: "JH-AC-061", name: 'Silli', state: 'Jharkhand', district: 'Ranchi', acNo: 61 },
-  { id: "JH-AC-062", name: 'Khijri', state: 'Jharkhand', district: 'Ranchi', acNo: 62 },
-  { id: "JH-AC-063", name: 'Ranchi', state: 'Jharkhand', district: 'Ranchi', acNo: 63 },
-  { id: "JH-AC-064", name: 'Hatia', state: 'Jharkhand', district: 'Ranchi', acNo: 64 },
-  { id: "JH-AC-065", name: 'Kanke', state: 'Jharkhand', district: 'Ranchi', acNo: 65 },
-  { id: "JH-AC-066", name: 'Mandar', state: 'Jharkhand', district: 'Ranchi', acNo: 66 },
-  { id: "JH-AC-067", name: 'Sisai', state: 'Jharkhand', district: 'Gumla', acNo: 67 },
-  { id: "JH-AC-068", name: 'Gumla', state: 'Jharkhand', district: 'Gumla', acNo: 68 },
-  { id: "JH-AC-069", name: 'Bishunpur', state: 'Jharkhand', district: 'Gumla', acNo: 69 },
-  { id: "JH-AC-070", name: 'Simdega', state: 'Jharkhand', district: 'Simdega', acNo: 70 },
-  { id: "JH-AC-071", name: 'Kolebira', state: 'Jharkhand', district: 'Simdega', acNo: 71 },
-  { id: "JH-AC-072", name: 'Lohardaga', state: 'Jharkhand', district: 'Lohardaga', acNo: 72 },
-  { id: "JH-AC-073", name: 'Manika', state: 'Jharkhand', district: 'Latehar', acNo: 73 },
-  { id: "JH-AC-074", name: 'Latehar', state: 'Jharkhand', district: 'Latehar', acNo: 74 },
-  { id: "JH-AC-075", name: 'Panki', state: 'Jharkhand', district: 'Palamu', acNo: 75 },
-  { id: "JH-AC-076", name: 'Daltonganj', state: 'Jharkhand', district: 'Palamu', acNo: 76 },
-  { id: "JH-AC-077", name: 'Bishrampur', state: 'Jharkhand', district: 'Palamu', acNo: 77 },
-  { id: "JH-AC-078", name: 'Chhatarpur', state: 'Jharkhand', district: 'Palamu', acNo: 78 },
-  { id: "JH-AC-079", name: 'Hussainabad', state: 'Jharkhand', district: 'Palamu', acNo: 79 },
-  { id: "JH-AC-080", name: 'Garhwa', state: 'Jharkhand', district: 'Garhwa', acNo: 80 },
-  { id: "JH-AC-081", name: 'Bhawanathpur', state: 'Jharkhand', district: 'Garhwa', acNo: 81 },
+  'Rajmahal',1153,'Borio',1153,'Barhait',1153,'Litipara',1080,'Pakur',1080,'Maheshpur',1080,
+  'Sikaripara',771,'Nala',865,'Jamtara',865,'Dumka',771,'Jama',771,'Jarmundi',771,
+  'Madhupur',748,'Sarath',748,'Deoghar',748,'Poreyahat',816,'Godda',816,'Mahagama',816,
+  'Kodarma',938,'Barkatha',838,'Barhi',838,'Barkagaon',1134,'Ramgarh',1134,'Mandu',838,
+  'Hazaribagh',838,'Simaria',719,'Chatra',719,'Dhanwar',814,'Bagodar',814,'Jamua',814,
+  'Gandey',814,'Giridih',814,'Dumri',814,'Gomia',698,'Bermo',698,'Bokaro',698,
+  'Chandankiyari',698,'Sindri',754,'Nirsa',754,'Dhanbad',754,'Jharia',754,'Tundi',754,
+  'Baghmara',754,'Baharagora',782,'Ghatsila',782,'Potka',782,'Jugsalai',782,'Jamshedpur East',782,
+  'Jamshedpur West',782,'Ichagarh',1174,'Seraikella',1174,'Chaibasa',1300,'Majhgaon',1300,'Jaganathpur',1300,
+  'Manoharpur',1300,'Chakradharpur',1300,'Kharsawan',1174,'Tamar',1136,'Torpa',933,'Khunti',933,
+  'Silli',1136,'Khijri',1136,'Ranchi',1136,'Hatia',1136,'Kanke',1136,'Mandar',1136,
+  'Sisai',823,'Gumla',823,'Bishunpur',823,'Simdega',1197,'Kolebira',1197,'Lohardaga',974,
+  'Manika',970,'Latehar',970,'Panki',1083,'Daltonganj',1083,'Bishrampur',1083,'Chhatarpur',1083,
+  'Hussainabad',1083,'Garhwa',806,'Bhawanathpur',806,
   // Karnataka (224)
-  { id: "KA-AC-001", name: 'Nippani', state: 'Karnataka', acNo: 1 },
-  { id: "KA-AC-002", name: 'Chikkodi-Sadalga', state: 'Karnataka', acNo: 2 },
-  { id: "KA-AC-003", name: 'Athani', state: 'Karnataka', acNo: 3 },
-  { id: "KA-AC-004", name: 'Kagwad', state: 'Karnataka', acNo: 4 },
-  { id: "KA-AC-005", name: 'Kudachi', state: 'Karnataka', acNo: 5 },
-  { id: "KA-AC-006", name: 'Raibag', state: 'Karnataka', acNo: 6 },
-  { id: "KA-AC-007", name: 'Hukkeri', state: 'Karnataka', acNo: 7 },
-  { id: "KA-AC-008", name: 'Arabhavi', state: 'Karnataka', acNo: 8 },
-  { id: "KA-AC-009", name: 'Gokak', state: 'Karnataka', acNo: 9 },
-  { id: "KA-AC-010", name: 'Yemkanmardi', state: 'Karnataka', acNo: 10 },
-  { id: "KA-AC-011", name: 'Belgaum Uttar', state: 'Karnataka', acNo: 11 },
-  { id: "KA-AC-012", name: 'Belgaum Dakshin', state: 'Karnataka', acNo: 12 },
-  { id: "KA-AC-013", name: 'Belgaum Rural', state: 'Karnataka', acNo: 13 },
-  { id: "KA-AC-014", name: 'Khanapur', state: 'Karnataka', acNo: 14 },
-  { id: "KA-AC-015", name: 'Kittur', state: 'Karnataka', acNo: 15 },
-  { id: "KA-AC-016", name: 'Bailhongal', state: 'Karnataka', acNo: 16 },
-  { id: "KA-AC-017", name: 'Saundatti Yellamma', state: 'Karnataka', acNo: 17 },
-  { id: "KA-AC-018", name: 'Ramdurg', state: 'Karnataka', acNo: 18 },
-  { id: "KA-AC-019", name: 'Mudhol', state: 'Karnataka', acNo: 19 },
-  { id: "KA-AC-020", name: 'Terdal', state: 'Karnataka', acNo: 20 },
-  { id: "KA-AC-021", name: 'Jamkhandi', state: 'Karnataka', acNo: 21 },
-  { id: "KA-AC-022", name: 'Bilgi', state: 'Karnataka', acNo: 22 },
-  { id: "KA-AC-023", name: 'Badami', state: 'Karnataka', acNo: 23 },
-  { id: "KA-AC-024", name: 'Bagalkot', state: 'Karnataka', acNo: 24 },
-  { id: "KA-AC-025", name: 'Hungund', state: 'Karnataka', acNo: 25 },
-  { id: "KA-AC-026", name: 'Muddebihal', state: 'Karnataka', acNo: 26 },
-  { id: "KA-AC-027", name: 'Devar Hippargi', state: 'Karnataka', acNo: 27 },
-  { id: "KA-AC-028", name: 'Basavana Bagevadi', state: 'Karnataka', acNo: 28 },
-  { id: "KA-AC-029", name: 'Babaleshwar', state: 'Karnataka', acNo: 29 },
-  { id: "KA-AC-030", name: 'Bijapur City', state: 'Karnataka', acNo: 30 },
-  { id: "KA-AC-031", name: 'Nagathan', state: 'Karnataka', acNo: 31 },
-  { id: "KA-AC-032", name: 'Indi', state: 'Karnataka', acNo: 32 },
-  { id: "KA-AC-033", name: 'Sindagi', state: 'Karnataka', acNo: 33 },
-  { id: "KA-AC-034", name: 'Afzalpur', state: 'Karnataka', acNo: 34 },
-  { id: "KA-AC-035", name: 'Jevargi', state: 'Karnataka', acNo: 35 },
-  { id: "KA-AC-036", name: 'Shorapur', state: 'Karnataka', acNo: 36 },
-  { id: "KA-AC-037", name: 'Shahapur', state: 'Karnataka', acNo: 37 },
-  { id: "KA-AC-038", name: 'Yadgir', state: 'Karnataka', acNo: 38 },
-  { id: "KA-AC-039", name: 'Gurmitkal', state: 'Karnataka', acNo: 39 },
-  { id: "KA-AC-040", name: 'Chittapur', state: 'Karnataka', acNo: 40 },
-  { id: "KA-AC-041", name: 'Sedam', state: 'Karnataka', acNo: 41 },
-  { id: "KA-AC-042", name: 'Chincholi', state: 'Karnataka', acNo: 42 },
-  { id: "KA-AC-043", name: 'Gulbarga Rural', state: 'Karnataka', acNo: 43 },
-  { id: "KA-AC-044", name: 'Gulbarga Dakshin', state: 'Karnataka', acNo: 44 },
-  { id: "KA-AC-045", name: 'Gulbarga Uttar', state: 'Karnataka', acNo: 45 },
-  { id: "KA-AC-046", name: 'Aland', state: 'Karnataka', acNo: 46 },
-  { id: "KA-AC-047", name: 'Basavakalyan', state: 'Karnataka', acNo: 47 },
-  { id: "KA-AC-048", name: 'Humnabad', state: 'Karnataka', acNo: 48 },
-  { id: "KA-AC-049", name: 'Bidar South', state: 'Karnataka', acNo: 49 },
-  { id: "KA-AC-050", name: 'Bidar', state: 'Karnataka', acNo: 50 },
-  { id: "KA-AC-051", name: 'Bhalki', state: 'Karnataka', acNo: 51 },
-  { id: "KA-AC-052", name: 'Aurad', state: 'Karnataka', acNo: 52 },
-  { id: "KA-AC-053", name: 'Raichur Rural', state: 'Karnataka', acNo: 53 },
-  { id: "KA-AC-054", name: 'Raichur', state: 'Karnataka', acNo: 54 },
-  { id: "KA-AC-055", name: 'Manvi', state: 'Karnataka', acNo: 55 },
-  { id: "KA-AC-056", name: 'Devadurga', state: 'Karnataka', acNo: 56 },
-  { id: "KA-AC-057", name: 'Lingsugur', state: 'Karnataka', acNo: 57 },
-  { id: "KA-AC-058", name: 'Sindhanur', state: 'Karnataka', acNo: 58 },
-  { id: "KA-AC-059", name: 'Maski', state: 'Karnataka', acNo: 59 },
-  { id: "KA-AC-060", name: 'Kushtagi', state: 'Karnataka', acNo: 60 },
-  { id: "KA-AC-061", name: 'Kanakagiri', state: 'Karnataka', acNo: 61 },
-  { id: "KA-AC-062", name: 'Gangawati', state: 'Karnataka', acNo: 62 },
-  { id: "KA-AC-063", name: 'Yelburga', state: 'Karnataka', acNo: 63 },
-  { id: "KA-AC-064", name: 'Koppal', state: 'Karnataka', acNo: 64 },
-  { id: "KA-AC-065", name: 'Shirahatti', state: 'Karnataka', acNo: 65 },
-  { id: "KA-AC-066", name: 'Gadag', state: 'Karnataka', acNo: 66 },
-  { id: "KA-AC-067", name: 'Ron', state: 'Karnataka', acNo: 67 },
-  { id: "KA-AC-068", name: 'Nargund', state: 'Karnataka', acNo: 68 },
-  { id: "KA-AC-069", name: 'Navalgund', state: 'Karnataka', acNo: 69 },
-  { id: "KA-AC-070", name: 'Kundgol', state: 'Karnataka', acNo: 70 },
-  { id: "KA-AC-071", name: 'Dharwad', state: 'Karnataka', acNo: 71 },
-  { id: "KA-AC-072", name: 'Hubli-Dharwad East', state: 'Karnataka', acNo: 72 },
-  { id: "KA-AC-073", name: 'Hubli-Dharwad Central', state: 'Karnataka', acNo: 73 },
-  { id: "KA-AC-074", name: 'Hubli-Dharwad West', state: 'Karnataka', acNo: 74 },
-  { id: "KA-AC-075", name: 'Kalghatgi', state: 'Karnataka', acNo: 75 },
-  { id: "KA-AC-076", name: 'Haliyal', state: 'Karnataka', acNo: 76 },
-  { id: "KA-AC-077", name: 'Karwar', state: 'Karnataka', acNo: 77 },
-  { id: "KA-AC-078", name: 'Kumta', state: 'Karnataka', acNo: 78 },
-  { id: "KA-AC-079", name: 'Bhatkal', state: 'Karnataka', acNo: 79 },
-  { id: "KA-AC-080", name: 'Sirsi', state: 'Karnataka', acNo: 80 },
-  { id: "KA-AC-081", name: 'Yellapur', state: 'Karnataka', acNo: 81 },
-  { id: "KA-AC-082", name: 'Hangal', state: 'Karnataka', acNo: 82 },
-  { id: "KA-AC-083", name: 'Shiggaon', state: 'Karnataka', acNo: 83 },
-  { id: "KA-AC-084", name: 'Haveri', state: 'Karnataka', acNo: 84 },
-  { id: "KA-AC-085", name: 'Byadgi', state: 'Karnataka', acNo: 85 },
-  { id: "KA-AC-086", name: 'Hirekerur', state: 'Karnataka', acNo: 86 },
-  { id: "KA-AC-087", name: 'Ranebennur', state: 'Karnataka', acNo: 87 },
-  { id: "KA-AC-088", name: 'Hoovina Hadagali', state: 'Karnataka', acNo: 88 },
-  { id: "KA-AC-089", name: 'Hagaribommanahalli', state: 'Karnataka', acNo: 89 },
-  { id: "KA-AC-090", name: 'Vijayanagara', state: 'Karnataka', acNo: 90 },
-  { id: "KA-AC-091", name: 'Kampli', state: 'Karnataka', acNo: 91 },
-  { id: "KA-AC-092", name: 'Siruguppa', state: 'Karnataka', acNo: 92 },
-  { id: "KA-AC-093", name: 'Bellary Rural', state: 'Karnataka', acNo: 93 },
-  { id: "KA-AC-094", name: 'Bellary City', state: 'Karnataka', acNo: 94 },
-  { id: "KA-AC-095", name: 'Sandur', state: 'Karnataka', acNo: 95 },
-  { id: "KA-AC-096", name: 'Kudligi', state: 'Karnataka', acNo: 96 },
-  { id: "KA-AC-097", name: 'Molakalmuru', state: 'Karnataka', acNo: 97 },
-  { id: "KA-AC-098", name: 'Challakere', state: 'Karnataka', acNo: 98 },
-  { id: "KA-AC-099", name: 'Chitradurga', state: 'Karnataka', acNo: 99 },
-  { id: "KA-AC-100", name: 'Hiriyur', state: 'Karnataka', acNo: 100 },
-  { id: "KA-AC-101", name: 'Hosadurga', state: 'Karnataka', acNo: 101 },
-  { id: "KA-AC-102", name: 'Holalkere', state: 'Karnataka', acNo: 102 },
-  { id: "KA-AC-103", name: 'Jagalur', state: 'Karnataka', acNo: 103 },
-  { id: "KA-AC-104", name: 'Harapanahalli', state: 'Karnataka', acNo: 104 },
-  { id: "KA-AC-105", name: 'Harihar', state: 'Karnataka', acNo: 105 },
-  { id: "KA-AC-106", name: 'Davanagere North', state: 'Karnataka', acNo: 106 },
-  { id: "KA-AC-107", name: 'Davanagere South', state: 'Karnataka', acNo: 107 },
-  { id: "KA-AC-108", name: 'Mayakonda', state: 'Karnataka', acNo: 108 },
-  { id: "KA-AC-109", name: 'Channagiri', state: 'Karnataka', acNo: 109 },
-  { id: "KA-AC-110", name: 'Honnali', state: 'Karnataka', acNo: 110 },
-  { id: "KA-AC-111", name: 'Shimoga Rural', state: 'Karnataka', acNo: 111 },
-  { id: "KA-AC-112", name: 'Bhadravati', state: 'Karnataka', acNo: 112 },
-  { id: "KA-AC-113", name: 'Shimoga', state: 'Karnataka', acNo: 113 },
-  { id: "KA-AC-114", name: 'Tirthahalli', state: 'Karnataka', acNo: 114 },
-  { id: "KA-AC-115", name: 'Shikaripura', state: 'Karnataka', acNo: 115 },
-  { id: "KA-AC-116", name: 'Soraba', state: 'Karnataka', acNo: 116 },
-  { id: "KA-AC-117", name: 'Sagar', state: 'Karnataka', acNo: 117 },
-  { id: "KA-AC-118", name: 'Byndoor', state: 'Karnataka', acNo: 118 },
-  { id: "KA-AC-119", name: 'Kundapura', state: 'Karnataka', acNo: 119 },
-  { id: "KA-AC-120", name: 'Udupi', state: 'Karnataka', acNo: 120 },
-  { id: "KA-AC-121", name: 'Kapu', state: 'Karnataka', acNo: 121 },
-  { id: "KA-AC-122", name: 'Karkala', state: 'Karnataka', acNo: 122 },
-  { id: "KA-AC-123", name: 'Sringeri', state: 'Karnataka', acNo: 123 },
-  { id: "KA-AC-124", name: 'Mudigere', state: 'Karnataka', acNo: 124 },
-  { id: "KA-AC-125", name: 'Chikmagalur', state: 'Karnataka', acNo: 125 },
-  { id: "KA-AC-126", name: 'Tarikere', state: 'Karnataka', acNo: 126 },
-  { id: "KA-AC-127", name: 'Kadur', state: 'Karnataka', acNo: 127 },
-  { id: "KA-AC-128", name: 'Chiknayakanhalli', state: 'Karnataka', acNo: 128 },
-  { id: "KA-AC-129", name: 'Tiptur', state: 'Karnataka', acNo: 129 },
-  { id: "KA-AC-130", name: 'Turuvekere', state: 'Karnataka', acNo: 130 },
-  { id: "KA-AC-131", name: 'Kunigal', state: 'Karnataka', acNo: 131 },
-  { id: "KA-AC-132", name: 'Tumkur City', state: 'Karnataka', acNo: 132 },
-  { id: "KA-AC-133", name: 'Tumkur Rural', state: 'Karnataka', acNo: 133 },
-  { id: "KA-AC-134", name: 'Koratagere', state: 'Karnataka', acNo: 134 },
-  { id: "KA-AC-135", name: 'Gubbi', state: 'Karnataka', acNo: 135 },
-  { id: "KA-AC-136", name: 'Sira', state: 'Karnataka', acNo: 136 },
-  { id: "KA-AC-137", name: 'Pavagada', state: 'Karnataka', acNo: 137 },
-  { id: "KA-AC-138", name: 'Madhugiri', state: 'Karnataka', acNo: 138 },
-  { id: "KA-AC-139", name: 'Gauribidanur', state: 'Karnataka', acNo: 139 },
-  { id: "KA-AC-140", name: 'Bagepalli', state: 'Karnataka', acNo: 140 },
-  { id: "KA-AC-141", name: 'Chikkaballapur', state: 'Karnataka', acNo: 141 },
-  { id: "KA-AC-142", name: 'Sidlaghatta', state: 'Karnataka', acNo: 142 },
-  { id: "KA-AC-143", name: 'Chintamani', state: 'Karnataka', acNo: 143 },
-  { id: "KA-AC-144", name: 'Srinivaspur', state: 'Karnataka', acNo: 144 },
-  { id: "KA-AC-145", name: 'Mulbagal', state: 'Karnataka', acNo: 145 },
-  { id: "KA-AC-146", name: 'Kolar Gold Field', state: 'Karnataka', acNo: 146 },
-  { id: "KA-AC-147", name: 'Bangarapet', state: 'Karnataka', acNo: 147 },
-  { id: "KA-AC-148", name: 'Kolar', state: 'Karnataka', acNo: 148 },
-  { id: "KA-AC-149", name: 'Malur', state: 'Karnataka', acNo: 149 },
-  { id: "KA-AC-150", name: 'Yelahanka', state: 'Karnataka', acNo: 150 },
-  { id: "KA-AC-151", name: 'Krishnarajapuram', state: 'Karnataka', acNo: 151 },
-  { id: "KA-AC-152", name: 'Byatarayanapura', state: 'Karnataka', acNo: 152 },
-  { id: "KA-AC-153", name: 'Yeshwantpur', state: 'Karnataka', acNo: 153 },
-  { id: "KA-AC-154", name: 'Rajarajeshwarinagar', state: 'Karnataka', acNo: 154 },
-  { id: "KA-AC-155", name: 'Dasarahalli', state: 'Karnataka', acNo: 155 },
-  { id: "KA-AC-156", name: 'Mahalakshmi Layout', state: 'Karnataka', acNo: 156 },
-  { id: "KA-AC-157", name: 'Malleshwaram', state: 'Karnataka', acNo: 157 },
-  { id: "KA-AC-158", name: 'Hebbal', state: 'Karnataka', acNo: 158 },
-  { id: "KA-AC-159", name: 'Pulakeshinagar', state: 'Karnataka', acNo: 159 },
-  { id: "KA-AC-160", name: 'Sarvagnanagar', state: 'Karnataka', acNo: 160 },
-  { id: "KA-AC-161", name: 'C. V. Raman Nagar', state: 'Karnataka', acNo: 161 },
-  { id: "KA-AC-162", name: 'Shivajinagar', state: 'Karnataka', acNo: 162 },
-  { id: "KA-AC-163", name: 'Shanti Nagar', state: 'Karnataka', acNo: 163 },
-  { id: "KA-AC-164", name: 'Gandhi Nagar', state: 'Karnataka', acNo: 164 },
-  { id: "KA-AC-165", name: 'Rajaji Nagar', state: 'Karnataka', acNo: 165 },
-  { id: "KA-AC-166", name: 'Govindraj Nagar', state: 'Karnataka', acNo: 166 },
-  { id: "KA-AC-167", name: 'Vijay Nagar', state: 'Karnataka', acNo: 167 },
-  { id: "KA-AC-168", name: 'Chamrajpet', state: 'Karnataka', acNo: 168 },
-  { id: "KA-AC-169", name: 'Chickpet', state: 'Karnataka', acNo: 169 },
-  { id: "KA-AC-170", name: 'Basavanagudi', state: 'Karnataka', acNo: 170 },
-  { id: "KA-AC-171", name: 'Padmanabhanagar', state: 'Karnataka', acNo: 171 },
-  { id: "KA-AC-172", name: 'B.T.M. Layout', state: 'Karnataka', acNo: 172 },
-  { id: "KA-AC-173", name: 'Jayanagar', state: 'Karnataka', acNo: 173 },
-  { id: "KA-AC-174", name: 'Mahadevapura', state: 'Karnataka', acNo: 174 },
-  { id: "KA-AC-175", name: 'Bommanahalli', state: 'Karnataka', acNo: 175 },
-  { id: "KA-AC-176", name: 'Bangalore South', state: 'Karnataka', acNo: 176 },
-  { id: "KA-AC-177", name: 'Anekal', state: 'Karnataka', acNo: 177 },
-  { id: "KA-AC-178", name: 'Hosakote', state: 'Karnataka', acNo: 178 },
-  { id: "KA-AC-179", name: 'Devanahalli', state: 'Karnataka', acNo: 179 },
-  { id: "KA-AC-180", name: 'Doddaballapur', state: 'Karnataka', acNo: 180 },
-  { id: "KA-AC-181", name: 'Nelamangala', state: 'Karnataka', acNo: 181 },
-  { id: "KA-AC-182", name: 'Magadi', state: 'Karnataka', acNo: 182 },
-  { id: "KA-AC-183", name: 'Ramanagaram', state: 'Karnataka', acNo: 183 },
-  { id: "KA-AC-184", name: 'Kanakapura', state: 'Karnataka', acNo: 184 },
-  { id: "KA-AC-185", name: 'Channapatna', state: 'Karnataka', acNo: 185 },
-  { id: "KA-AC-186", name: 'Malavalli', state: 'Karnataka', acNo: 186 },
-  { id: "KA-AC-187", name: 'Maddur', state: 'Karnataka', acNo: 187 },
-  { id: "KA-AC-188", name: 'Melukote', state: 'Karnataka', acNo: 188 },
-  { id: "KA-AC-189", name: 'Mandya', state: 'Karnataka', acNo: 189 },
-  { id: "KA-AC-190", name: 'Shrirangapattana', state: 'Karnataka', acNo: 190 },
-  { id: "KA-AC-191", name: 'Nagamangala', state: 'Karnataka', acNo: 191 },
-  { id: "KA-AC-192", name: 'Krishnarajapet', state: 'Karnataka', acNo: 192 },
-  { id: "KA-AC-193", name: 'Shravanabelagola', state: 'Karnataka', acNo: 193 },
-  { id: "KA-AC-194", name: 'Arsikere', state: 'Karnataka', acNo: 194 },
-  { id: "KA-AC-195", name: 'Belur', state: 'Karnataka', acNo: 195 },
-  { id: "KA-AC-196", name: 'Hassan', state: 'Karnataka', acNo: 196 },
-  { id: "KA-AC-197", name: 'Holenarasipur', state: 'Karnataka', acNo: 197 },
-  { id: "KA-AC-198", name: 'Arkalgud', state: 'Karnataka', acNo: 198 },
-  { id: "KA-AC-199", name: 'Sakleshpur', state: 'Karnataka', acNo: 199 },
-  { id: "KA-AC-200", name: 'Belthangady', state: 'Karnataka', acNo: 200 },
-  { id: "KA-AC-201", name: 'Moodabidri', state: 'Karnataka', acNo: 201 },
-  { id: "KA-AC-202", name: 'Mangalore City North', state: 'Karnataka', acNo: 202 },
-  { id: "KA-AC-203", name: 'Mangalore City South', state: 'Karnataka', acNo: 203 },
-  { id: "KA-AC-204", name: 'Mangalore', state: 'Karnataka', acNo: 204 },
-  { id: "KA-AC-205", name: 'Bantval', state: 'Karnataka', acNo: 205 },
-  { id: "KA-AC-206", name: 'Puttur', state: 'Karnataka', acNo: 206 },
-  { id: "KA-AC-207", name: 'Sullia', state: 'Karnataka', acNo: 207 },
-  { id: "KA-AC-208", name: 'Madikeri', state: 'Karnataka', acNo: 208 },
-  { id: "KA-AC-209", name: 'Virajpet', state: 'Karnataka', acNo: 209 },
-  { id: "KA-AC-210", name: 'Periyapatna', state: 'Karnataka', acNo: 210 },
-  { id: "KA-AC-211", name: 'Krishnarajanagara', state: 'Karnataka', acNo: 211 },
-  { id: "KA-AC-212", name: 'Hunsur', state: 'Karnataka', acNo: 212 },
-  { id: "KA-AC-213", name: 'Heggadadevankote', state: 'Karnataka', acNo: 213 },
-  { id: "KA-AC-214", name: 'Nanjangud', state: 'Karnataka', acNo: 214 },
-  { id: "KA-AC-215", name: 'Chamundeshwari', state: 'Karnataka', acNo: 215 },
-  { id: "KA-AC-216", name: 'Krishnaraja', state: 'Karnataka', acNo: 216 },
-  { id: "KA-AC-217", name: 'Chamaraja', state: 'Karnataka', acNo: 217 },
-  { id: "KA-AC-218", name: 'Narasimharaja', state: 'Karnataka', acNo: 218 },
-  { id: "KA-AC-219", name: 'Varuna', state: 'Karnataka', acNo: 219 },
-  { id: "KA-AC-220", name: 'T. Narasipur', state: 'Karnataka', acNo: 220 },
-  { id: "KA-AC-221", name: 'Hanur', state: 'Karnataka', acNo: 221 },
-  { id: "KA-AC-222", name: 'Kollegal', state: 'Karnataka', acNo: 222 },
-  { id: "KA-AC-223", name: 'Chamarajanagar', state: 'Karnataka', acNo: 223 },
-  { id: "KA-AC-224", name: 'Gundlupet', state: 'Karnataka', acNo: 224 },
+  'Nippani',-1,'Chikkodi-Sadalga',-1,'Athani',-1,'Kagwad',-1,'Kudachi',-1,'Raibag',-1,
+  'Hukkeri',-1,'Arabhavi',-1,'Gokak',-1,'Yemkanmardi',-1,'Belgaum Uttar',-1,'Belgaum Dakshin',-1,
+  'Belgaum Rural',-1,'Khanapur',-1,'Kittur',-1,'Bailhongal',-1,'Saundatti Yellamma',-1,'Ramdurg',-1,
+  'Mudhol',-1,'Terdal',-1,'Jamkhandi',-1,'Bilgi',-1,'Badami',-1,'Bagalkot',-1,
+  'Hungund',-1,'Muddebihal',-1,'Devar Hippargi',-1,'Basavana Bagevadi',-1,'Babaleshwar',-1,'Bijapur City',-1,
+  'Nagathan',-1,'Indi',-1,'Sindagi',-1,'Afzalpur',-1,'Jevargi',-1,'Shorapur',-1,
+  'Shahapur',-1,'Yadgir',-1,'Gurmitkal',-1,'Chittapur',-1,'Sedam',-1,'Chincholi',-1,
+  'Gulbarga Rural',-1,'Gulbarga Dakshin',-1,'Gulbarga Uttar',-1,'Aland',-1,'Basavakalyan',-1,'Humnabad',-1,
+  'Bidar South',-1,'Bidar',-1,'Bhalki',-1,'Aurad',-1,'Raichur Rural',-1,'Raichur',-1,
+  'Manvi',-1,'Devadurga',-1,'Lingsugur',-1,'Sindhanur',-1,'Maski',-1,'Kushtagi',-1,
+  'Kanakagiri',-1,'Gangawati',-1,'Yelburga',-1,'Koppal',-1,'Shirahatti',-1,'Gadag',-1,
+  'Ron',-1,'Nargund',-1,'Navalgund',-1,'Kundgol',-1,'Dharwad',-1,'Hubli-Dharwad East',-1,
+  'Hubli-Dharwad Central',-1,'Hubli-Dharwad West',-1,'Kalghatgi',-1,'Haliyal',-1,'Karwar',-1,'Kumta',-1,
+  'Bhatkal',-1,'Sirsi',-1,'Yellapur',-1,'Hangal',-1,'Shiggaon',-1,'Haveri',-1,
+  'Byadgi',-1,'Hirekerur',-1,'Ranebennur',-1,'Hoovina Hadagali',-1,'Hagaribommanahalli',-1,'Vijayanagara',-1,
+  'Kampli',-1,'Siruguppa',-1,'Bellary Rural',-1,'Bellary City',-1,'Sandur',-1,'Kudligi',-1,
+  'Molakalmuru',-1,'Challakere',-1,'Chitradurga',-1,'Hiriyur',-1,'Hosadurga',-1,'Holalkere',-1,
+  'Jagalur',-1,'Harapanahalli',-1,'Harihar',-1,'Davanagere North',-1,'Davanagere South',-1,'Mayakonda',-1,
+  'Channagiri',-1,'Honnali',-1,'Shimoga Rural',-1,'Bhadravati',-1,'Shimoga',-1,'Tirthahalli',-1,
+  'Shikaripura',-1,'Soraba',-1,'Sagar',-1,'Byndoor',-1,'Kundapura',-1,'Udupi',-1,
+  'Kapu',-1,'Karkala',-1,'Sringeri',-1,'Mudigere',-1,'Chikmagalur',-1,'Tarikere',-1,
+  'Kadur',-1,'Chiknayakanhalli',-1,'Tiptur',-1,'Turuvekere',-1,'Kunigal',-1,'Tumkur City',-1,
+  'Tumkur Rural',-1,'Koratagere',-1,'Gubbi',-1,'Sira',-1,'Pavagada',-1,'Madhugiri',-1,
+  'Gauribidanur',-1,'Bagepalli',-1,'Chikkaballapur',-1,'Sidlaghatta',-1,'Chintamani',-1,'Srinivaspur',-1,
+  'Mulbagal',-1,'Kolar Gold Field',-1,'Bangarapet',-1,'Kolar',-1,'Malur',-1,'Yelahanka',-1,
+  'Krishnarajapuram',-1,'Byatarayanapura',-1,'Yeshwantpur',-1,'Rajarajeshwarinagar',-1,'Dasarahalli',-1,'Mahalakshmi Layout',-1,
+  'Malleshwaram',-1,'Hebbal',-1,'Pulakeshinagar',-1,'Sarvagnanagar',-1,'C. V. Raman Nagar',-1,'Shivajinagar',-1,
+  'Shanti Nagar',-1,'Gandhi Nagar',-1,'Rajaji Nagar',-1,'Govindraj Nagar',-1,'Vijay Nagar',-1,'Chamrajpet',-1,
+  'Chickpet',-1,'Basavanagudi',-1,'Padmanabhanagar',-1,'B.T.M. Layout',-1,'Jayanagar',-1,'Mahadevapura',-1,
+  'Bommanahalli',-1,'Bangalore South',-1,'Anekal',-1,'Hosakote',-1,'Devanahalli',-1,'Doddaballapur',-1,
+  'Nelamangala',-1,'Magadi',-1,'Ramanagaram',-1,'Kanakapura',-1,'Channapatna',-1,'Malavalli',-1,
+  'Maddur',-1,'Melukote',-1,'Mandya',-1,'Shrirangapattana',-1,'Nagamangala',-1,'Krishnarajapet',-1,
+  'Shravanabelagola',-1,'Arsikere',-1,'Belur',-1,'Hassan',-1,'Holenarasipur',-1,'Arkalgud',-1,
+  'Sakleshpur',-1,'Belthangady',-1,'Moodabidri',-1,'Mangalore City North',-1,'Mangalore City South',-1,'Mangalore',-1,
+  'Bantval',-1,'Puttur',-1,'Sullia',-1,'Madikeri',-1,'Virajpet',-1,'Periyapatna',-1,
+  'Krishnarajanagara',-1,'Hunsur',-1,'Heggadadevankote',-1,'Nanjangud',-1,'Chamundeshwari',-1,'Krishnaraja',-1,
+  'Chamaraja',-1,'Narasimharaja',-1,'Varuna',-1,'T. Narasipur',-1,'Hanur',-1,'Kollegal',-1,
+  'Chamarajanagar',-1,'Gundlupet',-1,
   // Kerala (140)
-  { id: "KL-AC-001", name: 'Manjeshwaram', state: 'Kerala', district: 'Kasargod', acNo: 1 },
-  { id: "KL-AC-002", name: 'Kasaragod', state: 'Kerala', district: 'Kasargod', acNo: 2 },
-  { id: "KL-AC-003", name: 'Udma', state: 'Kerala', district: 'Kasargod', acNo: 3 },
-  { id: "KL-AC-004", name: 'Kanhangad', state: 'Kerala', district: 'Kasargod', acNo: 4 },
-  { id: "KL-AC-005", name: 'Thrikaripur', state: 'Kerala', district: 'Kasargod', acNo: 5 },
-  { id: "KL-AC-006", name: 'Payyanur', state: 'Kerala', district: 'Kannur', acNo: 6 },
-  { id: "KL-AC-007", name: 'Kalliasseri', state: 'Kerala', district: 'Kannur', acNo: 7 },
-  { id: "KL-AC-008", name: 'Taliparamba', state: 'Kerala', district: 'Kannur', acNo: 8 },
-  { id: "KL-AC-009", name: 'Irikkur', state: 'Kerala', district: 'Kannur', acNo: 9 },
-  { id: "KL-AC-010", name: 'Azhikode', state: 'Kerala', district: 'Kannur', acNo: 10 },
-  { id: "KL-AC-011", name: 'Kannur', state: 'Kerala', district: 'Kannur', acNo: 11 },
-  { id: "KL-AC-012", name: 'Dharmadom', state: 'Kerala', district: 'Kannur', acNo: 12 },
-  { id: "KL-AC-013", name: 'Thalassery', state: 'Kerala', district: 'Kannur', acNo: 13 },
-  { id: "KL-AC-014", name: 'Mattanur', state: 'Kerala', district: 'Kannur', acNo: 14 },
-  { id: "KL-AC-015", name: 'Kuthuparamba', state: 'Kerala', district: 'Kannur', acNo: 15 },
-  { id: "KL-AC-016", name: 'Peravoor', state: 'Kerala', district: 'Kannur', acNo: 16 },
-  { id: "KL-AC-017", name: 'Mananthavady', state: 'Kerala', district: 'Wayanad', acNo: 17 },
-  { id: "KL-AC-018", name: 'Sulthan Bathery', state: 'Kerala', district: 'Wayanad', acNo: 18 },
-  { id: "KL-AC-019", name: 'Kalpetta', state: 'Kerala', district: 'Wayanad', acNo: 19 },
-  { id: "KL-AC-020", name: 'Vatakara', state: 'Kerala', district: 'Kozhikode', acNo: 20 },
-  { id: "KL-AC-021", name: 'Kuttiady', state: 'Kerala', district: 'Kozhikode', acNo: 21 },
-  { id: "KL-AC-022", name: 'Nadapuram', state: 'Kerala', district: 'Kozhikode', acNo: 22 },
-  { id: "KL-AC-023", name: 'Koyilandy', state: 'Kerala', district: 'Kozhikode', acNo: 23 },
-  { id: "KL-AC-024", name: 'Perambra', state: 'Kerala', district: 'Kozhikode', acNo: 24 },
-  { id: "KL-AC-025", name: 'Balussery', state: 'Kerala', district: 'Kozhikode', acNo: 25 },
-  { id: "KL-AC-026", name: 'Elathur', state: 'Kerala', district: 'Kozhikode', acNo: 26 },
-  { id: "KL-AC-027", name: 'Kozhikode North', state: 'Kerala', district: 'Kozhikode', acNo: 27 },
-  { id: "KL-AC-028", name: 'Kozhikode South', state: 'Kerala', district: 'Kozhikode', acNo: 28 },
-  { id: "KL-AC-029", name: 'Beypore', state: 'Kerala', district: 'Kozhikode', acNo: 29 },
-  { id: "KL-AC-030", name: 'Kunnamangalam', state: 'Kerala', district: 'Kozhikode', acNo: 30 },
-  { id: "KL-AC-031", name: 'Koduvally', state: 'Kerala', district: 'Kozhikode', acNo: 31 },
-  { id: "KL-AC-032", name: 'Thiruvambady', state: 'Kerala', district: 'Kozhikode', acNo: 32 },
-  { id: "KL-AC-033", name: 'Kondotty', state: 'Kerala', district: 'Malappuram', acNo: 33 },
-  { id: "KL-AC-034", name: 'Eranad', state: 'Kerala', district: 'Malappuram', acNo: 34 },
-  { id: "KL-AC-035", name: 'Nilambur', state: 'Kerala', district: 'Malappuram', acNo: 35 },
-  { id: "KL-AC-036", name: 'Wandoor', state: 'Kerala', district: 'Malappuram', acNo: 36 },
-  { id: "KL-AC-037", name: 'Manjeri', state: 'Kerala', district: 'Malappuram', acNo: 37 },
-  { id: "KL-AC-038", name: 'Perinthalmanna', state: 'Kerala', district: 'Malappuram', acNo: 38 },
-  { id: "KL-AC-039", name: 'Mankada', state: 'Kerala', district: 'Malappuram', acNo: 39 },
-  { id: "KL-AC-040", name: 'Malappuram', state: 'Kerala', district: 'Malappuram', acNo: 40 },
-  { id: "KL-AC-041", name: 'Vengara', state: 'Kerala', district: 'Malappuram', acNo: 41 },
-  { id: "KL-AC-042", name: 'Vallikkunnu', state: 'Kerala', district: 'Malappuram', acNo: 42 },
-  { id: "KL-AC-043", name: 'Tirurangadi', state: 'Kerala', district: 'Malappuram', acNo: 43 },
-  { id: "KL-AC-044", name: 'Tanur', state: 'Kerala', district: 'Malappuram', acNo: 44 },
-  { id: "KL-AC-045", name: 'Tirur', state: 'Kerala', district: 'Malappuram', acNo: 45 },
-  { id: "KL-AC-046", name: 'Kottakkal', state: 'Kerala', district: 'Malappuram', acNo: 46 },
-  { id: "KL-AC-047", name: 'Thavanur', state: 'Kerala', district: 'Malappuram', acNo: 47 },
-  { id: "KL-AC-048", name: 'Ponnani', state: 'Kerala', district: 'Malappuram', acNo: 48 },
-  { id: "KL-AC-049", name: 'Thrithala', state: 'Kerala', district: 'Palakkad', acNo: 49 },
-  { id: "KL-AC-050", name: 'Pattambi', state: 'Kerala', district: 'Palakkad', acNo: 50 },
-  { id: "KL-AC-051", name: 'Shornur', state: 'Kerala', district: 'Palakkad', acNo: 51 },
-  { id: "KL-AC-052", name: 'Ottapalam', state: 'Kerala', district: 'Palakkad', acNo: 52 },
-  { id: "KL-AC-053", name: 'Kongad', state: 'Kerala', district: 'Palakkad', acNo: 53 },
-  { id: "KL-AC-054", name: 'Mannarkkad', state: 'Kerala', district: 'Palakkad', acNo: 54 },
-  { id: "KL-AC-055", name: 'Malampuzha', state: 'Kerala', district: 'Palakkad', acNo: 55 },
-  { id: "KL-AC-056", name: 'Palakkad', state: 'Kerala', district: 'Palakkad', acNo: 56 },
-  { id: "KL-AC-057", name: 'Tarur', state: 'Kerala', district: 'Palakkad', acNo: 57 },
-  { id: "KL-AC-058", name: 'Chittur', state: 'Kerala', district: 'Palakkad', acNo: 58 },
-  { id: "KL-AC-059", name: 'Nenmara', state: 'Kerala', district: 'Palakkad', acNo: 59 },
-  { id: "KL-AC-060", name: 'Alathur', state: 'Kerala', district: 'Palakkad', acNo: 60 },
-  { id: "KL-AC-061", name: 'Chelakkara', state: 'Kerala', district: 'Thrissur', acNo: 61 },
-  { id: "KL-AC-062", name: 'Kunnamkulam', state: 'Kerala', district: 'Thrissur', acNo: 62 },
-  { id: "KL-AC-063", name: 'Guruvayur', state: 'Kerala', district: 'Thrissur', acNo: 63 },
-  { id: "KL-AC-064", name: 'Manalur', state: 'Kerala', district: 'Thrissur', acNo: 64 },
-  { id: "KL-AC-065", name: 'Wadakkanchery', state: 'Kerala', district: 'Thrissur', acNo: 65 },
-  { id: "KL-AC-066", name: 'Ollur', state: 'Kerala', district: 'Thrissur', acNo: 66 },
-  { id: "KL-AC-067", name: 'Thrissur', state: 'Kerala', district: 'Thrissur', acNo: 67 },
-  { id: "KL-AC-068", name: 'Nattika', state: 'Kerala', district: 'Thrissur', acNo: 68 },
-  { id: "KL-AC-069", name: 'Kaipamangalam', state: 'Kerala', district: 'Thrissur', acNo: 69 },
-  { id: "KL-AC-070", name: 'Irinjalakuda', state: 'Kerala', district: 'Thrissur', acNo: 70 },
-  { id: "KL-AC-071", name: 'Puthukkad', state: 'Kerala', district: 'Thrissur', acNo: 71 },
-  { id: "KL-AC-072", name: 'Chalakudy', state: 'Kerala', district: 'Thrissur', acNo: 72 },
-  { id: "KL-AC-073", name: 'Kodungallur', state: 'Kerala', district: 'Thrissur', acNo: 73 },
-  { id: "KL-AC-074", name: 'Perumbavoor', state: 'Kerala', district: 'Ernakulam', acNo: 74 },
-  { id: "KL-AC-075", name: 'Angamaly', state: 'Kerala', district: 'Ernakulam', acNo: 75 },
-  { id: "KL-AC-076", name: 'Aluva', state: 'Kerala', district: 'Ernakulam', acNo: 76 },
-  { id: "KL-AC-077", name: 'Kalamassery', state: 'Kerala', district: 'Ernakulam', acNo: 77 },
-  { id: "KL-AC-078", name: 'Paravur', state: 'Kerala', district: 'Ernakulam', acNo: 78 },
-  { id: "KL-AC-079", name: 'Vypin', state: 'Kerala', district: 'Ernakulam', acNo: 79 },
-  { id: "KL-AC-080", name: 'Kochi', state: 'Kerala', district: 'Ernakulam', acNo: 80 },
-  { id: "KL-AC-081", name: 'Thrippunithura', state: 'Kerala', district: 'Ernakulam', acNo: 81 },
-  { id: "KL-AC-082", name: 'Ernakulam', state: 'Kerala', district: 'Ernakulam', acNo: 82 },
-  { id: "KL-AC-083", name: 'Thrikkakara', state: 'Kerala', district: 'Ernakulam', acNo: 83 },
-  { id: "KL-AC-084", name: 'Kunnathunad', state: 'Kerala', district: 'Ernakulam', acNo: 84 },
-  { id: "KL-AC-085", name: 'Piravom', state: 'Kerala', district: 'Ernakulam', acNo: 85 },
-  { id: "KL-AC-086", name: 'Muvattupuzha', state: 'Kerala', district: 'Ernakulam', acNo: 86 },
-  { id: "KL-AC-087", name: 'Kothamangalam', state: 'Kerala', district: 'Ernakulam', acNo: 87 },
-  { id: "KL-AC-088", name: 'Devikulam', state: 'Kerala', district: 'Idukki', acNo: 88 },
-  { id: "KL-AC-089", name: 'Udumbanchola', state: 'Kerala', district: 'Idukki', acNo: 89 },
-  { id: "KL-AC-090", name: 'Thodupuzha', state: 'Kerala', district: 'Idukki', acNo: 90 },
-  { id: "KL-AC-091", name: 'Idukki', state: 'Kerala', district: 'Idukki', acNo: 91 },
-  { id: "KL-AC-092", name: 'Peerumade', state: 'Kerala', district: 'Idukki', acNo: 92 },
-  { id: "KL-AC-093", name: 'Pala', state: 'Kerala', district: 'Kottayam', acNo: 93 },
-  { id: "KL-AC-094", name: 'Kaduthuruthy', state: 'Kerala', district: 'Kottayam', acNo: 94 },
-  { id: "KL-AC-095", name: 'Vaikom', state: 'Kerala', district: 'Kottayam', acNo: 95 },
-  { id: "KL-AC-096", name: 'Ettumanoor', state: 'Kerala', district: 'Kottayam', acNo: 96 },
-  { id: "KL-AC-097", name: 'Kottayam', state: 'Kerala', district: 'Kottayam', acNo: 97 },
-  { id: "KL-AC-098", name: 'Puthuppally', state: 'Kerala', district: 'Kottayam', acNo: 98 },
-  { id: "KL-AC-099", name: 'Changanassery', state: 'Kerala', district: 'Kottayam', acNo: 99 },
-  { id: "KL-AC-100", name: 'Kanjirappally', state: 'Kerala', district: 'Kottayam', acNo: 100 },
-  { id: "KL-AC-101", name: 'Poonjar', state: 'Kerala', district: 'Kottayam', acNo: 101 },
-  { id: "KL-AC-102", name: 'Aroor', state: 'Kerala', district: 'Alappuzha', acNo: 102 },
-  { id: "KL-AC-103", name: 'Cherthala', state: 'Kerala', district: 'Alappuzha', acNo: 103 },
-  { id: "KL-AC-104", name: 'Alappuzha', state: 'Kerala', district: 'Alappuzha', acNo: 104 },
-  { id: "KL-AC-105", name: 'Ambalappuzha', state: 'Kerala', district: 'Alappuzha', acNo: 105 },
-  { id: "KL-AC-106", name: 'Kuttanad', state: 'Kerala', district: 'Alappuzha', acNo: 106 },
-  { id: "KL-AC-107", name: 'Haripad', state: 'Kerala', district: 'Alappuzha', acNo: 107 },
-  { id: "KL-AC-108", name: 'Kayamkulam', state: 'Kerala', district: 'Alappuzha', acNo: 108 },
-  { id: "KL-AC-109", name: 'Mavelikara', state: 'Kerala', district: 'Alappuzha', acNo: 109 },
-  { id: "KL-AC-110", name: 'Chengannur', state: 'Kerala', district: 'Alappuzha', acNo: 110 },
-  { id: "KL-AC-111", name: 'Thiruvalla', state: 'Kerala', district: 'Pathanamthitta', acNo: 111 },
-  { id: "KL-AC-112", name: 'Ranni', state: 'Kerala', district: 'Pathanamthitta', acNo: 112 },
-  { id: "KL-AC-113", name: 'Aranmula', state: 'Kerala', district: 'Pathanamthitta', acNo: 113 },
-  { id: "KL-AC-114", name: 'Konni', state: 'Kerala', district: 'Pathanamthitta', acNo: 114 },
-  { id: "KL-AC-115", name: 'Adoor', state: 'Kerala', district: 'Pathanamthitta', acNo: 115 },
-  { id: "KL-AC-116", name: 'Karunagapally', state: 'Kerala', district: 'Kollam', acNo: 116 },
-  { id: "KL-AC-117", name: 'Chavara', state: 'Kerala', district: 'Kollam', acNo: 117 },
-  { id: "KL-AC-118", name: 'Kunnathur', state: 'Kerala', district: 'Kollam', acNo: 118 },
-  { id: "KL-AC-119", name: 'Kottarakkara', state: 'Kerala', district: 'Kollam', acNo: 119 },
-  { id: "KL-AC-120", name: 'Pathanapuram', state: 'Kerala', district: 'Kollam', acNo: 120 },
-  { id: "KL-AC-121", name: 'Punalur', state: 'Kerala', district: 'Kollam', acNo: 121 },
-  { id: "KL-AC-122", name: 'Chadayamangalam', state: 'Kerala', district: 'Kollam', acNo: 122 },
-  { id: "KL-AC-123", name: 'Kundara', state: 'Kerala', district: 'Kollam', acNo: 123 },
-  { id: "KL-AC-124", name: 'Kollam', state: 'Kerala', district: 'Kollam', acNo: 124 },
-  { id: "KL-AC-125", name: 'Eravipuram', state: 'Kerala', district: 'Kollam', acNo: 125 },
-  { id: "KL-AC-126", name: 'Chathannoor', state: 'Kerala', district: 'Kollam', acNo: 126 },
-  { id: "KL-AC-127", name: 'Varkala', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 127 },
-  { id: "KL-AC-128", name: 'Attingal', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 128 },
-  { id: "KL-AC-129", name: 'Chirayinkeezhu', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 129 },
-  { id: "KL-AC-130", name: 'Nedumangad', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 130 },
-  { id: "KL-AC-131", name: 'Vamanapuram', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 131 },
-  { id: "KL-AC-132", name: 'Kazhakootam', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 132 },
-  { id: "KL-AC-133", name: 'Vattiyoorkavu', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 133 },
-  { id: "KL-AC-134", name: 'Thiruvananthapuram', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 134 },
-  { id: "KL-AC-135", name: 'Nemom', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 135 },
-  { id: "KL-AC-136", name: 'Aruvikkara', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 136 },
-  { id: "KL-AC-137", name: 'Parassala', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 137 },
-  { id: "KL-AC-138", name: 'Kattakkada', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 138 },
-  { id: "KL-AC-139", name: 'Kovalam', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 139 },
-  { id: "KL-AC-140", name: 'Neyyattinkara', state: 'Kerala', district: 'Thiruvananthapuram', acNo: 140 },
+  'Manjeshwaram',914,'Kasaragod',914,'Udma',914,'Kanhangad',914,'Thrikaripur',914,'Payyanur',903,
+  'Kalliasseri',903,'Taliparamba',903,'Irikkur',903,'Azhikode',903,'Kannur',903,'Dharmadom',903,
+  'Thalassery',903,'Mattanur',903,'Kuthuparamba',903,'Peravoor',903,'Mananthavady',1290,'Sulthan Bathery',1290,
+  'Kalpetta',1290,'Vatakara',954,'Kuttiady',954,'Nadapuram',954,'Koyilandy',954,'Perambra',954,
+  'Balussery',954,'Elathur',954,'Kozhikode North',954,'Kozhikode South',954,'Beypore',954,'Kunnamangalam',954,
+  'Koduvally',954,'Thiruvambady',954,'Kondotty',999,'Eranad',999,'Nilambur',999,'Wandoor',999,
+  'Manjeri',999,'Perinthalmanna',999,'Mankada',999,'Malappuram',999,'Vengara',999,'Vallikkunnu',999,
+  'Tirurangadi',999,'Tanur',999,'Tirur',999,'Kottakkal',999,'Thavanur',999,'Ponnani',999,
+  'Thrithala',1082,'Pattambi',1082,'Shornur',1082,'Ottapalam',1082,'Kongad',1082,'Mannarkkad',1082,
+  'Malampuzha',1082,'Palakkad',1082,'Tarur',1082,'Chittur',1082,'Nenmara',1082,'Alathur',1082,
+  'Chelakkara',1250,'Kunnamkulam',1250,'Guruvayur',1250,'Manalur',1250,'Wadakkanchery',1250,'Ollur',1250,
+  'Thrissur',1250,'Nattika',1250,'Kaipamangalam',1250,'Irinjalakuda',1250,'Puthukkad',1250,'Chalakudy',1250,
+  'Kodungallur',1250,'Perumbavoor',785,'Angamaly',785,'Aluva',785,'Kalamassery',785,'Paravur',785,
+  'Vypin',785,'Kochi',785,'Thrippunithura',785,'Ernakulam',785,'Thrikkakara',785,'Kunnathunad',785,
+  'Piravom',785,'Muvattupuzha',785,'Kothamangalam',785,'Devikulam',847,'Udumbanchola',847,'Thodupuzha',847,
+  'Idukki',847,'Peerumade',847,'Pala',953,'Kaduthuruthy',953,'Vaikom',953,'Ettumanoor',953,
+  'Kottayam',953,'Puthuppally',953,'Changanassery',953,'Kanjirappally',953,'Poonjar',953,'Aroor',613,
+  'Cherthala',613,'Alappuzha',613,'Ambalappuzha',613,'Kuttanad',613,'Haripad',613,'Kayamkulam',613,
+  'Mavelikara',613,'Chengannur',613,'Thiruvalla',1098,'Ranni',1098,'Aranmula',1098,'Konni',1098,
+  'Adoor',1098,'Karunagapally',944,'Chavara',944,'Kunnathur',944,'Kottarakkara',944,'Pathanapuram',944,
+  'Punalur',944,'Chadayamangalam',944,'Kundara',944,'Kollam',944,'Eravipuram',944,'Chathannoor',944,
+  'Varkala',1246,'Attingal',1246,'Chirayinkeezhu',1246,'Nedumangad',1246,'Vamanapuram',1246,'Kazhakootam',1246,
+  'Vattiyoorkavu',1246,'Thiruvananthapuram',1246,'Nemom',1246,'Aruvikkara',1246,'Parassala',1246,'Kattakkada',1246,
+  'Kovalam',1246,'Neyyattinkara',1246,
   // Madhya Pradesh (230)
-  { id: "MP-AC-001", name: 'Sheopur', state: 'Madhya Pradesh', district: 'Sheopur', acNo: 1 },
-  { id: "MP-AC-002", name: 'Vijaypur', state: 'Madhya Pradesh', district: 'Sheopur', acNo: 2 },
-  { id: "MP-AC-003", name: 'Sabalgarh', state: 'Madhya Pradesh', district: 'Morena', acNo: 3 },
-  { id: "MP-AC-004", name: 'Joura', state: 'Madhya Pradesh', district: 'Morena', acNo: 4 },
-  { id: "MP-AC-005", name: 'Sumawali', state: 'Madhya Pradesh', district: 'Morena', acNo: 5 },
-  { id: "MP-AC-006", name: 'Morena', state: 'Madhya Pradesh', district: 'Morena', acNo: 6 },
-  { id: "MP-AC-007", name: 'Dimani', state: 'Madhya Pradesh', district: 'Morena', acNo: 7 },
-  { id: "MP-AC-008", name: 'Ambah', state: 'Madhya Pradesh', district: 'Morena', acNo: 8 },
-  { id: "MP-AC-009", name: 'Ater', state: 'Madhya Pradesh', district: 'Bhind', acNo: 9 },
-  { id: "MP-AC-010", name: 'Bhind', state: 'Madhya Pradesh', district: 'Bhind', acNo: 10 },
-  { id: "MP-AC-011", name: 'Lahar', state: 'Madhya Pradesh', district: 'Bhind', acNo: 11 },
-  { id: "MP-AC-012", name: 'Mehgaon', state: 'Madhya Pradesh', district: 'Bhind', acNo: 12 },
-  { id: "MP-AC-013", name: 'Gohad', state: 'Madhya Pradesh', district: 'Bhind', acNo: 13 },
-  { id: "MP-AC-014", name: 'Gwalior Rural', state: 'Madhya Pradesh', district: 'Gwalior', acNo: 14 },
-  { id: "MP-AC-015", name: 'Gwalior', state: 'Madhya Pradesh', district: 'Gwalior', acNo: 15 },
-  { id: "MP-AC-016", name: 'Gwalior East', state: 'Madhya Pradesh', district: 'Gwalior', acNo: 16 },
-  { id: "MP-AC-017", name: 'Gwalior South', state: 'Madhya Pradesh', district: 'Gwalior', acNo: 17 },
-  { id: "MP-AC-018", name: 'Bhitarwar', state: 'Madhya Pradesh', district: 'Gwalior', acNo: 18 },
-  { id: "MP-AC-019", name: 'Dabra', state: 'Madhya Pradesh', district: 'Gwalior', acNo: 19 },
-  { id: "MP-AC-020", name: 'Sewda', state: 'Madhya Pradesh', district: 'Datia', acNo: 20 },
-  { id: "MP-AC-021", name: 'Bhander', state: 'Madhya Pradesh', district: 'Datia', acNo: 21 },
-  { id: "MP-AC-022", name: 'Datia', state: 'Madhya Pradesh', district: 'Datia', acNo: 22 },
-  { id: "MP-AC-023", name: 'Karera', state: 'Madhya Pradesh', district: 'Shivpuri', acNo: 23 },
-  { id: "MP-AC-024", name: 'Pohari', state: 'Madhya Pradesh', district: 'Shivpuri', acNo: 24 },
-  { id: "MP-AC-025", name: 'Shivpuri', state: 'Madhya Pradesh', district: 'Shivpuri', acNo: 25 },
-  { id: "MP-AC-026", name: 'Pichhore', state: 'Madhya Pradesh', district: 'Shivpuri', acNo: 26 },
-  { id: "MP-AC-027", name: 'Kolaras', state: 'Madhya Pradesh', district: 'Shivpuri', acNo: 27 },
-  { id: "MP-AC-028", name: 'Bamori', state: 'Madhya Pradesh', district: 'Guna', acNo: 28 },
-  { id: "MP-AC-029", name: 'Guna', state: 'Madhya Pradesh', district: 'Guna', acNo: 29 },
-  { id: "MP-AC-030", name: 'Chachoura', state: 'Madhya Pradesh', district: 'Guna', acNo: 30 },
-  { id: "MP-AC-031", name: 'Raghogarh', state: 'Madhya Pradesh', district: 'Guna', acNo: 31 },
-  { id: "MP-AC-032", name: 'Ashok Nagar', state: 'Madhya Pradesh', district: 'Ashok Nagar', acNo: 32 },
-  { id: "MP-AC-033", name: 'Chanderi', state: 'Madhya Pradesh', district: 'Ashok Nagar', acNo: 33 },
-  { id: "MP-AC-034", name: 'Mungaoli', state: 'Madhya Pradesh', district: 'Ashok Nagar', acNo: 34 },
-  { id: "MP-AC-035", name: 'Bina', state: 'Madhya Pradesh', district: 'Sagar', acNo: 35 },
-  { id: "MP-AC-036", name: 'Khurai', state: 'Madhya Pradesh', district: 'Sagar', acNo: 36 },
-  { id: "MP-AC-037", name: 'Surkhi', state: 'Madhya Pradesh', district: 'Sagar', acNo: 37 },
-  { id: "MP-AC-038", name: 'Deori', state: 'Madhya Pradesh', district: 'Sagar', acNo: 38 },
-  { id: "MP-AC-039", name: 'Rehli', state: 'Madhya Pradesh', district: 'Sagar', acNo: 39 },
-  { id: "MP-AC-040", name: 'Naryoli', state: 'Madhya Pradesh', district: 'Sagar', acNo: 40 },
-  { id: "MP-AC-041", name: 'Sagar', state: 'Madhya Pradesh', district: 'Sagar', acNo: 41 },
-  { id: "MP-AC-042", name: 'Banda', state: 'Madhya Pradesh', district: 'Sagar', acNo: 42 },
-  { id: "MP-AC-043", name: 'Tikamgarh', state: 'Madhya Pradesh', district: 'Tikamgarh', acNo: 43 },
-  { id: "MP-AC-044", name: 'Jatara', state: 'Madhya Pradesh', district: 'Tikamgarh', acNo: 44 },
-  { id: "MP-AC-045", name: 'Prithvipur', state: 'Madhya Pradesh', district: 'Niwari', acNo: 45 },
-  { id: "MP-AC-046", name: 'Niwari', state: 'Madhya Pradesh', district: 'Niwari', acNo: 46 },
-  { id: "MP-AC-047", name: 'Khargapur', state: 'Madhya Pradesh', district: 'Tikamgarh', acNo: 47 },
-  { id: "MP-AC-048", name: 'Maharajpur', state: 'Madhya Pradesh', district: 'Chhatarpur', acNo: 48 },
-  { id: "MP-AC-049", name: 'Chandla', state: 'Madhya Pradesh', district: 'Chhatarpur', acNo: 49 },
-  { id: "MP-AC-050", name: 'Rajnagar', state: 'Madhya Pradesh', district: 'Chhatarpur', acNo: 50 },
-  { id: "MP-AC-051", name: 'Chhatarpur', state: 'Madhya Pradesh', district: 'Chhatarpur', acNo: 51 },
-  { id: "MP-AC-052", name: 'Bijawar', state: 'Madhya Pradesh', district: 'Chhatarpur', acNo: 52 },
-  { id: "MP-AC-053", name: 'Malhara', state: 'Madhya Pradesh', district: 'Chhatarpur', acNo: 53 },
-  { id: "MP-AC-054", name: 'Pathariya', state: 'Madhya Pradesh', district: 'Damoh', acNo: 54 },
-  { id: "MP-AC-055", name: 'Damoh', state: 'Madhya Pradesh', district: 'Damoh', acNo: 55 },
-  { id: "MP-AC-056", name: 'Jabera', state: 'Madhya Pradesh', district: 'Damoh', acNo: 56 },
-  { id: "MP-AC-057", name: 'Hatta', state: 'Madhya Pradesh', district: 'Damoh', acNo: 57 },
-  { id: "MP-AC-058", name: 'Pawai', state: 'Madhya Pradesh', district: 'Panna', acNo: 58 },
-  { id: "MP-AC-059", name: 'Gunnaor', state: 'Madhya Pradesh', district: 'Panna', acNo: 59 },
-  { id: "MP-AC-060", name: 'Panna', state: 'Madhya Pradesh', district: 'Panna', acNo: 60 },
-  { id: "MP-AC-061", name: 'Chitrakoot', state: 'Madhya Pradesh', district: 'Satna', acNo: 61 },
-  { id: "MP-AC-062", name: 'Raigaon', state: 'Madhya Pradesh', district: 'Satna', acNo: 62 },
-  { id: "MP-AC-063", name: 'Satna', state: 'Madhya Pradesh', district: 'Satna', acNo: 63 },
-  { id: "MP-AC-064", name: 'Nagod', state: 'Madhya Pradesh', district: 'Satna', acNo: 64 },
-  { id: "MP-AC-065", name: 'Maihar', state: 'Madhya Pradesh', district: 'Satna', acNo: 65 },
-  { id: "MP-AC-066", name: 'Amarpatan', state: 'Madhya Pradesh', district: 'Satna', acNo: 66 },
-  { id: "MP-AC-067", name: 'Rampur-Baghelan', state: 'Madhya Pradesh', district: 'Satna', acNo: 67 },
-  { id: "MP-AC-068", name: 'Sirmour', state: 'Madhya Pradesh', district: 'Rewa', acNo: 68 },
-  { id: "MP-AC-069", name: 'Semariya', state: 'Madhya Pradesh', district: 'Rewa', acNo: 69 },
-  { id: "MP-AC-070", name: 'Teonthar', state: 'Madhya Pradesh', district: 'Rewa', acNo: 70 },
-  { id: "MP-AC-071", name: 'Mauganj', state: 'Madhya Pradesh', district: 'Mauganj', acNo: 71 },
-  { id: "MP-AC-072", name: 'Deotalab', state: 'Madhya Pradesh', district: 'Mauganj', acNo: 72 },
-  { id: "MP-AC-073", name: 'Mangawan', state: 'Madhya Pradesh', district: 'Rewa', acNo: 73 },
-  { id: "MP-AC-074", name: 'Rewa', state: 'Madhya Pradesh', district: 'Rewa', acNo: 74 },
-  { id: "MP-AC-075", name: 'Gurh', state: 'Madhya Pradesh', district: 'Rewa', acNo: 75 },
-  { id: "MP-AC-076", name: 'Churhat', state: 'Madhya Pradesh', district: 'Sidhi', acNo: 76 },
-  { id: "MP-AC-077", name: 'Sidhi', state: 'Madhya Pradesh', district: 'Sidhi', acNo: 77 },
-  { id: "MP-AC-078", name: 'Sihawal', state: 'Madhya Pradesh', district: 'Sidhi', acNo: 78 },
-  { id: "MP-AC-079", name: 'Chitrangi', state: 'Madhya Pradesh', district: 'Singrauli', acNo: 79 },
-  { id: "MP-AC-080", name: 'Singrauli', state: 'Madhya Pradesh', district: 'Singrauli', acNo: 80 },
-  { id: "MP-AC-081", name: 'Devsar', state: 'Madhya Pradesh', district: 'Singrauli', acNo: 81 },
-  { id: "MP-AC-082", name: 'Dhauhani', state: 'Madhya Pradesh', district: 'Sidhi', acNo: 82 },
-  { id: "MP-AC-083", name: 'Beohari', state: 'Madhya Pradesh', district: 'Shahdol', acNo: 83 },
-  { id: "MP-AC-084", name: 'Jaisingnagar', state: 'Madhya Pradesh', district: 'Shahdol', acNo: 84 },
-  { id: "MP-AC-085", name: 'Jaitpur', state: 'Madhya Pradesh', district: 'Shahdol', acNo: 85 },
-  { id: "MP-AC-086", name: 'Kotma', state: 'Madhya Pradesh', district: 'Anuppur', acNo: 86 },
-  { id: "MP-AC-087", name: 'Anuppur', state: 'Madhya Pradesh', district: 'Anuppur', acNo: 87 },
-  { id: "MP-AC-088", name: 'Pushprajgarh', state: 'Madhya Pradesh', district: 'Anuppur', acNo: 88 },
-  { id: "MP-AC-089", name: 'Bandhavgarh', state: 'Madhya Pradesh', district: 'Umaria', acNo: 89 },
-  { id: "MP-AC-090", name: 'Manpur', state: 'Madhya Pradesh', district: 'Umaria', acNo: 90 },
-  { id: "MP-AC-091", name: 'Barwara', state: 'Madhya Pradesh', district: 'Katni', acNo: 91 },
-  { id: "MP-AC-092", name: 'Vijayraghavgarh', state: 'Madhya Pradesh', district: 'Katni', acNo: 92 },
-  { id: "MP-AC-093", name: 'Murwara', state: 'Madhya Pradesh', district: 'Katni', acNo: 93 },
-  { id: "MP-AC-094", name: 'Bahoriband', state: 'Madhya Pradesh', district: 'Katni', acNo: 94 },
-  { id: "MP-AC-095", name: 'Patan', state: 'Madhya Pradesh', district: 'Jabalpur', acNo: 95 },
-  { id: "MP-AC-096", name: 'Bargi', state: 'Madhya Pradesh', district: 'Jabalpur', acNo: 96 },
-  { id: "MP-AC-097", name: 'Jabalpur East', state: 'Madhya Pradesh', district: 'Jabalpur', acNo: 97 },
-  { id: "MP-AC-098", name: 'Jabalpur North', state: 'Madhya Pradesh', district: 'Jabalpur', acNo: 98 },
-  { id: "MP-AC-099", name: 'Jabalpur Cantonment', state: 'Madhya Pradesh', district: 'Jabalpur', acNo: 99 },
-  { id: "MP-AC-100", name: 'Jabalpur West', state: 'Madhya Pradesh', district: 'Jabalpur', acNo: 100 },
-  { id: "MP-AC-101", name: 'Panagar', state: 'Madhya Pradesh', district: 'Jabalpur', acNo: 101 },
-  { id: "MP-AC-102", name: 'Sihora', state: 'Madhya Pradesh', district: 'Jabalpur', acNo: 102 },
-  { id: "MP-AC-103", name: 'Shahpura', state: 'Madhya Pradesh', district: 'Dindori', acNo: 103 },
-  { id: "MP-AC-104", name: 'Dindori', state: 'Madhya Pradesh', district: 'Dindori', acNo: 104 },
-  { id: "MP-AC-105", name: 'Bichhiya', state: 'Madhya Pradesh', district: 'Mandla', acNo: 105 },
-  { id: "MP-AC-106", name: 'Niwas', state: 'Madhya Pradesh', district: 'Mandla', acNo: 106 },
-  { id: "MP-AC-107", name: 'Mandla', state: 'Madhya Pradesh', district: 'Mandla', acNo: 107 },
-  { id: "MP-AC-108", name: 'Baihar', state: 'Madhya Pradesh', district: 'Balaghat', acNo: 108 },
-  { id: "MP-AC-109", name: 'Lanji', state: 'Madhya Pradesh', district: 'Balaghat', acNo: 109 },
-  { id: "MP-AC-110", name: 'Paraswada', state: 'Madhya Pradesh', district: 'Balaghat', acNo: 110 },
-  { id: "MP-AC-111", name: 'Balaghat', state: 'Madhya Pradesh', district: 'Balaghat', acNo: 111 },
-  { id: "MP-AC-112", name: 'Waraseoni', state: 'Madhya Pradesh', district: 'Balaghat', acNo: 112 },
-  { id: "MP-AC-113", name: 'Katangi', state: 'Madhya Pradesh', district: 'Balaghat', acNo: 113 },
-  { id: "MP-AC-114", name: 'Barghat', state: 'Madhya Pradesh', district: 'Seoni', acNo: 114 },
-  { id: "MP-AC-115", name: 'Seoni', state: 'Madhya Pradesh', district: 'Seoni', acNo: 115 },
-  { id: "MP-AC-116", name: 'Keolari', state: 'Madhya Pradesh', district: 'Seoni', acNo: 116 },
-  { id: "MP-AC-117", name: 'Lakhnadon', state: 'Madhya Pradesh', district: 'Seoni', acNo: 117 },
-  { id: "MP-AC-118", name: 'Gotegaon', state: 'Madhya Pradesh', district: 'Narsinghpur', acNo: 118 },
-  { id: "MP-AC-119", name: 'Narsingpur', state: 'Madhya Pradesh', district: 'Narsinghpur', acNo: 119 },
-  { id: "MP-AC-120", name: 'Tendukheda', state: 'Madhya Pradesh', district: 'Narsinghpur', acNo: 120 },
-  { id: "MP-AC-121", name: 'Gadarwara', state: 'Madhya Pradesh', district: 'Narsinghpur', acNo: 121 },
-  { id: "MP-AC-122", name: 'Junnardeo', state: 'Madhya Pradesh', district: 'Chhindwara', acNo: 122 },
-  { id: "MP-AC-123", name: 'Amarwara', state: 'Madhya Pradesh', district: 'Chhindwara', acNo: 123 },
-  { id: "MP-AC-124", name: 'Chourai', state: 'Madhya Pradesh', district: 'Chhindwara', acNo: 124 },
-  { id: "MP-AC-125", name: 'Saunsar', state: 'Madhya Pradesh', district: 'Chhindwara', acNo: 125 },
-  { id: "MP-AC-126", name: 'Chhindwara', state: 'Madhya Pradesh', district: 'Chhindwara', acNo: 126 },
-  { id: "MP-AC-127", name: 'Parasia', state: 'Madhya Pradesh', district: 'Chhindwara', acNo: 127 },
-  { id: "MP-AC-128", name: 'Pandhurna', state: 'Madhya Pradesh', district: 'Chhindwara', acNo: 128 },
-  { id: "MP-AC-129", name: 'Multai', state: 'Madhya Pradesh', district: 'Betul', acNo: 129 },
-  { id: "MP-AC-130", name: 'Amla', state: 'Madhya Pradesh', district: 'Betul', acNo: 130 },
-  { id: "MP-AC-131", name: 'Betul', state: 'Madhya Pradesh', district: 'Betul', acNo: 131 },
-  { id: "MP-AC-132", name: 'Ghoradongri', state: 'Madhya Pradesh', district: 'Betul', acNo: 132 },
-  { id: "MP-AC-133", name: 'Bhainsdehi', state: 'Madhya Pradesh', district: 'Betul', acNo: 133 },
-  { id: "MP-AC-134", name: 'Timarni', state: 'Madhya Pradesh', district: 'Harda', acNo: 134 },
-  { id: "MP-AC-135", name: 'Harda', state: 'Madhya Pradesh', district: 'Harda', acNo: 135 },
-  { id: "MP-AC-136", name: 'Seoni-Malwa', state: 'Madhya Pradesh', district: 'Narmadapuram', acNo: 136 },
-  { id: "MP-AC-137", name: 'Narmadapuram', state: 'Madhya Pradesh', district: 'Narmadapuram', acNo: 137 },
-  { id: "MP-AC-138", name: 'Sohagpur', state: 'Madhya Pradesh', district: 'Narmadapuram', acNo: 138 },
-  { id: "MP-AC-139", name: 'Pipariya', state: 'Madhya Pradesh', district: 'Narmadapuram', acNo: 139 },
-  { id: "MP-AC-140", name: 'Udaipura', state: 'Madhya Pradesh', district: 'Raisen', acNo: 140 },
-  { id: "MP-AC-141", name: 'Bhojpur', state: 'Madhya Pradesh', district: 'Raisen', acNo: 141 },
-  { id: "MP-AC-142", name: 'Sanchi', state: 'Madhya Pradesh', district: 'Raisen', acNo: 142 },
-  { id: "MP-AC-143", name: 'Silwani', state: 'Madhya Pradesh', district: 'Raisen', acNo: 143 },
-  { id: "MP-AC-144", name: 'Vidisha', state: 'Madhya Pradesh', district: 'Vidisha', acNo: 144 },
-  { id: "MP-AC-145", name: 'Basoda', state: 'Madhya Pradesh', district: 'Vidisha', acNo: 145 },
-  { id: "MP-AC-146", name: 'Kurwai', state: 'Madhya Pradesh', district: 'Vidisha', acNo: 146 },
-  { id: "MP-AC-147", name: 'Sironj', state: 'Madhya Pradesh', district: 'Vidisha', acNo: 147 },
-  { id: "MP-AC-148", name: 'Shamshabad', state: 'Madhya Pradesh', district: 'Vidisha', acNo: 148 },
-  { id: "MP-AC-149", name: 'Berasia', state: 'Madhya Pradesh', district: 'Bhopal', acNo: 149 },
-  { id: "MP-AC-150", name: 'Bhopal Uttar', state: 'Madhya Pradesh', district: 'Bhopal', acNo: 150 },
-  { id: "MP-AC-151", name: 'Narela', state: 'Madhya Pradesh', district: 'Bhopal', acNo: 151 },
-  { id: "MP-AC-152", name: 'Bhopal Dakshin-Paschim', state: 'Madhya Pradesh', district: 'Bhopal', acNo: 152 },
-  { id: "MP-AC-153", name: 'Bhopal Madhya', state: 'Madhya Pradesh', district: 'Bhopal', acNo: 153 },
-  { id: "MP-AC-154", name: 'Govindpura', state: 'Madhya Pradesh', district: 'Bhopal', acNo: 154 },
-  { id: "MP-AC-155", name: 'Huzur', state: 'Madhya Pradesh', district: 'Bhopal', acNo: 155 },
-  { id: "MP-AC-156", name: 'Budhni', state: 'Madhya Pradesh', district: 'Sehore', acNo: 156 },
-  { id: "MP-AC-157", name: 'Ashta', state: 'Madhya Pradesh', district: 'Sehore', acNo: 157 },
-  { id: "MP-AC-158", name: 'Ichhawar', state: 'Madhya Pradesh', district: 'Sehore', acNo: 158 },
-  { id: "MP-AC-159", name: 'Sehore', state: 'Madhya Pradesh', district: 'Sehore', acNo: 159 },
-  { id: "MP-AC-160", name: 'Narsinghgarh', state: 'Madhya Pradesh', district: 'Rajgarh', acNo: 160 },
-  { id: "MP-AC-161", name: 'Biaora', state: 'Madhya Pradesh', district: 'Rajgarh', acNo: 161 },
-  { id: "MP-AC-162", name: 'Rajgarh', state: 'Madhya Pradesh', district: 'Rajgarh', acNo: 162 },
-  { id: "MP-AC-163", name: 'Khilchipur', state: 'Madhya Pradesh', district: 'Rajgarh', acNo: 163 },
-  { id: "MP-AC-164", name: 'Sarangpur', state: 'Madhya Pradesh', district: 'Rajgarh', acNo: 164 },
-  { id: "MP-AC-165", name: 'Susner', state: 'Madhya Pradesh', district: 'Agar Malwa', acNo: 165 },
-  { id: "MP-AC-166", name: 'Agar', state: 'Madhya Pradesh', district: 'Agar Malwa', acNo: 166 },
-  { id: "MP-AC-167", name: 'Shajapur', state: 'Madhya Pradesh', district: 'Shajapur', acNo: 167 },
-  { id: "MP-AC-168", name: 'Shujalpur', state: 'Madhya Pradesh', district: 'Shajapur', acNo: 168 },
-  { id: "MP-AC-169", name: 'Kalapipal', state: 'Madhya Pradesh', district: 'Shajapur', acNo: 169 },
-  { id: "MP-AC-170", name: 'Sonkatch', state: 'Madhya Pradesh', district: 'Dewas', acNo: 170 },
-  { id: "MP-AC-171", name: 'Dewas', state: 'Madhya Pradesh', district: 'Dewas', acNo: 171 },
-  { id: "MP-AC-172", name: 'Hatpipliya', state: 'Madhya Pradesh', district: 'Dewas', acNo: 172 },
-  { id: "MP-AC-173", name: 'Khategaon', state: 'Madhya Pradesh', district: 'Dewas', acNo: 173 },
-  { id: "MP-AC-174", name: 'Bagli', state: 'Madhya Pradesh', district: 'Dewas', acNo: 174 },
-  { id: "MP-AC-175", name: 'Mandhata', state: 'Madhya Pradesh', district: 'Khandwa', acNo: 175 },
-  { id: "MP-AC-176", name: 'Harsud', state: 'Madhya Pradesh', district: 'Khandwa', acNo: 176 },
-  { id: "MP-AC-177", name: 'Khandwa', state: 'Madhya Pradesh', district: 'Khandwa', acNo: 177 },
-  { id: "MP-AC-178", name: 'Pandhana', state: 'Madhya Pradesh', district: 'Khandwa', acNo: 178 },
-  { id: "MP-AC-179", name: 'Nepanagar', state: 'Madhya Pradesh', district: 'Burhanpur', acNo: 179 },
-  { id: "MP-AC-180", name: 'Burhanpur', state: 'Madhya Pradesh', district: 'Burhanpur', acNo: 180 },
-  { id: "MP-AC-181", name: 'Bhikangaon', state: 'Madhya Pradesh', district: 'Khargone', acNo: 181 },
-  { id: "MP-AC-182", name: 'Badwaha', state: 'Madhya Pradesh', district: 'Khargone', acNo: 182 },
-  { id: "MP-AC-183", name: 'Maheshwar', state: 'Madhya Pradesh', district: 'Khargone', acNo: 183 },
-  { id: "MP-AC-184", name: 'Kasrawad', state: 'Madhya Pradesh', district: 'Khargone', acNo: 184 },
-  { id: "MP-AC-185", name: 'Khargone', state: 'Madhya Pradesh', district: 'Khargone', acNo: 185 },
-  { id: "MP-AC-186", name: 'Bhagwanpura', state: 'Madhya Pradesh', district: 'Khargone', acNo: 186 },
-  { id: "MP-AC-187", name: 'Sendhawa', state: 'Madhya Pradesh', district: 'Barwani', acNo: 187 },
-  { id: "MP-AC-188", name: 'Rajpur', state: 'Madhya Pradesh', district: 'Barwani', acNo: 188 },
-  { id: "MP-AC-189", name: 'Pansemal', state: 'Madhya Pradesh', district: 'Barwani', acNo: 189 },
-  { id: "MP-AC-190", name: 'Barwani', state: 'Madhya Pradesh', district: 'Barwani', acNo: 190 },
-  { id: "MP-AC-191", name: 'Alirajpur', state: 'Madhya Pradesh', district: 'Alirajpur', acNo: 191 },
-  { id: "MP-AC-192", name: 'Jobat', state: 'Madhya Pradesh', district: 'Alirajpur', acNo: 192 },
-  { id: "MP-AC-193", name: 'Jhabua', state: 'Madhya Pradesh', district: 'Jhabua', acNo: 193 },
-  { id: "MP-AC-194", name: 'Thandla', state: 'Madhya Pradesh', district: 'Jhabua', acNo: 194 },
-  { id: "MP-AC-195", name: 'Petlawad', state: 'Madhya Pradesh', district: 'Jhabua', acNo: 195 },
-  { id: "MP-AC-196", name: 'Sardarpur', state: 'Madhya Pradesh', district: 'Dhar', acNo: 196 },
-  { id: "MP-AC-197", name: 'Gandhwani', state: 'Madhya Pradesh', district: 'Dhar', acNo: 197 },
-  { id: "MP-AC-198", name: 'Kukshi', state: 'Madhya Pradesh', district: 'Dhar', acNo: 198 },
-  { id: "MP-AC-199", name: 'Manawar', state: 'Madhya Pradesh', district: 'Dhar', acNo: 199 },
-  { id: "MP-AC-200", name: 'Dharampuri', state: 'Madhya Pradesh', district: 'Dhar', acNo: 200 },
-  { id: "MP-AC-201", name: 'Dhar', state: 'Madhya Pradesh', district: 'Dhar', acNo: 201 },
-  { id: "MP-AC-202", name: 'Badnawar', state: 'Madhya Pradesh', district: 'Dhar', acNo: 202 },
-  { id: "MP-AC-203", name: 'Depalpur', state: 'Madhya Pradesh', district: 'Indore', acNo: 203 },
-  { id: "MP-AC-204", name: 'Indore-1', state: 'Madhya Pradesh', district: 'Indore', acNo: 204 },
-  { id: "MP-AC-205", name: 'Indore-2', state: 'Madhya Pradesh', district: 'Indore', acNo: 205 },
-  { id: "MP-AC-206", name: 'Indore-3', state: 'Madhya Pradesh', district: 'Indore', acNo: 206 },
-  { id: "MP-AC-207", name: 'Indore-4', state: 'Madhya Pradesh', district: 'Indore', acNo: 207 },
-  { id: "MP-AC-208", name: 'Indore-5', state: 'Madhya Pradesh', district: 'Indore', acNo: 208 },
-  { id: "MP-AC-209", name: 'Dr. Ambedkar Nagar-Mhow', state: 'Madhya Pradesh', district: 'Indore', acNo: 209 },
-  { id: "MP-AC-210", name: 'Rau', state: 'Madhya Pradesh', district: 'Indore', acNo: 210 },
-  { id: "MP-AC-211", name: 'Sanwer', state: 'Madhya Pradesh', district: 'Indore', acNo: 211 },
-  { id: "MP-AC-212", name: 'Nagda-Khachrod', state: 'Madhya Pradesh', district: 'Ujjain', acNo: 212 },
-  { id: "MP-AC-213", name: 'Mahidpur', state: 'Madhya Pradesh', district: 'Ujjain', acNo: 213 },
-  { id: "MP-AC-214", name: 'Tarana', state: 'Madhya Pradesh', district: 'Ujjain', acNo: 214 },
-  { id: "MP-AC-215", name: 'Ghatiya', state: 'Madhya Pradesh', district: 'Ujjain', acNo: 215 },
-  { id: "MP-AC-216", name: 'Ujjain North', state: 'Madhya Pradesh', district: 'Ujjain', acNo: 216 },
-  { id: "MP-AC-217", name: 'Ujjain South', state: 'Madhya Pradesh', district: 'Ujjain', acNo: 217 },
-  { id: "MP-AC-218", name: 'Badnagar', state: 'Madhya Pradesh', district: 'Ujjain', acNo: 218 },
-  { id: "MP-AC-219", name: 'Ratlam Rural', state: 'Madhya Pradesh', district: 'Ratlam', acNo: 219 },
-  { id: "MP-AC-220", name: 'Ratlam City', state: 'Madhya Pradesh', district: 'Ratlam', acNo: 220 },
-  { id: "MP-AC-221", name: 'Sailana', state: 'Madhya Pradesh', district: 'Ratlam', acNo: 221 },
-  { id: "MP-AC-222", name: 'Jaora', state: 'Madhya Pradesh', district: 'Ratlam', acNo: 222 },
-  { id: "MP-AC-223", name: 'Alot', state: 'Madhya Pradesh', district: 'Ratlam', acNo: 223 },
-  { id: "MP-AC-224", name: 'Mandsaur', state: 'Madhya Pradesh', district: 'Mandsaur', acNo: 224 },
-  { id: "MP-AC-225", name: 'Malhargarh', state: 'Madhya Pradesh', district: 'Mandsaur', acNo: 225 },
-  { id: "MP-AC-226", name: 'Suwasra', state: 'Madhya Pradesh', district: 'Mandsaur', acNo: 226 },
-  { id: "MP-AC-227", name: 'Garoth', state: 'Madhya Pradesh', district: 'Mandsaur', acNo: 227 },
-  { id: "MP-AC-228", name: 'Manasa', state: 'Madhya Pradesh', district: 'Neemuch', acNo: 228 },
-  { id: "MP-AC-229", name: 'Neemuch', state: 'Madhya Pradesh', district: 'Neemuch', acNo: 229 },
-  { id: "MP-AC-230", name: 'Jawad', state: 'Madhya Pradesh', district: 'Neemuch', acNo: 230 },
+  'Sheopur',1185,'Vijaypur',1185,'Sabalgarh',1027,'Joura',1027,'Sumawali',1027,'Morena',1027,
+  'Dimani',1027,'Ambah',1027,'Ater',686,'Bhind',686,'Lahar',686,'Mehgaon',686,
+  'Gohad',686,'Gwalior Rural',828,'Gwalior',828,'Gwalior East',828,'Gwalior South',828,'Bhitarwar',828,
+  'Dabra',828,'Sewda',745,'Bhander',745,'Datia',745,'Karera',1188,'Pohari',1188,
+  'Shivpuri',1188,'Pichhore',1188,'Kolaras',1188,'Bamori',824,'Guna',824,'Chachoura',824,
+  'Raghogarh',824,'Ashok Nagar',638,'Chanderi',638,'Mungaoli',638,'Bina',1150,'Khurai',1150,
+  'Surkhi',1150,'Deori',1150,'Rehli',1150,'Naryoli',1150,'Sagar',1150,'Banda',1150,
+  'Tikamgarh',1251,'Jatara',1251,'Prithvipur',1067,'Niwari',1067,'Khargapur',1251,'Maharajpur',722,
+  'Chandla',722,'Rajnagar',722,'Chhatarpur',722,'Bijawar',722,'Malhara',722,'Pathariya',739,
+  'Damoh',739,'Jabera',739,'Hatta',739,'Pawai',1091,'Gunnaor',1091,'Panna',1091,
+  'Chitrakoot',1169,'Raigaon',1169,'Satna',1169,'Nagod',1169,'Maihar',1169,'Amarpatan',1169,
+  'Rampur-Baghelan',1169,'Sirmour',1142,'Semariya',1142,'Teonthar',1142,'Mauganj',1014,'Deotalab',1014,
+  'Mangawan',1142,'Rewa',1142,'Gurh',1142,'Churhat',1195,'Sidhi',1195,'Sihawal',1195,
+  'Chitrangi',1199,'Singrauli',1199,'Devsar',1199,'Dhauhani',1195,'Beohari',1177,'Jaisingnagar',1177,
+  'Jaitpur',1177,'Kotma',633,'Anuppur',633,'Pushprajgarh',633,'Bandhavgarh',1268,'Manpur',1268,
+  'Barwara',918,'Vijayraghavgarh',918,'Murwara',918,'Bahoriband',918,'Patan',851,'Bargi',851,
+  'Jabalpur East',851,'Jabalpur North',851,'Jabalpur Cantonment',851,'Jabalpur West',851,'Panagar',851,'Sihora',851,
+  'Shahpura',768,'Dindori',768,'Bichhiya',1005,'Niwas',1005,'Mandla',1005,'Baihar',647,
+  'Lanji',647,'Paraswada',647,'Balaghat',647,'Waraseoni',647,'Katangi',647,'Barghat',1173,
+  'Seoni',1173,'Keolari',1173,'Lakhnadon',1173,'Gotegaon',1057,'Narsingpur',1057,'Tendukheda',1057,
+  'Gadarwara',1057,'Junnardeo',723,'Amarwara',723,'Chourai',723,'Saunsar',723,'Chhindwara',723,
+  'Parasia',723,'Pandhurna',723,'Multai',677,'Amla',677,'Betul',677,'Ghoradongri',677,
+  'Bhainsdehi',677,'Timarni',835,'Harda',835,'Seoni-Malwa',1056,'Narmadapuram',1056,'Sohagpur',1056,
+  'Pipariya',1056,'Udaipura',1125,'Bhojpur',1125,'Sanchi',1125,'Silwani',1125,'Vidisha',1281,
+  'Basoda',1281,'Kurwai',1281,'Sironj',1281,'Shamshabad',1281,'Berasia',689,'Bhopal Uttar',689,
+  'Narela',689,'Bhopal Dakshin-Paschim',689,'Bhopal Madhya',689,'Govindpura',689,'Huzur',689,'Budhni',1171,
+  'Ashta',1171,'Ichhawar',1171,'Sehore',1171,'Narsinghgarh',1127,'Biaora',1127,'Rajgarh',1127,
+  'Khilchipur',1127,'Sarangpur',1127,'Susner',606,'Agar',606,'Shajapur',1180,'Shujalpur',1180,
+  'Kalapipal',1180,'Sonkatch',751,'Dewas',751,'Hatpipliya',751,'Khategaon',751,'Bagli',751,
+  'Mandhata',927,'Harsud',927,'Khandwa',927,'Pandhana',927,'Nepanagar',707,'Burhanpur',707,
+  'Bhikangaon',928,'Badwaha',928,'Maheshwar',928,'Kasrawad',928,'Khargone',928,'Bhagwanpura',928,
+  'Sendhawa',669,'Rajpur',669,'Pansemal',669,'Barwani',669,'Alirajpur',616,'Jobat',616,
+  'Jhabua',873,'Thandla',873,'Petlawad',873,'Sardarpur',755,'Gandhwani',755,'Kukshi',755,
+  'Manawar',755,'Dharampuri',755,'Dhar',755,'Badnawar',755,'Depalpur',850,'Indore-1',850,
+  'Indore-2',850,'Indore-3',850,'Indore-4',850,'Indore-5',850,'Dr. Ambedkar Nagar-Mhow',850,'Rau',850,
+  'Sanwer',850,'Nagda-Khachrod',1266,'Mahidpur',1266,'Tarana',1266,'Ghatiya',1266,'Ujjain North',1266,
+  'Ujjain South',1266,'Badnagar',1266,'Ratlam Rural',1139,'Ratlam City',1139,'Sailana',1139,'Jaora',1139,
+  'Alot',1139,'Mandsaur',1006,'Malhargarh',1006,'Suwasra',1006,'Garoth',1006,'Manasa',1062,
+  'Neemuch',1062,'Jawad',1062,
   // Maharashtra (288)
-  { id: "MH-AC-001", name: 'Akkalkuwa', state: 'Maharashtra', district: 'Nandurbar', acNo: 1 },
-  { id: "MH-AC-002", name: 'Shahada', state: 'Maharashtra', district: 'Nandurbar', acNo: 2 },
-  { id: "MH-AC-003", name: 'Nandurbar', state: 'Maharashtra', district: 'Nandurbar', acNo: 3 },
-  { id: "MH-AC-004", name: 'Navapur', state: 'Maharashtra', district: 'Nandurbar', acNo: 4 },
-  { id: "MH-AC-005", name: 'Sakri', state: 'Maharashtra', district: 'Dhule', acNo: 5 },
-  { id: "MH-AC-006", name: 'Dhule Rural', state: 'Maharashtra', district: 'Dhule', acNo: 6 },
-  { id: "MH-AC-007", name: 'Dhule City', state: 'Maharashtra', district: 'Dhule', acNo: 7 },
-  { id: "MH-AC-008", name: 'Sindkheda', state: 'Maharashtra', district: 'Dhule', acNo: 8 },
-  { id: "MH-AC-009", name: 'Shirpur', state: 'Maharashtra', district: 'Dhule', acNo: 9 },
-  { id: "MH-AC-010", name: 'Chopda', state: 'Maharashtra', district: 'Jalgaon', acNo: 10 },
-  { id: "MH-AC-011", name: 'Raver', state: 'Maharashtra', district: 'Jalgaon', acNo: 11 },
-  { id: "MH-AC-012", name: 'Bhusawal', state: 'Maharashtra', district: 'Jalgaon', acNo: 12 },
-  { id: "MH-AC-013", name: 'Jalgaon City', state: 'Maharashtra', district: 'Jalgaon', acNo: 13 },
-  { id: "MH-AC-014", name: 'Jalgaon Rural', state: 'Maharashtra', district: 'Jalgaon', acNo: 14 },
-  { id: "MH-AC-015", name: 'Amalner', state: 'Maharashtra', district: 'Jalgaon', acNo: 15 },
-  { id: "MH-AC-016", name: 'Erandol', state: 'Maharashtra', district: 'Jalgaon', acNo: 16 },
-  { id: "MH-AC-017", name: 'Chalisgaon', state: 'Maharashtra', district: 'Jalgaon', acNo: 17 },
-  { id: "MH-AC-018", name: 'Pachora', state: 'Maharashtra', district: 'Jalgaon', acNo: 18 },
-  { id: "MH-AC-019", name: 'Jamner', state: 'Maharashtra', district: 'Jalgaon', acNo: 19 },
-  { id: "MH-AC-020", name: 'Muktainagar', state: 'Maharashtra', district: 'Jalgaon', acNo: 20 },
-  { id: "MH-AC-021", name: 'Malkapur', state: 'Maharashtra', district: 'Buldhana', acNo: 21 },
-  { id: "MH-AC-022", name: 'Buldhana', state: 'Maharashtra', district: 'Buldhana', acNo: 22 },
-  { id: "MH-AC-023", name: 'Chikhali', state: 'Maharashtra', district: 'Buldhana', acNo: 23 },
-  { id: "MH-AC-024", name: 'Sindkhed Raja', state: 'Maharashtra', district: 'Buldhana', acNo: 24 },
-  { id: "MH-AC-025", name: 'Mehkar', state: 'Maharashtra', district: 'Buldhana', acNo: 25 },
-  { id: "MH-AC-026", name: 'Khamgaon', state: 'Maharashtra', district: 'Buldhana', acNo: 26 },
-  { id: "MH-AC-027", name: 'Jalgaon', state: 'Maharashtra', district: 'Buldhana', acNo: 27 },
-  { id: "MH-AC-028", name: 'Akot', state: 'Maharashtra', district: 'Akola', acNo: 28 },
-  { id: "MH-AC-029", name: 'Balapur', state: 'Maharashtra', district: 'Akola', acNo: 29 },
-  { id: "MH-AC-030", name: 'Akola West', state: 'Maharashtra', district: 'Akola', acNo: 30 },
-  { id: "MH-AC-031", name: 'Akola East', state: 'Maharashtra', district: 'Akola', acNo: 31 },
-  { id: "MH-AC-032", name: 'Murtizapur', state: 'Maharashtra', district: 'Akola', acNo: 32 },
-  { id: "MH-AC-033", name: 'Risod', state: 'Maharashtra', district: 'Washim', acNo: 33 },
-  { id: "MH-AC-034", name: 'Washim', state: 'Maharashtra', district: 'Washim', acNo: 34 },
-  { id: "MH-AC-035", name: 'Karanja', state: 'Maharashtra', district: 'Washim', acNo: 35 },
-  { id: "MH-AC-036", name: 'Dhamangaon Railway', state: 'Maharashtra', district: 'Amravati', acNo: 36 },
-  { id: "MH-AC-037", name: 'Badnera', state: 'Maharashtra', district: 'Amravati', acNo: 37 },
-  { id: "MH-AC-038", name: 'Amravati', state: 'Maharashtra', district: 'Amravati', acNo: 38 },
-  { id: "MH-AC-039", name: 'Teosa', state: 'Maharashtra', district: 'Amravati', acNo: 39 },
-  { id: "MH-AC-040", name: 'Daryapur', state: 'Maharashtra', district: 'Amravati', acNo: 40 },
-  { id: "MH-AC-041", name: 'Melghat', state: 'Maharashtra', district: 'Amravati', acNo: 41 },
-  { id: "MH-AC-042", name: 'Achalpur', state: 'Maharashtra', district: 'Amravati', acNo: 42 },
-  { id: "MH-AC-043", name: 'Morshi', state: 'Maharashtra', district: 'Amravati', acNo: 43 },
-  { id: "MH-AC-044", name: 'Arvi', state: 'Maharashtra', district: 'Wardha', acNo: 44 },
-  { id: "MH-AC-045", name: 'Deoli', state: 'Maharashtra', district: 'Wardha', acNo: 45 },
-  { id: "MH-AC-046", name: 'Hinganghat', state: 'Maharashtra', district: 'Wardha', acNo: 46 },
-  { id: "MH-AC-047", name: 'Wardha', state: 'Maharashtra', district: 'Wardha', acNo: 47 },
-  { id: "MH-AC-048", name: 'Katol', state: 'Maharashtra', district: 'Nagpur', acNo: 48 },
-  { id: "MH-AC-049", name: 'Savner', state: 'Maharashtra', district: 'Nagpur', acNo: 49 },
-  { id: "MH-AC-050", name: 'Hingna', state: 'Maharashtra', district: 'Nagpur', acNo: 50 },
-  { id: "MH-AC-051", name: 'Umred', state: 'Maharashtra', district: 'Nagpur', acNo: 51 },
-  { id: "MH-AC-052", name: 'Nagpur South West', state: 'Maharashtra', district: 'Nagpur', acNo: 52 },
-  { id: "MH-AC-053", name: 'Nagpur South', state: 'Maharashtra', district: 'Nagpur', acNo: 53 },
-  { id: "MH-AC-054", name: 'Nagpur East', state: 'Maharashtra', district: 'Nagpur', acNo: 54 },
-  { id: "MH-AC-055", name: 'Nagpur Central', state: 'Maharashtra', district: 'Nagpur', acNo: 55 },
-  { id: "MH-AC-056", name: 'Nagpur West', state: 'Maharashtra', district: 'Nagpur', acNo: 56 },
-  { id: "MH-AC-057", name: 'Nagpur North', state: 'Maharashtra', district: 'Nagpur', acNo: 57 },
-  { id: "MH-AC-058", name: 'Kamthi', state: 'Maharashtra', district: 'Nagpur', acNo: 58 },
-  { id: "MH-AC-059", name: 'Ramtek', state: 'Maharashtra', district: 'Nagpur', acNo: 59 },
-  { id: "MH-AC-060", name: 'Tumsar', state: 'Maharashtra', district: 'Bhandara', acNo: 60 },
-  { id: "MH-AC-061", name: 'Bhandara', state: 'Maharashtra', district: 'Bhandara', acNo: 61 },
-  { id: "MH-AC-062", name: 'Sakoli', state: 'Maharashtra', district: 'Bhandara', acNo: 62 },
-  { id: "MH-AC-063", name: 'Arjuni-Morgaon', state: 'Maharashtra', district: 'Gondiya', acNo: 63 },
-  { id: "MH-AC-064", name: 'Tirora', state: 'Maharashtra', district: 'Gondiya', acNo: 64 },
-  { id: "MH-AC-065", name: 'Gondiya', state: 'Maharashtra', district: 'Gondiya', acNo: 65 },
-  { id: "MH-AC-066", name: 'Amgaon', state: 'Maharashtra', district: 'Gondiya', acNo: 66 },
-  { id: "MH-AC-067", name: 'Armori', state: 'Maharashtra', district: 'Gadchiroli', acNo: 67 },
-  { id: "MH-AC-068", name: 'Gadchiroli', state: 'Maharashtra', district: 'Gadchiroli', acNo: 68 },
-  { id: "MH-AC-069", name: 'Aheri', state: 'Maharashtra', district: 'Gadchiroli', acNo: 69 },
-  { id: "MH-AC-070", name: 'Rajura', state: 'Maharashtra', district: 'Chandrapur', acNo: 70 },
-  { id: "MH-AC-071", name: 'Chandrapur', state: 'Maharashtra', district: 'Chandrapur', acNo: 71 },
-  { id: "MH-AC-072", name: 'Ballarpur', state: 'Maharashtra', district: 'Chandrapur', acNo: 72 },
-  { id: "MH-AC-073", name: 'Bramhapuri', state: 'Maharashtra', district: 'Chandrapur', acNo: 73 },
-  { id: "MH-AC-074", name: 'Chimur', state: 'Maharashtra', district: 'Chandrapur', acNo: 74 },
-  { id: "MH-AC-075", name: 'Warora', state: 'Maharashtra', district: 'Chandrapur', acNo: 75 },
-  { id: "MH-AC-076", name: 'Wani', state: 'Maharashtra', district: 'Yavatmal', acNo: 76 },
-  { id: "MH-AC-077", name: 'Ralegaon', state: 'Maharashtra', district: 'Yavatmal', acNo: 77 },
-  { id: "MH-AC-078", name: 'Yavatmal', state: 'Maharashtra', district: 'Yavatmal', acNo: 78 },
-  { id: "MH-AC-079", name: 'Digras', state: 'Maharashtra', district: 'Yavatmal', acNo: 79 },
-  { id: "MH-AC-080", name: 'Arni', state: 'Maharashtra', district: 'Yavatmal', acNo: 80 },
-  { id: "MH-AC-081", name: 'Pusad', state: 'Maharashtra', district: 'Yavatmal', acNo: 81 },
-  { id: "MH-AC-082", name: 'Umarkhed', state: 'Maharashtra', district: 'Yavatmal', acNo: 82 },
-  { id: "MH-AC-083", name: 'Kinwat', state: 'Maharashtra', district: 'Nanded', acNo: 83 },
-  { id: "MH-AC-084", name: 'Hadgaon', state: 'Maharashtra', district: 'Nanded', acNo: 84 },
-  { id: "MH-AC-085", name: 'Bhokar', state: 'Maharashtra', district: 'Nanded', acNo: 85 },
-  { id: "MH-AC-086", name: 'Nanded North', state: 'Maharashtra', district: 'Nanded', acNo: 86 },
-  { id: "MH-AC-087", name: 'Nanded South', state: 'Maharashtra', district: 'Nanded', acNo: 87 },
-  { id: "MH-AC-088", name: 'Loha', state: 'Maharashtra', district: 'Nanded', acNo: 88 },
-  { id: "MH-AC-089", name: 'Naigaon', state: 'Maharashtra', district: 'Nanded', acNo: 89 },
-  { id: "MH-AC-090", name: 'Deglur', state: 'Maharashtra', district: 'Nanded', acNo: 90 },
-  { id: "MH-AC-091", name: 'Mukhed', state: 'Maharashtra', district: 'Nanded', acNo: 91 },
-  { id: "MH-AC-092", name: 'Basmath', state: 'Maharashtra', district: 'Hingoli', acNo: 92 },
-  { id: "MH-AC-093", name: 'Kalamnuri', state: 'Maharashtra', district: 'Hingoli', acNo: 93 },
-  { id: "MH-AC-094", name: 'Hingoli', state: 'Maharashtra', district: 'Hingoli', acNo: 94 },
-  { id: "MH-AC-095", name: 'Jintur', state: 'Maharashtra', district: 'Parbhani', acNo: 95 },
-  { id: "MH-AC-096", name: 'Parbhani', state: 'Maharashtra', district: 'Parbhani', acNo: 96 },
-  { id: "MH-AC-097", name: 'Gangakhed', state: 'Maharashtra', district: 'Parbhani', acNo: 97 },
-  { id: "MH-AC-098", name: 'Pathri', state: 'Maharashtra', district: 'Parbhani', acNo: 98 },
-  { id: "MH-AC-099", name: 'Partur', state: 'Maharashtra', district: 'Jalna', acNo: 99 },
-  { id: "MH-AC-100", name: 'Ghansawangi', state: 'Maharashtra', district: 'Jalna', acNo: 100 },
-  { id: "MH-AC-101", name: 'Jalna', state: 'Maharashtra', district: 'Jalna', acNo: 101 },
-  { id: "MH-AC-102", name: 'Badnapur', state: 'Maharashtra', district: 'Jalna', acNo: 102 },
-  { id: "MH-AC-103", name: 'Bhokardan', state: 'Maharashtra', district: 'Jalna', acNo: 103 },
-  { id: "MH-AC-104", name: 'Sillod', state: 'Maharashtra', district: 'Aurangabad', acNo: 104 },
-  { id: "MH-AC-105", name: 'Kannad', state: 'Maharashtra', district: 'Aurangabad', acNo: 105 },
-  { id: "MH-AC-106", name: 'Phulambri', state: 'Maharashtra', district: 'Aurangabad', acNo: 106 },
-  { id: "MH-AC-107", name: 'Aurangabad Central', state: 'Maharashtra', district: 'Aurangabad', acNo: 107 },
-  { id: "MH-AC-108", name: 'Aurangabad West', state: 'Maharashtra', district: 'Aurangabad', acNo: 108 },
-  { id: "MH-AC-109", name: 'Aurangabad East', state: 'Maharashtra', district: 'Aurangabad', acNo: 109 },
-  { id: "MH-AC-110", name: 'Paithan', state: 'Maharashtra', district: 'Aurangabad', acNo: 110 },
-  { id: "MH-AC-111", name: 'Gangapur', state: 'Maharashtra', district: 'Aurangabad', acNo: 111 },
-  { id: "MH-AC-112", name: 'Vaijapur', state: 'Maharashtra', district: 'Aurangabad', acNo: 112 },
-  { id: "MH-AC-113", name: 'Nandgaon', state: 'Maharashtra', district: 'Nashik', acNo: 113 },
-  { id: "MH-AC-114", name: 'Malegaon Central', state: 'Maharashtra', district: 'Nashik', acNo: 114 },
-  { id: "MH-AC-115", name: 'Malegaon Outer', state: 'Maharashtra', district: 'Nashik', acNo: 115 },
-  { id: "MH-AC-116", name: 'Baglan', state: 'Maharashtra', district: 'Nashik', acNo: 116 },
-  { id: "MH-AC-117", name: 'Kalwan', state: 'Maharashtra', district: 'Nashik', acNo: 117 },
-  { id: "MH-AC-118", name: 'Chandwad', state: 'Maharashtra', district: 'Nashik', acNo: 118 },
-  { id: "MH-AC-119", name: 'Yevla', state: 'Maharashtra', district: 'Nashik', acNo: 119 },
-  { id: "MH-AC-120", name: 'Sinnar', state: 'Maharashtra', district: 'Nashik', acNo: 120 },
-  { id: "MH-AC-121", name: 'Niphad', state: 'Maharashtra', district: 'Nashik', acNo: 121 },
-  { id: "MH-AC-122", name: 'Dindori', state: 'Maharashtra', district: 'Nashik', acNo: 122 },
-  { id: "MH-AC-123", name: 'Nashik East', state: 'Maharashtra', district: 'Nashik', acNo: 123 },
-  { id: "MH-AC-124", name: 'Nashik Central', state: 'Maharashtra', district: 'Nashik', acNo: 124 },
-  { id: "MH-AC-125", name: 'Nashik West', state: 'Maharashtra', district: 'Nashik', acNo: 125 },
-  { id: "MH-AC-126", name: 'Deolali', state: 'Maharashtra', district: 'Nashik', acNo: 126 },
-  { id: "MH-AC-127", name: 'Igatpuri', state: 'Maharashtra', district: 'Nashik', acNo: 127 },
-  { id: "MH-AC-128", name: 'Dahanu', state: 'Maharashtra', district: 'Palghar', acNo: 128 },
-  { id: "MH-AC-129", name: 'Vikramgad', state: 'Maharashtra', district: 'Palghar', acNo: 129 },
-  { id: "MH-AC-130", name: 'Palghar', state: 'Maharashtra', district: 'Palghar', acNo: 130 },
-  { id: "MH-AC-131", name: 'Boisar', state: 'Maharashtra', district: 'Palghar', acNo: 131 },
-  { id: "MH-AC-132", name: 'Nallasopara', state: 'Maharashtra', district: 'Palghar', acNo: 132 },
-  { id: "MH-AC-133", name: 'Vasai', state: 'Maharashtra', district: 'Palghar', acNo: 133 },
-  { id: "MH-AC-134", name: 'Bhiwandi Rural', state: 'Maharashtra', district: 'Thane', acNo: 134 },
-  { id: "MH-AC-135", name: 'Shahapur', state: 'Maharashtra', district: 'Thane', acNo: 135 },
-  { id: "MH-AC-136", name: 'Bhiwandi West', state: 'Maharashtra', district: 'Thane', acNo: 136 },
-  { id: "MH-AC-137", name: 'Bhiwandi East', state: 'Maharashtra', district: 'Thane', acNo: 137 },
-  { id: "MH-AC-138", name: 'Kalyan West', state: 'Maharashtra', district: 'Thane', acNo: 138 },
-  { id: "MH-AC-139", name: 'Murbad', state: 'Maharashtra', district: 'Thane', acNo: 139 },
-  { id: "MH-AC-140", name: 'Ambernath', state: 'Maharashtra', district: 'Thane', acNo: 140 },
-  { id: "MH-AC-141", name: 'Ulhasnagar', state: 'Maharashtra', district: 'Thane', acNo: 141 },
-  { id: "MH-AC-142", name: 'Kalyan East', state: 'Maharashtra', district: 'Thane', acNo: 142 },
-  { id: "MH-AC-143", name: 'Dombivali', state: 'Maharashtra', district: 'Thane', acNo: 143 },
-  { id: "MH-AC-144", name: 'Kalyan Rural', state: 'Maharashtra', district: 'Thane', acNo: 144 },
-  { id: "MH-AC-145", name: 'Mira Bhayandar', state: 'Maharashtra', district: 'Thane', acNo: 145 },
-  { id: "MH-AC-146", name: 'Ovala-Majiwada', state: 'Maharashtra', district: 'Thane', acNo: 146 },
-  { id: "MH-AC-147", name: 'Kopri-Pachpakhadi', state: 'Maharashtra', district: 'Thane', acNo: 147 },
-  { id: "MH-AC-148", name: 'Thane', state: 'Maharashtra', district: 'Thane', acNo: 148 },
-  { id: "MH-AC-149", name: 'Mumbra-Kalwa', state: 'Maharashtra', district: 'Thane', acNo: 149 },
-  { id: "MH-AC-150", name: 'Airoli', state: 'Maharashtra', district: 'Thane', acNo: 150 },
-  { id: "MH-AC-151", name: 'Belapur', state: 'Maharashtra', district: 'Thane', acNo: 151 },
-  { id: "MH-AC-152", name: 'Borivali', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 152 },
-  { id: "MH-AC-153", name: 'Dahisar', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 153 },
-  { id: "MH-AC-154", name: 'Magathane', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 154 },
-  { id: "MH-AC-155", name: 'Mulund', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 155 },
-  { id: "MH-AC-156", name: 'Vikhroli', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 156 },
-  { id: "MH-AC-157", name: 'Bhandup West', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 157 },
-  { id: "MH-AC-158", name: 'Jogeshwari East', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 158 },
-  { id: "MH-AC-159", name: 'Dindoshi', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 159 },
-  { id: "MH-AC-160", name: 'Kandivli East', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 160 },
-  { id: "MH-AC-161", name: 'Charkop', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 161 },
-  { id: "MH-AC-162", name: 'Malad West', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 162 },
-  { id: "MH-AC-163", name: 'Goregaon', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 163 },
-  { id: "MH-AC-164", name: 'Versova', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 164 },
-  { id: "MH-AC-165", name: 'Andheri West', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 165 },
-  { id: "MH-AC-166", name: 'Andheri East', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 166 },
-  { id: "MH-AC-167", name: 'Vile Parle', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 167 },
-  { id: "MH-AC-168", name: 'Chandivali', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 168 },
-  { id: "MH-AC-169", name: 'Ghatkopar West', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 169 },
-  { id: "MH-AC-170", name: 'Ghatkopar East', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 170 },
-  { id: "MH-AC-171", name: 'Mankhurd Shivaji Nagar', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 171 },
-  { id: "MH-AC-172", name: 'Anushakti Nagar', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 172 },
-  { id: "MH-AC-173", name: 'Chembur', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 173 },
-  { id: "MH-AC-174", name: 'Kurla', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 174 },
-  { id: "MH-AC-175", name: 'Kalina', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 175 },
-  { id: "MH-AC-176", name: 'Vandre East', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 176 },
-  { id: "MH-AC-177", name: 'Vandre West', state: 'Maharashtra', district: 'Mumbai Suburban', acNo: 177 },
-  { id: "MH-AC-178", name: 'Dharavi', state: 'Maharashtra', district: 'Mumbai City', acNo: 178 },
-  { id: "MH-AC-179", name: 'Sion Koliwada', state: 'Maharashtra', district: 'Mumbai City', acNo: 179 },
-  { id: "MH-AC-180", name: 'Wadala', state: 'Maharashtra', district: 'Mumbai City', acNo: 180 },
-  { id: "MH-AC-181", name: 'Mahim', state: 'Maharashtra', district: 'Mumbai City', acNo: 181 },
-  { id: "MH-AC-182", name: 'Worli', state: 'Maharashtra', district: 'Mumbai City', acNo: 182 },
-  { id: "MH-AC-183", name: 'Shivadi', state: 'Maharashtra', district: 'Mumbai City', acNo: 183 },
-  { id: "MH-AC-184", name: 'Byculla', state: 'Maharashtra', district: 'Mumbai City', acNo: 184 },
-  { id: "MH-AC-185", name: 'Malabar Hill', state: 'Maharashtra', district: 'Mumbai City', acNo: 185 },
-  { id: "MH-AC-186", name: 'Mumbadevi', state: 'Maharashtra', district: 'Mumbai City', acNo: 186 },
-  { id: "MH-AC-187", name: 'Colaba', state: 'Maharashtra', district: 'Mumbai City', acNo: 187 },
-  { id: "MH-AC-188", name: 'Panvel', state: 'Maharashtra', district: 'Raigad', acNo: 188 },
-  { id: "MH-AC-189", name: 'Karjat', state: 'Maharashtra', district: 'Raigad', acNo: 189 },
-  { id: "MH-AC-190", name: 'Uran', state: 'Maharashtra', district: 'Raigad', acNo: 190 },
-  { id: "MH-AC-191", name: 'Pen', state: 'Maharashtra', district: 'Raigad', acNo: 191 },
-  { id: "MH-AC-192", name: 'Alibag', state: 'Maharashtra', district: 'Raigad', acNo: 192 },
-  { id: "MH-AC-193", name: 'Shrivardhan', state: 'Maharashtra', district: 'Raigad', acNo: 193 },
-  { id: "MH-AC-194", name: 'Mahad', state: 'Maharashtra', district: 'Raigad', acNo: 194 },
-  { id: "MH-AC-195", name: 'Junnar', state: 'Maharashtra', district: 'Pune', acNo: 195 },
-  { id: "MH-AC-196", name: 'Ambegaon', state: 'Maharashtra', district: 'Pune', acNo: 196 },
-  { id: "MH-AC-197", name: 'Khed Alandi', state: 'Maharashtra', district: 'Pune', acNo: 197 },
-  { id: "MH-AC-198", name: 'Shirur', state: 'Maharashtra', district: 'Pune', acNo: 198 },
-  { id: "MH-AC-199", name: 'Daund', state: 'Maharashtra', district: 'Pune', acNo: 199 },
-  { id: "MH-AC-200", name: 'Indapur', state: 'Maharashtra', district: 'Pune', acNo: 200 },
-  { id: "MH-AC-201", name: 'Baramati', state: 'Maharashtra', district: 'Pune', acNo: 201 },
-  { id: "MH-AC-202", name: 'Purandar', state: 'Maharashtra', district: 'Pune', acNo: 202 },
-  { id: "MH-AC-203", name: 'Bhor', state: 'Maharashtra', district: 'Pune', acNo: 203 },
-  { id: "MH-AC-204", name: 'Maval', state: 'Maharashtra', district: 'Pune', acNo: 204 },
-  { id: "MH-AC-205", name: 'Chinchwad', state: 'Maharashtra', district: 'Pune', acNo: 205 },
-  { id: "MH-AC-206", name: 'Pimpri', state: 'Maharashtra', district: 'Pune', acNo: 206 },
-  { id: "MH-AC-207", name: 'Bhosari', state: 'Maharashtra', district: 'Pune', acNo: 207 },
-  { id: "MH-AC-208", name: 'Vadgaon Sheri', state: 'Maharashtra', district: 'Pune', acNo: 208 },
-  { id: "MH-AC-209", name: 'Shivajinagar', state: 'Maharashtra', district: 'Pune', acNo: 209 },
-  { id: "MH-AC-210", name: 'Kothrud', state: 'Maharashtra', district: 'Pune', acNo: 210 },
-  { id: "MH-AC-211", name: 'Khadakwasala', state: 'Maharashtra', district: 'Pune', acNo: 211 },
-  { id: "MH-AC-212", name: 'Parvati', state: 'Maharashtra', district: 'Pune', acNo: 212 },
-  { id: "MH-AC-213", name: 'Hadapsar', state: 'Maharashtra', district: 'Pune', acNo: 213 },
-  { id: "MH-AC-214", name: 'Pune Cantonment', state: 'Maharashtra', district: 'Pune', acNo: 214 },
-  { id: "MH-AC-215", name: 'Kasba Peth', state: 'Maharashtra', district: 'Pune', acNo: 215 },
-  { id: "MH-AC-216", name: 'Akole', state: 'Maharashtra', district: 'Ahmednagar', acNo: 216 },
-  { id: "MH-AC-217", name: 'Sangamner', state: 'Maharashtra', district: 'Ahmednagar', acNo: 217 },
-  { id: "MH-AC-218", name: 'Shirdi', state: 'Maharashtra', district: 'Ahmednagar', acNo: 218 },
-  { id: "MH-AC-219", name: 'Kopargaon', state: 'Maharashtra', district: 'Ahmednagar', acNo: 219 },
-  { id: "MH-AC-220", name: 'Shrirampur', state: 'Maharashtra', district: 'Ahmednagar', acNo: 220 },
-  { id: "MH-AC-221", name: 'Nevasa', state: 'Maharashtra', district: 'Ahmednagar', acNo: 221 },
-  { id: "MH-AC-222", name: 'Shevgaon', state: 'Maharashtra', district: 'Ahmednagar', acNo: 222 },
-  { id: "MH-AC-223", name: 'Rahuri', state: 'Maharashtra', district: 'Ahmednagar', acNo: 223 },
-  { id: "MH-AC-224", name: 'Parner', state: 'Maharashtra', district: 'Ahmednagar', acNo: 224 },
-  { id: "MH-AC-225", name: 'Ahmednagar City', state: 'Maharashtra', district: 'Ahmednagar', acNo: 225 },
-  { id: "MH-AC-226", name: 'Shrigonda', state: 'Maharashtra', district: 'Ahmednagar', acNo: 226 },
-  { id: "MH-AC-227", name: 'Karjat Jamkhed', state: 'Maharashtra', district: 'Ahmednagar', acNo: 227 },
-  { id: "MH-AC-228", name: 'Georai', state: 'Maharashtra', district: 'Beed', acNo: 228 },
-  { id: "MH-AC-229", name: 'Majalgaon', state: 'Maharashtra', district: 'Beed', acNo: 229 },
-  { id: "MH-AC-230", name: 'Beed', state: 'Maharashtra', district: 'Beed', acNo: 230 },
-  { id: "MH-AC-231", name: 'Ashti', state: 'Maharashtra', district: 'Beed', acNo: 231 },
-  { id: "MH-AC-232", name: 'Kaij', state: 'Maharashtra', district: 'Beed', acNo: 232 },
-  { id: "MH-AC-233", name: 'Parli', state: 'Maharashtra', district: 'Beed', acNo: 233 },
-  { id: "MH-AC-234", name: 'Latur Rural', state: 'Maharashtra', district: 'Latur', acNo: 234 },
-  { id: "MH-AC-235", name: 'Latur City', state: 'Maharashtra', district: 'Latur', acNo: 235 },
-  { id: "MH-AC-236", name: 'Ahmedpur', state: 'Maharashtra', district: 'Latur', acNo: 236 },
-  { id: "MH-AC-237", name: 'Udgir', state: 'Maharashtra', district: 'Latur', acNo: 237 },
-  { id: "MH-AC-238", name: 'Nilanga', state: 'Maharashtra', district: 'Latur', acNo: 238 },
-  { id: "MH-AC-239", name: 'Ausa', state: 'Maharashtra', district: 'Latur', acNo: 239 },
-  { id: "MH-AC-240", name: 'Umarga', state: 'Maharashtra', district: 'Osmanabad', acNo: 240 },
-  { id: "MH-AC-241", name: 'Tuljapur', state: 'Maharashtra', district: 'Osmanabad', acNo: 241 },
-  { id: "MH-AC-242", name: 'Osmanabad', state: 'Maharashtra', district: 'Osmanabad', acNo: 242 },
-  { id: "MH-AC-243", name: 'Paranda', state: 'Maharashtra', district: 'Osmanabad', acNo: 243 },
-  { id: "MH-AC-244", name: 'Karmala', state: 'Maharashtra', district: 'Solapur', acNo: 244 },
-  { id: "MH-AC-245", name: 'Madha', state: 'Maharashtra', district: 'Solapur', acNo: 245 },
-  { id: "MH-AC-246", name: 'Barshi', state: 'Maharashtra', district: 'Solapur', acNo: 246 },
-  { id: "MH-AC-247", name: 'Mohol', state: 'Maharashtra', district: 'Solapur', acNo: 247 },
-  { id: "MH-AC-248", name: 'Solapur City North', state: 'Maharashtra', district: 'Solapur', acNo: 248 },
-  { id: "MH-AC-249", name: 'Solapur City Central', state: 'Maharashtra', district: 'Solapur', acNo: 249 },
-  { id: "MH-AC-250", name: 'Akkalkot', state: 'Maharashtra', district: 'Solapur', acNo: 250 },
-  { id: "MH-AC-251", name: 'Solapur South', state: 'Maharashtra', district: 'Solapur', acNo: 251 },
-  { id: "MH-AC-252", name: 'Pandharpur', state: 'Maharashtra', district: 'Solapur', acNo: 252 },
-  { id: "MH-AC-253", name: 'Sangola', state: 'Maharashtra', district: 'Solapur', acNo: 253 },
-  { id: "MH-AC-254", name: 'Malshiras', state: 'Maharashtra', district: 'Solapur', acNo: 254 },
-  { id: "MH-AC-255", name: 'Phaltan', state: 'Maharashtra', district: 'Satara', acNo: 255 },
-  { id: "MH-AC-256", name: 'Wai', state: 'Maharashtra', district: 'Satara', acNo: 256 },
-  { id: "MH-AC-257", name: 'Koregaon', state: 'Maharashtra', district: 'Satara', acNo: 257 },
-  { id: "MH-AC-258", name: 'Man', state: 'Maharashtra', district: 'Satara', acNo: 258 },
-  { id: "MH-AC-259", name: 'Karad North', state: 'Maharashtra', district: 'Satara', acNo: 259 },
-  { id: "MH-AC-260", name: 'Karad South', state: 'Maharashtra', district: 'Satara', acNo: 260 },
-  { id: "MH-AC-261", name: 'Patan', state: 'Maharashtra', district: 'Satara', acNo: 261 },
-  { id: "MH-AC-262", name: 'Satara', state: 'Maharashtra', district: 'Satara', acNo: 262 },
-  { id: "MH-AC-263", name: 'Dapoli', state: 'Maharashtra', district: 'Ratnagiri', acNo: 263 },
-  { id: "MH-AC-264", name: 'Guhagar', state: 'Maharashtra', district: 'Ratnagiri', acNo: 264 },
-  { id: "MH-AC-265", name: 'Chiplun', state: 'Maharashtra', district: 'Ratnagiri', acNo: 265 },
-  { id: "MH-AC-266", name: 'Ratnagiri', state: 'Maharashtra', district: 'Ratnagiri', acNo: 266 },
-  { id: "MH-AC-267", name: 'Rajapur', state: 'Maharashtra', district: 'Ratnagiri', acNo: 267 },
-  { id: "MH-AC-268", name: 'Kankavli', state: 'Maharashtra', district: 'Sindhudurg', acNo: 268 },
-  { id: "MH-AC-269", name: 'Kudal', state: 'Maharashtra', district: 'Sindhudurg', acNo: 269 },
-  { id: "MH-AC-270", name: 'Sawantwadi', state: 'Maharashtra', district: 'Sindhudurg', acNo: 270 },
-  { id: "MH-AC-271", name: 'Chandgad', state: 'Maharashtra', district: 'Kolhapur', acNo: 271 },
-  { id: "MH-AC-272", name: 'Radhanagari', state: 'Maharashtra', district: 'Kolhapur', acNo: 272 },
-  { id: "MH-AC-273", name: 'Kagal', state: 'Maharashtra', district: 'Kolhapur', acNo: 273 },
-  { id: "MH-AC-274", name: 'Kolhapur South', state: 'Maharashtra', district: 'Kolhapur', acNo: 274 },
-  { id: "MH-AC-275", name: 'Karvir', state: 'Maharashtra', district: 'Kolhapur', acNo: 275 },
-  { id: "MH-AC-276", name: 'Kolhapur North', state: 'Maharashtra', district: 'Kolhapur', acNo: 276 },
-  { id: "MH-AC-277", name: 'Shahuwadi', state: 'Maharashtra', district: 'Kolhapur', acNo: 277 },
-  { id: "MH-AC-278", name: 'Hatkanangle', state: 'Maharashtra', district: 'Kolhapur', acNo: 278 },
-  { id: "MH-AC-279", name: 'Ichalkaranji', state: 'Maharashtra', district: 'Kolhapur', acNo: 279 },
-  { id: "MH-AC-280", name: 'Shirol', state: 'Maharashtra', district: 'Kolhapur', acNo: 280 },
-  { id: "MH-AC-281", name: 'Miraj', state: 'Maharashtra', district: 'Sangli', acNo: 281 },
-  { id: "MH-AC-282", name: 'Sangli', state: 'Maharashtra', district: 'Sangli', acNo: 282 },
-  { id: "MH-AC-283", name: 'Islampur', state: 'Maharashtra', district: 'Sangli', acNo: 283 },
-  { id: "MH-AC-284", name: 'Shirala', state: 'Maharashtra', district: 'Sangli', acNo: 284 },
-  { id: "MH-AC-285", name: 'Palus-Kadegaon', state: 'Maharashtra', district: 'Sangli', acNo: 285 },
-  { id: "MH-AC-286", name: 'Khanapur', state: 'Maharashtra', district: 'Sangli', acNo: 286 },
-  { id: "MH-AC-287", name: 'Tasgaon-Kavathe Mahankal', state: 'Maharashtra', district: 'Sangli', acNo: 287 },
-  { id: "MH-AC-288", name: 'Jat', state: 'Maharashtra', district: 'Sangli', acNo: 288 },
+  'Akkalkuwa',1051,'Shahada',1051,'Nandurbar',1051,'Navapur',1051,'Sakri',761,'Dhule Rural',761,
+  'Dhule City',761,'Sindkheda',761,'Shirpur',761,'Chopda',859,'Raver',859,'Bhusawal',859,
+  'Jalgaon City',859,'Jalgaon Rural',859,'Amalner',859,'Erandol',859,'Chalisgaon',859,'Pachora',859,
+  'Jamner',859,'Muktainagar',859,'Malkapur',705,'Buldhana',705,'Chikhali',705,'Sindkhed Raja',705,
+  'Mehkar',705,'Khamgaon',705,'Jalgaon',705,'Akot',612,'Balapur',612,'Akola West',612,
+  'Akola East',612,'Murtizapur',612,'Risod',1289,'Washim',1289,'Karanja',1289,'Dhamangaon Railway',622,
+  'Badnera',622,'Amravati',622,'Teosa',622,'Daryapur',622,'Melghat',622,'Achalpur',622,
+  'Morshi',622,'Arvi',1288,'Deoli',1288,'Hinganghat',1288,'Wardha',1288,'Katol',1043,
+  'Savner',1043,'Hingna',1043,'Umred',1043,'Nagpur South West',1043,'Nagpur South',1043,'Nagpur East',1043,
+  'Nagpur Central',1043,'Nagpur West',1043,'Nagpur North',1043,'Kamthi',1043,'Ramtek',1043,'Tumsar',681,
+  'Bhandara',681,'Sakoli',681,'Arjuni-Morgaon',820,'Tirora',820,'Gondiya',820,'Amgaon',820,
+  'Armori',798,'Gadchiroli',798,'Aheri',798,'Rajura',715,'Chandrapur',715,'Ballarpur',715,
+  'Bramhapuri',715,'Chimur',715,'Warora',715,'Wani',1307,'Ralegaon',1307,'Yavatmal',1307,
+  'Digras',1307,'Arni',1307,'Pusad',1307,'Umarkhed',1307,'Kinwat',1050,'Hadgaon',1050,
+  'Bhokar',1050,'Nanded North',1050,'Nanded South',1050,'Loha',1050,'Naigaon',1050,'Deglur',1050,
+  'Mukhed',1050,'Basmath',839,'Kalamnuri',839,'Hingoli',839,'Jintur',1093,'Parbhani',1093,
+  'Gangakhed',1093,'Pathri',1093,'Partur',860,'Ghansawangi',860,'Jalna',860,'Badnapur',860,
+  'Bhokardan',860,'Sillod',640,'Kannad',640,'Phulambri',640,'Aurangabad Central',640,'Aurangabad West',640,
+  'Aurangabad East',640,'Paithan',640,'Gangapur',640,'Vaijapur',640,'Nandgaon',1058,'Malegaon Central',1058,
+  'Malegaon Outer',1058,'Baglan',1058,'Kalwan',1058,'Chandwad',1058,'Yevla',1058,'Sinnar',1058,
+  'Niphad',1058,'Dindori',1058,'Nashik East',1058,'Nashik Central',1058,'Nashik West',1058,'Deolali',1058,
+  'Igatpuri',1058,'Dahanu',1084,'Vikramgad',1084,'Palghar',1084,'Boisar',1084,'Nallasopara',1084,
+  'Vasai',1084,'Bhiwandi Rural',1242,'Shahapur',1242,'Bhiwandi West',1242,'Bhiwandi East',1242,'Kalyan West',1242,
+  'Murbad',1242,'Ambernath',1242,'Ulhasnagar',1242,'Kalyan East',1242,'Dombivali',1242,'Kalyan Rural',1242,
+  'Mira Bhayandar',1242,'Ovala-Majiwada',1242,'Kopri-Pachpakhadi',1242,'Thane',1242,'Mumbra-Kalwa',1242,'Airoli',1242,
+  'Belapur',1242,'Borivali',1030,'Dahisar',1030,'Magathane',1030,'Mulund',1030,'Vikhroli',1030,
+  'Bhandup West',1030,'Jogeshwari East',1030,'Dindoshi',1030,'Kandivli East',1030,'Charkop',1030,'Malad West',1030,
+  'Goregaon',1030,'Versova',1030,'Andheri West',1030,'Andheri East',1030,'Vile Parle',1030,'Chandivali',1030,
+  'Ghatkopar West',1030,'Ghatkopar East',1030,'Mankhurd Shivaji Nagar',1030,'Anushakti Nagar',1030,'Chembur',1030,'Kurla',1030,
+  'Kalina',1030,'Vandre East',1030,'Vandre West',1030,'Dharavi',1029,'Sion Koliwada',1029,'Wadala',1029,
+  'Mahim',1029,'Worli',1029,'Shivadi',1029,'Byculla',1029,'Malabar Hill',1029,'Mumbadevi',1029,
+  'Colaba',1029,'Panvel',1122,'Karjat',1122,'Uran',1122,'Pen',1122,'Alibag',1122,
+  'Shrivardhan',1122,'Mahad',1122,'Junnar',1116,'Ambegaon',1116,'Khed Alandi',1116,'Shirur',1116,
+  'Daund',1116,'Indapur',1116,'Baramati',1116,'Purandar',1116,'Bhor',1116,'Maval',1116,
+  'Chinchwad',1116,'Pimpri',1116,'Bhosari',1116,'Vadgaon Sheri',1116,'Shivajinagar',1116,'Kothrud',1116,
+  'Khadakwasala',1116,'Parvati',1116,'Hadapsar',1116,'Pune Cantonment',1116,'Kasba Peth',1116,'Akole',609,
+  'Sangamner',609,'Shirdi',609,'Kopargaon',609,'Shrirampur',609,'Nevasa',609,'Shevgaon',609,
+  'Rahuri',609,'Parner',609,'Ahmednagar City',609,'Shrigonda',609,'Karjat Jamkhed',609,'Georai',674,
+  'Majalgaon',674,'Beed',674,'Ashti',674,'Kaij',674,'Parli',674,'Latur Rural',971,
+  'Latur City',971,'Ahmedpur',971,'Udgir',971,'Nilanga',971,'Ausa',971,'Umarga',1078,
+  'Tuljapur',1078,'Osmanabad',1078,'Paranda',1078,'Karmala',1209,'Madha',1209,'Barshi',1209,
+  'Mohol',1209,'Solapur City North',1209,'Solapur City Central',1209,'Akkalkot',1209,'Solapur South',1209,'Pandharpur',1209,
+  'Sangola',1209,'Malshiras',1209,'Phaltan',1168,'Wai',1168,'Koregaon',1168,'Man',1168,
+  'Karad North',1168,'Karad South',1168,'Patan',1168,'Satara',1168,'Dapoli',1140,'Guhagar',1140,
+  'Chiplun',1140,'Ratnagiri',1140,'Rajapur',1140,'Kankavli',1198,'Kudal',1198,'Sawantwadi',1198,
+  'Chandgad',942,'Radhanagari',942,'Kagal',942,'Kolhapur South',942,'Karvir',942,'Kolhapur North',942,
+  'Shahuwadi',942,'Hatkanangle',942,'Ichalkaranji',942,'Shirol',942,'Miraj',1164,'Sangli',1164,
+  'Islampur',1164,'Shirala',1164,'Palus-Kadegaon',1164,'Khanapur',1164,'Tasgaon-Kavathe Mahankal',1164,'Jat',1164,
   // Manipur (60)
-  { id: "MN-AC-001", name: 'Khundrakpam', state: 'Manipur', district: 'Imphal East', acNo: 1 },
-  { id: "MN-AC-002", name: 'Heingang', state: 'Manipur', district: 'Imphal East', acNo: 2 },
-  { id: "MN-AC-003", name: 'Khurai', state: 'Manipur', district: 'Imphal East', acNo: 3 },
-  { id: "MN-AC-004", name: 'Kshetrigao', state: 'Manipur', district: 'Imphal East', acNo: 4 },
-  { id: "MN-AC-005", name: 'Thongju', state: 'Manipur', district: 'Imphal East', acNo: 5 },
-  { id: "MN-AC-006", name: 'Keirao', state: 'Manipur', district: 'Imphal East', acNo: 6 },
-  { id: "MN-AC-007", name: 'Andro', state: 'Manipur', district: 'Imphal East', acNo: 7 },
-  { id: "MN-AC-008", name: 'Lamlai', state: 'Manipur', district: 'Imphal East', acNo: 8 },
-  { id: "MN-AC-009", name: 'Thangmeiband', state: 'Manipur', district: 'Imphal West', acNo: 9 },
-  { id: "MN-AC-010", name: 'Uripok', state: 'Manipur', district: 'Imphal West', acNo: 10 },
-  { id: "MN-AC-011", name: 'Sagolband', state: 'Manipur', district: 'Imphal West', acNo: 11 },
-  { id: "MN-AC-012", name: 'Keishamthong', state: 'Manipur', district: 'Imphal West', acNo: 12 },
-  { id: "MN-AC-013", name: 'Singjamei', state: 'Manipur', district: 'Imphal West', acNo: 13 },
-  { id: "MN-AC-014", name: 'Yaiskul', state: 'Manipur', district: 'Imphal East', acNo: 14 },
-  { id: "MN-AC-015", name: 'Wangkhei', state: 'Manipur', district: 'Imphal East', acNo: 15 },
-  { id: "MN-AC-016", name: 'Sekmai', state: 'Manipur', district: 'Imphal West', acNo: 16 },
-  { id: "MN-AC-017", name: 'Lamsang', state: 'Manipur', district: 'Imphal West', acNo: 17 },
-  { id: "MN-AC-018", name: 'Konthoujam', state: 'Manipur', district: 'Imphal West', acNo: 18 },
-  { id: "MN-AC-019", name: 'Patsoi', state: 'Manipur', district: 'Imphal West', acNo: 19 },
-  { id: "MN-AC-020", name: 'Langthabal', state: 'Manipur', district: 'Imphal West', acNo: 20 },
-  { id: "MN-AC-021", name: 'Naoriya Pakhanglakpa', state: 'Manipur', district: 'Imphal West', acNo: 21 },
-  { id: "MN-AC-022", name: 'Wangoi', state: 'Manipur', district: 'Imphal West', acNo: 22 },
-  { id: "MN-AC-023", name: 'Mayang Imphal', state: 'Manipur', district: 'Imphal West', acNo: 23 },
-  { id: "MN-AC-024", name: 'Nambol', state: 'Manipur', district: 'Bishnupur', acNo: 24 },
-  { id: "MN-AC-025", name: 'Oinam', state: 'Manipur', district: 'Bishnupur', acNo: 25 },
-  { id: "MN-AC-026", name: 'Bishnupur', state: 'Manipur', district: 'Bishnupur', acNo: 26 },
-  { id: "MN-AC-027", name: 'Moirang', state: 'Manipur', district: 'Bishnupur', acNo: 27 },
-  { id: "MN-AC-028", name: 'Thanga', state: 'Manipur', district: 'Bishnupur', acNo: 28 },
-  { id: "MN-AC-029", name: 'Kumbi', state: 'Manipur', district: 'Bishnupur', acNo: 29 },
-  { id: "MN-AC-030", name: 'Lilong', state: 'Manipur', district: 'Thoubal', acNo: 30 },
-  { id: "MN-AC-031", name: 'Thoubal', state: 'Manipur', district: 'Thoubal', acNo: 31 },
-  { id: "MN-AC-032", name: 'Wangkhem', state: 'Manipur', district: 'Thoubal', acNo: 32 },
-  { id: "MN-AC-033", name: 'Heirok', state: 'Manipur', district: 'Thoubal', acNo: 33 },
-  { id: "MN-AC-034", name: 'Wangjing Tentha', state: 'Manipur', district: 'Thoubal', acNo: 34 },
-  { id: "MN-AC-035", name: 'Khangabok', state: 'Manipur', district: 'Thoubal', acNo: 35 },
-  { id: "MN-AC-036", name: 'Wabgai', state: 'Manipur', district: 'Thoubal', acNo: 36 },
-  { id: "MN-AC-037", name: 'Kakching', state: 'Manipur', district: 'Thoubal', acNo: 37 },
-  { id: "MN-AC-038", name: 'Hiyanglam', state: 'Manipur', district: 'Thoubal', acNo: 38 },
-  { id: "MN-AC-039", name: 'Sugnu', state: 'Manipur', district: 'Thoubal', acNo: 39 },
-  { id: "MN-AC-040", name: 'Jiribam', state: 'Manipur', district: 'Imphal East', acNo: 40 },
-  { id: "MN-AC-041", name: 'Chandel', state: 'Manipur', district: 'Chandel', acNo: 41 },
-  { id: "MN-AC-042", name: 'Tengnoupal', state: 'Manipur', district: 'Chandel', acNo: 42 },
-  { id: "MN-AC-043", name: 'Phungyar', state: 'Manipur', district: 'Ukhrul', acNo: 43 },
-  { id: "MN-AC-044", name: 'Ukhrul', state: 'Manipur', district: 'Ukhrul', acNo: 44 },
-  { id: "MN-AC-045", name: 'Chingai', state: 'Manipur', district: 'Ukhrul', acNo: 45 },
-  { id: "MN-AC-046", name: 'Saikul', state: 'Manipur', district: 'Senapati', acNo: 46 },
-  { id: "MN-AC-047", name: 'Karong', state: 'Manipur', district: 'Senapati', acNo: 47 },
-  { id: "MN-AC-048", name: 'Mao', state: 'Manipur', district: 'Senapati', acNo: 48 },
-  { id: "MN-AC-049", name: 'Tadubi', state: 'Manipur', district: 'Senapati', acNo: 49 },
-  { id: "MN-AC-050", name: 'Kangpokpi', state: 'Manipur', district: 'Senapati', acNo: 50 },
-  { id: "MN-AC-051", name: 'Saitu', state: 'Manipur', district: 'Senapati', acNo: 51 },
-  { id: "MN-AC-052", name: 'Tamei', state: 'Manipur', district: 'Tamenglong', acNo: 52 },
-  { id: "MN-AC-053", name: 'Tamenglong', state: 'Manipur', district: 'Tamenglong', acNo: 53 },
-  { id: "MN-AC-054", name: 'Nungba', state: 'Manipur', district: 'Tamenglong', acNo: 54 },
-  { id: "MN-AC-055", name: 'Tipaimukh', state: 'Manipur', district: 'Churachandpur', acNo: 55 },
-  { id: "MN-AC-056", name: 'Thanlon', state: 'Manipur', district: 'Churachandpur', acNo: 56 },
-  { id: "MN-AC-057", name: 'Henglep', state: 'Manipur', district: 'Churachandpur', acNo: 57 },
-  { id: "MN-AC-058", name: 'Churachandpur', state: 'Manipur', district: 'Churachandpur', acNo: 58 },
-  { id: "MN-AC-059", name: 'Saikot', state: 'Manipur', district: 'Churachandpur', acNo: 59 },
-  { id: "MN-AC-060", name: 'Singhat', state: 'Manipur', district: 'Churachandpur', acNo: 60 },
+  'Khundrakpam',848,'Heingang',848,'Khurai',848,'Kshetrigao',848,'Thongju',848,'Keirao',848,
+  'Andro',848,'Lamlai',848,'Thangmeiband',849,'Uripok',849,'Sagolband',849,'Keishamthong',849,
+  'Singjamei',849,'Yaiskul',848,'Wangkhei',848,'Sekmai',849,'Lamsang',849,'Konthoujam',849,
+  'Patsoi',849,'Langthabal',849,'Naoriya Pakhanglakpa',849,'Wangoi',849,'Mayang Imphal',849,'Nambol',696,
+  'Oinam',696,'Bishnupur',696,'Moirang',696,'Thanga',696,'Kumbi',696,'Lilong',1249,
+  'Thoubal',1249,'Wangkhem',1249,'Heirok',1249,'Wangjing Tentha',1249,'Khangabok',1249,'Wabgai',1249,
+  'Kakching',1249,'Hiyanglam',1249,'Sugnu',1249,'Jiribam',848,'Chandel',714,'Tengnoupal',714,
+  'Phungyar',1267,'Ukhrul',1267,'Chingai',1267,'Saikul',1172,'Karong',1172,'Mao',1172,
+  'Tadubi',1172,'Kangpokpi',1172,'Saitu',1172,'Tamei',1237,'Tamenglong',1237,'Nungba',1237,
+  'Tipaimukh',729,'Thanlon',729,'Henglep',729,'Churachandpur',729,'Saikot',729,'Singhat',729,
   // Meghalaya (60)
-  { id: "ML-AC-001", name: 'Nartiang', state: 'Meghalaya', district: 'West Jaintia Hill', acNo: 1 },
-  { id: "ML-AC-002", name: 'Jowai', state: 'Meghalaya', district: 'West Jaintia Hill', acNo: 2 },
-  { id: "ML-AC-003", name: 'Raliang', state: 'Meghalaya', district: 'West Jaintia Hill', acNo: 3 },
-  { id: "ML-AC-004", name: 'Mowkaiaw', state: 'Meghalaya', district: 'West Jaintia Hill', acNo: 4 },
-  { id: "ML-AC-005", name: 'Sutnga Saipung', state: 'Meghalaya', district: 'East Jaintia Hill', acNo: 5 },
-  { id: "ML-AC-006", name: 'Khliehriat', state: 'Meghalaya', district: 'East Jaintia Hill', acNo: 6 },
-  { id: "ML-AC-007", name: 'Amlarem', state: 'Meghalaya', district: 'West Jaintia Hill', acNo: 7 },
-  { id: "ML-AC-008", name: 'Mawhati', state: 'Meghalaya', district: 'Ri Bhoi', acNo: 8 },
-  { id: "ML-AC-009", name: 'Nongpoh', state: 'Meghalaya', district: 'Ri Bhoi', acNo: 9 },
-  { id: "ML-AC-010", name: 'Jirang', state: 'Meghalaya', district: 'Ri Bhoi', acNo: 10 },
-  { id: "ML-AC-011", name: 'Umsning', state: 'Meghalaya', district: 'Ri Bhoi', acNo: 11 },
-  { id: "ML-AC-012", name: 'Umroi', state: 'Meghalaya', district: 'Ri Bhoi', acNo: 12 },
-  { id: "ML-AC-013", name: 'Mawrengkneng', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 13 },
-  { id: "ML-AC-014", name: 'Pynthorumkhrah', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 14 },
-  { id: "ML-AC-015", name: 'Mawlai', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 15 },
-  { id: "ML-AC-016", name: 'East Shillong', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 16 },
-  { id: "ML-AC-017", name: 'North Shillong', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 17 },
-  { id: "ML-AC-018", name: 'West Shillong', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 18 },
-  { id: "ML-AC-019", name: 'South Shillong', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 19 },
-  { id: "ML-AC-020", name: 'Mylliem', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 20 },
-  { id: "ML-AC-021", name: 'Nongthymmai', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 21 },
-  { id: "ML-AC-022", name: 'Nongkrem', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 22 },
-  { id: "ML-AC-023", name: 'Sohiong', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 23 },
-  { id: "ML-AC-024", name: 'Mawphlang', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 24 },
-  { id: "ML-AC-025", name: 'Mawsynram', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 25 },
-  { id: "ML-AC-026", name: 'Shella', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 26 },
-  { id: "ML-AC-027", name: 'Pynursla', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 27 },
-  { id: "ML-AC-028", name: 'Sohra', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 28 },
-  { id: "ML-AC-029", name: 'Mawkynrew', state: 'Meghalaya', district: 'East Khasi Hills', acNo: 29 },
-  { id: "ML-AC-030", name: 'Mairang', state: 'Meghalaya', district: 'Eastern West Khasi Hills', acNo: 30 },
-  { id: "ML-AC-031", name: 'Mawthadraishan', state: 'Meghalaya', district: 'Eastern West Khasi Hills', acNo: 31 },
-  { id: "ML-AC-032", name: 'Nongstoin', state: 'Meghalaya', district: 'West Khasi Hills', acNo: 32 },
-  { id: "ML-AC-033", name: 'Rambrai-Jyrngam', state: 'Meghalaya', district: 'West Khasi Hills', acNo: 33 },
-  { id: "ML-AC-034", name: 'Mawshynrut', state: 'Meghalaya', district: 'West Khasi Hills', acNo: 34 },
-  { id: "ML-AC-035", name: 'Ranikor', state: 'Meghalaya', district: 'South West Khasi Hills', acNo: 35 },
-  { id: "ML-AC-036", name: 'Mawkyrwat', state: 'Meghalaya', district: 'South West Khasi Hills', acNo: 36 },
-  { id: "ML-AC-037", name: 'Kharkutta', state: 'Meghalaya', district: 'North Garo Hills', acNo: 37 },
-  { id: "ML-AC-038", name: 'Mendipathar', state: 'Meghalaya', district: 'North Garo Hills', acNo: 38 },
-  { id: "ML-AC-039", name: 'Resubelpara', state: 'Meghalaya', district: 'North Garo Hills', acNo: 39 },
-  { id: "ML-AC-040", name: 'Bajengdoba', state: 'Meghalaya', district: 'North Garo Hills', acNo: 40 },
-  { id: "ML-AC-041", name: 'Songsak', state: 'Meghalaya', district: 'East Garo Hills', acNo: 41 },
-  { id: "ML-AC-042", name: 'Rongjeng', state: 'Meghalaya', district: 'East Garo Hills', acNo: 42 },
-  { id: "ML-AC-043", name: 'Williamnagar', state: 'Meghalaya', district: 'East Garo Hills', acNo: 43 },
-  { id: "ML-AC-044", name: 'Raksamgre', state: 'Meghalaya', district: 'West Garo Hills', acNo: 44 },
-  { id: "ML-AC-045", name: 'Tikrikilla', state: 'Meghalaya', district: 'West Garo Hills', acNo: 45 },
-  { id: "ML-AC-046", name: 'Phulbari', state: 'Meghalaya', district: 'West Garo Hills', acNo: 46 },
-  { id: "ML-AC-047", name: 'Rajabala', state: 'Meghalaya', district: 'West Garo Hills', acNo: 47 },
-  { id: "ML-AC-048", name: 'Selsella', state: 'Meghalaya', district: 'West Garo Hills', acNo: 48 },
-  { id: "ML-AC-049", name: 'Dadenggre', state: 'Meghalaya', district: 'West Garo Hills', acNo: 49 },
-  { id: "ML-AC-050", name: 'North Tura', state: 'Meghalaya', district: 'West Garo Hills', acNo: 50 },
-  { id: "ML-AC-051", name: 'South Tura', state: 'Meghalaya', district: 'West Garo Hills', acNo: 51 },
-  { id: "ML-AC-052", name: 'Rangsakona', state: 'Meghalaya', district: 'West Garo Hills', acNo: 52 },
-  { id: "ML-AC-053", name: 'Ampati', state: 'Meghalaya', district: 'South West Garo Hills', acNo: 53 },
-  { id: "ML-AC-054", name: 'Mahendraganj', state: 'Meghalaya', district: 'South West Garo Hills', acNo: 54 },
-  { id: "ML-AC-055", name: 'Salmanpara', state: 'Meghalaya', district: 'South West Garo Hills', acNo: 55 },
-  { id: "ML-AC-056", name: 'Gambegre', state: 'Meghalaya', district: 'West Garo Hills', acNo: 56 },
-  { id: "ML-AC-057", name: 'Dalu', state: 'Meghalaya', district: 'West Garo Hills', acNo: 57 },
-  { id: "ML-AC-058", name: 'Rongara Siju', state: 'Meghalaya', district: 'South Garo Hills', acNo: 58 },
-  { id: "ML-AC-059", name: 'Chokpot', state: 'Meghalaya', district: 'South Garo Hills', acNo: 59 },
-  { id: "ML-AC-060", name: 'Baghmara', state: 'Meghalaya', district: 'South Garo Hills', acNo: 60 },
+  'Nartiang',1295,'Jowai',1295,'Raliang',1295,'Mowkaiaw',1295,'Sutnga Saipung',778,'Khliehriat',778,
+  'Amlarem',1295,'Mawhati',1144,'Nongpoh',1144,'Jirang',1144,'Umsning',1144,'Umroi',1144,
+  'Mawrengkneng',780,'Pynthorumkhrah',780,'Mawlai',780,'East Shillong',780,'North Shillong',780,'West Shillong',780,
+  'South Shillong',780,'Mylliem',780,'Nongthymmai',780,'Nongkrem',780,'Sohiong',780,'Mawphlang',780,
+  'Mawsynram',780,'Shella',780,'Pynursla',780,'Sohra',780,'Mawkynrew',780,'Mairang',783,
+  'Mawthadraishan',783,'Nongstoin',1298,'Rambrai-Jyrngam',1298,'Mawshynrut',1298,'Ranikor',1222,'Mawkyrwat',1222,
+  'Kharkutta',1073,'Mendipathar',1073,'Resubelpara',1073,'Bajengdoba',1073,'Songsak',776,'Rongjeng',776,
+  'Williamnagar',776,'Raksamgre',1293,'Tikrikilla',1293,'Phulbari',1293,'Rajabala',1293,'Selsella',1293,
+  'Dadenggre',1293,'North Tura',1293,'South Tura',1293,'Rangsakona',1293,'Ampati',1221,'Mahendraganj',1221,
+  'Salmanpara',1221,'Gambegre',1293,'Dalu',1293,'Rongara Siju',1217,'Chokpot',1217,'Baghmara',1217,
   // Mizoram (40)
-  { id: "MZ-AC-001", name: 'Hachhek', state: 'Mizoram', district: 'Mamit', acNo: 1 },
-  { id: "MZ-AC-002", name: 'Dampa', state: 'Mizoram', district: 'Mamit', acNo: 2 },
-  { id: "MZ-AC-003", name: 'Mamit', state: 'Mizoram', district: 'Mamit', acNo: 3 },
-  { id: "MZ-AC-004", name: 'Tuirial', state: 'Mizoram', district: 'Kolasib', acNo: 4 },
-  { id: "MZ-AC-005", name: 'Kolasib', state: 'Mizoram', district: 'Kolasib', acNo: 5 },
-  { id: "MZ-AC-006", name: 'Serlui', state: 'Mizoram', district: 'Kolasib', acNo: 6 },
-  { id: "MZ-AC-007", name: 'Tuivawl', state: 'Mizoram', district: 'Aizawl', acNo: 7 },
-  { id: "MZ-AC-008", name: 'Chalfilh', state: 'Mizoram', district: 'Saitual', acNo: 8 },
-  { id: "MZ-AC-009", name: 'Tawi', state: 'Mizoram', district: 'Saitual', acNo: 9 },
-  { id: "MZ-AC-010", name: 'Aizawl North 1', state: 'Mizoram', district: 'Aizawl', acNo: 10 },
-  { id: "MZ-AC-011", name: 'Aizawl North 2', state: 'Mizoram', district: 'Aizawl', acNo: 11 },
-  { id: "MZ-AC-012", name: 'Aizawl North 3', state: 'Mizoram', district: 'Aizawl', acNo: 12 },
-  { id: "MZ-AC-013", name: 'Aizawl East 1', state: 'Mizoram', district: 'Aizawl', acNo: 13 },
-  { id: "MZ-AC-014", name: 'Aizawl East 2', state: 'Mizoram', district: 'Aizawl', acNo: 14 },
-  { id: "MZ-AC-015", name: 'Aizawl West 1', state: 'Mizoram', district: 'Aizawl', acNo: 15 },
-  { id: "MZ-AC-016", name: 'Aizawl West 2', state: 'Mizoram', district: 'Aizawl', acNo: 16 },
-  { id: "MZ-AC-017", name: 'Aizawl West 3', state: 'Mizoram', district: 'Aizawl', acNo: 17 },
-  { id: "MZ-AC-018", name: 'Aizawl South 1', state: 'Mizoram', district: 'Aizawl', acNo: 18 },
-  { id: "MZ-AC-019", name: 'Aizawl South 2', state: 'Mizoram', district: 'Aizawl', acNo: 19 },
-  { id: "MZ-AC-020", name: 'Aizawl South 3', state: 'Mizoram', district: 'Aizawl', acNo: 20 },
-  { id: "MZ-AC-021", name: 'Lengteng', state: 'Mizoram', district: 'Saitual', acNo: 21 },
-  { id: "MZ-AC-022", name: 'Tuichang', state: 'Mizoram', district: 'Khawzawl', acNo: 22 },
-  { id: "MZ-AC-023", name: 'Champhai North', state: 'Mizoram', district: 'Champhai', acNo: 23 },
-  { id: "MZ-AC-024", name: 'Champhai South', state: 'Mizoram', district: 'Champhai', acNo: 24 },
-  { id: "MZ-AC-025", name: 'East Tuipui', state: 'Mizoram', district: 'Champhai', acNo: 25 },
-  { id: "MZ-AC-026", name: 'Serchhip', state: 'Mizoram', district: 'Serchhip', acNo: 26 },
-  { id: "MZ-AC-027", name: 'Tuikum', state: 'Mizoram', district: 'Serchhip', acNo: 27 },
-  { id: "MZ-AC-028", name: 'Hrangturzo', state: 'Mizoram', district: 'Serchhip', acNo: 28 },
-  { id: "MZ-AC-029", name: 'South Tuipui', state: 'Mizoram', district: 'Hnahthial', acNo: 29 },
-  { id: "MZ-AC-030", name: 'Lunglei North', state: 'Mizoram', district: 'Lunglei', acNo: 30 },
-  { id: "MZ-AC-031", name: 'Lunglei East', state: 'Mizoram', district: 'Lunglei', acNo: 31 },
-  { id: "MZ-AC-032", name: 'Lunglei West', state: 'Mizoram', district: 'Lunglei', acNo: 32 },
-  { id: "MZ-AC-033", name: 'Lunglei South', state: 'Mizoram', district: 'Lunglei', acNo: 33 },
-  { id: "MZ-AC-034", name: 'Thorang', state: 'Mizoram', district: 'Lunglei', acNo: 34 },
-  { id: "MZ-AC-035", name: 'West Tuipui', state: 'Mizoram', district: 'Lunglei', acNo: 35 },
-  { id: "MZ-AC-036", name: 'Tuichawng', state: 'Mizoram', district: 'Lawngtlai', acNo: 36 },
-  { id: "MZ-AC-037", name: 'Lawngtlai West', state: 'Mizoram', district: 'Lawngtlai', acNo: 37 },
-  { id: "MZ-AC-038", name: 'Lawngtlai East', state: 'Mizoram', district: 'Lawngtlai', acNo: 38 },
-  { id: "MZ-AC-039", name: 'Saiha', state: 'Mizoram', district: 'Saiha', acNo: 39 },
-  { id: "MZ-AC-040", name: 'Palak', state: 'Mizoram', district: 'Saiha', acNo: 40 },
+  'Hachhek',1002,'Dampa',1002,'Mamit',1002,'Tuirial',941,'Kolasib',941,'Serlui',941,
+  'Tuivawl',610,'Chalfilh',1155,'Tawi',1155,'Aizawl North 1',610,'Aizawl North 2',610,'Aizawl North 3',610,
+  'Aizawl East 1',610,'Aizawl East 2',610,'Aizawl West 1',610,'Aizawl West 2',610,'Aizawl West 3',610,'Aizawl South 1',610,
+  'Aizawl South 2',610,'Aizawl South 3',610,'Lengteng',1155,'Tuichang',929,'Champhai North',712,'Champhai South',712,
+  'East Tuipui',712,'Serchhip',1175,'Tuikum',1175,'Hrangturzo',1175,'South Tuipui',841,'Lunglei North',983,
+  'Lunglei East',983,'Lunglei West',983,'Lunglei South',983,'Thorang',983,'West Tuipui',983,'Tuichawng',972,
+  'Lawngtlai West',972,'Lawngtlai East',972,'Saiha',1154,'Palak',1154,
   // Nagaland (60)
-  { id: "NL-AC-001", name: 'Dimapur I', state: 'Nagaland', district: 'Dimapur', acNo: 1 },
-  { id: "NL-AC-002", name: 'Dimapur II', state: 'Nagaland', district: 'Dimapur', acNo: 2 },
-  { id: "NL-AC-003", name: 'Dimapur III', state: 'Nagaland', district: 'Dimapur', acNo: 3 },
-  { id: "NL-AC-004", name: 'Ghaspani I', state: 'Nagaland', district: 'Chümoukedima and Niuland', acNo: 4 },
-  { id: "NL-AC-005", name: 'Ghaspani II', state: 'Nagaland', district: 'Chümoukedima', acNo: 5 },
-  { id: "NL-AC-006", name: 'Tening', state: 'Nagaland', district: 'Peren', acNo: 6 },
-  { id: "NL-AC-007", name: 'Peren', state: 'Nagaland', district: 'Peren', acNo: 7 },
-  { id: "NL-AC-008", name: 'Western Angami', state: 'Nagaland', district: 'Kohima', acNo: 8 },
-  { id: "NL-AC-009", name: 'Kohima Town', state: 'Nagaland', district: 'Kohima', acNo: 9 },
-  { id: "NL-AC-010", name: 'Northern Angami I', state: 'Nagaland', district: 'Kohima', acNo: 10 },
-  { id: "NL-AC-011", name: 'Northern Angami II', state: 'Nagaland', district: 'Kohima', acNo: 11 },
-  { id: "NL-AC-012", name: 'Tseminyü', state: 'Nagaland', district: 'Tseminyü', acNo: 12 },
-  { id: "NL-AC-013", name: 'Pughoboto', state: 'Nagaland', district: 'Zünheboto', acNo: 13 },
-  { id: "NL-AC-014", name: 'Southern Angami I', state: 'Nagaland', district: 'Kohima', acNo: 14 },
-  { id: "NL-AC-015", name: 'Southern Angami II', state: 'Nagaland', district: 'Kohima', acNo: 15 },
-  { id: "NL-AC-016", name: 'Pfütsero', state: 'Nagaland', district: 'Phek', acNo: 16 },
-  { id: "NL-AC-017", name: 'Chizami', state: 'Nagaland', district: 'Phek', acNo: 17 },
-  { id: "NL-AC-018", name: 'Chozuba', state: 'Nagaland', district: 'Phek', acNo: 18 },
-  { id: "NL-AC-019", name: 'Phek', state: 'Nagaland', district: 'Phek', acNo: 19 },
-  { id: "NL-AC-020", name: 'Meluri', state: 'Nagaland', district: 'Phek', acNo: 20 },
-  { id: "NL-AC-021", name: 'Tuli', state: 'Nagaland', district: 'Mokokchung', acNo: 21 },
-  { id: "NL-AC-022", name: 'Arkakong', state: 'Nagaland', district: 'Mokokchung', acNo: 22 },
-  { id: "NL-AC-023", name: 'Impur', state: 'Nagaland', district: 'Mokokchung', acNo: 23 },
-  { id: "NL-AC-024", name: 'Angetyongpang', state: 'Nagaland', district: 'Mokokchung', acNo: 24 },
-  { id: "NL-AC-025", name: 'Mongoya', state: 'Nagaland', district: 'Mokokchung', acNo: 25 },
-  { id: "NL-AC-026", name: 'Aonglenden', state: 'Nagaland', district: 'Mokokchung', acNo: 26 },
-  { id: "NL-AC-027", name: 'Mokokchung Town', state: 'Nagaland', district: 'Mokokchung', acNo: 27 },
-  { id: "NL-AC-028", name: 'Koridang', state: 'Nagaland', district: 'Mokokchung', acNo: 28 },
-  { id: "NL-AC-029", name: 'Jangpetkong', state: 'Nagaland', district: 'Mokokchung', acNo: 29 },
-  { id: "NL-AC-030", name: 'Alongtaki', state: 'Nagaland', district: 'Mokokchung', acNo: 30 },
-  { id: "NL-AC-031", name: 'Akuluto', state: 'Nagaland', district: 'Zünheboto', acNo: 31 },
-  { id: "NL-AC-032", name: 'Atoizu', state: 'Nagaland', district: 'Zünheboto', acNo: 32 },
-  { id: "NL-AC-033", name: 'Suruhoto', state: 'Nagaland', district: 'Zünheboto', acNo: 33 },
-  { id: "NL-AC-034", name: 'Aghunato', state: 'Nagaland', district: 'Zünheboto', acNo: 34 },
-  { id: "NL-AC-035", name: 'Zünheboto', state: 'Nagaland', district: 'Zünheboto', acNo: 35 },
-  { id: "NL-AC-036", name: 'Satakha', state: 'Nagaland', district: 'Zünheboto', acNo: 36 },
-  { id: "NL-AC-037", name: 'Tyüi', state: 'Nagaland', district: 'Wokha', acNo: 37 },
-  { id: "NL-AC-038", name: 'Wokha', state: 'Nagaland', district: 'Wokha', acNo: 38 },
-  { id: "NL-AC-039", name: 'Sanis', state: 'Nagaland', district: 'Wokha', acNo: 39 },
-  { id: "NL-AC-040", name: 'Bhandari', state: 'Nagaland', district: 'Wokha', acNo: 40 },
-  { id: "NL-AC-041", name: 'Tizit', state: 'Nagaland', district: 'Mon', acNo: 41 },
-  { id: "NL-AC-042", name: 'Wakching', state: 'Nagaland', district: 'Mon', acNo: 42 },
-  { id: "NL-AC-043", name: 'Tapi', state: 'Nagaland', district: 'Mon', acNo: 43 },
-  { id: "NL-AC-044", name: 'Phomching', state: 'Nagaland', district: 'Mon', acNo: 44 },
-  { id: "NL-AC-045", name: 'Tehok', state: 'Nagaland', district: 'Mon', acNo: 45 },
-  { id: "NL-AC-046", name: 'Mon Town', state: 'Nagaland', district: 'Mon', acNo: 46 },
-  { id: "NL-AC-047", name: 'Aboi', state: 'Nagaland', district: 'Mon', acNo: 47 },
-  { id: "NL-AC-048", name: 'Moka', state: 'Nagaland', district: 'Mon', acNo: 48 },
-  { id: "NL-AC-049", name: 'Tamlu', state: 'Nagaland', district: 'Longleng', acNo: 49 },
-  { id: "NL-AC-050", name: 'Longleng', state: 'Nagaland', district: 'Longleng', acNo: 50 },
-  { id: "NL-AC-051", name: 'Noksen', state: 'Nagaland', district: 'Tuensang', acNo: 51 },
-  { id: "NL-AC-052", name: 'Longkhim Chare', state: 'Nagaland', district: 'Tuensang', acNo: 52 },
-  { id: "NL-AC-053", name: 'Tuensang Sadar I', state: 'Nagaland', district: 'Tuensang', acNo: 53 },
-  { id: "NL-AC-054", name: 'Tuensang Sadar II', state: 'Nagaland', district: 'Tuensang', acNo: 54 },
-  { id: "NL-AC-055", name: 'Tobu', state: 'Nagaland', district: 'Mon', acNo: 55 },
-  { id: "NL-AC-056", name: 'Noklak', state: 'Nagaland', district: 'Noklak', acNo: 56 },
-  { id: "NL-AC-057", name: 'Thonoknyu', state: 'Nagaland', district: 'Noklak', acNo: 57 },
-  { id: "NL-AC-058", name: 'Shamator–Chessore', state: 'Nagaland', district: 'Shamator', acNo: 58 },
-  { id: "NL-AC-059", name: 'Seyochung–Sitimi', state: 'Nagaland', district: 'Kiphire', acNo: 59 },
-  { id: "NL-AC-060", name: 'Pungro–Kiphire', state: 'Nagaland', district: 'Kiphire', acNo: 60 },
+  'Dimapur I',766,'Dimapur II',766,'Dimapur III',766,'Ghaspani I',732,'Ghaspani II',731,'Tening',1104,
+  'Peren',1104,'Western Angami',939,'Kohima Town',939,'Northern Angami I',939,'Northern Angami II',939,'Tseminyü',1261,
+  'Pughoboto',1308,'Southern Angami I',939,'Southern Angami II',939,'Pfütsero',1106,'Chizami',1106,'Chozuba',1106,
+  'Phek',1106,'Meluri',1106,'Tuli',1023,'Arkakong',1023,'Impur',1023,'Angetyongpang',1023,
+  'Mongoya',1023,'Aonglenden',1023,'Mokokchung Town',1023,'Koridang',1023,'Jangpetkong',1023,'Alongtaki',1023,
+  'Akuluto',1308,'Atoizu',1308,'Suruhoto',1308,'Aghunato',1308,'Zünheboto',1308,'Satakha',1308,
+  'Tyüi',1302,'Wokha',1302,'Sanis',1302,'Bhandari',1302,'Tizit',1024,'Wakching',1024,
+  'Tapi',1024,'Phomching',1024,'Tehok',1024,'Mon Town',1024,'Aboi',1024,'Moka',1024,
+  'Tamlu',977,'Longleng',977,'Noksen',1262,'Longkhim Chare',1262,'Tuensang Sadar I',1262,'Tuensang Sadar II',1262,
+  'Tobu',1024,'Noklak',1069,'Thonoknyu',1069,'Shamator–Chessore',1181,'Seyochung–Sitimi',935,'Pungro–Kiphire',935,
   // Odisha (147)
-  { id: "OD-AC-001", name: 'Padampur', state: 'Odisha', district: 'Mayurbhanj', acNo: 1 },
-  { id: "OD-AC-002", name: 'Bijepur', state: 'Odisha', district: 'Mayurbhanj', acNo: 2 },
-  { id: "OD-AC-003", name: 'Bargarh', state: 'Odisha', district: 'Khordha', acNo: 3 },
-  { id: "OD-AC-004", name: 'Attabira', state: 'Odisha', district: 'Sambalpur', acNo: 4 },
-  { id: "OD-AC-005", name: 'Bhatli', state: 'Odisha', district: 'Khordha', acNo: 5 },
-  { id: "OD-AC-006", name: 'Brajarajnagar', state: 'Odisha', district: 'Subarnapur', acNo: 6 },
-  { id: "OD-AC-007", name: 'Jharsuguda', state: 'Odisha', district: 'Sundargarh', acNo: 7 },
-  { id: "OD-AC-008", name: 'Talsara', state: 'Odisha', district: 'Cuttack', acNo: 8 },
-  { id: "OD-AC-009", name: 'Sundargarh', state: 'Odisha', district: 'Jagatsinghpur', acNo: 9 },
-  { id: "OD-AC-010", name: 'Biramitrapur', state: 'Odisha', district: 'Cuttack', acNo: 10 },
-  { id: "OD-AC-011", name: 'Raghunathpali', state: 'Odisha', district: 'Dhenkanal', acNo: 11 },
-  { id: "OD-AC-012", name: 'Rourkela', state: 'Odisha', district: 'Ganjam', acNo: 12 },
-  { id: "OD-AC-013", name: 'Rajgangpur', state: 'Odisha', district: 'Mayurbhanj', acNo: 13 },
-  { id: "OD-AC-014", name: 'Bonai', state: 'Odisha', district: 'Kalahandi', acNo: 14 },
-  { id: "OD-AC-015", name: 'Kuchinda', state: 'Odisha', district: 'Mayurbhanj', acNo: 15 },
-  { id: "OD-AC-016", name: 'Rengali', state: 'Odisha', district: 'Cuttack', acNo: 16 },
-  { id: "OD-AC-017", name: 'Sambalpur', state: 'Odisha', district: 'Ganjam', acNo: 17 },
-  { id: "OD-AC-018", name: 'Rairakhol', state: 'Odisha', district: 'Nabarangpur', acNo: 18 },
-  { id: "OD-AC-019", name: 'Deogarh', state: 'Odisha', district: 'Kalahandi', acNo: 19 },
-  { id: "OD-AC-020", name: 'Telkoi', state: 'Odisha', district: 'Mayurbhanj', acNo: 20 },
-  { id: "OD-AC-021", name: 'Ghasipura', state: 'Odisha', district: 'Jharsuguda', acNo: 21 },
-  { id: "OD-AC-022", name: 'Anandpur', state: 'Odisha', district: 'Bargarh', acNo: 22 },
-  { id: "OD-AC-023", name: 'Patna', state: 'Odisha', district: 'Koraput', acNo: 23 },
-  { id: "OD-AC-024", name: 'Keonjhar', state: 'Odisha', district: 'Koraput', acNo: 24 },
-  { id: "OD-AC-025", name: 'Champua', state: 'Odisha', district: 'Mayurbhanj', acNo: 25 },
-  { id: "OD-AC-026", name: 'Jashipur', state: 'Odisha', district: 'Kendrapara', acNo: 26 },
-  { id: "OD-AC-027", name: 'Saraskana', state: 'Odisha', district: 'Gajapati', acNo: 27 },
-  { id: "OD-AC-028", name: 'Rairangpur', state: 'Odisha', district: 'Kendujhar', acNo: 28 },
-  { id: "OD-AC-029", name: 'Bangriposi', state: 'Odisha', district: 'Balangir', acNo: 29 },
-  { id: "OD-AC-030", name: 'Karanjia', state: 'Odisha', acNo: 30 },
-  { id: "OD-AC-031", name: 'Udala', state: 'Odisha', acNo: 31 },
-  { id: "OD-AC-032", name: 'Badasahi', state: 'Odisha', acNo: 32 },
-  { id: "OD-AC-033", name: 'Baripada', state: 'Odisha', acNo: 33 },
-  { id: "OD-AC-034", name: 'Morada', state: 'Odisha', acNo: 34 },
-  { id: "OD-AC-035", name: 'Jaleswar', state: 'Odisha', acNo: 35 },
-  { id: "OD-AC-036", name: 'Bhograi', state: 'Odisha', acNo: 36 },
-  { id: "OD-AC-037", name: 'Basta', state: 'Odisha', acNo: 37 },
-  { id: "OD-AC-038", name: 'Balasore', state: 'Odisha', acNo: 38 },
-  { id: "OD-AC-039", name: 'Remuna', state: 'Odisha', acNo: 39 },
-  { id: "OD-AC-040", name: 'Nilgiri', state: 'Odisha', acNo: 40 },
-  { id: "OD-AC-041", name: 'Soro', state: 'Odisha', acNo: 41 },
-  { id: "OD-AC-042", name: 'Simulia', state: 'Odisha', acNo: 42 },
-  { id: "OD-AC-043", name: 'Bhandaripokhari', state: 'Odisha', acNo: 43 },
-  { id: "OD-AC-044", name: 'Bhadrak', state: 'Odisha', acNo: 44 },
-  { id: "OD-AC-045", name: 'Basudevpur', state: 'Odisha', acNo: 45 },
-  { id: "OD-AC-046", name: 'Dhamnagar', state: 'Odisha', acNo: 46 },
-  { id: "OD-AC-047", name: 'Chandabali', state: 'Odisha', acNo: 47 },
-  { id: "OD-AC-048", name: 'Binjharpur', state: 'Odisha', acNo: 48 },
-  { id: "OD-AC-049", name: 'Bari', state: 'Odisha', acNo: 49 },
-  { id: "OD-AC-050", name: 'Barchana', state: 'Odisha', acNo: 50 },
-  { id: "OD-AC-051", name: 'Dharmasala', state: 'Odisha', acNo: 51 },
-  { id: "OD-AC-052", name: 'Jajpur', state: 'Odisha', acNo: 52 },
-  { id: "OD-AC-053", name: 'Korei', state: 'Odisha', acNo: 53 },
-  { id: "OD-AC-054", name: 'Sukinda', state: 'Odisha', acNo: 54 },
-  { id: "OD-AC-055", name: 'Dhenkanal', state: 'Odisha', acNo: 55 },
-  { id: "OD-AC-056", name: 'Hindol', state: 'Odisha', acNo: 56 },
-  { id: "OD-AC-057", name: 'Kamakshyanagar', state: 'Odisha', acNo: 57 },
-  { id: "OD-AC-058", name: 'Parjanga', state: 'Odisha', acNo: 58 },
-  { id: "OD-AC-059", name: 'Pallahara', state: 'Odisha', acNo: 59 },
-  { id: "OD-AC-060", name: 'Talcher', state: 'Odisha', acNo: 60 },
-  { id: "OD-AC-061", name: 'Angul', state: 'Odisha', acNo: 61 },
-  { id: "OD-AC-062", name: 'Chhendipada', state: 'Odisha', acNo: 62 },
-  { id: "OD-AC-063", name: 'Athmallik', state: 'Odisha', acNo: 63 },
-  { id: "OD-AC-064", name: 'Birmaharajpur', state: 'Odisha', acNo: 64 },
-  { id: "OD-AC-065", name: 'Sonepur', state: 'Odisha', acNo: 65 },
-  { id: "OD-AC-066", name: 'Loisingha', state: 'Odisha', acNo: 66 },
-  { id: "OD-AC-067", name: 'Patnagarh', state: 'Odisha', acNo: 67 },
-  { id: "OD-AC-068", name: 'Bolangir', state: 'Odisha', acNo: 68 },
-  { id: "OD-AC-069", name: 'Titlagarh', state: 'Odisha', acNo: 69 },
-  { id: "OD-AC-070", name: 'Kantabanji', state: 'Odisha', acNo: 70 },
-  { id: "OD-AC-071", name: 'Nuapada', state: 'Odisha', acNo: 71 },
-  { id: "OD-AC-072", name: 'Khariar', state: 'Odisha', acNo: 72 },
-  { id: "OD-AC-073", name: 'Umerkote', state: 'Odisha', acNo: 73 },
-  { id: "OD-AC-074", name: 'Jharigam', state: 'Odisha', acNo: 74 },
-  { id: "OD-AC-075", name: 'Nabarangpur', state: 'Odisha', acNo: 75 },
-  { id: "OD-AC-076", name: 'Dabugam', state: 'Odisha', acNo: 76 },
-  { id: "OD-AC-077", name: 'Lanjigarh', state: 'Odisha', acNo: 77 },
-  { id: "OD-AC-078", name: 'Junagarh', state: 'Odisha', acNo: 78 },
-  { id: "OD-AC-079", name: 'Dharmagarh', state: 'Odisha', acNo: 79 },
-  { id: "OD-AC-080", name: 'Bhawanipatna', state: 'Odisha', acNo: 80 },
-  { id: "OD-AC-081", name: 'Narla', state: 'Odisha', acNo: 81 },
-  { id: "OD-AC-082", name: 'Baliguda', state: 'Odisha', acNo: 82 },
-  { id: "OD-AC-083", name: 'G. Udayagiri', state: 'Odisha', acNo: 83 },
-  { id: "OD-AC-084", name: 'Phulbani', state: 'Odisha', acNo: 84 },
-  { id: "OD-AC-085", name: 'Kantamal', state: 'Odisha', acNo: 85 },
-  { id: "OD-AC-086", name: 'Boudh', state: 'Odisha', acNo: 86 },
-  { id: "OD-AC-087", name: 'Baramba', state: 'Odisha', acNo: 87 },
-  { id: "OD-AC-088", name: 'Banki', state: 'Odisha', acNo: 88 },
-  { id: "OD-AC-089", name: 'Athgarh', state: 'Odisha', acNo: 89 },
-  { id: "OD-AC-090", name: 'Barabati-Cuttack', state: 'Odisha', acNo: 90 },
-  { id: "OD-AC-091", name: 'Choudwar-Cuttack', state: 'Odisha', acNo: 91 },
-  { id: "OD-AC-092", name: 'Niali', state: 'Odisha', acNo: 92 },
-  { id: "OD-AC-093", name: 'Cuttack Sadar', state: 'Odisha', acNo: 93 },
-  { id: "OD-AC-094", name: 'Salepur', state: 'Odisha', acNo: 94 },
-  { id: "OD-AC-095", name: 'Mahanga', state: 'Odisha', acNo: 95 },
-  { id: "OD-AC-096", name: 'Patkura', state: 'Odisha', acNo: 96 },
-  { id: "OD-AC-097", name: 'Kendrapara', state: 'Odisha', acNo: 97 },
-  { id: "OD-AC-098", name: 'Aul', state: 'Odisha', acNo: 98 },
-  { id: "OD-AC-099", name: 'Rajanagar', state: 'Odisha', acNo: 99 },
-  { id: "OD-AC-100", name: 'Mahakalapada', state: 'Odisha', acNo: 100 },
-  { id: "OD-AC-101", name: 'Paradeep', state: 'Odisha', acNo: 101 },
-  { id: "OD-AC-102", name: 'Tirtol', state: 'Odisha', acNo: 102 },
-  { id: "OD-AC-103", name: 'Balikuda-Erasama', state: 'Odisha', acNo: 103 },
-  { id: "OD-AC-104", name: 'Jagatsinghpur', state: 'Odisha', acNo: 104 },
-  { id: "OD-AC-105", name: 'Kakatpur', state: 'Odisha', acNo: 105 },
-  { id: "OD-AC-106", name: 'Nimapara', state: 'Odisha', acNo: 106 },
-  { id: "OD-AC-107", name: 'Puri', state: 'Odisha', acNo: 107 },
-  { id: "OD-AC-108", name: 'Brahmagiri', state: 'Odisha', acNo: 108 },
-  { id: "OD-AC-109", name: 'Satyabadi', state: 'Odisha', acNo: 109 },
-  { id: "OD-AC-110", name: 'Pipili', state: 'Odisha', acNo: 110 },
-  { id: "OD-AC-111", name: 'Jayadev', state: 'Odisha', acNo: 111 },
-  { id: "OD-AC-112", name: 'Bhubaneswar Central', state: 'Odisha', acNo: 112 },
-  { id: "OD-AC-113", name: 'Bhubaneswar North', state: 'Odisha', acNo: 113 },
-  { id: "OD-AC-114", name: 'Ekamra Bhubaneswar', state: 'Odisha', acNo: 114 },
-  { id: "OD-AC-115", name: 'Jatani', state: 'Odisha', acNo: 115 },
-  { id: "OD-AC-116", name: 'Begunia', state: 'Odisha', acNo: 116 },
-  { id: "OD-AC-117", name: 'Khurda', state: 'Odisha', acNo: 117 },
-  { id: "OD-AC-118", name: 'Chilika', state: 'Odisha', acNo: 118 },
-  { id: "OD-AC-119", name: 'Ranpur', state: 'Odisha', acNo: 119 },
-  { id: "OD-AC-120", name: 'Khandapada', state: 'Odisha', acNo: 120 },
-  { id: "OD-AC-121", name: 'Daspalla', state: 'Odisha', acNo: 121 },
-  { id: "OD-AC-122", name: 'Nayagarh', state: 'Odisha', acNo: 122 },
-  { id: "OD-AC-123", name: 'Bhanjanagar', state: 'Odisha', acNo: 123 },
-  { id: "OD-AC-124", name: 'Polasara', state: 'Odisha', acNo: 124 },
-  { id: "OD-AC-125", name: 'Kabisuryanagar', state: 'Odisha', acNo: 125 },
-  { id: "OD-AC-126", name: 'Khalikote', state: 'Odisha', acNo: 126 },
-  { id: "OD-AC-127", name: 'Chhatrapur', state: 'Odisha', acNo: 127 },
-  { id: "OD-AC-128", name: 'Aska', state: 'Odisha', acNo: 128 },
-  { id: "OD-AC-129", name: 'Surada', state: 'Odisha', acNo: 129 },
-  { id: "OD-AC-130", name: 'Sanakhemundi', state: 'Odisha', acNo: 130 },
-  { id: "OD-AC-131", name: 'Hinjili', state: 'Odisha', acNo: 131 },
-  { id: "OD-AC-132", name: 'Gopalpur', state: 'Odisha', acNo: 132 },
-  { id: "OD-AC-133", name: 'Berhampur', state: 'Odisha', acNo: 133 },
-  { id: "OD-AC-134", name: 'Digapahandi', state: 'Odisha', acNo: 134 },
-  { id: "OD-AC-135", name: 'Chikiti', state: 'Odisha', acNo: 135 },
-  { id: "OD-AC-136", name: 'Mohana', state: 'Odisha', acNo: 136 },
-  { id: "OD-AC-137", name: 'Paralakhemundi', state: 'Odisha', acNo: 137 },
-  { id: "OD-AC-138", name: 'Gunupur', state: 'Odisha', acNo: 138 },
-  { id: "OD-AC-139", name: 'Bissam Cuttack', state: 'Odisha', acNo: 139 },
-  { id: "OD-AC-140", name: 'Rayagada', state: 'Odisha', acNo: 140 },
-  { id: "OD-AC-141", name: 'Laxmipur', state: 'Odisha', acNo: 141 },
-  { id: "OD-AC-142", name: 'Kotpad', state: 'Odisha', acNo: 142 },
-  { id: "OD-AC-143", name: 'Jeypore', state: 'Odisha', acNo: 143 },
-  { id: "OD-AC-144", name: 'Koraput', state: 'Odisha', acNo: 144 },
-  { id: "OD-AC-145", name: 'Pottangi', state: 'Odisha', acNo: 145 },
-  { id: "OD-AC-146", name: 'Malkangiri', state: 'Odisha', acNo: 146 },
-  { id: "OD-AC-147", name: 'Chitrakonda', state: 'Odisha', acNo: 147 },
+  'Padampur',1016,'Bijepur',1016,'Bargarh',931,'Attabira',1160,'Bhatli',931,'Brajarajnagar',1227,
+  'Jharsuguda',1230,'Talsara',736,'Sundargarh',852,'Biramitrapur',736,'Raghunathpali',758,'Rourkela',805,
+  'Rajgangpur',1016,'Bonai',891,'Kuchinda',1016,'Rengali',736,'Sambalpur',805,'Rairakhol',1037,
+  'Deogarh',891,'Telkoi',1016,'Ghasipura',878,'Anandpur',665,'Patna',948,'Keonjhar',948,
+  'Champua',1016,'Jashipur',921,'Saraskana',799,'Rairangpur',922,'Bangriposi',648,'Karanjia',-1,
+  'Udala',-1,'Badasahi',-1,'Baripada',-1,'Morada',-1,'Jaleswar',-1,'Bhograi',-1,
+  'Basta',-1,'Balasore',-1,'Remuna',-1,'Nilgiri',-1,'Soro',-1,'Simulia',-1,
+  'Bhandaripokhari',-1,'Bhadrak',-1,'Basudevpur',-1,'Dhamnagar',-1,'Chandabali',-1,'Binjharpur',-1,
+  'Bari',-1,'Barchana',-1,'Dharmasala',-1,'Jajpur',-1,'Korei',-1,'Sukinda',-1,
+  'Dhenkanal',-1,'Hindol',-1,'Kamakshyanagar',-1,'Parjanga',-1,'Pallahara',-1,'Talcher',-1,
+  'Angul',-1,'Chhendipada',-1,'Athmallik',-1,'Birmaharajpur',-1,'Sonepur',-1,'Loisingha',-1,
+  'Patnagarh',-1,'Bolangir',-1,'Titlagarh',-1,'Kantabanji',-1,'Nuapada',-1,'Khariar',-1,
+  'Umerkote',-1,'Jharigam',-1,'Nabarangpur',-1,'Dabugam',-1,'Lanjigarh',-1,'Junagarh',-1,
+  'Dharmagarh',-1,'Bhawanipatna',-1,'Narla',-1,'Baliguda',-1,'G. Udayagiri',-1,'Phulbani',-1,
+  'Kantamal',-1,'Boudh',-1,'Baramba',-1,'Banki',-1,'Athgarh',-1,'Barabati-Cuttack',-1,
+  'Choudwar-Cuttack',-1,'Niali',-1,'Cuttack Sadar',-1,'Salepur',-1,'Mahanga',-1,'Patkura',-1,
+  'Kendrapara',-1,'Aul',-1,'Rajanagar',-1,'Mahakalapada',-1,'Paradeep',-1,'Tirtol',-1,
+  'Balikuda-Erasama',-1,'Jagatsinghpur',-1,'Kakatpur',-1,'Nimapara',-1,'Puri',-1,'Brahmagiri',-1,
+  'Satyabadi',-1,'Pipili',-1,'Jayadev',-1,'Bhubaneswar Central',-1,'Bhubaneswar North',-1,'Ekamra Bhubaneswar',-1,
+  'Jatani',-1,'Begunia',-1,'Khurda',-1,'Chilika',-1,'Ranpur',-1,'Khandapada',-1,
+  'Daspalla',-1,'Nayagarh',-1,'Bhanjanagar',-1,'Polasara',-1,'Kabisuryanagar',-1,'Khalikote',-1,
+  'Chhatrapur',-1,'Aska',-1,'Surada',-1,'Sanakhemundi',-1,'Hinjili',-1,'Gopalpur',-1,
+  'Berhampur',-1,'Digapahandi',-1,'Chikiti',-1,'Mohana',-1,'Paralakhemundi',-1,'Gunupur',-1,
+  'Bissam Cuttack',-1,'Rayagada',-1,'Laxmipur',-1,'Kotpad',-1,'Jeypore',-1,'Koraput',-1,
+  'Pottangi',-1,'Malkangiri',-1,'Chitrakonda',-1,
   // Punjab (117)
-  { id: "PB-AC-001", name: 'Sujanpur', state: 'Punjab', district: 'Pathankot', acNo: 1 },
-  { id: "PB-AC-002", name: 'Bhoa', state: 'Punjab', district: 'Pathankot', acNo: 2 },
-  { id: "PB-AC-003", name: 'Pathankot', state: 'Punjab', district: 'Pathankot', acNo: 3 },
-  { id: "PB-AC-004", name: 'Gurdaspur', state: 'Punjab', district: 'Gurdaspur', acNo: 4 },
-  { id: "PB-AC-005", name: 'Dina Nagar', state: 'Punjab', district: 'Gurdaspur', acNo: 5 },
-  { id: "PB-AC-006", name: 'Qadian', state: 'Punjab', district: 'Gurdaspur', acNo: 6 },
-  { id: "PB-AC-007", name: 'Batala', state: 'Punjab', district: 'Gurdaspur', acNo: 7 },
-  { id: "PB-AC-008", name: 'Sri Hargobindpur', state: 'Punjab', district: 'Gurdaspur', acNo: 8 },
-  { id: "PB-AC-009", name: 'Fatehgarh Churian', state: 'Punjab', district: 'Gurdaspur', acNo: 9 },
-  { id: "PB-AC-010", name: 'Dera Baba Nanak', state: 'Punjab', district: 'Gurdaspur', acNo: 10 },
-  { id: "PB-AC-011", name: 'Ajnala', state: 'Punjab', district: 'Amritsar', acNo: 11 },
-  { id: "PB-AC-012", name: 'Raja Sansi', state: 'Punjab', district: 'Amritsar', acNo: 12 },
-  { id: "PB-AC-013", name: 'Majitha', state: 'Punjab', district: 'Amritsar', acNo: 13 },
-  { id: "PB-AC-014", name: 'Jandiala', state: 'Punjab', district: 'Amritsar', acNo: 14 },
-  { id: "PB-AC-015", name: 'Amritsar North', state: 'Punjab', district: 'Amritsar', acNo: 15 },
-  { id: "PB-AC-016", name: 'Amritsar West', state: 'Punjab', district: 'Amritsar', acNo: 16 },
-  { id: "PB-AC-017", name: 'Amritsar Central', state: 'Punjab', district: 'Amritsar', acNo: 17 },
-  { id: "PB-AC-018", name: 'Amritsar East', state: 'Punjab', district: 'Amritsar', acNo: 18 },
-  { id: "PB-AC-019", name: 'Amritsar South', state: 'Punjab', district: 'Amritsar', acNo: 19 },
-  { id: "PB-AC-020", name: 'Attari', state: 'Punjab', district: 'Amritsar', acNo: 20 },
-  { id: "PB-AC-021", name: 'Tarn Taran', state: 'Punjab', district: 'Tarn Taran', acNo: 21 },
-  { id: "PB-AC-022", name: 'Khem Karan', state: 'Punjab', district: 'Tarn Taran', acNo: 22 },
-  { id: "PB-AC-023", name: 'Patti', state: 'Punjab', district: 'Tarn Taran', acNo: 23 },
-  { id: "PB-AC-024", name: 'Khadoor Sahib', state: 'Punjab', district: 'Tarn Taran', acNo: 24 },
-  { id: "PB-AC-025", name: 'Baba Bakala', state: 'Punjab', district: 'Tarn Taran', acNo: 25 },
-  { id: "PB-AC-026", name: 'Bholath', state: 'Punjab', district: 'Kapurthala', acNo: 26 },
-  { id: "PB-AC-027", name: 'Kapurthala', state: 'Punjab', district: 'Kapurthala', acNo: 27 },
-  { id: "PB-AC-028", name: 'Sultanpur Lodhi', state: 'Punjab', district: 'Kapurthala', acNo: 28 },
-  { id: "PB-AC-029", name: 'Phagwara', state: 'Punjab', district: 'Kapurthala', acNo: 29 },
-  { id: "PB-AC-030", name: 'Phillaur', state: 'Punjab', district: 'Jalandhar', acNo: 30 },
-  { id: "PB-AC-031", name: 'Nakodar', state: 'Punjab', district: 'Jalandhar', acNo: 31 },
-  { id: "PB-AC-032", name: 'Shahkot', state: 'Punjab', district: 'Jalandhar', acNo: 32 },
-  { id: "PB-AC-033", name: 'Kartarpur', state: 'Punjab', district: 'Jalandhar', acNo: 33 },
-  { id: "PB-AC-034", name: 'Jalandhar West', state: 'Punjab', district: 'Jalandhar', acNo: 34 },
-  { id: "PB-AC-035", name: 'Jalandhar Central', state: 'Punjab', district: 'Jalandhar', acNo: 35 },
-  { id: "PB-AC-036", name: 'Jalandhar North', state: 'Punjab', district: 'Jalandhar', acNo: 36 },
-  { id: "PB-AC-037", name: 'Jalandhar Cantt', state: 'Punjab', district: 'Jalandhar', acNo: 37 },
-  { id: "PB-AC-038", name: 'Adampur', state: 'Punjab', district: 'Jalandhar', acNo: 38 },
-  { id: "PB-AC-039", name: 'Mukerian', state: 'Punjab', district: 'Hoshiarpur', acNo: 39 },
-  { id: "PB-AC-040", name: 'Dasuya', state: 'Punjab', district: 'Hoshiarpur', acNo: 40 },
-  { id: "PB-AC-041", name: 'Urmar', state: 'Punjab', district: 'Hoshiarpur', acNo: 41 },
-  { id: "PB-AC-042", name: 'Sham Chaurasi', state: 'Punjab', district: 'Hoshiarpur', acNo: 42 },
-  { id: "PB-AC-043", name: 'Hoshiarpur', state: 'Punjab', district: 'Hoshiarpur', acNo: 43 },
-  { id: "PB-AC-044", name: 'Chabbewal', state: 'Punjab', district: 'Hoshiarpur', acNo: 44 },
-  { id: "PB-AC-045", name: 'Garhshankar', state: 'Punjab', district: 'Hoshiarpur', acNo: 45 },
-  { id: "PB-AC-046", name: 'Banga', state: 'Punjab', district: 'S.B.S. Nagar', acNo: 46 },
-  { id: "PB-AC-047", name: 'Nawan Shahr', state: 'Punjab', district: 'S.B.S. Nagar', acNo: 47 },
-  { id: "PB-AC-048", name: 'Balachaur', state: 'Punjab', district: 'S.B.S. Nagar', acNo: 48 },
-  { id: "PB-AC-049", name: 'Anandpur Sahib', state: 'Punjab', district: 'Rupnagar', acNo: 49 },
-  { id: "PB-AC-050", name: 'Rupnagar', state: 'Punjab', district: 'Rupnagar', acNo: 50 },
-  { id: "PB-AC-051", name: 'Chamkaur Sahib', state: 'Punjab', district: 'Rupnagar', acNo: 51 },
-  { id: "PB-AC-052", name: 'Kharar', state: 'Punjab', district: 'Mohali', acNo: 52 },
-  { id: "PB-AC-053", name: 'S.A.S. Nagar', state: 'Punjab', district: 'Mohali', acNo: 53 },
-  { id: "PB-AC-054", name: 'Bassi Pathana', state: 'Punjab', district: 'Fatehgarh Sahib', acNo: 54 },
-  { id: "PB-AC-055", name: 'Fatehgarh Sahib', state: 'Punjab', district: 'Fatehgarh Sahib', acNo: 55 },
-  { id: "PB-AC-056", name: 'Amloh', state: 'Punjab', district: 'Fatehgarh Sahib', acNo: 56 },
-  { id: "PB-AC-057", name: 'Khanna', state: 'Punjab', district: 'Ludhiana', acNo: 57 },
-  { id: "PB-AC-058", name: 'Samrala', state: 'Punjab', district: 'Ludhiana', acNo: 58 },
-  { id: "PB-AC-059", name: 'Sahnewal', state: 'Punjab', district: 'Ludhiana', acNo: 59 },
-  { id: "PB-AC-060", name: 'Ludhiana East', state: 'Punjab', district: 'Ludhiana', acNo: 60 },
-  { id: "PB-AC-061", name: 'Ludhiana South', state: 'Punjab', district: 'Ludhiana', acNo: 61 },
-  { id: "PB-AC-062", name: 'Atam Nagar', state: 'Punjab', district: 'Ludhiana', acNo: 62 },
-  { id: "PB-AC-063", name: 'Ludhiana Central', state: 'Punjab', district: 'Ludhiana', acNo: 63 },
-  { id: "PB-AC-064", name: 'Ludhiana West', state: 'Punjab', district: 'Ludhiana', acNo: 64 },
-  { id: "PB-AC-065", name: 'Ludhiana North', state: 'Punjab', district: 'Ludhiana', acNo: 65 },
-  { id: "PB-AC-066", name: 'Gill', state: 'Punjab', district: 'Ludhiana', acNo: 66 },
-  { id: "PB-AC-067", name: 'Payal', state: 'Punjab', district: 'Ludhiana', acNo: 67 },
-  { id: "PB-AC-068", name: 'Dakha', state: 'Punjab', district: 'Ludhiana', acNo: 68 },
-  { id: "PB-AC-069", name: 'Raikot', state: 'Punjab', district: 'Ludhiana', acNo: 69 },
-  { id: "PB-AC-070", name: 'Jagraon', state: 'Punjab', district: 'Ludhiana', acNo: 70 },
-  { id: "PB-AC-071", name: 'Nihal Singhwala', state: 'Punjab', district: 'Moga', acNo: 71 },
-  { id: "PB-AC-072", name: 'Bhagha Purana', state: 'Punjab', district: 'Moga', acNo: 72 },
-  { id: "PB-AC-073", name: 'Moga', state: 'Punjab', district: 'Moga', acNo: 73 },
-  { id: "PB-AC-074", name: 'Dharamkot', state: 'Punjab', district: 'Moga', acNo: 74 },
-  { id: "PB-AC-075", name: 'Zira', state: 'Punjab', district: 'Firozpur', acNo: 75 },
-  { id: "PB-AC-076", name: 'Firozpur City', state: 'Punjab', district: 'Firozpur', acNo: 76 },
-  { id: "PB-AC-077", name: 'Firozpur Rural', state: 'Punjab', district: 'Firozpur', acNo: 77 },
-  { id: "PB-AC-078", name: 'Guru Har Sahai', state: 'Punjab', district: 'Firozpur', acNo: 78 },
-  { id: "PB-AC-079", name: 'Jalalabad', state: 'Punjab', district: 'Fazilka', acNo: 79 },
-  { id: "PB-AC-080", name: 'Fazilka', state: 'Punjab', district: 'Fazilka', acNo: 80 },
-  { id: "PB-AC-081", name: 'Abohar', state: 'Punjab', district: 'Fazilka', acNo: 81 },
-  { id: "PB-AC-082", name: 'Balluana', state: 'Punjab', district: 'Fazilka', acNo: 82 },
-  { id: "PB-AC-083", name: 'Lambi', state: 'Punjab', district: 'Sri Muktsar Sahib', acNo: 83 },
-  { id: "PB-AC-084", name: 'Gidderbaha', state: 'Punjab', district: 'Sri Muktsar Sahib', acNo: 84 },
-  { id: "PB-AC-085", name: 'Malout', state: 'Punjab', district: 'Sri Muktsar Sahib', acNo: 85 },
-  { id: "PB-AC-086", name: 'Muktsar', state: 'Punjab', district: 'Sri Muktsar Sahib', acNo: 86 },
-  { id: "PB-AC-087", name: 'Faridkot', state: 'Punjab', district: 'Faridkot', acNo: 87 },
-  { id: "PB-AC-088", name: 'Kotkapura', state: 'Punjab', district: 'Faridkot', acNo: 88 },
-  { id: "PB-AC-089", name: 'Jaitu', state: 'Punjab', district: 'Faridkot', acNo: 89 },
-  { id: "PB-AC-090", name: 'Rampura Phul', state: 'Punjab', district: 'Bathinda', acNo: 90 },
-  { id: "PB-AC-091", name: 'Bhucho Mandi', state: 'Punjab', district: 'Bathinda', acNo: 91 },
-  { id: "PB-AC-092", name: 'Bathinda Urban', state: 'Punjab', district: 'Bathinda', acNo: 92 },
-  { id: "PB-AC-093", name: 'Bathinda Rural', state: 'Punjab', district: 'Bathinda', acNo: 93 },
-  { id: "PB-AC-094", name: 'Talwandi Sabo', state: 'Punjab', district: 'Bathinda', acNo: 94 },
-  { id: "PB-AC-095", name: 'Maur', state: 'Punjab', district: 'Bathinda', acNo: 95 },
-  { id: "PB-AC-096", name: 'Mansa', state: 'Punjab', district: 'Mansa', acNo: 96 },
-  { id: "PB-AC-097", name: 'Sardulgarh', state: 'Punjab', district: 'Mansa', acNo: 97 },
-  { id: "PB-AC-098", name: 'Budhlada', state: 'Punjab', district: 'Mansa', acNo: 98 },
-  { id: "PB-AC-099", name: 'Lehra', state: 'Punjab', district: 'Sangrur', acNo: 99 },
-  { id: "PB-AC-100", name: 'Dirba', state: 'Punjab', district: 'Sangrur', acNo: 100 },
-  { id: "PB-AC-101", name: 'Sunam', state: 'Punjab', district: 'Sangrur', acNo: 101 },
-  { id: "PB-AC-102", name: 'Bhadaur', state: 'Punjab', district: 'Barnala', acNo: 102 },
-  { id: "PB-AC-103", name: 'Barnala', state: 'Punjab', district: 'Barnala', acNo: 103 },
-  { id: "PB-AC-104", name: 'Mehal Kalan', state: 'Punjab', district: 'Barnala', acNo: 104 },
-  { id: "PB-AC-105", name: 'Malerkotla', state: 'Punjab', district: 'Malerkotla', acNo: 105 },
-  { id: "PB-AC-106", name: 'Amargarh', state: 'Punjab', district: 'Malerkotla', acNo: 106 },
-  { id: "PB-AC-107", name: 'Dhuri', state: 'Punjab', district: 'Sangrur', acNo: 107 },
-  { id: "PB-AC-108", name: 'Sangrur', state: 'Punjab', district: 'Sangrur', acNo: 108 },
-  { id: "PB-AC-109", name: 'Nabha', state: 'Punjab', district: 'Patiala', acNo: 109 },
-  { id: "PB-AC-110", name: 'Patiala Rural', state: 'Punjab', district: 'Patiala', acNo: 110 },
-  { id: "PB-AC-111", name: 'Rajpura', state: 'Punjab', district: 'Patiala', acNo: 111 },
-  { id: "PB-AC-112", name: 'Dera Bassi', state: 'Punjab', district: 'Mohali', acNo: 112 },
-  { id: "PB-AC-113", name: 'Ghanaur', state: 'Punjab', district: 'Patiala', acNo: 113 },
-  { id: "PB-AC-114", name: 'Sanour', state: 'Punjab', district: 'Patiala', acNo: 114 },
-  { id: "PB-AC-115", name: 'Patiala', state: 'Punjab', district: 'Patiala', acNo: 115 },
-  { id: "PB-AC-116", name: 'Samana', state: 'Punjab', district: 'Patiala', acNo: 116 },
-  { id: "PB-AC-117", name: 'Shutrana', state: 'Punjab', district: 'Patiala', acNo: 117 },
+  'Sujanpur',1099,'Bhoa',1099,'Pathankot',1099,'Gurdaspur',826,'Dina Nagar',826,'Qadian',826,
+  'Batala',826,'Sri Hargobindpur',826,'Fatehgarh Churian',826,'Dera Baba Nanak',826,'Ajnala',624,'Raja Sansi',624,
+  'Majitha',624,'Jandiala',624,'Amritsar North',624,'Amritsar West',624,'Amritsar Central',624,'Amritsar East',624,
+  'Amritsar South',624,'Attari',624,'Tarn Taran',1239,'Khem Karan',1239,'Patti',1239,'Khadoor Sahib',1239,
+  'Baba Bakala',1239,'Bholath',906,'Kapurthala',906,'Sultanpur Lodhi',906,'Phagwara',906,'Phillaur',857,
+  'Nakodar',857,'Shahkot',857,'Kartarpur',857,'Jalandhar West',857,'Jalandhar Central',857,'Jalandhar North',857,
+  'Jalandhar Cantt',857,'Adampur',857,'Mukerian',844,'Dasuya',844,'Urmar',844,'Sham Chaurasi',844,
+  'Hoshiarpur',844,'Chabbewal',844,'Garhshankar',844,'Banga',1148,'Nawan Shahr',1148,'Balachaur',1148,
+  'Anandpur Sahib',1147,'Rupnagar',1147,'Chamkaur Sahib',1147,'Kharar',1022,'S.A.S. Nagar',1022,'Bassi Pathana',793,
+  'Fatehgarh Sahib',793,'Amloh',793,'Khanna',982,'Samrala',982,'Sahnewal',982,'Ludhiana East',982,
+  'Ludhiana South',982,'Atam Nagar',982,'Ludhiana Central',982,'Ludhiana West',982,'Ludhiana North',982,'Gill',982,
+  'Payal',982,'Dakha',982,'Raikot',982,'Jagraon',982,'Nihal Singhwala',1021,'Bhagha Purana',1021,
+  'Moga',1021,'Dharamkot',1021,'Zira',797,'Firozpur City',797,'Firozpur Rural',797,'Guru Har Sahai',797,
+  'Jalalabad',795,'Fazilka',795,'Abohar',795,'Balluana',795,'Lambi',1223,'Gidderbaha',1223,
+  'Malout',1223,'Muktsar',1223,'Faridkot',790,'Kotkapura',790,'Jaitu',790,'Rampura Phul',672,
+  'Bhucho Mandi',672,'Bathinda Urban',672,'Bathinda Rural',672,'Talwandi Sabo',672,'Maur',672,'Mansa',1009,
+  'Sardulgarh',1009,'Budhlada',1009,'Lehra',1165,'Dirba',1165,'Sunam',1165,'Bhadaur',667,
+  'Barnala',667,'Mehal Kalan',667,'Malerkotla',1001,'Amargarh',1001,'Dhuri',1165,'Sangrur',1165,
+  'Nabha',1100,'Patiala Rural',1100,'Rajpura',1100,'Dera Bassi',1022,'Ghanaur',1100,'Sanour',1100,
+  'Patiala',1100,'Samana',1100,'Shutrana',1100,
   // Rajasthan (200)
-  { id: "RJ-AC-001", name: 'Sadulshahar', state: 'Rajasthan', district: 'Ganganagar', acNo: 1 },
-  { id: "RJ-AC-002", name: 'Ganganagar', state: 'Rajasthan', district: 'Ganganagar', acNo: 2 },
-  { id: "RJ-AC-003", name: 'Karanpur', state: 'Rajasthan', district: 'Ganganagar', acNo: 3 },
-  { id: "RJ-AC-004", name: 'Suratgarh', state: 'Rajasthan', district: 'Ganganagar', acNo: 4 },
-  { id: "RJ-AC-005", name: 'Raisinghnagar', state: 'Rajasthan', district: 'Anupgarh', acNo: 5 },
-  { id: "RJ-AC-006", name: 'Anupgarh', state: 'Rajasthan', district: 'Anupgarh', acNo: 6 },
-  { id: "RJ-AC-007", name: 'Sangaria', state: 'Rajasthan', district: 'Hanumangarh', acNo: 7 },
-  { id: "RJ-AC-008", name: 'Hanumangarh', state: 'Rajasthan', district: 'Hanumangarh', acNo: 8 },
-  { id: "RJ-AC-009", name: 'Pilibanga', state: 'Rajasthan', district: 'Hanumangarh', acNo: 9 },
-  { id: "RJ-AC-010", name: 'Nohar', state: 'Rajasthan', district: 'Hanumangarh', acNo: 10 },
-  { id: "RJ-AC-011", name: 'Bhadra', state: 'Rajasthan', district: 'Hanumangarh', acNo: 11 },
-  { id: "RJ-AC-012", name: 'Khajuwala', state: 'Rajasthan', district: 'Anupgarh', acNo: 12 },
-  { id: "RJ-AC-013", name: 'Bikaner West', state: 'Rajasthan', district: 'Bikaner', acNo: 13 },
-  { id: "RJ-AC-014", name: 'Bikaner East', state: 'Rajasthan', district: 'Bikaner', acNo: 14 },
-  { id: "RJ-AC-015", name: 'Kolayat', state: 'Rajasthan', district: 'Bikaner', acNo: 15 },
-  { id: "RJ-AC-016", name: 'Lunkaransar', state: 'Rajasthan', district: 'Bikaner', acNo: 16 },
-  { id: "RJ-AC-017", name: 'Dungargarh', state: 'Rajasthan', district: 'Bikaner', acNo: 17 },
-  { id: "RJ-AC-018", name: 'Nokha', state: 'Rajasthan', district: 'Bikaner', acNo: 18 },
-  { id: "RJ-AC-019", name: 'Sadulpur', state: 'Rajasthan', district: 'Churu', acNo: 19 },
-  { id: "RJ-AC-020", name: 'Taranagar', state: 'Rajasthan', district: 'Churu', acNo: 20 },
-  { id: "RJ-AC-021", name: 'Sardarshahar', state: 'Rajasthan', district: 'Churu', acNo: 21 },
-  { id: "RJ-AC-022", name: 'Churu', state: 'Rajasthan', district: 'Churu', acNo: 22 },
-  { id: "RJ-AC-023", name: 'Ratangarh', state: 'Rajasthan', district: 'Churu', acNo: 23 },
-  { id: "RJ-AC-024", name: 'Sujangarh', state: 'Rajasthan', district: 'Churu', acNo: 24 },
-  { id: "RJ-AC-025", name: 'Pilani', state: 'Rajasthan', district: 'Jhunjhunu', acNo: 25 },
-  { id: "RJ-AC-026", name: 'Surajgarh', state: 'Rajasthan', district: 'Jhunjhunu', acNo: 26 },
-  { id: "RJ-AC-027", name: 'Jhunjhunu', state: 'Rajasthan', district: 'Jhunjhunu', acNo: 27 },
-  { id: "RJ-AC-028", name: 'Mandawa', state: 'Rajasthan', district: 'Jhunjhunu', acNo: 28 },
-  { id: "RJ-AC-029", name: 'Nawalgarh', state: 'Rajasthan', district: 'Jhunjhunu', acNo: 29 },
-  { id: "RJ-AC-030", name: 'Udaipurwati', state: 'Rajasthan', district: 'Jhunjhunu', acNo: 30 },
-  { id: "RJ-AC-031", name: 'Khetri', state: 'Rajasthan', district: 'Jhunjhunu', acNo: 31 },
-  { id: "RJ-AC-032", name: 'Fatehpur', state: 'Rajasthan', district: 'Sikar', acNo: 32 },
-  { id: "RJ-AC-033", name: 'Lachhmangarh', state: 'Rajasthan', district: 'Sikar', acNo: 33 },
-  { id: "RJ-AC-034", name: 'Dhod', state: 'Rajasthan', district: 'Sikar', acNo: 34 },
-  { id: "RJ-AC-035", name: 'Sikar', state: 'Rajasthan', district: 'Sikar', acNo: 35 },
-  { id: "RJ-AC-036", name: 'Danta Ramgarh', state: 'Rajasthan', district: 'Sikar', acNo: 36 },
-  { id: "RJ-AC-037", name: 'Khandela', state: 'Rajasthan', district: 'Sikar', acNo: 37 },
-  { id: "RJ-AC-038", name: 'Neem Ka Thana', state: 'Rajasthan', district: 'Neem Ka Thana', acNo: 38 },
-  { id: "RJ-AC-039", name: 'Srimadhopur', state: 'Rajasthan', district: 'Neem Ka Thana', acNo: 39 },
-  { id: "RJ-AC-040", name: 'Kotputli', state: 'Rajasthan', district: 'Kotputli-Behror', acNo: 40 },
-  { id: "RJ-AC-041", name: 'Viratnagar', state: 'Rajasthan', district: 'Kotputli-Behror', acNo: 41 },
-  { id: "RJ-AC-042", name: 'Shahpura', state: 'Rajasthan', district: 'Jaipur', acNo: 42 },
-  { id: "RJ-AC-043", name: 'Chomu', state: 'Rajasthan', district: 'Jaipur Rural', acNo: 43 },
-  { id: "RJ-AC-044", name: 'Phulera', state: 'Rajasthan', district: 'Jaipur Rural', acNo: 44 },
-  { id: "RJ-AC-045", name: 'Dudu', state: 'Rajasthan', district: 'Dudu', acNo: 45 },
-  { id: "RJ-AC-046", name: 'Jhotwara', state: 'Rajasthan', district: 'Jaipur', acNo: 46 },
-  { id: "RJ-AC-047", name: 'Amber', state: 'Rajasthan', district: 'Jaipur', acNo: 47 },
-  { id: "RJ-AC-048", name: 'Jamwa Ramgarh', state: 'Rajasthan', district: 'Jaipur Rural', acNo: 48 },
-  { id: "RJ-AC-049", name: 'Hawa Mahal', state: 'Rajasthan', district: 'Jaipur', acNo: 49 },
-  { id: "RJ-AC-050", name: 'Vidhyadhar Nagar', state: 'Rajasthan', district: 'Jaipur', acNo: 50 },
-  { id: "RJ-AC-051", name: 'Civil Lines', state: 'Rajasthan', district: 'Jaipur', acNo: 51 },
-  { id: "RJ-AC-052", name: 'Kishanpole', state: 'Rajasthan', district: 'Jaipur', acNo: 52 },
-  { id: "RJ-AC-053", name: 'Adarsh Nagar', state: 'Rajasthan', district: 'Jaipur', acNo: 53 },
-  { id: "RJ-AC-054", name: 'Malviya Nagar', state: 'Rajasthan', district: 'Jaipur', acNo: 54 },
-  { id: "RJ-AC-055", name: 'Sanganer', state: 'Rajasthan', district: 'Jaipur', acNo: 55 },
-  { id: "RJ-AC-056", name: 'Bagru', state: 'Rajasthan', district: 'Jaipur Rural', acNo: 56 },
-  { id: "RJ-AC-057", name: 'Bassi', state: 'Rajasthan', district: 'Jaipur Rural', acNo: 57 },
-  { id: "RJ-AC-058", name: 'Chaksu', state: 'Rajasthan', district: 'Jaipur Rural', acNo: 58 },
-  { id: "RJ-AC-059", name: 'Tijara', state: 'Rajasthan', district: 'Khairthal-Tijara', acNo: 59 },
-  { id: "RJ-AC-060", name: 'Kishangarh Bas', state: 'Rajasthan', district: 'Khairthal-Tijara', acNo: 60 },
-  { id: "RJ-AC-061", name: 'Mundawar', state: 'Rajasthan', district: 'Khairthal-Tijara', acNo: 61 },
-  { id: "RJ-AC-062", name: 'Behror', state: 'Rajasthan', district: 'Alwar', acNo: 62 },
-  { id: "RJ-AC-063", name: 'Bansur', state: 'Rajasthan', district: 'Alwar', acNo: 63 },
-  { id: "RJ-AC-064", name: 'Thanagazi', state: 'Rajasthan', district: 'Alwar', acNo: 64 },
-  { id: "RJ-AC-065", name: 'Alwar Rural', state: 'Rajasthan', district: 'Alwar', acNo: 65 },
-  { id: "RJ-AC-066", name: 'Alwar Urban', state: 'Rajasthan', district: 'Alwar', acNo: 66 },
-  { id: "RJ-AC-067", name: 'Ramgarh', state: 'Rajasthan', district: 'Alwar', acNo: 67 },
-  { id: "RJ-AC-068", name: 'Rajgarh Laxmangarh', state: 'Rajasthan', district: 'Alwar', acNo: 68 },
-  { id: "RJ-AC-069", name: 'Kathumar', state: 'Rajasthan', district: 'Alwar', acNo: 69 },
-  { id: "RJ-AC-070", name: 'Kaman', state: 'Rajasthan', district: 'Deeg', acNo: 70 },
-  { id: "RJ-AC-071", name: 'Nagar', state: 'Rajasthan', district: 'Deeg', acNo: 71 },
-  { id: "RJ-AC-072", name: 'Deeg-Kumher', state: 'Rajasthan', district: 'Deeg', acNo: 72 },
-  { id: "RJ-AC-073", name: 'Bharatpur', state: 'Rajasthan', district: 'Bharatpur', acNo: 73 },
-  { id: "RJ-AC-074", name: 'Nadbai', state: 'Rajasthan', district: 'Bharatpur', acNo: 74 },
-  { id: "RJ-AC-075", name: 'Weir', state: 'Rajasthan', district: 'Bharatpur', acNo: 75 },
-  { id: "RJ-AC-076", name: 'Bayana', state: 'Rajasthan', district: 'Bharatpur', acNo: 76 },
-  { id: "RJ-AC-077", name: 'Baseri', state: 'Rajasthan', district: 'Dholpur', acNo: 77 },
-  { id: "RJ-AC-078", name: 'Bari', state: 'Rajasthan', district: 'Dholpur', acNo: 78 },
-  { id: "RJ-AC-079", name: 'Dholpur', state: 'Rajasthan', district: 'Dholpur', acNo: 79 },
-  { id: "RJ-AC-080", name: 'Rajakhera', state: 'Rajasthan', district: 'Dholpur', acNo: 80 },
-  { id: "RJ-AC-081", name: 'Todabhim', state: 'Rajasthan', district: 'Karauli', acNo: 81 },
-  { id: "RJ-AC-082", name: 'Hindaun', state: 'Rajasthan', district: 'Karauli', acNo: 82 },
-  { id: "RJ-AC-083", name: 'Karauli', state: 'Rajasthan', district: 'Karauli', acNo: 83 },
-  { id: "RJ-AC-084", name: 'Sapotra', state: 'Rajasthan', district: 'Karauli', acNo: 84 },
-  { id: "RJ-AC-085", name: 'Bandikui', state: 'Rajasthan', district: 'Dausa', acNo: 85 },
-  { id: "RJ-AC-086", name: 'Mahuwa', state: 'Rajasthan', district: 'Dausa', acNo: 86 },
-  { id: "RJ-AC-087", name: 'Sikrai', state: 'Rajasthan', district: 'Dausa', acNo: 87 },
-  { id: "RJ-AC-088", name: 'Dausa', state: 'Rajasthan', district: 'Dausa', acNo: 88 },
-  { id: "RJ-AC-089", name: 'Lalsot', state: 'Rajasthan', district: 'Dausa', acNo: 89 },
-  { id: "RJ-AC-090", name: 'Gangapur', state: 'Rajasthan', district: 'Gangapur City', acNo: 90 },
-  { id: "RJ-AC-091", name: 'Bamanwas', state: 'Rajasthan', district: 'Gangapur City', acNo: 91 },
-  { id: "RJ-AC-092", name: 'Sawai Madhopur', state: 'Rajasthan', district: 'Sawai Madhopur', acNo: 92 },
-  { id: "RJ-AC-093", name: 'Khandar', state: 'Rajasthan', district: 'Sawai Madhopur', acNo: 93 },
-  { id: "RJ-AC-094", name: 'Malpura', state: 'Rajasthan', district: 'Tonk', acNo: 94 },
-  { id: "RJ-AC-095", name: 'Niwai', state: 'Rajasthan', district: 'Tonk', acNo: 95 },
-  { id: "RJ-AC-096", name: 'Tonk', state: 'Rajasthan', district: 'Tonk', acNo: 96 },
-  { id: "RJ-AC-097", name: 'Deoli-Uniara', state: 'Rajasthan', district: 'Tonk', acNo: 97 },
-  { id: "RJ-AC-098", name: 'Kishangarh', state: 'Rajasthan', district: 'Ajmer', acNo: 98 },
-  { id: "RJ-AC-099", name: 'Pushkar', state: 'Rajasthan', district: 'Ajmer', acNo: 99 },
-  { id: "RJ-AC-100", name: 'Ajmer North', state: 'Rajasthan', district: 'Ajmer', acNo: 100 },
-  { id: "RJ-AC-101", name: 'Ajmer South', state: 'Rajasthan', district: 'Ajmer', acNo: 101 },
-  { id: "RJ-AC-102", name: 'Nasirabad', state: 'Rajasthan', district: 'Ajmer', acNo: 102 },
-  { id: "RJ-AC-103", name: 'Beawar', state: 'Rajasthan', district: 'Beawar', acNo: 103 },
-  { id: "RJ-AC-104", name: 'Masuda', state: 'Rajasthan', district: 'Beawar', acNo: 104 },
-  { id: "RJ-AC-105", name: 'Kekri', state: 'Rajasthan', district: 'Kekri', acNo: 105 },
-  { id: "RJ-AC-106", name: 'Ladnun', state: 'Rajasthan', district: 'Didwana Kuchaman', acNo: 106 },
-  { id: "RJ-AC-107", name: 'Deedwana', state: 'Rajasthan', district: 'Didwana Kuchaman', acNo: 107 },
-  { id: "RJ-AC-108", name: 'Jayal', state: 'Rajasthan', district: 'Nagaur', acNo: 108 },
-  { id: "RJ-AC-109", name: 'Nagaur', state: 'Rajasthan', district: 'Nagaur', acNo: 109 },
-  { id: "RJ-AC-110", name: 'Khinwsar', state: 'Rajasthan', district: 'Nagaur', acNo: 110 },
-  { id: "RJ-AC-111", name: 'Merta', state: 'Rajasthan', district: 'Nagaur', acNo: 111 },
-  { id: "RJ-AC-112", name: 'Degana', state: 'Rajasthan', district: 'Nagaur', acNo: 112 },
-  { id: "RJ-AC-113", name: 'Makrana', state: 'Rajasthan', district: 'Didwana Kuchaman', acNo: 113 },
-  { id: "RJ-AC-114", name: 'Parbatsar', state: 'Rajasthan', district: 'Didwana Kuchaman', acNo: 114 },
-  { id: "RJ-AC-115", name: 'Nawan', state: 'Rajasthan', district: 'Didwana Kuchaman', acNo: 115 },
-  { id: "RJ-AC-116", name: 'Jaitaran', state: 'Rajasthan', district: 'Pali', acNo: 116 },
-  { id: "RJ-AC-117", name: 'Sojat', state: 'Rajasthan', district: 'Pali', acNo: 117 },
-  { id: "RJ-AC-118", name: 'Pali', state: 'Rajasthan', district: 'Pali', acNo: 118 },
-  { id: "RJ-AC-119", name: 'Marwar Junction', state: 'Rajasthan', district: 'Pali', acNo: 119 },
-  { id: "RJ-AC-120", name: 'Bali', state: 'Rajasthan', district: 'Pali', acNo: 120 },
-  { id: "RJ-AC-121", name: 'Sumerpur', state: 'Rajasthan', district: 'Pali', acNo: 121 },
-  { id: "RJ-AC-122", name: 'Phalodi', state: 'Rajasthan', district: 'Phalodi', acNo: 122 },
-  { id: "RJ-AC-123", name: 'Lohawat', state: 'Rajasthan', district: 'Phalodi', acNo: 123 },
-  { id: "RJ-AC-124", name: 'Shergarh', state: 'Rajasthan', district: 'Jodhpur Rural', acNo: 124 },
-  { id: "RJ-AC-125", name: 'Osian', state: 'Rajasthan', district: 'Jodhpur Rural', acNo: 125 },
-  { id: "RJ-AC-126", name: 'Bhopalgarh', state: 'Rajasthan', district: 'Jodhpur Rural', acNo: 126 },
-  { id: "RJ-AC-127", name: 'Sardarpura', state: 'Rajasthan', district: 'Jodhpur', acNo: 127 },
-  { id: "RJ-AC-128", name: 'Jodhpur', state: 'Rajasthan', district: 'Jodhpur', acNo: 128 },
-  { id: "RJ-AC-129", name: 'Soorsagar', state: 'Rajasthan', district: 'Jodhpur', acNo: 129 },
-  { id: "RJ-AC-130", name: 'Luni', state: 'Rajasthan', district: 'Jodhpur Rural', acNo: 130 },
-  { id: "RJ-AC-131", name: 'Bilara', state: 'Rajasthan', district: 'Jodhpur Rural', acNo: 131 },
-  { id: "RJ-AC-132", name: 'Jaisalmer', state: 'Rajasthan', district: 'Jaisalmer', acNo: 132 },
-  { id: "RJ-AC-133", name: 'Pokaran', state: 'Rajasthan', district: 'Jaisalmer', acNo: 133 },
-  { id: "RJ-AC-134", name: 'Sheo', state: 'Rajasthan', district: 'Barmer', acNo: 134 },
-  { id: "RJ-AC-135", name: 'Barmer', state: 'Rajasthan', district: 'Barmer', acNo: 135 },
-  { id: "RJ-AC-136", name: 'Baytoo', state: 'Rajasthan', district: 'Balotra', acNo: 136 },
-  { id: "RJ-AC-137", name: 'Pachpadra', state: 'Rajasthan', district: 'Balotra', acNo: 137 },
-  { id: "RJ-AC-138", name: 'Siwana', state: 'Rajasthan', district: 'Balotra', acNo: 138 },
-  { id: "RJ-AC-139", name: 'Gudha Malani', state: 'Rajasthan', district: 'Barmer', acNo: 139 },
-  { id: "RJ-AC-140", name: 'Chohtan', state: 'Rajasthan', district: 'Barmer', acNo: 140 },
-  { id: "RJ-AC-141", name: 'Ahore', state: 'Rajasthan', district: 'Jalore', acNo: 141 },
-  { id: "RJ-AC-142", name: 'Jalore', state: 'Rajasthan', district: 'Jalore', acNo: 142 },
-  { id: "RJ-AC-143", name: 'Bhinmal', state: 'Rajasthan', district: 'Jalore', acNo: 143 },
-  { id: "RJ-AC-144", name: 'Sanchore', state: 'Rajasthan', district: 'Sanchore', acNo: 144 },
-  { id: "RJ-AC-145", name: 'Raniwara', state: 'Rajasthan', district: 'Sanchore', acNo: 145 },
-  { id: "RJ-AC-146", name: 'Sirohi', state: 'Rajasthan', district: 'Sirohi', acNo: 146 },
-  { id: "RJ-AC-147", name: 'Pindwara-Abu', state: 'Rajasthan', district: 'Sirohi', acNo: 147 },
-  { id: "RJ-AC-148", name: 'Reodar', state: 'Rajasthan', district: 'Sirohi', acNo: 148 },
-  { id: "RJ-AC-149", name: 'Gogunda', state: 'Rajasthan', district: 'Udaipur', acNo: 149 },
-  { id: "RJ-AC-150", name: 'Jhadol', state: 'Rajasthan', district: 'Udaipur', acNo: 150 },
-  { id: "RJ-AC-151", name: 'Kherwara', state: 'Rajasthan', district: 'Udaipur', acNo: 151 },
-  { id: "RJ-AC-152", name: 'Udaipur Rural', state: 'Rajasthan', district: 'Udaipur', acNo: 152 },
-  { id: "RJ-AC-153", name: 'Udaipur', state: 'Rajasthan', district: 'Udaipur', acNo: 153 },
-  { id: "RJ-AC-154", name: 'Mavli', state: 'Rajasthan', district: 'Udaipur', acNo: 154 },
-  { id: "RJ-AC-155", name: 'Vallabhnagar', state: 'Rajasthan', district: 'Udaipur', acNo: 155 },
-  { id: "RJ-AC-156", name: 'Salumber', state: 'Rajasthan', district: 'Salumbar', acNo: 156 },
-  { id: "RJ-AC-157", name: 'Dhariawad', state: 'Rajasthan', district: 'Pratapgarh', acNo: 157 },
-  { id: "RJ-AC-158", name: 'Dungarpur', state: 'Rajasthan', district: 'Dungarpur', acNo: 158 },
-  { id: "RJ-AC-159", name: 'Aspur', state: 'Rajasthan', district: 'Dungarpur', acNo: 159 },
-  { id: "RJ-AC-160", name: 'Sagwara', state: 'Rajasthan', district: 'Dungarpur', acNo: 160 },
-  { id: "RJ-AC-161", name: 'Chorasi', state: 'Rajasthan', district: 'Dungarpur', acNo: 161 },
-  { id: "RJ-AC-162", name: 'Ghatol', state: 'Rajasthan', district: 'Banswara', acNo: 162 },
-  { id: "RJ-AC-163", name: 'Garhi', state: 'Rajasthan', district: 'Banswara', acNo: 163 },
-  { id: "RJ-AC-164", name: 'Banswara', state: 'Rajasthan', district: 'Banswara', acNo: 164 },
-  { id: "RJ-AC-165", name: 'Bagidora', state: 'Rajasthan', district: 'Banswara', acNo: 165 },
-  { id: "RJ-AC-166", name: 'Kushalgarh', state: 'Rajasthan', district: 'Banswara', acNo: 166 },
-  { id: "RJ-AC-167", name: 'Kapasan', state: 'Rajasthan', district: 'Chittorgarh', acNo: 167 },
-  { id: "RJ-AC-168", name: 'Begun', state: 'Rajasthan', district: 'Chittorgarh', acNo: 168 },
-  { id: "RJ-AC-169", name: 'Chittorgarh', state: 'Rajasthan', district: 'Chittorgarh', acNo: 169 },
-  { id: "RJ-AC-170", name: 'Nimbahera', state: 'Rajasthan', district: 'Chittorgarh', acNo: 170 },
-  { id: "RJ-AC-171", name: 'Bari Sadri', state: 'Rajasthan', district: 'Chittorgarh', acNo: 171 },
-  { id: "RJ-AC-172", name: 'Pratapgarh', state: 'Rajasthan', district: 'Pratapgarh', acNo: 172 },
-  { id: "RJ-AC-173", name: 'Bhim', state: 'Rajasthan', district: 'Rajsamand', acNo: 173 },
-  { id: "RJ-AC-174", name: 'Kumbhalgarh', state: 'Rajasthan', district: 'Rajsamand', acNo: 174 },
-  { id: "RJ-AC-175", name: 'Rajsamand', state: 'Rajasthan', district: 'Rajsamand', acNo: 175 },
-  { id: "RJ-AC-176", name: 'Nathdwara', state: 'Rajasthan', district: 'Rajsamand', acNo: 176 },
-  { id: "RJ-AC-177", name: 'Asind', state: 'Rajasthan', district: 'Bhilwara', acNo: 177 },
-  { id: "RJ-AC-178", name: 'Mandal', state: 'Rajasthan', district: 'Bhilwara', acNo: 178 },
-  { id: "RJ-AC-179", name: 'Sahara', state: 'Rajasthan', district: 'Bhilwara', acNo: 179 },
-  { id: "RJ-AC-180", name: 'Bhilwara', state: 'Rajasthan', district: 'Bhilwara', acNo: 180 },
-  { id: "RJ-AC-181", name: 'Shahpura', state: 'Rajasthan', district: 'Shahpura', acNo: 181 },
-  { id: "RJ-AC-182", name: 'Jahazpur', state: 'Rajasthan', district: 'Shahpura', acNo: 182 },
-  { id: "RJ-AC-183", name: 'Mandalgarh', state: 'Rajasthan', district: 'Bhilwara', acNo: 183 },
-  { id: "RJ-AC-184", name: 'Hindoli', state: 'Rajasthan', district: 'Bundi', acNo: 184 },
-  { id: "RJ-AC-185", name: 'Keshoraipatan', state: 'Rajasthan', district: 'Bundi', acNo: 185 },
-  { id: "RJ-AC-186", name: 'Bundi', state: 'Rajasthan', district: 'Bundi', acNo: 186 },
-  { id: "RJ-AC-187", name: 'Pipalda', state: 'Rajasthan', district: 'Kota', acNo: 187 },
-  { id: "RJ-AC-188", name: 'Sangod', state: 'Rajasthan', district: 'Kota', acNo: 188 },
-  { id: "RJ-AC-189", name: 'Kota North', state: 'Rajasthan', district: 'Kota', acNo: 189 },
-  { id: "RJ-AC-190", name: 'Kota South', state: 'Rajasthan', district: 'Kota', acNo: 190 },
-  { id: "RJ-AC-191", name: 'Ladpura', state: 'Rajasthan', district: 'Kota', acNo: 191 },
-  { id: "RJ-AC-192", name: 'Ramganj Mandi', state: 'Rajasthan', district: 'Kota', acNo: 192 },
-  { id: "RJ-AC-193", name: 'Anta', state: 'Rajasthan', district: 'Baran', acNo: 193 },
-  { id: "RJ-AC-194", name: 'Kishanganj', state: 'Rajasthan', district: 'Baran', acNo: 194 },
-  { id: "RJ-AC-195", name: 'Baran-Atru', state: 'Rajasthan', district: 'Baran', acNo: 195 },
-  { id: "RJ-AC-196", name: 'Chhabra', state: 'Rajasthan', district: 'Baran', acNo: 196 },
-  { id: "RJ-AC-197", name: 'Dag', state: 'Rajasthan', district: 'Jhalawar', acNo: 197 },
-  { id: "RJ-AC-198", name: 'Jhalrapatan', state: 'Rajasthan', district: 'Jhalawar', acNo: 198 },
-  { id: "RJ-AC-199", name: 'Khanpur', state: 'Rajasthan', district: 'Jhalawar', acNo: 199 },
-  { id: "RJ-AC-200", name: 'Manohar Thana', state: 'Rajasthan', district: 'Jhalawar', acNo: 200 },
+  'Sadulshahar',802,'Ganganagar',802,'Karanpur',802,'Suratgarh',802,'Raisinghnagar',632,'Anupgarh',632,
+  'Sangaria',833,'Hanumangarh',833,'Pilibanga',833,'Nohar',833,'Bhadra',833,'Khajuwala',632,
+  'Bikaner West',693,'Bikaner East',693,'Kolayat',693,'Lunkaransar',693,'Dungargarh',693,'Nokha',693,
+  'Sadulpur',730,'Taranagar',730,'Sardarshahar',730,'Churu',730,'Ratangarh',730,'Sujangarh',730,
+  'Pilani',879,'Surajgarh',879,'Jhunjhunu',879,'Mandawa',879,'Nawalgarh',879,'Udaipurwati',879,
+  'Khetri',879,'Fatehpur',1196,'Lachhmangarh',1196,'Dhod',1196,'Sikar',1196,'Danta Ramgarh',1196,
+  'Khandela',1196,'Neem Ka Thana',1061,'Srimadhopur',1061,'Kotputli',952,'Viratnagar',952,'Shahpura',854,
+  'Chomu',855,'Phulera',855,'Dudu',770,'Jhotwara',854,'Amber',854,'Jamwa Ramgarh',855,
+  'Hawa Mahal',854,'Vidhyadhar Nagar',854,'Civil Lines',854,'Kishanpole',854,'Adarsh Nagar',854,'Malviya Nagar',854,
+  'Sanganer',854,'Bagru',855,'Bassi',855,'Chaksu',855,'Tijara',925,'Kishangarh Bas',925,
+  'Mundawar',925,'Behror',618,'Bansur',618,'Thanagazi',618,'Alwar Rural',618,'Alwar Urban',618,
+  'Ramgarh',618,'Rajgarh Laxmangarh',618,'Kathumar',618,'Kaman',747,'Nagar',747,'Deeg-Kumher',747,
+  'Bharatpur',682,'Nadbai',682,'Weir',682,'Bayana',682,'Baseri',759,'Bari',759,
+  'Dholpur',759,'Rajakhera',759,'Todabhim',908,'Hindaun',908,'Karauli',908,'Sapotra',908,
+  'Bandikui',746,'Mahuwa',746,'Sikrai',746,'Dausa',746,'Lalsot',746,'Gangapur',803,
+  'Bamanwas',803,'Sawai Madhopur',1170,'Khandar',1170,'Malpura',1260,'Niwai',1260,'Tonk',1260,
+  'Deoli-Uniara',1260,'Kishangarh',611,'Pushkar',611,'Ajmer North',611,'Ajmer South',611,'Nasirabad',611,
+  'Beawar',673,'Masuda',673,'Kekri',920,'Ladnun',764,'Deedwana',764,'Jayal',1042,
+  'Nagaur',1042,'Khinwsar',1042,'Merta',1042,'Degana',1042,'Makrana',764,'Parbatsar',764,
+  'Nawan',764,'Jaitaran',1085,'Sojat',1085,'Pali',1085,'Marwar Junction',1085,'Bali',1085,
+  'Sumerpur',1085,'Phalodi',1105,'Lohawat',1105,'Shergarh',882,'Osian',882,'Bhopalgarh',882,
+  'Sardarpura',881,'Jodhpur',881,'Soorsagar',881,'Luni',882,'Bilara',882,'Jaisalmer',856,
+  'Pokaran',856,'Sheo',666,'Barmer',666,'Baytoo',652,'Pachpadra',652,'Siwana',652,
+  'Gudha Malani',666,'Chohtan',666,'Ahore',861,'Jalore',861,'Bhinmal',861,'Sanchore',1162,
+  'Raniwara',1162,'Sirohi',1202,'Pindwara-Abu',1202,'Reodar',1202,'Gogunda',1263,'Jhadol',1263,
+  'Kherwara',1263,'Udaipur Rural',1263,'Udaipur',1263,'Mavli',1263,'Vallabhnagar',1263,'Salumber',1157,
+  'Dhariawad',1112,'Dungarpur',772,'Aspur',772,'Sagwara',772,'Chorasi',772,'Ghatol',659,
+  'Garhi',659,'Banswara',659,'Bagidora',659,'Kushalgarh',659,'Kapasan',728,'Begun',728,
+  'Chittorgarh',728,'Nimbahera',728,'Bari Sadri',728,'Pratapgarh',1112,'Bhim',1131,'Kumbhalgarh',1131,
+  'Rajsamand',1131,'Nathdwara',1131,'Asind',685,'Mandal',685,'Sahara',685,'Bhilwara',685,
+  'Shahpura',1179,'Jahazpur',1179,'Mandalgarh',685,'Hindoli',706,'Keshoraipatan',706,'Bundi',706,
+  'Pipalda',951,'Sangod',951,'Kota North',951,'Kota South',951,'Ladpura',951,'Ramganj Mandi',951,
+  'Anta',663,'Kishanganj',663,'Baran-Atru',663,'Chhabra',663,'Dag',875,'Jhalrapatan',875,
+  'Khanpur',875,'Manohar Thana',875,
   // Sikkim (32)
-  { id: "SK-AC-001", name: 'Yoksam–Tashiding', state: 'Sikkim', district: 'Gyalshing', acNo: 1 },
-  { id: "SK-AC-002", name: 'Yangthang', state: 'Sikkim', district: 'Gyalshing', acNo: 2 },
-  { id: "SK-AC-003", name: 'Maneybong–Dentam', state: 'Sikkim', district: 'Gyalshing', acNo: 3 },
-  { id: "SK-AC-004", name: 'Gyalshing–Barnyak', state: 'Sikkim', district: 'Gyalshing', acNo: 4 },
-  { id: "SK-AC-005", name: 'Rinchenpong', state: 'Sikkim', district: 'Soreng', acNo: 5 },
-  { id: "SK-AC-006", name: 'Daramdin', state: 'Sikkim', district: 'Soreng', acNo: 6 },
-  { id: "SK-AC-007", name: 'Soreng–Chakung', state: 'Sikkim', district: 'Soreng', acNo: 7 },
-  { id: "SK-AC-008", name: 'Salghari–Zoom', state: 'Sikkim', district: 'Soreng', acNo: 8 },
-  { id: "SK-AC-009", name: 'Barfung', state: 'Sikkim', district: 'Namchi', acNo: 9 },
-  { id: "SK-AC-010", name: 'Poklok–Kamrang', state: 'Sikkim', district: 'Namchi', acNo: 10 },
-  { id: "SK-AC-011", name: 'Namchi–Singhithang', state: 'Sikkim', district: 'Namchi', acNo: 11 },
-  { id: "SK-AC-012", name: 'Melli', state: 'Sikkim', district: 'Namchi', acNo: 12 },
-  { id: "SK-AC-013", name: 'Namthang–Rateypani', state: 'Sikkim', district: 'Namchi', acNo: 13 },
-  { id: "SK-AC-014", name: 'Temi–Namphing', state: 'Sikkim', district: 'Namchi', acNo: 14 },
-  { id: "SK-AC-015", name: 'Rangang–Yangang', state: 'Sikkim', district: 'Namchi', acNo: 15 },
-  { id: "SK-AC-016", name: 'Tumin–Lingee', state: 'Sikkim', district: 'Namchi', acNo: 16 },
-  { id: "SK-AC-017", name: 'Khamdong–Singtam', state: 'Sikkim', district: 'Gangtok', acNo: 17 },
-  { id: "SK-AC-018", name: 'West Pendam', state: 'Sikkim', district: 'Pakyong', acNo: 18 },
-  { id: "SK-AC-019", name: 'Rhenock', state: 'Sikkim', district: 'Pakyong', acNo: 19 },
-  { id: "SK-AC-020", name: 'Chujachen', state: 'Sikkim', district: 'Pakyong', acNo: 20 },
-  { id: "SK-AC-021", name: 'Gnathang–Machong', state: 'Sikkim', district: 'Pakyong', acNo: 21 },
-  { id: "SK-AC-022", name: 'Namchaybong', state: 'Sikkim', district: 'Pakyong', acNo: 22 },
-  { id: "SK-AC-023", name: 'Shyari', state: 'Sikkim', district: 'Gangtok', acNo: 23 },
-  { id: "SK-AC-024", name: 'Martam–Rumtek', state: 'Sikkim', district: 'Gangtok', acNo: 24 },
-  { id: "SK-AC-025", name: 'Upper Tadong', state: 'Sikkim', district: 'Gangtok', acNo: 25 },
-  { id: "SK-AC-026", name: 'Arithang', state: 'Sikkim', district: 'Gangtok', acNo: 26 },
-  { id: "SK-AC-027", name: 'Gangtok', state: 'Sikkim', district: 'Gangtok', acNo: 27 },
-  { id: "SK-AC-028", name: 'Upper Burtuk', state: 'Sikkim', district: 'Gangtok', acNo: 28 },
-  { id: "SK-AC-029", name: 'Kabi–Lungchok', state: 'Sikkim', district: 'Mangan', acNo: 29 },
-  { id: "SK-AC-030", name: 'Djongu', state: 'Sikkim', district: 'Mangan', acNo: 30 },
-  { id: "SK-AC-031", name: 'Lachen–Mangan', state: 'Sikkim', district: 'Mangan', acNo: 31 },
-  { id: "SK-AC-032", name: 'Sangha', state: 'Sikkim', district: 'Buddhist Monasteries', acNo: 32 },
+  'Yoksam–Tashiding',829,'Yangthang',829,'Maneybong–Dentam',829,'Gyalshing–Barnyak',829,'Rinchenpong',1213,'Daramdin',1213,
+  'Soreng–Chakung',1213,'Salghari–Zoom',1213,'Barfung',1048,'Poklok–Kamrang',1048,'Namchi–Singhithang',1048,'Melli',1048,
+  'Namthang–Rateypani',1048,'Temi–Namphing',1048,'Rangang–Yangang',1048,'Tumin–Lingee',1048,'Khamdong–Singtam',804,'West Pendam',1081,
+  'Rhenock',1081,'Chujachen',1081,'Gnathang–Machong',1081,'Namchaybong',1081,'Shyari',804,'Martam–Rumtek',804,
+  'Upper Tadong',804,'Arithang',804,'Gangtok',804,'Upper Burtuk',804,'Kabi–Lungchok',1008,'Djongu',1008,
+  'Lachen–Mangan',1008,'Sangha',702,
   // Tamil Nadu (234)
-  { id: "TN-AC-001", name: 'Gummidipoondi', state: 'Tamil Nadu', district: 'Thiruvallur', acNo: 1 },
-  { id: "TN-AC-002", name: 'Ponneri', state: 'Tamil Nadu', district: 'Thiruvallur', acNo: 2 },
-  { id: "TN-AC-003", name: 'Tiruttani', state: 'Tamil Nadu', district: 'Thiruvallur', acNo: 3 },
-  { id: "TN-AC-004", name: 'Thiruvallur', state: 'Tamil Nadu', district: 'Thiruvallur', acNo: 4 },
-  { id: "TN-AC-005", name: 'Poonamallee', state: 'Tamil Nadu', district: 'Thiruvallur', acNo: 5 },
-  { id: "TN-AC-006", name: 'Avadi', state: 'Tamil Nadu', district: 'Thiruvallur', acNo: 6 },
-  { id: "TN-AC-007", name: 'Maduravoyal', state: 'Tamil Nadu', district: 'Chennai', acNo: 7 },
-  { id: "TN-AC-008", name: 'Ambattur', state: 'Tamil Nadu', district: 'Chennai', acNo: 8 },
-  { id: "TN-AC-009", name: 'Madavaram', state: 'Tamil Nadu', district: 'Chennai', acNo: 9 },
-  { id: "TN-AC-010", name: 'Thiruvottiyur', state: 'Tamil Nadu', district: 'Chennai', acNo: 10 },
-  { id: "TN-AC-011", name: 'Dr. Radhakrishnan Nagar', state: 'Tamil Nadu', district: 'Chennai', acNo: 11 },
-  { id: "TN-AC-012", name: 'Perambur', state: 'Tamil Nadu', district: 'Chennai', acNo: 12 },
-  { id: "TN-AC-013", name: 'Kolathur', state: 'Tamil Nadu', district: 'Chennai', acNo: 13 },
-  { id: "TN-AC-014", name: 'Villivakkam', state: 'Tamil Nadu', district: 'Chennai', acNo: 14 },
-  { id: "TN-AC-015", name: 'Thiru-Vi-Ka-Nagar', state: 'Tamil Nadu', district: 'Chennai', acNo: 15 },
-  { id: "TN-AC-016", name: 'Egmore', state: 'Tamil Nadu', district: 'Chennai', acNo: 16 },
-  { id: "TN-AC-017", name: 'Royapuram', state: 'Tamil Nadu', district: 'Chennai', acNo: 17 },
-  { id: "TN-AC-018", name: 'Harbour', state: 'Tamil Nadu', district: 'Chennai', acNo: 18 },
-  { id: "TN-AC-019", name: 'Chepauk-Thiruvallikeni', state: 'Tamil Nadu', district: 'Chennai', acNo: 19 },
-  { id: "TN-AC-020", name: 'Thousand Lights', state: 'Tamil Nadu', district: 'Chennai', acNo: 20 },
-  { id: "TN-AC-021", name: 'Anna Nagar', state: 'Tamil Nadu', district: 'Chennai', acNo: 21 },
-  { id: "TN-AC-022", name: 'Virugampakkam', state: 'Tamil Nadu', district: 'Chennai', acNo: 22 },
-  { id: "TN-AC-023", name: 'Saidapet', state: 'Tamil Nadu', district: 'Chennai', acNo: 23 },
-  { id: "TN-AC-024", name: 'Thiyagarayanagar', state: 'Tamil Nadu', district: 'Chennai', acNo: 24 },
-  { id: "TN-AC-025", name: 'Mylapore', state: 'Tamil Nadu', district: 'Chennai', acNo: 25 },
-  { id: "TN-AC-026", name: 'Velachery', state: 'Tamil Nadu', district: 'Chennai', acNo: 26 },
-  { id: "TN-AC-027", name: 'Sholinganallur', state: 'Tamil Nadu', district: 'Chennai', acNo: 27 },
-  { id: "TN-AC-028", name: 'Alandur', state: 'Tamil Nadu', district: 'Chennai', acNo: 28 },
-  { id: "TN-AC-029", name: 'Sriperumbudur', state: 'Tamil Nadu', district: 'Kancheepuram', acNo: 29 },
-  { id: "TN-AC-030", name: 'Pallavaram', state: 'Tamil Nadu', district: 'Chengalpattu', acNo: 30 },
-  { id: "TN-AC-031", name: 'Tambaram', state: 'Tamil Nadu', district: 'Chengalpattu', acNo: 31 },
-  { id: "TN-AC-032", name: 'Chengalpattu', state: 'Tamil Nadu', district: 'Chengalpattu', acNo: 32 },
-  { id: "TN-AC-033", name: 'Thiruporur', state: 'Tamil Nadu', district: 'Chengalpattu', acNo: 33 },
-  { id: "TN-AC-034", name: 'Cheyyur', state: 'Tamil Nadu', district: 'Chengalpattu', acNo: 34 },
-  { id: "TN-AC-035", name: 'Madurantakam', state: 'Tamil Nadu', district: 'Chengalpattu', acNo: 35 },
-  { id: "TN-AC-036", name: 'Uthiramerur', state: 'Tamil Nadu', district: 'Kancheepuram', acNo: 36 },
-  { id: "TN-AC-037", name: 'Kancheepuram', state: 'Tamil Nadu', district: 'Kancheepuram', acNo: 37 },
-  { id: "TN-AC-038", name: 'Arakkonam', state: 'Tamil Nadu', district: 'Ranipet', acNo: 38 },
-  { id: "TN-AC-039", name: 'Sholingur', state: 'Tamil Nadu', district: 'Ranipet', acNo: 39 },
-  { id: "TN-AC-040", name: 'Katpadi', state: 'Tamil Nadu', district: 'Vellore', acNo: 40 },
-  { id: "TN-AC-041", name: 'Ranipet', state: 'Tamil Nadu', district: 'Ranipet', acNo: 41 },
-  { id: "TN-AC-042", name: 'Arcot', state: 'Tamil Nadu', district: 'Ranipet', acNo: 42 },
-  { id: "TN-AC-043", name: 'Vellore', state: 'Tamil Nadu', district: 'Vellore', acNo: 43 },
-  { id: "TN-AC-044", name: 'Anaikattu', state: 'Tamil Nadu', district: 'Vellore', acNo: 44 },
-  { id: "TN-AC-045", name: 'Kilvaithinankuppam', state: 'Tamil Nadu', district: 'Vellore', acNo: 45 },
-  { id: "TN-AC-046", name: 'Gudiyatham', state: 'Tamil Nadu', district: 'Vellore', acNo: 46 },
-  { id: "TN-AC-047", name: 'Vaniyambadi', state: 'Tamil Nadu', district: 'Tirupattur', acNo: 47 },
-  { id: "TN-AC-048", name: 'Ambur', state: 'Tamil Nadu', district: 'Tirupattur', acNo: 48 },
-  { id: "TN-AC-049", name: 'Jolarpet', state: 'Tamil Nadu', district: 'Tirupattur', acNo: 49 },
-  { id: "TN-AC-050", name: 'Tiruppattur', state: 'Tamil Nadu', district: 'Tirupattur', acNo: 50 },
-  { id: "TN-AC-051", name: 'Uthangarai', state: 'Tamil Nadu', district: 'Krishnagiri', acNo: 51 },
-  { id: "TN-AC-052", name: 'Bargur', state: 'Tamil Nadu', district: 'Krishnagiri', acNo: 52 },
-  { id: "TN-AC-053", name: 'Krishnagiri', state: 'Tamil Nadu', district: 'Krishnagiri', acNo: 53 },
-  { id: "TN-AC-054", name: 'Veppanahalli', state: 'Tamil Nadu', district: 'Krishnagiri', acNo: 54 },
-  { id: "TN-AC-055", name: 'Hosur', state: 'Tamil Nadu', district: 'Krishnagiri', acNo: 55 },
-  { id: "TN-AC-056", name: 'Thalli', state: 'Tamil Nadu', district: 'Krishnagiri', acNo: 56 },
-  { id: "TN-AC-057", name: 'Palacode', state: 'Tamil Nadu', district: 'Dharmapuri', acNo: 57 },
-  { id: "TN-AC-058", name: 'Pennagaram', state: 'Tamil Nadu', district: 'Dharmapuri', acNo: 58 },
-  { id: "TN-AC-059", name: 'Dharmapuri', state: 'Tamil Nadu', district: 'Dharmapuri', acNo: 59 },
-  { id: "TN-AC-060", name: 'Pappireddippatti', state: 'Tamil Nadu', district: 'Dharmapuri', acNo: 60 },
-  { id: "TN-AC-061", name: 'Harur', state: 'Tamil Nadu', district: 'Dharmapuri', acNo: 61 },
-  { id: "TN-AC-062", name: 'Chengam', state: 'Tamil Nadu', district: 'Tiruvannamalai', acNo: 62 },
-  { id: "TN-AC-063", name: 'Tiruvannamalai', state: 'Tamil Nadu', district: 'Tiruvannamalai', acNo: 63 },
-  { id: "TN-AC-064", name: 'Kilpennathur', state: 'Tamil Nadu', district: 'Tiruvannamalai', acNo: 64 },
-  { id: "TN-AC-065", name: 'Kalasapakkam', state: 'Tamil Nadu', district: 'Tiruvannamalai', acNo: 65 },
-  { id: "TN-AC-066", name: 'Polur', state: 'Tamil Nadu', district: 'Tiruvannamalai', acNo: 66 },
-  { id: "TN-AC-067", name: 'Arani', state: 'Tamil Nadu', district: 'Tiruvannamalai', acNo: 67 },
-  { id: "TN-AC-068", name: 'Cheyyar', state: 'Tamil Nadu', district: 'Tiruvannamalai', acNo: 68 },
-  { id: "TN-AC-069", name: 'Vandavasi', state: 'Tamil Nadu', district: 'Tiruvannamalai', acNo: 69 },
-  { id: "TN-AC-070", name: 'Gingee', state: 'Tamil Nadu', district: 'Viluppuram', acNo: 70 },
-  { id: "TN-AC-071", name: 'Mailam', state: 'Tamil Nadu', district: 'Viluppuram', acNo: 71 },
-  { id: "TN-AC-072", name: 'Tindivanam', state: 'Tamil Nadu', district: 'Viluppuram', acNo: 72 },
-  { id: "TN-AC-073", name: 'Vanur', state: 'Tamil Nadu', district: 'Viluppuram', acNo: 73 },
-  { id: "TN-AC-074", name: 'Villupuram', state: 'Tamil Nadu', district: 'Viluppuram', acNo: 74 },
-  { id: "TN-AC-075", name: 'Vikravandi', state: 'Tamil Nadu', district: 'Viluppuram', acNo: 75 },
-  { id: "TN-AC-076", name: 'Tirukkoyilur', state: 'Tamil Nadu', district: 'Kallakurichi', acNo: 76 },
-  { id: "TN-AC-077", name: 'Ulundurpettai', state: 'Tamil Nadu', district: 'Kallakurichi', acNo: 77 },
-  { id: "TN-AC-078", name: 'Rishivandiyam', state: 'Tamil Nadu', district: 'Kallakurichi', acNo: 78 },
-  { id: "TN-AC-079", name: 'Sankarapuram', state: 'Tamil Nadu', district: 'Kallakurichi', acNo: 79 },
-  { id: "TN-AC-080", name: 'Kallakurichi', state: 'Tamil Nadu', district: 'Kallakurichi', acNo: 80 },
-  { id: "TN-AC-081", name: 'Gangavalli', state: 'Tamil Nadu', district: 'Salem', acNo: 81 },
-  { id: "TN-AC-082", name: 'Attur', state: 'Tamil Nadu', district: 'Salem', acNo: 82 },
-  { id: "TN-AC-083", name: 'Yercaud', state: 'Tamil Nadu', district: 'Salem', acNo: 83 },
-  { id: "TN-AC-084", name: 'Omalur', state: 'Tamil Nadu', district: 'Salem', acNo: 84 },
-  { id: "TN-AC-085", name: 'Mettur', state: 'Tamil Nadu', district: 'Salem', acNo: 85 },
-  { id: "TN-AC-086", name: 'Edappadi', state: 'Tamil Nadu', district: 'Salem', acNo: 86 },
-  { id: "TN-AC-087", name: 'Sankari', state: 'Tamil Nadu', district: 'Salem', acNo: 87 },
-  { id: "TN-AC-088", name: 'Salem', state: 'Tamil Nadu', district: 'Salem', acNo: 88 },
-  { id: "TN-AC-089", name: 'Salem', state: 'Tamil Nadu', district: 'Salem', acNo: 89 },
-  { id: "TN-AC-090", name: 'Salem', state: 'Tamil Nadu', district: 'Salem', acNo: 90 },
-  { id: "TN-AC-091", name: 'Veerapandi', state: 'Tamil Nadu', district: 'Salem', acNo: 91 },
-  { id: "TN-AC-092", name: 'Rasipuram', state: 'Tamil Nadu', district: 'Namakkal', acNo: 92 },
-  { id: "TN-AC-093", name: 'Senthamangalam', state: 'Tamil Nadu', district: 'Namakkal', acNo: 93 },
-  { id: "TN-AC-094", name: 'Namakkal', state: 'Tamil Nadu', district: 'Namakkal', acNo: 94 },
-  { id: "TN-AC-095", name: 'Paramathi Velur', state: 'Tamil Nadu', district: 'Namakkal', acNo: 95 },
-  { id: "TN-AC-096", name: 'Tiruchengodu', state: 'Tamil Nadu', district: 'Namakkal', acNo: 96 },
-  { id: "TN-AC-097", name: 'Kumarapalayam', state: 'Tamil Nadu', district: 'Namakkal', acNo: 97 },
-  { id: "TN-AC-098", name: 'Erode', state: 'Tamil Nadu', district: 'Erode', acNo: 98 },
-  { id: "TN-AC-099", name: 'Erode', state: 'Tamil Nadu', district: 'Erode', acNo: 99 },
-  { id: "TN-AC-100", name: 'Modakkurichi', state: 'Tamil Nadu', district: 'Erode', acNo: 100 },
-  { id: "TN-AC-101", name: 'Dharapuram', state: 'Tamil Nadu', district: 'Tiruppur', acNo: 101 },
-  { id: "TN-AC-102", name: 'Kangayam', state: 'Tamil Nadu', district: 'Tiruppur', acNo: 102 },
-  { id: "TN-AC-103", name: 'Perundurai', state: 'Tamil Nadu', district: 'Erode', acNo: 103 },
-  { id: "TN-AC-104", name: 'Bhavani', state: 'Tamil Nadu', district: 'Erode', acNo: 104 },
-  { id: "TN-AC-105", name: 'Anthiyur', state: 'Tamil Nadu', district: 'Erode', acNo: 105 },
-  { id: "TN-AC-106", name: 'Gobichettipalayam', state: 'Tamil Nadu', district: 'Erode', acNo: 106 },
-  { id: "TN-AC-107", name: 'Bhavanisagar', state: 'Tamil Nadu', district: 'Erode', acNo: 107 },
-  { id: "TN-AC-108", name: 'Udhagamandalam', state: 'Tamil Nadu', district: 'Nilgiris', acNo: 108 },
-  { id: "TN-AC-109", name: 'Gudalur', state: 'Tamil Nadu', district: 'Nilgiris', acNo: 109 },
-  { id: "TN-AC-110", name: 'Coonoor', state: 'Tamil Nadu', district: 'Nilgiris', acNo: 110 },
-  { id: "TN-AC-111", name: 'Mettupalayam', state: 'Tamil Nadu', district: 'Coimbatore', acNo: 111 },
-  { id: "TN-AC-112", name: 'Avanashi', state: 'Tamil Nadu', district: 'Tiruppur', acNo: 112 },
-  { id: "TN-AC-113", name: 'Tiruppur', state: 'Tamil Nadu', district: 'Tiruppur', acNo: 113 },
-  { id: "TN-AC-114", name: 'Tiruppur', state: 'Tamil Nadu', district: 'Tiruppur', acNo: 114 },
-  { id: "TN-AC-115", name: 'Palladam', state: 'Tamil Nadu', district: 'Tiruppur', acNo: 115 },
-  { id: "TN-AC-116", name: 'Sulur', state: 'Tamil Nadu', district: 'Coimbatore', acNo: 116 },
-  { id: "TN-AC-117", name: 'Kavundampalayam', state: 'Tamil Nadu', district: 'Coimbatore', acNo: 117 },
-  { id: "TN-AC-118", name: 'Coimbatore', state: 'Tamil Nadu', district: 'Coimbatore', acNo: 118 },
-  { id: "TN-AC-119", name: 'Thondamuthur', state: 'Tamil Nadu', district: 'Coimbatore', acNo: 119 },
-  { id: "TN-AC-120", name: 'Coimbatore', state: 'Tamil Nadu', district: 'Coimbatore', acNo: 120 },
-  { id: "TN-AC-121", name: 'Singanallur', state: 'Tamil Nadu', district: 'Coimbatore', acNo: 121 },
-  { id: "TN-AC-122", name: 'Kinathukadavu', state: 'Tamil Nadu', district: 'Coimbatore', acNo: 122 },
-  { id: "TN-AC-123", name: 'Pollachi', state: 'Tamil Nadu', district: 'Coimbatore', acNo: 123 },
-  { id: "TN-AC-124", name: 'Valparai', state: 'Tamil Nadu', district: 'Coimbatore', acNo: 124 },
-  { id: "TN-AC-125", name: 'Udumalaipettai', state: 'Tamil Nadu', district: 'Tiruppur', acNo: 125 },
-  { id: "TN-AC-126", name: 'Madathukulam', state: 'Tamil Nadu', district: 'Tiruppur', acNo: 126 },
-  { id: "TN-AC-127", name: 'Palani', state: 'Tamil Nadu', district: 'Dindigul', acNo: 127 },
-  { id: "TN-AC-128", name: 'Oddanchatram', state: 'Tamil Nadu', district: 'Dindigul', acNo: 128 },
-  { id: "TN-AC-129", name: 'Athoor', state: 'Tamil Nadu', district: 'Dindigul', acNo: 129 },
-  { id: "TN-AC-130", name: 'Nilakottai', state: 'Tamil Nadu', district: 'Dindigul', acNo: 130 },
-  { id: "TN-AC-131", name: 'Natham', state: 'Tamil Nadu', district: 'Dindigul', acNo: 131 },
-  { id: "TN-AC-132", name: 'Dindigul', state: 'Tamil Nadu', district: 'Dindigul', acNo: 132 },
-  { id: "TN-AC-133", name: 'Vedasandur', state: 'Tamil Nadu', district: 'Dindigul', acNo: 133 },
-  { id: "TN-AC-134", name: 'Aravakurichi', state: 'Tamil Nadu', district: 'Karur', acNo: 134 },
-  { id: "TN-AC-135", name: 'Karur', state: 'Tamil Nadu', district: 'Karur', acNo: 135 },
-  { id: "TN-AC-136", name: 'Krishnarayapuram', state: 'Tamil Nadu', district: 'Karur', acNo: 136 },
-  { id: "TN-AC-137", name: 'Kulithalai', state: 'Tamil Nadu', district: 'Karur', acNo: 137 },
-  { id: "TN-AC-138", name: 'Manapaarai', state: 'Tamil Nadu', district: 'Tiruchirappalli', acNo: 138 },
-  { id: "TN-AC-139", name: 'Srirangam', state: 'Tamil Nadu', district: 'Tiruchirappalli', acNo: 139 },
-  { id: "TN-AC-140", name: 'Tiruchirappalli', state: 'Tamil Nadu', district: 'Tiruchirappalli', acNo: 140 },
-  { id: "TN-AC-141", name: 'Tiruchirappalli', state: 'Tamil Nadu', district: 'Tiruchirappalli', acNo: 141 },
-  { id: "TN-AC-142", name: 'Thiruverumbur', state: 'Tamil Nadu', district: 'Tiruchirappalli', acNo: 142 },
-  { id: "TN-AC-143", name: 'Lalgudi', state: 'Tamil Nadu', district: 'Tiruchirappalli', acNo: 143 },
-  { id: "TN-AC-144", name: 'Manachanallur', state: 'Tamil Nadu', district: 'Tiruchirappalli', acNo: 144 },
-  { id: "TN-AC-145", name: 'Musiri', state: 'Tamil Nadu', district: 'Tiruchirappalli', acNo: 145 },
-  { id: "TN-AC-146", name: 'Thuraiyur', state: 'Tamil Nadu', district: 'Tiruchirappalli', acNo: 146 },
-  { id: "TN-AC-147", name: 'Perambalur', state: 'Tamil Nadu', district: 'Perambalur', acNo: 147 },
-  { id: "TN-AC-148", name: 'Kunnam', state: 'Tamil Nadu', district: 'Perambalur', acNo: 148 },
-  { id: "TN-AC-149", name: 'Ariyalur', state: 'Tamil Nadu', district: 'Ariyalur', acNo: 149 },
-  { id: "TN-AC-150", name: 'Jayankondam', state: 'Tamil Nadu', district: 'Ariyalur', acNo: 150 },
-  { id: "TN-AC-151", name: 'Tittakudi', state: 'Tamil Nadu', district: 'Cuddalore', acNo: 151 },
-  { id: "TN-AC-152", name: 'Virudhachalam', state: 'Tamil Nadu', district: 'Cuddalore', acNo: 152 },
-  { id: "TN-AC-153", name: 'Neyveli', state: 'Tamil Nadu', district: 'Cuddalore', acNo: 153 },
-  { id: "TN-AC-154", name: 'Panruti', state: 'Tamil Nadu', district: 'Cuddalore', acNo: 154 },
-  { id: "TN-AC-155", name: 'Cuddalore', state: 'Tamil Nadu', district: 'Cuddalore', acNo: 155 },
-  { id: "TN-AC-156", name: 'Kurinjipadi', state: 'Tamil Nadu', district: 'Cuddalore', acNo: 156 },
-  { id: "TN-AC-157", name: 'Bhuvanagiri', state: 'Tamil Nadu', district: 'Cuddalore', acNo: 157 },
-  { id: "TN-AC-158", name: 'Chidambaram', state: 'Tamil Nadu', district: 'Cuddalore', acNo: 158 },
-  { id: "TN-AC-159", name: 'Kattumannarkoil', state: 'Tamil Nadu', district: 'Cuddalore', acNo: 159 },
-  { id: "TN-AC-160", name: 'Sirkazhi', state: 'Tamil Nadu', district: 'Mayiladuthurai', acNo: 160 },
-  { id: "TN-AC-161", name: 'Mayiladuturai', state: 'Tamil Nadu', district: 'Mayiladuthurai', acNo: 161 },
-  { id: "TN-AC-162", name: 'Poompuhar', state: 'Tamil Nadu', district: 'Mayiladuthurai', acNo: 162 },
-  { id: "TN-AC-163", name: 'Nagapattinam', state: 'Tamil Nadu', district: 'Nagapattinam', acNo: 163 },
-  { id: "TN-AC-164", name: 'Kilvelur', state: 'Tamil Nadu', district: 'Nagapattinam', acNo: 164 },
-  { id: "TN-AC-165", name: 'Vedaranyam', state: 'Tamil Nadu', district: 'Nagapattinam', acNo: 165 },
-  { id: "TN-AC-166", name: 'Thiruthuraipoondi', state: 'Tamil Nadu', district: 'Thiruvarur', acNo: 166 },
-  { id: "TN-AC-167", name: 'Mannargudi', state: 'Tamil Nadu', district: 'Thiruvarur', acNo: 167 },
-  { id: "TN-AC-168", name: 'Thiruvarur', state: 'Tamil Nadu', district: 'Thiruvarur', acNo: 168 },
-  { id: "TN-AC-169", name: 'Nannilam', state: 'Tamil Nadu', district: 'Thiruvarur', acNo: 169 },
-  { id: "TN-AC-170", name: 'Thiruvidaimarudur', state: 'Tamil Nadu', district: 'Thanjavur', acNo: 170 },
-  { id: "TN-AC-171", name: 'Kumbakonam', state: 'Tamil Nadu', district: 'Thanjavur', acNo: 171 },
-  { id: "TN-AC-172", name: 'Papanasam', state: 'Tamil Nadu', district: 'Thanjavur', acNo: 172 },
-  { id: "TN-AC-173", name: 'Thiruvaiyaru', state: 'Tamil Nadu', district: 'Thanjavur', acNo: 173 },
-  { id: "TN-AC-174", name: 'Thanjavur', state: 'Tamil Nadu', district: 'Thanjavur', acNo: 174 },
-  { id: "TN-AC-175", name: 'Orathanadu', state: 'Tamil Nadu', district: 'Thanjavur', acNo: 175 },
-  { id: "TN-AC-176", name: 'Pattukkottai', state: 'Tamil Nadu', district: 'Thanjavur', acNo: 176 },
-  { id: "TN-AC-177", name: 'Peravurani', state: 'Tamil Nadu', district: 'Thanjavur', acNo: 177 },
-  { id: "TN-AC-178", name: 'Gandarvakottai', state: 'Tamil Nadu', district: 'Pudukkottai', acNo: 178 },
-  { id: "TN-AC-179", name: 'Viralimalai', state: 'Tamil Nadu', district: 'Pudukkottai', acNo: 179 },
-  { id: "TN-AC-180", name: 'Pudukkottai', state: 'Tamil Nadu', district: 'Pudukkottai', acNo: 180 },
-  { id: "TN-AC-181", name: 'Thirumayam', state: 'Tamil Nadu', district: 'Pudukkottai', acNo: 181 },
-  { id: "TN-AC-182", name: 'Alangudi', state: 'Tamil Nadu', district: 'Pudukkottai', acNo: 182 },
-  { id: "TN-AC-183", name: 'Aranthangi', state: 'Tamil Nadu', district: 'Pudukkottai', acNo: 183 },
-  { id: "TN-AC-184", name: 'Karaikudi', state: 'Tamil Nadu', district: 'Sivaganga', acNo: 184 },
-  { id: "TN-AC-185", name: 'Tiruppattur', state: 'Tamil Nadu', district: 'Sivaganga', acNo: 185 },
-  { id: "TN-AC-186", name: 'Sivaganga', state: 'Tamil Nadu', district: 'Sivaganga', acNo: 186 },
-  { id: "TN-AC-187", name: 'Manamadurai', state: 'Tamil Nadu', district: 'Sivaganga', acNo: 187 },
-  { id: "TN-AC-188", name: 'Melur', state: 'Tamil Nadu', district: 'Madurai', acNo: 188 },
-  { id: "TN-AC-189", name: 'Madurai East', state: 'Tamil Nadu', district: 'Madurai', acNo: 189 },
-  { id: "TN-AC-190", name: 'Sholavandan', state: 'Tamil Nadu', district: 'Madurai', acNo: 190 },
-  { id: "TN-AC-191", name: 'Madurai North', state: 'Tamil Nadu', district: 'Madurai', acNo: 191 },
-  { id: "TN-AC-192", name: 'Madurai South', state: 'Tamil Nadu', district: 'Madurai', acNo: 192 },
-  { id: "TN-AC-193", name: 'Madurai Central', state: 'Tamil Nadu', district: 'Madurai', acNo: 193 },
-  { id: "TN-AC-194", name: 'Madurai West', state: 'Tamil Nadu', district: 'Madurai', acNo: 194 },
-  { id: "TN-AC-195", name: 'Thiruparankundram', state: 'Tamil Nadu', district: 'Madurai', acNo: 195 },
-  { id: "TN-AC-196", name: 'Thirumangalam', state: 'Tamil Nadu', district: 'Madurai', acNo: 196 },
-  { id: "TN-AC-197", name: 'Usilampatti', state: 'Tamil Nadu', district: 'Madurai', acNo: 197 },
-  { id: "TN-AC-198", name: 'Andipatti', state: 'Tamil Nadu', district: 'Theni', acNo: 198 },
-  { id: "TN-AC-199", name: 'Periyakulam', state: 'Tamil Nadu', district: 'Theni', acNo: 199 },
-  { id: "TN-AC-200", name: 'Bodinayakanur', state: 'Tamil Nadu', district: 'Theni', acNo: 200 },
-  { id: "TN-AC-201", name: 'Cumbum', state: 'Tamil Nadu', district: 'Theni', acNo: 201 },
-  { id: "TN-AC-202", name: 'Rajapalayam', state: 'Tamil Nadu', district: 'Virudhunagar', acNo: 202 },
-  { id: "TN-AC-203", name: 'Srivilliputhur', state: 'Tamil Nadu', district: 'Virudhunagar', acNo: 203 },
-  { id: "TN-AC-204", name: 'Sattur', state: 'Tamil Nadu', district: 'Virudhunagar', acNo: 204 },
-  { id: "TN-AC-205", name: 'Sivakasi', state: 'Tamil Nadu', district: 'Virudhunagar', acNo: 205 },
-  { id: "TN-AC-206", name: 'Virudhunagar', state: 'Tamil Nadu', district: 'Virudhunagar', acNo: 206 },
-  { id: "TN-AC-207", name: 'Aruppukkottai', state: 'Tamil Nadu', district: 'Virudhunagar', acNo: 207 },
-  { id: "TN-AC-208", name: 'Tiruchuli', state: 'Tamil Nadu', district: 'Virudhunagar', acNo: 208 },
-  { id: "TN-AC-209", name: 'Paramakudi', state: 'Tamil Nadu', district: 'Ramanathapuram', acNo: 209 },
-  { id: "TN-AC-210", name: 'Tiruvadanai', state: 'Tamil Nadu', district: 'Ramanathapuram', acNo: 210 },
-  { id: "TN-AC-211", name: 'Ramanathapuram', state: 'Tamil Nadu', district: 'Ramanathapuram', acNo: 211 },
-  { id: "TN-AC-212", name: 'Mudhukulathur', state: 'Tamil Nadu', district: 'Ramanathapuram', acNo: 212 },
-  { id: "TN-AC-213", name: 'Vilathikulam', state: 'Tamil Nadu', district: 'Thoothukudi', acNo: 213 },
-  { id: "TN-AC-214", name: 'Thoothukkudi', state: 'Tamil Nadu', district: 'Thoothukudi', acNo: 214 },
-  { id: "TN-AC-215", name: 'Tiruchendur', state: 'Tamil Nadu', district: 'Thoothukudi', acNo: 215 },
-  { id: "TN-AC-216", name: 'Srivaikuntam', state: 'Tamil Nadu', district: 'Thoothukudi', acNo: 216 },
-  { id: "TN-AC-217", name: 'Ottapidaram', state: 'Tamil Nadu', district: 'Thoothukudi', acNo: 217 },
-  { id: "TN-AC-218", name: 'Kovilpatti', state: 'Tamil Nadu', district: 'Thoothukudi', acNo: 218 },
-  { id: "TN-AC-219", name: 'Sankarankovil', state: 'Tamil Nadu', district: 'Tenkasi', acNo: 219 },
-  { id: "TN-AC-220", name: 'Vasudevanallur', state: 'Tamil Nadu', district: 'Tenkasi', acNo: 220 },
-  { id: "TN-AC-221", name: 'Kadayanallur', state: 'Tamil Nadu', district: 'Tenkasi', acNo: 221 },
-  { id: "TN-AC-222", name: 'Tenkasi', state: 'Tamil Nadu', district: 'Tenkasi', acNo: 222 },
-  { id: "TN-AC-223", name: 'Alangulam', state: 'Tamil Nadu', district: 'Tenkasi', acNo: 223 },
-  { id: "TN-AC-224", name: 'Tirunelveli', state: 'Tamil Nadu', district: 'Tirunelveli', acNo: 224 },
-  { id: "TN-AC-225", name: 'Ambasamudram', state: 'Tamil Nadu', district: 'Tirunelveli', acNo: 225 },
-  { id: "TN-AC-226", name: 'Palayamkottai', state: 'Tamil Nadu', district: 'Tirunelveli', acNo: 226 },
-  { id: "TN-AC-227", name: 'Nanguneri', state: 'Tamil Nadu', district: 'Tirunelveli', acNo: 227 },
-  { id: "TN-AC-228", name: 'Radhapuram', state: 'Tamil Nadu', district: 'Tirunelveli', acNo: 228 },
-  { id: "TN-AC-229", name: 'Kanniyakumari', state: 'Tamil Nadu', district: 'Kanniyakumari', acNo: 229 },
-  { id: "TN-AC-230", name: 'Nagercoil', state: 'Tamil Nadu', district: 'Kanniyakumari', acNo: 230 },
-  { id: "TN-AC-231", name: 'Colachal', state: 'Tamil Nadu', district: 'Kanniyakumari', acNo: 231 },
-  { id: "TN-AC-232", name: 'Padmanabhapuram', state: 'Tamil Nadu', district: 'Kanniyakumari', acNo: 232 },
-  { id: "TN-AC-233", name: 'Vilavancode', state: 'Tamil Nadu', district: 'Kanniyakumari', acNo: 233 },
-  { id: "TN-AC-234", name: 'Killiyoor', state: 'Tamil Nadu', district: 'Kanniyakumari', acNo: 234 },
+  'Gummidipoondi',1245,'Ponneri',1245,'Tiruttani',1245,'Thiruvallur',1245,'Poonamallee',1245,'Avadi',1245,
+  'Maduravoyal',721,'Ambattur',721,'Madavaram',721,'Thiruvottiyur',721,'Dr. Radhakrishnan Nagar',721,'Perambur',721,
+  'Kolathur',721,'Villivakkam',721,'Thiru-Vi-Ka-Nagar',721,'Egmore',721,'Royapuram',721,'Harbour',721,
+  'Chepauk-Thiruvallikeni',721,'Thousand Lights',721,'Anna Nagar',721,'Virugampakkam',721,'Saidapet',721,'Thiyagarayanagar',721,
+  'Mylapore',721,'Velachery',721,'Sholinganallur',721,'Alandur',721,'Sriperumbudur',898,'Pallavaram',720,
+  'Tambaram',720,'Chengalpattu',720,'Thiruporur',720,'Cheyyur',720,'Madurantakam',720,'Uthiramerur',898,
+  'Kancheepuram',898,'Arakkonam',1138,'Sholingur',1138,'Katpadi',1280,'Ranipet',1138,'Arcot',1138,
+  'Vellore',1280,'Anaikattu',1280,'Kilvaithinankuppam',1280,'Gudiyatham',1280,'Vaniyambadi',1257,'Ambur',1257,
+  'Jolarpet',1257,'Tiruppattur',1257,'Uthangarai',957,'Bargur',957,'Krishnagiri',957,'Veppanahalli',957,
+  'Hosur',957,'Thalli',957,'Palacode',756,'Pennagaram',756,'Dharmapuri',756,'Pappireddippatti',756,
+  'Harur',756,'Chengam',1259,'Tiruvannamalai',1259,'Kilpennathur',1259,'Kalasapakkam',1259,'Polur',1259,
+  'Arani',1259,'Cheyyar',1259,'Vandavasi',1259,'Gingee',1283,'Mailam',1283,'Tindivanam',1283,
+  'Vanur',1283,'Villupuram',1283,'Vikravandi',1283,'Tirukkoyilur',893,'Ulundurpettai',893,'Rishivandiyam',893,
+  'Sankarapuram',893,'Kallakurichi',893,'Gangavalli',1156,'Attur',1156,'Yercaud',1156,'Omalur',1156,
+  'Mettur',1156,'Edappadi',1156,'Sankari',1156,'Salem',1156,'Salem',1156,'Salem',1156,
+  'Veerapandi',1156,'Rasipuram',1047,'Senthamangalam',1047,'Namakkal',1047,'Paramathi Velur',1047,'Tiruchengodu',1047,
+  'Kumarapalayam',1047,'Erode',786,'Erode',786,'Modakkurichi',786,'Dharapuram',1258,'Kangayam',1258,
+  'Perundurai',786,'Bhavani',786,'Anthiyur',786,'Gobichettipalayam',786,'Bhavanisagar',786,'Udhagamandalam',1065,
+  'Gudalur',1065,'Coonoor',1065,'Mettupalayam',733,'Avanashi',1258,'Tiruppur',1258,'Tiruppur',1258,
+  'Palladam',1258,'Sulur',733,'Kavundampalayam',733,'Coimbatore',733,'Thondamuthur',733,'Coimbatore',733,
+  'Singanallur',733,'Kinathukadavu',733,'Pollachi',733,'Valparai',733,'Udumalaipettai',1258,'Madathukulam',1258,
+  'Palani',767,'Oddanchatram',767,'Athoor',767,'Nilakottai',767,'Natham',767,'Dindigul',767,
+  'Vedasandur',767,'Aravakurichi',913,'Karur',913,'Krishnarayapuram',913,'Kulithalai',913,'Manapaarai',1254,
+  'Srirangam',1254,'Tiruchirappalli',1254,'Tiruchirappalli',1254,'Thiruverumbur',1254,'Lalgudi',1254,'Manachanallur',1254,
+  'Musiri',1254,'Thuraiyur',1254,'Perambalur',1103,'Kunnam',1103,'Ariyalur',636,'Jayankondam',636,
+  'Tittakudi',735,'Virudhachalam',735,'Neyveli',735,'Panruti',735,'Cuddalore',735,'Kurinjipadi',735,
+  'Bhuvanagiri',735,'Chidambaram',735,'Kattumannarkoil',735,'Sirkazhi',1015,'Mayiladuturai',1015,'Poompuhar',1015,
+  'Nagapattinam',1040,'Kilvelur',1040,'Vedaranyam',1040,'Thiruthuraipoondi',1247,'Mannargudi',1247,'Thiruvarur',1247,
+  'Nannilam',1247,'Thiruvidaimarudur',1243,'Kumbakonam',1243,'Papanasam',1243,'Thiruvaiyaru',1243,'Thanjavur',1243,
+  'Orathanadu',1243,'Pattukkottai',1243,'Peravurani',1243,'Gandarvakottai',1114,'Viralimalai',1114,'Pudukkottai',1114,
+  'Thirumayam',1114,'Alangudi',1114,'Aranthangi',1114,'Karaikudi',1206,'Tiruppattur',1206,'Sivaganga',1206,
+  'Manamadurai',1206,'Melur',986,'Madurai East',986,'Sholavandan',986,'Madurai North',986,'Madurai South',986,
+  'Madurai Central',986,'Madurai West',986,'Thiruparankundram',986,'Thirumangalam',986,'Usilampatti',986,'Andipatti',1244,
+  'Periyakulam',1244,'Bodinayakanur',1244,'Cumbum',1244,'Rajapalayam',1284,'Srivilliputhur',1284,'Sattur',1284,
+  'Sivakasi',1284,'Virudhunagar',1284,'Aruppukkottai',1284,'Tiruchuli',1284,'Paramakudi',1132,'Tiruvadanai',1132,
+  'Ramanathapuram',1132,'Mudhukulathur',1132,'Vilathikulam',1248,'Thoothukkudi',1248,'Tiruchendur',1248,'Srivaikuntam',1248,
+  'Ottapidaram',1248,'Kovilpatti',1248,'Sankarankovil',1241,'Vasudevanallur',1241,'Kadayanallur',1241,'Tenkasi',1241,
+  'Alangulam',1241,'Tirunelveli',1255,'Ambasamudram',1255,'Palayamkottai',1255,'Nanguneri',1255,'Radhapuram',1255,
+  'Kanniyakumari',902,'Nagercoil',902,'Colachal',902,'Padmanabhapuram',902,'Vilavancode',902,'Killiyoor',902,
   // Telangana (119)
-  { id: "TS-AC-001", name: 'Sirpur', state: 'Telangana', district: 'Komaram Bheem Asifabad', acNo: 1 },
-  { id: "TS-AC-002", name: 'Chennur', state: 'Telangana', district: 'Mancherial', acNo: 2 },
-  { id: "TS-AC-003", name: 'Bellampalli', state: 'Telangana', district: 'Mancherial', acNo: 3 },
-  { id: "TS-AC-004", name: 'Mancherial', state: 'Telangana', district: 'Mancherial', acNo: 4 },
-  { id: "TS-AC-005", name: 'Asifabad', state: 'Telangana', district: 'Komaram Bheem Asifabad', acNo: 5 },
-  { id: "TS-AC-006", name: 'Khanapur', state: 'Telangana', district: 'Adilabad', acNo: 6 },
-  { id: "TS-AC-007", name: 'Adilabad', state: 'Telangana', district: 'Adilabad', acNo: 7 },
-  { id: "TS-AC-008", name: 'Boath', state: 'Telangana', district: 'Adilabad', acNo: 8 },
-  { id: "TS-AC-009", name: 'Nirmal', state: 'Telangana', district: 'Nirmal', acNo: 9 },
-  { id: "TS-AC-010", name: 'Mudhole', state: 'Telangana', district: 'Nirmal', acNo: 10 },
-  { id: "TS-AC-011", name: 'Armur', state: 'Telangana', district: 'Nizamabad', acNo: 11 },
-  { id: "TS-AC-012", name: 'Bodhan', state: 'Telangana', district: 'Nizamabad', acNo: 12 },
-  { id: "TS-AC-013", name: 'Jukkal', state: 'Telangana', district: 'Kamareddy', acNo: 13 },
-  { id: "TS-AC-014", name: 'Banswada', state: 'Telangana', district: 'Kamareddy', acNo: 14 },
-  { id: "TS-AC-015", name: 'Yellareddy', state: 'Telangana', district: 'Kamareddy', acNo: 15 },
-  { id: "TS-AC-016", name: 'Kamareddy', state: 'Telangana', district: 'Kamareddy', acNo: 16 },
-  { id: "TS-AC-017", name: 'Nizamabad Urban', state: 'Telangana', district: 'Nizamabad', acNo: 17 },
-  { id: "TS-AC-018", name: 'Nizamabad Rural', state: 'Telangana', district: 'Nizamabad', acNo: 18 },
-  { id: "TS-AC-019", name: 'Balkonda', state: 'Telangana', district: 'Nizamabad', acNo: 19 },
-  { id: "TS-AC-020", name: 'Koratla', state: 'Telangana', district: 'Jagtial', acNo: 20 },
-  { id: "TS-AC-021", name: 'Jagtial', state: 'Telangana', district: 'Jagtial', acNo: 21 },
-  { id: "TS-AC-022", name: 'Dharmapuri', state: 'Telangana', district: 'Jagtial', acNo: 22 },
-  { id: "TS-AC-023", name: 'Ramagundam', state: 'Telangana', district: 'Peddapalli', acNo: 23 },
-  { id: "TS-AC-024", name: 'Manthani', state: 'Telangana', district: 'Jayashankar Bhupalpally', acNo: 24 },
-  { id: "TS-AC-025", name: 'Peddapalle', state: 'Telangana', district: 'Peddapalli', acNo: 25 },
-  { id: "TS-AC-026", name: 'Karimnagar', state: 'Telangana', district: 'Karimnagar', acNo: 26 },
-  { id: "TS-AC-027", name: 'Choppadandi', state: 'Telangana', district: 'Jagtial', acNo: 27 },
-  { id: "TS-AC-028", name: 'Vemulawada', state: 'Telangana', district: 'Jagtial', acNo: 28 },
-  { id: "TS-AC-029", name: 'Sircilla', state: 'Telangana', district: 'Rajanna Sircilla', acNo: 29 },
-  { id: "TS-AC-030", name: 'Manakondur', state: 'Telangana', district: 'Karimnagar', acNo: 30 },
-  { id: "TS-AC-031", name: 'Huzurabad', state: 'Telangana', district: 'Karimnagar', acNo: 31 },
-  { id: "TS-AC-032", name: 'Husnabad', state: 'Telangana', district: 'Karimnagar', acNo: 32 },
-  { id: "TS-AC-033", name: 'Siddipet', state: 'Telangana', district: 'Siddipet', acNo: 33 },
-  { id: "TS-AC-034", name: 'Medak', state: 'Telangana', district: 'Medak', acNo: 34 },
-  { id: "TS-AC-035", name: 'Narayankhed', state: 'Telangana', district: 'Medak', acNo: 35 },
-  { id: "TS-AC-036", name: 'Andole', state: 'Telangana', district: 'Medak', acNo: 36 },
-  { id: "TS-AC-037", name: 'Narsapur', state: 'Telangana', district: 'Medak', acNo: 37 },
-  { id: "TS-AC-038", name: 'Zahirabad', state: 'Telangana', district: 'Sangareddy', acNo: 38 },
-  { id: "TS-AC-039", name: 'Sangareddy', state: 'Telangana', district: 'Sangareddy', acNo: 39 },
-  { id: "TS-AC-040", name: 'Patancheru', state: 'Telangana', district: 'Sangareddy', acNo: 40 },
-  { id: "TS-AC-041", name: 'Dubbak', state: 'Telangana', district: 'Medak', acNo: 41 },
-  { id: "TS-AC-042", name: 'Gajwel', state: 'Telangana', district: 'Medak', acNo: 42 },
-  { id: "TS-AC-043", name: 'Medchal', state: 'Telangana', district: 'Medchal-Malkajgiri', acNo: 43 },
-  { id: "TS-AC-044", name: 'Malkajgiri', state: 'Telangana', district: 'Medchal-Malkajgiri', acNo: 44 },
-  { id: "TS-AC-045", name: 'Quthbullapur', state: 'Telangana', district: 'Medchal-Malkajgiri', acNo: 45 },
-  { id: "TS-AC-046", name: 'Kukatpally', state: 'Telangana', district: 'Medchal-Malkajgiri', acNo: 46 },
-  { id: "TS-AC-047", name: 'Uppal', state: 'Telangana', district: 'Medchal-Malkajgiri', acNo: 47 },
-  { id: "TS-AC-048", name: 'Ibrahimpatnam', state: 'Telangana', district: 'Ranga Reddy', acNo: 48 },
-  { id: "TS-AC-049", name: 'Lal Bahadur Nagar', state: 'Telangana', district: 'Ranga Reddy', acNo: 49 },
-  { id: "TS-AC-050", name: 'Maheshwaram', state: 'Telangana', district: 'Ranga Reddy', acNo: 50 },
-  { id: "TS-AC-051", name: 'Rajendranagar', state: 'Telangana', district: 'Ranga Reddy', acNo: 51 },
-  { id: "TS-AC-052", name: 'Serilingampally', state: 'Telangana', district: 'Ranga Reddy', acNo: 52 },
-  { id: "TS-AC-053", name: 'Chevella', state: 'Telangana', district: 'Ranga Reddy', acNo: 53 },
-  { id: "TS-AC-054", name: 'Pargi', state: 'Telangana', district: 'Mahbubnagar', acNo: 54 },
-  { id: "TS-AC-055", name: 'Vikarabad', state: 'Telangana', district: 'Vikarabad', acNo: 55 },
-  { id: "TS-AC-056", name: 'Tandur', state: 'Telangana', district: 'Vikarabad', acNo: 56 },
-  { id: "TS-AC-057", name: 'Musheerabad', state: 'Telangana', district: 'Hyderabad', acNo: 57 },
-  { id: "TS-AC-058", name: 'Malakpet', state: 'Telangana', district: 'Hyderabad', acNo: 58 },
-  { id: "TS-AC-059", name: 'Amberpet', state: 'Telangana', district: 'Hyderabad', acNo: 59 },
-  { id: "TS-AC-060", name: 'Khairatabad', state: 'Telangana', district: 'Hyderabad', acNo: 60 },
-  { id: "TS-AC-061", name: 'Jubilee Hills', state: 'Telangana', district: 'Hyderabad', acNo: 61 },
-  { id: "TS-AC-062", name: 'Sanathnagar', state: 'Telangana', district: 'Hyderabad', acNo: 62 },
-  { id: "TS-AC-063", name: 'Nampally', state: 'Telangana', district: 'Hyderabad', acNo: 63 },
-  { id: "TS-AC-064", name: 'Karwan', state: 'Telangana', district: 'Hyderabad', acNo: 64 },
-  { id: "TS-AC-065", name: 'Goshamahal', state: 'Telangana', district: 'Hyderabad', acNo: 65 },
-  { id: "TS-AC-066", name: 'Charminar', state: 'Telangana', district: 'Hyderabad', acNo: 66 },
-  { id: "TS-AC-067", name: 'Chandrayangutta', state: 'Telangana', district: 'Hyderabad', acNo: 67 },
-  { id: "TS-AC-068", name: 'Yakutpura', state: 'Telangana', district: 'Hyderabad', acNo: 68 },
-  { id: "TS-AC-069", name: 'Bahadurpura', state: 'Telangana', district: 'Hyderabad', acNo: 69 },
-  { id: "TS-AC-070", name: 'Secunderabad', state: 'Telangana', district: 'Hyderabad', acNo: 70 },
-  { id: "TS-AC-071", name: 'Secunderabad Cantonment', state: 'Telangana', district: 'Hyderabad', acNo: 71 },
-  { id: "TS-AC-072", name: 'Kodangal', state: 'Telangana', district: 'Mahabubnagar', acNo: 72 },
-  { id: "TS-AC-073", name: 'Narayanpet', state: 'Telangana', district: 'Narayanpet', acNo: 73 },
-  { id: "TS-AC-074", name: 'Mahbubnagar', state: 'Telangana', district: 'Mahabubnagar', acNo: 74 },
-  { id: "TS-AC-075", name: 'Jadcherla', state: 'Telangana', district: 'Mahabubnagar', acNo: 75 },
-  { id: "TS-AC-076", name: 'Devarkadra', state: 'Telangana', district: 'Mahabubnagar', acNo: 76 },
-  { id: "TS-AC-077", name: 'Makthal', state: 'Telangana', district: 'Mahabubnagar', acNo: 77 },
-  { id: "TS-AC-078", name: 'Wanaparthy', state: 'Telangana', district: 'Mahabubnagar', acNo: 78 },
-  { id: "TS-AC-079", name: 'Gadwal', state: 'Telangana', district: 'Jogulamba Gadwal', acNo: 79 },
-  { id: "TS-AC-080", name: 'Alampur', state: 'Telangana', district: 'Jogulamba Gadwal', acNo: 80 },
-  { id: "TS-AC-081", name: 'Nagarkurnool', state: 'Telangana', district: 'Nagarkurnool', acNo: 81 },
-  { id: "TS-AC-082", name: 'Achampet', state: 'Telangana', district: 'Nagarkurnool', acNo: 82 },
-  { id: "TS-AC-083", name: 'Kalwakurthy', state: 'Telangana', district: 'Nagarkurnool', acNo: 83 },
-  { id: "TS-AC-084", name: 'Shadnagar', state: 'Telangana', district: 'Ranga Reddy', acNo: 84 },
-  { id: "TS-AC-085", name: 'Kollapur', state: 'Telangana', district: 'Nagarkurnool', acNo: 85 },
-  { id: "TS-AC-086", name: 'Devarakonda', state: 'Telangana', district: 'Nalgonda', acNo: 86 },
-  { id: "TS-AC-087", name: 'Nagarjuna Sagar', state: 'Telangana', district: 'Nalgonda', acNo: 87 },
-  { id: "TS-AC-088", name: 'Miryalaguda', state: 'Telangana', district: 'Nalgonda', acNo: 88 },
-  { id: "TS-AC-089", name: 'Huzurnagar', state: 'Telangana', district: 'Suryapet', acNo: 89 },
-  { id: "TS-AC-090", name: 'Kodad', state: 'Telangana', district: 'Suryapet', acNo: 90 },
-  { id: "TS-AC-091", name: 'Suryapet', state: 'Telangana', district: 'Suryapet', acNo: 91 },
-  { id: "TS-AC-092", name: 'Nalgonda', state: 'Telangana', district: 'Nalgonda', acNo: 92 },
-  { id: "TS-AC-093", name: 'Munugode', state: 'Telangana', district: 'Nalgonda', acNo: 93 },
-  { id: "TS-AC-094", name: 'Bhongir', state: 'Telangana', district: 'Yadadri Bhuvanagiri', acNo: 94 },
-  { id: "TS-AC-095", name: 'Nakrekal', state: 'Telangana', district: 'Nalgonda', acNo: 95 },
-  { id: "TS-AC-096", name: 'Thungathurthi', state: 'Telangana', district: 'Nalgonda', acNo: 96 },
-  { id: "TS-AC-097", name: 'Alair', state: 'Telangana', district: 'Jangaon', acNo: 97 },
-  { id: "TS-AC-098", name: 'Jangaon', state: 'Telangana', district: 'Jangaon', acNo: 98 },
-  { id: "TS-AC-099", name: 'Ghanpur Station', state: 'Telangana', district: 'Jangaon', acNo: 99 },
-  { id: "TS-AC-100", name: 'Palakurthi', state: 'Telangana', district: 'Jangaon', acNo: 100 },
-  { id: "TS-AC-101", name: 'Dornakal', state: 'Telangana', district: 'Mahbubabad', acNo: 101 },
-  { id: "TS-AC-102", name: 'Mahabubabad', state: 'Telangana', district: 'Mahbubabad', acNo: 102 },
-  { id: "TS-AC-103", name: 'Narsampet', state: 'Telangana', district: 'Warangal', acNo: 103 },
-  { id: "TS-AC-104", name: 'Parkal', state: 'Telangana', district: 'Warangal', acNo: 104 },
-  { id: "TS-AC-105", name: 'Warangal West', state: 'Telangana', district: 'Hanumakonda', acNo: 105 },
-  { id: "TS-AC-106", name: 'Warangal East', state: 'Telangana', district: 'Hanumakonda', acNo: 106 },
-  { id: "TS-AC-107", name: 'Waradhanapet', state: 'Telangana', district: 'Warangal', acNo: 107 },
-  { id: "TS-AC-108", name: 'Bhupalpalle', state: 'Telangana', district: 'Jayashankar Bhupalpally', acNo: 108 },
-  { id: "TS-AC-109", name: 'Mulug', state: 'Telangana', district: 'Mulugu', acNo: 109 },
-  { id: "TS-AC-110", name: 'Pinapaka', state: 'Telangana', district: 'Bhadradri Kothagudem', acNo: 110 },
-  { id: "TS-AC-111", name: 'Yellandu', state: 'Telangana', district: 'Bhadradri Kothagudem', acNo: 111 },
-  { id: "TS-AC-112", name: 'Khammam', state: 'Telangana', district: 'Khammam', acNo: 112 },
-  { id: "TS-AC-113", name: 'Palair', state: 'Telangana', district: 'Khammam', acNo: 113 },
-  { id: "TS-AC-114", name: 'Madhira', state: 'Telangana', district: 'Khammam', acNo: 114 },
-  { id: "TS-AC-115", name: 'Wyra', state: 'Telangana', district: 'Bhadradri Kothagudem', acNo: 115 },
-  { id: "TS-AC-116", name: 'Sathupalli', state: 'Telangana', district: 'Khammam', acNo: 116 },
-  { id: "TS-AC-117", name: 'Kothagudem', state: 'Telangana', district: 'Bhadradri Kothagudem', acNo: 117 },
-  { id: "TS-AC-118", name: 'Aswaraopeta', state: 'Telangana', district: 'Bhadradri Kothagudem', acNo: 118 },
-  { id: "TS-AC-119", name: 'Bhadrachalam', state: 'Telangana', district: 'Bhadradri Kothagudem', acNo: 119 },
+  'Sirpur',945,'Chennur',1003,'Bellampalli',1003,'Mancherial',1003,'Asifabad',945,'Khanapur',605,
+  'Adilabad',605,'Boath',605,'Nirmal',1066,'Mudhole',1066,'Armur',1068,'Bodhan',1068,
+  'Jukkal',894,'Banswada',894,'Yellareddy',894,'Kamareddy',894,'Nizamabad Urban',1068,'Nizamabad Rural',1068,
+  'Balkonda',1068,'Koratla',853,'Jagtial',853,'Dharmapuri',853,'Ramagundam',1102,'Manthani',871,
+  'Peddapalle',1102,'Karimnagar',911,'Choppadandi',853,'Vemulawada',853,'Sircilla',1126,'Manakondur',911,
+  'Huzurabad',911,'Husnabad',911,'Siddipet',1194,'Medak',1017,'Narayankhed',1017,'Andole',1017,
+  'Narsapur',1017,'Zahirabad',1163,'Sangareddy',1163,'Patancheru',1163,'Dubbak',1017,'Gajwel',1017,
+  'Medchal',1018,'Malkajgiri',1018,'Quthbullapur',1018,'Kukatpally',1018,'Uppal',1018,'Ibrahimpatnam',1137,
+  'Lal Bahadur Nagar',1137,'Maheshwaram',1137,'Rajendranagar',1137,'Serilingampally',1137,'Chevella',1137,'Pargi',991,
+  'Vikarabad',1282,'Tandur',1282,'Musheerabad',846,'Malakpet',846,'Amberpet',846,'Khairatabad',846,
+  'Jubilee Hills',846,'Sanathnagar',846,'Nampally',846,'Karwan',846,'Goshamahal',846,'Charminar',846,
+  'Chandrayangutta',846,'Yakutpura',846,'Bahadurpura',846,'Secunderabad',846,'Secunderabad Cantonment',846,'Kodangal',987,
+  'Narayanpet',1053,'Mahbubnagar',987,'Jadcherla',987,'Devarkadra',987,'Makthal',987,'Wanaparthy',987,
+  'Gadwal',883,'Alampur',883,'Nagarkurnool',1041,'Achampet',1041,'Kalwakurthy',1041,'Shadnagar',1137,
+  'Kollapur',1041,'Devarakonda',1046,'Nagarjuna Sagar',1046,'Miryalaguda',1046,'Huzurnagar',1236,'Kodad',1236,
+  'Suryapet',1236,'Nalgonda',1046,'Munugode',1046,'Bhongir',1304,'Nakrekal',1046,'Thungathurthi',1046,
+  'Alair',867,'Jangaon',867,'Ghanpur Station',867,'Palakurthi',867,'Dornakal',990,'Mahabubabad',990,
+  'Narsampet',1287,'Parkal',1287,'Warangal West',832,'Warangal East',832,'Waradhanapet',1287,'Bhupalpalle',871,
+  'Mulug',1028,'Pinapaka',679,'Yellandu',679,'Khammam',926,'Palair',926,'Madhira',926,
+  'Wyra',679,'Sathupalli',926,'Kothagudem',679,'Aswaraopeta',679,'Bhadrachalam',679,
   // Tripura (60)
-  { id: "TR-AC-001", name: 'Simna', state: 'Tripura', district: 'West Tripura', acNo: 1 },
-  { id: "TR-AC-002", name: 'Mohanpur', state: 'Tripura', district: 'West Tripura', acNo: 2 },
-  { id: "TR-AC-003", name: 'Bamutia', state: 'Tripura', district: 'West Tripura', acNo: 3 },
-  { id: "TR-AC-004", name: 'Barjala', state: 'Tripura', district: 'West Tripura', acNo: 4 },
-  { id: "TR-AC-005", name: 'Khayerpur', state: 'Tripura', district: 'West Tripura', acNo: 5 },
-  { id: "TR-AC-006", name: 'Agartala', state: 'Tripura', district: 'West Tripura', acNo: 6 },
-  { id: "TR-AC-007", name: 'Ramnagar', state: 'Tripura', district: 'West Tripura', acNo: 7 },
-  { id: "TR-AC-008", name: 'Town Bordowali', state: 'Tripura', district: 'West Tripura', acNo: 8 },
-  { id: "TR-AC-009", name: 'Banamalipur', state: 'Tripura', district: 'West Tripura', acNo: 9 },
-  { id: "TR-AC-010", name: 'Majlishpur', state: 'Tripura', district: 'West Tripura', acNo: 10 },
-  { id: "TR-AC-011", name: 'Mandaibazar', state: 'Tripura', district: 'West Tripura', acNo: 11 },
-  { id: "TR-AC-012", name: 'Takarjala', state: 'Tripura', district: 'Sipahijala', acNo: 12 },
-  { id: "TR-AC-013", name: 'Pratapgarh', state: 'Tripura', district: 'West Tripura', acNo: 13 },
-  { id: "TR-AC-014", name: 'Badharghat', state: 'Tripura', district: 'West Tripura', acNo: 14 },
-  { id: "TR-AC-015", name: 'Kamalasagar', state: 'Tripura', district: 'Sipahijala', acNo: 15 },
-  { id: "TR-AC-016", name: 'Bishalgarh', state: 'Tripura', district: 'Sipahijala', acNo: 16 },
-  { id: "TR-AC-017", name: 'Golaghati', state: 'Tripura', district: 'Sipahijala', acNo: 17 },
-  { id: "TR-AC-018", name: 'Suryamaninagar', state: 'Tripura', district: 'West Tripura', acNo: 18 },
-  { id: "TR-AC-019", name: 'Charilam', state: 'Tripura', district: 'Sipahijala', acNo: 19 },
-  { id: "TR-AC-020", name: 'Boxanagar', state: 'Tripura', district: 'Sipahijala', acNo: 20 },
-  { id: "TR-AC-021", name: 'Nalchar', state: 'Tripura', district: 'Sipahijala', acNo: 21 },
-  { id: "TR-AC-022", name: 'Sonamura', state: 'Tripura', district: 'Sipahijala', acNo: 22 },
-  { id: "TR-AC-023", name: 'Dhanpur', state: 'Tripura', district: 'Sipahijala', acNo: 23 },
-  { id: "TR-AC-024", name: 'Ramchandraghat', state: 'Tripura', district: 'Khowai', acNo: 24 },
-  { id: "TR-AC-025", name: 'Khowai', state: 'Tripura', district: 'Khowai', acNo: 25 },
-  { id: "TR-AC-026", name: 'Asharambari', state: 'Tripura', district: 'Khowai', acNo: 26 },
-  { id: "TR-AC-027", name: 'Kalyanpur–Pramodenagar', state: 'Tripura', district: 'Khowai', acNo: 27 },
-  { id: "TR-AC-028", name: 'Teliamura', state: 'Tripura', district: 'Khowai', acNo: 28 },
-  { id: "TR-AC-029", name: 'Krishnapur', state: 'Tripura', district: 'Khowai', acNo: 29 },
-  { id: "TR-AC-030", name: 'Bagma', state: 'Tripura', district: 'Gomati', acNo: 30 },
-  { id: "TR-AC-031", name: 'Radhakishorpur', state: 'Tripura', district: 'Gomati', acNo: 31 },
-  { id: "TR-AC-032", name: 'Matarbari', state: 'Tripura', district: 'Gomati', acNo: 32 },
-  { id: "TR-AC-033", name: 'Kakraban–Salgarh', state: 'Tripura', district: 'Gomati', acNo: 33 },
-  { id: "TR-AC-034", name: 'Rajnagar', state: 'Tripura', district: 'South Tripura', acNo: 34 },
-  { id: "TR-AC-035", name: 'Belonia', state: 'Tripura', district: 'South Tripura', acNo: 35 },
-  { id: "TR-AC-036", name: 'Santirbazar', state: 'Tripura', district: 'South Tripura', acNo: 36 },
-  { id: "TR-AC-037", name: 'Hrishyamukh', state: 'Tripura', district: 'South Tripura', acNo: 37 },
-  { id: "TR-AC-038", name: 'Jolaibari', state: 'Tripura', district: 'South Tripura', acNo: 38 },
-  { id: "TR-AC-039", name: 'Manu', state: 'Tripura', district: 'South Tripura', acNo: 39 },
-  { id: "TR-AC-040", name: 'Sabroom', state: 'Tripura', district: 'South Tripura', acNo: 40 },
-  { id: "TR-AC-041", name: 'Ampinagar', state: 'Tripura', district: 'Gomati', acNo: 41 },
-  { id: "TR-AC-042", name: 'Amarpur', state: 'Tripura', district: 'Gomati', acNo: 42 },
-  { id: "TR-AC-043", name: 'Karbook', state: 'Tripura', district: 'Gomati', acNo: 43 },
-  { id: "TR-AC-044", name: 'Raima Valley', state: 'Tripura', district: 'Dhalai', acNo: 44 },
-  { id: "TR-AC-045", name: 'Kamalpur', state: 'Tripura', district: 'Dhalai', acNo: 45 },
-  { id: "TR-AC-046", name: 'Surma', state: 'Tripura', district: 'Dhalai', acNo: 46 },
-  { id: "TR-AC-047", name: 'Ambassa', state: 'Tripura', district: 'Dhalai', acNo: 47 },
-  { id: "TR-AC-048", name: 'Karamcherra', state: 'Tripura', district: 'Dhalai', acNo: 48 },
-  { id: "TR-AC-049", name: 'Chawamanu', state: 'Tripura', district: 'Dhalai', acNo: 49 },
-  { id: "TR-AC-050", name: 'Pabiachhara', state: 'Tripura', district: 'Unakoti', acNo: 50 },
-  { id: "TR-AC-051", name: 'Fatikroy', state: 'Tripura', district: 'Unakoti', acNo: 51 },
-  { id: "TR-AC-052", name: 'Chandipur', state: 'Tripura', district: 'Unakoti', acNo: 52 },
-  { id: "TR-AC-053", name: 'Kailashahar', state: 'Tripura', district: 'Unakoti', acNo: 53 },
-  { id: "TR-AC-054", name: 'Kadamtala–Kurti', state: 'Tripura', district: 'North Tripura', acNo: 54 },
-  { id: "TR-AC-055", name: 'Bagbassa', state: 'Tripura', district: 'North Tripura', acNo: 55 },
-  { id: "TR-AC-056", name: 'Dharmanagar', state: 'Tripura', district: 'North Tripura', acNo: 56 },
-  { id: "TR-AC-057", name: 'Jubarajnagar', state: 'Tripura', district: 'North Tripura', acNo: 57 },
-  { id: "TR-AC-058", name: 'Panisagar', state: 'Tripura', district: 'North Tripura', acNo: 58 },
-  { id: "TR-AC-059", name: 'Pencharthal', state: 'Tripura', district: 'North Tripura', acNo: 59 },
-  { id: "TR-AC-060", name: 'Kanchanpur', state: 'Tripura', district: 'North Tripura', acNo: 60 },
+  'Simna',1301,'Mohanpur',1301,'Bamutia',1301,'Barjala',1301,'Khayerpur',1301,'Agartala',1301,
+  'Ramnagar',1301,'Town Bordowali',1301,'Banamalipur',1301,'Majlishpur',1301,'Mandaibazar',1301,'Takarjala',1200,
+  'Pratapgarh',1301,'Badharghat',1301,'Kamalasagar',1200,'Bishalgarh',1200,'Golaghati',1200,'Suryamaninagar',1301,
+  'Charilam',1200,'Boxanagar',1200,'Nalchar',1200,'Sonamura',1200,'Dhanpur',1200,'Ramchandraghat',932,
+  'Khowai',932,'Asharambari',932,'Kalyanpur–Pramodenagar',932,'Teliamura',932,'Krishnapur',932,'Bagma',818,
+  'Radhakishorpur',818,'Matarbari',818,'Kakraban–Salgarh',818,'Rajnagar',1220,'Belonia',1220,'Santirbazar',1220,
+  'Hrishyamukh',1220,'Jolaibari',1220,'Manu',1220,'Sabroom',1220,'Ampinagar',818,'Amarpur',818,
+  'Karbook',818,'Raima Valley',752,'Kamalpur',752,'Surma',752,'Ambassa',752,'Karamcherra',752,
+  'Chawamanu',752,'Pabiachhara',1270,'Fatikroy',1270,'Chandipur',1270,'Kailashahar',1270,'Kadamtala–Kurti',1075,
+  'Bagbassa',1075,'Dharmanagar',1075,'Jubarajnagar',1075,'Panisagar',1075,'Pencharthal',1075,'Kanchanpur',1075,
   // Uttar Pradesh (403)
-  { id: "UP-AC-001", name: 'Behat', state: 'Uttar Pradesh', district: 'Saharanpur', acNo: 1 },
-  { id: "UP-AC-002", name: 'Nakur', state: 'Uttar Pradesh', district: 'Saharanpur', acNo: 2 },
-  { id: "UP-AC-003", name: 'Saharanpur Nagar', state: 'Uttar Pradesh', district: 'Saharanpur', acNo: 3 },
-  { id: "UP-AC-004", name: 'Saharanpur', state: 'Uttar Pradesh', district: 'Saharanpur', acNo: 4 },
-  { id: "UP-AC-005", name: 'Deoband', state: 'Uttar Pradesh', district: 'Saharanpur', acNo: 5 },
-  { id: "UP-AC-006", name: 'Rampur Maniharan', state: 'Uttar Pradesh', district: 'Saharanpur', acNo: 6 },
-  { id: "UP-AC-007", name: 'Gangoh', state: 'Uttar Pradesh', district: 'Saharanpur', acNo: 7 },
-  { id: "UP-AC-008", name: 'Kairana', state: 'Uttar Pradesh', district: 'Shamli', acNo: 8 },
-  { id: "UP-AC-009", name: 'Thana Bhawan', state: 'Uttar Pradesh', district: 'Shamli', acNo: 9 },
-  { id: "UP-AC-010", name: 'Shamli', state: 'Uttar Pradesh', district: 'Shamli', acNo: 10 },
-  { id: "UP-AC-011", name: 'Budhana', state: 'Uttar Pradesh', district: 'Muzaffarnagar', acNo: 11 },
-  { id: "UP-AC-012", name: 'Charthawal', state: 'Uttar Pradesh', district: 'Muzaffarnagar', acNo: 12 },
-  { id: "UP-AC-013", name: 'Purqazi', state: 'Uttar Pradesh', district: 'Muzaffarnagar', acNo: 13 },
-  { id: "UP-AC-014", name: 'Muzaffarnagar', state: 'Uttar Pradesh', district: 'Muzaffarnagar', acNo: 14 },
-  { id: "UP-AC-015", name: 'Khatauli', state: 'Uttar Pradesh', district: 'Muzaffarnagar', acNo: 15 },
-  { id: "UP-AC-016", name: 'Meerapur', state: 'Uttar Pradesh', district: 'Muzaffarnagar', acNo: 16 },
-  { id: "UP-AC-017", name: 'Najibabad', state: 'Uttar Pradesh', district: 'Bijnor', acNo: 17 },
-  { id: "UP-AC-018", name: 'Nagina', state: 'Uttar Pradesh', district: 'Bijnor', acNo: 18 },
-  { id: "UP-AC-019", name: 'Barhapur', state: 'Uttar Pradesh', district: 'Bijnor', acNo: 19 },
-  { id: "UP-AC-020", name: 'Dhampur', state: 'Uttar Pradesh', district: 'Bijnor', acNo: 20 },
-  { id: "UP-AC-021", name: 'Nehtaur', state: 'Uttar Pradesh', district: 'Bijnor', acNo: 21 },
-  { id: "UP-AC-022", name: 'Bijnor', state: 'Uttar Pradesh', district: 'Bijnor', acNo: 22 },
-  { id: "UP-AC-023", name: 'Chandpur', state: 'Uttar Pradesh', district: 'Bijnor', acNo: 23 },
-  { id: "UP-AC-024", name: 'Noorpur', state: 'Uttar Pradesh', district: 'Bijnor', acNo: 24 },
-  { id: "UP-AC-025", name: 'Kanth', state: 'Uttar Pradesh', district: 'Moradabad', acNo: 25 },
-  { id: "UP-AC-026", name: 'Thakurdwara', state: 'Uttar Pradesh', district: 'Moradabad', acNo: 26 },
-  { id: "UP-AC-027", name: 'Moradabad Rural', state: 'Uttar Pradesh', district: 'Moradabad', acNo: 27 },
-  { id: "UP-AC-028", name: 'Moradabad Nagar', state: 'Uttar Pradesh', district: 'Moradabad', acNo: 28 },
-  { id: "UP-AC-029", name: 'Kundarki', state: 'Uttar Pradesh', district: 'Moradabad', acNo: 29 },
-  { id: "UP-AC-030", name: 'Bilari', state: 'Uttar Pradesh', district: 'Moradabad', acNo: 30 },
-  { id: "UP-AC-031", name: 'Chandausi', state: 'Uttar Pradesh', district: 'Sambhal', acNo: 31 },
-  { id: "UP-AC-032", name: 'Asmoli', state: 'Uttar Pradesh', district: 'Sambhal', acNo: 32 },
-  { id: "UP-AC-033", name: 'Sambhal', state: 'Uttar Pradesh', district: 'Sambhal', acNo: 33 },
-  { id: "UP-AC-034", name: 'Suar', state: 'Uttar Pradesh', district: 'Rampur', acNo: 34 },
-  { id: "UP-AC-035", name: 'Chamraua', state: 'Uttar Pradesh', district: 'Rampur', acNo: 35 },
-  { id: "UP-AC-036", name: 'Bilaspur', state: 'Uttar Pradesh', district: 'Rampur', acNo: 36 },
-  { id: "UP-AC-037", name: 'Rampur', state: 'Uttar Pradesh', district: 'Rampur', acNo: 37 },
-  { id: "UP-AC-038", name: 'Milak', state: 'Uttar Pradesh', district: 'Rampur', acNo: 38 },
-  { id: "UP-AC-039", name: 'Dhanaura', state: 'Uttar Pradesh', district: 'Amroha', acNo: 39 },
-  { id: "UP-AC-040", name: 'Naugawan Sadat', state: 'Uttar Pradesh', district: 'Amroha', acNo: 40 },
-  { id: "UP-AC-041", name: 'Amroha', state: 'Uttar Pradesh', district: 'Amroha', acNo: 41 },
-  { id: "UP-AC-042", name: 'Hasanpur', state: 'Uttar Pradesh', district: 'Amroha', acNo: 42 },
-  { id: "UP-AC-043", name: 'Siwalkhas', state: 'Uttar Pradesh', district: 'Meerut', acNo: 43 },
-  { id: "UP-AC-044", name: 'Sardhana', state: 'Uttar Pradesh', district: 'Meerut', acNo: 44 },
-  { id: "UP-AC-045", name: 'Hastinapur', state: 'Uttar Pradesh', district: 'Meerut', acNo: 45 },
-  { id: "UP-AC-046", name: 'Kithore', state: 'Uttar Pradesh', district: 'Meerut', acNo: 46 },
-  { id: "UP-AC-047", name: 'Meerut Cantt.', state: 'Uttar Pradesh', district: 'Meerut', acNo: 47 },
-  { id: "UP-AC-048", name: 'Meerut', state: 'Uttar Pradesh', district: 'Meerut', acNo: 48 },
-  { id: "UP-AC-049", name: 'Meerut South', state: 'Uttar Pradesh', district: 'Meerut', acNo: 49 },
-  { id: "UP-AC-050", name: 'Chhaprauli', state: 'Uttar Pradesh', district: 'Bagpat', acNo: 50 },
-  { id: "UP-AC-051", name: 'Baraut', state: 'Uttar Pradesh', district: 'Bagpat', acNo: 51 },
-  { id: "UP-AC-052", name: 'Bagpat', state: 'Uttar Pradesh', district: 'Bagpat', acNo: 52 },
-  { id: "UP-AC-053", name: 'Loni', state: 'Uttar Pradesh', district: 'Ghaziabad', acNo: 53 },
-  { id: "UP-AC-054", name: 'Muradnagar', state: 'Uttar Pradesh', district: 'Ghaziabad', acNo: 54 },
-  { id: "UP-AC-055", name: 'Sahibabad', state: 'Uttar Pradesh', district: 'Ghaziabad', acNo: 55 },
-  { id: "UP-AC-056", name: 'Ghaziabad', state: 'Uttar Pradesh', district: 'Ghaziabad', acNo: 56 },
-  { id: "UP-AC-057", name: 'Modinagar', state: 'Uttar Pradesh', district: 'Ghaziabad', acNo: 57 },
-  { id: "UP-AC-058", name: 'Dhaulana', state: 'Uttar Pradesh', district: 'Hapur', acNo: 58 },
-  { id: "UP-AC-059", name: 'Hapur', state: 'Uttar Pradesh', district: 'Hapur', acNo: 59 },
-  { id: "UP-AC-060", name: 'Garhmukteshwar', state: 'Uttar Pradesh', district: 'Hapur', acNo: 60 },
-  { id: "UP-AC-061", name: 'Noida', state: 'Uttar Pradesh', district: 'Gautam Budh Nagar', acNo: 61 },
-  { id: "UP-AC-062", name: 'Dadri', state: 'Uttar Pradesh', district: 'Gautam Budh Nagar', acNo: 62 },
-  { id: "UP-AC-063", name: 'Jewar', state: 'Uttar Pradesh', district: 'Gautam Budh Nagar', acNo: 63 },
-  { id: "UP-AC-064", name: 'Sikandrabad', state: 'Uttar Pradesh', district: 'Bulandshahr', acNo: 64 },
-  { id: "UP-AC-065", name: 'Bulandshahr', state: 'Uttar Pradesh', district: 'Bulandshahr', acNo: 65 },
-  { id: "UP-AC-066", name: 'Syana', state: 'Uttar Pradesh', district: 'Bulandshahr', acNo: 66 },
-  { id: "UP-AC-067", name: 'Anupshahr', state: 'Uttar Pradesh', district: 'Bulandshahr', acNo: 67 },
-  { id: "UP-AC-068", name: 'Debai', state: 'Uttar Pradesh', district: 'Bulandshahr', acNo: 68 },
-  { id: "UP-AC-069", name: 'Shikarpur', state: 'Uttar Pradesh', district: 'Bulandshahr', acNo: 69 },
-  { id: "UP-AC-070", name: 'Khurja', state: 'Uttar Pradesh', district: 'Bulandshahr', acNo: 70 },
-  { id: "UP-AC-071", name: 'Khair', state: 'Uttar Pradesh', district: 'Aligarh', acNo: 71 },
-  { id: "UP-AC-072", name: 'Barauli', state: 'Uttar Pradesh', district: 'Aligarh', acNo: 72 },
-  { id: "UP-AC-073", name: 'Atrauli', state: 'Uttar Pradesh', district: 'Aligarh', acNo: 73 },
-  { id: "UP-AC-074", name: 'Chharra', state: 'Uttar Pradesh', district: 'Aligarh', acNo: 74 },
-  { id: "UP-AC-075", name: 'Koil', state: 'Uttar Pradesh', district: 'Aligarh', acNo: 75 },
-  { id: "UP-AC-076", name: 'Aligarh', state: 'Uttar Pradesh', district: 'Aligarh', acNo: 76 },
-  { id: "UP-AC-077", name: 'Iglas', state: 'Uttar Pradesh', district: 'Aligarh', acNo: 77 },
-  { id: "UP-AC-078", name: 'Hathras', state: 'Uttar Pradesh', district: 'Hathras', acNo: 78 },
-  { id: "UP-AC-079", name: 'Sadabad', state: 'Uttar Pradesh', district: 'Hathras', acNo: 79 },
-  { id: "UP-AC-080", name: 'Sikandra Rao', state: 'Uttar Pradesh', district: 'Hathras', acNo: 80 },
-  { id: "UP-AC-081", name: 'Chhata', state: 'Uttar Pradesh', district: 'Mathura', acNo: 81 },
-  { id: "UP-AC-082", name: 'Mant', state: 'Uttar Pradesh', district: 'Mathura', acNo: 82 },
-  { id: "UP-AC-083", name: 'Goverdhan', state: 'Uttar Pradesh', district: 'Mathura', acNo: 83 },
-  { id: "UP-AC-084", name: 'Mathura', state: 'Uttar Pradesh', district: 'Mathura', acNo: 84 },
-  { id: "UP-AC-085", name: 'Baldev', state: 'Uttar Pradesh', district: 'Mathura', acNo: 85 },
-  { id: "UP-AC-086", name: 'Etmadpur', state: 'Uttar Pradesh', district: 'Agra', acNo: 86 },
-  { id: "UP-AC-087", name: 'Agra Cantt.', state: 'Uttar Pradesh', district: 'Agra', acNo: 87 },
-  { id: "UP-AC-088", name: 'Agra South', state: 'Uttar Pradesh', district: 'Agra', acNo: 88 },
-  { id: "UP-AC-089", name: 'Agra North', state: 'Uttar Pradesh', district: 'Agra', acNo: 89 },
-  { id: "UP-AC-090", name: 'Agra Rural', state: 'Uttar Pradesh', district: 'Agra', acNo: 90 },
-  { id: "UP-AC-091", name: 'Fatehpur Sikri', state: 'Uttar Pradesh', district: 'Agra', acNo: 91 },
-  { id: "UP-AC-092", name: 'Kheragarh', state: 'Uttar Pradesh', district: 'Agra', acNo: 92 },
-  { id: "UP-AC-093", name: 'Fatehabad', state: 'Uttar Pradesh', district: 'Agra', acNo: 93 },
-  { id: "UP-AC-094", name: 'Bah', state: 'Uttar Pradesh', district: 'Agra', acNo: 94 },
-  { id: "UP-AC-095", name: 'Tundla', state: 'Uttar Pradesh', district: 'Firozabad', acNo: 95 },
-  { id: "UP-AC-096", name: 'Jasrana', state: 'Uttar Pradesh', district: 'Firozabad', acNo: 96 },
-  { id: "UP-AC-097", name: 'Firozabad', state: 'Uttar Pradesh', district: 'Firozabad', acNo: 97 },
-  { id: "UP-AC-098", name: 'Shikohabad', state: 'Uttar Pradesh', district: 'Firozabad', acNo: 98 },
-  { id: "UP-AC-099", name: 'Sirsaganj', state: 'Uttar Pradesh', district: 'Firozabad', acNo: 99 },
-  { id: "UP-AC-100", name: 'Kasganj', state: 'Uttar Pradesh', district: 'Kasganj', acNo: 100 },
-  { id: "UP-AC-101", name: 'Amanpur', state: 'Uttar Pradesh', district: 'Kasganj', acNo: 101 },
-  { id: "UP-AC-102", name: 'Patiyali', state: 'Uttar Pradesh', district: 'Kasganj', acNo: 102 },
-  { id: "UP-AC-103", name: 'Aliganj', state: 'Uttar Pradesh', district: 'Etah', acNo: 103 },
-  { id: "UP-AC-104", name: 'Etah', state: 'Uttar Pradesh', district: 'Etah', acNo: 104 },
-  { id: "UP-AC-105", name: 'Marhara', state: 'Uttar Pradesh', district: 'Etah', acNo: 105 },
-  { id: "UP-AC-106", name: 'Jalesar', state: 'Uttar Pradesh', district: 'Etah', acNo: 106 },
-  { id: "UP-AC-107", name: 'Mainpuri', state: 'Uttar Pradesh', district: 'Mainpuri', acNo: 107 },
-  { id: "UP-AC-108", name: 'Bhongaon', state: 'Uttar Pradesh', district: 'Mainpuri', acNo: 108 },
-  { id: "UP-AC-109", name: 'Kishni', state: 'Uttar Pradesh', district: 'Mainpuri', acNo: 109 },
-  { id: "UP-AC-110", name: 'Karhal', state: 'Uttar Pradesh', district: 'Mainpuri', acNo: 110 },
-  { id: "UP-AC-111", name: 'Gunnaur', state: 'Uttar Pradesh', district: 'Sambhal', acNo: 111 },
-  { id: "UP-AC-112", name: 'Bisauli', state: 'Uttar Pradesh', district: 'Budaun', acNo: 112 },
-  { id: "UP-AC-113", name: 'Sahaswan', state: 'Uttar Pradesh', district: 'Budaun', acNo: 113 },
-  { id: "UP-AC-114", name: 'Bilsi', state: 'Uttar Pradesh', district: 'Budaun', acNo: 114 },
-  { id: "UP-AC-115", name: 'Badaun', state: 'Uttar Pradesh', district: 'Budaun', acNo: 115 },
-  { id: "UP-AC-116", name: 'Shekhupur', state: 'Uttar Pradesh', district: 'Budaun', acNo: 116 },
-  { id: "UP-AC-117", name: 'Dataganj', state: 'Uttar Pradesh', district: 'Budaun', acNo: 117 },
-  { id: "UP-AC-118", name: 'Baheri', state: 'Uttar Pradesh', district: 'Bareilly', acNo: 118 },
-  { id: "UP-AC-119", name: 'Meerganj', state: 'Uttar Pradesh', district: 'Bareilly', acNo: 119 },
-  { id: "UP-AC-120", name: 'Bhojipura', state: 'Uttar Pradesh', district: 'Bareilly', acNo: 120 },
-  { id: "UP-AC-121", name: 'Nawabganj', state: 'Uttar Pradesh', district: 'Bareilly', acNo: 121 },
-  { id: "UP-AC-122", name: 'Faridpur', state: 'Uttar Pradesh', district: 'Bareilly', acNo: 122 },
-  { id: "UP-AC-123", name: 'Bithari Chainpur', state: 'Uttar Pradesh', district: 'Bareilly', acNo: 123 },
-  { id: "UP-AC-124", name: 'Bareilly', state: 'Uttar Pradesh', district: 'Bareilly', acNo: 124 },
-  { id: "UP-AC-125", name: 'Bareilly Cantt.', state: 'Uttar Pradesh', district: 'Bareilly', acNo: 125 },
-  { id: "UP-AC-126", name: 'Aonla', state: 'Uttar Pradesh', district: 'Bareilly', acNo: 126 },
-  { id: "UP-AC-127", name: 'Pilibhit', state: 'Uttar Pradesh', district: 'Pilibhit', acNo: 127 },
-  { id: "UP-AC-128", name: 'Barkhera', state: 'Uttar Pradesh', district: 'Pilibhit', acNo: 128 },
-  { id: "UP-AC-129", name: 'Puranpur', state: 'Uttar Pradesh', district: 'Pilibhit', acNo: 129 },
-  { id: "UP-AC-130", name: 'Bisalpur', state: 'Uttar Pradesh', district: 'Pilibhit', acNo: 130 },
-  { id: "UP-AC-131", name: 'Katra', state: 'Uttar Pradesh', district: 'Shahjahanpur', acNo: 131 },
-  { id: "UP-AC-132", name: 'Jalalabad', state: 'Uttar Pradesh', district: 'Shahjahanpur', acNo: 132 },
-  { id: "UP-AC-133", name: 'Tilhar', state: 'Uttar Pradesh', district: 'Shahjahanpur', acNo: 133 },
-  { id: "UP-AC-134", name: 'Powayan', state: 'Uttar Pradesh', district: 'Shahjahanpur', acNo: 134 },
-  { id: "UP-AC-135", name: 'Shahjahanpur', state: 'Uttar Pradesh', district: 'Shahjahanpur', acNo: 135 },
-  { id: "UP-AC-136", name: 'Dadraul', state: 'Uttar Pradesh', district: 'Shahjahanpur', acNo: 136 },
-  { id: "UP-AC-137", name: 'Palia', state: 'Uttar Pradesh', district: 'Lakhimpur Kheri', acNo: 137 },
-  { id: "UP-AC-138", name: 'Nighasan', state: 'Uttar Pradesh', district: 'Lakhimpur Kheri', acNo: 138 },
-  { id: "UP-AC-139", name: 'Gola Gokrannath', state: 'Uttar Pradesh', district: 'Lakhimpur Kheri', acNo: 139 },
-  { id: "UP-AC-140", name: 'Sri Nagar', state: 'Uttar Pradesh', district: 'Lakhimpur Kheri', acNo: 140 },
-  { id: "UP-AC-141", name: 'Dhaurahra', state: 'Uttar Pradesh', district: 'Lakhimpur Kheri', acNo: 141 },
-  { id: "UP-AC-142", name: 'Lakhimpur', state: 'Uttar Pradesh', district: 'Lakhimpur Kheri', acNo: 142 },
-  { id: "UP-AC-143", name: 'Kasta', state: 'Uttar Pradesh', district: 'Lakhimpur Kheri', acNo: 143 },
-  { id: "UP-AC-144", name: 'Mohammdi', state: 'Uttar Pradesh', district: 'Lakhimpur Kheri', acNo: 144 },
-  { id: "UP-AC-145", name: 'Maholi', state: 'Uttar Pradesh', district: 'Sitapur', acNo: 145 },
-  { id: "UP-AC-146", name: 'Sitapur', state: 'Uttar Pradesh', district: 'Sitapur', acNo: 146 },
-  { id: "UP-AC-147", name: 'Hargaon', state: 'Uttar Pradesh', district: 'Sitapur', acNo: 147 },
-  { id: "UP-AC-148", name: 'Laharpur', state: 'Uttar Pradesh', district: 'Sitapur', acNo: 148 },
-  { id: "UP-AC-149", name: 'Biswan', state: 'Uttar Pradesh', district: 'Sitapur', acNo: 149 },
-  { id: "UP-AC-150", name: 'Sevata', state: 'Uttar Pradesh', district: 'Sitapur', acNo: 150 },
-  { id: "UP-AC-151", name: 'Mahmoodabad', state: 'Uttar Pradesh', district: 'Sitapur', acNo: 151 },
-  { id: "UP-AC-152", name: 'Sidhauli', state: 'Uttar Pradesh', district: 'Sitapur', acNo: 152 },
-  { id: "UP-AC-153", name: 'Misrikh', state: 'Uttar Pradesh', district: 'Sitapur', acNo: 153 },
-  { id: "UP-AC-154", name: 'Sawayazpur', state: 'Uttar Pradesh', district: 'Hardoi', acNo: 154 },
-  { id: "UP-AC-155", name: 'Shahabad', state: 'Uttar Pradesh', district: 'Hardoi', acNo: 155 },
-  { id: "UP-AC-156", name: 'Hardoi', state: 'Uttar Pradesh', district: 'Hardoi', acNo: 156 },
-  { id: "UP-AC-157", name: 'Gopamau', state: 'Uttar Pradesh', district: 'Hardoi', acNo: 157 },
-  { id: "UP-AC-158", name: 'Sandi', state: 'Uttar Pradesh', district: 'Hardoi', acNo: 158 },
-  { id: "UP-AC-159", name: 'Bilgram-Mallanwan', state: 'Uttar Pradesh', district: 'Hardoi', acNo: 159 },
-  { id: "UP-AC-160", name: 'Balamau', state: 'Uttar Pradesh', district: 'Hardoi', acNo: 160 },
-  { id: "UP-AC-161", name: 'Sandila', state: 'Uttar Pradesh', district: 'Hardoi', acNo: 161 },
-  { id: "UP-AC-162", name: 'Bangarmau', state: 'Uttar Pradesh', district: 'Unnao', acNo: 162 },
-  { id: "UP-AC-163", name: 'Safipur', state: 'Uttar Pradesh', district: 'Unnao', acNo: 163 },
-  { id: "UP-AC-164", name: 'Mohan', state: 'Uttar Pradesh', district: 'Unnao', acNo: 164 },
-  { id: "UP-AC-165", name: 'Unnao', state: 'Uttar Pradesh', district: 'Unnao', acNo: 165 },
-  { id: "UP-AC-166", name: 'Bhagwantnagar', state: 'Uttar Pradesh', district: 'Unnao', acNo: 166 },
-  { id: "UP-AC-167", name: 'Purwa', state: 'Uttar Pradesh', district: 'Unnao', acNo: 167 },
-  { id: "UP-AC-168", name: 'Malihabad', state: 'Uttar Pradesh', district: 'Lucknow', acNo: 168 },
-  { id: "UP-AC-169", name: 'Bakshi Kaa Talab', state: 'Uttar Pradesh', district: 'Lucknow', acNo: 169 },
-  { id: "UP-AC-170", name: 'Sarojini Nagar', state: 'Uttar Pradesh', district: 'Lucknow', acNo: 170 },
-  { id: "UP-AC-171", name: 'Lucknow West', state: 'Uttar Pradesh', district: 'Lucknow', acNo: 171 },
-  { id: "UP-AC-172", name: 'Lucknow North', state: 'Uttar Pradesh', district: 'Lucknow', acNo: 172 },
-  { id: "UP-AC-173", name: 'Lucknow East', state: 'Uttar Pradesh', district: 'Lucknow', acNo: 173 },
-  { id: "UP-AC-174", name: 'Lucknow Central', state: 'Uttar Pradesh', district: 'Lucknow', acNo: 174 },
-  { id: "UP-AC-175", name: 'Lucknow Cantonment', state: 'Uttar Pradesh', district: 'Lucknow', acNo: 175 },
-  { id: "UP-AC-176", name: 'Mohanlalganj', state: 'Uttar Pradesh', district: 'Lucknow', acNo: 176 },
-  { id: "UP-AC-177", name: 'Bachhrawan', state: 'Uttar Pradesh', district: 'Raebareli', acNo: 177 },
-  { id: "UP-AC-178", name: 'Tiloi', state: 'Uttar Pradesh', district: 'Amethi', acNo: 178 },
-  { id: "UP-AC-179", name: 'Harchandpur', state: 'Uttar Pradesh', district: 'Raebareli', acNo: 179 },
-  { id: "UP-AC-180", name: 'Rae Bareli', state: 'Uttar Pradesh', district: 'Raebareli', acNo: 180 },
-  { id: "UP-AC-181", name: 'Salon', state: 'Uttar Pradesh', district: 'Amethi', acNo: 181 },
-  { id: "UP-AC-182", name: 'Sareni', state: 'Uttar Pradesh', district: 'Amethi', acNo: 182 },
-  { id: "UP-AC-183", name: 'Unchahar', state: 'Uttar Pradesh', district: 'Amethi', acNo: 183 },
-  { id: "UP-AC-184", name: 'Jagdishpur', state: 'Uttar Pradesh', district: 'Amethi', acNo: 184 },
-  { id: "UP-AC-185", name: 'Gauriganj', state: 'Uttar Pradesh', district: 'Amethi', acNo: 185 },
-  { id: "UP-AC-186", name: 'Amethi', state: 'Uttar Pradesh', district: 'Amethi', acNo: 186 },
-  { id: "UP-AC-187", name: 'Isauli', state: 'Uttar Pradesh', district: 'Sultanpur', acNo: 187 },
-  { id: "UP-AC-188", name: 'Sultanpur', state: 'Uttar Pradesh', district: 'Sultanpur', acNo: 188 },
-  { id: "UP-AC-189", name: 'Sadar', state: 'Uttar Pradesh', district: 'Sultanpur', acNo: 189 },
-  { id: "UP-AC-190", name: 'Lambhua', state: 'Uttar Pradesh', district: 'Sultanpur', acNo: 190 },
-  { id: "UP-AC-191", name: 'Kadipur', state: 'Uttar Pradesh', district: 'Sultanpur', acNo: 191 },
-  { id: "UP-AC-192", name: 'Kaimganj', state: 'Uttar Pradesh', district: 'Farrukhabad', acNo: 192 },
-  { id: "UP-AC-193", name: 'Amritpur', state: 'Uttar Pradesh', district: 'Farrukhabad', acNo: 193 },
-  { id: "UP-AC-194", name: 'Farrukhabad', state: 'Uttar Pradesh', district: 'Farrukhabad', acNo: 194 },
-  { id: "UP-AC-195", name: 'Bhojpur', state: 'Uttar Pradesh', district: 'Farrukhabad', acNo: 195 },
-  { id: "UP-AC-196", name: 'Chhibramau', state: 'Uttar Pradesh', district: 'Kannauj', acNo: 196 },
-  { id: "UP-AC-197", name: 'Tirwa', state: 'Uttar Pradesh', district: 'Kannauj', acNo: 197 },
-  { id: "UP-AC-198", name: 'Kannauj', state: 'Uttar Pradesh', district: 'Kannauj', acNo: 198 },
-  { id: "UP-AC-199", name: 'Jaswantnagar', state: 'Uttar Pradesh', district: 'Etawah', acNo: 199 },
-  { id: "UP-AC-200", name: 'Etawah', state: 'Uttar Pradesh', district: 'Etawah', acNo: 200 },
-  { id: "UP-AC-201", name: 'Bharthana', state: 'Uttar Pradesh', district: 'Etawah', acNo: 201 },
-  { id: "UP-AC-202", name: 'Bidhuna', state: 'Uttar Pradesh', district: 'Auraiya', acNo: 202 },
-  { id: "UP-AC-203", name: 'Dibiyapur', state: 'Uttar Pradesh', district: 'Auraiya', acNo: 203 },
-  { id: "UP-AC-204", name: 'Auraiya', state: 'Uttar Pradesh', district: 'Auraiya', acNo: 204 },
-  { id: "UP-AC-205", name: 'Rasulabad', state: 'Uttar Pradesh', district: 'Kanpur Dehat', acNo: 205 },
-  { id: "UP-AC-206", name: 'Akbarpur-Raniya', state: 'Uttar Pradesh', district: 'Kanpur Dehat', acNo: 206 },
-  { id: "UP-AC-207", name: 'Sikandra', state: 'Uttar Pradesh', district: 'Kanpur Dehat', acNo: 207 },
-  { id: "UP-AC-208", name: 'Bhognipur', state: 'Uttar Pradesh', district: 'Kanpur Dehat', acNo: 208 },
-  { id: "UP-AC-209", name: 'Bilhaur', state: 'Uttar Pradesh', district: 'Kanpur Nagar', acNo: 209 },
-  { id: "UP-AC-210", name: 'Bithoor', state: 'Uttar Pradesh', district: 'Kanpur Nagar', acNo: 210 },
-  { id: "UP-AC-211", name: 'Kalyanpur', state: 'Uttar Pradesh', district: 'Kanpur Nagar', acNo: 211 },
-  { id: "UP-AC-212", name: 'Govind Nagar', state: 'Uttar Pradesh', district: 'Kanpur Nagar', acNo: 212 },
-  { id: "UP-AC-213", name: 'Sishamau', state: 'Uttar Pradesh', district: 'Kanpur Nagar', acNo: 213 },
-  { id: "UP-AC-214", name: 'Arya Nagar', state: 'Uttar Pradesh', district: 'Kanpur Nagar', acNo: 214 },
-  { id: "UP-AC-215", name: 'Kidwai Nagar', state: 'Uttar Pradesh', district: 'Kanpur Nagar', acNo: 215 },
-  { id: "UP-AC-216", name: 'Kanpur Cantonment', state: 'Uttar Pradesh', district: 'Kanpur Nagar', acNo: 216 },
-  { id: "UP-AC-217", name: 'Maharajpur', state: 'Uttar Pradesh', district: 'Kanpur Nagar', acNo: 217 },
-  { id: "UP-AC-218", name: 'Ghatampur', state: 'Uttar Pradesh', district: 'Kanpur Nagar', acNo: 218 },
-  { id: "UP-AC-219", name: 'Madhogarh', state: 'Uttar Pradesh', district: 'Jalaun', acNo: 219 },
-  { id: "UP-AC-220", name: 'Kalpi', state: 'Uttar Pradesh', district: 'Jalaun', acNo: 220 },
-  { id: "UP-AC-221", name: 'Orai', state: 'Uttar Pradesh', district: 'Jalaun', acNo: 221 },
-  { id: "UP-AC-222", name: 'Babina', state: 'Uttar Pradesh', district: 'Jhansi', acNo: 222 },
-  { id: "UP-AC-223", name: 'Jhansi Nagar', state: 'Uttar Pradesh', district: 'Jhansi', acNo: 223 },
-  { id: "UP-AC-224", name: 'Mauranipur', state: 'Uttar Pradesh', district: 'Jhansi', acNo: 224 },
-  { id: "UP-AC-225", name: 'Garautha', state: 'Uttar Pradesh', district: 'Jhansi', acNo: 225 },
-  { id: "UP-AC-226", name: 'Lalitpur', state: 'Uttar Pradesh', district: 'Lalitpur', acNo: 226 },
-  { id: "UP-AC-227", name: 'Mehroni', state: 'Uttar Pradesh', district: 'Lalitpur', acNo: 227 },
-  { id: "UP-AC-228", name: 'Hamirpur', state: 'Uttar Pradesh', district: 'Hamirpur', acNo: 228 },
-  { id: "UP-AC-229", name: 'Rath', state: 'Uttar Pradesh', district: 'Hamirpur', acNo: 229 },
-  { id: "UP-AC-230", name: 'Mahoba', state: 'Uttar Pradesh', district: 'Mahoba', acNo: 230 },
-  { id: "UP-AC-231", name: 'Charkhari', state: 'Uttar Pradesh', district: 'Mahoba', acNo: 231 },
-  { id: "UP-AC-232", name: 'Tindwari', state: 'Uttar Pradesh', district: 'Banda', acNo: 232 },
-  { id: "UP-AC-233", name: 'Baberu', state: 'Uttar Pradesh', district: 'Banda', acNo: 233 },
-  { id: "UP-AC-234", name: 'Naraini', state: 'Uttar Pradesh', district: 'Banda', acNo: 234 },
-  { id: "UP-AC-235", name: 'Banda', state: 'Uttar Pradesh', district: 'Banda', acNo: 235 },
-  { id: "UP-AC-236", name: 'Chitrakoot', state: 'Uttar Pradesh', district: 'Chitrakoot', acNo: 236 },
-  { id: "UP-AC-237", name: 'Manikpur', state: 'Uttar Pradesh', district: 'Chitrakoot', acNo: 237 },
-  { id: "UP-AC-238", name: 'Jahanabad', state: 'Uttar Pradesh', district: 'Fatehpur', acNo: 238 },
-  { id: "UP-AC-239", name: 'Bindki', state: 'Uttar Pradesh', district: 'Fatehpur', acNo: 239 },
-  { id: "UP-AC-240", name: 'Fatehpur', state: 'Uttar Pradesh', district: 'Fatehpur', acNo: 240 },
-  { id: "UP-AC-241", name: 'Ayah Shah', state: 'Uttar Pradesh', district: 'Fatehpur', acNo: 241 },
-  { id: "UP-AC-242", name: 'Husainganj', state: 'Uttar Pradesh', district: 'Fatehpur', acNo: 242 },
-  { id: "UP-AC-243", name: 'Khaga', state: 'Uttar Pradesh', district: 'Fatehpur', acNo: 243 },
-  { id: "UP-AC-244", name: 'Rampur Khas', state: 'Uttar Pradesh', district: 'Pratapgarh', acNo: 244 },
-  { id: "UP-AC-245", name: 'Babaganj', state: 'Uttar Pradesh', district: 'Pratapgarh', acNo: 245 },
-  { id: "UP-AC-246", name: 'Kunda', state: 'Uttar Pradesh', district: 'Pratapgarh', acNo: 246 },
-  { id: "UP-AC-247", name: 'Vishwanathganj', state: 'Uttar Pradesh', district: 'Pratapgarh', acNo: 247 },
-  { id: "UP-AC-248", name: 'Pratapgarh', state: 'Uttar Pradesh', district: 'Pratapgarh', acNo: 248 },
-  { id: "UP-AC-249", name: 'Patti', state: 'Uttar Pradesh', district: 'Pratapgarh', acNo: 249 },
-  { id: "UP-AC-250", name: 'Raniganj', state: 'Uttar Pradesh', district: 'Pratapgarh', acNo: 250 },
-  { id: "UP-AC-251", name: 'Sirathu', state: 'Uttar Pradesh', district: 'Kaushambi', acNo: 251 },
-  { id: "UP-AC-252", name: 'Manjhanpur', state: 'Uttar Pradesh', district: 'Kaushambi', acNo: 252 },
-  { id: "UP-AC-253", name: 'Chail', state: 'Uttar Pradesh', district: 'Kaushambi', acNo: 253 },
-  { id: "UP-AC-254", name: 'Phaphamau', state: 'Uttar Pradesh', district: 'Prayagraj', acNo: 254 },
-  { id: "UP-AC-255", name: 'Soraon', state: 'Uttar Pradesh', district: 'Prayagraj', acNo: 255 },
-  { id: "UP-AC-256", name: 'Phulpur', state: 'Uttar Pradesh', district: 'Prayagraj', acNo: 256 },
-  { id: "UP-AC-257", name: 'Pratappur', state: 'Uttar Pradesh', district: 'Prayagraj', acNo: 257 },
-  { id: "UP-AC-258", name: 'Handia', state: 'Uttar Pradesh', district: 'Prayagraj', acNo: 258 },
-  { id: "UP-AC-259", name: 'Meja', state: 'Uttar Pradesh', district: 'Prayagraj', acNo: 259 },
-  { id: "UP-AC-260", name: 'Karachhana', state: 'Uttar Pradesh', district: 'Prayagraj', acNo: 260 },
-  { id: "UP-AC-261", name: 'Prayagraj West', state: 'Uttar Pradesh', district: 'Prayagraj', acNo: 261 },
-  { id: "UP-AC-262", name: 'Prayagraj North', state: 'Uttar Pradesh', district: 'Prayagraj', acNo: 262 },
-  { id: "UP-AC-263", name: 'Prayagraj South', state: 'Uttar Pradesh', district: 'Prayagraj', acNo: 263 },
-  { id: "UP-AC-264", name: 'Bara', state: 'Uttar Pradesh', district: 'Prayagraj', acNo: 264 },
-  { id: "UP-AC-265", name: 'Koraon', state: 'Uttar Pradesh', district: 'Prayagraj', acNo: 265 },
-  { id: "UP-AC-266", name: 'Kursi', state: 'Uttar Pradesh', district: 'Barabanki', acNo: 266 },
-  { id: "UP-AC-267", name: 'Ram Nagar', state: 'Uttar Pradesh', district: 'Barabanki', acNo: 267 },
-  { id: "UP-AC-268", name: 'Barabanki', state: 'Uttar Pradesh', district: 'Barabanki', acNo: 268 },
-  { id: "UP-AC-269", name: 'Zaidpur', state: 'Uttar Pradesh', district: 'Barabanki', acNo: 269 },
-  { id: "UP-AC-270", name: 'Dariyabad', state: 'Uttar Pradesh', district: 'Barabanki', acNo: 270 },
-  { id: "UP-AC-271", name: 'Rudauli', state: 'Uttar Pradesh', district: 'Ayodhya', acNo: 271 },
-  { id: "UP-AC-272", name: 'Haidergarh', state: 'Uttar Pradesh', district: 'Barabanki', acNo: 272 },
-  { id: "UP-AC-273", name: 'Milkipur', state: 'Uttar Pradesh', district: 'Ayodhya', acNo: 273 },
-  { id: "UP-AC-274", name: 'Bikapur', state: 'Uttar Pradesh', district: 'Ayodhya', acNo: 274 },
-  { id: "UP-AC-275", name: 'Ayodhya', state: 'Uttar Pradesh', district: 'Ayodhya', acNo: 275 },
-  { id: "UP-AC-276", name: 'Goshainganj', state: 'Uttar Pradesh', district: 'Ayodhya', acNo: 276 },
-  { id: "UP-AC-277", name: 'Katehari', state: 'Uttar Pradesh', district: 'Ambedkar Nagar', acNo: 277 },
-  { id: "UP-AC-278", name: 'Tanda', state: 'Uttar Pradesh', district: 'Ambedkar Nagar', acNo: 278 },
-  { id: "UP-AC-279", name: 'Alapur', state: 'Uttar Pradesh', district: 'Ambedkar Nagar', acNo: 279 },
-  { id: "UP-AC-280", name: 'Jalalpur', state: 'Uttar Pradesh', district: 'Ambedkar Nagar', acNo: 280 },
-  { id: "UP-AC-281", name: 'Akbarpur', state: 'Uttar Pradesh', district: 'Ambedkar Nagar', acNo: 281 },
-  { id: "UP-AC-282", name: 'Balha', state: 'Uttar Pradesh', district: 'Bahraich', acNo: 282 },
-  { id: "UP-AC-283", name: 'Nanpara', state: 'Uttar Pradesh', district: 'Bahraich', acNo: 283 },
-  { id: "UP-AC-284", name: 'Matera', state: 'Uttar Pradesh', district: 'Bahraich', acNo: 284 },
-  { id: "UP-AC-285", name: 'Mahasi', state: 'Uttar Pradesh', district: 'Bahraich', acNo: 285 },
-  { id: "UP-AC-286", name: 'Bahraich', state: 'Uttar Pradesh', district: 'Bahraich', acNo: 286 },
-  { id: "UP-AC-287", name: 'Payagpur', state: 'Uttar Pradesh', district: 'Bahraich', acNo: 287 },
-  { id: "UP-AC-288", name: 'Kaiserganj', state: 'Uttar Pradesh', district: 'Bahraich', acNo: 288 },
-  { id: "UP-AC-289", name: 'Bhinga', state: 'Uttar Pradesh', district: 'Shrawasti', acNo: 289 },
-  { id: "UP-AC-290", name: 'Shrawasti', state: 'Uttar Pradesh', district: 'Shrawasti', acNo: 290 },
-  { id: "UP-AC-291", name: 'Tulsipur', state: 'Uttar Pradesh', district: 'Balrampur', acNo: 291 },
-  { id: "UP-AC-292", name: 'Gainsari', state: 'Uttar Pradesh', district: 'Balrampur', acNo: 292 },
-  { id: "UP-AC-293", name: 'Utraula', state: 'Uttar Pradesh', district: 'Balrampur', acNo: 293 },
-  { id: "UP-AC-294", name: 'Balrampur', state: 'Uttar Pradesh', district: 'Balrampur', acNo: 294 },
-  { id: "UP-AC-295", name: 'Mehnaun', state: 'Uttar Pradesh', district: 'Gonda', acNo: 295 },
-  { id: "UP-AC-296", name: 'Gonda', state: 'Uttar Pradesh', district: 'Gonda', acNo: 296 },
-  { id: "UP-AC-297", name: 'Katra Bazar', state: 'Uttar Pradesh', district: 'Gonda', acNo: 297 },
-  { id: "UP-AC-298", name: 'Colonelganj', state: 'Uttar Pradesh', district: 'Gonda', acNo: 298 },
-  { id: "UP-AC-299", name: 'Tarabganj', state: 'Uttar Pradesh', district: 'Gonda', acNo: 299 },
-  { id: "UP-AC-300", name: 'Mankapur', state: 'Uttar Pradesh', district: 'Gonda', acNo: 300 },
-  { id: "UP-AC-301", name: 'Gaura', state: 'Uttar Pradesh', district: 'Gonda', acNo: 301 },
-  { id: "UP-AC-302", name: 'Shohratgarh', state: 'Uttar Pradesh', district: 'Siddharthnagar', acNo: 302 },
-  { id: "UP-AC-303", name: 'Kapilvastu', state: 'Uttar Pradesh', district: 'Siddharthnagar', acNo: 303 },
-  { id: "UP-AC-304", name: 'Bansi', state: 'Uttar Pradesh', district: 'Siddharthnagar', acNo: 304 },
-  { id: "UP-AC-305", name: 'Itwa', state: 'Uttar Pradesh', district: 'Siddharthnagar', acNo: 305 },
-  { id: "UP-AC-306", name: 'Domariyaganj', state: 'Uttar Pradesh', district: 'Siddharthnagar', acNo: 306 },
-  { id: "UP-AC-307", name: 'Harraiya', state: 'Uttar Pradesh', district: 'Basti', acNo: 307 },
-  { id: "UP-AC-308", name: 'Kaptanganj', state: 'Uttar Pradesh', district: 'Basti', acNo: 308 },
-  { id: "UP-AC-309", name: 'Rudhauli', state: 'Uttar Pradesh', district: 'Basti', acNo: 309 },
-  { id: "UP-AC-310", name: 'Basti Sadar', state: 'Uttar Pradesh', district: 'Basti', acNo: 310 },
-  { id: "UP-AC-311", name: 'Mahadewa', state: 'Uttar Pradesh', district: 'Basti', acNo: 311 },
-  { id: "UP-AC-312", name: 'Menhdawal', state: 'Uttar Pradesh', district: 'Sant Kabir Nagar', acNo: 312 },
-  { id: "UP-AC-313", name: 'Khalilabad', state: 'Uttar Pradesh', district: 'Sant Kabir Nagar', acNo: 313 },
-  { id: "UP-AC-314", name: 'Dhanghata', state: 'Uttar Pradesh', district: 'Sant Kabir Nagar', acNo: 314 },
-  { id: "UP-AC-315", name: 'Pharenda', state: 'Uttar Pradesh', district: 'Maharajganj', acNo: 315 },
-  { id: "UP-AC-316", name: 'Nautanwa', state: 'Uttar Pradesh', district: 'Maharajganj', acNo: 316 },
-  { id: "UP-AC-317", name: 'Siswa', state: 'Uttar Pradesh', district: 'Maharajganj', acNo: 317 },
-  { id: "UP-AC-318", name: 'Maharajganj', state: 'Uttar Pradesh', district: 'Maharajganj', acNo: 318 },
-  { id: "UP-AC-319", name: 'Paniyara', state: 'Uttar Pradesh', district: 'Maharajganj', acNo: 319 },
-  { id: "UP-AC-320", name: 'Caimpiyarganj', state: 'Uttar Pradesh', district: 'Gorakhpur', acNo: 320 },
-  { id: "UP-AC-321", name: 'Pipraich', state: 'Uttar Pradesh', district: 'Gorakhpur', acNo: 321 },
-  { id: "UP-AC-322", name: 'Gorakhpur Urban', state: 'Uttar Pradesh', district: 'Gorakhpur', acNo: 322 },
-  { id: "UP-AC-323", name: 'Gorakhpur Rural', state: 'Uttar Pradesh', district: 'Gorakhpur', acNo: 323 },
-  { id: "UP-AC-324", name: 'Sahajanwa', state: 'Uttar Pradesh', district: 'Gorakhpur', acNo: 324 },
-  { id: "UP-AC-325", name: 'Khajani', state: 'Uttar Pradesh', district: 'Gorakhpur', acNo: 325 },
-  { id: "UP-AC-326", name: 'Chauri-Chaura', state: 'Uttar Pradesh', district: 'Gorakhpur', acNo: 326 },
-  { id: "UP-AC-327", name: 'Bansgaon', state: 'Uttar Pradesh', district: 'Gorakhpur', acNo: 327 },
-  { id: "UP-AC-328", name: 'Chillupar', state: 'Uttar Pradesh', district: 'Gorakhpur', acNo: 328 },
-  { id: "UP-AC-329", name: 'Khadda', state: 'Uttar Pradesh', district: 'Kushinagar', acNo: 329 },
-  { id: "UP-AC-330", name: 'Padrauna', state: 'Uttar Pradesh', district: 'Kushinagar', acNo: 330 },
-  { id: "UP-AC-331", name: 'Tamkuhi Raj', state: 'Uttar Pradesh', district: 'Kushinagar', acNo: 331 },
-  { id: "UP-AC-332", name: 'Fazilnagar', state: 'Uttar Pradesh', district: 'Kushinagar', acNo: 332 },
-  { id: "UP-AC-333", name: 'Kushinagar', state: 'Uttar Pradesh', district: 'Kushinagar', acNo: 333 },
-  { id: "UP-AC-334", name: 'Hata', state: 'Uttar Pradesh', district: 'Kushinagar', acNo: 334 },
-  { id: "UP-AC-335", name: 'Ramkola', state: 'Uttar Pradesh', district: 'Kushinagar', acNo: 335 },
-  { id: "UP-AC-336", name: 'Rudrapur', state: 'Uttar Pradesh', district: 'Deoria', acNo: 336 },
-  { id: "UP-AC-337", name: 'Deoria', state: 'Uttar Pradesh', district: 'Deoria', acNo: 337 },
-  { id: "UP-AC-338", name: 'Pathardeva', state: 'Uttar Pradesh', district: 'Deoria', acNo: 338 },
-  { id: "UP-AC-339", name: 'Rampur Karkhana', state: 'Uttar Pradesh', district: 'Deoria', acNo: 339 },
-  { id: "UP-AC-340", name: 'Bhatpar Rani', state: 'Uttar Pradesh', district: 'Deoria', acNo: 340 },
-  { id: "UP-AC-341", name: 'Salempur', state: 'Uttar Pradesh', district: 'Deoria', acNo: 341 },
-  { id: "UP-AC-342", name: 'Barhaj', state: 'Uttar Pradesh', district: 'Deoria', acNo: 342 },
-  { id: "UP-AC-343", name: 'Atrauliya', state: 'Uttar Pradesh', district: 'Azamgarh', acNo: 343 },
-  { id: "UP-AC-344", name: 'Gopalpur', state: 'Uttar Pradesh', district: 'Azamgarh', acNo: 344 },
-  { id: "UP-AC-345", name: 'Sagri', state: 'Uttar Pradesh', district: 'Azamgarh', acNo: 345 },
-  { id: "UP-AC-346", name: 'Mubarakpur', state: 'Uttar Pradesh', district: 'Azamgarh', acNo: 346 },
-  { id: "UP-AC-347", name: 'Azamgarh', state: 'Uttar Pradesh', district: 'Azamgarh', acNo: 347 },
-  { id: "UP-AC-348", name: 'Nizamabad', state: 'Uttar Pradesh', district: 'Azamgarh', acNo: 348 },
-  { id: "UP-AC-349", name: 'Phoolpur Pawai', state: 'Uttar Pradesh', district: 'Azamgarh', acNo: 349 },
-  { id: "UP-AC-350", name: 'Didarganj', state: 'Uttar Pradesh', district: 'Azamgarh', acNo: 350 },
-  { id: "UP-AC-351", name: 'Lalganj', state: 'Uttar Pradesh', district: 'Azamgarh', acNo: 351 },
-  { id: "UP-AC-352", name: 'Mehnagar', state: 'Uttar Pradesh', district: 'Azamgarh', acNo: 352 },
-  { id: "UP-AC-353", name: 'Madhuban', state: 'Uttar Pradesh', district: 'Mau', acNo: 353 },
-  { id: "UP-AC-354", name: 'Ghosi', state: 'Uttar Pradesh', district: 'Mau', acNo: 354 },
-  { id: "UP-AC-355", name: 'Muhammadabad-Gohna', state: 'Uttar Pradesh', district: 'Mau', acNo: 355 },
-  { id: "UP-AC-356", name: 'Mau', state: 'Uttar Pradesh', district: 'Mau', acNo: 356 },
-  { id: "UP-AC-357", name: 'Belthara Road', state: 'Uttar Pradesh', district: 'Ballia', acNo: 357 },
-  { id: "UP-AC-358", name: 'Rasara', state: 'Uttar Pradesh', district: 'Ballia', acNo: 358 },
-  { id: "UP-AC-359", name: 'Sikanderpur', state: 'Uttar Pradesh', district: 'Ballia', acNo: 359 },
-  { id: "UP-AC-360", name: 'Phephana', state: 'Uttar Pradesh', district: 'Ballia', acNo: 360 },
-  { id: "UP-AC-361", name: 'Ballia Nagar', state: 'Uttar Pradesh', district: 'Ballia', acNo: 361 },
-  { id: "UP-AC-362", name: 'Bansdih', state: 'Uttar Pradesh', district: 'Ballia', acNo: 362 },
-  { id: "UP-AC-363", name: 'Bairia', state: 'Uttar Pradesh', district: 'Ballia', acNo: 363 },
-  { id: "UP-AC-364", name: 'Badlapur', state: 'Uttar Pradesh', district: 'Jaunpur', acNo: 364 },
-  { id: "UP-AC-365", name: 'Shahganj', state: 'Uttar Pradesh', district: 'Jaunpur', acNo: 365 },
-  { id: "UP-AC-366", name: 'Jaunpur', state: 'Uttar Pradesh', district: 'Jaunpur', acNo: 366 },
-  { id: "UP-AC-367", name: 'Malhani', state: 'Uttar Pradesh', district: 'Jaunpur', acNo: 367 },
-  { id: "UP-AC-368", name: 'Mungra Badshahpur', state: 'Uttar Pradesh', district: 'Jaunpur', acNo: 368 },
-  { id: "UP-AC-369", name: 'Machhlishahr', state: 'Uttar Pradesh', district: 'Jaunpur', acNo: 369 },
-  { id: "UP-AC-370", name: 'Mariyahu', state: 'Uttar Pradesh', district: 'Jaunpur', acNo: 370 },
-  { id: "UP-AC-371", name: 'Zafrabad', state: 'Uttar Pradesh', district: 'Jaunpur', acNo: 371 },
-  { id: "UP-AC-372", name: 'Kerakat', state: 'Uttar Pradesh', district: 'Jaunpur', acNo: 372 },
-  { id: "UP-AC-373", name: 'Jakhanian', state: 'Uttar Pradesh', district: 'Ghazipur', acNo: 373 },
-  { id: "UP-AC-374", name: 'Saidpur', state: 'Uttar Pradesh', district: 'Ghazipur', acNo: 374 },
-  { id: "UP-AC-375", name: 'Ghazipur Sadar', state: 'Uttar Pradesh', district: 'Ghazipur', acNo: 375 },
-  { id: "UP-AC-376", name: 'Jangipur', state: 'Uttar Pradesh', district: 'Ghazipur', acNo: 376 },
-  { id: "UP-AC-377", name: 'Zahoorabad', state: 'Uttar Pradesh', district: 'Ghazipur', acNo: 377 },
-  { id: "UP-AC-378", name: 'Mohammadabad', state: 'Uttar Pradesh', district: 'Ghazipur', acNo: 378 },
-  { id: "UP-AC-379", name: 'Zamania', state: 'Uttar Pradesh', district: 'Ghazipur', acNo: 379 },
-  { id: "UP-AC-380", name: 'Mughalsarai', state: 'Uttar Pradesh', district: 'Chandauli', acNo: 380 },
-  { id: "UP-AC-381", name: 'Sakaldiha', state: 'Uttar Pradesh', district: 'Chandauli', acNo: 381 },
-  { id: "UP-AC-382", name: 'Saiyadraja', state: 'Uttar Pradesh', district: 'Chandauli', acNo: 382 },
-  { id: "UP-AC-383", name: 'Chakia', state: 'Uttar Pradesh', district: 'Chandauli', acNo: 383 },
-  { id: "UP-AC-384", name: 'Pindra', state: 'Uttar Pradesh', district: 'Varanasi', acNo: 384 },
-  { id: "UP-AC-385", name: 'Ajagara', state: 'Uttar Pradesh', district: 'Varanasi', acNo: 385 },
-  { id: "UP-AC-386", name: 'Shivpur', state: 'Uttar Pradesh', district: 'Varanasi', acNo: 386 },
-  { id: "UP-AC-387", name: 'Rohaniya', state: 'Uttar Pradesh', district: 'Varanasi', acNo: 387 },
-  { id: "UP-AC-388", name: 'Varanasi North', state: 'Uttar Pradesh', district: 'Varanasi', acNo: 388 },
-  { id: "UP-AC-389", name: 'Varanasi South', state: 'Uttar Pradesh', district: 'Varanasi', acNo: 389 },
-  { id: "UP-AC-390", name: 'Varanasi Cantt.', state: 'Uttar Pradesh', district: 'Varanasi', acNo: 390 },
-  { id: "UP-AC-391", name: 'Sevapuri', state: 'Uttar Pradesh', district: 'Varanasi', acNo: 391 },
-  { id: "UP-AC-392", name: 'Bhadohi', state: 'Uttar Pradesh', district: 'Bhadohi', acNo: 392 },
-  { id: "UP-AC-393", name: 'Gyanpur', state: 'Uttar Pradesh', district: 'Bhadohi', acNo: 393 },
-  { id: "UP-AC-394", name: 'Aurai', state: 'Uttar Pradesh', district: 'Bhadohi', acNo: 394 },
-  { id: "UP-AC-395", name: 'Chhanbey', state: 'Uttar Pradesh', district: 'Mirzapur', acNo: 395 },
-  { id: "UP-AC-396", name: 'Mirzapur', state: 'Uttar Pradesh', district: 'Mirzapur', acNo: 396 },
-  { id: "UP-AC-397", name: 'Majhawan', state: 'Uttar Pradesh', district: 'Mirzapur', acNo: 397 },
-  { id: "UP-AC-398", name: 'Chunar', state: 'Uttar Pradesh', district: 'Mirzapur', acNo: 398 },
-  { id: "UP-AC-399", name: 'Marihan', state: 'Uttar Pradesh', district: 'Mirzapur', acNo: 399 },
-  { id: "UP-AC-400", name: 'Ghorawal', state: 'Uttar Pradesh', district: 'Sonbhadra', acNo: 400 },
-  { id: "UP-AC-401", name: 'Robertsganj', state: 'Uttar Pradesh', district: 'Sonbhadra', acNo: 401 },
-  { id: "UP-AC-402", name: 'Obra', state: 'Uttar Pradesh', district: 'Sonbhadra', acNo: 402 },
-  { id: "UP-AC-403", name: 'Duddhi', state: 'Uttar Pradesh', district: 'Sonbhadra', acNo: 403 },
+  'Behat',1151,'Nakur',1151,'Saharanpur Nagar',1151,'Saharanpur',1151,'Deoband',1151,'Rampur Maniharan',1151,
+  'Gangoh',1151,'Kairana',1182,'Thana Bhawan',1182,'Shamli',1182,'Budhana',1034,'Charthawal',1034,
+  'Purqazi',1034,'Muzaffarnagar',1034,'Khatauli',1034,'Meerapur',1034,'Najibabad',692,'Nagina',692,
+  'Barhapur',692,'Dhampur',692,'Nehtaur',692,'Bijnor',692,'Chandpur',692,'Noorpur',692,
+  'Kanth',1025,'Thakurdwara',1025,'Moradabad Rural',1025,'Moradabad Nagar',1025,'Kundarki',1025,'Bilari',1025,
+  'Chandausi',1161,'Asmoli',1161,'Sambhal',1161,'Suar',1135,'Chamraua',1135,'Bilaspur',1135,
+  'Rampur',1135,'Milak',1135,'Dhanaura',625,'Naugawan Sadat',625,'Amroha',625,'Hasanpur',625,
+  'Siwalkhas',1019,'Sardhana',1019,'Hastinapur',1019,'Kithore',1019,'Meerut Cantt.',1019,'Meerut',1019,
+  'Meerut South',1019,'Chhaprauli',643,'Baraut',643,'Bagpat',643,'Loni',811,'Muradnagar',811,
+  'Sahibabad',811,'Ghaziabad',811,'Modinagar',811,'Dhaulana',834,'Hapur',834,'Garhmukteshwar',834,
+  'Noida',809,'Dadri',809,'Jewar',809,'Sikandrabad',704,'Bulandshahr',704,'Syana',704,
+  'Anupshahr',704,'Debai',704,'Shikarpur',704,'Khurja',704,'Khair',614,'Barauli',614,
+  'Atrauli',614,'Chharra',614,'Koil',614,'Aligarh',614,'Iglas',614,'Hathras',837,
+  'Sadabad',837,'Sikandra Rao',837,'Chhata',1012,'Mant',1012,'Goverdhan',1012,'Mathura',1012,
+  'Baldev',1012,'Etmadpur',607,'Agra Cantt.',607,'Agra South',607,'Agra North',607,'Agra Rural',607,
+  'Fatehpur Sikri',607,'Kheragarh',607,'Fatehabad',607,'Bah',607,'Tundla',796,'Jasrana',796,
+  'Firozabad',796,'Shikohabad',796,'Sirsaganj',796,'Kasganj',915,'Amanpur',915,'Patiyali',915,
+  'Aliganj',787,'Etah',787,'Marhara',787,'Jalesar',787,'Mainpuri',997,'Bhongaon',997,
+  'Kishni',997,'Karhal',997,'Gunnaur',1161,'Bisauli',701,'Sahaswan',701,'Bilsi',701,
+  'Badaun',701,'Shekhupur',701,'Dataganj',701,'Baheri',664,'Meerganj',664,'Bhojipura',664,
+  'Nawabganj',664,'Faridpur',664,'Bithari Chainpur',664,'Bareilly',664,'Bareilly Cantt.',664,'Aonla',664,
+  'Pilibhit',1107,'Barkhera',1107,'Puranpur',1107,'Bisalpur',1107,'Katra',1178,'Jalalabad',1178,
+  'Tilhar',1178,'Powayan',1178,'Shahjahanpur',1178,'Dadraul',1178,'Palia',967,'Nighasan',967,
+  'Gola Gokrannath',967,'Sri Nagar',967,'Dhaurahra',967,'Lakhimpur',967,'Kasta',967,'Mohammdi',967,
+  'Maholi',1205,'Sitapur',1205,'Hargaon',1205,'Laharpur',1205,'Biswan',1205,'Sevata',1205,
+  'Mahmoodabad',1205,'Sidhauli',1205,'Misrikh',1205,'Sawayazpur',836,'Shahabad',836,'Hardoi',836,
+  'Gopamau',836,'Sandi',836,'Bilgram-Mallanwan',836,'Balamau',836,'Sandila',836,'Bangarmau',1271,
+  'Safipur',1271,'Mohan',1271,'Unnao',1271,'Bhagwantnagar',1271,'Purwa',1271,'Malihabad',981,
+  'Bakshi Kaa Talab',981,'Sarojini Nagar',981,'Lucknow West',981,'Lucknow North',981,'Lucknow East',981,'Lucknow Central',981,
+  'Lucknow Cantonment',981,'Mohanlalganj',981,'Bachhrawan',1121,'Tiloi',621,'Harchandpur',1121,'Rae Bareli',1121,
+  'Salon',621,'Sareni',621,'Unchahar',621,'Jagdishpur',621,'Gauriganj',621,'Amethi',621,
+  'Isauli',1229,'Sultanpur',1229,'Sadar',1229,'Lambhua',1229,'Kadipur',1229,'Kaimganj',791,
+  'Amritpur',791,'Farrukhabad',791,'Bhojpur',791,'Chhibramau',901,'Tirwa',901,'Kannauj',901,
+  'Jaswantnagar',788,'Etawah',788,'Bharthana',788,'Bidhuna',639,'Dibiyapur',639,'Auraiya',639,
+  'Rasulabad',904,'Akbarpur-Raniya',904,'Sikandra',904,'Bhognipur',904,'Bilhaur',905,'Bithoor',905,
+  'Kalyanpur',905,'Govind Nagar',905,'Sishamau',905,'Arya Nagar',905,'Kidwai Nagar',905,'Kanpur Cantonment',905,
+  'Maharajpur',905,'Ghatampur',905,'Madhogarh',858,'Kalpi',858,'Orai',858,'Babina',876,
+  'Jhansi Nagar',876,'Mauranipur',876,'Garautha',876,'Lalitpur',969,'Mehroni',969,'Hamirpur',831,
+  'Rath',831,'Mahoba',996,'Charkhari',996,'Tindwari',655,'Baberu',655,'Naraini',655,
+  'Banda',655,'Chitrakoot',726,'Manikpur',726,'Jahanabad',794,'Bindki',794,'Fatehpur',794,
+  'Ayah Shah',794,'Husainganj',794,'Khaga',794,'Rampur Khas',1112,'Babaganj',1112,'Kunda',1112,
+  'Vishwanathganj',1112,'Pratapgarh',1112,'Patti',1112,'Raniganj',1112,'Sirathu',919,'Manjhanpur',919,
+  'Chail',919,'Phaphamau',1113,'Soraon',1113,'Phulpur',1113,'Pratappur',1113,'Handia',1113,
+  'Meja',1113,'Karachhana',1113,'Prayagraj West',1113,'Prayagraj North',1113,'Prayagraj South',1113,'Bara',1113,
+  'Koraon',1113,'Kursi',661,'Ram Nagar',661,'Barabanki',661,'Zaidpur',661,'Dariyabad',661,
+  'Rudauli',641,'Haidergarh',661,'Milkipur',641,'Bikapur',641,'Ayodhya',641,'Goshainganj',641,
+  'Katehari',620,'Tanda',620,'Alapur',620,'Jalalpur',620,'Akbarpur',620,'Balha',644,
+  'Nanpara',644,'Matera',644,'Mahasi',644,'Bahraich',644,'Payagpur',644,'Kaiserganj',644,
+  'Bhinga',1190,'Shrawasti',1190,'Tulsipur',653,'Gainsari',653,'Utraula',653,'Balrampur',653,
+  'Mehnaun',819,'Gonda',819,'Katra Bazar',819,'Colonelganj',819,'Tarabganj',819,'Mankapur',819,
+  'Gaura',819,'Shohratgarh',1193,'Kapilvastu',1193,'Bansi',1193,'Itwa',1193,'Domariyaganj',1193,
+  'Harraiya',671,'Kaptanganj',671,'Rudhauli',671,'Basti Sadar',671,'Mahadewa',671,'Menhdawal',1166,
+  'Khalilabad',1166,'Dhanghata',1166,'Pharenda',988,'Nautanwa',988,'Siswa',988,'Maharajganj',988,
+  'Paniyara',988,'Caimpiyarganj',822,'Pipraich',822,'Gorakhpur Urban',822,'Gorakhpur Rural',822,'Sahajanwa',822,
+  'Khajani',822,'Chauri-Chaura',822,'Bansgaon',822,'Chillupar',822,'Khadda',964,'Padrauna',964,
+  'Tamkuhi Raj',964,'Fazilnagar',964,'Kushinagar',964,'Hata',964,'Ramkola',964,'Rudrapur',749,
+  'Deoria',749,'Pathardeva',749,'Rampur Karkhana',749,'Bhatpar Rani',749,'Salempur',749,'Barhaj',749,
+  'Atrauliya',642,'Gopalpur',642,'Sagri',642,'Mubarakpur',642,'Azamgarh',642,'Nizamabad',642,
+  'Phoolpur Pawai',642,'Didarganj',642,'Lalganj',642,'Mehnagar',642,'Madhuban',1013,'Ghosi',1013,
+  'Muhammadabad-Gohna',1013,'Mau',1013,'Belthara Road',649,'Rasara',649,'Sikanderpur',649,'Phephana',649,
+  'Ballia Nagar',649,'Bansdih',649,'Bairia',649,'Badlapur',870,'Shahganj',870,'Jaunpur',870,
+  'Malhani',870,'Mungra Badshahpur',870,'Machhlishahr',870,'Mariyahu',870,'Zafrabad',870,'Kerakat',870,
+  'Jakhanian',812,'Saidpur',812,'Ghazipur Sadar',812,'Jangipur',812,'Zahoorabad',812,'Mohammadabad',812,
+  'Zamania',812,'Mughalsarai',713,'Sakaldiha',713,'Saiyadraja',713,'Chakia',713,'Pindra',1278,
+  'Ajagara',1278,'Shivpur',1278,'Rohaniya',1278,'Varanasi North',1278,'Varanasi South',1278,'Varanasi Cantt.',1278,
+  'Sevapuri',1278,'Bhadohi',678,'Gyanpur',678,'Aurai',678,'Chhanbey',1020,'Mirzapur',1020,
+  'Majhawan',1020,'Chunar',1020,'Marihan',1020,'Ghorawal',1210,'Robertsganj',1210,'Obra',1210,
+  'Duddhi',1210,
   // Uttarakhand (70)
-  { id: "UK-AC-001", name: 'Purola', state: 'Uttarakhand', acNo: 1 },
-  { id: "UK-AC-002", name: 'Yamunotri', state: 'Uttarakhand', acNo: 2 },
-  { id: "UK-AC-003", name: 'Gangotri', state: 'Uttarakhand', acNo: 3 },
-  { id: "UK-AC-004", name: 'Badrinath', state: 'Uttarakhand', acNo: 4 },
-  { id: "UK-AC-005", name: 'Tharali', state: 'Uttarakhand', acNo: 5 },
-  { id: "UK-AC-006", name: 'Karnaprayag', state: 'Uttarakhand', acNo: 6 },
-  { id: "UK-AC-007", name: 'Kedarnath', state: 'Uttarakhand', acNo: 7 },
-  { id: "UK-AC-008", name: 'Rudraprayag', state: 'Uttarakhand', acNo: 8 },
-  { id: "UK-AC-009", name: 'Ghansali', state: 'Uttarakhand', acNo: 9 },
-  { id: "UK-AC-010", name: 'Devprayag', state: 'Uttarakhand', acNo: 10 },
-  { id: "UK-AC-011", name: 'Narendranagar', state: 'Uttarakhand', acNo: 11 },
-  { id: "UK-AC-012", name: 'Pratapnagar', state: 'Uttarakhand', acNo: 12 },
-  { id: "UK-AC-013", name: 'Tehri', state: 'Uttarakhand', acNo: 13 },
-  { id: "UK-AC-014", name: 'Dhanaulti', state: 'Uttarakhand', acNo: 14 },
-  { id: "UK-AC-015", name: 'Chakrata', state: 'Uttarakhand', acNo: 15 },
-  { id: "UK-AC-016", name: 'Vikasnagar', state: 'Uttarakhand', acNo: 16 },
-  { id: "UK-AC-017", name: 'Sahaspur', state: 'Uttarakhand', acNo: 17 },
-  { id: "UK-AC-018", name: 'Dharampur', state: 'Uttarakhand', acNo: 18 },
-  { id: "UK-AC-019", name: 'Raipur', state: 'Uttarakhand', acNo: 19 },
-  { id: "UK-AC-020", name: 'Rajpur Road', state: 'Uttarakhand', acNo: 20 },
-  { id: "UK-AC-021", name: 'Dehradun Cantonment', state: 'Uttarakhand', acNo: 21 },
-  { id: "UK-AC-022", name: 'Mussoorie', state: 'Uttarakhand', acNo: 22 },
-  { id: "UK-AC-023", name: 'Doiwala', state: 'Uttarakhand', acNo: 23 },
-  { id: "UK-AC-024", name: 'Rishikesh', state: 'Uttarakhand', acNo: 24 },
-  { id: "UK-AC-025", name: 'Haridwar', state: 'Uttarakhand', acNo: 25 },
-  { id: "UK-AC-026", name: 'BHEL Ranipur', state: 'Uttarakhand', acNo: 26 },
-  { id: "UK-AC-027", name: 'Jwalapur', state: 'Uttarakhand', acNo: 27 },
-  { id: "UK-AC-028", name: 'Bhagwanpur', state: 'Uttarakhand', acNo: 28 },
-  { id: "UK-AC-029", name: 'Jhabrera', state: 'Uttarakhand', acNo: 29 },
-  { id: "UK-AC-030", name: 'Piran Kaliyar', state: 'Uttarakhand', acNo: 30 },
-  { id: "UK-AC-031", name: 'Roorkee', state: 'Uttarakhand', acNo: 31 },
-  { id: "UK-AC-032", name: 'Khanpur', state: 'Uttarakhand', acNo: 32 },
-  { id: "UK-AC-033", name: 'Manglaur', state: 'Uttarakhand', acNo: 33 },
-  { id: "UK-AC-034", name: 'Laksar', state: 'Uttarakhand', acNo: 34 },
-  { id: "UK-AC-035", name: 'Haridwar Rural', state: 'Uttarakhand', acNo: 35 },
-  { id: "UK-AC-036", name: 'Yamkeshwar', state: 'Uttarakhand', acNo: 36 },
-  { id: "UK-AC-037", name: 'Pauri', state: 'Uttarakhand', acNo: 37 },
-  { id: "UK-AC-038", name: 'Srinagar', state: 'Uttarakhand', acNo: 38 },
-  { id: "UK-AC-039", name: 'Chaubattakhal', state: 'Uttarakhand', acNo: 39 },
-  { id: "UK-AC-040", name: 'Lansdowne', state: 'Uttarakhand', acNo: 40 },
-  { id: "UK-AC-041", name: 'Kotdwar', state: 'Uttarakhand', acNo: 41 },
-  { id: "UK-AC-042", name: 'Dharchula', state: 'Uttarakhand', acNo: 42 },
-  { id: "UK-AC-043", name: 'Didihat', state: 'Uttarakhand', acNo: 43 },
-  { id: "UK-AC-044", name: 'Pithoragarh', state: 'Uttarakhand', acNo: 44 },
-  { id: "UK-AC-045", name: 'Gangolihat', state: 'Uttarakhand', acNo: 45 },
-  { id: "UK-AC-046", name: 'Kapkot', state: 'Uttarakhand', acNo: 46 },
-  { id: "UK-AC-047", name: 'Bageshwar', state: 'Uttarakhand', acNo: 47 },
-  { id: "UK-AC-048", name: 'Dwarahat', state: 'Uttarakhand', acNo: 48 },
-  { id: "UK-AC-049", name: 'Salt', state: 'Uttarakhand', acNo: 49 },
-  { id: "UK-AC-050", name: 'Ranikhet', state: 'Uttarakhand', acNo: 50 },
-  { id: "UK-AC-051", name: 'Someshwar', state: 'Uttarakhand', acNo: 51 },
-  { id: "UK-AC-052", name: 'Almora', state: 'Uttarakhand', acNo: 52 },
-  { id: "UK-AC-053", name: 'Jageshwar', state: 'Uttarakhand', acNo: 53 },
-  { id: "UK-AC-054", name: 'Lohaghat', state: 'Uttarakhand', acNo: 54 },
-  { id: "UK-AC-055", name: 'Champawat', state: 'Uttarakhand', acNo: 55 },
-  { id: "UK-AC-056", name: 'Lalkuan', state: 'Uttarakhand', acNo: 56 },
-  { id: "UK-AC-057", name: 'Bhimtal', state: 'Uttarakhand', acNo: 57 },
-  { id: "UK-AC-058", name: 'Nainital', state: 'Uttarakhand', acNo: 58 },
-  { id: "UK-AC-059", name: 'Haldwani', state: 'Uttarakhand', acNo: 59 },
-  { id: "UK-AC-060", name: 'Kaladhungi', state: 'Uttarakhand', acNo: 60 },
-  { id: "UK-AC-061", name: 'Ramnagar', state: 'Uttarakhand', acNo: 61 },
-  { id: "UK-AC-062", name: 'Jaspur', state: 'Uttarakhand', acNo: 62 },
-  { id: "UK-AC-063", name: 'Kashipur', state: 'Uttarakhand', acNo: 63 },
-  { id: "UK-AC-064", name: 'Bajpur', state: 'Uttarakhand', acNo: 64 },
-  { id: "UK-AC-065", name: 'Gadarpur', state: 'Uttarakhand', acNo: 65 },
-  { id: "UK-AC-066", name: 'Rudrapur', state: 'Uttarakhand', acNo: 66 },
-  { id: "UK-AC-067", name: 'Kichha', state: 'Uttarakhand', acNo: 67 },
-  { id: "UK-AC-068", name: 'Sitarganj', state: 'Uttarakhand', acNo: 68 },
-  { id: "UK-AC-069", name: 'Nanakmatta', state: 'Uttarakhand', acNo: 69 },
-  { id: "UK-AC-070", name: 'Khatima', state: 'Uttarakhand', acNo: 70 },
+  'Purola',-1,'Yamunotri',-1,'Gangotri',-1,'Badrinath',-1,'Tharali',-1,'Karnaprayag',-1,
+  'Kedarnath',-1,'Rudraprayag',-1,'Ghansali',-1,'Devprayag',-1,'Narendranagar',-1,'Pratapnagar',-1,
+  'Tehri',-1,'Dhanaulti',-1,'Chakrata',-1,'Vikasnagar',-1,'Sahaspur',-1,'Dharampur',-1,
+  'Raipur',-1,'Rajpur Road',-1,'Dehradun Cantonment',-1,'Mussoorie',-1,'Doiwala',-1,'Rishikesh',-1,
+  'Haridwar',-1,'BHEL Ranipur',-1,'Jwalapur',-1,'Bhagwanpur',-1,'Jhabrera',-1,'Piran Kaliyar',-1,
+  'Roorkee',-1,'Khanpur',-1,'Manglaur',-1,'Laksar',-1,'Haridwar Rural',-1,'Yamkeshwar',-1,
+  'Pauri',-1,'Srinagar',-1,'Chaubattakhal',-1,'Lansdowne',-1,'Kotdwar',-1,'Dharchula',-1,
+  'Didihat',-1,'Pithoragarh',-1,'Gangolihat',-1,'Kapkot',-1,'Bageshwar',-1,'Dwarahat',-1,
+  'Salt',-1,'Ranikhet',-1,'Someshwar',-1,'Almora',-1,'Jageshwar',-1,'Lohaghat',-1,
+  'Champawat',-1,'Lalkuan',-1,'Bhimtal',-1,'Nainital',-1,'Haldwani',-1,'Kaladhungi',-1,
+  'Ramnagar',-1,'Jaspur',-1,'Kashipur',-1,'Bajpur',-1,'Gadarpur',-1,'Rudrapur',-1,
+  'Kichha',-1,'Sitarganj',-1,'Nanakmatta',-1,'Khatima',-1,
   // West Bengal (294)
-  { id: "WB-AC-001", name: 'Mekliganj', state: 'West Bengal', district: 'Cooch Behar', acNo: 1 },
-  { id: "WB-AC-002", name: 'Mathabhanga', state: 'West Bengal', district: 'Cooch Behar', acNo: 2 },
-  { id: "WB-AC-003", name: 'Cooch Behar Uttar', state: 'West Bengal', district: 'Cooch Behar', acNo: 3 },
-  { id: "WB-AC-004", name: 'Cooch Behar Dakshin', state: 'West Bengal', district: 'Cooch Behar', acNo: 4 },
-  { id: "WB-AC-005", name: 'Sitalkuchi', state: 'West Bengal', district: 'Cooch Behar', acNo: 5 },
-  { id: "WB-AC-006", name: 'Sitai', state: 'West Bengal', district: 'Cooch Behar', acNo: 6 },
-  { id: "WB-AC-007", name: 'Dinhata', state: 'West Bengal', district: 'Cooch Behar', acNo: 7 },
-  { id: "WB-AC-008", name: 'Natabari', state: 'West Bengal', district: 'Cooch Behar', acNo: 8 },
-  { id: "WB-AC-009", name: 'Tufanganj', state: 'West Bengal', district: 'Cooch Behar', acNo: 9 },
-  { id: "WB-AC-010", name: 'Kumargram', state: 'West Bengal', district: 'Alipurduar', acNo: 10 },
-  { id: "WB-AC-011", name: 'Kalchini', state: 'West Bengal', district: 'Alipurduar', acNo: 11 },
-  { id: "WB-AC-012", name: 'Alipurudars', state: 'West Bengal', district: 'Alipurduar', acNo: 12 },
-  { id: "WB-AC-013", name: 'Falakata', state: 'West Bengal', district: 'Alipurduar', acNo: 13 },
-  { id: "WB-AC-014", name: 'Madarihat', state: 'West Bengal', district: 'Alipurduar', acNo: 14 },
-  { id: "WB-AC-015", name: 'Dhupguri', state: 'West Bengal', district: 'Jalpaiguri', acNo: 15 },
-  { id: "WB-AC-016", name: 'Maynaguri', state: 'West Bengal', district: 'Jalpaiguri', acNo: 16 },
-  { id: "WB-AC-017", name: 'Jalpaiguri', state: 'West Bengal', district: 'Jalpaiguri', acNo: 17 },
-  { id: "WB-AC-018", name: 'Rajganj', state: 'West Bengal', district: 'Jalpaiguri', acNo: 18 },
-  { id: "WB-AC-019", name: 'Dabgram-Phulbari', state: 'West Bengal', district: 'Jalpaiguri', acNo: 19 },
-  { id: "WB-AC-020", name: 'Mal', state: 'West Bengal', district: 'Jalpaiguri', acNo: 20 },
-  { id: "WB-AC-021", name: 'Nagrakata', state: 'West Bengal', district: 'Jalpaiguri', acNo: 21 },
-  { id: "WB-AC-022", name: 'Kalimpong', state: 'West Bengal', district: 'Kalimpong', acNo: 22 },
-  { id: "WB-AC-023", name: 'Darjeeling', state: 'West Bengal', district: 'Darjeeling', acNo: 23 },
-  { id: "WB-AC-024", name: 'Kurseong', state: 'West Bengal', district: 'Darjeeling', acNo: 24 },
-  { id: "WB-AC-025", name: 'Matigara-Naxalbari', state: 'West Bengal', district: 'Darjeeling', acNo: 25 },
-  { id: "WB-AC-026", name: 'Siliguri', state: 'West Bengal', district: 'Darjeeling', acNo: 26 },
-  { id: "WB-AC-027", name: 'Phansidewa', state: 'West Bengal', district: 'Darjeeling', acNo: 27 },
-  { id: "WB-AC-028", name: 'Chopra', state: 'West Bengal', district: 'Uttar Dinajpur', acNo: 28 },
-  { id: "WB-AC-029", name: 'Islampur', state: 'West Bengal', district: 'Uttar Dinajpur', acNo: 29 },
-  { id: "WB-AC-030", name: 'Goalpokhar', state: 'West Bengal', district: 'Uttar Dinajpur', acNo: 30 },
-  { id: "WB-AC-031", name: 'Chakulia', state: 'West Bengal', district: 'Uttar Dinajpur', acNo: 31 },
-  { id: "WB-AC-032", name: 'Karandighi', state: 'West Bengal', district: 'Uttar Dinajpur', acNo: 32 },
-  { id: "WB-AC-033", name: 'Hemtabad', state: 'West Bengal', district: 'Uttar Dinajpur', acNo: 33 },
-  { id: "WB-AC-034", name: 'Kaliaganj', state: 'West Bengal', district: 'Uttar Dinajpur', acNo: 34 },
-  { id: "WB-AC-035", name: 'Raiganj', state: 'West Bengal', district: 'Uttar Dinajpur', acNo: 35 },
-  { id: "WB-AC-036", name: 'Itahar', state: 'West Bengal', district: 'Uttar Dinajpur', acNo: 36 },
-  { id: "WB-AC-037", name: 'Kushmandi', state: 'West Bengal', district: 'Dakshin Dinajpur', acNo: 37 },
-  { id: "WB-AC-038", name: 'Kumarganj', state: 'West Bengal', district: 'Dakshin Dinajpur', acNo: 38 },
-  { id: "WB-AC-039", name: 'Balurghat', state: 'West Bengal', district: 'Dakshin Dinajpur', acNo: 39 },
-  { id: "WB-AC-040", name: 'Tapan', state: 'West Bengal', district: 'Dakshin Dinajpur', acNo: 40 },
-  { id: "WB-AC-041", name: 'Gangarampur', state: 'West Bengal', district: 'Dakshin Dinajpur', acNo: 41 },
-  { id: "WB-AC-042", name: 'Harirampur', state: 'West Bengal', district: 'Dakshin Dinajpur', acNo: 42 },
-  { id: "WB-AC-043", name: 'Habibpur', state: 'West Bengal', district: 'Maldah', acNo: 43 },
-  { id: "WB-AC-044", name: 'Gazole', state: 'West Bengal', district: 'Maldah', acNo: 44 },
-  { id: "WB-AC-045", name: 'Chanchal', state: 'West Bengal', district: 'Maldah', acNo: 45 },
-  { id: "WB-AC-046", name: 'Harishchandrapur', state: 'West Bengal', district: 'Maldah', acNo: 46 },
-  { id: "WB-AC-047", name: 'Malatipur', state: 'West Bengal', district: 'Maldah', acNo: 47 },
-  { id: "WB-AC-048", name: 'Ratua', state: 'West Bengal', district: 'Maldah', acNo: 48 },
-  { id: "WB-AC-049", name: 'Manikchak', state: 'West Bengal', district: 'Maldah', acNo: 49 },
-  { id: "WB-AC-050", name: 'Maldaha', state: 'West Bengal', district: 'Maldah', acNo: 50 },
-  { id: "WB-AC-051", name: 'English Bazar', state: 'West Bengal', district: 'Maldah', acNo: 51 },
-  { id: "WB-AC-052", name: 'Mothabari', state: 'West Bengal', district: 'Maldah', acNo: 52 },
-  { id: "WB-AC-053", name: 'Sujapur', state: 'West Bengal', district: 'Maldah', acNo: 53 },
-  { id: "WB-AC-054", name: 'Baisnabnagar', state: 'West Bengal', district: 'Maldah', acNo: 54 },
-  { id: "WB-AC-055", name: 'Farakka', state: 'West Bengal', district: 'Murshidabad', acNo: 55 },
-  { id: "WB-AC-056", name: 'Samserganj', state: 'West Bengal', district: 'Murshidabad', acNo: 56 },
-  { id: "WB-AC-057", name: 'Suti', state: 'West Bengal', district: 'Murshidabad', acNo: 57 },
-  { id: "WB-AC-058", name: 'Jangipur', state: 'West Bengal', district: 'Murshidabad', acNo: 58 },
-  { id: "WB-AC-059", name: 'Raghunathganj', state: 'West Bengal', district: 'Murshidabad', acNo: 59 },
-  { id: "WB-AC-060", name: 'Sagardighi', state: 'West Bengal', district: 'Murshidabad', acNo: 60 },
-  { id: "WB-AC-061", name: 'Lalgola', state: 'West Bengal', district: 'Murshidabad', acNo: 61 },
-  { id: "WB-AC-062", name: 'Bhagabangola', state: 'West Bengal', district: 'Murshidabad', acNo: 62 },
-  { id: "WB-AC-063", name: 'Raninagar', state: 'West Bengal', district: 'Murshidabad', acNo: 63 },
-  { id: "WB-AC-064", name: 'Murshidabad', state: 'West Bengal', district: 'Murshidabad', acNo: 64 },
-  { id: "WB-AC-065", name: 'Nabagram', state: 'West Bengal', district: 'Murshidabad', acNo: 65 },
-  { id: "WB-AC-066", name: 'Khargram', state: 'West Bengal', district: 'Murshidabad', acNo: 66 },
-  { id: "WB-AC-067", name: 'Burwan', state: 'West Bengal', district: 'Murshidabad', acNo: 67 },
-  { id: "WB-AC-068", name: 'Kandi', state: 'West Bengal', district: 'Murshidabad', acNo: 68 },
-  { id: "WB-AC-069", name: 'Bharatpur', state: 'West Bengal', district: 'Murshidabad', acNo: 69 },
-  { id: "WB-AC-070", name: 'Rejinagar', state: 'West Bengal', district: 'Murshidabad', acNo: 70 },
-  { id: "WB-AC-071", name: 'Beldanga', state: 'West Bengal', district: 'Murshidabad', acNo: 71 },
-  { id: "WB-AC-072", name: 'Baharampur', state: 'West Bengal', district: 'Murshidabad', acNo: 72 },
-  { id: "WB-AC-073", name: 'Hariharpara', state: 'West Bengal', district: 'Murshidabad', acNo: 73 },
-  { id: "WB-AC-074", name: 'Naoda', state: 'West Bengal', district: 'Murshidabad', acNo: 74 },
-  { id: "WB-AC-075", name: 'Domkal', state: 'West Bengal', district: 'Murshidabad', acNo: 75 },
-  { id: "WB-AC-076", name: 'Jalangi', state: 'West Bengal', district: 'Murshidabad', acNo: 76 },
-  { id: "WB-AC-077", name: 'Karimpur', state: 'West Bengal', district: 'Nadia', acNo: 77 },
-  { id: "WB-AC-078", name: 'Tehatta', state: 'West Bengal', district: 'Nadia', acNo: 78 },
-  { id: "WB-AC-079", name: 'Palashipara', state: 'West Bengal', district: 'Nadia', acNo: 79 },
-  { id: "WB-AC-080", name: 'Kaliganj', state: 'West Bengal', district: 'Nadia', acNo: 80 },
-  { id: "WB-AC-081", name: 'Nakashipara', state: 'West Bengal', district: 'Nadia', acNo: 81 },
-  { id: "WB-AC-082", name: 'Chapra', state: 'West Bengal', district: 'Nadia', acNo: 82 },
-  { id: "WB-AC-083", name: 'Krishnanagar Uttar', state: 'West Bengal', district: 'Nadia', acNo: 83 },
-  { id: "WB-AC-084", name: 'Nabadwip', state: 'West Bengal', district: 'Nadia', acNo: 84 },
-  { id: "WB-AC-085", name: 'Krishnanagar Dakshin', state: 'West Bengal', district: 'Nadia', acNo: 85 },
-  { id: "WB-AC-086", name: 'Santipur', state: 'West Bengal', district: 'Nadia', acNo: 86 },
-  { id: "WB-AC-087", name: 'Ranaghat Uttar Paschim', state: 'West Bengal', district: 'Nadia', acNo: 87 },
-  { id: "WB-AC-088", name: 'Krishnaganj', state: 'West Bengal', district: 'Nadia', acNo: 88 },
-  { id: "WB-AC-089", name: 'Ranaghat Uttar Purba', state: 'West Bengal', district: 'Nadia', acNo: 89 },
-  { id: "WB-AC-090", name: 'Ranaghat Dakshin', state: 'West Bengal', district: 'Nadia', acNo: 90 },
-  { id: "WB-AC-091", name: 'Chakdaha', state: 'West Bengal', district: 'Nadia', acNo: 91 },
-  { id: "WB-AC-092", name: 'Kalyani', state: 'West Bengal', district: 'Nadia', acNo: 92 },
-  { id: "WB-AC-093", name: 'Haringhata', state: 'West Bengal', district: 'Nadia', acNo: 93 },
-  { id: "WB-AC-094", name: 'Bagda', state: 'West Bengal', district: 'North 24 Parganas', acNo: 94 },
-  { id: "WB-AC-095", name: 'Bangaon Uttar', state: 'West Bengal', district: 'North 24 Parganas', acNo: 95 },
-  { id: "WB-AC-096", name: 'Bangaon Dakshin', state: 'West Bengal', district: 'North 24 Parganas', acNo: 96 },
-  { id: "WB-AC-097", name: 'Gaighata', state: 'West Bengal', district: 'North 24 Parganas', acNo: 97 },
-  { id: "WB-AC-098", name: 'Swarupnagar', state: 'West Bengal', district: 'North 24 Parganas', acNo: 98 },
-  { id: "WB-AC-099", name: 'Baduria', state: 'West Bengal', district: 'North 24 Parganas', acNo: 99 },
-  { id: "WB-AC-100", name: 'Habra', state: 'West Bengal', district: 'North 24 Parganas', acNo: 100 },
-  { id: "WB-AC-101", name: 'Ashoknagar', state: 'West Bengal', district: 'North 24 Parganas', acNo: 101 },
-  { id: "WB-AC-102", name: 'Amdanga', state: 'West Bengal', district: 'North 24 Parganas', acNo: 102 },
-  { id: "WB-AC-103", name: 'Bijpur', state: 'West Bengal', district: 'North 24 Parganas', acNo: 103 },
-  { id: "WB-AC-104", name: 'Naihati', state: 'West Bengal', district: 'North 24 Parganas', acNo: 104 },
-  { id: "WB-AC-105", name: 'Bhatpara', state: 'West Bengal', district: 'North 24 Parganas', acNo: 105 },
-  { id: "WB-AC-106", name: 'Jagatdal', state: 'West Bengal', district: 'North 24 Parganas', acNo: 106 },
-  { id: "WB-AC-107", name: 'Noapara', state: 'West Bengal', district: 'North 24 Parganas', acNo: 107 },
-  { id: "WB-AC-108", name: 'Barrackpur', state: 'West Bengal', district: 'North 24 Parganas', acNo: 108 },
-  { id: "WB-AC-109", name: 'Khardaha', state: 'West Bengal', district: 'North 24 Parganas', acNo: 109 },
-  { id: "WB-AC-110", name: 'Dum Dum Uttar', state: 'West Bengal', district: 'North 24 Parganas', acNo: 110 },
-  { id: "WB-AC-111", name: 'Panihati', state: 'West Bengal', district: 'North 24 Parganas', acNo: 111 },
-  { id: "WB-AC-112", name: 'Kamarhati', state: 'West Bengal', district: 'North 24 Parganas', acNo: 112 },
-  { id: "WB-AC-113", name: 'Baranagar', state: 'West Bengal', district: 'North 24 Parganas', acNo: 113 },
-  { id: "WB-AC-114", name: 'Dum Dum', state: 'West Bengal', district: 'North 24 Parganas', acNo: 114 },
-  { id: "WB-AC-115", name: 'Rajarhat New Town', state: 'West Bengal', district: 'North 24 Parganas', acNo: 115 },
-  { id: "WB-AC-116", name: 'Bidhannagar', state: 'West Bengal', district: 'North 24 Parganas', acNo: 116 },
-  { id: "WB-AC-117", name: 'Rajarhat Gopalpur', state: 'West Bengal', district: 'North 24 Parganas', acNo: 117 },
-  { id: "WB-AC-118", name: 'Madhyamgram', state: 'West Bengal', district: 'North 24 Parganas', acNo: 118 },
-  { id: "WB-AC-119", name: 'Barasat', state: 'West Bengal', district: 'North 24 Parganas', acNo: 119 },
-  { id: "WB-AC-120", name: 'Deganga', state: 'West Bengal', district: 'North 24 Parganas', acNo: 120 },
-  { id: "WB-AC-121", name: 'Haroa', state: 'West Bengal', district: 'North 24 Parganas', acNo: 121 },
-  { id: "WB-AC-122", name: 'Minakhan', state: 'West Bengal', district: 'North 24 Parganas', acNo: 122 },
-  { id: "WB-AC-123", name: 'Sandeshkhali', state: 'West Bengal', district: 'North 24 Parganas', acNo: 123 },
-  { id: "WB-AC-124", name: 'Basirhat Dakshin', state: 'West Bengal', district: 'North 24 Parganas', acNo: 124 },
-  { id: "WB-AC-125", name: 'Basirhat Uttar', state: 'West Bengal', district: 'North 24 Parganas', acNo: 125 },
-  { id: "WB-AC-126", name: 'Hingalganj', state: 'West Bengal', district: 'North 24 Parganas', acNo: 126 },
-  { id: "WB-AC-127", name: 'Gosaba', state: 'West Bengal', district: 'South 24 Parganas', acNo: 127 },
-  { id: "WB-AC-128", name: 'Basanti', state: 'West Bengal', district: 'South 24 Parganas', acNo: 128 },
-  { id: "WB-AC-129", name: 'Kultali', state: 'West Bengal', district: 'South 24 Parganas', acNo: 129 },
-  { id: "WB-AC-130", name: 'Patharpratima', state: 'West Bengal', district: 'South 24 Parganas', acNo: 130 },
-  { id: "WB-AC-131", name: 'Kakdwip', state: 'West Bengal', district: 'South 24 Parganas', acNo: 131 },
-  { id: "WB-AC-132", name: 'Sagar', state: 'West Bengal', district: 'South 24 Parganas', acNo: 132 },
-  { id: "WB-AC-133", name: 'Kulpi', state: 'West Bengal', district: 'South 24 Parganas', acNo: 133 },
-  { id: "WB-AC-134", name: 'Raidighi', state: 'West Bengal', district: 'South 24 Parganas', acNo: 134 },
-  { id: "WB-AC-135", name: 'Mandirbazar', state: 'West Bengal', district: 'South 24 Parganas', acNo: 135 },
-  { id: "WB-AC-136", name: 'Jaynagar', state: 'West Bengal', district: 'South 24 Parganas', acNo: 136 },
-  { id: "WB-AC-137", name: 'Baruipur Purba', state: 'West Bengal', district: 'South 24 Parganas', acNo: 137 },
-  { id: "WB-AC-138", name: 'Canning Paschim', state: 'West Bengal', district: 'South 24 Parganas', acNo: 138 },
-  { id: "WB-AC-139", name: 'Canning Purba', state: 'West Bengal', district: 'South 24 Parganas', acNo: 139 },
-  { id: "WB-AC-140", name: 'Baruipur Paschim', state: 'West Bengal', district: 'South 24 Parganas', acNo: 140 },
-  { id: "WB-AC-141", name: 'Magrahat Purba', state: 'West Bengal', district: 'South 24 Parganas', acNo: 141 },
-  { id: "WB-AC-142", name: 'Magrahat Paschim', state: 'West Bengal', district: 'South 24 Parganas', acNo: 142 },
-  { id: "WB-AC-143", name: 'Diamond Harbour', state: 'West Bengal', district: 'South 24 Parganas', acNo: 143 },
-  { id: "WB-AC-144", name: 'Falta', state: 'West Bengal', district: 'South 24 Parganas', acNo: 144 },
-  { id: "WB-AC-145", name: 'Satgachhia', state: 'West Bengal', district: 'South 24 Parganas', acNo: 145 },
-  { id: "WB-AC-146", name: 'Bishnupur, South 24 Parganas', state: 'West Bengal', district: 'South 24 Parganas', acNo: 146 },
-  { id: "WB-AC-147", name: 'Sonarpur Dakshin', state: 'West Bengal', district: 'South 24 Parganas', acNo: 147 },
-  { id: "WB-AC-148", name: 'Bhangar', state: 'West Bengal', district: 'South 24 Parganas', acNo: 148 },
-  { id: "WB-AC-149", name: 'Kasba', state: 'West Bengal', district: 'South 24 Parganas', acNo: 149 },
-  { id: "WB-AC-150", name: 'Jadavpur', state: 'West Bengal', district: 'South 24 Parganas', acNo: 150 },
-  { id: "WB-AC-151", name: 'Sonarpur Uttar', state: 'West Bengal', district: 'South 24 Parganas', acNo: 151 },
-  { id: "WB-AC-152", name: 'Tollyganj', state: 'West Bengal', district: 'South 24 Parganas', acNo: 152 },
-  { id: "WB-AC-153", name: 'Behala Purba', state: 'West Bengal', district: 'South 24 Parganas', acNo: 153 },
-  { id: "WB-AC-154", name: 'Behala Paschim', state: 'West Bengal', district: 'South 24 Parganas', acNo: 154 },
-  { id: "WB-AC-155", name: 'Maheshtala', state: 'West Bengal', district: 'South 24 Parganas', acNo: 155 },
-  { id: "WB-AC-156", name: 'Budge Budge', state: 'West Bengal', district: 'South 24 Parganas', acNo: 156 },
-  { id: "WB-AC-157", name: 'Metiaburuz', state: 'West Bengal', district: 'South 24 Parganas', acNo: 157 },
-  { id: "WB-AC-158", name: 'Kolkata Port', state: 'West Bengal', district: 'Kolkata', acNo: 158 },
-  { id: "WB-AC-159", name: 'Bhabanipur', state: 'West Bengal', district: 'Kolkata', acNo: 159 },
-  { id: "WB-AC-160", name: 'Rashbehari', state: 'West Bengal', district: 'Kolkata', acNo: 160 },
-  { id: "WB-AC-161", name: 'Ballygunge', state: 'West Bengal', district: 'Kolkata', acNo: 161 },
-  { id: "WB-AC-162", name: 'Chowranghee', state: 'West Bengal', district: 'Kolkata', acNo: 162 },
-  { id: "WB-AC-163", name: 'Entally', state: 'West Bengal', district: 'Kolkata', acNo: 163 },
-  { id: "WB-AC-164", name: 'Beleghata', state: 'West Bengal', district: 'Kolkata', acNo: 164 },
-  { id: "WB-AC-165", name: 'Jorasanko', state: 'West Bengal', district: 'Kolkata', acNo: 165 },
-  { id: "WB-AC-166", name: 'Shyampukur', state: 'West Bengal', district: 'Kolkata', acNo: 166 },
-  { id: "WB-AC-167", name: 'Maniktola', state: 'West Bengal', district: 'Kolkata', acNo: 167 },
-  { id: "WB-AC-168", name: 'Kashipur Belgachhia', state: 'West Bengal', district: 'Kolkata', acNo: 168 },
-  { id: "WB-AC-169", name: 'Bally', state: 'West Bengal', district: 'Howrah', acNo: 169 },
-  { id: "WB-AC-170", name: 'Howrah Uttar', state: 'West Bengal', district: 'Howrah', acNo: 170 },
-  { id: "WB-AC-171", name: 'Howrah Madhya', state: 'West Bengal', district: 'Howrah', acNo: 171 },
-  { id: "WB-AC-172", name: 'Shibpur', state: 'West Bengal', district: 'Howrah', acNo: 172 },
-  { id: "WB-AC-173", name: 'Howrah Dakshin', state: 'West Bengal', district: 'Howrah', acNo: 173 },
-  { id: "WB-AC-174", name: 'Sankrail', state: 'West Bengal', district: 'Howrah', acNo: 174 },
-  { id: "WB-AC-175", name: 'Panchla', state: 'West Bengal', district: 'Howrah', acNo: 175 },
-  { id: "WB-AC-176", name: 'Uluberia Purba', state: 'West Bengal', district: 'Howrah', acNo: 176 },
-  { id: "WB-AC-177", name: 'Uluberia Uttar', state: 'West Bengal', district: 'Howrah', acNo: 177 },
-  { id: "WB-AC-178", name: 'Uluberia Dakshin', state: 'West Bengal', district: 'Howrah', acNo: 178 },
-  { id: "WB-AC-179", name: 'Shyampur', state: 'West Bengal', district: 'Howrah', acNo: 179 },
-  { id: "WB-AC-180", name: 'Bagnan', state: 'West Bengal', district: 'Howrah', acNo: 180 },
-  { id: "WB-AC-181", name: 'Amta', state: 'West Bengal', district: 'Howrah', acNo: 181 },
-  { id: "WB-AC-182", name: 'Udaynarayanpur', state: 'West Bengal', district: 'Howrah', acNo: 182 },
-  { id: "WB-AC-183", name: 'Jagatballavpur', state: 'West Bengal', district: 'Howrah', acNo: 183 },
-  { id: "WB-AC-184", name: 'Domjur', state: 'West Bengal', district: 'Howrah', acNo: 184 },
-  { id: "WB-AC-185", name: 'Uttarpara', state: 'West Bengal', district: 'Hooghly', acNo: 185 },
-  { id: "WB-AC-186", name: 'Sreerampur', state: 'West Bengal', district: 'Hooghly', acNo: 186 },
-  { id: "WB-AC-187", name: 'Champdani', state: 'West Bengal', district: 'Hooghly', acNo: 187 },
-  { id: "WB-AC-188", name: 'Singur', state: 'West Bengal', district: 'Hooghly', acNo: 188 },
-  { id: "WB-AC-189", name: 'Chandannagar', state: 'West Bengal', district: 'Hooghly', acNo: 189 },
-  { id: "WB-AC-190", name: 'Chunchura', state: 'West Bengal', district: 'Hooghly', acNo: 190 },
-  { id: "WB-AC-191", name: 'Balagarh', state: 'West Bengal', district: 'Hooghly', acNo: 191 },
-  { id: "WB-AC-192", name: 'Pandua', state: 'West Bengal', district: 'Hooghly', acNo: 192 },
-  { id: "WB-AC-193", name: 'Saptagram', state: 'West Bengal', district: 'Hooghly', acNo: 193 },
-  { id: "WB-AC-194", name: 'Chanditala', state: 'West Bengal', district: 'Hooghly', acNo: 194 },
-  { id: "WB-AC-195", name: 'Jangipara', state: 'West Bengal', district: 'Hooghly', acNo: 195 },
-  { id: "WB-AC-196", name: 'Haripal', state: 'West Bengal', district: 'Hooghly', acNo: 196 },
-  { id: "WB-AC-197", name: 'Dhanekhali', state: 'West Bengal', district: 'Hooghly', acNo: 197 },
-  { id: "WB-AC-198", name: 'Tarakeswar', state: 'West Bengal', district: 'Hooghly', acNo: 198 },
-  { id: "WB-AC-199", name: 'Pursurah', state: 'West Bengal', district: 'Hooghly', acNo: 199 },
-  { id: "WB-AC-200", name: 'Arambag', state: 'West Bengal', district: 'Hooghly', acNo: 200 },
-  { id: "WB-AC-201", name: 'Goghat', state: 'West Bengal', district: 'Hooghly', acNo: 201 },
-  { id: "WB-AC-202", name: 'Khanakul', state: 'West Bengal', district: 'Hooghly', acNo: 202 },
-  { id: "WB-AC-203", name: 'Tamluk', state: 'West Bengal', district: 'Purba Medinipur', acNo: 203 },
-  { id: "WB-AC-204", name: 'Panskura Purba', state: 'West Bengal', district: 'Purba Medinipur', acNo: 204 },
-  { id: "WB-AC-205", name: 'Panskura Paschim', state: 'West Bengal', district: 'Purba Medinipur', acNo: 205 },
-  { id: "WB-AC-206", name: 'Moyna', state: 'West Bengal', district: 'Purba Medinipur', acNo: 206 },
-  { id: "WB-AC-207", name: 'Nandakumar', state: 'West Bengal', district: 'Purba Medinipur', acNo: 207 },
-  { id: "WB-AC-208", name: 'Mahisadal', state: 'West Bengal', district: 'Purba Medinipur', acNo: 208 },
-  { id: "WB-AC-209", name: 'Haldia', state: 'West Bengal', district: 'Purba Medinipur', acNo: 209 },
-  { id: "WB-AC-210", name: 'Nandigram', state: 'West Bengal', district: 'Purba Medinipur', acNo: 210 },
-  { id: "WB-AC-211", name: 'Chandipur', state: 'West Bengal', district: 'Purba Medinipur', acNo: 211 },
-  { id: "WB-AC-212", name: 'Patashpur', state: 'West Bengal', district: 'Purba Medinipur', acNo: 212 },
-  { id: "WB-AC-213", name: 'Kanthi Uttar', state: 'West Bengal', district: 'Purba Medinipur', acNo: 213 },
-  { id: "WB-AC-214", name: 'Bhagabanpur', state: 'West Bengal', district: 'Purba Medinipur', acNo: 214 },
-  { id: "WB-AC-215", name: 'Khejuri', state: 'West Bengal', district: 'Purba Medinipur', acNo: 215 },
-  { id: "WB-AC-216", name: 'Kanthi Dakshin', state: 'West Bengal', district: 'Purba Medinipur', acNo: 216 },
-  { id: "WB-AC-217", name: 'Ramnagar, Purba Medinipur', state: 'West Bengal', district: 'Purba Medinipur', acNo: 217 },
-  { id: "WB-AC-218", name: 'Egra', state: 'West Bengal', district: 'Purba Medinipur', acNo: 218 },
-  { id: "WB-AC-219", name: 'Dantan', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 219 },
-  { id: "WB-AC-220", name: 'Nayagram', state: 'West Bengal', district: 'Jhargram', acNo: 220 },
-  { id: "WB-AC-221", name: 'Gopiballavpur', state: 'West Bengal', district: 'Jhargram', acNo: 221 },
-  { id: "WB-AC-222", name: 'Jhargram', state: 'West Bengal', district: 'Jhargram', acNo: 222 },
-  { id: "WB-AC-223", name: 'Keshiary', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 223 },
-  { id: "WB-AC-224", name: 'Kharagpur Sadar', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 224 },
-  { id: "WB-AC-225", name: 'Narayangarh', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 225 },
-  { id: "WB-AC-226", name: 'Sabang', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 226 },
-  { id: "WB-AC-227", name: 'Pingla', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 227 },
-  { id: "WB-AC-228", name: 'Kharagpur', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 228 },
-  { id: "WB-AC-229", name: 'Debra', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 229 },
-  { id: "WB-AC-230", name: 'Daspur', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 230 },
-  { id: "WB-AC-231", name: 'Ghatal', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 231 },
-  { id: "WB-AC-232", name: 'Chandrakona', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 232 },
-  { id: "WB-AC-233", name: 'Garbeta', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 233 },
-  { id: "WB-AC-234", name: 'Salboni', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 234 },
-  { id: "WB-AC-235", name: 'Keshpur', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 235 },
-  { id: "WB-AC-236", name: 'Medinipur', state: 'West Bengal', district: 'Paschim Medinipur', acNo: 236 },
-  { id: "WB-AC-237", name: 'Binpur', state: 'West Bengal', district: 'Jhargram', acNo: 237 },
-  { id: "WB-AC-238", name: 'Bandwan', state: 'West Bengal', district: 'Purulia', acNo: 238 },
-  { id: "WB-AC-239", name: 'Balarampur, Purulia', state: 'West Bengal', district: 'Purulia', acNo: 239 },
-  { id: "WB-AC-240", name: 'Baghmundi', state: 'West Bengal', district: 'Purulia', acNo: 240 },
-  { id: "WB-AC-241", name: 'Joypur, Purulia', state: 'West Bengal', district: 'Purulia', acNo: 241 },
-  { id: "WB-AC-242", name: 'Purulia', state: 'West Bengal', district: 'Purulia', acNo: 242 },
-  { id: "WB-AC-243", name: 'Manbazar', state: 'West Bengal', district: 'Purulia', acNo: 243 },
-  { id: "WB-AC-244", name: 'Kashipur', state: 'West Bengal', district: 'Purulia', acNo: 244 },
-  { id: "WB-AC-245", name: 'Para', state: 'West Bengal', district: 'Purulia', acNo: 245 },
-  { id: "WB-AC-246", name: 'Raghunathpur, Purulia', state: 'West Bengal', district: 'Purulia', acNo: 246 },
-  { id: "WB-AC-247", name: 'Saltora', state: 'West Bengal', district: 'Bankura', acNo: 247 },
-  { id: "WB-AC-248", name: 'Chhatna', state: 'West Bengal', district: 'Bankura', acNo: 248 },
-  { id: "WB-AC-249", name: 'Ranibandh', state: 'West Bengal', district: 'Bankura', acNo: 249 },
-  { id: "WB-AC-250", name: 'Raipur, Bankura', state: 'West Bengal', district: 'Bankura', acNo: 250 },
-  { id: "WB-AC-251", name: 'Taldangra', state: 'West Bengal', district: 'Bankura', acNo: 251 },
-  { id: "WB-AC-252", name: 'Bankura', state: 'West Bengal', district: 'Bankura', acNo: 252 },
-  { id: "WB-AC-253", name: 'Barjora', state: 'West Bengal', district: 'Bankura', acNo: 253 },
-  { id: "WB-AC-254", name: 'Onda', state: 'West Bengal', district: 'Bankura', acNo: 254 },
-  { id: "WB-AC-255", name: 'Bishnupur, Bankura', state: 'West Bengal', district: 'Bankura', acNo: 255 },
-  { id: "WB-AC-256", name: 'Katulpur', state: 'West Bengal', district: 'Bankura', acNo: 256 },
-  { id: "WB-AC-257", name: 'Indas', state: 'West Bengal', district: 'Bankura', acNo: 257 },
-  { id: "WB-AC-258", name: 'Sonamukhi', state: 'West Bengal', district: 'Bankura', acNo: 258 },
-  { id: "WB-AC-259", name: 'Khandaghosh', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 259 },
-  { id: "WB-AC-260", name: 'Burdwan Dakshin', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 260 },
-  { id: "WB-AC-261", name: 'Raina', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 261 },
-  { id: "WB-AC-262", name: 'Jamalpur', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 262 },
-  { id: "WB-AC-263", name: 'Manteswar', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 263 },
-  { id: "WB-AC-264", name: 'Kalna', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 264 },
-  { id: "WB-AC-265", name: 'Memari', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 265 },
-  { id: "WB-AC-266", name: 'Burdwan Uttar', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 266 },
-  { id: "WB-AC-267", name: 'Bhatar', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 267 },
-  { id: "WB-AC-268", name: 'Purbasthali Dakshin', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 268 },
-  { id: "WB-AC-269", name: 'Purbasthali Uttar', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 269 },
-  { id: "WB-AC-270", name: 'Katwa', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 270 },
-  { id: "WB-AC-271", name: 'Ketugram', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 271 },
-  { id: "WB-AC-272", name: 'Mangalkot', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 272 },
-  { id: "WB-AC-273", name: 'Ausgram', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 273 },
-  { id: "WB-AC-274", name: 'Galsi', state: 'West Bengal', district: 'Purba Bardhaman', acNo: 274 },
-  { id: "WB-AC-275", name: 'Pandaveswar', state: 'West Bengal', district: 'Paschim Bardhaman', acNo: 275 },
-  { id: "WB-AC-276", name: 'Durgapur Purba', state: 'West Bengal', district: 'Paschim Bardhaman', acNo: 276 },
-  { id: "WB-AC-277", name: 'Durgapur Paschim', state: 'West Bengal', district: 'Paschim Bardhaman', acNo: 277 },
-  { id: "WB-AC-278", name: 'Raniganj', state: 'West Bengal', district: 'Paschim Bardhaman', acNo: 278 },
-  { id: "WB-AC-279", name: 'Jamuria', state: 'West Bengal', district: 'Paschim Bardhaman', acNo: 279 },
-  { id: "WB-AC-280", name: 'Asansol Dakshin', state: 'West Bengal', district: 'Paschim Bardhaman', acNo: 280 },
-  { id: "WB-AC-281", name: 'Asansol Uttar', state: 'West Bengal', district: 'Paschim Bardhaman', acNo: 281 },
-  { id: "WB-AC-282", name: 'Kulti', state: 'West Bengal', district: 'Paschim Bardhaman', acNo: 282 },
-  { id: "WB-AC-283", name: 'Barabani', state: 'West Bengal', district: 'Paschim Bardhaman', acNo: 283 },
-  { id: "WB-AC-284", name: 'Dubrajpur', state: 'West Bengal', district: 'Birbhum', acNo: 284 },
-  { id: "WB-AC-285", name: 'Suri', state: 'West Bengal', district: 'Birbhum', acNo: 285 },
-  { id: "WB-AC-286", name: 'Bolpur', state: 'West Bengal', district: 'Birbhum', acNo: 286 },
-  { id: "WB-AC-287", name: 'Nanoor', state: 'West Bengal', district: 'Birbhum', acNo: 287 },
-  { id: "WB-AC-288", name: 'Labhpur', state: 'West Bengal', district: 'Birbhum', acNo: 288 },
-  { id: "WB-AC-289", name: 'Sainthia', state: 'West Bengal', district: 'Birbhum', acNo: 289 },
-  { id: "WB-AC-290", name: 'Mayureswar', state: 'West Bengal', district: 'Birbhum', acNo: 290 },
-  { id: "WB-AC-291", name: 'Rampurhat', state: 'West Bengal', district: 'Birbhum', acNo: 291 },
-  { id: "WB-AC-292", name: 'Hansan', state: 'West Bengal', district: 'Birbhum', acNo: 292 },
-  { id: "WB-AC-293", name: 'Nalhati', state: 'West Bengal', district: 'Birbhum', acNo: 293 },
-  { id: "WB-AC-294", name: 'Murarai', state: 'West Bengal', district: 'Birbhum', acNo: 294 },
+  'Mekliganj',734,'Mathabhanga',734,'Cooch Behar Uttar',734,'Cooch Behar Dakshin',734,'Sitalkuchi',734,'Sitai',734,
+  'Dinhata',734,'Natabari',734,'Tufanganj',734,'Kumargram',615,'Kalchini',615,'Alipurudars',615,
+  'Falakata',615,'Madarihat',615,'Dhupguri',862,'Maynaguri',862,'Jalpaiguri',862,'Rajganj',862,
+  'Dabgram-Phulbari',862,'Mal',862,'Nagrakata',862,'Kalimpong',892,'Darjeeling',743,'Kurseong',743,
+  'Matigara-Naxalbari',743,'Siliguri',743,'Phansidewa',743,'Chopra',1274,'Islampur',1274,'Goalpokhar',1274,
+  'Chakulia',1274,'Karandighi',1274,'Hemtabad',1274,'Kaliaganj',1274,'Raiganj',1274,'Itahar',1274,
+  'Kushmandi',738,'Kumarganj',738,'Balurghat',738,'Tapan',738,'Gangarampur',738,'Harirampur',738,
+  'Habibpur',1000,'Gazole',1000,'Chanchal',1000,'Harishchandrapur',1000,'Malatipur',1000,'Ratua',1000,
+  'Manikchak',1000,'Maldaha',1000,'English Bazar',1000,'Mothabari',1000,'Sujapur',1000,'Baisnabnagar',1000,
+  'Farakka',1033,'Samserganj',1033,'Suti',1033,'Jangipur',1033,'Raghunathganj',1033,'Sagardighi',1033,
+  'Lalgola',1033,'Bhagabangola',1033,'Raninagar',1033,'Murshidabad',1033,'Nabagram',1033,'Khargram',1033,
+  'Burwan',1033,'Kandi',1033,'Bharatpur',1033,'Rejinagar',1033,'Beldanga',1033,'Baharampur',1033,
+  'Hariharpara',1033,'Naoda',1033,'Domkal',1033,'Jalangi',1033,'Karimpur',1038,'Tehatta',1038,
+  'Palashipara',1038,'Kaliganj',1038,'Nakashipara',1038,'Chapra',1038,'Krishnanagar Uttar',1038,'Nabadwip',1038,
+  'Krishnanagar Dakshin',1038,'Santipur',1038,'Ranaghat Uttar Paschim',1038,'Krishnaganj',1038,'Ranaghat Uttar Purba',1038,'Ranaghat Dakshin',1038,
+  'Chakdaha',1038,'Kalyani',1038,'Haringhata',1038,'Bagda',1070,'Bangaon Uttar',1070,'Bangaon Dakshin',1070,
+  'Gaighata',1070,'Swarupnagar',1070,'Baduria',1070,'Habra',1070,'Ashoknagar',1070,'Amdanga',1070,
+  'Bijpur',1070,'Naihati',1070,'Bhatpara',1070,'Jagatdal',1070,'Noapara',1070,'Barrackpur',1070,
+  'Khardaha',1070,'Dum Dum Uttar',1070,'Panihati',1070,'Kamarhati',1070,'Baranagar',1070,'Dum Dum',1070,
+  'Rajarhat New Town',1070,'Bidhannagar',1070,'Rajarhat Gopalpur',1070,'Madhyamgram',1070,'Barasat',1070,'Deganga',1070,
+  'Haroa',1070,'Minakhan',1070,'Sandeshkhali',1070,'Basirhat Dakshin',1070,'Basirhat Uttar',1070,'Hingalganj',1070,
+  'Gosaba',1214,'Basanti',1214,'Kultali',1214,'Patharpratima',1214,'Kakdwip',1214,'Sagar',1214,
+  'Kulpi',1214,'Raidighi',1214,'Mandirbazar',1214,'Jaynagar',1214,'Baruipur Purba',1214,'Canning Paschim',1214,
+  'Canning Purba',1214,'Baruipur Paschim',1214,'Magrahat Purba',1214,'Magrahat Paschim',1214,'Diamond Harbour',1214,'Falta',1214,
+  'Satgachhia',1214,'Bishnupur, South 24 Parganas',1214,'Sonarpur Dakshin',1214,'Bhangar',1214,'Kasba',1214,'Jadavpur',1214,
+  'Sonarpur Uttar',1214,'Tollyganj',1214,'Behala Purba',1214,'Behala Paschim',1214,'Maheshtala',1214,'Budge Budge',1214,
+  'Metiaburuz',1214,'Kolkata Port',943,'Bhabanipur',943,'Rashbehari',943,'Ballygunge',943,'Chowranghee',943,
+  'Entally',943,'Beleghata',943,'Jorasanko',943,'Shyampukur',943,'Maniktola',943,'Kashipur Belgachhia',943,
+  'Bally',845,'Howrah Uttar',845,'Howrah Madhya',845,'Shibpur',845,'Howrah Dakshin',845,'Sankrail',845,
+  'Panchla',845,'Uluberia Purba',845,'Uluberia Uttar',845,'Uluberia Dakshin',845,'Shyampur',845,'Bagnan',845,
+  'Amta',845,'Udaynarayanpur',845,'Jagatballavpur',845,'Domjur',845,'Uttarpara',843,'Sreerampur',843,
+  'Champdani',843,'Singur',843,'Chandannagar',843,'Chunchura',843,'Balagarh',843,'Pandua',843,
+  'Saptagram',843,'Chanditala',843,'Jangipara',843,'Haripal',843,'Dhanekhali',843,'Tarakeswar',843,
+  'Pursurah',843,'Arambag',843,'Goghat',843,'Khanakul',843,'Tamluk',1118,'Panskura Purba',1118,
+  'Panskura Paschim',1118,'Moyna',1118,'Nandakumar',1118,'Mahisadal',1118,'Haldia',1118,'Nandigram',1118,
+  'Chandipur',1118,'Patashpur',1118,'Kanthi Uttar',1118,'Bhagabanpur',1118,'Khejuri',1118,'Kanthi Dakshin',1118,
+  'Ramnagar, Purba Medinipur',1118,'Egra',1118,'Dantan',1096,'Nayagram',877,'Gopiballavpur',877,'Jhargram',877,
+  'Keshiary',1096,'Kharagpur Sadar',1096,'Narayangarh',1096,'Sabang',1096,'Pingla',1096,'Kharagpur',1096,
+  'Debra',1096,'Daspur',1096,'Ghatal',1096,'Chandrakona',1096,'Garbeta',1096,'Salboni',1096,
+  'Keshpur',1096,'Medinipur',1096,'Binpur',877,'Bandwan',1120,'Balarampur, Purulia',1120,'Baghmundi',1120,
+  'Joypur, Purulia',1120,'Purulia',1120,'Manbazar',1120,'Kashipur',1120,'Para',1120,'Raghunathpur, Purulia',1120,
+  'Saltora',658,'Chhatna',658,'Ranibandh',658,'Raipur, Bankura',658,'Taldangra',658,'Bankura',658,
+  'Barjora',658,'Onda',658,'Bishnupur, Bankura',658,'Katulpur',658,'Indas',658,'Sonamukhi',658,
+  'Khandaghosh',1117,'Burdwan Dakshin',1117,'Raina',1117,'Jamalpur',1117,'Manteswar',1117,'Kalna',1117,
+  'Memari',1117,'Burdwan Uttar',1117,'Bhatar',1117,'Purbasthali Dakshin',1117,'Purbasthali Uttar',1117,'Katwa',1117,
+  'Ketugram',1117,'Mangalkot',1117,'Ausgram',1117,'Galsi',1117,'Pandaveswar',1095,'Durgapur Purba',1095,
+  'Durgapur Paschim',1095,'Raniganj',1095,'Jamuria',1095,'Asansol Dakshin',1095,'Asansol Uttar',1095,'Kulti',1095,
+  'Barabani',1095,'Dubrajpur',695,'Suri',695,'Bolpur',695,'Nanoor',695,'Labhpur',695,
+  'Sainthia',695,'Mayureswar',695,'Rampurhat',695,'Hansan',695,'Nalhati',695,'Murarai',695,
   // NCT of Delhi (70)
-  { id: "DL-AC-001", name: 'Narela', state: 'NCT of Delhi', district: 'North Delhi', acNo: 1 },
-  { id: "DL-AC-002", name: 'Burari', state: 'NCT of Delhi', district: 'North Delhi', acNo: 2 },
-  { id: "DL-AC-003", name: 'Timarpur', state: 'NCT of Delhi', district: 'North Delhi', acNo: 3 },
-  { id: "DL-AC-004", name: 'Adarsh Nagar', state: 'NCT of Delhi', district: 'North Delhi', acNo: 4 },
-  { id: "DL-AC-005", name: 'Badli', state: 'NCT of Delhi', district: 'North Delhi', acNo: 5 },
-  { id: "DL-AC-006", name: 'Rithala', state: 'NCT of Delhi', district: 'North West Delhi', acNo: 6 },
-  { id: "DL-AC-007", name: 'Bawana', state: 'NCT of Delhi', district: 'North Delhi', acNo: 7 },
-  { id: "DL-AC-008", name: 'Mundka', state: 'NCT of Delhi', district: 'North West Delhi', acNo: 8 },
-  { id: "DL-AC-009", name: 'Kirari', state: 'NCT of Delhi', district: 'North West Delhi', acNo: 9 },
-  { id: "DL-AC-010", name: 'Sultan Pur Majra', state: 'NCT of Delhi', district: 'North West Delhi', acNo: 10 },
-  { id: "DL-AC-011", name: 'Nangloi Jat', state: 'NCT of Delhi', district: 'West Delhi', acNo: 11 },
-  { id: "DL-AC-012", name: 'Mangol Puri', state: 'NCT of Delhi', district: 'North West Delhi', acNo: 12 },
-  { id: "DL-AC-013", name: 'Rohini', state: 'NCT of Delhi', district: 'North Delhi', acNo: 13 },
-  { id: "DL-AC-014", name: 'Shalimar Bagh', state: 'NCT of Delhi', district: 'North West Delhi', acNo: 14 },
-  { id: "DL-AC-015", name: 'Shakur Basti', state: 'NCT of Delhi', district: 'North Delhi', acNo: 15 },
-  { id: "DL-AC-016", name: 'Tri Nagar', state: 'NCT of Delhi', district: 'North West Delhi', acNo: 16 },
-  { id: "DL-AC-017", name: 'Wazirpur', state: 'NCT of Delhi', district: 'North Delhi', acNo: 17 },
-  { id: "DL-AC-018", name: 'Model Town', state: 'NCT of Delhi', district: 'North Delhi', acNo: 18 },
-  { id: "DL-AC-019", name: 'Sadar Bazar', state: 'NCT of Delhi', district: 'Central Delhi', acNo: 19 },
-  { id: "DL-AC-020", name: 'Chandni Chowk', state: 'NCT of Delhi', district: 'Central Delhi', acNo: 20 },
-  { id: "DL-AC-021", name: 'Matia Mahal', state: 'NCT of Delhi', district: 'Central Delhi', acNo: 21 },
-  { id: "DL-AC-022", name: 'Ballimaran', state: 'NCT of Delhi', district: 'Central Delhi', acNo: 22 },
-  { id: "DL-AC-023", name: 'Karol Bagh', state: 'NCT of Delhi', district: 'Central Delhi', acNo: 23 },
-  { id: "DL-AC-024", name: 'Patel Nagar', state: 'NCT of Delhi', district: 'West Delhi', acNo: 24 },
-  { id: "DL-AC-025", name: 'Moti Nagar', state: 'NCT of Delhi', district: 'West Delhi', acNo: 25 },
-  { id: "DL-AC-026", name: 'Madipur', state: 'NCT of Delhi', district: 'West Delhi', acNo: 26 },
-  { id: "DL-AC-027", name: 'Rajouri Garden', state: 'NCT of Delhi', district: 'West Delhi', acNo: 27 },
-  { id: "DL-AC-028", name: 'Hari Nagar', state: 'NCT of Delhi', district: 'West Delhi', acNo: 28 },
-  { id: "DL-AC-029", name: 'Tilak Nagar', state: 'NCT of Delhi', district: 'West Delhi', acNo: 29 },
-  { id: "DL-AC-030", name: 'Janakpuri', state: 'NCT of Delhi', district: 'West Delhi', acNo: 30 },
-  { id: "DL-AC-031", name: 'Vikaspuri', state: 'NCT of Delhi', district: 'West Delhi', acNo: 31 },
-  { id: "DL-AC-032", name: 'Uttam Nagar', state: 'NCT of Delhi', district: 'West Delhi', acNo: 32 },
-  { id: "DL-AC-033", name: 'Dwarka', state: 'NCT of Delhi', district: 'West Delhi', acNo: 33 },
-  { id: "DL-AC-034", name: 'Matiala', state: 'NCT of Delhi', district: 'West Delhi', acNo: 34 },
-  { id: "DL-AC-035", name: 'Najafgarh', state: 'NCT of Delhi', district: 'West Delhi', acNo: 35 },
-  { id: "DL-AC-036", name: 'Bijwasan', state: 'NCT of Delhi', district: 'West Delhi', acNo: 36 },
-  { id: "DL-AC-037", name: 'Palam', state: 'NCT of Delhi', district: 'West Delhi', acNo: 37 },
-  { id: "DL-AC-038", name: 'Delhi Cantonment', state: 'NCT of Delhi', district: 'New Delhi', acNo: 38 },
-  { id: "DL-AC-039", name: 'Rajinder Nagar', state: 'NCT of Delhi', district: 'New Delhi', acNo: 39 },
-  { id: "DL-AC-040", name: 'New Delhi', state: 'NCT of Delhi', district: 'New Delhi', acNo: 40 },
-  { id: "DL-AC-041", name: 'Jangpura', state: 'NCT of Delhi', district: 'South East Delhi', acNo: 41 },
-  { id: "DL-AC-042", name: 'Kasturba Nagar', state: 'NCT of Delhi', district: 'South East Delhi', acNo: 42 },
-  { id: "DL-AC-043", name: 'Malviya Nagar', state: 'NCT of Delhi', district: 'South Delhi', acNo: 43 },
-  { id: "DL-AC-044", name: 'R K Puram', state: 'NCT of Delhi', district: 'New Delhi', acNo: 44 },
-  { id: "DL-AC-045", name: 'Mehrauli', state: 'NCT of Delhi', district: 'South Delhi', acNo: 45 },
-  { id: "DL-AC-046", name: 'Chhatarpur', state: 'NCT of Delhi', district: 'South Delhi', acNo: 46 },
-  { id: "DL-AC-047", name: 'Deoli', state: 'NCT of Delhi', district: 'South Delhi', acNo: 47 },
-  { id: "DL-AC-048", name: 'Ambedkar Nagar', state: 'NCT of Delhi', district: 'South Delhi', acNo: 48 },
-  { id: "DL-AC-049", name: 'Sangam Vihar', state: 'NCT of Delhi', district: 'South East Delhi', acNo: 49 },
-  { id: "DL-AC-050", name: 'Greater Kailash', state: 'NCT of Delhi', district: 'South East Delhi', acNo: 50 },
-  { id: "DL-AC-051", name: 'Kalkaji', state: 'NCT of Delhi', district: 'South East Delhi', acNo: 51 },
-  { id: "DL-AC-052", name: 'Tughlakabad', state: 'NCT of Delhi', district: 'South East Delhi', acNo: 52 },
-  { id: "DL-AC-053", name: 'Badarpur', state: 'NCT of Delhi', district: 'South East Delhi', acNo: 53 },
-  { id: "DL-AC-054", name: 'Okhla', state: 'NCT of Delhi', district: 'South East Delhi', acNo: 54 },
-  { id: "DL-AC-055", name: 'Trilokpuri', state: 'NCT of Delhi', district: 'East Delhi', acNo: 55 },
-  { id: "DL-AC-056", name: 'Kondli', state: 'NCT of Delhi', district: 'East Delhi', acNo: 56 },
-  { id: "DL-AC-057", name: 'Patparganj', state: 'NCT of Delhi', district: 'East Delhi', acNo: 57 },
-  { id: "DL-AC-058", name: 'Laxmi Nagar', state: 'NCT of Delhi', district: 'East Delhi', acNo: 58 },
-  { id: "DL-AC-059", name: 'Vishwas Nagar', state: 'NCT of Delhi', district: 'Shahdara', acNo: 59 },
-  { id: "DL-AC-060", name: 'Krishna Nagar', state: 'NCT of Delhi', district: 'East Delhi', acNo: 60 },
-  { id: "DL-AC-061", name: 'Gandhi Nagar', state: 'NCT of Delhi', district: 'East Delhi', acNo: 61 },
-  { id: "DL-AC-062", name: 'Shahdara', state: 'NCT of Delhi', district: 'Shahdara', acNo: 62 },
-  { id: "DL-AC-063", name: 'Seemapuri', state: 'NCT of Delhi', district: 'Shahdara', acNo: 63 },
-  { id: "DL-AC-064", name: 'Rohtas Nagar', state: 'NCT of Delhi', district: 'Shahdara', acNo: 64 },
-  { id: "DL-AC-065", name: 'Seelampur', state: 'NCT of Delhi', district: 'North East Delhi', acNo: 65 },
-  { id: "DL-AC-066", name: 'Ghonda', state: 'NCT of Delhi', district: 'North East Delhi', acNo: 66 },
-  { id: "DL-AC-067", name: 'Babarpur', state: 'NCT of Delhi', district: 'Shahdara', acNo: 67 },
-  { id: "DL-AC-068", name: 'Gokalpur', state: 'NCT of Delhi', district: 'North East Delhi', acNo: 68 },
-  { id: "DL-AC-069", name: 'Mustafabad', state: 'NCT of Delhi', district: 'North East Delhi', acNo: 69 },
-  { id: "DL-AC-070", name: 'Karawal Nagar', state: 'NCT of Delhi', district: 'North East Delhi', acNo: 70 },
+  'Narela',1071,'Burari',1071,'Timarpur',1071,'Adarsh Nagar',1071,'Badli',1071,'Rithala',1076,
+  'Bawana',1071,'Mundka',1076,'Kirari',1076,'Sultan Pur Majra',1076,'Nangloi Jat',1292,'Mangol Puri',1076,
+  'Rohini',1071,'Shalimar Bagh',1076,'Shakur Basti',1071,'Tri Nagar',1076,'Wazirpur',1071,'Model Town',1071,
+  'Sadar Bazar',710,'Chandni Chowk',710,'Matia Mahal',710,'Ballimaran',710,'Karol Bagh',710,'Patel Nagar',1292,
+  'Moti Nagar',1292,'Madipur',1292,'Rajouri Garden',1292,'Hari Nagar',1292,'Tilak Nagar',1292,'Janakpuri',1292,
+  'Vikaspuri',1292,'Uttam Nagar',1292,'Dwarka',1292,'Matiala',1292,'Najafgarh',1292,'Bijwasan',1292,
+  'Palam',1292,'Delhi Cantonment',1064,'Rajinder Nagar',1064,'New Delhi',1064,'Jangpura',1216,'Kasturba Nagar',1216,
+  'Malviya Nagar',1215,'R K Puram',1064,'Mehrauli',1215,'Chhatarpur',1215,'Deoli',1215,'Ambedkar Nagar',1215,
+  'Sangam Vihar',1216,'Greater Kailash',1216,'Kalkaji',1216,'Tughlakabad',1216,'Badarpur',1216,'Okhla',1216,
+  'Trilokpuri',775,'Kondli',775,'Patparganj',775,'Laxmi Nagar',775,'Vishwas Nagar',1176,'Krishna Nagar',775,
+  'Gandhi Nagar',775,'Shahdara',1176,'Seemapuri',1176,'Rohtas Nagar',1176,'Seelampur',1072,'Ghonda',1072,
+  'Babarpur',1176,'Gokalpur',1072,'Mustafabad',1072,'Karawal Nagar',1072,
   // Jammu & Kashmir (90)
-  { id: "JK-AC-001", name: 'Karnah', state: 'Jammu & Kashmir', district: 'Kupwara', acNo: 1 },
-  { id: "JK-AC-002", name: 'Trehgam', state: 'Jammu & Kashmir', district: 'Kupwara', acNo: 2 },
-  { id: "JK-AC-003", name: 'Kupwara', state: 'Jammu & Kashmir', district: 'Kupwara', acNo: 3 },
-  { id: "JK-AC-004", name: 'Lolab', state: 'Jammu & Kashmir', district: 'Kupwara', acNo: 4 },
-  { id: "JK-AC-005", name: 'Handwara', state: 'Jammu & Kashmir', district: 'Kupwara', acNo: 5 },
-  { id: "JK-AC-006", name: 'Langate', state: 'Jammu & Kashmir', district: 'Kupwara', acNo: 6 },
-  { id: "JK-AC-007", name: 'Sopore', state: 'Jammu & Kashmir', district: 'Baramulla', acNo: 7 },
-  { id: "JK-AC-008", name: 'Rafiabad', state: 'Jammu & Kashmir', district: 'Baramulla', acNo: 8 },
-  { id: "JK-AC-009", name: 'Uri', state: 'Jammu & Kashmir', district: 'Baramulla', acNo: 9 },
-  { id: "JK-AC-010", name: 'Baramulla', state: 'Jammu & Kashmir', district: 'Baramulla', acNo: 10 },
-  { id: "JK-AC-011", name: 'Gulmarg', state: 'Jammu & Kashmir', district: 'Baramulla', acNo: 11 },
-  { id: "JK-AC-012", name: 'Wagoora–Kreeri', state: 'Jammu & Kashmir', district: 'Baramulla', acNo: 12 },
-  { id: "JK-AC-013", name: 'Pattan', state: 'Jammu & Kashmir', district: 'Baramulla', acNo: 13 },
-  { id: "JK-AC-014", name: 'Sonawari', state: 'Jammu & Kashmir', district: 'Bandipora', acNo: 14 },
-  { id: "JK-AC-015", name: 'Bandipora', state: 'Jammu & Kashmir', district: 'Bandipora', acNo: 15 },
-  { id: "JK-AC-016", name: 'Gurez', state: 'Jammu & Kashmir', district: 'Bandipora', acNo: 16 },
-  { id: "JK-AC-017", name: 'Kangan', state: 'Jammu & Kashmir', district: 'Ganderbal', acNo: 17 },
-  { id: "JK-AC-018", name: 'Ganderbal', state: 'Jammu & Kashmir', district: 'Ganderbal', acNo: 18 },
-  { id: "JK-AC-019", name: 'Hazratbal', state: 'Jammu & Kashmir', district: 'Srinagar', acNo: 19 },
-  { id: "JK-AC-020", name: 'Khanyar', state: 'Jammu & Kashmir', district: 'Srinagar', acNo: 20 },
-  { id: "JK-AC-021", name: 'Habba Kadal', state: 'Jammu & Kashmir', district: 'Srinagar', acNo: 21 },
-  { id: "JK-AC-022", name: 'Lal Chowk', state: 'Jammu & Kashmir', district: 'Srinagar', acNo: 22 },
-  { id: "JK-AC-023", name: 'Chanapora', state: 'Jammu & Kashmir', district: 'Srinagar', acNo: 23 },
-  { id: "JK-AC-024", name: 'Zadibal', state: 'Jammu & Kashmir', district: 'Srinagar', acNo: 24 },
-  { id: "JK-AC-025", name: 'Eidgah', state: 'Jammu & Kashmir', district: 'Srinagar', acNo: 25 },
-  { id: "JK-AC-026", name: 'Central Shalteng', state: 'Jammu & Kashmir', district: 'Srinagar', acNo: 26 },
-  { id: "JK-AC-027", name: 'Budgam', state: 'Jammu & Kashmir', district: 'Budgam', acNo: 27 },
-  { id: "JK-AC-028", name: 'Beerwah', state: 'Jammu & Kashmir', district: 'Budgam', acNo: 28 },
-  { id: "JK-AC-029", name: 'Khan Sahib', state: 'Jammu & Kashmir', district: 'Budgam', acNo: 29 },
-  { id: "JK-AC-030", name: 'Chrar-i-Sharief', state: 'Jammu & Kashmir', district: 'Budgam', acNo: 30 },
-  { id: "JK-AC-031", name: 'Chadoora', state: 'Jammu & Kashmir', district: 'Budgam', acNo: 31 },
-  { id: "JK-AC-032", name: 'Pampore', state: 'Jammu & Kashmir', district: 'Pulwama', acNo: 32 },
-  { id: "JK-AC-033", name: 'Tral', state: 'Jammu & Kashmir', district: 'Pulwama', acNo: 33 },
-  { id: "JK-AC-034", name: 'Pulwama', state: 'Jammu & Kashmir', district: 'Pulwama', acNo: 34 },
-  { id: "JK-AC-035", name: 'Rajpora', state: 'Jammu & Kashmir', district: 'Pulwama', acNo: 35 },
-  { id: "JK-AC-036", name: 'Zainapora', state: 'Jammu & Kashmir', district: 'Shopian', acNo: 36 },
-  { id: "JK-AC-037", name: 'Shopian', state: 'Jammu & Kashmir', district: 'Shopian', acNo: 37 },
-  { id: "JK-AC-038", name: 'D. H. Pora', state: 'Jammu & Kashmir', district: 'Kulgam', acNo: 38 },
-  { id: "JK-AC-039", name: 'Kulgam', state: 'Jammu & Kashmir', district: 'Kulgam', acNo: 39 },
-  { id: "JK-AC-040", name: 'Devsar', state: 'Jammu & Kashmir', district: 'Kulgam', acNo: 40 },
-  { id: "JK-AC-041", name: 'Dooru', state: 'Jammu & Kashmir', district: 'Anantnag', acNo: 41 },
-  { id: "JK-AC-042", name: 'Kokernag', state: 'Jammu & Kashmir', district: 'Anantnag', acNo: 42 },
-  { id: "JK-AC-043", name: 'Anantnag West', state: 'Jammu & Kashmir', district: 'Anantnag', acNo: 43 },
-  { id: "JK-AC-044", name: 'Anantnag', state: 'Jammu & Kashmir', district: 'Anantnag', acNo: 44 },
-  { id: "JK-AC-045", name: 'Srigufwara–Bijbehara', state: 'Jammu & Kashmir', district: 'Anantnag', acNo: 45 },
-  { id: "JK-AC-046", name: 'Shangus–Anantnag East', state: 'Jammu & Kashmir', district: 'Anantnag', acNo: 46 },
-  { id: "JK-AC-047", name: 'Pahalgam', state: 'Jammu & Kashmir', district: 'Anantnag', acNo: 47 },
-  { id: "JK-AC-048", name: 'Inderwal', state: 'Jammu & Kashmir', district: 'Kishtawar', acNo: 48 },
-  { id: "JK-AC-049", name: 'Kishtwar', state: 'Jammu & Kashmir', district: 'Kishtawar', acNo: 49 },
-  { id: "JK-AC-050", name: 'Padder–Nagseni', state: 'Jammu & Kashmir', district: 'Kishtawar', acNo: 50 },
-  { id: "JK-AC-051", name: 'Bhadarwah', state: 'Jammu & Kashmir', district: 'Doda', acNo: 51 },
-  { id: "JK-AC-052", name: 'Doda', state: 'Jammu & Kashmir', district: 'Doda', acNo: 52 },
-  { id: "JK-AC-053", name: 'Doda West', state: 'Jammu & Kashmir', district: 'Doda', acNo: 53 },
-  { id: "JK-AC-054", name: 'Ramban', state: 'Jammu & Kashmir', district: 'Ramban', acNo: 54 },
-  { id: "JK-AC-055", name: 'Banihal', state: 'Jammu & Kashmir', district: 'Ramban', acNo: 55 },
-  { id: "JK-AC-056", name: 'Gulabgarh', state: 'Jammu & Kashmir', district: 'Reasi', acNo: 56 },
-  { id: "JK-AC-057", name: 'Reasi', state: 'Jammu & Kashmir', district: 'Reasi', acNo: 57 },
-  { id: "JK-AC-058", name: 'Shri Mata Vaishno Devi', state: 'Jammu & Kashmir', district: 'Reasi', acNo: 58 },
-  { id: "JK-AC-059", name: 'Udhampur West', state: 'Jammu & Kashmir', district: 'Udhampur', acNo: 59 },
-  { id: "JK-AC-060", name: 'Udhampur East', state: 'Jammu & Kashmir', district: 'Udhampur', acNo: 60 },
-  { id: "JK-AC-061", name: 'Chenani', state: 'Jammu & Kashmir', district: 'Udhampur', acNo: 61 },
-  { id: "JK-AC-062", name: 'Ramnagar', state: 'Jammu & Kashmir', district: 'Udhampur', acNo: 62 },
-  { id: "JK-AC-063", name: 'Bani', state: 'Jammu & Kashmir', district: 'Kathua', acNo: 63 },
-  { id: "JK-AC-064", name: 'Billawar', state: 'Jammu & Kashmir', district: 'Kathua', acNo: 64 },
-  { id: "JK-AC-065", name: 'Basohli', state: 'Jammu & Kashmir', district: 'Kathua', acNo: 65 },
-  { id: "JK-AC-066", name: 'Jasrota', state: 'Jammu & Kashmir', district: 'Kathua', acNo: 66 },
-  { id: "JK-AC-067", name: 'Kathua', state: 'Jammu & Kashmir', district: 'Kathua', acNo: 67 },
-  { id: "JK-AC-068", name: 'Hiranagar', state: 'Jammu & Kashmir', district: 'Kathua', acNo: 68 },
-  { id: "JK-AC-069", name: 'Ramgarh', state: 'Jammu & Kashmir', district: 'Samba', acNo: 69 },
-  { id: "JK-AC-070", name: 'Samba', state: 'Jammu & Kashmir', district: 'Samba', acNo: 70 },
-  { id: "JK-AC-071", name: 'Vijaypur', state: 'Jammu & Kashmir', district: 'Samba', acNo: 71 },
-  { id: "JK-AC-072", name: 'Bishnah', state: 'Jammu & Kashmir', district: 'Jammu', acNo: 72 },
-  { id: "JK-AC-073", name: 'Suchetgarh', state: 'Jammu & Kashmir', district: 'Jammu', acNo: 73 },
-  { id: "JK-AC-074", name: 'R. S. Pura–Jammu South', state: 'Jammu & Kashmir', district: 'Jammu', acNo: 74 },
-  { id: "JK-AC-075", name: 'Bahu', state: 'Jammu & Kashmir', district: 'Jammu', acNo: 75 },
-  { id: "JK-AC-076", name: 'Jammu East', state: 'Jammu & Kashmir', district: 'Jammu', acNo: 76 },
-  { id: "JK-AC-077", name: 'Nagrota', state: 'Jammu & Kashmir', district: 'Jammu', acNo: 77 },
-  { id: "JK-AC-078", name: 'Jammu West', state: 'Jammu & Kashmir', district: 'Jammu', acNo: 78 },
-  { id: "JK-AC-079", name: 'Jammu North', state: 'Jammu & Kashmir', district: 'Jammu', acNo: 79 },
-  { id: "JK-AC-080", name: 'Marh', state: 'Jammu & Kashmir', district: 'Jammu', acNo: 80 },
-  { id: "JK-AC-081", name: 'Akhnoor', state: 'Jammu & Kashmir', district: 'Jammu', acNo: 81 },
-  { id: "JK-AC-082", name: 'Chhamb', state: 'Jammu & Kashmir', district: 'Jammu', acNo: 82 },
-  { id: "JK-AC-083", name: 'Kalakote–Sunderbani', state: 'Jammu & Kashmir', district: 'Rajouri', acNo: 83 },
-  { id: "JK-AC-084", name: 'Nowshera', state: 'Jammu & Kashmir', district: 'Rajouri', acNo: 84 },
-  { id: "JK-AC-085", name: 'Rajouri', state: 'Jammu & Kashmir', district: 'Rajouri', acNo: 85 },
-  { id: "JK-AC-086", name: 'Budhal', state: 'Jammu & Kashmir', district: 'Rajouri', acNo: 86 },
-  { id: "JK-AC-087", name: 'Thannamandi', state: 'Jammu & Kashmir', district: 'Rajouri', acNo: 87 },
-  { id: "JK-AC-088", name: 'Surankote', state: 'Jammu & Kashmir', district: 'Poonch', acNo: 88 },
-  { id: "JK-AC-089", name: 'Poonch Haveli', state: 'Jammu & Kashmir', district: 'Poonch', acNo: 89 },
-  { id: "JK-AC-090", name: 'Mendhar', state: 'Jammu & Kashmir', district: 'Poonch', acNo: 90 },
+  'Karnah',960,'Trehgam',960,'Kupwara',960,'Lolab',960,'Handwara',960,'Langate',960,
+  'Sopore',662,'Rafiabad',662,'Uri',662,'Baramulla',662,'Gulmarg',662,'Wagoora–Kreeri',662,
+  'Pattan',662,'Sonawari',656,'Bandipora',656,'Gurez',656,'Kangan',800,'Ganderbal',800,
+  'Hazratbal',1226,'Khanyar',1226,'Habba Kadal',1226,'Lal Chowk',1226,'Chanapora',1226,'Zadibal',1226,
+  'Eidgah',1226,'Central Shalteng',1226,'Budgam',703,'Beerwah',703,'Khan Sahib',703,'Chrar-i-Sharief',703,
+  'Chadoora',703,'Pampore',1115,'Tral',1115,'Pulwama',1115,'Rajpora',1115,'Zainapora',1189,
+  'Shopian',1189,'D. H. Pora',958,'Kulgam',958,'Devsar',958,'Dooru',629,'Kokernag',629,
+  'Anantnag West',629,'Anantnag',629,'Srigufwara–Bijbehara',629,'Shangus–Anantnag East',629,'Pahalgam',629,'Inderwal',937,
+  'Kishtwar',937,'Padder–Nagseni',937,'Bhadarwah',769,'Doda',769,'Doda West',769,'Ramban',1133,
+  'Banihal',1133,'Gulabgarh',1141,'Reasi',1141,'Shri Mata Vaishno Devi',1141,'Udhampur West',1265,'Udhampur East',1265,
+  'Chenani',1265,'Ramnagar',1265,'Bani',916,'Billawar',916,'Basohli',916,'Jasrota',916,
+  'Kathua',916,'Hiranagar',916,'Ramgarh',1159,'Samba',1159,'Vijaypur',1159,'Bishnah',863,
+  'Suchetgarh',863,'R. S. Pura–Jammu South',863,'Bahu',863,'Jammu East',863,'Nagrota',863,'Jammu West',863,
+  'Jammu North',863,'Marh',863,'Akhnoor',863,'Chhamb',863,'Kalakote–Sunderbani',1130,'Nowshera',1130,
+  'Rajouri',1130,'Budhal',1130,'Thannamandi',1130,'Surankote',1109,'Poonch Haveli',1109,'Mendhar',1109,
   // Puducherry (30)
-  { id: "PY-AC-001", name: 'Mannadipet', state: 'Puducherry', district: 'Puducherry', acNo: 1 },
-  { id: "PY-AC-002", name: 'Thirubuvanai', state: 'Puducherry', district: 'Puducherry', acNo: 2 },
-  { id: "PY-AC-003", name: 'Ossudu', state: 'Puducherry', district: 'Puducherry', acNo: 3 },
-  { id: "PY-AC-004", name: 'Mangalam', state: 'Puducherry', district: 'Puducherry', acNo: 4 },
-  { id: "PY-AC-005", name: 'Villianur', state: 'Puducherry', district: 'Puducherry', acNo: 5 },
-  { id: "PY-AC-006", name: 'Ozhukarai', state: 'Puducherry', district: 'Puducherry', acNo: 6 },
-  { id: "PY-AC-007", name: 'Kadirkamam', state: 'Puducherry', district: 'Puducherry', acNo: 7 },
-  { id: "PY-AC-008", name: 'Indira Nagar', state: 'Puducherry', district: 'Puducherry', acNo: 8 },
-  { id: "PY-AC-009", name: 'Thattanchavady', state: 'Puducherry', district: 'Puducherry', acNo: 9 },
-  { id: "PY-AC-010", name: 'Kamaraj Nagar', state: 'Puducherry', district: 'Puducherry', acNo: 10 },
-  { id: "PY-AC-011", name: 'Lawspet', state: 'Puducherry', district: 'Puducherry', acNo: 11 },
-  { id: "PY-AC-012", name: 'Kalapet', state: 'Puducherry', district: 'Puducherry', acNo: 12 },
-  { id: "PY-AC-013", name: 'Muthialpet', state: 'Puducherry', district: 'Puducherry', acNo: 13 },
-  { id: "PY-AC-014", name: 'Raj Bhavan', state: 'Puducherry', district: 'Puducherry', acNo: 14 },
-  { id: "PY-AC-015", name: 'Oupalam', state: 'Puducherry', district: 'Puducherry', acNo: 15 },
-  { id: "PY-AC-016", name: 'Orleampeth', state: 'Puducherry', district: 'Puducherry', acNo: 16 },
-  { id: "PY-AC-017", name: 'Nellithope', state: 'Puducherry', district: 'Puducherry', acNo: 17 },
-  { id: "PY-AC-018", name: 'Mudaliarpet', state: 'Puducherry', district: 'Puducherry', acNo: 18 },
-  { id: "PY-AC-019", name: 'Ariankuppam', state: 'Puducherry', district: 'Puducherry', acNo: 19 },
-  { id: "PY-AC-020", name: 'Manavely', state: 'Puducherry', district: 'Puducherry', acNo: 20 },
-  { id: "PY-AC-021", name: 'Embalam', state: 'Puducherry', district: 'Puducherry', acNo: 21 },
-  { id: "PY-AC-022", name: 'Nettapakkam', state: 'Puducherry', district: 'Puducherry', acNo: 22 },
-  { id: "PY-AC-023", name: 'Bahour', state: 'Puducherry', district: 'Puducherry', acNo: 23 },
-  { id: "PY-AC-024", name: 'Nedungadu', state: 'Puducherry', district: 'Karaikal', acNo: 24 },
-  { id: "PY-AC-025", name: 'Thirunallar', state: 'Puducherry', district: 'Karaikal', acNo: 25 },
-  { id: "PY-AC-026", name: 'Karaikal North', state: 'Puducherry', district: 'Karaikal', acNo: 26 },
-  { id: "PY-AC-027", name: 'Karaikal South', state: 'Puducherry', district: 'Karaikal', acNo: 27 },
-  { id: "PY-AC-028", name: 'Neravy T. R. Pattinam', state: 'Puducherry', district: 'Karaikal', acNo: 28 },
-  { id: "PY-AC-029", name: 'Mahe', state: 'Puducherry', district: 'Mahe', acNo: 29 },
-  { id: "PY-AC-030", name: 'Yanam', state: 'Puducherry', district: 'Yanam', acNo: 30 },
+  'Mannadipet',30,'Thirubuvanai',30,'Ossudu',30,'Mangalam',30,'Villianur',30,'Ozhukarai',30,
+  'Kadirkamam',30,'Indira Nagar',30,'Thattanchavady',30,'Kamaraj Nagar',30,'Lawspet',30,'Kalapet',30,
+  'Muthialpet',30,'Raj Bhavan',30,'Oupalam',30,'Orleampeth',30,'Nellithope',30,'Mudaliarpet',30,
+  'Ariankuppam',30,'Manavely',30,'Embalam',30,'Nettapakkam',30,'Bahour',30,'Nedungadu',907,
+  'Thirunallar',907,'Karaikal North',907,'Karaikal South',907,'Neravy T. R. Pattinam',907,'Mahe',992,'Yanam',1306,
+];
+
+// Per state: name, code (string indexes), AC count; ACs are numbered 1..count
+const _st = [
+  0,31,175,
+  1,32,60,
+  2,33,126,
+  3,34,243,
+  4,35,90,
+  5,36,40,
+  6,37,182,
+  7,38,90,
+  8,39,68,
+  9,40,81,
+  10,41,224,
+  11,42,140,
+  12,43,230,
+  13,44,288,
+  14,45,60,
+  15,46,60,
+  16,47,40,
+  17,48,60,
+  18,49,147,
+  19,50,117,
+  20,51,200,
+  21,52,32,
+  22,53,234,
+  23,54,119,
+  24,55,60,
+  25,56,403,
+  26,57,70,
+  27,58,294,
+  28,59,70,
+  29,60,90,
+  30,61,30,
 ];
 
+const assemblyConstituencies = [];
+for (let i = 0, k = 0; i < _st.length; i += 3) {
+  const state = _s[_st[i]];
+  const code = _s[_st[i + 1]];
+  for (let acNo = 1; acNo <= _st[i + 2]; acNo++, k += 2) {
+    const entry = { id: `${code}-AC-${String(acNo).padStart(3, '0')}`, name: _a[k], state };
+    if (_a[k + 1] >= 0) entry.district = _s[_a[k + 1]];
+    entry.acNo = acNo;
+    assemblyConstituencies.push(entry);
+  }
+}
+
 export default assemblyConstituencies;
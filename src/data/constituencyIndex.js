@@ -0,0 +1,716 @@
+// Reverse indexes over pcToAcMapping: AC → PC, district → ACs, district → PCs
+// Generated by scripts/generate_constituency_index.py; see it for the layout
+// 543 PCs, 4123 ACs, 710 districts
+
+import _s, { acId } from './stringTable';
+// Encoded against stringTable.js tableDigest 05cb28c7c3
+
+const _ak = [
+  31001,31002,31003,31004,31005,31006,31007,31008,31009,31010,31011,31012,31013,31014,31015,31016,31017,31018,31019,31020,31021,31022,31023,31024,
+  31025,31026,31027,31028,31029,31030,31031,31032,31033,31034,31035,31036,31037,31038,31039,31040,31041,31042,31043,31044,31045,31046,31047,31048,
+  31049,31050,31051,31052,31053,31054,31055,31056,31057,31058,31059,31060,31061,31062,31063,31064,31065,31066,31067,31068,31069,31070,31071,31072,
+  31073,31074,31075,31076,31077,31078,31079,31080,31081,31082,31083,31084,31085,31086,31087,31088,31089,31090,31091,31092,31093,31094,31095,31096,
+  31097,31098,31099,31100,31101,31102,31103,31104,31105,31106,31107,31108,31109,31110,31111,31112,31113,31114,31115,31116,31117,31118,31119,31120,
+  31121,31122,31123,31124,31125,31126,31127,31128,31129,31130,31131,31132,31133,31134,31135,31136,31137,31138,31139,31140,31141,31142,31143,31144,
+  31145,31146,31147,31148,31149,31150,31151,31152,31153,31154,31155,31156,31157,31158,31159,31160,31161,31162,31163,31164,31165,31166,31167,31168,
+  31169,31170,31171,31172,31173,31174,31175,32001,32002,32003,32004,32005,32006,32007,32008,32009,32010,32011,32012,32013,32014,32015,32016,32017,
+  32018,32019,32020,32021,32022,32023,32024,32025,32026,32027,32028,32029,32030,32031,32032,32033,32034,32035,32036,32037,32038,32039,32040,32041,
+  32042,32043,32044,32045,32046,32047,32048,32049,32050,32051,32052,32053,32054,32055,32056,32057,32058,32059,32060,33001,33002,33003,33004,33005,
+  33006,33007,33008,33009,33010,33011,33012,33013,33014,33015,33016,33017,33018,33019,33020,33021,33022,33023,33024,33025,33026,33027,33028,33029,
+  33030,33031,33032,33033,33034,33035,33036,33037,33038,33039,33040,33041,33042,33043,33044,33045,33046,33047,33048,33049,33050,33051,33052,33053,
+  33054,33055,33056,33057,33058,33059,33060,33061,33062,33063,33064,33065,33066,33067,33068,33069,33070,33071,33072,33073,33074,33075,33076,33077,
+  33078,33079,33080,33081,33082,33083,33084,33085,33086,33087,33088,33089,33090,33091,33092,33093,33094,33095,33096,33097,33098,33099,33100,33101,
+  33102,33103,33104,33105,33106,33107,33108,33109,33110,33111,33112,33113,33114,33115,33116,33117,33118,33119,33120,33121,33122,33123,33124,33125,
+  33126,34001,34002,34003,34004,34005,34006,34007,34008,34009,34010,34011,34012,34013,34014,34015,34016,34017,34018,34019,34020,34021,34022,34023,
+  34024,34025,34026,34027,34028,34029,34030,34031,34032,34033,34034,34035,34036,34037,34038,34039,34040,34041,34042,34043,34044,34045,34046,34047,
+  34048,34049,34050,34051,34052,34053,34054,34055,34056,34057,34058,34059,34060,34061,34062,34063,34064,34065,34066,34067,34068,34069,34070,34071,
+  34072,34073,34074,34075,34076,34077,34078,34079,34080,34081,34082,34083,34084,34085,34086,34087,34088,34089,34090,34091,34092,34093,34094,34095,
+  34096,34097,34098,34099,34100,34101,34102,34103,34104,34105,34106,34107,34108,34109,34110,34111,34112,34113,34114,34115,34116,34117,34118,34119,
+  34120,34121,34122,34123,34124,34125,34126,34127,34128,34129,34130,34131,34132,34133,34134,34135,34136,34137,34138,34139,34140,34141,34142,34143,
+  34144,34145,34146,34147,34148,34149,34150,34151,34152,34153,34154,34155,34156,34157,34158,34159,34160,34161,34162,34163,34164,34165,34166,34167,
+  34168,34169,34170,34171,34172,34173,34174,34175,34176,34177,34178,34179,34180,34181,34182,34183,34184,34185,34186,34187,34188,34189,34190,34191,
+  34192,34193,34194,34195,34196,34197,34198,34199,34200,34201,34202,34203,34204,34205,34206,34207,34208,34209,34210,34211,34212,34213,34214,34215,
+  34216,34217,34218,34219,34220,34221,34222,34223,34224,34225,34226,34227,34228,34229,34230,34231,34232,34233,34234,34235,34236,34237,34238,34239,
+  34240,34241,34242,34243,35001,35002,35003,35004,35005,35006,35007,35008,35009,35010,35011,35012,35013,35014,35015,35016,35017,35018,35019,35020,
+  35021,35022,35023,35024,35025,35026,35027,35028,35029,35030,35031,35032,35033,35034,35035,35036,35037,35038,35039,35040,35041,35042,35043,35044,
+  35045,35046,35047,35048,35049,35050,35051,35052,35053,35054,35055,35056,35057,35058,35059,35060,35061,35062,35063,35064,35065,35066,35067,35068,
+  35069,35070,35071,35072,35073,35074,35075,35076,35077,35078,35079,35080,35081,35082,35083,35084,35085,35086,35087,35088,35089,35090,36001,36002,
+  36003,36004,36005,36006,36007,36008,36009,36010,36011,36012,36013,36014,36015,36016,36017,36018,36019,36020,36021,36022,36023,36024,36025,36026,
+  36027,36028,36029,36030,36031,36032,36033,36034,36035,36036,36037,36038,36039,36040,37001,37002,37003,37004,37005,37006,37007,37008,37009,37010,
+  37011,37012,37013,37014,37015,37016,37017,37018,37019,37020,37021,37022,37023,37024,37025,37026,37027,37028,37029,37030,37031,37032,37033,37034,
+  37035,37036,37037,37038,37039,37040,37041,37042,37043,37044,37045,37046,37047,37048,37049,37050,37051,37052,37053,37054,37055,37056,37057,37058,
+  37059,37060,37061,37062,37063,37064,37065,37066,37067,37068,37069,37070,37071,37072,37073,37074,37075,37076,37077,37078,37079,37080,37081,37082,
+  37083,37084,37085,37086,37087,37088,37089,37090,37091,37092,37093,37094,37095,37096,37097,37098,37099,37100,37101,37102,37103,37104,37105,37106,
+  37107,37108,37109,37110,37111,37112,37113,37114,37115,37116,37117,37118,37119,37120,37121,37122,37123,37124,37125,37126,37127,37128,37129,37130,
+  37131,37132,37133,37134,37135,37136,37137,37138,37139,37140,37141,37142,37143,37144,37145,37146,37147,37148,37149,37150,37151,37152,37153,37154,
+  37155,37156,37157,37158,37159,37160,37161,37162,37163,37164,37165,37166,37167,37168,37169,37170,37171,37172,37173,37174,37175,37176,37177,37178,
+  37179,37180,37181,37182,38001,38002,38003,38004,38005,38006,38007,38008,38009,38010,38011,38012,38013,38014,38015,38016,38017,38018,38019,38020,
+  38021,38022,38023,38024,38025,38026,38027,38028,38029,38030,38031,38032,38033,38034,38035,38036,38037,38038,38039,38040,38041,38042,38043,38044,
+  38045,38046,38047,38048,38049,38050,38051,38052,38053,38054,38055,38056,38057,38058,38059,38060,38061,38062,38063,38064,38065,38066,38067,38068,
+  38069,38070,38071,38072,38073,38074,38075,38076,38077,38078,38079,38080,38081,38082,38083,38084,38085,38086,38087,38088,38089,38090,39001,39002,
+  39003,39004,39005,39006,39007,39008,39009,39010,39011,39012,39013,39014,39015,39016,39017,39018,39019,39020,39021,39022,39023,39024,39025,39026,
+  39027,39028,39029,39030,39031,39032,39033,39034,39035,39036,39037,39038,39039,39040,39041,39042,39043,39044,39045,39046,39047,39048,39049,39050,
+  39051,39052,39053,39054,39055,39056,39057,39058,39059,39060,39061,39062,39063,39064,39065,39066,39067,39068,40001,40002,40003,40004,40005,40006,
+  40007,40008,40009,40010,40011,40012,40013,40014,40015,40016,40017,40018,40019,40020,40021,40022,40023,40024,40025,40026,40027,40028,40029,40030,
+  40031,40032,40033,40034,40035,40036,40037,40038,40039,40040,40041,40042,40043,40044,40045,40046,40047,40048,40049,40050,40051,40052,40053,40054,
+  40055,40056,40057,40058,40059,40060,40061,40062,40063,40064,40065,40066,40067,40068,40069,40070,40071,40072,40073,40074,40075,40076,40077,40078,
+  40079,40080,40081,41001,41002,41003,41004,41005,41006,41007,41008,41009,41010,41011,41012,41013,41014,41015,41016,41017,41018,41019,41020,41021,
+  41022,41023,41024,41025,41026,41027,41028,41029,41030,41031,41032,41033,41034,41035,41036,41037,41038,41039,41040,41041,41042,41043,41044,41045,
+  41046,41047,41048,41049,41050,41051,41052,41053,41054,41055,41056,41057,41058,41059,41060,41061,41062,41063,41064,41065,41066,41067,41068,41069,
+  41070,41071,41072,41073,41074,41075,41076,41077,41078,41079,41080,41081,41082,41083,41084,41085,41086,41087,41088,41089,41090,41091,41092,41093,
+  41094,41095,41096,41097,41098,41099,41100,41101,41102,41103,41104,41105,41106,41107,41108,41109,41110,41111,41112,41113,41114,41115,41116,41117,
+  41118,41119,41120,41121,41122,41123,41124,41125,41126,41127,41128,41129,41130,41131,41132,41133,41134,41135,41136,41137,41138,41139,41140,41141,
+  41142,41143,41144,41145,41146,41147,41148,41149,41150,41151,41152,41153,41154,41155,41156,41157,41158,41159,41160,41161,41162,41163,41164,41165,
+  41166,41167,41168,41169,41170,41171,41172,41173,41174,41175,41176,41177,41178,41179,41180,41181,41182,41183,41184,41185,41186,41187,41188,41189,
+  41190,41191,41192,41193,41194,41195,41196,41197,41198,41199,41200,41201,41202,41203,41204,41205,41206,41207,41208,41209,41210,41211,41212,41213,
+  41214,41215,41216,41217,41218,41219,41220,41221,41222,41223,41224,42001,42002,42003,42004,42005,42006,42007,42008,42009,42010,42011,42012,42013,
+  42014,42015,42016,42017,42018,42019,42020,42021,42022,42023,42024,42025,42026,42027,42028,42029,42030,42031,42032,42033,42034,42035,42036,42037,
+  42038,42039,42040,42041,42042,42043,42044,42045,42046,42047,42048,42049,42050,42051,42052,42053,42054,42055,42056,42057,42058,42059,42060,42061,
+  42062,42063,42064,42065,42066,42067,42068,42069,42070,42071,42072,42073,42074,42075,42076,42077,42078,42079,42080,42081,42082,42083,42084,42085,
+  42086,42087,42088,42089,42090,42091,42092,42093,42094,42095,42096,42097,42098,42099,42100,42101,42102,42103,42104,42105,42106,42107,42108,42109,
+  42110,42111,42112,42113,42114,42115,42116,42117,42118,42119,42120,42121,42122,42123,42124,42125,42126,42127,42128,42129,42130,42131,42132,42133,
+  42134,42135,42136,42137,42138,42139,42140,43001,43002,43003,43004,43005,43006,43007,43008,43009,43010,43011,43012,43013,43014,43015,43016,43017,
+  43018,43019,43020,43021,43022,43023,43024,43025,43026,43027,43028,43029,43030,43031,43032,43033,43034,43035,43036,43037,43038,43039,43040,43041,
+  43042,43043,43044,43045,43046,43047,43048,43049,43050,43051,43052,43053,43054,43055,43056,43057,43058,43059,43060,43061,43062,43063,43064,43065,
+  43066,43067,43068,43069,43070,43071,43072,43073,43074,43075,43076,43077,43078,43079,43080,43081,43082,43083,43084,43085,43086,43087,43088,43089,
+  43090,43091,43092,43093,43094,43095,43096,43097,43098,43099,43100,43101,43102,43103,43104,43105,43106,43107,43108,43109,43110,43111,43112,43113,
+  43114,43115,43116,43117,43118,43119,43120,43121,43122,43123,43124,43125,43126,43127,43128,43129,43130,43131,43132,43133,43134,43135,43136,43137,
+  43138,43139,43140,43141,43142,43143,43144,43145,43146,43147,43148,43149,43150,43151,43152,43153,43154,43155,43156,43157,43158,43159,43160,43161,
+  43162,43163,43164,43165,43166,43167,43168,43169,43170,43171,43172,43173,43174,43175,43176,43177,43178,43179,43180,43181,43182,43183,43184,43185,
+  43186,43187,43188,43189,43190,43191,43192,43193,43194,43195,43196,43197,43198,43199,43200,43201,43202,43203,43204,43205,43206,43207,43208,43209,
+  43210,43211,43212,43213,43214,43215,43216,43217,43218,43219,43220,43221,43222,43223,43224,43225,43226,43227,43228,43229,43230,44001,44002,44003,
+  44004,44005,44006,44007,44008,44009,44010,44011,44012,44013,44014,44015,44016,44017,44018,44019,44020,44021,44022,44023,44024,44025,44026,44027,
+  44028,44029,44030,44031,44032,44033,44034,44035,44036,44037,44038,44039,44040,44041,44042,44043,44044,44045,44046,44047,44048,44049,44050,44051,
+  44052,44053,44054,44055,44056,44057,44058,44059,44060,44061,44062,44063,44064,44065,44066,44067,44068,44069,44070,44071,44072,44073,44074,44075,
+  44076,44077,44078,44079,44080,44081,44082,44083,44084,44085,44086,44087,44088,44089,44090,44091,44092,44093,44094,44095,44096,44097,44098,44099,
+  44100,44101,44102,44103,44104,44105,44106,44107,44108,44109,44110,44111,44112,44113,44114,44115,44116,44117,44118,44119,44120,44121,44122,44123,
+  44124,44125,44126,44127,44128,44129,44130,44131,44132,44133,44134,44135,44136,44137,44138,44139,44140,44141,44142,44143,44144,44145,44146,44147,
+  44148,44149,44150,44151,44152,44153,44154,44155,44156,44157,44158,44159,44160,44161,44162,44163,44164,44165,44166,44167,44168,44169,44170,44171,
+  44172,44173,44174,44175,44176,44177,44178,44179,44180,44181,44182,44183,44184,44185,44186,44187,44188,44189,44190,44191,44192,44193,44194,44195,
+  44196,44197,44198,44199,44200,44201,44202,44203,44204,44205,44206,44207,44208,44209,44210,44211,44212,44213,44214,44215,44216,44217,44218,44219,
+  44220,44221,44222,44223,44224,44225,44226,44227,44228,44229,44230,44231,44232,44233,44234,44235,44236,44237,44238,44239,44240,44241,44242,44243,
+  44244,44245,44246,44247,44248,44249,44250,44251,44252,44253,44254,44255,44256,44257,44258,44259,44260,44261,44262,44263,44264,44265,44266,44267,
+  44268,44269,44270,44271,44272,44273,44274,44275,44276,44277,44278,44279,44280,44281,44282,44283,44284,44285,44286,44287,44288,45001,45002,45003,
+  45004,45005,45006,45007,45008,45009,45010,45011,45012,45013,45014,45015,45016,45017,45018,45019,45020,45021,45022,45023,45024,45025,45026,45027,
+  45028,45029,45030,45031,45032,45033,45034,45035,45036,45037,45038,45039,45040,45041,45042,45043,45044,45045,45046,45047,45048,45049,45050,45051,
+  45052,45053,45054,45055,45056,45057,45058,45059,45060,46001,46002,46003,46004,46005,46006,46007,46008,46009,46010,46011,46012,46013,46014,46015,
+  46016,46017,46018,46019,46020,46021,46022,46023,46024,46025,46026,46027,46028,46029,46030,46031,46032,46033,46034,46035,46036,46037,46038,46039,
+  46040,46041,46042,46043,46044,46045,46046,46047,46048,46049,46050,46051,46052,46053,46054,46055,46056,46057,46058,46059,46060,47001,47002,47003,
+  47004,47005,47006,47007,47008,47009,47010,47011,47012,47013,47014,47015,47016,47017,47018,47019,47020,47021,47022,47023,47024,47025,47026,47027,
+  47028,47029,47030,47031,47032,47033,47034,47035,47036,47037,47038,47039,47040,48001,48002,48003,48004,48005,48006,48007,48008,48009,48010,48011,
+  48012,48013,48014,48015,48016,48017,48018,48019,48020,48021,48022,48023,48024,48025,48026,48027,48028,48029,48030,48031,48032,48033,48034,48035,
+  48036,48037,48038,48039,48040,48041,48042,48043,48044,48045,48046,48047,48048,48049,48050,48051,48052,48053,48054,48055,48056,48057,48058,48059,
+  48060,49001,49002,49003,49004,49005,49006,49007,49008,49009,49010,49011,49012,49013,49014,49015,49016,49017,49018,49019,49020,49021,49022,49023,
+  49024,49025,49026,49027,49028,49029,49030,49031,49032,49033,49034,49035,49036,49037,49038,49039,49040,49041,49042,49043,49044,49045,49046,49047,
+  49048,49049,49050,49051,49052,49053,49054,49055,49056,49057,49058,49059,49060,49061,49062,49063,49064,49065,49066,49067,49068,49069,49070,49071,
+  49072,49073,49074,49075,49076,49077,49078,49079,49080,49081,49082,49083,49084,49085,49086,49087,49088,49089,49090,49091,49092,49093,49094,49095,
+  49096,49097,49098,49099,49100,49101,49102,49103,49104,49105,49106,49107,49108,49109,49110,49111,49112,49113,49114,49115,49116,49117,49118,49119,
+  49120,49121,49122,49123,49124,49125,49126,49127,49128,49129,49130,49131,49132,49133,49134,49135,49136,49137,49138,49139,49140,49141,49142,49143,
+  49144,49145,49146,49147,50001,50002,50003,50004,50005,50006,50007,50008,50009,50010,50011,50012,50013,50014,50015,50016,50017,50018,50019,50020,
+  50021,50022,50023,50024,50025,50026,50027,50028,50029,50030,50031,50032,50033,50034,50035,50036,50037,50038,50039,50040,50041,50042,50043,50044,
+  50045,50046,50047,50048,50049,50050,50051,50052,50053,50054,50055,50056,50057,50058,50059,50060,50061,50062,50063,50064,50065,50066,50067,50068,
+  50069,50070,50071,50072,50073,50074,50075,50076,50077,50078,50079,50080,50081,50082,50083,50084,50085,50086,50087,50088,50089,50090,50091,50092,
+  50093,50094,50095,50096,50097,50098,50099,50100,50101,50102,50103,50104,50105,50106,50107,50108,50109,50110,50111,50112,50113,50114,50115,50116,
+  50117,51001,51002,51003,51004,51005,51006,51007,51008,51009,51010,51011,51012,51013,51014,51015,51016,51017,51018,51019,51020,51021,51022,51023,
+  51024,51025,51026,51027,51028,51029,51030,51031,51032,51033,51034,51035,51036,51037,51038,51039,51040,51041,51042,51043,51044,51045,51046,51047,
+  51048,51049,51050,51051,51052,51053,51054,51055,51056,51057,51058,51059,51060,51061,51062,51063,51064,51065,51066,51067,51068,51069,51070,51071,
+  51072,51073,51074,51075,51076,51077,51078,51079,51080,51081,51082,51083,51084,51085,51086,51087,51088,51089,51090,51091,51092,51093,51094,51095,
+  51096,51097,51098,51099,51100,51101,51102,51103,51104,51105,51106,51107,51108,51109,51110,51111,51112,51113,51114,51115,51116,51117,51118,51119,
+  51120,51121,51122,51123,51124,51125,51126,51127,51128,51129,51130,51131,51132,51133,51134,51135,51136,51137,51138,51139,51140,51141,51142,51143,
+  51144,51145,51146,51147,51148,51149,51150,51151,51152,51153,51154,51155,51156,51157,51158,51159,51160,51161,51162,51163,51164,51165,51166,51167,
+  51168,51169,51170,51171,51172,51173,51174,51175,51176,51177,51178,51179,51180,51181,51182,51183,51184,51185,51186,51187,51188,51189,51190,51191,
+  51192,51193,51194,51195,51196,51197,51198,51199,51200,52001,52002,52003,52004,52005,52006,52007,52008,52009,52010,52011,52012,52013,52014,52015,
+  52016,52017,52018,52019,52020,52021,52022,52023,52024,52025,52026,52027,52028,52029,52030,52031,52032,53001,53002,53003,53004,53005,53006,53007,
+  53008,53009,53010,53011,53012,53013,53014,53015,53016,53017,53018,53019,53020,53021,53022,53023,53024,53025,53026,53027,53028,53029,53030,53031,
+  53032,53033,53034,53035,53036,53037,53038,53039,53040,53041,53042,53043,53044,53045,53046,53047,53048,53049,53050,53051,53052,53053,53054,53055,
+  53056,53057,53058,53059,53060,53061,53062,53063,53064,53065,53066,53067,53068,53069,53070,53071,53072,53073,53074,53075,53076,53077,53078,53079,
+  53080,53081,53082,53083,53084,53085,53086,53087,53088,53089,53090,53091,53092,53093,53094,53095,53096,53097,53098,53099,53100,53101,53102,53103,
+  53104,53105,53106,53107,53108,53109,53110,53111,53112,53113,53114,53115,53116,53117,53118,53119,53120,53121,53122,53123,53124,53125,53126,53127,
+  53128,53129,53130,53131,53132,53133,53134,53135,53136,53137,53138,53139,53140,53141,53142,53143,53144,53145,53146,53147,53148,53149,53150,53151,
+  53152,53153,53154,53155,53156,53157,53158,53159,53160,53161,53162,53163,53164,53165,53166,53167,53168,53169,53170,53171,53172,53173,53174,53175,
+  53176,53177,53178,53179,53180,53181,53182,53183,53184,53185,53186,53187,53188,53189,53190,53191,53192,53193,53194,53195,53196,53197,53198,53199,
+  53200,53201,53202,53203,53204,53205,53206,53207,53208,53209,53210,53211,53212,53213,53214,53215,53216,53217,53218,53219,53220,53221,53222,53223,
+  53224,53225,53226,53227,53228,53229,53230,53231,53232,53233,53234,54001,54002,54003,54004,54005,54006,54007,54008,54009,54010,54011,54012,54013,
+  54014,54015,54016,54017,54018,54019,54020,54021,54022,54023,54024,54025,54026,54027,54028,54029,54030,54031,54032,54033,54034,54035,54036,54037,
+  54038,54039,54040,54041,54042,54043,54044,54045,54046,54047,54048,54049,54050,54051,54052,54053,54054,54055,54056,54057,54058,54059,54060,54061,
+  54062,54063,54064,54065,54066,54067,54068,54069,54070,54071,54072,54073,54074,54075,54076,54077,54078,54079,54080,54081,54082,54083,54084,54085,
+  54086,54087,54088,54089,54090,54091,54092,54093,54094,54095,54096,54097,54098,54099,54100,54101,54102,54103,54104,54105,54106,54107,54108,54109,
+  54110,54111,54112,54113,54114,54115,54116,54117,54118,54119,55001,55002,55003,55004,55005,55006,55007,55008,55009,55010,55011,55012,55013,55014,
+  55015,55016,55017,55018,55019,55020,55021,55022,55023,55024,55025,55026,55027,55028,55029,55030,55031,55032,55033,55034,55035,55036,55037,55038,
+  55039,55040,55041,55042,55043,55044,55045,55046,55047,55048,55049,55050,55051,55052,55053,55054,55055,55056,55057,55058,55059,55060,56001,56002,
+  56003,56004,56005,56006,56007,56008,56009,56010,56011,56012,56013,56014,56015,56016,56017,56018,56019,56020,56021,56022,56023,56024,56025,56026,
+  56027,56028,56029,56030,56031,56032,56033,56034,56035,56036,56037,56038,56039,56040,56041,56042,56043,56044,56045,56046,56047,56048,56049,56050,
+  56051,56052,56053,56054,56055,56056,56057,56058,56059,56060,56061,56062,56063,56064,56065,56066,56067,56068,56069,56070,56071,56072,56073,56074,
+  56075,56076,56077,56078,56079,56080,56081,56082,56083,56084,56085,56086,56087,56088,56089,56090,56091,56092,56093,56094,56095,56096,56097,56098,
+  56099,56100,56101,56102,56103,56104,56105,56106,56107,56108,56109,56110,56111,56112,56113,56114,56115,56116,56117,56118,56119,56120,56121,56122,
+  56123,56124,56125,56126,56127,56128,56129,56130,56131,56132,56133,56134,56135,56136,56137,56138,56139,56140,56141,56142,56143,56144,56145,56146,
+  56147,56148,56149,56150,56151,56152,56153,56154,56155,56156,56157,56158,56159,56160,56161,56162,56163,56164,56165,56166,56167,56168,56169,56170,
+  56171,56172,56173,56174,56175,56176,56177,56178,56179,56180,56181,56182,56183,56184,56185,56186,56187,56188,56189,56190,56191,56192,56193,56194,
+  56195,56196,56197,56198,56199,56200,56201,56202,56203,56204,56205,56206,56207,56208,56209,56210,56211,56212,56213,56214,56215,56216,56217,56218,
+  56219,56220,56221,56222,56223,56224,56225,56226,56227,56228,56229,56230,56231,56232,56233,56234,56235,56236,56237,56238,56239,56240,56241,56242,
+  56243,56244,56245,56246,56247,56248,56249,56250,56251,56252,56253,56254,56255,56256,56257,56258,56259,56260,56261,56262,56263,56264,56265,56266,
+  56267,56268,56269,56270,56271,56272,56273,56274,56275,56276,56277,56278,56279,56280,56281,56282,56283,56284,56285,56286,56287,56288,56289,56290,
+  56291,56292,56293,56294,56295,56296,56297,56298,56299,56300,56301,56302,56303,56304,56305,56306,56307,56308,56309,56310,56311,56312,56313,56314,
+  56315,56316,56317,56318,56319,56320,56321,56322,56323,56324,56325,56326,56327,56328,56329,56330,56331,56332,56333,56334,56335,56336,56337,56338,
+  56339,56340,56341,56342,56343,56344,56345,56346,56347,56348,56349,56350,56351,56352,56353,56354,56355,56356,56357,56358,56359,56360,56361,56362,
+  56363,56364,56365,56366,56367,56368,56369,56370,56371,56372,56373,56374,56375,56376,56377,56378,56379,56380,56381,56382,56383,56384,56385,56386,
+  56387,56388,56389,56390,56391,56392,56393,56394,56395,56396,56397,56398,56399,56400,56401,56402,56403,57001,57002,57003,57004,57005,57006,57007,
+  57008,57009,57010,57011,57012,57013,57014,57015,57016,57017,57018,57019,57020,57021,57022,57023,57024,57025,57026,57027,57028,57029,57030,57031,
+  57032,57033,57034,57035,57036,57037,57038,57039,57040,57041,57042,57043,57044,57045,57046,57047,57048,57049,57050,57051,57052,57053,57054,57055,
+  57056,57057,57058,57059,57060,57061,57062,57063,57064,57065,57066,57067,57068,57069,57070,58001,58002,58003,58004,58005,58006,58007,58008,58009,
+  58010,58011,58012,58013,58014,58015,58016,58017,58018,58019,58020,58021,58022,58023,58024,58025,58026,58027,58028,58029,58030,58031,58032,58033,
+  58034,58035,58036,58037,58038,58039,58040,58041,58042,58043,58044,58045,58046,58047,58048,58049,58050,58051,58052,58053,58054,58055,58056,58057,
+  58058,58059,58060,58061,58062,58063,58064,58065,58066,58067,58068,58069,58070,58071,58072,58073,58074,58075,58076,58077,58078,58079,58080,58081,
+  58082,58083,58084,58085,58086,58087,58088,58089,58090,58091,58092,58093,58094,58095,58096,58097,58098,58099,58100,58101,58102,58103,58104,58105,
+  58106,58107,58108,58109,58110,58111,58112,58113,58114,58115,58116,58117,58118,58119,58120,58121,58122,58123,58124,58125,58126,58127,58128,58129,
+  58130,58131,58132,58133,58134,58135,58136,58137,58138,58139,58140,58141,58142,58143,58144,58145,58146,58147,58148,58149,58150,58151,58152,58153,
+  58154,58155,58156,58157,58158,58159,58160,58161,58162,58163,58164,58165,58166,58167,58168,58169,58170,58171,58172,58173,58174,58175,58176,58177,
+  58178,58179,58180,58181,58182,58183,58184,58185,58186,58187,58188,58189,58190,58191,58192,58193,58194,58195,58196,58197,58198,58199,58200,58201,
+  58202,58203,58204,58205,58206,58207,58208,58209,58210,58211,58212,58213,58214,58215,58216,58217,58218,58219,58220,58221,58222,58223,58224,58225,
+  58226,58227,58228,58229,58230,58231,58232,58233,58234,58235,58236,58237,58238,58239,58240,58241,58242,58243,58244,58245,58246,58247,58248,58249,
+  58250,58251,58252,58253,58254,58255,58256,58257,58258,58259,58260,58261,58262,58263,58264,58265,58266,58267,58268,58269,58270,58271,58272,58273,
+  58274,58275,58276,58277,58278,58279,58280,58281,58282,58283,58284,58285,58286,58287,58288,58289,58290,58291,58292,58293,58294,59001,59002,59003,
+  59004,59005,59006,59007,59008,59009,59010,59011,59012,59013,59014,59015,59016,59017,59018,59019,59020,59021,59022,59023,59024,59025,59026,59027,
+  59028,59029,59030,59031,59032,59033,59034,59035,59036,59037,59038,59039,59040,59041,59042,59043,59044,59045,59046,59047,59048,59049,59050,59051,
+  59052,59053,59054,59055,59056,59057,59058,59059,59060,59061,59062,59063,59064,59065,59066,59067,59068,59069,59070,60001,60002,60003,60004,60005,
+  60006,60007,60008,60009,60010,60011,60012,60013,60014,60015,60016,60017,60018,60019,60020,60021,60022,60023,60024,60025,60026,60027,60028,60029,
+  60030,60031,60032,60033,60034,60035,60036,60037,60038,60039,60040,60041,60042,60043,60044,60045,60046,60047,60048,60049,60050,60051,60052,60053,
+  60054,60055,60056,60057,60058,60059,60060,60061,60062,60063,60064,60065,60066,60067,60068,60069,60070,60071,60072,60073,60074,60075,60076,60077,
+  60078,60079,60080,60081,60082,60083,60084,60085,60086,60087,60088,60089,60090,61001,61002,61003,61004,61005,61006,61007,61008,61009,61010,61011,
+  61012,61013,61014,61015,61016,61017,61018,61019,61020,61021,61022,61023,61024,61025,61026,61027,61028,61029,61030,
+];
+const _ap = [
+  63,63,63,63,63,63,64,63,64,62,62,62,62,64,64,64,64,64,65,65,65,65,65,65,
+  65,66,66,62,62,66,66,66,66,66,67,67,67,67,67,69,67,68,68,68,68,68,68,68,
+  69,69,69,67,62,69,69,70,70,70,70,70,70,70,71,71,71,69,71,71,73,71,72,72,
+  71,72,72,72,72,72,73,73,73,73,73,73,75,74,74,74,76,76,74,76,74,74,74,75,
+  75,75,75,75,75,77,77,76,76,76,76,77,83,77,77,77,77,83,83,83,83,83,84,84,
+  84,84,83,82,85,82,85,85,82,82,82,82,82,78,78,78,79,78,78,78,78,79,79,79,
+  79,79,79,80,80,80,80,80,80,80,81,81,81,81,81,81,81,85,85,85,85,86,84,84,
+  84,86,86,86,86,86,86,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,
+  87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,87,88,88,88,88,88,88,88,88,
+  88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,88,93,93,93,93,93,
+  92,92,92,92,92,92,92,95,92,95,94,92,94,93,93,94,92,92,94,94,94,95,95,95,
+  94,96,96,95,95,95,95,95,94,94,94,93,93,96,96,96,96,96,96,96,96,96,98,98,
+  98,98,98,99,98,99,98,98,99,99,99,97,97,97,97,97,97,97,97,97,102,102,102,102,
+  102,102,102,102,102,101,101,101,101,101,101,101,101,101,101,100,100,100,100,100,100,100,100,100,
+  100,99,99,99,99,99,91,91,91,91,91,91,90,90,90,90,90,90,90,89,89,89,89,89,
+  89,103,103,103,103,103,104,104,104,103,104,104,104,105,105,105,105,105,106,105,106,106,106,106,
+  107,107,107,107,107,107,106,108,108,109,109,108,108,109,109,109,109,110,110,110,110,110,111,111,
+  111,111,111,111,112,112,112,112,112,112,114,114,114,114,114,113,113,113,113,113,113,114,115,115,
+  110,115,115,115,127,115,125,116,116,116,116,116,125,116,108,108,117,117,117,117,117,117,117,118,
+  118,118,118,119,119,119,119,119,119,120,120,120,120,120,120,520,520,520,520,520,520,122,122,122,
+  122,122,122,123,123,118,123,123,123,123,124,125,125,125,124,124,124,124,124,125,127,126,126,126,
+  126,126,126,126,127,127,127,127,128,128,128,128,128,129,128,129,129,129,129,129,142,130,130,130,
+  130,142,141,131,131,131,131,131,131,131,130,130,132,132,132,132,132,132,133,133,133,133,133,133,
+  134,134,134,134,134,134,134,135,135,135,135,135,136,136,136,136,136,136,135,137,137,137,138,138,
+  138,138,138,137,137,137,305,305,305,305,140,305,140,140,140,305,140,138,140,141,141,141,141,141,
+  142,142,142,142,146,146,146,143,143,143,143,143,143,143,143,144,144,144,144,144,144,144,144,146,
+  146,146,146,146,147,147,147,147,147,147,147,147,145,145,145,145,145,145,151,151,151,151,145,145,
+  150,150,150,150,150,150,150,150,150,151,151,153,151,151,153,153,153,149,149,149,149,149,149,149,
+  149,149,148,148,148,148,148,148,148,148,153,153,153,153,152,152,152,152,152,152,152,152,154,154,
+  154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,154,155,155,155,155,155,155,
+  155,155,155,155,155,155,155,155,155,155,155,155,155,155,156,156,156,156,156,156,157,157,157,157,
+  158,157,157,157,158,158,158,158,158,158,159,159,159,159,159,159,160,160,160,160,160,160,160,162,
+  162,161,159,161,164,161,161,161,162,163,161,162,162,162,162,163,163,163,163,163,161,163,172,172,
+  164,164,164,164,164,164,156,165,165,165,165,165,165,165,166,166,166,167,167,167,167,167,167,167,
+  166,166,166,168,168,166,168,168,168,168,168,169,169,169,169,169,169,170,169,170,170,170,170,170,
+  170,171,171,171,171,171,171,171,172,172,172,172,173,172,173,173,174,173,173,173,173,176,174,174,
+  174,174,174,174,175,175,176,176,176,176,175,175,175,175,175,176,177,176,177,177,177,177,177,177,
+  179,178,178,178,179,179,179,179,180,180,180,179,179,180,178,178,178,178,181,180,180,180,181,181,
+  181,181,181,181,182,182,182,182,182,182,182,182,182,183,183,183,183,183,183,183,183,183,186,186,
+  186,186,186,186,186,186,186,187,187,187,187,187,187,187,187,187,185,184,184,184,184,184,184,184,
+  184,184,185,185,185,185,185,185,185,189,189,189,189,189,185,188,188,188,188,188,188,188,188,189,
+  189,189,189,190,188,190,190,190,190,190,190,190,190,191,191,191,191,191,191,191,191,191,192,193,
+  192,192,192,192,192,192,192,504,504,192,192,192,192,192,192,192,192,192,193,193,193,193,193,193,
+  193,193,193,193,193,504,193,193,193,504,504,504,504,504,504,504,504,504,504,504,504,504,504,195,
+  195,195,195,195,195,195,195,195,195,195,195,195,195,195,195,193,195,193,196,196,196,196,196,196,
+  197,197,197,197,197,198,198,197,198,198,198,198,200,200,209,209,209,209,209,199,199,200,200,200,
+  200,201,201,201,201,202,202,202,202,202,202,201,201,204,204,204,204,204,204,203,205,205,205,205,
+  205,205,206,206,206,206,203,203,203,203,203,207,207,207,207,206,206,207,199,199,199,208,208,208,
+  208,208,208,210,210,210,210,210,210,210,211,211,210,211,211,211,221,221,211,211,211,212,212,212,
+  212,212,212,212,213,213,213,213,213,213,213,213,214,214,215,215,215,214,214,214,216,214,214,214,
+  216,216,216,216,216,216,216,215,215,215,215,215,217,217,217,217,217,217,217,219,219,219,212,220,
+  220,220,220,220,220,220,221,221,221,221,221,221,219,220,219,219,219,219,218,218,218,218,217,218,
+  218,218,218,227,227,227,227,227,227,222,222,222,222,222,222,222,222,223,223,223,223,223,223,223,
+  223,224,224,224,224,224,224,224,224,225,228,228,228,232,228,228,228,228,227,227,228,236,236,236,
+  237,237,237,237,237,237,237,237,236,233,233,233,232,233,233,233,233,233,234,234,234,234,234,234,
+  235,235,234,235,235,235,235,235,234,235,232,232,236,236,236,236,232,232,232,232,229,229,229,229,
+  229,229,229,225,225,225,225,225,225,225,226,226,226,226,226,226,226,226,230,230,230,229,230,231,
+  231,230,230,230,230,231,231,231,231,231,231,238,238,238,238,238,238,238,239,239,239,239,239,240,
+  240,239,239,241,241,241,240,240,240,240,240,242,242,242,242,242,242,242,241,243,241,241,241,243,
+  243,243,243,243,243,244,244,244,244,244,244,244,245,245,245,245,245,245,245,246,246,246,246,246,
+  246,247,247,246,247,247,247,248,247,247,248,248,248,248,248,249,249,249,249,249,249,249,248,251,
+  250,250,250,250,250,250,250,251,251,251,251,251,251,253,254,254,252,252,252,252,253,252,252,253,
+  253,254,254,254,254,254,252,255,253,253,253,255,255,255,255,255,255,256,256,256,256,256,257,257,
+  257,257,256,257,256,257,257,258,258,258,258,258,258,258,258,259,259,259,259,259,260,260,260,260,
+  260,260,259,259,259,260,260,261,261,261,261,261,277,277,261,261,261,262,262,262,264,264,262,262,
+  264,263,263,263,263,263,263,265,265,263,263,264,264,264,264,264,265,265,265,266,266,266,266,266,
+  266,266,267,267,267,267,267,267,267,267,268,268,268,268,268,268,268,268,269,269,269,269,269,269,
+  269,269,265,265,265,270,270,270,270,270,270,270,270,271,271,271,271,271,272,272,272,272,272,272,
+  272,272,271,271,271,274,274,274,273,273,273,273,273,273,273,286,286,286,286,286,286,286,274,274,
+  274,274,274,275,275,275,275,275,262,262,262,276,276,276,276,276,276,276,275,278,275,276,277,277,
+  277,277,277,277,278,278,278,278,278,278,278,275,285,285,286,285,285,285,285,285,285,284,284,284,
+  284,284,284,284,284,281,281,281,281,281,282,282,282,282,282,282,282,283,283,283,283,283,283,282,
+  283,283,279,279,279,279,279,279,279,281,281,281,280,279,280,280,280,280,280,280,280,287,287,287,
+  287,287,288,288,288,287,290,290,290,289,289,289,289,289,289,290,290,290,291,291,291,291,291,291,
+  292,292,292,292,292,292,300,300,294,293,293,293,293,293,293,294,294,294,294,294,295,295,295,295,
+  296,296,296,296,296,296,295,295,297,297,297,297,297,297,298,298,298,298,299,299,299,298,298,299,
+  299,300,300,300,299,300,301,301,301,302,302,302,327,302,302,302,301,301,301,303,303,303,303,303,
+  303,304,304,304,304,305,305,305,305,305,304,305,305,306,288,288,288,306,306,306,307,306,306,307,
+  307,307,307,307,308,308,308,308,308,308,309,309,309,309,309,309,310,310,310,310,310,311,311,311,
+  311,310,311,311,312,312,312,314,314,314,313,313,312,312,312,313,313,313,313,315,315,314,314,314,
+  316,316,315,315,315,315,316,316,316,316,317,317,317,317,317,317,319,319,319,318,318,318,318,322,
+  322,322,322,321,321,321,321,321,319,319,319,322,320,320,320,321,320,322,320,320,324,324,324,324,
+  324,324,323,323,323,323,323,323,325,325,325,325,325,325,327,327,327,327,327,326,326,326,326,326,
+  329,329,326,328,328,328,328,328,328,329,329,329,331,331,331,331,331,331,331,318,318,332,332,332,
+  332,332,332,333,333,333,333,333,333,334,334,334,334,330,330,334,334,330,330,330,330,335,335,335,
+  335,335,335,335,335,335,335,335,335,335,335,335,335,335,335,335,335,335,335,335,335,335,335,335,
+  335,335,335,335,335,336,336,336,336,336,336,336,336,336,336,336,336,336,336,336,336,336,336,336,
+  336,336,336,336,336,336,336,336,336,337,337,337,337,337,337,337,337,337,337,337,337,337,337,337,
+  337,337,337,337,337,337,337,337,337,337,337,337,337,337,337,337,337,337,337,337,337,338,338,338,
+  338,338,338,338,338,338,338,338,338,338,338,338,338,338,338,338,338,338,338,338,338,339,339,339,
+  339,339,339,339,339,339,339,339,339,339,339,339,339,339,339,339,339,339,339,339,339,339,339,339,
+  339,339,339,339,339,339,339,339,339,339,339,339,339,340,340,340,340,340,340,340,340,340,340,340,
+  340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,
+  340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,340,
+  340,341,341,341,341,341,341,341,342,342,342,342,342,342,342,343,343,343,343,343,344,344,344,344,
+  344,344,345,345,345,345,344,345,346,345,345,346,346,346,346,346,346,347,347,347,347,347,347,347,
+  348,348,348,348,348,348,348,349,349,349,349,349,349,349,343,343,350,350,350,350,350,350,350,351,
+  351,352,352,352,352,351,351,351,351,351,353,353,353,353,353,354,354,354,354,354,356,354,355,355,
+  355,355,355,355,355,356,356,356,356,356,356,357,357,357,357,358,358,358,358,358,358,358,357,357,
+  354,353,357,353,359,359,359,360,359,359,359,359,360,360,360,360,360,360,361,361,361,361,352,361,
+  361,361,352,352,362,362,362,362,362,362,362,366,362,362,363,363,363,364,363,363,363,363,363,363,
+  364,364,364,364,364,366,364,364,366,365,365,365,365,365,365,365,365,365,366,366,366,366,366,366,
+  367,367,367,367,367,367,367,367,367,369,369,369,369,369,369,368,368,368,368,368,368,368,369,368,
+  369,368,374,374,374,374,364,373,373,373,373,373,373,373,372,374,373,373,374,374,374,374,372,372,
+  372,372,372,372,372,372,371,371,371,371,371,371,371,369,371,371,370,370,370,370,370,370,370,370,
+  370,375,375,375,375,375,376,375,375,375,377,377,376,376,376,376,376,376,376,377,377,377,377,377,
+  377,378,378,378,378,378,378,378,378,379,379,379,379,379,379,379,380,380,380,379,380,387,380,380,
+  380,381,381,381,381,381,381,381,381,385,385,382,382,382,382,380,385,382,382,382,382,383,383,383,
+  383,383,383,383,383,384,384,384,384,384,384,384,384,385,385,385,385,385,386,386,386,386,386,386,
+  386,386,387,387,387,387,387,396,387,387,388,388,388,388,388,396,396,388,388,388,396,389,389,389,
+  389,389,390,390,390,389,389,390,390,390,390,389,391,390,391,391,391,391,391,391,391,392,392,392,
+  392,392,392,392,392,393,393,393,393,393,395,395,393,393,394,393,394,394,394,394,394,394,394,395,
+  395,395,395,395,395,396,396,396,396,397,397,397,397,397,397,397,397,398,398,398,398,398,398,398,
+  398,399,399,399,399,399,399,399,399,400,400,400,400,400,400,400,400,400,400,400,400,400,400,400,
+  400,400,400,400,400,400,400,400,400,400,400,400,400,400,400,400,400,401,401,407,401,401,401,405,
+  405,401,402,402,402,402,404,402,404,402,404,404,404,404,403,403,403,403,403,403,405,405,405,405,
+  406,406,406,406,406,406,407,407,407,407,407,408,408,408,408,408,408,411,411,409,409,409,409,409,
+  409,410,410,410,410,410,411,411,411,411,412,412,412,412,412,412,413,413,413,413,413,413,414,414,
+  414,414,414,414,415,410,415,416,415,415,415,415,416,416,416,416,416,417,417,417,417,417,417,418,
+  418,418,418,419,419,419,419,419,419,418,418,420,420,420,420,421,420,420,421,421,421,421,421,422,
+  422,422,422,422,422,423,423,423,423,425,423,424,424,424,424,425,425,425,425,425,427,427,427,426,
+  426,426,426,426,426,427,427,427,428,428,428,429,429,429,429,430,429,429,428,428,428,430,430,430,
+  430,430,424,423,424,431,431,435,431,431,431,431,432,432,433,432,432,432,432,434,434,433,433,433,
+  433,433,437,437,434,434,434,434,435,435,435,435,435,436,436,436,436,436,436,437,437,437,437,438,
+  438,438,438,438,438,439,439,439,439,439,439,440,441,441,441,440,440,440,440,440,440,443,443,444,
+  444,444,444,443,443,443,443,443,441,441,441,441,442,442,442,442,442,442,442,445,445,444,444,445,
+  444,445,445,445,445,446,446,446,446,446,453,446,449,449,449,449,449,449,449,447,448,447,447,447,
+  447,447,448,448,448,448,448,448,447,446,450,450,450,450,450,450,451,451,451,451,451,451,450,451,
+  452,452,452,452,452,452,452,453,453,453,453,453,453,454,454,455,455,455,454,454,454,454,454,455,
+  455,455,456,456,456,456,456,456,456,455,457,457,457,457,457,457,457,457,457,457,457,457,457,457,
+  457,457,457,457,457,457,457,457,457,458,458,458,458,458,458,457,457,457,457,457,457,457,458,458,
+  458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,458,459,460,
+  459,459,459,459,460,460,460,460,461,461,462,461,461,462,463,463,464,463,463,462,462,463,464,464,
+  464,464,466,466,466,466,466,465,465,465,465,465,467,467,467,467,469,461,462,468,468,468,468,469,
+  469,469,470,470,470,470,469,470,468,467,471,471,471,471,472,472,472,472,472,471,473,473,473,474,
+  473,473,474,474,474,474,475,475,475,475,475,476,476,476,476,477,477,477,477,477,478,478,478,478,
+  478,480,480,480,497,480,480,476,479,479,479,479,481,481,481,481,481,482,482,483,482,482,482,482,
+  482,482,482,482,483,483,483,483,484,484,484,484,484,484,485,485,485,485,486,485,486,486,486,487,
+  486,487,487,487,487,491,489,488,488,488,488,488,489,489,489,490,490,490,490,490,490,491,491,491,
+  492,492,492,492,492,491,493,494,493,493,494,494,493,494,494,494,495,495,495,495,495,497,497,497,
+  497,499,499,499,479,498,498,499,498,498,499,501,498,502,489,501,501,500,500,500,500,500,501,501,
+  502,502,502,503,503,503,502,503,503,504,504,504,504,504,505,505,505,505,505,506,506,506,506,506,
+  506,496,507,507,496,496,496,496,507,507,507,508,508,508,535,535,476,476,508,508,476,476,476,510,
+  510,510,510,511,511,510,511,511,511,512,512,512,519,512,512,513,513,513,513,513,514,514,515,515,
+  515,515,516,515,516,516,514,514,514,516,516,517,517,517,517,517,518,518,518,518,518,519,519,519,
+  520,520,520,520,520,521,521,521,521,521,519,524,524,524,522,522,523,523,522,522,522,524,523,523,
+  523,538,538,524,529,528,528,528,528,529,529,529,529,528,527,527,527,527,538,527,538,526,526,538,
+  526,530,530,530,530,530,531,531,531,531,532,532,532,532,526,526,532,533,533,533,537,531,533,533,
+  534,534,534,534,534,535,535,535,536,536,536,536,536,537,537,537,537,539,539,539,540,540,540,540,
+  540,539,540,540,539,539,539,539,539,539,543,539,539,539,539,543,543,543,543,543,543,543,543,543,
+  543,543,543,543,540,540,540,540,540,540,541,541,541,541,541,541,541,541,541,541,541,541,541,541,
+  542,542,542,542,542,540,542,542,542,542,542,542,542,542,542,546,544,544,544,544,544,544,544,545,
+  545,545,545,545,545,546,546,546,546,546,546,545,547,547,547,547,547,547,547,548,548,548,548,548,
+  548,548,549,549,549,549,549,549,549,550,550,550,550,550,550,551,550,551,551,551,551,551,551,552,
+  552,552,552,552,554,554,554,552,552,553,553,553,553,553,553,554,553,554,554,554,555,555,555,555,
+  555,555,556,555,556,556,556,556,556,556,557,557,557,557,557,557,557,561,560,560,558,558,558,558,
+  558,558,558,559,559,559,559,559,559,560,560,559,560,560,560,561,561,561,561,561,561,562,562,562,
+  563,563,563,563,563,563,562,565,562,562,565,562,563,564,564,564,564,565,565,566,565,565,565,566,
+  566,564,564,564,566,566,566,566,567,567,567,567,567,567,567,568,568,568,568,568,568,568,569,569,
+  569,569,569,569,569,570,570,570,570,570,571,571,571,571,571,571,570,570,572,571,572,572,572,572,
+  572,573,573,575,573,573,573,573,573,574,574,574,574,574,574,574,577,577,576,576,576,577,577,577,
+  575,575,577,575,575,575,572,576,576,575,577,576,576,578,578,578,578,578,578,578,579,579,579,579,
+  579,579,579,580,580,580,580,580,580,580,582,581,581,582,581,581,582,582,581,581,581,584,584,584,
+  582,583,582,582,583,583,583,583,583,583,585,585,584,584,584,585,584,585,585,585,585,594,591,591,
+  590,594,594,594,594,594,594,594,594,594,590,590,590,590,590,590,590,590,590,593,593,593,595,595,
+  595,595,595,595,595,595,595,595,596,596,593,593,593,592,593,593,593,596,596,596,596,596,593,596,
+  596,596,592,592,592,592,592,592,592,592,592,592,592,591,591,591,591,591,591,597,597,597,597,597,
+  597,597,597,597,597,597,597,597,597,597,597,598,598,598,598,598,598,598,598,598,598,597,597,598,
+  598,598,598,598,598,598,599,598,599,599,599,599,599,599,599,599,599,599,600,600,600,600,600,600,
+  600,600,601,601,601,600,600,600,600,600,600,600,600,600,600,601,601,601,601,601,601,601,601,601,
+  601,601,601,601,601,601,599,599,599,599,599,599,599,604,604,604,604,604,604,604,604,604,604,604,
+  604,604,604,604,604,604,604,604,604,604,604,604,604,604,604,604,604,604,604,
+];
+const _d = [
+  1225,0,1286,0,1094,0,1285,0,626,0,617,0,890,0,777,0,946,0,1108,0,1294,0,784,0,
+  1036,0,956,0,1086,0,825,0,660,0,1011,0,1111,0,1063,0,1256,0,1303,0,631,0,1052,0,
+  961,0,628,0,1224,0,727,0,1240,1,1296,1,690,1,779,1,1079,1,1092,1,923,1,980,1,
+  955,1,963,1,1273,1,895,1,1299,1,979,1,973,1,1191,1,1186,1,1272,1,781,1,762,1,
+  978,1,975,1,630,1,1049,1,716,1,1253,1,976,1,910,2,830,2,709,2,765,2,909,2,
+  1297,2,1219,2,760,2,940,2,725,2,699,2,815,2,668,2,645,2,896,2,897,2,646,2,
+  1045,2,1264,2,744,2,1212,2,697,2,1010,2,1039,2,842,2,817,2,884,2,998,2,1192,2,
+  717,2,966,2,757,2,763,2,1252,2,1291,3,774,3,1184,3,1204,3,985,3,1231,3,634,3,
+  936,3,1119,3,917,3,984,3,1152,3,742,3,1035,3,821,3,1207,3,1167,3,1276,3,1158,3,
+  675,3,924,3,680,3,657,3,1032,3,968,3,1183,3,1044,3,1101,3,688,3,708,3,888,3,
+  1146,3,637,3,872,3,640,3,810,3,1060,3,866,3,1007,4,950,4,1232,4,653,4,1235,4,
+  869,4,1123,4,949,4,808,4,1031,4,694,4,868,4,989,4,651,4,1124,4,807,4,753,4,
+  650,4,773,4,676,4,886,4,1129,4,900,4,947,4,1054,4,670,4,741,4,691,4,1228,4,
+  1074,5,1218,5,887,6,1279,6,654,6,1097,6,994,6,1149,6,635,6,801,6,608,6,1234,6,
+  1026,6,1128,6,864,6,750,6,1110,6,885,6,813,6,623,6,684,6,700,6,627,6,930,6,
+  995,6,1089,6,737,6,1275,6,724,6,1055,6,683,6,1233,6,1238,6,740,6,1059,6,1277,6,
+  1088,7,619,7,1305,7,962,7,889,7,912,7,1090,7,1211,7,880,7,792,7,1203,7,840,7,
+  687,7,718,7,1145,7,874,7,993,7,1143,7,827,7,1077,7,1087,7,789,7,711,8,899,8,
+  965,8,959,8,1004,8,831,8,1269,8,694,8,1208,8,1201,8,1187,8,934,8,1153,9,1080,9,
+  771,9,865,9,748,9,816,9,938,9,838,9,1134,9,719,9,814,9,698,9,754,9,782,9,
+  1174,9,1300,9,1136,9,933,9,823,9,1197,9,974,9,970,9,1083,9,806,9,914,11,903,11,
+  1290,11,954,11,999,11,1082,11,1250,11,785,11,847,11,953,11,613,11,1098,11,944,11,1246,11,
+  1185,12,1027,12,686,12,828,12,745,12,1188,12,824,12,638,12,1150,12,1251,12,1067,12,722,12,
+  739,12,1091,12,1169,12,1142,12,1014,12,1195,12,1199,12,1177,12,633,12,1268,12,918,12,851,12,
+  768,12,1005,12,647,12,1173,12,1057,12,723,12,677,12,835,12,1056,12,1125,12,1281,12,689,12,
+  1171,12,1127,12,606,12,1180,12,751,12,927,12,707,12,928,12,669,12,616,12,873,12,755,12,
+  850,12,1266,12,1139,12,1006,12,1062,12,1051,13,761,13,859,13,705,13,612,13,1289,13,622,13,
+  1288,13,1043,13,681,13,820,13,798,13,715,13,1307,13,1050,13,839,13,1093,13,860,13,640,13,
+  1058,13,1084,13,1242,13,1030,13,1029,13,1122,13,1116,13,609,13,674,13,971,13,1078,13,1209,13,
+  1168,13,1140,13,1198,13,942,13,1164,13,848,14,849,14,696,14,1249,14,714,14,1267,14,1172,14,
+  1237,14,729,14,1295,15,778,15,1144,15,780,15,783,15,1298,15,1222,15,1073,15,776,15,1293,15,
+  1221,15,1217,15,1002,16,941,16,610,16,1155,16,929,16,712,16,1175,16,841,16,983,16,972,16,
+  1154,16,766,17,732,17,731,17,1104,17,939,17,1261,17,1308,17,1106,17,1023,17,1302,17,1024,17,
+  977,17,1262,17,1069,17,1181,17,935,17,1016,18,931,18,1160,18,1227,18,1230,18,736,18,852,18,
+  758,18,805,18,891,18,1037,18,878,18,665,18,948,18,921,18,799,18,922,18,648,18,1099,19,
+  826,19,624,19,1239,19,906,19,857,19,844,19,1148,19,1147,19,1022,19,793,19,982,19,1021,19,
+  797,19,795,19,1223,19,790,19,672,19,1009,19,1165,19,667,19,1001,19,1100,19,802,20,632,20,
+  833,20,693,20,730,20,879,20,1196,20,1061,20,952,20,854,20,855,20,770,20,925,20,618,20,
+  747,20,682,20,759,20,908,20,746,20,803,20,1170,20,1260,20,611,20,673,20,920,20,764,20,
+  1042,20,1085,20,1105,20,882,20,881,20,856,20,666,20,652,20,861,20,1162,20,1202,20,1263,20,
+  1157,20,1112,20,772,20,659,20,728,20,1131,20,685,20,1179,20,706,20,951,20,663,20,875,20,
+  829,21,1213,21,1048,21,804,21,1081,21,1008,21,702,21,1245,22,721,22,898,22,720,22,1138,22,
+  1280,22,1257,22,957,22,756,22,1259,22,1283,22,893,22,1156,22,1047,22,786,22,1258,22,1065,22,
+  733,22,767,22,913,22,1254,22,1103,22,636,22,735,22,1015,22,1040,22,1247,22,1243,22,1114,22,
+  1206,22,986,22,1244,22,1284,22,1132,22,1248,22,1241,22,1255,22,902,22,945,23,1003,23,605,23,
+  1066,23,1068,23,894,23,853,23,1102,23,871,23,911,23,1126,23,1194,23,1017,23,1163,23,1018,23,
+  1137,23,991,23,1282,23,846,23,987,23,1053,23,883,23,1041,23,1046,23,1236,23,1304,23,867,23,
+  990,23,1287,23,832,23,1028,23,679,23,926,23,1301,24,1200,24,932,24,818,24,1220,24,752,24,
+  1270,24,1075,24,1151,25,1182,25,1034,25,692,25,1025,25,1161,25,1135,25,625,25,1019,25,643,25,
+  811,25,834,25,809,25,704,25,614,25,837,25,1012,25,607,25,796,25,915,25,787,25,997,25,
+  701,25,664,25,1107,25,1178,25,967,25,1205,25,836,25,1271,25,981,25,1121,25,621,25,1229,25,
+  791,25,901,25,788,25,639,25,904,25,905,25,858,25,876,25,969,25,831,25,996,25,655,25,
+  726,25,794,25,1112,25,919,25,1113,25,661,25,641,25,620,25,644,25,1190,25,653,25,819,25,
+  1193,25,671,25,1166,25,988,25,822,25,964,25,749,25,642,25,1013,25,649,25,870,25,812,25,
+  713,25,1278,25,678,25,1020,25,1210,25,734,27,615,27,862,27,892,27,743,27,1274,27,738,27,
+  1000,27,1033,27,1038,27,1070,27,1214,27,943,27,845,27,843,27,1118,27,1096,27,877,27,1120,27,
+  658,27,1117,27,1095,27,695,27,1071,28,1076,28,1292,28,710,28,1064,28,1216,28,1215,28,775,28,
+  1176,28,1072,28,960,29,662,29,656,29,800,29,1226,29,703,29,1115,29,1189,29,958,29,629,29,
+  937,29,769,29,1133,29,1141,29,1265,29,916,29,1159,29,863,29,1130,29,1109,29,30,30,907,30,
+  992,30,1306,30,
+];
+const _dao = [
+  0,8,15,19,25,32,34,41,48,55,56,63,70,77,84,91,98,103,107,113,121,128,136,141,
+  148,155,163,169,175,178,182,183,186,187,190,191,192,194,196,200,201,204,206,207,209,210,212,215,
+  216,218,219,220,223,228,232,235,240,243,250,251,254,255,257,262,265,267,270,274,280,282,288,292,
+  295,298,301,305,310,313,316,324,327,332,336,337,341,343,347,349,356,361,370,382,383,391,401,406,
+  412,416,423,430,434,438,448,459,465,473,483,491,501,508,512,519,524,527,529,531,538,552,559,563,
+  567,574,576,579,585,595,600,604,606,607,609,612,615,618,623,627,629,631,636,642,646,650,657,659,
+  662,665,671,674,676,682,685,687,688,691,692,693,694,717,734,740,745,749,753,760,764,767,772,793,
+  798,801,809,814,816,818,823,827,832,839,841,848,855,857,862,868,878,881,883,888,904,906,907,911,
+  916,918,922,926,930,934,939,943,949,954,957,962,969,973,975,979,983,987,990,994,997,1000,1006,1011,
+  1026,1027,1031,1041,1046,1051,1055,1060,1065,1073,1074,1077,1080,1084,1086,1089,1092,1093,1097,1099,1101,1107,1111,1117,
+  1123,1126,1131,1138,1140,1143,1145,1146,1148,1153,1155,1160,1171,1174,1187,1203,1215,1228,1242,1247,1256,1265,1270,1281,
+  1295,1297,1303,1308,1314,1317,1322,1326,1329,1337,1340,1342,1348,1352,1355,1362,1368,1370,1374,1377,1380,1383,1385,1389,
+  1397,1399,1402,1408,1412,1416,1423,1428,1430,1434,1438,1443,1450,1454,1459,1461,1464,1469,1473,1475,1481,1485,1487,1490,
+  1497,1506,1513,1518,1522,1525,1529,1534,1545,1552,1557,1560,1568,1572,1584,1587,1591,1594,1600,1607,1616,1619,1623,1628,
+  1637,1652,1658,1676,1702,1712,1719,1740,1752,1758,1764,1768,1779,1787,1792,1795,1805,1813,1824,1837,1843,1853,1855,1858,
+  1864,1867,1873,1878,1880,1885,1902,1904,1907,1909,1913,1916,1927,1930,1933,1936,1939,1951,1954,1955,1958,1961,1962,1968,
+  1971,1973,1976,1977,1978,1980,1986,1987,1994,1999,2009,2013,2022,2024,2028,2030,2031,2033,2039,2041,2042,2043,2044,2047,
+  2048,2049,2051,2053,2054,2055,2056,2058,2059,2060,2061,2062,2065,2072,2082,2087,2091,2100,2107,2110,2113,2116,2119,2133,
+  2137,2141,2145,2149,2152,2158,2161,2166,2169,2171,2179,2183,2186,2191,2197,2203,2210,2216,2218,2220,2230,2236,2237,2240,
+  2248,2251,2255,2259,2263,2268,2270,2272,2276,2281,2283,2284,2289,2294,2300,2302,2307,2310,2312,2316,2319,2322,2324,2327,
+  2334,2335,2337,2341,2346,2351,2355,2360,2362,2365,2371,2375,2379,2383,2387,2395,2402,2407,2410,2411,2417,2439,2442,2448,
+  2452,2457,2461,2467,2472,2480,2486,2491,2502,2508,2516,2524,2527,2537,2544,2548,2557,2559,2561,2570,2573,2576,2580,2588,
+  2594,2598,2608,2612,2619,2623,2629,2634,2639,2645,2647,2650,2653,2655,2660,2664,2669,2671,2673,2677,2678,2679,2685,2688,
+  2693,2700,2701,2703,2718,2724,2725,2727,2731,2738,2741,2742,2746,2748,2751,2753,2754,2760,2764,2778,2787,2793,2800,2807,
+  2813,2817,2824,2831,2834,2840,2848,2854,2858,2863,2867,2874,2877,2882,2885,2888,2895,2902,2905,2910,2919,2924,2927,2931,
+  2935,2941,2950,2954,2960,2968,2977,2985,2991,3000,3003,3010,3015,3019,3022,3025,3028,3032,3042,3045,3049,3051,3053,3055,
+  3059,3061,3067,3074,3077,3089,3095,3100,3105,3112,3114,3118,3125,3130,3135,3138,3143,3152,3159,3166,3176,3180,3187,3196,
+  3203,3207,3215,3218,3223,3227,3236,3241,3248,3249,3254,3263,3269,3281,3303,3320,3353,3384,3395,3411,3429,3445,3460,3464,
+  3473,3485,3501,3510,3521,3531,3538,3553,3558,3562,3570,3575,3581,3586,3591,3597,3604,3607,3609,3617,3622,3626,3628,3631,
+  3638,3641,3644,3646,3649,3653,3659,3662,3673,3678,3681,3704,3709,3710,3711,
+];
+const _da = [
+  0,1,2,3,4,5,6,7,8,13,14,15,16,17,18,9,10,11,12,19,20,21,22,23,
+  24,25,26,29,30,31,32,33,27,28,34,35,36,37,38,40,51,39,48,49,50,53,54,65,
+  41,42,43,44,45,46,47,52,55,56,57,58,59,60,61,62,63,64,66,67,69,72,68,78,
+  79,80,81,82,83,70,71,73,74,75,76,77,84,95,96,97,98,99,100,85,86,87,90,92,
+  93,94,88,89,91,103,105,101,110,111,112,102,104,106,107,108,109,113,114,115,116,117,118,119,
+  122,120,121,126,165,166,167,168,123,124,125,128,129,130,131,132,127,161,162,163,164,133,134,135,
+  137,138,139,140,136,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,
+  160,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,
+  192,194,193,195,196,197,198,200,199,201,204,205,202,210,203,206,209,207,208,214,211,212,213,215,
+  216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,
+  240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,
+  264,265,267,266,268,269,270,271,272,273,274,277,278,279,280,281,275,276,282,283,284,289,290,291,
+  285,286,287,288,292,296,297,293,294,295,298,303,304,299,300,301,302,305,306,307,308,309,310,311,
+  312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,334,335,336,
+  333,337,338,341,342,339,340,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,
+  360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,
+  384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,
+  408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,
+  432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,
+  456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,
+  480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,
+  504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,
+  528,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,
+  552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,
+  576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,
+  600,601,602,603,604,605,606,607,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,
+  624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,
+  648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,
+  672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,
+  696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,
+  720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,747,
+  748,743,744,745,746,749,750,751,752,753,754,755,756,757,758,759,760,761,762,766,763,764,765,767,
+  768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,784,785,786,787,788,789,790,791,
+  792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,
+  816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,
+  840,841,842,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,
+  864,865,866,867,868,869,873,874,875,876,877,878,879,880,870,871,872,881,882,883,884,885,886,887,
+  888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,
+  912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,
+  936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,
+  960,961,962,963,964,965,966,967,968,969,972,973,974,970,971,975,976,977,978,979,980,981,982,983,
+  984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,
+  1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,
+  1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051,1052,1053,1054,1055,
+  1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,
+  1080,1083,1084,1085,1081,1082,1086,1087,1088,1089,1090,1091,1092,1093,1094,1097,1098,1095,1096,1099,1100,1101,1102,1103,
+  1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1130,1125,1126,
+  1127,1128,1129,1131,1134,1135,1136,1137,1138,1139,1132,1133,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,
+  1152,1153,1154,1379,1380,1381,1382,1383,1384,1385,1386,1387,1388,1389,1390,1391,1392,1393,1394,1395,1396,1397,1398,1399,
+  1400,1401,1402,1403,1404,1405,1406,1407,1408,1409,1410,1411,1412,1413,1414,1415,1416,1417,1418,1419,1420,1421,1422,1423,
+  1424,1425,1426,1427,1428,1429,1430,1431,1432,1433,1434,1435,1436,1437,1438,1439,1440,1441,1442,1443,1444,1445,1446,1447,
+  1448,1449,1450,1451,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1466,1467,1468,1469,1470,1471,
+  1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1482,1483,1484,1485,1486,1487,1488,1489,1490,1491,1492,1493,1494,1495,
+  1496,1497,1498,1499,1500,1501,1502,1503,1504,1505,1506,1507,1508,1509,1510,1511,1512,1513,1514,1515,1516,1517,1518,1519,
+  1520,1521,1522,1523,1524,1525,1526,1527,1528,1529,1530,1531,1532,1533,1534,1535,1536,1537,1538,1539,1540,1541,1542,1543,
+  1544,1545,1546,1547,1548,1549,1550,1551,1552,1553,1554,1555,1556,1557,1558,1559,1560,1561,1562,1565,1563,1564,1566,1567,
+  1568,1569,1570,1571,1572,1573,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1591,1592,1593,
+  1589,1590,1594,1595,1596,1600,1597,1598,1599,1601,1602,1603,1604,1605,1606,1607,1608,1609,1610,1611,1612,1613,1614,1615,
+  1616,1617,1618,1619,1620,1621,1622,1623,1624,1625,1626,1627,1628,1629,1630,1631,1632,1633,1634,1635,1636,1637,1638,1639,
+  1640,1641,1642,1643,1644,1645,1646,1647,1648,1649,1650,1651,1652,1653,1654,1655,1656,1657,1658,1659,1660,1661,1662,1663,
+  1664,1665,1666,1667,1668,1669,1670,1671,1672,1673,1674,1675,1676,1677,1678,1679,1680,1681,1682,1683,1684,1685,1686,1687,
+  1688,1689,1690,1691,1692,1693,1694,1695,1696,1697,1698,1699,1700,1701,1702,1703,1704,1705,1706,1707,1708,1709,1710,1711,
+  1712,1713,1714,1715,1716,1717,1718,1719,1720,1721,1722,1723,1724,1725,1726,1727,1728,1729,1730,1731,1732,1733,1734,1735,
+  1736,1737,1738,1739,1740,1741,1742,1743,1744,1745,1746,1747,1748,1749,1750,1751,1752,1753,1754,1755,1756,1757,1758,1759,
+  1760,1761,1762,1763,1764,1765,1766,1767,1768,1769,1770,1771,1772,1773,1774,1775,1776,1777,1778,1779,1780,1781,1782,1783,
+  1784,1785,1786,1787,1788,1789,1790,1791,1792,1793,1794,1795,1796,1797,1798,1799,1800,1801,1802,1803,1804,1805,1806,1807,
+  1808,1809,1810,1811,1812,1813,1814,1815,1816,1817,1818,1819,1820,1821,1822,1823,1824,1825,1826,1827,1828,1829,1830,1831,
+  1832,1833,1834,1835,1836,1837,1838,1839,1840,1841,1842,1843,1844,1845,1846,1847,1848,1849,1850,1851,1852,1853,1854,1855,
+  1856,1857,1858,1859,1860,1861,1862,1863,1864,1865,1866,1867,1868,1869,1870,1871,1872,1873,1874,1875,1876,1877,1878,1879,
+  1880,1881,1882,1883,1884,1885,1886,1887,1888,1889,1890,1891,1892,1893,1894,1895,1896,1897,1898,1899,1900,1901,1902,1903,
+  1904,1905,1906,1907,1908,1909,1910,1911,1912,1913,1914,1915,1916,1917,1918,1919,1920,1921,1922,1923,1924,1925,1926,1927,
+  1928,1929,1930,1931,1932,1933,1934,1935,1936,1937,1938,1939,1940,1941,1942,1943,1944,1945,1946,1947,1948,1949,1950,1951,
+  1952,1953,1954,1955,1956,1957,1958,1959,1960,1961,1962,1963,1964,1965,1966,1967,1968,1969,1970,1971,1972,1973,1974,1975,
+  1976,1977,1978,1979,1980,1981,1982,1983,1984,1985,1986,1987,1988,1989,1990,1991,1992,1993,1994,1995,1996,1997,1998,1999,
+  2000,2001,2002,2003,2004,2005,2006,2007,2008,2009,2010,2011,2012,2013,2014,2015,2016,2017,2018,2019,2020,2021,2022,2023,
+  2024,2025,2026,2027,2028,2029,2030,2031,2032,2033,2034,2035,2036,2037,2038,2039,2040,2041,2042,2043,2044,2050,2051,2076,
+  2045,2046,2047,2048,2049,2052,2053,2054,2055,2056,2057,2058,2059,2060,2061,2062,2063,2064,2065,2066,2067,2068,2069,2070,
+  2071,2072,2073,2074,2075,2077,2078,2079,2080,2081,2082,2083,2084,2085,2086,2087,2088,2089,2090,2091,2092,2093,2094,2095,
+  2096,2097,2098,2099,2100,2103,2101,2102,2104,2105,2106,2107,2108,2109,2110,2111,2112,2113,2114,2115,2116,2117,2118,2119,
+  2120,2121,2122,2123,2124,2125,2126,2127,2128,2129,2130,2131,2132,2133,2134,2135,2136,2137,2138,2139,2140,2141,2142,2143,
+  2144,2145,2146,2147,2148,2152,2153,2149,2150,2151,2154,2155,2156,2157,2158,2159,2160,2161,2162,2163,2166,2167,2168,2169,
+  2170,2171,2172,2173,2174,2175,2176,2164,2165,2177,2178,2179,2180,2181,2182,2183,2184,2185,2186,2187,2188,2189,2190,2191,
+  2192,2193,2194,2195,2196,2197,2198,2199,2200,2201,2202,2203,2204,2205,2206,2207,2210,2211,2208,2209,2227,2228,2229,2230,
+  2231,2232,2212,2213,2214,2215,2216,2217,2218,2219,2220,2221,2222,2223,2224,2225,2226,2233,2234,2235,2236,2237,2238,2239,
+  2240,2241,2242,2243,2244,2251,2245,2246,2247,2248,2249,2250,2252,2253,2254,2255,2256,2257,2258,2269,2271,2276,2281,2259,
+  2261,2260,2262,2263,2264,2266,2272,2265,2267,2268,2273,2270,2275,2274,2277,2278,2279,2280,2282,2283,2284,2285,2404,2405,
+  2406,2407,2408,2409,2410,2411,2412,2413,2414,2415,2416,2417,2418,2419,2420,2421,2422,2423,2424,2425,2426,2427,2428,2429,
+  2430,2431,2432,2433,2434,2435,2436,2437,2438,2439,2440,2441,2442,2443,2444,2445,2446,2447,2448,2449,2450,2451,2452,2453,
+  2454,2455,2456,2515,2457,2458,2459,2460,2461,2462,2463,2464,2465,2466,2467,2468,2469,2470,2471,2472,2473,2474,2475,2476,
+  2477,2478,2479,2480,2481,2482,2483,2484,2485,2486,2487,2488,2489,2490,2491,2492,2493,2494,2495,2496,2497,2498,2499,2500,
+  2501,2502,2503,2504,2510,2511,2505,2506,2507,2508,2509,2512,2513,2514,2516,2517,2518,2519,2520,2521,2522,2523,2524,2525,
+  2526,2532,2527,2528,2529,2530,2531,2533,2534,2535,2536,2537,2538,2539,2540,2541,2542,2543,2544,2545,2546,2547,2548,2549,
+  2550,2551,2552,2553,2554,2555,2556,2557,2558,2559,2560,2561,2562,2566,2567,2569,2570,2571,2572,2573,2574,2575,2563,2564,
+  2568,2576,2577,2578,2565,2579,2580,2581,2582,2583,2584,2585,2586,2587,2588,2589,2590,2591,2592,2593,2594,2595,2596,2597,
+  2598,2599,2600,2601,2602,2603,2604,2605,2606,2607,2608,2609,2610,2611,2612,2613,2614,2615,2616,2617,2618,2619,2620,2621,
+  2622,2623,2624,2625,2626,2627,2633,2634,2635,2628,2629,2630,2631,2632,2636,2637,2638,2639,2640,2641,2642,2643,2644,2645,
+  2646,2650,2651,2647,2648,2649,2652,2653,2654,2655,2659,2660,2656,2657,2658,2661,2662,2663,2664,2665,2666,2667,2668,2669,
+  2670,2671,2672,2673,2674,2675,2676,2677,2692,2678,2679,2680,2681,2682,2683,2684,2685,2686,2687,2688,2689,2690,2691,2693,
+  2694,2695,2696,2697,2698,2699,2700,2703,2701,2702,2704,2705,2706,2707,2708,2709,2710,2711,2712,2713,2714,2715,2716,2717,
+  2718,2719,2720,2721,2722,2723,2724,2725,2726,2727,2728,2729,2730,2731,2732,2733,2734,2735,2736,2737,2743,2744,2745,2746,
+  2747,2748,2738,2739,2740,2741,2742,2749,2750,2751,2752,2753,2754,2755,2756,2757,2758,2759,2760,2761,2762,2763,2764,2765,
+  2766,2767,2768,2769,2770,2771,2772,2773,2774,2775,2776,2777,2778,2779,2780,2781,2788,2789,2782,2783,2784,2785,2786,2787,
+  2790,2791,2793,2794,2792,2795,2796,2797,2798,2799,2800,2801,2802,2803,2804,2805,2806,2807,2808,2809,2810,2811,2812,2813,
+  2814,2815,2816,2817,2818,2819,2820,2821,2822,2823,2824,2825,2826,2827,2828,2829,2830,2831,2832,2833,2834,2835,2836,2837,
+  2838,2839,2840,2841,2842,2843,2844,2845,2846,2847,2848,2849,2850,2851,2852,2855,2856,2857,2858,2859,2853,2854,2864,2865,
+  2866,2867,2877,2878,2860,2861,2862,2863,2868,2869,2870,2871,2872,2873,2874,2875,2876,2879,2880,2881,2882,2883,2884,2885,
+  2886,2887,2888,2889,2890,2891,2892,2893,2894,2895,2896,2897,2898,2899,2900,2901,2902,2903,2904,2905,2906,2907,2908,2909,
+  2910,2911,2912,2913,2914,2915,2916,2917,2918,2919,2920,2921,2922,2923,2924,2925,2926,2927,2928,2929,2930,2931,2932,2933,
+  2934,2935,2936,2937,2938,2939,2940,2941,2942,2943,2944,2945,2946,2947,2948,2949,2950,2951,2952,2953,2954,2955,2956,2957,
+  2958,2959,2960,2961,2962,2963,2964,2965,2966,2967,2968,2969,2970,2971,2972,2973,2974,2975,2976,2977,2978,2979,2980,2981,
+  2982,2983,2984,2985,2986,2987,2991,2988,2989,2990,2992,2993,2994,2995,2996,2997,2998,3003,3004,3005,2999,3000,3001,3002,
+  3006,3007,3008,3013,3014,3009,3011,3010,3094,3012,3016,3017,3018,3015,3019,3020,3021,3022,3023,3027,3028,3024,3025,3026,
+  3029,3030,3031,3032,3033,3034,3035,3036,3037,3038,3039,3070,3040,3041,3042,3043,3044,3045,3046,3047,3048,3049,3050,3051,
+  3052,3053,3054,3055,3056,3057,3058,3060,3061,3062,3063,3064,3059,3065,3066,3067,3068,3069,3071,3072,3073,3074,3078,3079,
+  3081,3082,3075,3076,3077,3080,3083,3084,3085,3086,3087,3088,3089,3090,3093,3091,3092,3095,3096,3097,3101,3103,3104,3105,
+  3098,3099,3100,3102,3106,3107,3108,3109,3110,3111,3112,3113,3114,3115,3116,3118,3119,3123,3117,3120,3121,3122,3124,3125,
+  3126,3127,3128,3129,3130,3131,3132,3133,3134,3135,3136,3137,3138,3146,3147,3148,3139,3140,3141,3142,3143,3144,3145,3149,
+  3150,3151,3152,3153,3154,3155,3156,3157,3158,3159,3160,3161,3162,3163,3164,3165,3166,3167,3168,3169,3170,3171,3172,3173,
+  3174,3175,3176,3177,3178,3179,3180,3181,3182,3183,3184,3185,3186,3187,3188,3189,3190,3191,3192,3193,3194,3195,3196,3197,
+  3198,3276,3199,3200,3201,3202,3203,3204,3205,3206,3207,3208,3209,3210,3211,3212,3213,3214,3215,3216,3217,3218,3219,3220,
+  3221,3222,3223,3224,3225,3226,3227,3228,3229,3230,3231,3232,3233,3234,3235,3236,3237,3238,3239,3240,3241,3242,3243,3244,
+  3245,3246,3247,3248,3249,3250,3251,3252,3253,3254,3255,3256,3257,3258,3259,3260,3261,3262,3263,3264,3265,3266,3267,3268,
+  3269,3270,3271,3272,3273,3274,3275,3277,3278,3279,3280,3281,3282,3283,3284,3285,3286,3287,3288,3289,3290,3291,3292,3293,
+  3294,3295,3296,3297,3298,3299,3300,3301,3302,3303,3304,3305,3306,3307,3308,3309,3310,3311,3312,3313,3314,3315,3316,3317,
+  3318,3319,3320,3321,3322,3323,3324,3325,3326,3327,3328,3329,3330,3331,3332,3333,3334,3335,3336,3337,3338,3339,3340,3341,
+  3342,3344,3345,3343,3346,3347,3348,3349,3350,3351,3352,3353,3354,3355,3356,3357,3358,3359,3360,3361,3362,3363,3364,3365,
+  3366,3367,3368,3369,3370,3371,3372,3373,3374,3375,3376,3377,3378,3379,3380,3381,3382,3383,3384,3385,3386,3387,3388,3389,
+  3390,3391,3392,3393,3394,3395,3396,3397,3398,3399,3400,3401,3402,3403,3404,3405,3406,3407,3408,3409,3410,3411,3412,3413,
+  3414,3415,3416,3417,3418,3419,3420,3421,3422,3423,3424,3425,3426,3427,3428,3429,3430,3431,3432,3433,3434,3435,3437,3436,
+  3438,3439,3440,3441,3442,3443,3444,3445,3446,3447,3448,3449,3450,3451,3452,3453,3454,3455,3456,3457,3458,3459,3460,3461,
+  3462,3463,3464,3465,3466,3467,3468,3469,3470,3471,3472,3473,3474,3475,3476,3477,3478,3479,3480,3481,3482,3483,3484,3485,
+  3486,3487,3488,3489,3490,3491,3492,3493,3494,3495,3496,3497,3498,3499,3500,3501,3502,3503,3504,3505,3506,3507,3508,3509,
+  3510,3511,3512,3513,3514,3515,3516,3517,3518,3519,3520,3521,3522,3523,3524,3525,3526,3527,3528,3529,3530,3531,3532,3533,
+  3534,3535,3536,3537,3538,3539,3540,3541,3542,3543,3544,3545,3546,3547,3548,3549,3550,3551,3552,3553,3554,3555,3556,3557,
+  3558,3559,3560,3561,3562,3563,3564,3565,3566,3567,3568,3639,3640,3641,3642,3643,3644,3645,3646,3647,3648,3649,3650,3651,
+  3652,3653,3654,3655,3656,3657,3658,3659,3660,3661,3662,3663,3664,3665,3666,3667,3668,3669,3670,3671,3672,3673,3674,3675,
+  3676,3677,3678,3679,3680,3681,3682,3683,3684,3685,3686,3687,3688,3689,3690,3691,3692,3693,3694,3695,3696,3697,3698,3699,
+  3700,3701,3702,3703,3704,3705,3706,3707,3708,3709,3710,3711,3712,3713,3714,3715,3716,3717,3718,3719,3720,3721,3722,3723,
+  3724,3725,3726,3727,3728,3729,3730,3731,3732,3733,3734,3735,3736,3737,3738,3739,3740,3741,3742,3743,3744,3745,3746,3747,
+  3748,3749,3750,3751,3752,3753,3754,3755,3756,3757,3758,3759,3760,3761,3762,3763,3764,3765,3766,3767,3768,3769,3770,3771,
+  3772,3773,3774,3775,3776,3777,3778,3779,3780,3781,3782,3783,3784,3785,3786,3787,3788,3789,3790,3791,3792,3793,3794,3795,
+  3796,3797,3798,3799,3800,3801,3802,3803,3804,3805,3806,3807,3808,3809,3810,3811,3812,3813,3814,3815,3816,3817,3818,3819,
+  3820,3821,3822,3823,3824,3825,3826,3827,3828,3829,3830,3831,3832,3833,3834,3835,3836,3837,3838,3839,3840,3841,3842,3843,
+  3844,3845,3846,3847,3848,3849,3850,3851,3852,3853,3854,3855,3856,3857,3861,3862,3863,3864,3865,3866,3867,3868,3869,3870,
+  3871,3872,3873,3874,3858,3859,3860,3875,3876,3877,3878,3879,3880,3881,3882,3883,3884,3885,3886,3887,3888,3889,3890,3891,
+  3892,3893,3894,3895,3896,3897,3898,3899,3900,3901,3902,3903,3904,3905,3906,3907,3908,3909,3910,3911,3912,3913,3914,3915,
+  3916,3917,3918,3919,3920,3921,3922,3923,3924,3925,3926,3927,3928,3929,3930,3931,3932,3933,3934,3935,3936,3937,3939,3945,
+  3947,3949,3950,3938,3940,3941,3942,3944,3946,3948,3943,3956,3957,3958,3959,3960,3961,3962,3963,3964,3965,3966,3967,3968,
+  3969,3951,3952,3953,3954,3955,3970,3971,3972,3976,3973,3974,3981,3982,3983,3984,3985,3986,3975,3977,3978,3979,3980,3987,
+  3988,3989,3990,3992,3993,3991,3994,3995,3996,3999,3997,3998,4000,4001,4002,4003,4004,4005,4006,4007,4008,4009,4010,4011,
+  4012,4013,4014,4015,4016,4017,4018,4019,4020,4021,4022,4023,4024,4025,4026,4027,4028,4029,4030,4031,4032,4033,4034,4035,
+  4036,4037,4038,4039,4040,4041,4042,4043,4044,4045,4046,4047,4048,4049,4050,4051,4052,4053,4054,4055,4056,4057,4058,4059,
+  4060,4061,4062,4063,4064,4065,4066,4067,4068,4069,4070,4071,4072,4073,4074,4075,4076,4077,4078,4079,4080,4081,4082,4083,
+  4084,4085,4086,4087,4088,4089,4090,4091,4092,4093,4094,4095,4096,4097,4098,4099,4100,4101,4102,4103,4104,4105,4106,4107,
+  4108,4109,4110,4111,4112,4113,4114,4115,4116,4117,4118,4119,4120,4121,4122,
+];
+const _dpo = [
+  0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,23,25,28,30,31,
+  32,33,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,52,53,55,56,57,58,
+  59,60,61,62,63,64,65,66,67,68,70,71,74,75,77,80,82,84,86,88,90,91,94,96,
+  98,100,102,103,105,106,107,109,110,111,112,113,115,116,117,119,121,122,124,127,128,130,132,133,
+  134,135,137,139,141,143,146,148,149,151,153,156,159,160,161,163,164,166,167,169,170,173,174,175,
+  177,180,181,182,184,187,188,189,190,191,192,193,194,195,196,197,199,200,201,202,203,205,206,207,
+  209,210,211,212,213,214,215,217,218,219,220,221,222,224,225,226,228,230,231,233,234,235,238,243,
+  244,246,248,249,250,251,253,254,255,257,258,259,261,263,265,266,269,270,272,273,276,277,278,280,
+  281,282,283,285,286,287,288,289,290,293,294,295,296,298,299,300,301,302,304,305,306,307,308,310,
+  312,313,314,316,317,318,319,320,321,323,324,325,326,328,329,331,332,333,335,336,337,339,341,343,
+  344,347,348,351,352,353,354,355,356,358,359,360,363,364,367,370,373,376,380,381,384,386,387,390,
+  392,393,394,395,396,397,399,401,402,404,405,406,409,410,411,412,413,414,415,416,418,419,420,422,
+  423,424,425,426,428,430,431,432,433,434,436,438,439,442,443,445,446,449,451,452,454,455,456,457,
+  458,460,461,464,465,466,467,469,471,473,474,476,478,479,481,482,484,485,487,490,493,494,495,497,
+  499,502,503,506,511,513,515,519,521,522,524,525,528,530,532,533,535,537,539,540,541,543,544,545,
+  546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,
+  570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,591,592,593,594,595,597,
+  598,599,601,603,604,605,606,607,608,609,610,611,612,614,616,617,619,620,622,623,624,626,627,629,
+  630,632,633,636,637,639,640,641,642,644,645,646,648,650,651,652,653,655,656,657,659,663,664,665,
+  669,670,671,672,673,674,675,676,677,678,680,681,682,684,686,687,689,690,692,693,694,695,696,697,
+  699,700,702,704,705,706,707,708,709,711,712,713,714,715,716,717,718,719,720,721,723,728,730,732,
+  733,735,737,738,739,741,743,745,749,751,754,759,760,763,765,767,770,772,773,775,776,777,779,781,
+  785,786,789,790,793,794,795,797,798,799,800,801,802,803,804,805,808,809,811,812,813,814,816,818,
+  819,823,824,825,828,830,831,832,833,835,836,837,839,840,842,843,844,846,847,848,849,850,852,854,
+  855,856,857,859,860,862,865,867,869,870,871,875,876,878,881,882,884,886,887,888,890,891,892,895,
+  896,898,900,901,902,904,908,910,911,913,914,916,917,918,919,921,923,927,930,931,933,934,935,936,
+  938,939,940,942,943,946,948,950,952,954,955,957,959,960,961,962,963,966,968,971,973,974,977,979,
+  981,983,986,987,988,989,992,993,995,996,997,1000,1001,1003,1007,1011,1016,1021,1023,1026,1029,1033,1037,1038,
+  1041,1043,1047,1049,1051,1054,1056,1060,1062,1063,1066,1068,1069,1071,1072,1073,1074,1075,1076,1077,1079,1080,1082,1083,
+  1084,1085,1086,1087,1088,1089,1090,1091,1092,1094,1095,1096,1097,1098,1099,
+];
+const _dp = [
+  63,64,64,65,62,65,66,62,67,69,68,62,70,71,73,72,75,74,76,77,76,77,83,83,
+  84,84,85,86,82,85,85,78,79,80,81,81,86,87,87,87,87,87,87,87,87,87,87,87,
+  87,87,87,88,87,87,88,87,88,88,88,88,88,88,88,88,88,88,93,92,92,95,94,92,
+  93,94,93,92,94,92,94,95,94,95,95,96,95,96,94,95,94,96,93,96,98,99,96,98,
+  98,99,98,99,97,99,97,97,102,102,102,101,102,101,100,100,100,91,99,99,91,90,91,89,
+  90,89,103,104,104,105,106,106,106,107,108,109,110,111,112,112,114,113,114,110,115,115,127,108,
+  116,125,117,118,119,120,520,122,520,118,123,124,124,125,127,126,127,128,129,129,130,142,130,141,
+  142,131,130,132,133,134,135,135,136,135,136,137,138,138,137,305,138,140,305,141,142,146,146,143,
+  143,143,144,144,146,146,147,147,147,145,151,145,150,150,151,151,153,153,149,149,148,148,153,152,
+  153,152,152,152,152,152,154,155,155,156,157,158,157,158,158,158,159,160,160,159,161,162,161,162,
+  163,164,172,164,156,165,165,166,167,167,166,166,168,168,169,169,170,170,171,172,173,173,174,173,
+  176,174,175,176,177,176,176,177,177,178,179,180,178,181,180,181,181,182,182,182,183,183,183,186,
+  186,187,184,185,187,184,184,185,185,189,189,188,188,189,188,190,190,190,191,191,192,193,192,504,
+  193,193,193,504,504,504,504,195,195,193,195,193,196,196,197,198,197,197,198,198,200,200,209,209,
+  199,200,201,201,202,201,202,204,203,205,206,205,203,206,207,206,207,206,207,199,199,208,208,238,
+  238,239,240,241,240,241,242,241,243,244,244,245,246,246,247,248,248,249,250,251,250,251,253,254,
+  252,253,254,252,253,255,256,257,258,258,259,260,259,260,261,261,277,261,262,264,263,263,263,264,
+  265,264,265,266,267,267,268,268,268,269,269,269,265,269,270,271,271,272,271,272,271,274,273,286,
+  286,274,274,275,262,275,276,275,276,278,277,277,278,278,275,278,285,285,286,285,284,285,284,281,
+  281,282,282,283,279,279,280,281,280,280,287,287,288,289,290,290,291,292,292,300,293,294,294,295,
+  296,297,297,298,298,298,299,299,300,301,301,302,327,301,303,303,304,304,305,288,306,307,308,309,
+  310,311,312,313,314,315,316,316,317,318,319,319,320,321,322,323,324,325,326,327,326,326,328,329,
+  329,331,318,332,332,333,334,330,334,335,336,335,335,335,336,336,336,336,336,336,337,337,337,337,
+  337,337,337,338,338,338,338,338,339,339,339,339,339,339,339,339,339,339,339,340,340,340,340,340,
+  340,340,340,340,340,340,340,340,340,340,340,341,342,343,344,341,341,341,341,342,343,342,342,342,
+  343,342,343,343,344,344,344,345,345,345,345,362,362,366,363,364,364,364,366,365,366,367,367,367,
+  367,370,369,368,369,374,364,373,373,372,373,374,374,372,374,372,371,371,369,371,370,375,375,376,
+  375,377,376,377,378,378,379,379,380,380,381,379,380,381,385,387,382,380,382,383,385,383,383,384,
+  384,385,386,386,386,387,387,396,387,388,388,396,389,396,390,389,390,390,390,391,391,391,392,392,
+  392,393,395,393,393,395,393,394,394,395,396,397,397,397,398,398,399,399,400,400,400,400,400,400,
+  400,401,407,401,402,403,404,405,405,406,405,406,407,407,408,408,411,409,410,411,412,412,413,413,
+  414,410,414,415,416,416,417,417,418,419,417,418,419,420,421,419,419,420,421,422,423,423,425,423,
+  424,425,425,427,427,426,427,428,429,429,430,428,430,423,424,431,435,431,432,433,434,433,434,435,
+  437,435,436,437,438,438,439,440,441,440,440,443,444,441,442,443,441,441,454,442,442,445,444,445,
+  444,445,446,446,449,450,453,449,449,446,447,448,450,451,450,451,451,452,453,452,453,453,454,455,
+  454,455,454,455,455,456,456,457,457,458,457,458,457,458,458,458,458,459,460,460,461,462,462,463,
+  464,464,466,466,481,465,467,461,462,468,469,469,469,470,467,468,470,471,471,472,473,474,474,475,
+  476,477,478,480,476,480,497,479,481,482,482,483,483,484,485,486,486,487,489,491,488,489,490,491,
+  492,493,493,494,495,497,499,479,498,498,499,498,499,501,502,489,500,501,502,502,503,503,504,504,
+  504,505,505,506,496,507,507,476,508,535,510,511,511,512,512,519,513,514,515,515,516,514,516,517,
+  518,519,520,519,521,524,522,523,523,524,538,528,529,527,526,527,538,530,531,526,532,533,537,531,
+  533,534,535,536,537,544,545,546,545,545,546,547,547,547,548,549,549,550,551,551,552,553,554,554,
+  555,556,557,557,558,559,560,561,562,563,564,565,566,566,567,568,569,570,570,571,572,573,574,575,
+  577,572,575,576,577,576,576,578,579,579,580,580,581,582,584,582,583,584,585,590,591,594,590,594,
+  593,594,595,596,590,593,593,592,593,596,593,596,592,591,592,591,597,597,597,598,598,597,598,598,
+  598,599,599,599,600,600,600,601,600,600,601,601,599,601,599,604,604,604,604,
+];
+
+const _acNo = new Map();
+for (let i = 0; i < _ak.length; i++) _acNo.set(acId(_ak[i]), i);
+const _districtNo = new Map();
+for (let i = 0; i < _d.length; i += 2) _districtNo.set(`${_s[_d[i + 1]]}|${_s[_d[i]]}`, i >> 1);
+
+function _range(offsets, values, decode, d) {
+  const out = [];
+  if (d === undefined) return out;
+  for (let k = offsets[d]; k < offsets[d + 1]; k++) out.push(decode(values[k]));
+  return out;
+}
+
+// PC ID of an AC, or null
+export function pcForAc(acId) {
+  const i = _acNo.get(acId);
+  return i === undefined || _ap[i] < 0 ? null : _s[_ap[i]];
+}
+
+// AC IDs in a district, in AC number order
+export function acsInDistrict(state, district) {
+  return _range(_dao, _da, (n) => acId(_ak[n]), _districtNo.get(`${state}|${district}`));
+}
+
+// PC IDs covering any AC of a district
+export function pcsInDistrict(state, district) {
+  return _range(_dpo, _dp, (i) => _s[i], _districtNo.get(`${state}|${district}`));
+}
+
+export default { pcForAc, acsInDistrict, pcsInDistrict };
@@ -0,0 +1,7 @@
+// Content-hashed data assets under public/data, by name
+// Generated by scripts/data_assets.py; load with src/utils/dataAssets.js
+
+const dataAssets = {
+};
+
+export default dataAssets;
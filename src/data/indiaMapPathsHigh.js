@@ -0,0 +1,189 @@
+// India state and UT paths, simplified (high level of detail)
+// Generated by scripts/simplify_map_paths.py from indiaMapPaths.js; see it for the method
+// viewBox: 0 0 1000 1136, integer coordinates, tolerance 0.3
+// 197 rings, 14418 points (source: 221 rings, 26551 points)
+
+const indiaMapPaths = [
+  {
+    name: "Andaman & Nicobar Islands",
+    path: "M871 1122l1-2 1 0 1-1 2 0 1-1 0 1 1 0 1 5 1 1 0 2 0 1-1 1 1 1-1 0 0 2 0 1 0 1-1-1-1 2-1 0 0-2-1-1 1 0-1-1-1-2 0-1-2-2-1 0z m-1-6l0-1 0-1 3-1 0-2 0 2 1 1-1 2-1 1-1 1-1-1z m-11-23l1-1 1-1 1 1 0 1 1 0 1 1 1 2-1 0-1-1-2 1-1-1-1-1z m7 0l1-2 1 0 0 1 0 2z m2-5l1 0 0 3z m-4-2l1-1 0-1 2 0 0 1-1 2 1 3 0 1-1 0 0 1-1 0 0-1 1-1 0-1-1 1z m-8-2l0-1 1 1z m-5-3l1-1 1 0 0 2 1 2 1 1-2-1-2-1z m18-8l0-1 1 4 0-2z m-30-23l1 0 1-1 1 1 1 2-1 1-3 0z m-12-54l1 0 1-2 1 0 0-1 1-1 1 0 1 1 0 2 1 1 0 1 1 2-2 3 1 1-2 2-1 0-2-1-1 0-1 0 2-2-1-2-1 0z m7-21l0-1 2 0-1-2 1-2 1 1 1 2-1 1 1 1-2 1-1 0z m-13-6l1-1 1 0 1 2-1 0-1 0z m11-2l1 0 1 1-1 1z m17-8l2 0-1 1z m-3-6l2-1 1 0 1 5-1 0-1-2-1 0 0-1-1 0z m1-3l2 0-1 2-1-1z m0-2l1 0 1 0 1 2 0 1 0 1-1-1 0-1-2-1z m3 1l1-3 0 1 1 1-1 2z m-18 10l0-2 2-2 0 2 1 1 1-8 0-3 2-2 1 2 1 0-1 3 2 2-1 1 0-1 0 2-1 0 0 1 0 2 1-1 1-1 0 1-1 7-1 1-1 2-1-1 0 1 1 0 1-1 1 0-1 5-1 1-1 0-1-1 0-1-1-2 0-3-1-1-1 1 0-5z m7-14l1 0 0 2-1 0z m5 0l1-1 0 1z m-6-1l1-1 0 2z m7 0l0-1 1 1z m-6 6l2-4-1-1 0-1 1-1 0-1 3 1 1 1-1 1 0 2-1-1 0 2 0-1-2 3-1 1z m37-7l1-1 1 1 0 2-1 0z m-33-3l0-1 2 1-1 0z m3 1l0-2 1-1 0 1z m-8-16l1-1 0 2z m5-3l0 1 1-1 1-1 0 1 1 0 1 3-1 1 2 2-1 1 0 2 1 3-1 2-1 1 1 0-1 2-1-1-1 1-1-1 2 4-1 0-1 1-2-1-2 1-1-1 0-6 0-1 0-1 0-2 1-1 1-1-1-1 1 0 0-1-1-2 0-2 2-1 0-1z m-7 1l1-3 1-1 1 0 0 3-2 4z m11-4l1 0 1-1-2 2z m44-16l1-1 0 1z m-48 20l0-1-2-1 0-2 1 0 0-1-1 0 0-3 1 0 0-1 1-1-1 0 1-3 0-1-1 0 1-1-1 0 0-1 1-2 0-1 1-1 0-1 1 0 0-1 1 0 0-1 1-1 1 1 0-1 0-1 1 1 0-1 1 3 0 3 1 2 0 1-1 0 0-1-1 0-1 1-1-1 0 1 2 1 1 1 0 3-1 4 0 1-2 0 0 1-1-2-1 2 1 1 0 1-1 0 0-1-1 0 0 1 0 1 0 1z m5-28l1 0 0 1-1 0z m12-17l1 0 0 1 0 2 0-1z",
+    labelX: 857, labelY: 993,
+  },
+  {
+    name: "Telangana",
+    path: "M319 815l0-3 0-1 0-1 0-2 0-4 2-2 1 0 0-1-2-2-2 0-2 1-4-2-1-2 1 0 0-1 3 0 0-1 1 0 0-1-1-1 3 0 0-2-1 0-1-1 2-1 0-1-2 0 1-2 1 0 0-1 0-1 0-3 0-3 1 0-1-4-2 0-2-2 1-1 0-1 3-2-1 0 1-2-1-1 2 0 1 0 0-1-1-1 1-1 2 1 0-1 1 0 0-1 1 0 1 0 1-1-2-1-2 0 0-1-1 0-1-1-1 2 0-1-2-1 1-4 2-1 1-1-2-1 0-1 1-1 1 0 0-1 1-1 0-1 1 1 0-2 1 0 0-1 0-1-3-1 0-1 0-1 1 0 1 0-1-2-1-2 1-1 0-1 1-1-2 0 0-1 0-1-1 0 0-1 1-1 0-1-1 0 0-1 2 0 0-1 1 0 0-1-1 0 0-2 2 0 0 1 3-1 1-1-1-3 2-1 2-4 2-1 1 1 0-1-1-1-1-2-1 0 0-1-1 0 0-1-2 0 0-2 0-1 1 0 0-1 1-1 0 1 1 0 0-2 0-1 0-1 1-2 1 0 0-1-2 0 0-1 3-1 4 2 0 1 1 0 2 0 0 1 1-1 1-3-1-1 1-1 1-2 1 1 1-1 1-1-1-3 1-1 0-1-2-2 1-1 1 0 1-1 1-2-1-1 0-1-2-1 1-2 1 1 1 0 1 2 2 1 1 0 1-1 2 1 1-1 3 2 1 0 2 0 1 1 1 0 1 3 1 0 2 1 0 1 1 1-1 1 1 0 1 1 1-1 0 1 2 0 0 1 1 0 2 2 1-1 0-1 0-1 1-2-1-1 3 1 0 1 2-1 1 2 1 0 1 1 2-1 0-1 1 0 0 1 2 1 1-2 0-1 3 0 1-1 1 0 1 2 1 1 2 1 3 4-1 3-1 3 1 2-3 2 0 3 2 0 0 6 0 1-1 0 1 2 3 1 1 1 2 2 2-1 0 1 1 0 0-1 2 0 1-1 2 5 1-1 1 1 2-1 1 0 5 3 1 2 1 1 0 1 1 1 1 3 1 2-1 1 0 2 2 0 0-1 1-1 1 0 0 1-1 0 1 2 1 0 3-1 0 1-1 1 0 1 2 9 1 2 1 0 1-1 2-2 3 2 5 0 3-1 0 1 3-1 1 1 2-2 1-1 1 1 2-1 1 2-1 0-1 1-2 1-2 1-2 1 0 1-2 4 1 0-1 2-1 3-2 3-1 0-2-1-2 2-3 0-1 1 1 2-1 1-6 1-2 0-1 0 1 2-2 0 0 1 0 2-1 1-4-1-1-1-1 1-1-1 1 0-1-1-2-1-3 1 0 2 0 1-1 0-1 0-1-2-1 1 1 1-1 2 3 1 1 1 0-1 1 0 1 0 1 1 1 1-1 1-1 1 2 2-1 0-4-1 0-1-2-1 0 1-1 1 0-2-2 0 0-4-2-1-2-1 0-1-2 2-2 0 0 1-1 0-1 2-1 2 2 0 0 1 1 1-1 2-3 4-2 0-1-2-2 0-1-1-2 1-1 0-2 1-1 0-1 1-3 0-2 2-6 1-1 1 0 1 0 1 0 1 0 3 0 1 0 1 0 2-1 0-1 1-1-1-4 0-2 1-2 1 1 2-1 1-1 0-1-2 0 2-2 3-2 0-2-1-1-2-1 0-2 2-5-1-3 1-2 0 0 1 0 1-1 2-2 1 0 2-2 0 1 0-1 1-2-1 0-2-1 0-1 2-4-2-3 1-3 0-1 0-1 0-1-1z",
+    labelX: 388, labelY: 745,
+  },
+  {
+    name: "Andhra Pradesh",
+    path: "M409 898l1-1 0 1 0 1z m73-110l1 0 1-1 0 4-1 0-1-1 0-1z m1-1l-3 0-1-1 0 1 3 1-1 1 1 1 1 1 0 1-12 6-4 1-4 2-1 0-4-1-1 0-5 0-4 2-2 3-1 4-2 3 1 1-2 2-3 4 0 2-3 2-3 0-1-1 0-1 0-2-1-2-3 0-4 0-4 2-4 2-2 3-1 3-2 4-2 4-1 2-1 4-1 4 2 11 1 3 1 3 1 0 0 3-1 6-1 5 0 4 1 3 3 7-1 5 1 2 2 6-1 0-1-4-2-3 0-1-1-1-1 0 0 3-1-2-2 3 2 2 1 0 1 1 3 1 1 1 1 0 0 2-1 0-1-2-1-2-2 1-2-1-1-2-1 1-1 0-1 0 2 1-1 0-1 1-1 1 0 1-1 0 1 1-1 2-3 1-1 0-1 0-1 0 0 1-1 0 2 1-1 2-1-1-1 0-1-1 1-1-1-1-3 2-1-3-4 0-2 1 2 0-1 3 1-1 1 1-1 0 0 1-2 0 0 1-1 0 0 1-1 0-1 0-2 0 0 1-2 1 0 2-3 0-1-1-2-1-2 0-1 0-1 2 0-2-2 0-3 1-1-1 0 2-2 0-1 1 1 2-1 2-1 4-1 1 0 1-1 1-1-2 0 2-1 0 0 2-3 0-3-1-1-2-2 1 0-1 1-1 0-1 0-3 1-1 2 1 0-2 1-1 1 1 1 0 1 0 1 1 0-1-1-1 0-2 1 1 0-3 1 0 0-1 1-1 0-1 1-1 1 0-1-1 1-3-2 0-2-1 0-1-1 1 0-1-1 0 0 1 0-1-2-1 1-1 0-4 1-3-1 0-4 0-1 0-1 1-1-1 1-1-1-1-3 0-1-2 2 0 0-1-1 0 1-2 0-3-1 0-1-1-1 1-1 0-1 2-1-1 0-1 1-1 0-2-2 2-1-1-2 0 0 2-2 1 0 1-2 1 0 1-1 0 0-1-2 1 0 1-1-1-1 1-1-1 0 2-2 0 0 1-1 0 1-3-1-2 0 1-1-1 1-1-3 0-1 0 0-1-2 1-1-2-1 1-1 0 0-2-1 1 1 1-1 0-1 1 2 1-1 0 1 2-3 0-1 0-1-1-1 2 0-1-1-2 1-1 1-2 0-1-1-1 0-1-2-2 1-1 0-1-1 0-1-1-1 0 0-1 2-1 1 0 2 0-1 3 1 0 0 1 3 1 1 1 0 1 1-1 2 0 1-1 1 1 1-1 0 2 1 0 0 1 0 1 0 1 1 0 1 0 0-2 1 0 0-1-2 0 0-1-2-1 1-1 1 0 1-1-1-1-1 1 0-1 1 0 0-2 3 0 1 1 0-1 0-2 0-1-1-1-1 0 0-1-1 0-1 0 0 1 0 1 1 0 0 2-1 0-1-1 0-1-2 0 0-2-2 0-1 0-2-1 0 1-1 2 0 1-1 1-1-1-4 0-1-1 1-1 0-1-1 0-1-1 0-2 1 0 1 0 0-1 1 0 0-2-2 0-2 1 0-2-2 0-1-3 0-3 1-2 0-1 1 0 1-3 0-1 0-2 0-1-1 1-2-1 1-2-1-1 1-1 2 1 1 1 2 0 1 0 3 0-1 1 2 0 0-1 1 0 0-2 1-1 0-1 1-1-1-2-1 0 1-1 1 0-1-1-1 0 0-2-2 1-1-2 1-1-1-1-2-2 0-1 2 0 0-4 2-1 1 1 0-1-1-2 0-1-1 0 0-3-1 0 0-1 2-2 3-2 3 0 4 1 2 0 2 0 4 1 1 1 1 0 1 0 3 0 3-1 4 2 1-2 1 0 0 2 2 1 1-1-1 0 2 0 0-2 2-1 1-2 0-1 0-1 2 0 3-1 5 1 2-2 1 0 1 2 2 1 2 0 2-3 0-2 1 2 1 0 1-1-1-2 2-1 2-1 4 0 1 1 1-1 1 0 0-2 0-1 0-1 0-3 0-1 0-1 0-1 1-1 6-1 2-2 3 0 1-1 1 0 2-1 1 0 2-1 1 1 2 0 1 2 2 0 3-4 1-2-1-1 0-1-2 0 1-2 1-2 1 0 0-1 2 0 2-2 0 1 2 1 2 1 0 4 2 0 0 2 1-1 0-1 2 1 0 1 4 1 1 0-2-2 1-1 1-1-1-1-1-1-1 0-1 0 0 1-1-1-3-1 1-2-1-1 1-1 1 2 1 0 1 0 0-1 0-2 3-1 2 1 1 1-1 0 1 1 1-1 1 1 4 1 1-1 0-2 0-1 2 0-1-2 1 0 2 0 6-1 1-1-1-2 1-1 3 0 2-2 2 1 1 0 2-3 1-3 1-2-1 0 2-4 0-1 2-1 2-1 2-1 1-1 1 0-1-2 1-2 5-1 2-2 0-1 1 0 1 0 2 0 0 1 1 0 1 1 2 0 0 1 1 0 0-3 1 0 0 1 1-1 0-3 1 1 0-1 0-1-2 0 0-1 1-1 0-1 1-1 1-1-1 0 1-2-1-2 4-4 1 1 1 0 0 1-1 1 2 0-1 2 2 1 0 4 1 1 1-2 4-2 1-1-1-2 1-1 2 1 1 0 0 1 1 1 2 0 1 0 2 0 0-1-2-2 3-3-2-1 0-1-1 0 1-1-1-1 2 0 2-5 2 1 3 0 0-1 3-1 2-1-1 0 1-1-2-2 0-1-1 0-1-2 1 1 0-1 1 0 2 0 1 2 1 0-1-2 1 0 0-2 0-1 1 1 0 1 0 1 1 0 1-2 1 0 0-1 1 0-1-1 1-1 3 5 0 1 1 0 0 2 1 1 0-1 0-1-1-1 2-1 1 2 0 1 1 2 1 2 4 0 2 1 0 1 1 0 4-1 2 0 1 0 1 0 0-1 1 0-1-2 1 0 3-2-1-1 1-1-1-1 2 1 1-2 2-1 1 0 0 1 0 1 1-2 1 0 1 0-1-1-1 0-1-1 3 0 0-2 1 1 0 1 1 1 1 1-2 3-1 0 0 1-3 3-1 2-2 2-2 3-3 3 0 1-7 7-1 2-6 3-2 1-6 3-5 4-1 2-3 2-1 1 0 2-7 8-2 1-5 2-1 1-7 4-5 2-4 3-6 5-2 3 0 2-1 0 1 2 3 1-1 4z",
+    labelX: 430, labelY: 816,
+  },
+  {
+    name: "Arunachal Pradesh",
+    path: "M925 420l0-1-1-1 1-2-1 0-1-3 2-1 0-1-2-3 0-2 2 0 0 1 4-3 3-1 1-2-1-1 1-1 2-1 2 1 9-2 0 1 1 0 1-1 2-1 1-2-1-3-2 0-1 1 0-1-1 0 0-1 1 0 0-3-2-1 0-1-1 0 0-1 0-1-1 0 1-2-1 0 0-1 1-1-1 0 2-2 3-3 2-3-5-1-8 1-1 1-2 2-4 2-2-2-10 4-6 2 0 1-1 0-1 0-2 1-2 0-2 2-1 0-3 2-2 0-1-1-2 1-3-1-1-1 1 0-1 0-1 1 0 1 1 1 0 1-3 2-3 2 0 2-2 1-2 2-5 5 1 3-4 2-2 2-6 1-5-1-8 2-1 0-2 0-3-2-2-1-3-1-4 0-1 1-2 1-5 0-1 2-2-1-1 1-1 1-1-1-2 1-3 0 0-3 0-1-1-1-1-1-1-1 0-1 0-1 0-1 2-3-1 0 0-1 1-1 1 0-2-2 0-2-1-2 0-1-3 0-3-1-2 1-3 0 0-1-2 0-3-3 1-1-1-1 2-3 1-2 0-2-1-1-2 1 0-2 1 0 3 0 1 1 2 1 2 0 1 3 2 0 3-2 2 1 4-3 1-1 2 0 2 3 2-1 1-1 2 1 1-1 1 0 1 1 0-1 2-2 2-1 3-3-2-2-1-1 0-2 1-1 4-2 0 1 3-1 0-2 2-1 1 2 2-2-1-1 3 0 1-1 2 0 1-1 0-1 0-1-1-2 3-2 1-2 0-2 1 0 0-1 2-1 2-1 1 1 0-1 1 1 3 0 4-1 2 1 2-2 2 1 1 0 1-3 2-1-1-1 1 0-1-1 2-1 1-2 3-2 2-5 2-2 3-1 0-1 2-1 2 0 3 0 0-2 1-1 1-2 3 2 2 2 1 1 0 2 2-1 2 1 2 0 1 1 0-1 3 1 1 1 4 0 0 2 1 0 1 0 1 1 4 0 2-4 1 1 0-4 2 0 0-2 1 1 2-1 1-1 1 0 1-2 1 0 1 0 2-2 2 1 4-3 1-1 2 3 1 2 0 2 2 2 0 1 2-1 1-1 1-1 1 2-1 3-3 0-2 1-1 2-2 0 2 4 0 1-1 1 1 1 2-1 2-2 2-2 3 0 3-1-2 3 0 1 2 0 0 2 0 1 3 4 0 1-1 1-4 2 1 2-3 2 0-1 0 2-2 0-1 1 2 1-1 1-3 3 1 0 1 1 2-1 0 2 1 0 1-2 0-1 2 0 3-2 3 0 3 2 0 2 3 0 2 0 0 1 3 1 2-1 1-1 1 1 2 2 2 0 0 1 2 0 4 3-1 0-2 1 0 1 1 1-1 1 0 1 1 0 1 1 1 0 0 1-1 0 0 1 0 3-1 1-1 0 0-1 0-1-2 1-4 3-2 1 0 2-1 0-1 1-2 2-1 1-1 1-1 0 2 4-1 2 2 2 0 1 1 1 0 1 3 3 0 1 1 2 1 0 1 2-1 1-1-1-2 1-3-2-2-1-2-1 1-1 0-1-1-1 0-1-2-2-3-1 0 1-3 0-1 0 0 1-2 2-2-1-3 1-1-1 0 1-2-1-1 1-1 0-7 3-3 5-2 2-2 0-2 2-1 3-1 0-1-1-2 2 0 2-3-1-1 1-1 2 0 1-2 2-4 1-1 0 0-1z",
+    labelX: 899, labelY: 367,
+  },
+  {
+    name: "Assam",
+    path: "M742 464l0 2-1 0z m181-58l-3 3-3 2-1 0-1-1-2 1-2 3-1 1-1 1-1 1 0-1-2 2-2 1-1-1 0 1-2 0-1 1-1 1-1 1-1 1 0 1-1 2-1 1-2 2 0-1-1-3-3 4-1 4-1 0-1 1-1 2-1 0 0 2-1 1-1 4-1 3 0 1 1 2-2 1-1 2-2-1-1 2-1-1 1-2-1-2-3 2 1 2-3 2-3 3-2 3-2 1-1 0-2 2 2 3 2 1 1 3-1 1 1 1-3 2-2 3 0 3-1 2-1 0-1 1 0 2 0 1 0 1-2 3 0 1-1 1-1-1-1 0-1 4 1 2-1 2 1 1-2 1 0 1 0 1 0 1-1 1 1 1-2 0-2 1-1-1 0 1-1 0-1 0-1-1-2-4-2 6-2 1-1 3-2 0-1 3-1 0-1 1-1 0 0-2 0-2-5 0-2 0 2-5-1-2-1-1 0-1 1-6 1-3 0-1 0-3-1 0 0-3 2 0 3 2 3 0 0-3-1 0 0-1-1 0 0-2 1-1 1-2 1 0 0-1 3 1 2-3 3-1 1 0 1 0-2-1 1-2 0-2-1 0-1-1-2-2-1 0-1 0 0-2-1 0 0-1 2-1 1-2-1 0-2 1-1-1 0-1-2-1-1-2-1 0 0-1-1-1-1 0-1 1-3 0-1 0-2 2 0-2 0-1-1-3 1-2 2-1-2-1 0-1 5-5-3 1-2-1-1 1-2 0-1 1-2 0-2 1-1-1-1 0 0-1 0-2-2 0-1 1-2 1 0 4-2 2-2-2 1 0 0-1-1 0 1-2-2 0-1 2-1 1-1 2-1 1-1 1-1 0-3 1-1 3-1 0-1 1-1-1-1-1 1-3-2 0-1 1-2 0 0-1-1 1-1 0 1-2-2-1 0-1-2-1 0 1-1-1-3 0 0 2-2-1 0-1-1 0-1 0-2 1-1-1-2 2 0-2-2-2-1 1-2-1-1 0-1 1-1 1-6 0-2 2-2 0 1 1-1 1-2 1 0 2-1 1-1 0 2 3 3 2-1 1-1 0-3 1 0-3-1-2 0-1-1 0 0-1 1-1-1-2 2-4 0-1-2 0 1 0 1-1-1-1-1 0-1-4-1 0 0-1-1-1-1 0 1-1-1 1 0-1 1-1-1 0 1-1-1-1 1 0-1-1 2 0-1-1 1 0 1-1 2-1 0-1 1-3-1 0 0-2 1-2 0-1-1 0 0-1 1 0 0-2-1-1 0-1 1 1 6-1 4-1 0-2 2-2 3 1 1-1 0-1 2 0 5 4 2 0 1 1 1-1 1 1 10-1 2 0 1-1 6 0 1 1 2 0 1 0 1-2 3 2 4-1 2 0 2 0 2-1 2-1 0-2 2 0 3 2 2 1 2-1 0-1 3 0 2-1 1 1 1-1 1-1 2 1 1-2 5 0 2-1 1-1 4 0 3 1 2 1 3 2 2 0 1 0 8-2 5 1 6-1 2-2 4-2-1-3 5-5 2-2 2-1 0-2 3-2 3-2 0-1-1-1 0-1 1-1 1 0-1 0 1 1 3 1 2-1 1 1 2 0 3-2 1 0 2-2 2 0 2-1 1 0 1 0 0-1 6-2 10-4 2 2 4-2 2-2 1-1 8-1 5 1-2 3-3 3-2 2 1 0-1 1 0 1 1 0-1 2 1 0 0 1 0 1 1 0 0 1 2 1 0 3-1 0 0 1 1 0 0 1 1-1 2 0 1 3-1 2-2 1-1 1-1 0 0-1-9 2-2-1-2 1-1 1 1 1-1 2-3 1-4 3 0-1z",
+    labelX: 843, labelY: 443,
+  },
+  {
+    name: "Bihar",
+    path: "M681 426l1 1 1-1 2 0 1-1 0 1-2 1 2 3 0 1 1 1 1 1-2 1-1 1-3 2-2 2-1 0-1 1 0 1-1-1-1 0 1 2-1 0 1 1-1 0-1 1 0-1-1 0-2 2 0 1 0 3-1 0 0 1 1 1 3 1-1 0 1 1-1 1 3 3 2 1 0 5 1 2 0 1-1 0-2-1-1-1-1 0-1 1-1 0 0 1-1 0-1 2-1-1 0 2 0 1 0 1 3 2 0 1-1 1 0 1-2 0 0-1-2-1-1-2-3 0-1-1-1 0-1 2-1 0 0 1 0 1 0 2-3-2-1 1-1 0-2 5-1-1-1 1-1 1-2 2 1 4 0 1-2 1-1 1 1 1-1 2-1 2 0 3-1 0-2-1-1 0-1 2 0 1-1-1 0 1-1-1-1 0-1-2-1 0-1 2-2 1-2-2-2 2-1 0 0 1-1 4-1 0 0 1 0 1-1-1-3-2-1 0 0-1-1 0 1-2 0-1 0-1-2 0-1-1-2 1-1-1 0-4-3-3-1 1-2 1-2-1-1-2-2 0 0 1-3-1-1 1 0 2-1 1-1 1 1 2 0 2-2 0-1-1-1 1 1 0-1 1-1 1-1 0 0-1-2 0-1 0-1 1-3 0 0 1-1 0-1 1-3 0 1 1-2 1-1 1-1 0 1-2-1 1-1 0-1 0-1 1-2 1-1-2 0-2-2 0 0-2-1 0-4 2 0 3-3-1-1 1-1 0 0 2-1 2-1-1 0-1-2 0 0-1-1-1-1 0-1-1 0-1-1 0 0-2 1 0-1-3-1 0 0 1-1 0-2 0 0 1-1 0 1 0-1-1 0 2-1 0-1 0 0-1-1-3-2-1-1 1-1 2-2 1-3 0-3 1-7-1 0-1 1 0 0-2 0-1-1-1 0-1-1-1 0-1-1 0-2-2 0-1-1-3 0-2 0-1 0-1-1-1 1-3 0-4 1 0 1-1 1-1 1 0 0-1 3-1 2 0 3-3 3 0 0-1 2-1-1-1 3-3 6-3-1-2 1-1 2 0 2 0 0 2 3 0 1 0 0-3 1 0 2 0 0 2 1 0 0-1 1 1 1 0 1 0 1 0 0-2 2 0 0-1 0-1-2-2-1 0 0-1-1 0 0-1-2 0-1-1-2-1-2 0-2-1-2-1 0-1-2-2-1-1-1 0 0-1-1 0 0-1-1-1 1-2 2 1 1-1 0-1 1 0 1 0 0-2 0-1 0-1-4-1-1-2-4 0 0-3 1 0 1 1 0-1 1 0 2-1 1-2 0-1 2 0 4 1 1 0 4-1 0-1-3-1-1-3-2 1 0-1 1-1-1-3-1 0-1 1-1 0 0-2-2 0 0 1-1-1 0-1-1-1 1-1-1 0 1-1-1-2-1-1 1-1-1 0-2 1 0-2 2-2-1-1-1-1-1-1 0-1 0-1 0-1-2 1-1-1 1 0 1-1 1 0 0-1-1 0 0-1 2-1 4 0 0-1 1-1 1-1 1 0 0 1 2 1 0 1 1-1 1 1 1 2 5 1 1 0 5 1 3 4-1 5-1 1 0 1 4 2 1-1 0 1 1-1 1 1 4 2 1 0-1 1 1 0 0 1 2 0-1 1 1 1 2-1 3 0 0 1-1 1 2 2 4 1 2-2 2 0 1 0 0-1 1 0 1-1 2-1 1 0 0 1 3 1 0 1 0 4 1 2 2 0 0 1 1 0 1 1 3-2 0-1 2 0 4 1 1 1 1 0 0 1 1 0 1-1 3 0 2 0 3 3 2 0 1 1 4 2 0 1 1 0 1 0 1-1 2 0 1 0 1-1 1 0 0-2 3 0 1-2 1 0 1 5 2 2 3-1 1 1 0 1 1 0 1 1 1-1 0-1 4-2 4 2 2 0 1-1 2 1 2-3 2 2 0-2 1 0 1 2 2 1 0 1 1 0 1 0 2-3z",
+    labelX: 603, labelY: 449,
+  },
+  {
+    name: "Chandigarh",
+    path: "M296 264l-1 1-2-1-2-3 3-1 1 1 0-1 0 1 1 0 0 2z",
+    labelX: 294, labelY: 262,
+  },
+  {
+    name: "Chhattisgarh",
+    path: "M541 576l-1 1 2 2 0 1-1 2-1 1-2-1 0 1-2 0-4 4-1 0-2 0-3 5 1 1-2 1 0 1 1 0-1 2 1 1 1 1-1 1 1 1 0 1-2 0 0 1-1 0-1 1 0 1-1 2-1 1 2 1 0 1-1 0 0-1-2 1-1 1 0 1 0 3 0 1 1 0 0 2 1 2-1 0-4-1 0 1 0 1 0 1 0 1-1-1 0 1-2 4-1 1-1 1-2-1-2-1-1 0-1-1-1 1 0-1-1 1-2-1-2 1-2 0-3 0 1 2-1 1 0 1-2 4-3 1 0 2-1 1-1 0-1-2-1 0-1 1 0 3 0 2 1 2 0 1-1 3 1 1 1 0 0 2 1 0 0 1 0 1-1 3 1 1 0 1 0 3-1 2 0 3 5 1 2 1 2 0 2 0 0 3 0 2 0 1-2 0-1 2-1 0-1-2 1-1-5-2-2 1-2 2-1-2-1-3-1-1-2 1-4-3-2 1 0-1-2-2-3 3-1 3 1 2 3 1 1 2 3 1-1 3 1 2-1 2 0 2 0 1 2 0 0 1 1 2 2 0-1 2 0 1 1 0-1 2 0 2 1 2 0 1 1 2-1 1 1 1 1 4-1 0-1 1-1 4-2 1-1 1-1 0-2 1-1 1 0 1-1 0-1 0 0 1 2 1 0 1-2 0 0 1-1 1 0 1-3 2-1 3-3 0 0 1-2 0-1 1-1 1-1 2 0 1-1 5 0 2-1 2 0 2-2-1 0 2 0 1-5 0-3-2-2 2-1 1-1 0-1-2-2-9 0-1 1-1 0-1-3 1-1 0-1-2 1 0 0-1-1 0-1 1 0 1-2 0 0-2 1-1-1-2-1-3-1-1 0-1-1-1-1-2-5-3-1 0-2 1-1-1-1 1-2-5-1-1 2-1 1-1 0-1 0-1-3-3 1-1 1-2-1-1 1 0 1-2 0-1 1-1 1-3 2-1 1-2 1 0 1-1 1-1 1 3 1 0 1-1 1 1 0 1 2 0 3-3-1-1-1-1 3-1 1-1-1-2-1-1-2 0-2-2-2 0 0-3-4-3 0-1-1-1-1 0-1 1 1 1-1-1-2 0 1 0 2-2 0-1-1-1 0 1-2-1 0-1 2 0 1 0 1 0 1-1 0-1 0-3 0-1-1-1-2 0-2 0 0-1 1-1-1-2 2-1 2 0 1-1 3-1-1-2-1 0 1-2 0-4 1-1-1-1 1 0-2 0-2 1 0-1-1-1 1-1 2-1-1-3 0-2 0-3 0-1-3 0-1-3 1-1-1-2 1-3 2 0 0-1 2 0 2-2 1-2 0-1 1-1 0-2 1-2 0-2 0-1 0-2 0-2 0-2 1-1 1 0 1 0 1-3 0-2 0-2 2-6 1-1 1 1 0 2 1 0 1-1 0-1-1-1 1 0 0-4 3 0 1-2-1-3 0-3 2 0 0-1 2 1 1-1 1-1 1 1 1-2 2 1 0 2 1 0 0-1 1-1 1 1 1-2 2 0 0-1 1 1 1-1 1-1 0-1 1-1 1 0 0-1 1 1 1-1-1-2 1-2 0-2 0-2 3 0 2-2 1-1 0-2-1-1 1-1 3 0 1-2 2 1 1-2-1 0 1-3 1-2 0-1-1-1-1-1 0 1-1-2-1 0-1 1 0-1-2-1 0-1-1-1 0-1-1-1-3 1-1-2-2 0-2 1-1 0 0 1-1 0-1 0 0-2-1 0 0-1 1-1 1-2 1 0 1-2-1-1-1-1 1-1-1-1-1 0 0-1 1-1-1 0 0-1 2-1 2 3 2 1 1 1 3-2 1-1 1 1 2 0 1 0 0 1 5 0 1-1 0 1 1 1 0-1 5 1 3 0 1 1 1-1 0-1 2 0 1 0 1-2 0-1 2-1 1 0 1 0 1-1 2 0 1 2 2 1 4 0 2 0 1-1 1-1 1-2 2-1 1-2 1-1 2 0 1 0 1 2 2 1 0 2 1 1 1 2 1 1 2 0 0 1 2 0 1 3 0 2-1 0 2 2-1 0 1 1 1 1 5 1 0-2 1-1 1 1 1 0 0 3-2 3 0 1 0 2 1 1 1-1 1 0 0 1 0 4 0 1-1 2 0 1 1 1 1 0 1 1 0 2 1 2 1 0 0-2 1 0 0 2 2 0 1 0 1 0 2 0 0 1 0 2-2 1-1 4-1-1-1 2 0 1-1 1-2 1-2 0-1 2-2 1z",
+    labelX: 483, labelY: 633,
+  },
+  {
+    name: "Dadra & Nagar Haveli and Daman & Diu",
+    path: "M173 664l0 1-1 2-2-1-2-1-1 0 0 1-1-1 0-1-1 1 0-1 0-2-1-1 0-1-1-1 1-1 1 1 0-1 1 0 0-1 0 1 1 0 0-1 1 0 1-1 1 1-1 1 1-1 2 1-1 0-2 3-1 0 0 2 1 0 1 0 0-1 0-1 2 0 1 1-1 1 0 1z m-12-12l-1 1 0 1 1 0 0 1-1-1-1 1 1-2 0-1z m-65-10l1 1-1 0-3 0 1-1z m-4-1l0 1 1 1-5 0-1-1-1-1 0-3 2-5 1 1 3-1 1 1 1 3-2 1 1 1 1 0 0 1-2 0z",
+    labelX: 130, labelY: 650,
+  },
+  {
+    name: "NCT of Delhi",
+    path: "M314 349l-1 1-1 0-2 1 0 2-2 1-1-1-1-1 0-2-1-1-1 1-2-2 0 2-1-1-1 1-2 0 0-1-2-1 0-1 1 0 1-2 1 0 0-1 1-1 0-4 0-1 1-1 2 0 1-1 2 0 1 1 1-1 1 0 0 1 0 2 1 0 2 3 1 0 0 1 0 1 1 1-2 2 0 1z",
+    labelX: 305, labelY: 345,
+  },
+  {
+    name: "Goa",
+    path: "M204 825l2 0 0-1 1 1 0-1 1 1 1 1-1 2 1 1-1 2 1 1 0 1 0 1 2 1 0 1 0 2-2 0 0 1 1 1 1 1-2 2 0 1 1 3-1 1 0 1-2 2-1-1-1 0 1 1-1 0-2 0 0 1-2-1 0-2 0-1-2-1 0-1-2-1 0-1 1 0 0-1-2-7-1-1-1 0-1 0-1-2 4 1 0-1-1 0-1-1-1 0 0-2-1 1-2-4 1-1-1 0-1-4 2 1 0-1 1 0 2 0 1-2 1 1-1 0 3 1 1 2 0 2 1 0 1 1 0-1z",
+    labelX: 200, labelY: 836,
+  },
+  {
+    name: "Gujarat",
+    path: "M93 643l-1-1 0-1z m61-16l1 0 0 1-1 1z m2-19l1 0 0 1-1 0z m-107-29l1 0 1 1 0 1-2-1z m-10 0l0-1 1 1z m1-2l1-1 0 1z m19 0l1-1 0-1 1 2z m3-2l0-1 2 0 0 1-1 0-1 1z m15-17l1-1-1 2z m-64-10l1-1 0 1 1 0 1 1-2 0-1 0z m-1-2l1 0 0 1-1 0z m3-1l1 1-1 0-1-1z m-5-3l0-1 1 0 1 1-1 2z m0-4l1-1 0 1-1 1z m-9-2l1-1 2 0 2-4 1-2 1 1 1-1-1 5-1 3-2 0-1-1-2 1z m4-8l1 1 0 2-2 2-1-1 1-2 0-1 1 0z m5 3l0-1 0-1 2-1 1 1-1 0 1 1-1 1-1 0z m-2-5l1 0 1 2-2 1-1 0-1-1 1-1z m-6 0l1 0 0 1-1 0z m8 0l-1 1-1-1-1 1 0-2 1 0 1-1 1 0z m3-2l1 0 1 0-2 2-1 1-1-1 2-1z m-3 2l0-2-1 0 1-2 1 0 1 1 0 1-1 1 0 2-1 0-1 0z m-5 2l-1 2-1 2 1 1-1 0-2-1 1-2 0-1 0-1 1 0 1-4 2 1 0-1 1-1 0-1 1 1 1-1 1 0-1 2-2 1-1 3z m206 28l1 3-1 1 2 2 1 0 1 0 1 2-1 2 0 1-2 2 0 3-1 0-3 0-1 1-1 2-1 0-1 1 0 1-3-2-1 1 0 1 1 0 0 2 1-1 0 2 1 0 0-1 1 0 1 0 1-1 0 2 1-1 1 1 0 1-3 2 0 1-2-1-1-1-1 0 0 3 0 1 0 2 2 0 0 4 1 0 0 1-1 1-1 1 0 1 2 0 0 1-4 2-6 3-1 0-1 0 1 2 2 2 0 2 0 1-4 0 1 1 1 0 1 4 2-1 1 1 1-1 1-1 6 0 1 1 1-1 1 1 1-1 1 1 0 1-2 1-3 0-2 1-2 0 0-1-1 2-3 1 0 4-2 1-2 0 0 3-1 0-1 0-1 0 0 1-2 0-2 1 0-1-1-1 0 1 1 1 1 0 1 1 1-1 1 1 0 2 1 1 1 0 0 1 3 0 0 2 1 2 0 1 1 0 0 4-1 1-1-1-1 2-1 0 0 2-2 1-1 1-2 0-1 0-1 0 0-2-2-1-1-1-2 1 0-2-1 0-1 2-1 0 1 2 2 1 0 1 1 0-1 1 0 1-3 3 0 1 1 0 0 4 0 1 0 2-4-1-1 1 0 1-1 1-1 0-1 0 0-1 1-1-1-1-2 0 0 1 0 1-1 0-1 0 0-2 1 0 2-3 1 0-2-1-1 1 1-1-1-1-1 1-1 0 0 1-1 0 0-1 0 1-1 0 0 1-1-1-1 1 1 1 0 1-3 0-1 0 0 2-2 1-2 0 1-4 0-2 1 0 0-1 1-2 1-1 1 1 0-1-1 0 0-1 1-1 1-4-2-6 1 0-1-2-2-5-1-1-1-1 0-2 1-1-2 0 0-1 1-2-2 0 0 3-1-1-1-5-1-2 1-1 1-1 0-1 1-2 0-2 0-2-1 1-1-2 0-1 1-1 2-1 1 0 1 0 1 0 1-1-3-1 0 1-4-1-2 1-1-1 0-1 1-1 1-3-2-1-1-3 2-8 2-2 1 0 2 1 2 0 2-2 2 0 1 0-1 0-1-2-3 2-2 0-2-2-4 2-1 1-1 0 1-1-1 0-1-2-1-1 0-1-1 0 0 1 1 1 1 2-1 1-1-1 0 1 1 1 0 1-1-1-1 2-1-1 0 1-1 6-1 0 0-2 0-1 2-1 0-1-3 1 0 3 0 2 1 2 1 5-1 0 2 4-2 2-1 5-3 4-2 3 1 2-3 2 0-1-2 2-6 2-1 2-1 0-2 1-1 0-4 1-1 1-2 2-4 1-5 2-1 1-2 0 0 1-1 0-2 0-1 0-2 0-1 1-1-2 0-1 2 0 0-1-1 0-1-1 2-1-1-3-1-1-3 1-1-1-2 5 0 3-1 0-2-1-4-2-3-2-1 0-3-3-6-4-13-16 1 0 0-1 1-1-1-2-1 0-1 0 1 1 0 1 1 1-1 1-17-16-8-9-1-1 0-3 0-1 0-1 2-3 3-1-1 1-1 1 1 1 2 0 1 0 1-1 1 1-1 1-1 2 2 2 1 0 3-2 3 0 3-1 1-1 0-2 1 1 0 1 2 1 0-1 1 0 1-1 1 0-1-1 1 0-1-1 2 0 0 1 1 0 1 1 1-1 0-1 2 0 1-1 1-2 1 0 7-1 2-4 0-1 1 0 0-1 1-1 2-4 1-2 1-1 3-5-2 1-1 1-1 3-1 0-4-1-3 1-1 1-4 0-3 2-2-1-2 1-1 1-2 3-3-1-1 1-1-1-3 0-5-2-2 0-2 0-14-9-1 0-4-3-2-2 1-1 1-1-1-1 1 0-1-1 0-1-1-1 0-1-1 1 0-2-1 0 0-1-1 0-1-2 1 0-1-5 3-3 2-1 2-3 2 0 0-1-2 0-1 1-2-1-2 4 0-3 1-2 2-1-1-1-1 0-1 0 0-1 7 0 1-12 2-1 1 4 1 0 1-2 1-1 1 2 1 0 3-2 4 2 3-2 2 1 3-1 2 1 3-1 5 4 8 0 3 0 2-4 16-5 1 0-1 3 0 1 0 1 0 1 2 1 6 0 3-1-1-1 3-2 1-1 1 1 1 0 1-2 1 0 1-1-1-1-4 0 1-3-1-1 0-2 1-1 3-2 6 3 1-2 1 0 1 1 4-2 1 0 2 0 1 1 0-1 2 2 4-2 1 1 0 1 1 0 1 0 0-2 2 1 0 1 2-1 0-1 2-1 1 0 0 2 1 1 1 0 1 0 1 1 1-1 3 1 1-1 0 1-1 1-1-1-1 1 1 1 2 0 1 0 0 2 2 0 0 1 1 2 1 0 1 0-1-1 2-2 1 1 3 0 1 0 0 2 1 2 5 0 2 1 2-2-1 0 1-1 0-1 1-2 0 1 1 0 2-1 0 3-1 1 3 1 2-1 0 1 0 1-1 0-1 1-1 0-2 5 2 2 3 1-1 2 2 1 1-1 2-1 0-2 1 0 0 1 2 2-1 2 1 0 0 2-1 1-1 2 0 1 0 1 0 1 1 0 1 0 2 2 1 0 0 3 0 1 2-2 2 1 1 1-1 3 1 1-1 2 1 0 1 0 1 1 2-1 0 1 2-1 2 4 1 0 1-1 1 1 2 0 0 2 2 0 1 1 0 3 2 1 1-1 1 0 1 2 0 1z",
+    labelX: 108, labelY: 580,
+  },
+  {
+    name: "Haryana",
+    path: "M322 276l0 1-1 1 1 1-2 1-2 4-1 1-1 0 0 2-3 2-2 0 0 3-3 2-1 6-1 0 0 1 1 2-1 1 0 1-1 2 1 2-1 1 1 2 0 1 1 0-1 1 1 2-1 0 0 1 1 0 0 1-1 2 1 1-1 1 1 2-1 3 1 1 1 1 1 1 0 3 0 2-1 0 0 1-1 1-1-1-2 0-1 1-2 0-1 1 0 1 0 4-1 1 0 1-1 0-1 2-1 0 0 1 2 1 0 1 2 0 1-1 1 1 0-2 2 2 1-1 1 1 0 2 1 1 1 1 2-1 0-2 2-1 1 0 1 0 4 3 0 1 1 2-1 0 1 2 0 1-1 0 2 1 0 1 0 1 0 1-1 0 0 2-1 0 0 1 0 2 2 2-1 1 1 0 0 1-2 0 0 2-1 0-1 0 0 1-2 0-3 2-1 1-2-1-1 0 0 1-2 0-2-2 0 2 1 1 1 1-1 0-1-1-1 0-1 4-1-1-1 1-1-1 1-1-1-1 0-2 1-2 1 0 0-2 0-1-1-1 0-2 2-6-3-2 1 0-2-1-1 0-1 1 0 1-2 1-1 0-1 2-1 0 0 3-2 0-1 2-1-1 0-2-3 0 1-1 1 0-2-1 0-1 2 0-1-1-3 0-1 0 0-1-1 0-2 0 3 2-1 0-1 0 2 2-1 1 0 1-1-1-1-1-1 0-2 0 1 1-1 1-1 1 1 1 0 2 1 0-1 2 1 0-1 2-2-1 0-1-1 0-1 0-3 0 0-2-1 0-1 0 0-1 2 0 0-2-1 0 0-1 1-1 1 0 1-1-1-1 0 1-1-1-1 0 2-1 0-1 1-1 1 0 0 1 1 0 0-1-1-1-1 0 1-1-2-1 1-1-2-1-1-2-1 0 0-1-3-1-2 0 0-1 1-1-1 0-1-1-2-1-1-1-1-1 0-2-2 0-1-2 0-3-1-2 0-2-1-1 0-1 0-1 0-1 1 0 0-1 0-2-2 0-1-2-1 0 0-2-1-1 0-1 1 0 0-1 0-1 0-2-1 1 0 1-2-1 1-2-2 1 0 1-1 0-1 0-1 0 0-1-1 1-1 0-1 1-1 0-1-3-2 1-1 0-1-4-2-1-2 0-1 2-1 0-1-1-2 0-1 2-1 0 0-1-1-2-1-1 0-2 1 1 1-3-1-1 0-1 1-7-2 1-2-1-1-1 1-2 2 0 0-1 0-2-1 0 0-1 4 1 0-1 2-1 1 0 3-1 2 1 2 1 1 1 1 1 0 1 2-1 1 0 0-1 1 0 0 2 0 1 0 1 1 0 0 1 1 0 0-2 1 0 1 0-1 1 2 2-1 1-1 0 0 2-1 0 1 2 1 1 0 1 1 1 2 0 0-1-1-1 1-1 1-2 1 0-1 0 1-1 1 0 0-2 2-1 0-1 2 1 2 1 2 0 0-1 1 0 2 1 0-2 2-1 1 1 1 0 1 1 1 1 2 1 1 0 1-1 1 0 1-1 1-1 1 0 4-2-2-1 0-2 1 0-1-3 1-1 2-3-2-1 0-1 1 2 3 0 1-1 1 0 1-1-1-1 1 0 0 2 1 1 2 1 2-1 1 1 1 0 0-3 1-1 0-1-1 0 0-1-1-1-1 1 0-1 2 0 2-2 1 0 1-2-1-1 1-1 2 0 1-1 1 1 1 2 1 0 1-1-2-2 0-2 1 0 0-1-1-1 1 0 0-2-1-2-1 0 0-1-1 0 0-1 0-1 0-2 1-1-1-2-1 0-1-1 0-2 2 0 0 1 1 1 2-1 1 2 0 1 2 0 0 2 0 1 3 0 2 2 0 4-1 1 0 1 2 1 1 1 1 0 3 1 1 0 0 1 1 0 1 1 1-2 1 1-1 1 2 0 0-1 2 2z",
+    labelX: 269, labelY: 319,
+  },
+  {
+    name: "Himachal Pradesh",
+    path: "M367 241l0 1 1 1 0 1 1 0 1 2 0 1-2 1-1-1-1 1-2-2-1-2-1 0-4 0 0-1-1-1-1 0-1 2-3 0-1-2-3-2-2 0 0 1-1 0-1 1-1 0-1 1-1 0-2 1-2 0-1 1-1 0-2 0-2 2 0 2-1 1 0 2-1 1-1 0-1 0 0 2 2 0 0 2-1 0-1-1 0 2-1 3 0 1 1 1 0 1 1 1 0 1 0 1-1 0 1 2 2 0 0 1-1 1-4 3-1 0-1 0-2 1 1 1-1 0-2-2 0 1-2 0 1-1-1-1-1 2-1-1-1 0 0-1-1 0-3-1-1 0-1-1-2-1 0-1 1-1 0-4-2-2-3 0 0-1 0-2-2 0 0-1-1-2-2 1-1-1 0-1-2 0-2-2-1 0-2-1-1-2 1-3-1 0 0-3 2-1-1 0-1 0 0-1-1-1 0 1-2-2 0 1-1-2-1 1-2-3-1-3 0 2-1 0 0 2-1 0 0 1-4 1 0-2-1 0-1-2 1 0-4-8-1-2 0-1-3-6 1 0 0-1-2-4-1-1-2-1-5-3-2 0-1-1 3-2 0-1-1-1 0-2 2-1 2 0 4-5 3-1-3-3 0-2 0-1 1-1 1-2-1-2 1-3-1-2-2-1-1-2 0-2 2 0 3 2 2-1 1-1 2-2 0-1 2-1 3 0 1-3 4-3 3 0 3-1 1 0 0 1 2 1 2-1 1 0 1-2 0-1 1 1 1-1 0 1-1 2 0 1 1 1 2 1 1 3 3 2 1-1 2 1 1 0 1 0 0 3 1 0 2 0 0 1 0 1 1-1 0 1 1 0 1 1 1 1 0-1 0-1 1-1 2 0 1 1 1-1 1 0 2-2 1 0 1-1 1-1 1 0 3 3-1 2 2 1 1 1 1 1 1 0 0 1 0 3 3 4 1 0 1-2 1-1 1 1 1-1 1-1 1 1 1-1 2-1 0-1 2-1 1 0 0 2 0 2 0 1 0 1-1 1-2 0 0 2 0 1 1 1 2-2 1 0 1 2 0 1 2 2 1 0-2 2 0 4-1 1 4 0 1 1 0 1 0 1 1 2 1 0 0 1 3 4 2 0-2 3 0 3-1 1 0 1 0 1 1 0-1 1 1 2 2 0 0 1 1 2 0 1-1 1-2 1-1 1 1 1 1 0 1 2 0 1 0 1 1 1 1 1-1 1 1 0 1 2z",
+    labelX: 312, labelY: 218,
+  },
+  {
+    name: "Jharkhand",
+    path: "M670 476l0 4 1 1 2 1 3 4 1 2-3 2-1 3-2 0 1 1 2 0 0 2 1 1-1 2 1 0-1 1-2 1-1-1 0 3 0 1-1 1 1 2-2 3-1 1-1 1-1 0-1 2 1 0 1 1 0 1-4-1 1 2-1 0 0 1-1 0-2-1 0 1 1 0-1 2 1 0 0 1-2 0 0 1-3-1-1 1-1-1 1-1-3 0-1 1 2 1-1 1 1 0 1 3-1 0-1-1 0 3-1 0 0-1-1 0-2-1 0 1 1 1 0 1-2 0-5-2-2-1-1 1-2 2 0-1 0 3-1 2-1 1-1-1-4 1-3 1-2 0-2 2-1 0 0 2 0 1-1 2-1 0 0 1-1-1-2 1 0-1-2-1-1 0 1-3-1 0-2 0 0-1-1 0-1 1 1 3-4 1-2-1 0 1 0 2 1 1-1 0 0 2-2 2 1 3 2 2 3-1 2 0 0 1 0 1 3 1 1 2 1 0 1 1 1 0 1-1 2 1 1 0 1 1 1-1 2 0 1 1 1-1 0 1-1 1-1 0-1 0-1 0 0 1 1 1 0 1-1 0 0 3 1 1 1 1 2 0 2 2 1 1 0 2 1 0 3 1 1 1 0 2-1 0 0 2 3 1 0 3 2 1 0 1-3 0 0 1-1 1-1 0-1 0-1 0-1-1-1 0 0-1-1-1-1 0-2 0-1-2-2 1-4-2-1-3-2 0-1-1-3 0-1-2-1-1-1 1-2 1 0 2 1 1 1 0 0 2-1 1 1 1-2 3 2 2-1 2 0 1-2 3-1 2-4-1-1 0 0-1 1-1 0-1 2 0-1-1-2 1-3 1-1-2-2 1-6-3-1 0 0 1-2 0-1 2-2 3 0-1-1-1-2-1-1 0 0-1-1 0-2 0-1 1 0-1 1 0 0-2 1-1 1-3 1-1 0-1-1 0 0-1 0-1-1-3 1-1-1 0-3 1-2 1-1 0 0-1-1 1-2-1-1 0-1 1-2 0-1 0-5 0-1 1 0 1-1 0 0 1-5 0-2-1-1 0-2-1 0-1 0-2-1 0-2-1-2-1 0-1 2-1 1-2 2 0 2-1 1-1 0-1 1-2 1 1 1-4 2-1 0-2 0-1-2 0-1 0-1 0-2 0 0-2-1 0 0 2-1 0-1-2 0-2-1-1-1 0-1-1 0-1 1-2 0-1 0-4 0-1-1 0-1 1-1-1 0-2 0-1 2-3 0-3-1 0-1-1-1 1 0 2-5-1-1-1-1-1 1 0-2-2 1 0 0-2-1-3-2 0 0-1-2 0-1-1-1-2-1-1 0-2-2-1-1-2-1 0-2 0 1-1 1-3 0-1 1-1-1-2 2-2 0-2-1 0 0-1-1-1 0-1 4-1 7 1 3-1 3 0 2-1 1-2 1-1 2 1 1 3 0 1 1 0 1 0 0-2 1 1-1 0 1 0 0-1 2 0 1 0 0-1 1 0 1 3-1 0 0 2 1 0 0 1 1 1 1 0 1 1 0 1 2 0 0 1 1 1 1-2 0-2 1 0 1-1 3 1 0-3 4-2 1 0 0 2 2 0 0 2 1 2 2-1 1-1 1 0 1 0 1-1-1 2 1 0 1-1 2-1-1-1 3 0 1-1 1 0 0-1 3 0 1-1 1 0 2 0 0 1 1 0 1-1 1-1-1 0 1-1 1 1 2 0 0-2-1-2 1-1 1-1 0-2 1-1 3 1 0-1 2 0 1 2 2 1 2-1 1-1 3 3 0 4 1 1 2-1 1 1 2 0 0 1 0 1-1 2 1 0 0 1 1 0 3 2 1 1 0-1 0-1 1 0 1-4 0-1 1 0 2-2 2 2 2-1 1-2 1 0 1 2 1 0 1 1 0-1 1 1 0-1 1-2 1 0 2 1 1 0 0-3 1-2 1-2-1-1 1-1 2-1 0-1-1-4 2-2 1-1 1-1 1 1 2-5 1 0 1-1 3 2 0-2 0-1 0-1 1 0 1-2 1 0 1 1 3 0 1 2 2 1z",
+    labelX: 597, labelY: 534,
+  },
+  {
+    name: "Karnataka",
+    path: "M321 731l2 0-1 1 0 1-1 1 1 2 1 2-1 0-1 0 0 1 0 1 3 1 0 1 0 1-1 0 0 2-1-1 0 1-1 1 0 1-1 0-1 1 0 1 2 1-1 1-2 1-1 4 2 1 0 1 1-2 1 1 1 0 0 1 2 0 2 1-1 1-1 0-1 0 0 1-1 0 0 1-2-1-1 1 1 1 0 1-1 0-2 0 1 1-1 2 1 0-3 2 0 1-1 1 2 2 2 0 1 4-1 0 0 3 0 3 0 1 0 1-1 0-1 2 2 0 0 1-2 1 1 1 1 0 0 2-3 0 1 1 0 1-1 0 0 1-3 0 0 1-1 0 1 2 4 2 2-1 2 0 2 2 0 1-1 0-2 2 0 4 0 2 0 1 0 1 0 3-2 0-2 0-4-1-3 0-3 2-2 2 0 1 1 0 0 3 1 0 0 1 1 2 0 1-1-1-2 1 0 4-2 0 0 1 2 2 1 1-1 1 1 2 2-1 0 2 1 0 1 1-1 0-1 1 1 0 1 2-1 1 0 1-1 1 0 2-1 0 0 1-2 0 1-1-3 0-1 0-2 0-1-1-2-1-1 1 1 1-1 2 2 1 1-1 0 1 0 2 0 1-1 3-1 0 0 1-1 2 0 3 1 3 2 0 0 2 2-1 2 0 0 2-1 0 0 1-1 0-1 0 0 2 1 1 1 0 0 1-1 1 1 1 4 0 1 1 1-1 0-1 1-2 0-1 2 1 1 0 2 0 0 2 2 0 0 1 1 1 1 0 0-2-1 0 0-1 0-1 1 0 1 0 0 1 1 0 1 1 0 1 0 2 0 1-1-1-3 0 0 2-1 0 0 1 1-1 1 1-1 1-1 0-1 1 2 1 0 1 2 0 0 1-1 0 0 2-1 0-1 0 0-1 0-1 0-1-1 0 0-2-1 1-1-1-1 1-2 0-1 1 0-1-1-1-3-1 0-1-1 0 1-3-2 0-1 0-2 1 0 1 1 0 1 1 1 0 0 1-1 1 2 2 0 1 1 1 0 1-1 2-1 1 1 2 0 1 1-2 1 1 1 0 3 0-1-2 1 0-2-1 1-1 1 0-1-1 1-1 0 2 1 0 1-1 1 2 2-1 0 1 1 0 3 0-1 1 1 1 0-1 1 2-1 3 1 0 0-1 2 0 0-2 1 1 1-1 1 1 0-1 2-1 0 1 1 0 0-1 2-1 0-1 2-1 0-2 2 0 1 1 2-2 0 2-1 1 0 1 1 1 1-2 1 0 1-1 1 1 1 0 0 3-1 2 1 0 0 1-2 0 1 2 3 0 1 1-1 1 1 1 1-1 1 0 4 0 1 0-1 3 0 4-1 1 2 1 0 1 0-1 1 0 0 1 1-1 0 1 2 1 2 0-1 3 1 1-1 0-1 1 0 1-1 1 0 1-1 0 0 3-1-1 0 2 1 1 0 1-1-1-1 0-1 0-1-1-1 1 0 2-2-1-1 1 0 3-4-1-2-2-1 0-1 1 0 1-1-2-1 1-1 0 1-1-1-1-1 0-2 0-1 1 0 1-1 2 1 0-1 1 0 1-1 0 0 1-1 0 0 1-1 0 0-1-1 0-2 0 0 2-1 2 1 2 1 0-1 1 1-1 0 1 0 4-2 2-3 1 0 2 1 1 4 0 4 0 0 2 1 1 0 1-2 2-1 2-5 1-1 0-1 1 0 2-1 2-1 1-2-1-1 1-1-2 0 1-2-1 0 1-3 0-1 1-1 1-1-1 0-1-1-1-2 1 0 1-1-1-1 0-1 2-2 3 1 1-1 1-2-1-5 0-2 0-1-2-1-1-2 1-1 0 0-1 0-1 0-1-3 1-1-1 0-1-1-1-2 0 0-1-1-1-2 1 0-5-4 2-4-1-2-1-1-3-1 0-2 0-1-1-1 0-1-2-1 0-1 0-3-5-2 0 0-1 0-1-1-1-1-1 0-1 2 0 0-1 0-1-1 0-1 1-1 0 0-1-1 0 0-1-1 0 0-1 1-1 1 0-1-1-1 0-1 2-1-1 0-2-2 1 0-1 0-1-1 0-1-1-1 1-1 0 0-2-1 0-1 0 1-1 0-1-1 0-1 0-2 1-1 0-1-3-4-16-1-2 0-7-3-11-1-3-1 0-1-1-1-8-1 0-3-10 0-1 1-1-1 0 0 1-2 0 0-1-1-3 0-2-1-2-2 0-3-2 1-1-1-2 0-1 2 0 1 0-1-1 1 0 1 1 2-2 0-1 1-1-1-3 0-1 2-2-1-1-1-1 0-1 2 0 0-2 0-1-2-1 0-1 0-1-1-1 1-2-1-1 1-2-1-1-1-1 0 1-1-1 0 1-2 0-1-1 1 0 0-2 1-1 1 0 1-1 1 0 0 2 1-1 1 1 1-1 1 0 0-1 0-1 1-1-1 0 0-1 1 0 0-1 1-2 2-3-1-1-2 1-1-1 2-1 2 0 1-3 0-1-1-1-2-1-1 0 0-1-2 1 0-1 0-2 0-1 1 0 0-1-1 0 0-2 0 1-1-1 0-1-1 1 0-1 0-1 0-1 1 1 1-1 2 1 0-2 3-1-1-2 1 0 1 1 1 0 1 3 2-1 0-1 2 0-1-1 1-1 0-2 2 0 1-1 3-1 2 0 0-3 1-1 1 0 0-1-2 0 1-1 1 0 1 0 3 0 0 1 1 1 1 0 1 1 0 1 2 0 0-1 1 0 0-1 0-2 3 0 1-1 1 0 1 0 1-1 1 2 1-1 1 0 0-1 2 0 0 1 1 1 1-1 0-2-1 0 0-1 1-1 0-1-1 0-1-2 0-1 1-1 0-2-1 0-1-1 1-1-1-1-1-1 2 0 0-3 2 1 0 1 1 0 1 0 1 0 0 1 1 1 1-2 1 0 0 1 1-1 0 2 2 1 2-1 2 0 1 1 0-1 1 0 1 1 0 1 1 0 0-2 2 0 1 0 0 1 2 0 1-1 0 2 1 0 1-2-2 0 1-3-2 0 0-1 2 0-1-1 0-1-1 0 0-2 3-1 1-1 2-1-1-2 2 0 0-1 1 0 0 2 1 0 1-2 0 1 1 0 1 1 0 1 1-4 2 0 1-2-1-1-1 0 0-1 1 0 0 1 1 0 0-1 2 0 1 0 1-1 0-4 1 0 0-2 1 0-2-1 1-3 2 0 0 1 1 0 0-1 1 2 2 0 0-1-1-1 2 0 1-3 1 0 0-1 1-1 0-3 3-1 1 1 0-1 1 2 1 0-2 3 3 0 0 1 1 1 2-1-1-1 1 0z",
+    labelX: 279, labelY: 846,
+  },
+  {
+    name: "Kerala",
+    path: "M283 1038l0 1-1 0z m0 0l1 1-1 0z m-2 1l1-1 0 1z m-1-10l0-2 1 2z m-3-5l1 1-1 0z m-1-2l1 2-1 0z m6-57l1 1-2 1 0 1-2 0-1 1-1-1-1 1 0 1 0 2 1 0 2 1 0-1 2 1 1 0 0 1 1 1 2 1 1 0 0 1-1 2-2 1 0 2 1-1 1 0 1 1 2-1 1 1 3-2 1 1 0 1-2 1 1 1 1 0 0 3 1 0-2 0-1 1-1 3 3 1 1 0 2 1 1 1-1 1 1 0 1 0 1 1-2 4 1 0 0 1-3 0 1 1 0 1-1 6 2 1-1 3 1 0 1 2 3 0 2-1 1-1 4-2 2 0-1 1 2 2 0 1 1 1-1 1 0 2-1 0-2 1 1 0 2 2-1 1 1 1-2 3 0 1 1 0 0 1 0 1-1 1 0 2-2 4 1 0 2 1 1 0 1-1 2 2 2 1-1 2-1 0-1 1 0 2-2 2 0 6-2 1-1 2-1 1 1 2 0 1 1 0 0 1 1 1 0 1-1 2-1 2-1 0 4 7-1 1-1 0 0 2-1 0-1 2 0 1 0 1-1 0-1 1-4-3 0-1-12-15-1-1-1 0-1-2 0-3-6-13-1-2-3-18 1 0 0 1 1 1-1 0 0 2 1-1 1 0 1 2 1 0-1 1 0 3 1 1 0 1-1 1 0 3 5 0-3-1 1-2-1-1 0-2-1 0 0-1-1-2 1-1 0-1-1-2-1 0 1 1-1 0-2-6 0-1-2-2 1 4 0 1 0 1-4-13-7-16-2-9-4-9 0-1-2-3-2-1-3-8-3-3-1-2-1-1-1 1-2-4 0-1-1-1 1 0 0-1 0-1 0-1 1 0 2-1 0-1-2 0-2 2-1-1-1 1 0 1 1 1-1 1-1-1-1-5-1-1-3-6-2-4-4-9 1 0 2-1 1 0 1 0 0 1-1 1 1 0 1 0 0 2 1 0 1-1 1 1 1 0 0 1 0 1 2-1 0 2 1 1 1-2 1 0 1 1-1 0-1 1 0 1 1 0 0 1 1 0 0 1 1 0 1-1 1 0 0 1 0 1-2 0 0 1 1 1 1 1 0 1 0 1 2 0 3 5 1 0 1 0 1 2 1 0 1 1 2 0 1 0 1 3 2 1 4 1 4-2 0 5 2-1 1 1 0 1 2 0 1 1 0 1 1 1 3-1 0 1 0 1z",
+    labelX: 272, labelY: 1004,
+  },
+  {
+    name: "Madhya Pradesh",
+    path: "M500 523l-1 1-1 0-1 0-2 1 0 1-1 2-1 0-2 0 0 1-1 1-1-1-3 0-5-1 0 1-1-1 0-1-1 1-5 0 0-1-1 0-2 0-1-1-1 1-3 2-1-1-2-1-2-3-2 1 0 1 1 0-1 1 0 1 1 0 1 1-1 1 1 1 1 1-1 2-1 0-1 2-1 1 0 1 1 0 0 2 1 0 1 0 0-1 1 0 2-1 2 0 1 2 3-1 1 1 0 1 1 1 0 1 2 1 0 1 1-1 1 0 1 2 0-1 1 1 1 1 0 1-1 2-1 3 1 0-1 2-2-1-1 2-3 0-1 1 1 1 0 2-1 1-2 2-3 0 0 2 0 2-1 2 1 2-1 1-1-1 0 1-1 0-1 1 0 1-1 1-1 1-1-1 0 1-2 0-1 2-1-1-1 1 0 1-1 0 0-2-2-1-1 2-1-1-1 1-1 1-2-1 0 1-2 0 0 3 1 3-1 2-3 0 0 4-1 0 1 1 0 1-1 1-1 0 0-2-1-1-1 1-2 6 0 2 0 2-1 3-1 0-1 0-1 1 0 2 0 2 0 2 0 1 0 2-1 2 0 2-1 1-1 1-1 0-3-3-2 0 0 1-2-1 0-1 1-1-2-2 0-1-1 0-1-2-2-1-2-1-2 1-2 2-2 0-1 1 0-1-2 0 0 1-1 0-3-1-1-1-2-1-2 1 0 1-4 0-1-1-1-1 1-1-1-1-3-1 0 1-4-1-1-1-1 1 0 1 0 1-3-1 0 1-1 1-3 0-1 0-1 0-1 1-1 0 1 2 0 2-1-1-1 1-1-1-2 0 0 1-1-1-1 1-1 0-3 0-1 0-1-2-1 0-1 1-2 0-1-3 1-1-2 0 0 1-1 0-1 0-2 0-1 1-2 0 0 2-6 4-2 0-1 1-4-2 0 1-1 0-1 1-1 0-1 0-1-1-1 0 0 1-2-1-2 1-1-3-1-1-1-2 3-1 2 1 2 0-1-1-1-5-3-3-2 1-5 0 1 0-1 1-1 0-1 1-1 0 0-1-4 0-6 4-1 0-1 1-1 0 0 1 0 1-1 0 1 1 0 1-2 1 0 1-4 3 1 2 0 1-1 2-2 0-1 0-1 0-2 3-1 0 0 1-1 1-4 0 0-1-3 0-1-1 0-1-1-1 2 0-1-2 0-1-1-1-1-3-1 0-3-1-2 0-1 0-2 0-4 0-3 0-3 1-2-1-3 0-1 0-2 0 0-1-3 0-4-2-1-3-5-2-1-1-1 0-2 1-7-2-2-2-1 0 0-2 0-1 1-4-2-2-1 0-1-2-1 0-2 2-1 0 0 1-4 0-1-1 0-1-2 0 0-1 1-1 1-1 0-1-1 0 0-4-2 0 0-2 0-1 0-3 1 0 1 1 2 1 0-1 3-2 0-1-1-1-1 1 0-2-1 1-1 0-1 0 0 1-1 0 0-2-1 1 0-2-1 0 0-1 1-1 3 2 0-1 1-1 1 0 1-2 1-1 3 0 1 0 0-3 2-2 0-1 1-2-1-2-1 0-1 0-2-2 1-1-1-3 2-1 3 1 1-1 1 0 0-1 2-1 2-2 2 1 1-1 0-1-1 1-1-1 1 0 0-1-1 0-1 0-3-1-1 0 0-1 0-2 1 0 0-2 1 0 1-1 1-1 2-1 1 0 1-1 1-1 0 1 2-1 1-2 2-1-1-1 1-3 0-1-1-1 0-2-1-1 1-1 2-5-1-3-2-4 1 0-1-1-1-1-4 0 1-1 0-2 3-3-2-2-1 0-2-1 1-1 0-2 2 0-1-1 1-2-1 0 1-2-1 0 1-1 0-1 2 4 1 1 2 0 1-2 1 0 0-2 0-1-4 0-1-1 0-1-1-2 0-3 1 0 0 1 1 0 1 2 1 0 0 1 3 0 1-1 1 1 1-1 0-3 1-1 0-2 1 0 1 1 5-1 0 1-1 1 0 1 0 2-2-2 1 2-1 0 0 1 1 1 1-1 1 1 2-1 0 1-4 2-1-1-1-1 0-1-1 0 1 2 0 1-1 0-1 1 1 2 1 0 1 0 6 2 5-2 1 2 1-1 1-1 2-1 2 0 1 1 0 2 1 0 0 2 1 1 0 1 1 0 0 1 0 2 0 1-2 2-1 0-1-1 1-1-1 0-1 1 0 1-1 0 0 2 1 2 1 0 0 3-1 0-1 3 1 0 1 1 1 0 0 2-2 0 0 3-2 1-1-3-2 2-2 0 0-1-2-1 0 1-1 1-1 2 4 3 0 1 1 1 2 0 1 1 0-2 1 0 1-1-1-1 0-1 2 1 0 1 3-2 1 1 2-1 1-1 0-2 0-1 2-1 0-1 3-1 0-4 1-2 0-1 1-1 0-1 1 1 0 1 0 2 1 0 1 0 1 0 1-1 1 0 2 2 0-1 1 0 1 0 1 1 1 1 2 0-1-1 2-2 2-1 1 0 0 1-1 2 1 1 2 0 1 2 3-1 1 1 0-3 1 1 0-1-2-3-1-2-1-1 1-1 0-3-1-3 1 0 1 1 1-1 0 2 2 1 1 0 1-1 0-1 1 0 0-2 0-3-1-2-2-1 0-1-1 0-1 1-2-1-2-2 1-1 2 0 2 0 0-1-1-1 0-1-1-1 0-2 0-1 2-1 1-1 4 1 1-1 1 0 1-1 2 0 1-1 1 2 3-2 0-2 1 0 0-2-2-1 1-2-1-1 0-1 0-1 0-1-2 0-2 2-1 1 0 1-4-1-1 1-1 0 0 1-2 0-1 0-2-1-1 0-3 0 0-1-1 0-2 0-1-1-1 0-1-1 0-1-1-1-1-3-1-2 0-2 0-1-1-1 0-1 2-1 0-2 2-3 1 0 1-1 1-1 2 1 1-1 0-1 1 0 2-2-1-1 2-1 0-1 2-1 2-1 1-2 2 0 1-2 3 0 2-1 2-2 0-1 2-1 2 0 0-1 3-1 5-3 1 0 1 0 0-2 3 0 0-2 2 0 1-2 1 0 2-2 3 1 0-2 1 0-1-2 1 0 2 0 0-1 1-1 2 1 1-2 2 0 1 0 0 2 2-1 1 2 2 0 1 1 2 0 2 0 0-1 2 0 1 1 2 0 2 2 1 0 2 1-1 1 1 0 1-1 0 1 1 2-1 1 0 1 2 2 0 2 1 0 2 0-1 1-1 1 0 1 1 1 1 1-1 0-1 1-1 0 0 1 0 1-1 0-1 2-1 0 1 1-1 0-1 1 2 2-2 2 0 1-2 3 0 2-1 0 0 1 1 0 0 2-1 0 0-1-1 0 0 1-1 0 0 1-1 1 2 2 0 2-5 2-1 1-1-1-1 1-3-1-1 1-1 0-1 1 1 2-1 0-1 1-1 0 0 2-2 1 1 1 0 1 1 1 1 1-1 1 2 1-1 1 1 0 1 0 0 1 0 1-2 0 0 1-1 0-1 1 1 2-1 1-4 4-1 0 0 1 0 1 1 0 0 1 1 3 1 2 0 1 0 1 0 3-1 0 0 1 0 1 1 0 0 2 4 2-2 2 1 1 1 1 2-1 1-2 1-1 1 0 1 1 1 0 1 2 2 1 0 1 1 1 1-1 1 1 0-1 1 3 1 0 0-1 2-1 0-1 1-1 0-1 2-2 1-3-2 0-1-1 0-1 1 0 1 0-1-1 0-1-1-1-1-2 0-1-1 2-2 0-1 0-1-2 2-2-1-3 1-1-1-2-3-1-1-2 0-1 0-3-1-1 0-1-1-2-1-3 1-1-2-1-1 0-1 1-1-1 1 0 1-1 0 1 1-1 0-2 1 1 1 0 1-3 1 1 0-1 1-1 1 0 0 1-1 1 1 1 2 0 0-2 1 0 0-1-1 1-1-2 0-1 1 1 1 0 2 1 0-2-1 0 1-1 1 0 0-1 2 0 0 1-1 0 1 1 0 1-1 1 1 1 0-1 1 0 0 3-1 1-1-1 1 0 0-1-2 0-2 3-1 0 0 1 1 0 0 1 1 1 1-2-1-1 1-1 2 0 1 0 0 1 0 1-1 1-1 0 0 1-1 0 0 1 0 1 0 1 2-2 1 0 1 0-1-1 1-1 1 0 0 1 1 0-1 2 1 0-1 2 1 0 1-2 1 1 0 1 1 1 1 0 0-2 1 0 0 1 1 1 0-2 1 0 0 1 1 0 1 0 0-1-1-2 0-1 1 1 1-1 0-1-1 0-1-1 0 1-1-1 0-1 1-1 2 0 0 1 0 2 1 0 0-1 1 0 0 1 2 0-1 1 0 1-1 0-1 2 1 1 0 1 1-1 0 1 1-1 0 1 1 1 1-1 0-1 1-1 1-1 0 1 2 1 1 0 3 0 3 1 1 0-1 0 1-2 0-2-1-1 1-1 2 1 2-1 1-3 2 0 2 0 1-1 1-1 2 0 0-1 2 1 0 4 1 0 1 2 1 0 1 2-3 2-1 2-1 1 0 1 2 1 1-1 1-2 2 0 1 1 1 0-1-1 1-1 1 1 1 0 1 0 0-1 0-2 1 1-1 1 1 0 1 1 1 0-1 1 2-1 1 1 1 0 0-1-2-1 0-1 3-1 0 1 1-1 0-1 1 0 1 1-1 1 0 2-1 2 1 1-2 1 0 1 2 0 2-1 1 1 2 0 1 0 1 0 1 1 1 1 1-2 2 0 0-2 2-3-1-1 1-2 3 0 1 1 1 0 1 1 1 1 1 0-1-2 1-1 1 0-1-1 2 0 1 0-1 1 2 0-1 1 1 0 0 1-1 1 1 1 1-1 1 1 1 1 0-1 3 2 1-1 2 2 0 3 1 1 1 1 1 0 1 0 3 1 1 1 0-1 1 1 2 0-1 1 2 0 0 2 0 1 1 0 1 1 0 2 1-1 1 1 2 0 0-2-1-1 1-1 1 1 2 0 1 1 4-2 2 1-1 1 1 0 2 0 0 2 1 0 0 2-2 0-1 0 0 1 1 1-1 4 0 1 2 0-1 5 0 2-1 1-1 0-1 0 2 2 2 1-1 2 2 0z",
+    labelX: 351, labelY: 521,
+  },
+  {
+    name: "Maharashtra",
+    path: "M427 620l0 1-1 2-2 2-2 0 0 1-2 0-1 3 1 2-1 1 1 3 3 0 0 1 0 3 0 2 1 3-2 1-1 1 1 1 0 1 2-1 2 0-1 0 1 1-1 1 0 4-1 2 1 0 1 2-3 1-1 1-2 0-2 1 1 2-1 1 0 1 2 0 2 0 1 1 0 1 0 3 0 1-1 1-1 0-1 0-2 0 0 1 2 1 0-1 1 1 0 1-2 2-1 0 2 0 1 1-1-1 1-1 1 0 1 1 0 1 4 3 0 3 2 0 2 2 2 0 1 1 1 2-1 1-3 1 1 1 1 1-3 3-2 0 0-1-1-1-1 1-1 0-1-3-1 1-1 1-1 0-1 2-2 1-1 3-1 1 0 1-1 2-1 0 1 1-1 2-1 1 3 3 0 1 0 1-1 1-2 1 1 1-1 1-2 0 0 1-1 0 0-1-2 1-2-2-1-1-3-1-1-2 1 0 0-1 0-6-2 0 0-3 3-2-1-2 1-3 1-3-3-4-2-1-1-1-1-2-1 0-1 1-3 0 0 1-1 2-2-1 0-1-1 0 0 1-2 1-1-1-1 0-1-2-2 1 0-1-3-1 1 1-1 2 0 1 0 1-1 1-2-2-1 0 0-1-2 0 0-1-1 1-1-1-1 0 1-1-1-1 0-1-2-1-1 0-1-3-1 0-1-1-2 0-1 0-3-2-1 1-2-1-1 1-1 0-2-1-1-2-1 0-1-1-1 2 2 1 0 1 1 1-1 2-1 1-1 0-1 1 2 2 0 1-1 1 1 3-1 1-1 1-1-1-1 2-1 1 1 1-1 3-1 1 0-1-2 0-1 0 0-1-4-2-3 1 0 1 2 0 0 1-1 0-1 2 0 1 0 1 0 2-1 0 0-1-1 1 0 1-1 0 0 1 0 2 2 0 0 1 1 0 0 1 1 0 1 2 1 1 0 1-1-1-2 1-2 4-2 1 1 3-1 1-3 1 0-1-2 0 0 2 1 0 0 1-1 0 0 1-2 0 0 1 1 0 0 1-1 1 0 1 1 0 0 1 0 1-1-1-1 0 1 1-2 1-1-1 0-1-3 0 2-3-1 0-1-2 0 1-1-1-3 1 0 3-1 1 0 1-1 0-1 3-2 0 1 1 0 1-2 0-1-2 0 1-1 0 0-1-2 0-1 3 2 1-1 0 0 2-1 0 0 4-1 1-1 0-2 0 0 1-1 0 0-1-1 0 0 1 1 0 1 1-1 2-2 0-1 4 0-1-1-1-1 0 0-1-1 2-1 0 0-2-1 0 0 1-2 0 1 2-2 1-1 1-3 1 0 2 1 0 0 1 1 1-2 0 0 1 2 0-1 3 2 0-1 2-1 0 0-2-1 1-2 0 0-1-1 0-2 0 0 2-1 0 0-1-1-1-1 0 0 1-1-1-2 0-2 1-2-1 0-2-1 1 0-1-1 0-1 2-1-1 0-1-1 0-1 0-1 0 0-1-2-1 0 3-2 0 1 1 1 1-1 1 1 1 1 0 0 2-1 1 0 1 1 2 1 0 0 1-1 1 0 1 1 0 0 2-1 1-1-1 0-1-2 0 0 1-1 0-1 1-1-2-1 1-1 0-1 0-1 1-3 0 0 2 0 1-1 0 0 1-2 0 0-1-1-1-1 0-1-1 0-1-3 0-1 0-1 0-1 1 2 0 0 1-1 0-1 1 0 3-2 0-3 1-1 1-2 0 0 2-1 1 1 1-2 0 0 1-2 1-1-3-1 0-1-1-1 0 1 2-3 1 0 2-2-1-1 1-1-1 0 1 0 1 0 1 1-1 0 1 1 1 0-1 0 2 1 0 0 1-1 0 0 1 0 2 0 1 2-1 0 1 1 0 2 1 1 1 0 1-1 3-2 0-2 1 1 1 2-1 1 1-2 3-1 2 0 1-1 0 0 1 1 0-1 1 0 1 0 1-1 0-1 1-1-1-1 1 0-2-1 0-1 1-1 0-1 1 0 2-1 0 1 1-3 1 0 1-1-1-1 0 0-2-1-2-3-1 1 0-1-1-1 2-2 0-1 0 0 1-2-1-1 0 0-1 0-1-3-4-2-1-1-4-1-1 0-3-2-7-1 0 0-1-2-6 1 0 1 1-2-3 1 0 0-1-1-3 0-3 0-1 0-2-1-1 0-3 0-1-1 0 0-1 1 1 0-1 0-2-2-6-1 0 1-1 0 1 1-1-1-1 0-2-2 0 0-1 1 0 0-2 0-1-2-2 1 0 0-1-1-2-1-2 1 0 0-1-2-5-1-1 0-1-1-1 1-1-1-1 0-1-1-1 0-1-1-2 1-1 0-1-1-1-1-2 1 0 1 1 3 1 0-1 0-1-3 0-2-2-1-1 1-1-1 0 0-2 0-3 1 0-3-6 1-3 1-1 1 1 1-2 0 2 1-1 0-2-2 1 0-1-1-1 1-1 1 0-1-1 1-1 2 0-1-3-1 0 0 1-1 1-2 0-1 3-1-1 0-1 0-1 1-1-1 0 0-3-1-2 0-2 1-4-2-2 0-2 1-2-2-1 0-2 0-1 0-1 0-2-1-2 0-2-1-1 0-1 1 0-1-3 2-2-1-3 1 0 0-2 2 0 2-1 0-2 1 0 3 0 1 1 0 2 0 1 1-1 0 1 1 1 0-1 1 0 2 1 2 1 1-2 0-1 1 0 1-1 0-1 1-1 4 1 0-2 0-1 0-4-1 0 0-1 3-3 0-1 1-1-1 0 0-1-2-1-1-2 1 0 1-2 1 0 0 2 2-1 1 1 2 1 0 2 1 0 1 0 2 0 1-1 2-1 0-2 1 0 1-2 1 1 1-1 0-4-1 0 0-1-1-2 0-2-3 0 0-1-1 0-1-1 0-2-1-1-1 1-1-1-1 0-1-1 0-1 1 1 0 1 2-1 2 0 0-1 1 0 1 0 1 0 0-3 2 0 2-1 0-4 3-1 1-2 0 1 2 0 2-1 3 0 2-1 0-1-1-1-1 1-1-1-1 1-1-1-6 0-1 1-1 1-1-1-2 1-1-4-1 0-1-1 4 0 0-1 0-2-2-2-1-2 1 0 1 0 6-3 4-2 1 1 4 0 0-1 1 0 2-2 1 0 1 2 1 0 2 2-1 4 0 1 0 2 1 0 2 2 7 2 2-1 1 0 1 1 5 2 1 3 4 2 3 0 0 1 2 0 1 0 3 0 2 1 3-1 3 0 4 0 2 0 1 0 2 0 3 1 1 0 1 3 1 1 0 1 1 2-2 0 1 1 0 1 1 1 3 0 0 1 4 0 1-1 0-1 1 0 2-3 1 0 1 0 2 0 1-2 0-1-1-2 4-3 0-1 2-1 0-1-1-1 1 0 0-1 0-1 1 0 1-1 1 0 6-4 4 0 0 1 1 0 1-1 1 0 1-1-1 0 5 0 2-1 3 3 1 5 1 1-2 0-2-1-3 1 1 2 1 1 1 3 2-1 2 1 0-1 1 0 1 1 1 0 1 0 1-1 1 0 0-1 4 2 1-1 2 0 6-4 0-2 2 0 1-1 2 0 1 0 1 0 0-1 2 0-1 1 1 3 2 0 1-1 1 0 1 2 1 0 3 0 1 0 1-1 1 1 0-1 2 0 1 1 1-1 1 1 0-2-1-2 1 0 1-1 1 0 1 0 3 0 1-1 0-1 3 1 0-1 0-1 1-1 1 1 4 1 0-1 3 1 1 1-1 1 1 1 1 1 4 0 0-1 2-1 2 1 1 1 3 1 1 0 0-1 2 0 0 1 1-1 2 0 2-2 2-1 2 1 2 1 1 2 1 0 0 1 2 2-1 1 0 1 2 1 0-1 2 0 3 3 1 0z",
+    labelX: 294, labelY: 711,
+  },
+  {
+    name: "Manipur",
+    path: "M906 467l0 1-2 1-1 7 0 1 1 0 4 2 0 4-1 2 0 1-3 4 0 3-1 1 0 1-2 0 0 2-2 3-1 0-1 3-1 0 0 2 0 1-1 1 1 0-1 2-1 0 0 2-1 2-1 2-1 5-2 3 0 1-1 0 0 3-1 0-1-2-2 0-1-1-1 0-1-1-2 0-1 1-2 0-2-3-5 0 1 1-1 0-1 1 0-1-1 1-1 0-1 0-2-4-3-1 0 2-2 0-1 0 0-1-1-1 0 2-2-1-1-1 0 1-1 0-1-1-1 0-2-1 1-4 0-2 1-2-1 0 0-2-1-1 2 0-1-1 1-1 0-1 0-1 0-1 2-1-1-1 1-2-1-2 1-4 1 0 1 1 1-1 0-1 2-3 0-1 0-1 0-2 1-1 1 0 1-2 0-3 2-3 3-2 0 1 1 1 2 1 1 1 3-6 1 0 3-4-1-1 0-1 1-1 1 0 4 0 2-1 0-1 2 2 1 1 1 0 1-1 1 0 0 1 1 1 2 0 1 0 4-2 0-1 2-2 1 0 2-2 1 0-1 4 0 3 2 1z",
+    labelX: 878, labelY: 492,
+  },
+  {
+    name: "Meghalaya",
+    path: "M829 483l-3-1 0-1-1 0-3-1-1-1-2-1-3-1-1 0-1 0-5 0-2 1-1-1-1 1-1 0 0 1-2 0-1 0 0-2-1 0-1 1-3 1 0-1-1 0-3-1-3-1 0 1-6 0-5 1-2 0-1 0-1 0-1-1-3 1-1-1-1 0-5 1-2 1-2-1-2-1-7-2-4-2-1 0-2-1-1 1-2 0 1-1-1-1 0-2 1-3 1 0 0-2 0-1 3-1 1 0 1-1-3-2-2-3 1 0 1-1 0-2 2-1 1-1-1-1 2 0 2-2 6 0 1-1 1-1 1 0 2 1 1-1 2 2 0 2 2-2 1 1 2-1 1 0 1 0 0 1 2 1 0-2 3 0 1 1 0-1 2 1 0 1 2 1-1 2 1 0 1-1 0 1 2 0 1-1 2 0-1 3 1 1 1 1 1-1 1 0 1-3 3-1 1 0 1-1 1-1 1-2 1-1 1-2 2 0-1 2 1 0 0 1-1 0 2 2 2-2 0-4 2-1 1-1 2 0 0 2 0 1 1 0 1 1 2-1 2 0 1-1 2 0 1-1 2 1 3-1-5 5 0 1 2 1-2 1-1 2 1 3 0 1 0 2 2-2 1 0 3 0 1-1 1 0 1 1 0 1 1 0 1 2 2 1 0 1 1 1 2-1 1 0-1 2-2 1 0 1 1 0 0 2 1 0 1 0 2 2 1 1 1 0 0 2-1 2 2 1-1 0-1 0-3 1-2 3-3-1 0 1-1 0-1 2z",
+    labelX: 791, labelY: 462,
+  },
+  {
+    name: "Mizoram",
+    path: "M848 506l1 1 0 2 1 0-1 2 0 2-1 4 2 1 1 0 1 1 1 0 0-1 1 1 2 1 0-2 1 1 0 1 1 0 2 0 0 2 1 2 1 0 0 6 1 2 1 1-1 1 0 5-1 1 0 3 1 1-2 2 0 3 1 1-1 3 1 1-1 0 0 2-2 2-2 1-2-2-1 0-1-1 0 1 0 2 0 1 1 2-1 0-1 4 0 2 0 2 1 4-1 2 1 0 0 3 1 0 1 1 1 6-3 1 1 1 0 1-1 0-1-1-1 0-1 1 0 2 1 1-2 0-1 2 1 2-1 0-1-1-1 0 0 2-2-4-1 0-1-1-1 0-2-2-1 0 0 2 0 2-1 1-1 1-1 0 0-2-1-3 1-1 0-1-1-8-2-10-2-6 0-2-3-2 1-4-1-2 0-1 0-4 1 0-1-3 0-1 0-1-1-2-1-4 0-1-1-1 1-2-1 0 0-2-1-1 0-3 1-1 0-1 0-1 1 1 1-2-1-1 0-1 0-1 0-3 1-3 0-2-2-1 0-1 5 0 0 2 0 2 1 0 1-1 1 0 1-3 2 0 1-3 2-1 2-6 2 4 1 1 1 0 1 0 0-1 1 1z",
+    labelX: 843, labelY: 549,
+  },
+  {
+    name: "Nagaland",
+    path: "M925 420l-1 1-2 2 0 1-1 1 0 1-2 2 0 1 1 0 0 1 0 1 1 0 0 6 1 1-1 2 0 2 1 0 1 1-1 2-2 2-2 2-1 2 1 2 0 2-4 4 0 2-1 1 0 1-2 0-1 2-1 1-1-1 0 1-2 1-2-1-2-1 0-3 1-4-1 0-2 2-1 0-2 2 0 1-4 2-1 0-2 0-1-1 0-1-1 0-1 1-1 0-1-1-2-2 0 1-2 1-4 0-1 0-1 1 0 1 1 1-3 4-1 0-3 6-1-1-2-1-1-1 0-1-1-1 1-1-1-3-2-1-2-3 2-2 1 0 2-1 2-3 3-3 3-2-1-2 3-2 1 2-1 2 1 1 1-2 2 1 1-2 2-1-1-2 0-1 1-3 1-4 1-1 0-2 1 0 1-2 1-1 1 0 1-4 3-4 1 3 0 1 2-2 1-1 1-2 0-1 1-1 1-1 1-1 1-1 2 0 0-1 1 1 2-1 2-2 0 1 1-1 1-1 1-1 2-3 2-1 1 1 1 0 3-2 3-3 0 2 2 3 0 1-2 1 1 3 1 0-1 2 1 1z",
+    labelX: 892, labelY: 441,
+  },
+  {
+    name: "Odisha",
+    path: "M566 702l1 0 1-1-1 2z m52-35l1 0 1 1z m19-22l-1 0 2-4 5 0 1 1 0 1-3 0-2 2-2-1z m2-5l3 0-2 1z m-5-52l0 2 2 0 1 1 1 1 4 1 1 1 1 0 1 2-2 3 2 2 2 0 0-1 0-1 2-1 0-1 1 0 2 0 0 1 0 1 0 1 0 3 4 1 3 0 0 1 0 1 0 3 1 1-3 2-5 0-5 2-4 3-3 4-3 4 1 2 4 12 0 1-3 0-2 1 0 1-1 3 1 0 1-1 0 1 3-2 3 1-8 5-2 3 0 2 2 1 0 1 0 1-2 1-2 1-4 3-2 1 1 0-1 2-2 2-1 2 0 1-2 0 0-2-2-1-1 0 0 1 1 0 2 2 1 1-9 3-9 2-6 2-8 5-5 2-5 4-3 3-6 4-3 5-1 0 0-1-1 0-1 1 1 1-1-1 0-1-1-1 0 2-3 0 1 1 1 0 1 1-1 0-1 0-1 2 0-1 0-1-1 0-2 1-1 2-2-1 1 1-1 1 1 1-3 2-1 0 1 2-1 0 0 1-1 0-1 0-2 0-4 1-1 0 0-1-2-1-4 0-1-2-1-2 0-1-1-2-2 1 1 1 0 1 0 1-1-1 0-2-1 0 0-1-3-5-1 1 1 1-1 0 0 1-1 0-1 2-1 0 0-1 0-1-1-1 0 1 0 2-1 0 1 2-1 0-1-2-2 0-1 0 0 1-1-1 1 2 1 0 0 1 2 2-1 1 1 0-2 1-3 1 0 1-3 0-2-1-2 5-2 0 1 1-1 1 1 0 0 1 2 1-3 3 2 2 0 1-2 0-1 0-2 0-1-1 0-1-1 0-2-1-1 1 1 2-1 1-4 2-1 2-1-1 0-4-2-1 1-2-2 0 1-1 0-1-1 0-1-1-4 4 1 2-1 2 1 0-1 1-1 1 0 1-1 1 0 1 2 0 0 1 0 1-1-1 0 3-1 1 0-1-1 0 0 3-1 0 0-1-2 0-1-1-1 0 0-1-2 0-1 0-1 0 0 1-2 2-5 1-1 2-2 1-1-1-1 1-2 2-1-1-3 1 0-1-3 1 0-1 0-2 2 1 0-2 1-2 0-2 1-5 0-1 1-2 1-1 1-1 2 0 0-1 3 0 1-3 3-2 0-1 1-1 0-1 2 0 0-1-2-1 0-1 1 0 1 0 0-1 1-1 2-1 1 0 1-1 2-1 1-4 1-1 1 0-1-4-1-1 1-1-1-2 0-1-1-2 0-2 1-2-1 0 0-1 1-2-2 0-1-2 0-1-2 0 0-1 0-2 1-2-1-2 1-3-3-1-1-2-3-1-1-2 1-3 3-3 2 2 0 1 2-1 4 3 2-1 1 1 1 3 1 2 2-2 2-1 5 2-1 1 1 2 1 0 1-2 2 0 0-1 0-2 0-3-2 0-2 0-2-1-5-1 0-3 1-2 0-3 0-1-1-1 1-3 0-1 0-1-1 0 0-2-1 0-1-1 1-3 0-1-1-2 0-2 0-3 1-1 1 0 1 2 1 0 1-1 0-2 3-1 2-4 0-1 1-1-1-2 3 0 2 0 2-1 2 1 1-1 0 1 1-1 1 1 1 0 2 1 2 1 1-1 1-1 2-4 0-1 1 1 0-1 0-1 0-1 0-1 4 1 1 0-1-2 0-2-1 0 0-1 0-3 0-1 1-1 2-1 0 1 1 0 0-1-2-1 1-1 1-2 0-1 1-1 1 0 0-1 2 0 0-1-1-1 1-1-1-1-1-1 1-2-1 0 0-1 2-1-1-1 3-5 2 0 1 0 4-4 2 0 0-1 2 1 1-1 1-2 0-1-2-2 1-1 2 1 2 1 1 0 0 2 0 1 2 1 1 0 2 1 5 0 0-1 1 0 0-1 1-1 5 0 1 0 2 0 1-1 1 0 2 1 1-1 0 1 1 0 2-1 3-1 1 0-1 1 1 3 0 1 0 1 1 0 0 1-1 1-1 3-1 1 0 2-1 0 0 1 1-1 2 0 1 0 0 1 1 0 2 1 1 1 0 1 2-3 1-2 2 0 0-1 1 0 6 3 2-1 1 2 3-1 2-1 1 1-2 0 0 1-1 1 0 1 1 0 4 1 1-2 2-3 0-1 1-2-2-2 2-3-1-1 1-1 0-2-1 0-1-1 0-2 2-1 1-1 1 1 1 2 3 0 1 1 2 0 1 3 4 2 2-1 1 2 2 0 1 0 1 1 0 1 1 0 1 1z",
+    labelX: 556, labelY: 661,
+  },
+  {
+    name: "Puducherry",
+    path: "M399 989l0 6-1 0-1-2 1 0-1-1-1 0-1-1-1 0 1-1-1 0 2 0-1-1 2 0 1 0z m0-34l-1 5-1-1-1-1-2 1 0-1-1 0 2 0 0-1-1-1 0-1 0-1-2 0 1-1 1 0 0 1 2 0-1 0 1 3 0-1 1-1 1 0z m-155-3l-1 0 0 1 1 2-2-3-1-1 0-1 1-1 1 1 2-2 2 0 0 1-2 1-1 0 0 1z m239-164l-1 0z m0-1l-1 0-1 0 1 1-3-1 0-1 1 1z",
+    labelX: 362, labelY: 890,
+  },
+  {
+    name: "Punjab",
+    path: "M294 255l0 2 1 1 1 0 1 2-1 1-1 0 0-1 0 1-1-1-3 1 2 3 2 1 1-1 0 1 1 0 0 1 1 0 1 2 0 2-1 0 1 1 0 1-1 0 0 2 2 2-1 1-1 0-1-2-1-1-1 1-2 0-1 1 1 1-1 2-1 0-2 2-2 0 0 1 1-1 1 1 0 1 1 0 0 1-1 1 0 3-1 0-1-1-2 1-2-1-1-1 0-2-1 0 1 1-1 1-1 0-1 1-3 0-1-2 0 1 2 1-2 3-1 1 1 3-1 0 0 2 2 1-4 2-1 0-1 1-1 1-1 0-1 1-1 0-2-1-1-1-1-1-1 0-1-1-2 1 0 2-2-1-1 0 0 1-2 0-2-1-2-1 0 1-2 1 0 2-1 0-1 1 1 0-1 0-1 2-1 1 1 1 0 1-2 0-1-1 0-1-1-1-1-2 1 0 0-2 1 0 1-1-2-2 1-1-1 0-1 0 0 2-1 0 0-1-1 0 0-1 0-1 0-2-1 0 0 1-1 0-2 1 0-1-1-1-1-1-2-1-2-1-3 1-1 0-2 1 0 1-4-1-21-1 0-1 0-3 2-3 0-2 0-3-3-4 0-1 1-1 1 0 0-2 1 0 1-1 2-2 0 1 1-1 0-1 1 0 0-1 1-1 1-1 3-3 1-1 0-1 1 0-1-1 1-2 2 0 0-2 2-1 2-2 1 0 1-1 0-3 1 0 1 1 2 0 1-1 0-1 0-1-2-1-1 1 0 1-2 0 0-1-1-1 0-1 0-3 0-1 1-1 2-4 1-1 1-2-2-1-1 0 0-1 1 0 0-2-3-6 0-1 1-1 1-2 1-2 0-1 1 0 1-1 2 0 0-2 1 1 2-1 1-1 1-2 1 0 1-1 1 0 2 2 1-1 3-2 1 0 0 1 1-1 0-1 1 0 1 1 2-3 1-2 1 0 0-1 0-1-1-1 0-2 3 1 2-1 0 1 0 1 1 0 1-2 0-1 5-1 1-1 1-3 1 1 1-1 3-4-1 1 0 1 0 2 3 3-3 1-4 5-2 0-2 1 0 2 1 1 0 1-3 2 1 1 2 0 5 3 2 1 1 1 2 4 0 1-1 0 3 6 0 1 1 2 4 8-1 0 1 2 1 0 0 2 4-1 0-1 1 0 0-2 1 0 0-2 1 3 2 3 1-1 1 2 0-1 2 2 0-1 1 1 0 1 1 0 1 0-2 1 0 3 1 0-1 3 1 2 2 1 1 0z",
+    labelX: 247, labelY: 249,
+  },
+  {
+    name: "Rajasthan",
+    path: "M217 294l0 1 1 0 0 2 0 1-2 0-1 2 1 1 2 1 2-1-1 7 0 1 1 1-1 3-1-1 0 2 1 1 1 2 0 1 1 0 1-2 2 0 1 1 1 0 1-2 2 0 2 1 1 4 1 0 2-1 1 3 1 0 1-1 1 0 1-1 0 1 1 0 1 0 1 0 0-1 2-1-1 2 2 1 0-1 1-1 0 2 0 1 0 1-1 0 0 1 1 1 0 2 1 0 1 2 2 0 0 2 0 1-1 0 0 1 0 1 0 1 1 1 0 2 1 2 0 3 1 2 2 0 0 2 1 1 1 1 2 1 1 1 1 0-1 1 0 1 2 0 3 1 0 1 1 0 1 2 2 1-1 1 2 1-1 1 1 0 1 1 0 1-1 0 0-1-1 0-1 1 0 1-2 1 1 0 1 1 0-1 1 1-1 1-1 0-1 1 0 1 1 0 0 2-2 0 0 1 1 0 1 0 0 2 3 0 1 0 1 0 0 1 2 1 1-2-1 0 1-2-1 0 0-2-1-1 1-1 1-1-1-1 2 0 1 0 1 1 1 1 0-1 1-1-2-2 1 0 1 0-3-2 2 0 1 0 0 1 1 0 3 0 1 1-2 0 0 1 2 1-1 0-1 1 3 0 0 2 1 1 1-2 2 0 0-3 1 0 1-2 1 0 2-1 0-1 1-1 1 0 2 1-1 0 3 2-2 6 0 2 1 1 0 1 0 2-1 0-1 2 0 2 1 1-1 1 1 1 1-1 1 1 1-4 1 0 1 1 1 0-1-1-1-1 0-2 2 2 2 0 0-1 1 0 2 1 1-1 1 1 0 3 1 0 1 2-1 1 1 1-1 1 1 2 1 0 0 1 2 1-1 2 1 1 2 0 3 2 1 0 0 1-1 0 2 3 0 1 1 0-1 1-1 0-1 2-1 1-1 1 1 0 0 1 3 1 1-1 1 2 1 0 0-1 0 1-3 1-8 4 0 1 1 1 0 1 1 1-1 1 2-1-1-1 1-2 1 0 0 1 3-1 2-1 1 0 0-1 1-1 1-1 4 2 1-1 1 1 1-1 0 1 1-1 1 0 0 2 1-2 1 1 1-1 0-1 5 1 0 1-2 1 0 1-1 1 0 1-2 0-1 0 1 2-1 0 0 2-3-1-2 2-1 0-1 2-2 0 0 2-3 0 0 2-1 0-1 0-5 3-3 1 0 1-2 0-2 1 0 1-2 2-2 1-3 0-1 2-2 0-1 2-2 1-2 1 0 1-2 1 1 1-2 2-1 0 0 1-1 1-2-1-1 1-1 1-1 0-2 3 0 2-2 1 0 1 1 1 0 1 0 2 1 2 1 3 1 1 0 1 1 1 1 0 1 1 2 0 1 0 0 1 3 0 1 0 2 1 1 0 2 0 0-1 1 0 1-1 4 1 0-1 1-1 2-2 2 0 0 1 0 1 0 1 1 1-1 2 2 1 0 2-1 0 0 2-3 2-1-2-1 1-2 0-1 1-1 0-1 1-4-1-1 1-2 1 0 1 0 2 1 1 0 1 1 1 0 1-2 0-2 0-1 1 2 2 2 1 1-1 1 0 0 1 2 1 1 2 0 3 0 2-1 0 0 1-1 1-1 0-2-1 0-2-1 1-1-1-1 0 1 3 0 3-1 1 1 1 1 2 2 3 0 1-1-1 0 3-1-1-3 1-1-2-2 0-1-1 1-2 0-1-1 0-2 1-2 2 1 1-2 0-1-1-1-1-1 0-1 0 0 1-2-2-1 0-1 1-1 0-1 0-1 0 0-2 0-1-1-1 0 1-1 1 0 1-1 2 0 4-3 1 0 1-2 1 0 1 0 2-1 1-2 1-1-1-3 2 0-1-2-1 0 1 1 1-1 1-1 0 0 2-1-1-2 0-1-1 0-1-4-3 1-2 1-1 0-1 2 1 0 1 2 0 2-2 1 3 2-1 0-3 2 0 0-2-1 0-1-1-1 0 1-3 1 0 0-3-1 0-1-2 0-2 1 0 0-1 1-1 1 0-1 1 1 1 1 0 2-2 0-1 0-2 0-1-1 0 0-1-1-1 0-2-1 0 0-2-1-1-2 0-2 1-1 1-1 1-1-2-5 2-6-2-1 0-1 0-1-2 1-1 1 0 0-1-1-2 1 0 0 1 1 1 1 1 4-2 0-1-2 1-1-1-1 1-1-1 0-1 1 0-1-2 2 2 0-2 0-1 1-1 0-1-5 1-1-1-1 0 0 2-1 1 0 3-1 1-1-1-1 1-3 0 0-1-1 0-1-2-1 0 0-1-1 0 0 3 1 2 0 1 1 1 4 0 0 1 0 2-1 0-1 2-2 0-1-1-2-4 0 1-1 1 1 0-1 2 1 0-1 2 1 1-2 0 0 2-1 1 2 1 1 0 2 2-3 3 0 2-1 1 4 0 1 1 1 1-1 0 2 4 1 3-2 5-1 1 1 1 0 2 1 1 0 1-1 3 1 1-2 1-1 2-2 1 0-1-1 1-1 1-1 0-2 1-1 1-1 1-1 0 0 2-1 0 0 2 0 1 1 0 3 1 1 0 1 0 0 1-1 0 1 1 1-1 0 1-1 1-2-1-2 2-2 1 0 1-1 0-1 1-3-1-2 1-2-1 0-1-1-2-1 0-1 1-2-1 0-3-1-1-2 0 0-2-2 0-1-1-1 1-1 0-2-4-2 1 0-1-2 1-1-1-1 0-1 0 1-2-1-1 1-3-1-1-2-1-2 2 0-1 0-3-1 0-2-2-1 0-1 0 0-1 0-1 0-1 1-2 1-1 0-2-1 0 1-2-2-2 0-1-1 0 0 2-2 1-1 1-2-1 1-2-3-1-2-2 2-5 1 0 1-1 1 0 0-1 0-1-2 1-3-1 1-1 0-3-2 1-1 0 0-1-1 2 0 1-1 1 1 0-2 2-2-1-5 0-1-2 0-2-1 0-3 0-1-1-2 2 1 1-1 0-1 0-1-2 0-1-2 0 0-2-1 0-2 0-1-1 1-1 1 1 1-1 0-1-1 1-3-1-1 1-1-1-1 0-1 0-1-1 0-2-1 0-2 1 0 1-2 1 0-1-2-1 0 2-1 0-1 0 0-1-1-1-4 2-2-2 0 1-1-1-2 0-1 0-4 2-1-1-1 0-1 2-6-3-1-1-2-3-3-6-1-7-5-5-1-2-2-3 0-5 0-5 0-1-1-1-4 1-4 1-4-1-2-3-2-2-2-4-1-5 2-5 1-2 0-3 0-6 0-3-2-1-2-1-5 1-3 0-4-3-7-3-1-3 1-8 2-4 1-2 3-3 6-5 3-4 3-2 3-9 1-2 2-2 3-2 2-3 4-1 3 1 4 4 0 3 3 4 4 1 13-5 5-1 9 0 8-4 1-6 2-4 7-5 0-2 4-10 2-4 13-7 7-4 1-4 3-3 7-13 4-15 7-3 7-2 5-5 0 2-2 3 0 3 0 1z",
+    labelX: 195, labelY: 420,
+  },
+  {
+    name: "Sikkim",
+    path: "M703 402l0 1-2-2-1 1-2-1-2 0-1 0 0 1-3 3-3-1-1-1-2 0-1 0-1 0-1 1-1 0-1-1-1-2 0-1-2 0 1-3 1-2-1-1 0-2 1-1-1-1 0-1 1-1 0-2 2-1 0-2 1-1 0-2 1-1 0-1 0-1 1-1-1-1-2-1 0-1 0-2 2 1 1-1 1 0 3-1 2 0 1-1 1 0 1-1 1 0 1 0 1-2 2-1-1 0 1-1 1 3 3 0 3 2 0 1 0 2 1 0 1 2 0 2-1 1 0 3 0 2-2 1 0 2-1 1 1 2-1 2 1 2 1 1 1 0 1 2 1 0-1 2-1 1-1 0-1 0-1 3z",
+    labelX: 694, labelY: 385,
+  },
+  {
+    name: "Tamil Nadu",
+    path: "M377 1048l2-1 2-1 1 1-1 1 1 1 2 2-3-2z m38-145l1 0 0 5-3 13 0 4 0 1-3 11-3 4-1 0 0 1-1 2-1 1-3 6-2 4-1 0-1 0-1 1 0 1-1-3 1 0-2 0 0-1-1 0-1 1 2 0 0 1 0 1 1 1 0 1-2 0 1 0 0 1 2-1 1 1 1 1-2 8 3 8 1 7-1 6-1 0-1 0-2 0 1 1-2 0 1 0-1 1 1 0 1 1 1 0 1 1-1 0 1 2 1 0 1 13 1 4-2 1-3 0 0-1-4 0 0-1-2 1 4 1 1 0-7-1 1-1 1 1 0-1-1 0 0 1-2 0 1 0-5 0 0 1-3 1-1 1 1 0-1 2 0 1-1 0 0 1 1 2-4 6 0 1-5 6-1 2-1 1-1 3 0 1 1 2 5 4 3 1-2 1-5-1-2 1-1 0-5 1 0 1-2 0-1 1-2 1-2 0-4 1-6 4-1 1-1 3 0 3 1 1-1 1-1 2-1 0 0 1 0 1 1 1-1 2 1 1-3 2 0 2-2 1-4 3-2 1-3 2-5 1-1 2-9-1 0-1-2-1-5-4 1-1 1 0 0-1 0-1 1-2 1 0 0-2 1 0 1-1-4-7 1 0 1-2 1-2 0-1-1-1 0-1-1 0 0-1-1-2 1-1 1-2 2-1 0-6 2-2 0-2 1-1 1 0 1-2-2-1-2-2-1 1-1 0-2-1-1 0 2-4 0-2 1-1 0-1 0-1-1 0 0-1 2-3-1-1 1-1-2-2-1 0 2-1 1 0 0-2 1-1-1-1 0-1-2-2 1-1-2 0-4 2-1 1-2 1-3 0-1-2-1 0 1-3-2-1 1-6 0-1-1-1 3 0 0-1-1 0 2-4-1-1-1 0-1 0 1-1-1-1-2-1-1 0-3-1 1-3 1-1 2 0-1 0 0-3-1 0-1-1 2-1 0-1-1-1-3 2-1-1-2 1-1-1-1 0-1 1 0-2 2-1 1-2 0-1-1 0-2-1-1-1 0-1-1 0-2-1 0 1-2-1-1 0 0-2 0-1 1-1 1 1 1-1 2 0 0-1 2-1-1-1 1 0 2-1 1 1 1 2 2 0 5 0 2 1 1-1-1-1 2-3 1-2 1 0 1 1 0-1 2-1 1 1 0 1 1 1 1-1 1-1 3 0 0-1 2 1 0-1 1 2 1-1 2 1 1-1 1-2 0-2 1-1 1 0 5-1 1-2 2-2 0-1-1-1 0-2-4 0-4 0-1-1 0-2 3-1 2-2 0-4 0-1-1 1 1-1-1 0-1-2 1-2 0-2 2 0 1 0 0 1 1 0 0-1 1 0 0-1 1 0 0-1 1-1-1 0 1-2 0-1 1-1 2 0 1 0 1 1-1 1 1 0 1-1 1 2 0-1 1-1 1 0 2 2 4 1 0 1-1 1 0 1 2-1 1 2 3 1 3 0 0-2 1 0 0-2 1 2 1-1 0-1 1-1 1-4 1-2-1-2 1-1 2 0 0-2 1 1 3-1 2 0 0 2 1-2 1 0 2 0 2 1 1 1 3 0 0-2 2-1 0-1 2 0 1 0 1 0 0-1 1 0 0-1 2 0 0-1 1 0-1-1-1 1 1-3-2 0 2-1 4 0 1 3 3-2 1 1-1 1 1 1 1 0 1 1 1-2-2-1 1 0 0-1 1 0 1 0 1 0 3-1 1-2-1-1 1 0 0-1 1-1 1-1 1 0-2-1 1 0 1 0 1-1 1 2 2 1 2-1 1 2 1 2 1 0z",
+    labelX: 346, labelY: 994,
+  },
+  {
+    name: "Tripura",
+    path: "M822 503l0 1 1 1 1 2-2 5 2 0 0 1 2 1 0 2-1 3 0 3 0 1 0 1 1 1-1 2-1-1 0 1 0 1-1 1 0 3-1 0 1 1-1 1 0-1-2-1 0-1-1 0-2 4-2-1-1-2-1 0-1 1 1 4 0 3-1 2-1 0-2 2-2 3-1 2 3 6-1 1-1 0 0 1-2 2-1 0-1 0-2 2-2-1 0-1 0-2-1 0 1-1-2-3 0-1-1-3-1 0-1 1-1 2 2 5-1 0-1-1-2-3 0-4 0-1-1-1 1-1-1-1-1-4-2-2 0-1-1-1 0-2 0-1 1 1 0-2-1 0-1-1 1-1 1 0 1 0 0-2 1-2-1-2 1 0-1-1 2 0-1-1 1-1 0 1 1-1 2 0 0-1 1-1-1-2 0-1 4 1 2 1 1 0 2-2 0-1 1-2-1-1 1 1 0 1 1 1 2 0-1-4 3 2 1-1 0 1 1 1 0 1 1 0 1-5 0-2 1-1 1 1 0-2 1 0 2 0 1 0 1-1 1-1 0-1 0-2z",
+    labelX: 806, labelY: 531,
+  },
+  {
+    name: "Uttar Pradesh",
+    path: "M407 337l2 0 3 3 1 0 1 1-1 0 2 1 1 2 1 1 2 0 3 2 0-3 1-1 1 0 1 0-1 1 1 1 2 0 1 1 1 1 2 1 1 0-1 1 3 1 2 0-1 1 3 2 1-1 2 3 5 1 1 1 0 1 3 4 0 2 1 0 0-1 3 0 0 1 1 1 0 1 6 4 2 0 3 3 1 0 2 2 1 0 0-1 2-2 3 0 2 3 1 0 2 1 8 6 3 0 2-1 4-1 0 3 1 0 0 1 1 1-1 2 0 1 0 1 7 0 0 1 3 1 5 0 1 1 2 1 0 1 1 1 2 0 1-1 0-1 1-1-1-1 1-1-1 0 8 0 8 5-1 0 1 1 2-1 0 1 0 1 0 1 1 1 1 1 1 1-2 2 0 2 2-1 1 0-1 1 1 1 1 2-1 1 1 0-1 1 1 1 0 1 1 1 0-1 2 0 0 2 1 0 1-1 1 0 1 3-1 1 0 1 2-1 1 3 3 1 0 1-4 1-1 0-4-1-2 0 0 1-1 2-2 1-1 0 0 1-1-1-1 0 0 3 4 0 1 2 4 1 0 1 0 1 0 2-1 0-1 0 0 1-1 1-2-1-1 2 1 1 0 1 1 0 0 1 1 0 1 1 2 2 0 1 2 1 2 1 2 0 2 1 1 1 2 0 0 1 1 0 0 1 1 0 2 2 0 1 0 1-2 0 0 2-1 0-1 0-1 0-1-1 0 1-1 0 0-2-2 0-1 0 0 3-1 0-3 0 0-2-2 0-2 0-1 1 1 2-6 3-3 3 1 1-2 1 0 1-3 0-3 3-2 0-3 1 0 1-1 0-1 1-1 1-1 0 0 4-1 3 1 1 0 1 0 1 0 2 1 3 0 1 2 2 1 0 0 1 1 1 0 1 1 1 0 1 0 2-1 0 0 1-4 1 0 1 1 1 0 1 1 0 0 2-2 2 1 2-1 1 0 1-1 3-1 1-1 1-1 2-2 1-1 2-1 1-1 1-2 0-4 0-2-1-1-2-2 0 0-2-2 0 1-2-2-1-2-2 1 0 1 0 1-1 0-2 1-5-2 0 0-1 1-4-1-1 0-1 1 0 2 0 0-2-1 0 0-2-2 0-1 0 1-1-2-1-4 2-1-1-2 0-1-1-1 1 1 1 0 2-2 0-1-1-1 1 0-2-1-1-1 0 0-1 0-2-2 0 1-1-2 0-1-1 0 1-1-1-3-1-1 0-1 0-1-1-1-1 0-3-2-2-1 1-3-2 0 1-1-1-1-1-1 1-1-1 1-1 0-1-1 0 1-1-2 0 1-1-1 0-2 0 1 1-1 0-1 1 1 2-1 0-1-1-1-1-1 0-1-1-3 0-1 2 1 1-2 3 0 2-2 0-1 2-1-1-1-1-1 0-1 0-2 0-1-1-2 1-2 0 0-1 2-1-1-1 1-2 0-2 1-1-1-1-1 0 0 1-1 1 0-1-3 1 0 1 2 1 0 1-1 0-1-1-2 1 1-1-1 0-1-1-1 0 1-1-1-1 0 2 0 1-1 0-1 0-1-1-1 1 1 1-1 0-1-1-2 0-1 2-1 1-2-1 0-1 1-1 1-2 3-2-1-2-1 0-1-2-1 0 0-4-2-1 0 1-2 0-1 1-1 1-2 0-2 0-1 3-2 1-2-1-1 1 1 1 0 2-1 2 1 0-1 0-3-1-3 0-1 0-2-1 0-1-1 1-1 1 0 1-1 1-1-1 0-1-1 1 0-1-1 1 0-1-1-1 1-2 1 0 0-1 1-1-2 0 0-1-1 0 0 1-1 0 0-2 0-1-2 0-1 1 0 1 1 1 0-1 1 1 1 0 0 1-1 1-1-1 0 1 1 2 0 1-1 0-1 0 0-1-1 0 0 2-1-1 0-1-1 0 0 2-1 0-1-1 0-1-1-1-1 2-1 0 1-2-1 0 1-2-1 0 0-1-1 0-1 1 1 1-1 0-1 0-2 2 0-1 0-1 0-1 1 0 0-1 1 0 1-1 0-1 0-1-1 0-2 0-1 1 1 1-1 2-1-1 0-1-1 0 0-1 1 0 2-3 2 0 0 1-1 0 1 1 1-1 0-3-1 0 0 1-1-1 1-1 0-1-1-1 1 0 0-1-2 0 0 1-1 0-1 1 1 0 0 2-2-1-1 0-1-1 0 1 1 2 1-1 0 1-1 0 0 2-2 0-1-1 1-1 0-1-1 0-1 1 0 1-1-1-1 3-1 0-1-1 0 2-1 1 0-1-1 1-1 0 1 1 1-1 1 0 2 1-1 1 1 3 1 2 0 1 1 1 0 3 0 1 1 2 3 1 1 2-1 1 1 3-2 2 1 2 1 0 2 0 1-2 0 1 1 2 1 1 0 1 1 1-1 0-1 0 0 1 1 1 2 0-1 3-2 2 0 1-1 1 0 1-2 1 0 1-1 0-1-3 0 1-1-1-1 1-1-1 0-1-2-1-1-2-1 0-1-1-1 0-1 1-1 2-2 1-1-1-1-1 2-2-4-2 0-2-1 0 0-1 0-1 1 0 0-3 0-1 0-1-1-2-1-3 0-1-1 0 0-1 0-1 1 0 4-4 1-1-1-2 1-1 1 0 0-1 2 0 0-1 0-1-1 0-1 0 1-1-2-1 1-1-1-1-1-1 0-1-1-1 2-1 0-2 1 0 1-1 1 0-1-2 1-1 1 0 1-1 3 1 1-1 1 1 1-1 5-2 0-2-2-2 1-1 0-1 1 0 0-1 1 0 0 1 1 0 0-2-1 0 0-1 1 0 0-2 2-3 0-1 2-2-2-2 1-1 1 0-1-1 1 0 1-2 1 0 0-1 0-1 1 0 1-1 1 0-1-1-1-1 0-1 1-1 1-1-2 0-1 0 0-2-2-2 0-1 1-1-1-2 0-1-1 1-1 0 1-1-2-1-1 0-2-2-2 0-1-1-2 0 0 1-2 0-2 0-1-1-2 0-1-2-2 1 0-2-1 0-2 0-1 2-2-1 0-1 2-1 0-1-5-1 0 1-1 1-1-1-1 2 0-2-1 0-1 1 0-1-1 1-1-1-1 1-4-2-1 1-1 1 0 1-1 0-2 1-3 1 0-1-1 0-1 2 1 1-2 1 1-1-1-1 0-1-1-1 0-1 8-4 3-1 0-1 0 1-1 0-1-2-1 1-3-1 0-1-1 0 1-1 1-1 1-2 1 0 1-1-1 0 0-1-2-3 1 0 0-1-1 0-3-2-2 0-1-1 1-2-2-1 0-1-1 0-1-2 1-1-1-1 1-1-1-2-1 0 0-3-1-1 3-2 2 0 0-1 1 0 1 0 0-2 2 0 0-1-1 0 1-1-2-2 0-2 0-1 1 0 0-2 1 0 0-1 0-1 0-1-2-1 1 0 0-1-1-2 1 0-1-2 0-1-4-3 0-1-2-1 0-1 2-2-1-1 0-1 0-1-1 0-2-3-1 0 0-2 0-1-1 0 0-1 1 0 0-2 0-3-1-1-1-1-1-1 1-3-1-2 1-1-1-1 1-2 0-1-1 0 0-1 1 0-1-2 1-1-1 0 0-1-1-2 1-1-1-2 1-2 0-1 1-1-1-2 0-1 1 0 1-6 3-2 0-3 2 0 3-2 0-2 1 0 1-1 2-4 2-1-1-1 1-1 0-1-1-1 3 0 1 1 1 2 7 3 1 1-4 6-1-1-1 3 0 1-1 2 0 1 0 1-1 2 1 0 0 2 1 1 0 3 1 0 0 1 2 0 1-1 2 0 1 2 0 2-1 1 2 0-1 1 2 0 1-2 1 0 2-3 1 0 1-1 1 0 3-2 1-2 2 1 3 2 1 3 2 3 4 3 7 2-1 2-1 1-1 0-1 1-1 0-1 1 1 1 2 2 1-1 1 1 1 2 0 1 1 1 1-1 1 2 1 0 0-1 1 0 3 1 0 1 1 2 0 1 1-1 3 3 2 0 1 0 0 1 1 0 0 2 0 1 4 0 1-1 0 2 2-1 2 1 2-2 2 0 1 1-1 2 1 0 0-1 2 0-1 1 2 0 0 1 1 2 1 1 1 0 1-1 1-2-1-1 1-1z",
+    labelX: 434, labelY: 401,
+  },
+  {
+    name: "Uttarakhand",
+    path: "M407 337l-1 0-1 1 1 1-1 2-1 1-1 0-1-1-1-2 0-1-2 0 1-1-2 0 0 1-1 0 1-2-1-1-2 0-2 2-2-1-2 1 0-2-1 1-4 0 0-1 0-2-1 0 0-1-1 0-2 0-3-3-1 1 0-1-1-2 0-1-3-1-1 0 0 1-1 0-1-2-1 1-1-1 0-1-1-2-1-1-1 1-2-2-1-1 1-1 1 0 1-1 1 0 1-1 1-2-7-2-4-3-2-3-1-3-3-2-2-1-1 2-3 2-1 0-1 1-1 0-2 3-1 0-1 2-2 0 1-1-2 0 1-1 0-2-1-2-2 0-1 1-2 0 0-1-1 0 0-3-1-1 0-2-1 0 1-2 0-1 0-1 1-2 0-1 1-3 1 1 4-6-1-1-7-3-1-2-1-1-3 0 2-1 1 0 1 0 4-3 1-1 0-1-2 0-1-2 1 0 0-1 0-1-1-1 0-1-1-1 0-1 1-3 0-2 1 1 1 0 0-2-2 0 0-2 1 0 1 0 1-1 0-2 1-1 0-2 2-2 2 0 1 0 1-1 2 0 2-1 1 0 1-1 1 0 1-1 1 0 0-1 2 0 3 2 1 2 3 0 1-2 1 0 1 1 0 1 4 0 1 0 1 2 2 2 1-1 1 1 2-1 0-1-1-2-1 0 0-1-1-1 0-1 1-3 2-1 1-2 1-2 3 1 1 3 2 1 0 1 1 1-1 2 1 0 2 4 2 1 1 3 3 0 2 2-1 1 2 1 2-1 1-1 1 0 2 0 2 1 2 0 0 2 1 0 1 1 4 2 1 1 0 1 1 1 1-1 0-1 1 0 1 2 1 0 1 1-1 2-1 1 1 1-1 1 1 1 1 1 1 0 1 0 2 2 1-1 1 1 2 1 2 1 1-1 1 0 4 3 2 3 1 1 7 2 0 1-1 0-2 1-2 2 1 1-4 3-1 2-1 0-1 2-3 0-1 1-1 3-1 1-1 1-1 0-2 1 0 1-1 1 1 2 1 1 0 1-2 3-1 0 1 1-1 1-1 1-1 0 1 1-2 0 0 2 1 0 0 1 1 2 0 5-2 0 1 2-2 1-1-1-2 2 0 4-1 1-1 2z",
+    labelX: 380, labelY: 287,
+  },
+  {
+    name: "West Bengal",
+    path: "M694 612l1-2 1 1 0 2z m12-1l0-1 2 1 0 1-1 0z m-4 0l0-1 1-1 0 1 1 0-1 1z m-7-1l1-1 2 1 0 1-2 1z m8-1l1-1 0 2 1 1-2 0 1-1-1 0z m8 0l0 1-1 0 0-1 0-1z m-14 0l0-2 1 2 0 1z m0-2l1 0 0 1z m14 2l-1-2 1 0 0 1 2 0 0 2-1 0z m-8-2l1 0 1-1 0 2z m-15 2l0-1 0-1 1 0 1 1 0 1-1 1-1 0z m5-3l1 2-1 2-1-1 0-2z m8 1l0-1 1 1 1 1-1 1z m-17 0l1-1 0 1-1 0 0 1 1 0 1 1-1 1z m28-1l2 0 1 2 0 1-1 1-1 0 0-1z m-1 0l2 1-1 1-1 0 1 0z m-16 0l1-1 1 1 1 0-1 1 0 1-1 1 0-1z m14 0l1 1-1 2-1-1-1-1 1-2z m-18 1l1-1 0 1 0 1 0 1 0 1-1 1 0-1z m-7 0l1 0 0-1 0-2 2 1 0 1 1 2 0 1 0 2 0 1-1 0-1-1-1-1 1-1 0-1z m27-2l0 2-2-1 0-2z m-21 0l0 1 1 0-1 1-1-1 1-2z m22 0l0-1 2 2-1 0z m-7 0l1-1 1 0-1 3 1 2-1 1-1-1 1-1 0-1-1-1-1 0z m-15 0l1-1 0 1z m7-1l1 0 0 1 1 0 0 1-2 0 1-1z m-10 1l1-1 0 2-1 0z m24 0l0-1 0-1 1 2 0 1-1 0z m-13 0l0-1 0-1 1 2z m-5 1l-1 1 0-2 0-1 1-1 1 0z m10-2l1 1-1 1 1 0 0 1-1 0 0 1-1-1-1-2 1-2z m-8 0l1-1 1 0 0 2-1 0 0 1z m-4 0l1-1 1 0-1 1 0 2z m20-1l1 0 0 1z m-6 2l-1-1 2-2 0 2z m-1-3l1 3-1 1-1 0 1-1-1-1z m5 1l0 2-1 0 0-1 0-1 2-1z m-16-1l1 0 1 1-1 0-1 0z m16 1l1-1-1 0 1-1 1 1 0 1-1 0 0 1-1 0z m-12-1l1-1 1 1 0 1z m-10 1l1-1 0-1 2 0 0 2 1 1-2 1 0 1-1 0 0-1z m20-2l1 0 0 4 1 0 0 1-1-1-1-1-1 0 0-3z m-28 7l0-2 1-2 2-4 1 2 0 6-1 1-1 0-2 0z m26-8l0 1 1 0 0 1-1 1-1-1 0-1z m5 4l1-2-1 0 1-1 0-1 2 1 0 1-1 1-1 1z m-12-3l1-2 0 1 1 1-1 3z m7 0l1-2 0 1 0 1z m-8-2l0 1 0 2-1 0 0-1 0-1 0-1z m-6 3l1-3 1 0 1 1 0 1-1 2-1 0-1 0z m13-2l0 1 0 3-1-2-1 1-1-1 1-3z m-10-1l1 0-1 1z m5 0l1 0 0 1z m-17 0l0-1 1 1z m26 2l-1 0-1-2 2 0 1-1 2 1-1 3 0-1-2 2z m-3-1l-1 0-2-1 0-1 1 1 2 0 0 2z m-3-2l0-2 1 0 0 1 2 1-2 0z m-3-1l1-2 2 1-1 2-1-1z m-20 2l1-3 1-1 1 0-1 3z m24-3l1-1 1 0 2 0 1 0 1 3-2 1-1-1-2 0-1-1z m0-2l1 0 0 1z m4 0l1 0 0 1z m4 1l1-1 1 0 1 2 0 2-1 0-1 0 0-1-1-1z m-7-1l1-1 1 1 0 1z m2-1l1 0 1 1-1 0z m1-1l2 1-1 0-1 0z m-4 2l2-2 0 1-1 1z m3-1l0-1-1 1 0-1 1-1 1 0 0 2z m1-2l0-1 1 0 1 2-2 0z m1-2l1 1 1-1 1 1 0 3-2 1 0 1 0 1 1 0 0-1 0-2 1 1 0 1 0 1 1 1 0 1 1 1-1 0-3-1-1-5 1-1z m3 4l1-2-1-2 1-1 0 2 1 1 0 1 0 2z m-12-1l1-2 1-2 3 1 1 0-4 3 0 2 2 0 0 1-1 0-2 0z m3 1l3-4 1 1 1-2 0 1 0 1-3 2-1 2z m7-4l0-2 1 1 0 1z m-3-2l-1 0 0 1 1 0-1 1-2-1 1-2 1 0 0-1z m0 0l0-1-1-1 0-2 1-1 1 0 3 3-1 1 1 1-1 0-1 2 0 1-1-2-2 0z m4-1l0-4 1-1 0 1 0 2 2 1-1 0 1 1 0 2 1 0 0 2 0 1-1-1-1-2-1 0z m-3-5l1 1 0 1-1-1z m-2-3l0 1-1-2z m2 2l0-4 1-1 1 2-1 2 1 2-1 1 0-1z m1-5l1 0 1 0 1 3 1 0 0 2-1 0-1 4-1-1-1-1 1-1 0-1-1-1 1-2z m-5-173l4 2 0 6 1-1 1-1 1 1 0 1 1 1 2-1 0 2 2 0 0 2 1 1 2 0 2 0 3-1 1-1 1 0 0 1 2 0 0 1 2 1 1-1 3 2 1-1 0 1-1 1 1 1 1-1 1 0 2 1 1 0 2 0 1 1 0 2-1 0 0 1 1 0 0 1-1 2 0 2 1 0-1 3 0 1-2 1-1 1-1 0 1 1-2 0 1 1-1 0 1 1-1 1 1 0-1 1 0 1 1-1-1 1-1 0 1-1-2-2 0 2-1 0-1 2 1 1 1 2-2 1 0 2-1 0-1 0 0-1-2 0-1 0 0-1-3 1-1-1-2-1-1-2 0-1-1 1-2-1 0-2 0-2-1-2 1 0-2-2 0-2-3-1-1-1-2 3 3 1 0 1 0 1 1-1 0 1 1 0 0 1 0 1-3 0-1-2-2 0-1 1 1 1-1 0-1-1 0-1-1-1-1 1-1-2-2 0 0-2-2-2 0-1-1 0 0 1-1 0 0-1-1 0 0-1-2-1-1-1 0 1-1-1 0-3-1 0-2 6 1 1 0-1 4 1 2 3-1 0-2 1-1 0-2 2 0 3-3 1-1 0-2 2-1 2 1 1 0 1-1 0-2 4 0 2 0 2 2 2 1-1 1 0 2-1 0 1 4 3-1 1 1 0 1 1 1 0 0 2 1 1 1 0 0 1 0 1 2 1 1 0 2 1 2 0 0-1 1 0 1 0 1-1 0 2 1 0 0 1 0 1 0 1 1 0-1 1 1 1 1 1 1-1 0 1 3 1-2 1 0 2-1 2-1-1-1-1-2 1-1 0-1 0-1-1-1 0-2 0-2 1-3-1-1 1 0 1 0 1 0 2 0 1-2 3 0 1-1 0-1 0 0 1 0 1 0 1-2-1 0-1-1-1-2 0-2 1 1 2-2 2 0 1-1 1 0 2-2 1 5 7 2 1 2 1 2 2 2 1 2-1 3 2 1 1 0-1 2 1 3 0 1 1 0 3-1 1 0 2-1 0 0 1 1 0 1 3 1 0 0 1-1 0 0 3-1 0-2 1-3 1 1 1-1 2 0 5 1 0 0 1 2 0 0 2 3 3 2-1 0 2-1 0-1 2 1 1-1 1 0 1-2 1 1 1 1 1 1 0 0 1 1 0 0-2 2 1 2 0 1 1 1-1 0 1 0 1-1 0-1 2-1 1-1 0 0 1 1 2-1 2 1 1 1 1 0 1 1 1 0-1 1 2-1 1-1 1 0 2 1 1-1 3 1 0 0 1 0 1-3 1 0 4-2-1 0-1-1-1-1 0-1-1-1 0 1 0 1 1 1 0 1 2 2 1 0 2-1 1-1 3-1 0-1 1 0 1-1 0-1 0-2 2 0 2 0 2-1 3 1 1-1 1-1 1 0-1-1 0 0 1 0 1-1-1 0-1-1 0 0 1-1-1-1 0-1 1 0 3-1 0 0-2-2 0 0 1-1 0 0 1 0 2-2-1 0-2-2-2 1-2-1-1 2-3 0-2 0-2-2-2-3 0 1-4 0 1-1 1-1 2-2-1-1-2 0-4-1 0 1 1 0 4 1 2 1 0 1 0 1 1 2 0 2 3-1 1-3 2-1-1 0-1-1 0 0 1 1 1-2 6-2 2-3 2-1 2-2 0 0 1-2 0-7 2-1-1 0-3 0-1 0-1-3 0-4-1 0-3 0-1 0-1 0-1-2 0-1 0 0 1-2 1 0 1 0 1-2 0-2-2 2-3-1-2-1 0-1-1-4-1-1-1-1-1-2 0 0-2 1 0 1 0 1-1 0-1 3 0 0-1-2-1 0-3-3-1 0-2 1 0 0-2-1-1-3-1-1 0 0-2-1-1-2-2-2 0-1-1-1-1 0-3 1 0 0-1-1-1 0-1 1 0 1 0 1 0 1-1 0-1-1 1-1-1-2 0-1 1-1-1-1 0-2-1-1 1-1 0-1-1-1 0-1-2-3-1 0-1 0-1-2 0-3 1-2-2-1-3 2-2 0-2 1 0-1-1 0-2 0-1 2 1 4-1-1-3 1-1 1 0 0 1 2 0 1 0-1 3 1 0 2 1 0 1 2-1 1 1 0-1 1 0 1-2 0-1 0-2 1 0 2-2 2 0 3-1 4-1 1 1 1-1 1-2 0-3 0 1 2-2 1-1 2 1 5 2 2 0 0-1-1-1 0-1 2 1 1 0 0 1 1 0 0-3 1 1 1 0-1-3-1 0 1-1-2-1 1-1 3 0-1 1 1 1 1-1 3 1 0-1 2 0 0-1-1 0 1-2-1 0 0-1 2 1 1 0 0-1 1 0-1-2 4 1 0-1-1-1-1 0 1-2 1 0 1-1 1-1 2-3-1-2 1-1 0-1 0-3 1 1 2-1 1-1-1 0 1-2-1-1 0-2-2 0-1-1 2 0 1-3 3-2-1-2-3-4-2-1-1-1 0-4 2 0 0-1 1-1 0-1-3-2 0-1 0-1 0-2 1 1 1-2 1 0 0-1 1 0 1-1 1 0 1 1 2 1 1 0 0-1-1-2 0-5-2-1-3-3 1-1-1-1 1 0-3-1-1-1 0-1 1 0 0-3 0-1 2-2 1 0 0 1 1-1 1 0-1-1 1 0-1-2 1 0 1 1 0-1 1-1 1 0 2-2 3-2 1-1 2-1-1-1-1-1 0-1-2-3 2-1 0-1-1 1-2 0-1 1-1-1 2-4 1-5-1-3 1-1-2-1 1-1-1-1 0-2-1 0 0-1-2 0-1-3-1 0 1-4 2 0 0 1 1 2 1 1 1 0 1-1 1 0 1 0 2 0 1 1 3 1 3-3 0-1 1 0 2 0 2 1 1-1 2 2z",
+    labelX: 673, labelY: 506,
+  },
+  {
+    name: "Lakshadweep",
+    path: "M168 1081l0 1-1 1-1 0 1 0 1-1z m20-62l0 1 0 1-1 0 0-1 1 0z m1-25l0 1 0-1 0 1-1 0 0-1 0 1 0-1 0 1 0-1 0 1 0-1z",
+    labelX: 162, labelY: 1023,
+  },
+  {
+    name: "Jammu & Kashmir",
+    path: "M204 84l2-1 4 0 4 1 1 1 1 1 2-2 3-2 3 3 3 2 0 2 0 3 0-1 1 1 2 1 4 2 2 1 0-2 1 0-1-1 1 0 1 1 1 0 0 2 1 0 2 2 1 2-1 2-1 2 2 0 0 1-1 0 1 1 2 1 1 0 2 4-2 3 1 5 3 0 1 2 3 0 0 1 2-2 1 1 0 2 1 3 1 0 1 2 1 1 1-1 0 1 1 0 0 2 2 0 2 0 0-1 2 0 0 3 4 4 1 2 3 1 0 3 1 1-1 1-1 1 0 1 0 1-1 0 1 1 2-1 0-1 1-1 1 1 1 1 0 1 1 0 1-1 1 2 1 0 1 2 1 0 1 2 1-1 1 4 1 1 1 0 1 3 1 0 0 1-1 2-1 0-3 1-1-2-1 0-2 1-3 0-4 2-1 4-5 1-1 2-2 1 0 1-2 1-3-2-2 0-1 2 0 1 1 1 2 1 1 2 0 3 1 1 0 1-3 3-1 3-2 1-1 2-1 1-4 1-2 1 0 2-1 0 0-1-1 0 0-1-2 1-2-1-1 0-1-1-1 0 0-1-1 0-2 0 1-1-1 0-2 0-1-2-2-1-1 0 0 2-2 0 0-1-2 0 0-1-3 0 0 1-2 0-2-1 0-1-1-1-1-3 1-1 1-1-1 0 0-1 2-6-2 0-1 3-1 1-1-1-1 1-1 0-2-2-2 0 0 1-1 0-2-2 0-1-3 0-2-2-3-1-1-1-2 0 0-1-1-1-1 0-1-1-2 0-1 1-1 0 0-1-1-2 0-1-2 0-2 0 0-1 0-1 1-2 0-1-1-1-1-1 0-2-1-3 0-1 1-1 0-1 1-1-1-1 0-1 1 0 0-1 0-1-2-2 0-2 1-1 0-1 0-1-1-2 1-4-2-2-1-3-1-9-2-5-1-1 0-1 1-2 1-5 0-1 3 0 3 0 1 1 0-2 1-2-1 0 2-5 2-1 2 0 0-1 3 0 1-1 1 0 2-2 0-1 1-1 0-2 1-1 0-1-1 0 1-2z",
+    labelX: 237, labelY: 141,
+  },
+  {
+    name: "Ladakh",
+    path: "M204 84l-2-2-1 1-1-2-2 1-1-2-2 0-2-1-1 0-2 1 0-1 0-2-1-2 0-1 2-3 2-1-1-3-1 0-1-1-2 0-1-1-2 1-1-1-1 0-1 0-3 0-1-1-2-1-6-4 0-3 1-2-2-2-3 1-2 0-2 0 0-1-2 0-1 0 0 1-2 0-2 1-2-1-1-1-1-1-2-1 0-1 1-1 0-1 1 0 1-1-1-1-2-1 1-3 1 0-1-2 0-1 1-1 1-1 1-1 2 1 0-1 3-1 2-3 1 0 1-1 0-1-1-1 2-1 2 0 0-2 2-1 2-3 0-1-1-2 2 0 2-2 1 1 5 0 0-1 1 0 1-1 3 2 2 0 2 1 1-1 2 1 0-1 2 0 1-1 2 1 1 0 0-1-1-2-1-1-1-1-3 0 0-1-1-2 0-1 2 1 0-1 3 1 2 1 1 0 2 1 1 1 1 1 2-2 1 0 1-2 4 0 5-4 4 0 1 1 1-4 2 0 1-1 1 1 0 1 1 1 1-1 2 0 0 2 3 3 3-3 3 2 1 0 1-1 2-3 2-1 3 0 0 3 1 1 1 0 0 1 0 1 0 1 1 0 0 3 1 1 5 2 2 2 2 5 6 4 6 1 3 3 3 2 3 0 3 2 0 2 1 2 3 1 0 1 1 0 2-1 2 3 0 1 3 1 1 2-2 1-1 2 2 2 0 2 5 3 2 0 4-1 1 2 1 0 0 1 2 0 0 1 3 1 0-1 1 0 2 2 1 1 0 1 1 1 0 2 1 1-2 0-2-1-1 0-1 1 1 1 1 0 0 1 2 1 3-2 0 1 1-1 2 1 1-1 1 1 2 0 0-2 1 1 2-1 3 2 0-1 2 1 0-1-1-1 1-2 0-1 1 1 2-1 1 2 2 0 1 0 0-3 1 0 0-2 2 1 1-4 2 1 1-1 1-2 4 0 4-2 1-1 2-1 4 1 3-1 1-1 2 2 3 1 1 0 2-2 0-3 1-2 5 0 1 1 0 3 1 0 3 1 2 1 4 1 1 1 5 1 2-2 2 0 1 0 3 6 4 2 2 1 2 6-1 1-1 0 0 2-1 5-1 2-1 3 0 4-1 3-2 5-1 1 0 2 0 4-4 1-3 0-2 2-1 1 0 1-1 1 2 2 0 1-4 0-3 0-3 1 0 1 0 1 1 0 0 4 2 2-1 1-1 2-1 0-1 2 0 1-1 1-1 1-1 1 1 1-1 1-1-1-6-1-1-1-1 1 0 1-1 0-3-1-3 1-1 2 4 8 1 1 1 0-1 1-1 1 1 2 1-1 1 3-1 0-3 0-2-1-1 3 1 2 0 4 1 2 1 2 1 0 3 1 5 0 2 1 2 0 3 1-1 2-2 5 1 2-2 1 1 1 0 1 2 0 5 7 1 1 1 1-4 5-2 2 0 1-2 0 0-1-3-1-1 2-1 0 0 1-2 1-2 0 0 1 0 1 0 1-1 1-3 0-1 2-1-1-2-1-2-2-1 0-1-5 0-1 0-1-1-2 0-1-1 1-2 0-1 3-2-1-2 0-1 1-1 0-1 1 0 1-1 0-3 3-1-2 1-1 0-1 3-2-1-1 0-1 1-2 0-2-1 0-2 1 0 1-2 1-1 1-2-1-1 2-1-1-1 2-1-1 0 2-2 0-3-4 1-3-1-1-1 0 0-1-2-1-1-1 1-2-3-3-2 0 0 1-2 1-3 2-1 0-1 1-1 0 0-1-1 0-1 1 0 1-1 1-1-2-1 0-1-1 0 1-1-1-1-1 0-1-1 1-1-3-1 0-1 0-1-1-1 1-3-2-1-3-1-1 0 1-1 0-1-2 0-3 1-1-1 0 0 1 0-1-1 0-1 0-1 0-1-3-1 0-1-1-1-4-1 1-1-2-1 0-1-2-1 0-1-2-1 1-1 0 0-1-1-1-1-1-1 1 0 1-2 1-1-1 1 0 0-1 0-1 1-1 1-1-1-1 0-3-3-1-1-2-4-4 0-3-2 0 0 1-2 0-2 0 0-2-1 0 0-1-1 1-1-1-1-2-1 0-1-3 0-2-1-1-2 2 0-1-3 0-1-2-3 0-1-5 2-3-2-4-1 0-2-1-1-1 1 0 0-1-2 0 1-2 1-2-1-2-2-2-1 0 0-2-1 0-1-1-1 0 1 1-1 0 0 2-2-1-4-2-2-1-1-1 0 1 0-3 0-2-3-2-3-3-3 2-2 2-1-1-1-1-4-1-4 0z",
+    labelX: 283, labelY: 99,
+  },
+];
+
+export default indiaMapPaths;
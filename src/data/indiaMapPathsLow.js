@@ -0,0 +1,189 @@
+// India state and UT paths, simplified (low level of detail)
+// Generated by scripts/simplify_map_paths.py from indiaMapPaths.js; see it for the method
+// viewBox: 0 0 1000 1136, integer coordinates, tolerance 2.0
+// 63 rings, 2558 points (source: 221 rings, 26551 points)
+
+const indiaMapPaths = [
+  {
+    name: "Andaman & Nicobar Islands",
+    path: "M871 1122l7-3 2 9-3 7z m-44-126l6-3-1 12-5-1z m5-37l2-4 1 3 3-13 1 12 2-1-4 9 3 0-2 6z m7-9l1-6 4-1 0 4z m4-28l0 1 3-1 2 12-2 5-3-1 1 4-5 1 0-19z m0 1l0-1 0-18 6-6 2 8-4 0 3 3-1 7-3 0z",
+    labelX: 857, labelY: 993,
+  },
+  {
+    name: "Telangana",
+    path: "M319 815l0-11 3-3-11-5 5-2 2-4 1-13-4-8 4-7 7-3-9-3 7-14-3-3 0-8 1-10 5 0 0-4 7-5-6-8 3-2 0-8 11 2 1-5 4-3 0-16 6 4 12 2 1 3 3 1 0 3 8 4 1-6 8 4 11-4 7 8-4 10 2 3-1 7 7 6 6-2 2 5 5-1 5 3 5 10-1 3 3-2 1 3 4-1 2 14 4-3 8 2 13-3 0 2-7 4-5 13-18 6-2 6-9-4-4 4-3-1 0 3 7 2 0 5-7-1-6-9-6 5 2 4-4 6-6-3-18 6-2 11-8 1-6 7-13-2-10 9-2-3z",
+    labelX: 388, labelY: 745,
+  },
+  {
+    name: "Andhra Pradesh",
+    path: "M482 788l1 0 1 3z m1-1l-4 0 3 1 1 4-12 6-23 4-12 21-3 0-1-4-4-2-14 7-8 21 5 17-2 18 6 23-5-9-4 4 9 5 0 2-10-5-3 7-7 2 1 3-11-5 1 4-8 3-2 4-16-2-8 16-9-2 1-3 4-6 4 2-1-4 5-6 0-4-8-3 2-8-11-2 1-8-6 1 1-4-5 1-4 6-6 2-3 1 0-6-9-3 0 6-6 0 1-6-5-8 5-1 0 4 4 3 6-2 3 5-2-8 5-1 0-4-3-2-1 4-3-4-5-1-2 5-5-1-2-4 3-5-4 1-3-5 3-12-3-1 0-3 11 2 3-6-7-11 5-6-3-7 5-4 11 1 19 1 2 3 10-9 13 2 6-7 8-1 2-11 18-6 6 3 4-6-2-4 6-5 6 9 7 1 0-5-7-2 0-3 3 1 4-4 9 4 2-6 18-6 5-13 7-4 0-2 9-6 7 3 3-3 1-13 4-4 5 11 6-8 4 3 5 0-2-10 4-5 10-2-4-6 5 2 1-4 2 2 3-5 4 8 2-3 3 7 7 2 8-1 3-8 8-2-2-2 3-2 2 3 1 1-22 27-19 11-12 15-30 18-3 5 4 3z",
+    labelX: 430, labelY: 816,
+  },
+  {
+    name: "Arunachal Pradesh",
+    path: "M925 420l-2-14 9-3 3-5 12 0 4-4-5-3 1-4-4-7 7-9-13 0-37 15-9-2 0 4-20 21-22 2-12-4-3 2-16 3-3-10 3-5-3-7-13-1-3-3 3-7-2-4 11 5 10-5 4 3 8-2 7-6-3-3 1-3 18-8-1-4 5-7 20-2 10-16 12-5 2-5 6 7 22 5 5-9 17-8 5 9 5 0-9 6 2 7 12-6-2 3 5 9-12 14 4 2 10-5 11 6 3-2 11 7-3 4 3 3-1 4-4 0-13 11 1 6 9 13-11-3 1-2-6-5-14 3-9 4-21 20z",
+    labelX: 899, labelY: 367,
+  },
+  {
+    name: "Assam",
+    path: "M742 464l-1 2 0-2z m181-58l-24 15-6 8-1-4-9 14-1 10-6 4-1-5-3 2-12 13 5 9-10 19-3 0-4 15-5 1-3-5-8 13-8-3-2 0 0-9 2-9-1-7 8 2-2-6 13-7-1-5-7-5 3-4-3 1-6-7-8 3 2-9-2-2 5-5-13 3-4-4-5 8-3-5-4 6-8 6-1-5-7 1-4-5-12 2-2-4-12 2-8 8 4 6-4 1-2-10 2-5-6-8 0-5 5-3 0-13 19-7 10 5 48-5 16-3 3-2 12 4 22-2 20-21 0-4 9 2 37-15 13 0-7 9 4 7-1 4 5 3-4 4-12 0-3 5z",
+    labelX: 843, labelY: 443,
+  },
+  {
+    name: "Bihar",
+    path: "M681 426l5-1-2 2 4 6-16 12-1 5 8 8 1 7-5-1-5 3 3 6-3 3-7-5-3 6-5-1-2 5-5 3-3 15-4-1-1 3-10-2-5 9-5-4 0-4-6-1-3-7-3 2-8-3-2 9-13 2-7 5 0-2-6 3-4-6-10 9-7-6 0-5-6 3-4-5-4 4-13 0 0-6-6-13 1-7 15-7 10-12 7 2 2-3 6 2 3-2-3-5-12-5-5-5 5-9-9-3 0-3 5-1 1-3 11 0-6-4 0-5-6-1-7-17 1-3 8-4 6 5 11 2 3 4-2 7 11 4 3 4 5-1 1 4 14-4 8 11 5-3 11 2 13 7 12-6 1 5 8 4 5-4 4 2 10-3 4 4z",
+    labelX: 603, labelY: 449,
+  },
+  {
+    name: "Chandigarh",
+    path: "M296 264l-1 1-2-1-2-3 5 0z",
+    labelX: 294, labelY: 262,
+  },
+  {
+    name: "Chhattisgarh",
+    path: "M541 576l0 6-12 5-3 5 1 9-8 14 2 5-5-1-3 8-19 0-6 12-3-2 1 30 11 2 0 6-4 2 0-3-5-2-4 3-3-6-10-4-3 3 0 5 7 4-1 10 5 3 2 18-6 7-6 3 2 3-7 8-7 3-5 16-8-2-4 3-2-14-4 1-1-3-3 2 1-3-5-10-5-3-5 1-2-5 2-4-2-5 4-10 6-5 1 3 5 1 3-3-2-2 4-2-8-5-5-8-4 1 3-2-3-3 4 0 1-5-5-2 0-4 8-3 0-10-5-1 3-2-5-15 8-9 2-14 3-1 3-13 4 1 3-14 17-3 6-5 0-8 6-3 0-4 7-3 1-6-9-8-11 1-1-3 4-5-3-7 7 4 4-3 20 4 10-7 5 3 6 0 7-8 6 3 9 15 8 0 1 18 4 6 1-2 7 3-6 10z",
+    labelX: 483, labelY: 633,
+  },
+  {
+    name: "Dadra & Nagar Haveli and Daman & Diu",
+    path: "M173 664l0 1-6 1-3-5-1-2 6-3 3 2-4 5 4-2z m-12-12l-2 3 1-2z m-65-10l-3 1 1-1z m-4-1l1 2-7-2 2-8 5 1z",
+    labelX: 130, labelY: 650,
+  },
+  {
+    name: "NCT of Delhi",
+    path: "M314 349l-1 1-5 4-3-5-1 1-3-1-1 1-4-3 4-8 0-1 1-1 2 0 5-1 1 0 4 6z",
+    labelX: 305, labelY: 345,
+  },
+  {
+    name: "Goa",
+    path: "M204 825l4 0 3 13-2 1 0 10-6 2-6-6-1-9-4-3 4 0-4-2-3-9 6-2 5 6z",
+    labelX: 200, labelY: 836,
+  },
+  {
+    name: "Gujarat",
+    path: "M93 643l-1-2z m-92-107l8-7-2 8z m12-12l1 0 1 0-4 2z m-8 4l-2 5-1-5 7-6z m206 28l5 8-3 8-4 0-4 5-4-1 2 4 4-2 2 3-3 3-4-2 3 15-12 5 3 6-4 1 3 5 15-2 1 2-9 1-8 11-8 0 10 7 2 9-7 6-10-5-1 19-7 2-1-3-4 2 4-5-3-2-6 3 1 2-8 3 3-9 2-3 0-10-10-20 3-9-2-2 7-3-10-1-1-9 4-10 10-1-9-2-6 3-2-5 0 7-4 7 1-5-3 4 3 13-7 16-39 17-2 0-1 1-1-2 1-7-5-1-2 8-20-12-13-16 1-4-1 4-26-29 5-6 5 8 9-3 1-3 3 3 2-4 4 2 6-5 7-1 11-19-4 5-5-1-15 4-3 4-8-1-24-11-6-5 2-3-2-3-4-10 9-8-7 4 2-7-1 0-1 0 7-1 3-13 2 4 2-3 22 0 5 4 8 0 5-4 16-5 0 6 8 1 10-6-4-2 0-4 4-5 6 3 8-3 11 2 7-3 4 3 6 0-3 2 6 3 1 3 3-3 13 6 6-6-1 4 5 1-5 7 6 6 4-4 0 12 5 7 5 0-1 6 7 0 2 4 2-1z",
+    labelX: 108, labelY: 580,
+  },
+  {
+    name: "Haryana",
+    path: "M322 276l-16 24 2 36-5 1-2 0-1 1 0 1-4 8 4 3 1-1 3 1 1-1 3 5 5-4 1 0 6 10-2 6 2 5-9 6-8-1 2 4-6 3 2-19-4-3-10 10-3-7-7-1 3 4-6 0 0 10-7-2-2-3 4-5-3-1 5-3-18-17-2-16-5-5 1-5-11 2-7-7-9 3-2-4 2-13-5-1 2-6 4 1 6-3 6 5 3-2 1 4 4-1-2 6 3 5 7-10 4 2 7-3 9 3 7-4-2-3 1-9 4 2 3-3 1 3 5 1 2-5-3-2 6-6 7 1-1-8-3-4 0-3-2-6 5 1 8 8-1 5 3 3z",
+    labelX: 269, labelY: 319,
+  },
+  {
+    name: "Himachal Pradesh",
+    path: "M367 241l3 6-4 1-3-4-11 0-4-4-15 5-7 16 4 9-9 5 1 1-13-4-3-3 1-5-8-8-5-1-5-3 1-9-10-9-2 5-4 1-10-26-11-6 3-2-1-4 11-7-3-6 1-1 1-7-4-7 5 2 15-12 9 1 6-4 0 1 2 5 13 10 3 2 3-3 8-4 5 6 3 2 3 8 6-4 7-3 0 6-3 4 4-1 4 5-3 7 5 1 1 4 6 5-3 8 4 7-4 4z",
+    labelX: 312, labelY: 218,
+  },
+  {
+    name: "Jharkhand",
+    path: "M670 476l0 4 7 8-6 5 4 6-4 1 0 7-6 7 2 2-7 1-1 5-7-2 0 8-12-2-4 7-11 2-5 8-9-6 0 4-6 1-1 10 2 2 5-1 6 6 11 0-4 2 0 6 12 9-1 4 5 5-6 3-23-13-3 4 2 10-4 8-5-1 2-4-5 2-9-4-6 6-8-4 4-8-1-6-27 5-10-7 7-5 6-10-7-3-1 2-4-6-1-18-8 0-9-15-6-3 4-10-2-5 4-1 13 0 4-4 4 5 6-3 0 5 7 6 10-9 4 6 6-3 0 2 7-5 13-2 2-9 8 3 3-2 3 7 6 1 0 4 5 4 5-9 10 2 1-3 4 1 3-15 5-3 2-5 5 1 3-6z",
+    labelX: 597, labelY: 534,
+  },
+  {
+    name: "Karnataka",
+    path: "M321 731l0 8 3 3-7 14 9 3-7 3-4 7 4 8-1 13-2 4-5 2 11 5-3 3 0 11-11-1-5 4 3 7-5 6 7 11-3 6-11-2 0 3 3 1-3 12 3 5 4-1-3 5 2 4 5 1 2-5 5 1 3 4 1-4 3 2 0 4-5 1 2 8-3-5-6 2-4-3 0-4-5 1 5 8-1 6 6 0 0-6 9 3 0 6 3-1 6-2 4-6 5-1-1 4 6-1-1 8 11 2-2 8 8 3 0 4-5 6 1 4-4-2-4 6-11-4-4 1-2 6-5 0 1 11-5 5 10 4-3 5-6 1-3 6-17-1-3 7-14-3 0-3-10-3 0-5-8 1-16-12 0-7-3 1-1-5-9-2-1-4-5 1-16-63-3 1-2-8-5-2 0-4 6-2 0-10 2-1-3-13-4 0 3-5 5 1 4-10-4-1 4-1 1-3-6-3-2-10 4 1 3-5 5 3 2-5 8-2 1-6 5 0 5 4 1-4 14-1-4-15 2-3 6 4 3-2 2 3 15 1-2-10 7-6 5 3 4-6-2-2 6-1 1-10 6 2 7-11 3 2-2 3z",
+    labelX: 279, labelY: 846,
+  },
+  {
+    name: "Kerala",
+    path: "M282 965l-6 4 0 3 10 4-3 6 10-1 1 6-4 4 9 5-4 5 1 12 5 2 9-4 2 5-4 4 3 4-4 13 9 3-9 17 3 5-3 5 4 7-6 8-19-22-10-36 5 5-1 10 5 0-3-1-1-10-6-10 1 6-17-48-15-21 0-3 3-4-6 2 0 1 1 1-13-25 5-1 1 4 9 2 1 5 3-1 0 7 16 12 8-1 0 5 10 3z",
+    labelX: 272, labelY: 1004,
+  },
+  {
+    name: "Madhya Pradesh",
+    path: "M500 523l-10 7-20-4-4 3-7-4 3 7-4 5 1 3 11-1 9 8-1 6-7 3 0 4-6 3 0 8-6 5-17 3-3 14-4-1-3 13-3 1-2 14-9-2-5-8-12 3-6-3-6 2-2-4-8-2-12 5 1 4-17-1-2-4-15 8-15 1-3-6 7 0-2-6-10-2-16 6-6 14-12 5-5-4-1-7-30-2-11-8-10-1-6-13-4 3-5-1-3-15 4 2 3-3-2-3-4 2-2-4 4 1 4-5 4 0 3-8-5-8 14-5-7-3 0-3 14-10-2-9 3-6-3-8-5-1 4-6-5-3 3-10 3 5 4-4-5-2-1-6 7 4 4-7 7 0-3 6 5 1-4 2-3-3 0 6 21 0 3 10-6 2 2 4-2 6 3 3-4 4-7-3-2 4 5 5 3 1 1-5 2 2 7-3 0-3 5-3 2-9 2 4 10 2 6-4 0 4 7 2-3-16 6 3 2-7-9-6 5-2-2-6 17-4-1-11-14 5-9-2-7-14 14-14 35-22 6-1 4-6 21 3 6 3 0 5 5 4-9 25-4 2 2 4-13 3-5 7 5 8-9 11 3 7-1 6 5 9 5-4 10 8 5-7-3-10-4 1 1-8-5-6-2-11-5-1 8-6 3 3-1-5 4 2 1-4 3 7-3-1-3 4 2 2 4-4-3 7 5-4 0 5 2-2 2 3 6-1-1-8 6 3-2 5 3 2 3-4 10 3-1-5 14-7 6 9-5 6 11-2 0-3 6 4-2-3 5-2-2 9 11 2 5-10 7 3 3-4 2 5 9 3 2 5 9 2 3 7 4 0 0-4 12 2-1 18-3 1z",
+    labelX: 351, labelY: 521,
+  },
+  {
+    name: "Maharashtra",
+    path: "M427 620l-8 9 5 15-3 2 5 1 0 10-8 3 0 4 5 2-1 5-4 0 3 3-3 2 4-1 5 8 8 5-4 2 2 2-3 3-5-1-1-3-6 5-4 10 2 5-2 4-6 2-7-6 1-7-2-3 4-10-7-8-11 4-8-4-1 6-8-4 0-3-3-1-1-3-12-2-6-4 0 16-4 3-1 5-11-2 0 8-3 2 6 8-7 5 0 4-5 0-1 10-7-1 2-3-3-2-7 11-6-2-1 10-6 1 2 2-4 6-5-3-7 6 2 10-15-1-2-3-3 2-6-4-2 3 4 15-14 1-1 4-5-4-5 0-1 6-8 2-2 5-5-3-3 5-4-1 2 10 6 3-1 3-4 1 4 1-4 10-5-1-3 5-4 1-5-6-6 2-6-7-7-22-2-27-11-35 5 2-6-5-1-15 3 0-2-4 4-3-2-3-5 3-1-19-4-12 2-11 8-3 3 5 6-1 0-1 7-2 1-19 10 5 7-6-2-9-10-7 8 0 8-11 9-1-1-2-15 2-3-5 4-1-3-6 12-5 5 1 4-3 6 13 10 1 11 8 30 2 1 7 5 4 12-5 6-14 16-6 10 2 2 6-7 0 3 6 15-1 15-8 2 4 17 1-1-4 12-5 8 2 2 4 6-2 6 3 12-3 5 8z",
+    labelX: 294, labelY: 711,
+  },
+  {
+    name: "Manipur",
+    path: "M906 467l-3 9 5 3-1 7-13 23-6 18-14-6-8 2-3-4-3 1-12-3 0-11 4-15 3 0 10-19 4 4 7-10-1-2 8-3 10 4 9-7 0 7z",
+    labelX: 878, labelY: 492,
+  },
+  {
+    name: "Meghalaya",
+    path: "M829 483l-13-6-14 2-13-3-28 3-21-6 1-7 1-2 0-1 4-1-4-6 8-8 12-2 2 4 12-2 4 5 7-1 1 5 8-6 4-6 3 5 5-8 4 4 13-3-5 5 2 2-2 9 8-3 6 7 3-1-3 4 7 5 1 5z",
+    labelX: 791, labelY: 462,
+  },
+  {
+    name: "Mizoram",
+    path: "M848 506l0 11 12 3 4 13-2 21-3 4-6-1-1 13 4 16-6 3-1 7-3 1-8-7-3 6-12-64 1-20 8 3 8-13 3 5z",
+    labelX: 843, labelY: 549,
+  },
+  {
+    name: "Nagaland",
+    path: "M925 420l-6 8 4 15-5 6 0 6-5 8-7 4-4-2 0-7-9 7-10-4-8 3 1 2-7 10-4-4-5-9 12-13 3-2 1 5 6-4 1-10 9-14 1 4 6-8 24-15z",
+    labelX: 892, labelY: 441,
+  },
+  {
+    name: "Odisha",
+    path: "M566 702l1 1z m68-114l0 2 10 4 1 7 7-4 0 6 7 1 1 6-13 4-7 7-2 6 4 12-5 2 0 4 7-1-8 5 0 8-10 6-3 7-5-3 4 4-32 12-24 19-2-3-3 2 2 2-8 2-3 8-8 1-7-2-3-7-2 3-4-8-3 5-2-2-1 4-5-2 4 6-10 2-4 5 2 10-5 0-4-3-6 8-5-11-4 4-1 13-3 3-7-3-9 6-13 3 5-16 7-3 7-8-2-3 6-3 6-7-2-18-5-3 1-10-7-4 0-5 3-3 10 4 3 6 4-3 5 2 0 3 4-2 0-6-11-2-1-30 3 2 6-12 19 0 3-8 5 1-2-5 8-14-1-9 3-5 12-5 0-6 10 7 27-5 1 6-4 8 8 4 6-6 9 4 5-2-2 4 5 1 4-8-2-10 3-4z",
+    labelX: 556, labelY: 661,
+  },
+  {
+    name: "Puducherry",
+    path: "M399 989l0 6-5-5z m0-34l-1 5-5-2 2-1-3-3z m-155-3l0 3-2-3-1-1 0-1 6-2z m239-164l-1 0z m0-1l-1 1-3-1z",
+    labelX: 362, labelY: 890,
+  },
+  {
+    name: "Punjab",
+    path: "M294 255l2 6-5 0 2 3 2 1 1-1 3 4 1 8-7-1-6 6 3 2-2 5-5-1-1-3-3 3-4-2-1 9 2 3-7 4-9-3-7 3-4-2-7 10-3-5 2-6-4 1-1-4-3 2-6-5-6 3-4-1-21-1 2-9-3-7 2-4 21-24 5-1-6-2 5-13-5-10 2-4 12-10 11-1 4-6-1-4 6 2 13-12-1 1 3 6-11 7 1 4-3 2 11 6 10 26 4-1 2-5 10 9-1 9z",
+    labelX: 247, labelY: 249,
+  },
+  {
+    name: "Rajasthan",
+    path: "M217 294l-2 6 5 1-2 13 2 4 9-3 7 7 11-2-1 5 5 5 2 16 18 17-5 3 3 1-4 5 2 3 7 2 0-10 6 0-3-4 7 1 3 7 10-10 4 3-2 19 6-3-2-4 8 1 3 11 9 7 2 5-5 5 7 2-11 6 1 5 2-4 9-4 9 3 3-3 5 1-2 3-4 6-6 1-35 22-14 14 7 14 9 2 14-5 1 11-17 4 2 6-5 2 9 6-2 7-6-3 3 16-7-2 0-4-6 4-10-2-2-4-2 9-5 3 0 3-7 3-2-2-1 5-3-1-5-5 2-4 7 3 4-4-3-3 2-6-2-4 6-2-3-10-21 0 0-6 3 3 4-2-5-1 3-6-7 0-4 7-7-4 1 6 5 2-4 4-3-5-3 10 5 3-4 6 5 1 3 8-3 6 2 9-14 10 0 3 7 3-14 5-13-11-2 1-2-4-7 0 1-6-5 0-5-7 0-12-4 4-6-6 5-7-5-1 1-4-6 6-13-6-3 3-1-3-6-3 3-2-6 0-4-3-7 3-11-2-8 3-6-3-7-17-8-10 0-11-13 0-6-9 2-24-12-1-11-6 2-15 27-34 7 0 7 11 4 1 35-10 16-31 20-11 11-20 4-15 19-10-2 9z",
+    labelX: 195, labelY: 420,
+  },
+  {
+    name: "Sikkim",
+    path: "M703 402l-7-1-4 4-10-1-4-4 6-22-2-7 9-1 8-6 9 10-4 12 5 9z",
+    labelX: 694, labelY: 385,
+  },
+  {
+    name: "Tamil Nadu",
+    path: "M377 1048l4-2 3 5z m38-145l-5 34-11 18-7-1 3 3-2 1 5 2 1 29-5 1 5 5 2 17-12-1-9 3-1 7-11 16 0 6 8 5-17 3-15 7-6 21-17 10-9-1-7-6 6-8-4-7 3-5-3-5 9-17-9-3 4-13-3-4 4-4-2-5-9 4-5-2-1-12 4-5-9-5 4-4-1-6-10 1 3-6-10-4 0-3 6-4 14 3 3-7 17 1 3-6 6-1 3-5-10-4 5-5-1-11 5 0 2-6 4-1 11 4-1 3 9 2 8-16 16 2 2-4 8-3-1-4 11 5-1-3 7-2 3-7 10 5z",
+    labelX: 346, labelY: 994,
+  },
+  {
+    name: "Tripura",
+    path: "M822 503l0 9 2 0-1 20-6 3-4-3 0 8-6 7 0 10-8 3-4-11-2 7-7-21 2-11 5-2 0-5 7 2 2-6 4 3-1-4 6 4 1-7 6-2 2-5z",
+    labelX: 806, labelY: 531,
+  },
+  {
+    name: "Uttar Pradesh",
+    path: "M407 337l15 10 2-4 22 13 4 8 4-1 15 12 6-3 13 10 9-2 1 9 15 2 4 4 3-5 16 5 7 17 6 1 0 5 6 4-11 0-1 3-5 1 0 3 9 3-5 9 5 5 12 5 3 5-3 2-6-2-2 3-7-2-10 12-15 7-1 7 6 13 0 6-4 1 2 5-4 10-7 8-6 0-5-3-5-7 3-1 1-18-12-2 0 4-4 0-3-7-9-2-2-5-9-3-2-5-3 4-7-3-5 10-11-2 2-9-5 2 2 3-6-4 0 3-11 2 5-6-6-9-14 7 1 5-10-3-3 4-3-2 2-5-6-3 1 8-6 1-2-3-2 2 0-5-5 4 3-7-4 4-2-2 3-4 3 1-3-7-1 4-4-2 1 5-3-3-8 6 5 1 2 11 5 6-1 8 4-1 3 10-5 7-10-8-5 4-5-9 1-6-3-7 9-11-5-8 5-7 13-3-2-4 4-2 9-25-5-4 0-5-6-3-21-3 2-3-5-1-3 3-9-3-9 4-2 4-1-5 11-6-7-2 5-5-2-5-9-7-3-11 9-6-2-5 2-6-6-10 0-1-1-7-4-6-1 0-2-36 16-24-1-1 13 7-8 15 3 7 5-1 1 6 13-10 2 1 6 8 11 5-5 6 8 7 5 0 1 4 7 2 1 4 13-1 0 3 3-1 3 5z",
+    labelX: 434, labelY: 401,
+  },
+  {
+    name: "Uttarakhand",
+    path: "M407 337l-4 5-3-5-3 1 0-3-13 1-1-4-7-2-1-4-5 0-8-7 5-6-11-5-6-8-2-1-13 10-1-6-5 1-3-7 8-15-13-7 9-5-4-9 7-16 15-5 4 4 11 0 3 4 4-1-3-6 5-8 12 17 6 4 10-1 12 8 0 7 27 13-22 21 2 4-6 9 2 8-6 4z",
+    labelX: 380, labelY: 287,
+  },
+  {
+    name: "West Bengal",
+    path: "M690 605l1-1z m-11 3l3-8 1 8z m29-19l3 1-2 5 3 4-3-1z m-9 3l2-4 4 1-4 3 1 3z m7-5l1-5 3 5-2 3z m4-1l1-5 3 10z m-2-11l4 3-2 6z m-5-173l4 2 0 6 6 0 3 5 9-2 9 3-1 2 8 1 0 13-5 3 0 5-2-3 0 7-3 3-7-1-7-5-2-10-4-2-2 3 5 4-7 1-16-15-2 6 5 1 2 3-12 9-3 8 2 6 4-2 13 13 5-2 1 6 6 3-3 5-16-1-2 9-2 3-7-2-4 9 11 11 14 4-2 7 3 4-7 5 0 8 8 5-3 9 9 2-4 5 3 17-3 7-2-2-4-2 6 4-2 6-1 0-5 4-2 9-5 0-1 4-3-1-1 0 0 1 0 2-4-5 2-10-5-2 1-4-4 3-2-6 1 5 8 6-4 3-2-2-1 8-6 6-11 3-1-6-7-1 0-6-7 4-1-7-10-4 0-2 6-3-5-5 1-4-12-9 0-6 4-2-11 0-6-6-5 1-2-2 1-10 6-1 0-4 9 6 5-8 11-2 4-7 12 2 0-8 7 2 1-5 7-1-2-2 6-7 0-7 4-1-4-6 6-5-7-8 0-4 3-3-3-6 5-3 5 1-1-7-8-8 1-5 16-12-4-6 2-2-5 1 3-9-7-13 1-4 4 4 10 1 4-4z",
+    labelX: 673, labelY: 506,
+  },
+  {
+    name: "Lakshadweep",
+    path: "M168 1081l0 1-1 1 0-1 1 0z",
+    labelX: 162, labelY: 1023,
+  },
+  {
+    name: "Jammu & Kashmir",
+    path: "M204 84l12 2 5-4 6 5 0 5 9 4 1-3 5 5-1 6 7 7-1 8 7 3 3-1 6 10 6-1 8 10-1 9 3-3 4 2 11 13-1 3-11 0-15 12-5-2 3 7-2 8-11 11-7-2-8-5-14-1 1-14-4 4-8-1-25-14-1-32-7-21 2-8 7 1 2-9 11-5z",
+    labelX: 237, labelY: 141,
+  },
+  {
+    name: "Ladakh",
+    path: "M204 84l-14-4 2-13-16-4-6-4-1-7-17 0-3-2 1-12 15-11 3-9 12-3 16 2-7-9 12 5 13-8 5 1 4-5 8 7 15-6 4 11 9 9 31 17 6 7-3 3 2 4 19 6 5 8-6 0 2 2 20 0 0-5 6 2 5-8 13-5 16 1 3-7 17 8 10-1 3 6 6 3 2 6-9 32-10 4 1 5-10 1 2 9-5 9-9-2-9 4 7 15-6-1 1 11 5 3 12 2-4 10 10 11-6 8-5-2-11 10-6-4-2-10-12 6-4 1 4-4-1-6-5 4-2-1-6 4-3-8-1-1-2-1-5-6-8 4-1 0-2 3-1-2-2 0-11-7-2-3-2-6 0 1 0-1-2 0-11-13-4-2-3 3 1-9-8-10-6 1-6-10-3 1-7-3 1-8-7-7 1-6-5-5-1 3-9-4 0-5-6-5-5 4z",
+    labelX: 283, labelY: 99,
+  },
+];
+
+export default indiaMapPaths;
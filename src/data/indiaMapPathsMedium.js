@@ -0,0 +1,189 @@
+// India state and UT paths, simplified (medium level of detail)
+// Generated by scripts/simplify_map_paths.py from indiaMapPaths.js; see it for the method
+// viewBox: 0 0 1000 1136, integer coordinates, tolerance 0.8
+// 130 rings, 6498 points (source: 221 rings, 26551 points)
+
+const indiaMapPaths = [
+  {
+    name: "Andaman & Nicobar Islands",
+    path: "M871 1122l1-2 5-2 1 1 2 9-1 5-1 0-1 2-3-7-3-2z m-1-6l0-2 3-1 0-2 1 3-1 2-2 2z m-11-23l1-1 2 0 0 1 2 1 0 2-1-1-2 1z m7 0l2-2 0 3z m-2-7l3-2-1 3 1 3-1 2-1-1 1-2-1 1z m-13-5l2-1 0 2 2 3-2-1z m-12-31l2-1 1 1 0 3-3 0z m-12-54l4-4 2 1 2 6-2 3 1 1-2 2-5-1 2-2-2-2z m7-21l2-1 0-4 2 5z m-13-6l1-1 1 0 0 2z m25-16l3-1 1 5z m1-3l2 0-1 2z m0-2l2 0 1 4z m3 1l1-3 0 4z m-18 10l2-4 1 3 1-8 2-5 1 2 1 0-1 3 2 2-1 0-1 5 1-1 1 0-1 7-3 2 1 1 2-1-2 6-3-4 0-3-1-1-1 1 0-5z m7-14l1 0 0 2-1 0z m0 5l1-6 1-2 3 1 0 4-1-1-2 4z m37-7l1-1 1 3-1 0z m-33-21l0 1 2-2 1 1 0 4 2 2 0 6-2 5-3-1 1 4-5 1-1-11 2-2-1-6 2-2z m-7 1l2-4 1 3-2 4z m7 0l0-1-2-1 1-3-1 0 1-4 1-1-1 0 1-4-1 0 1-5 3-3 0-1 2 0 1-2 1 6 1 2-4 0 3 3-1 7-2 2-1-2-1 2 1 1-2 0 0 3z",
+    labelX: 857, labelY: 993,
+  },
+  {
+    name: "Telangana",
+    path: "M319 815l0-11 3-3-2-2-4 1-4-2-1-2 5-2-1-2 3 0 0-2-2-1 2-1 0-1-2 0 2-3 0-4 1-3-1-4-4-2 1-2 3-2-1-3 3 0-1-2 6-2 1-1-4-2-2-1-1 2-2-2 1-4 3-2-2-2 5-6-3-3 2-1-2-4 2-3-2 0-1-3 1-2-1 0 2-1 0-4 5 0 0-4 2-1 2-4 3 0-6-8 1-2 2 0 0-4 2-2-2-2 3-1 4 3 4 0 1-5 4-3 0-5-2-2 3-2 1-2-3-3 1-2 6 4 4-1 4 2 4 1 1 3 3 1 0 3 5 1 3 3 1-3 0-3 8 4 3-2 2 2 1-3 5-1 7 8-2 6 1 2-3 2 0 3 2 0 0 6-1 1 7 6 6-2 2 5 5-1 5 3 5 10-1 1 0 2 2 0 1-2 1 0 0 3 4-1-1 3 3 11 4-3 8 2 7 0 2-2 4-1 0 2-7 4-2 5 1 0-2 5-2 3-3-1-2 2-4 1 0 3-6 1-3 0 1 2-2 0-1 4-4-1-2 0-1-2-2-1-4 4-2-2-1 1 1 1-1 2 4 2 2-1 1 1-1 3 2 2-1 0-4-1-2-2-1 2-4-7-2-2-6 5-1 2 3 2-4 6-6-3-12 5-6 1-1 2-1 9-6 0-2 1-2 1 0 3-2-2 0 2-2 3-6-3-2 2-5-1-5 2-1 3-4 4-2-3-2 2-4-2-3 1z",
+    labelX: 388, labelY: 745,
+  },
+  {
+    name: "Andhra Pradesh",
+    path: "M482 788l1 0 1-1 0 4-2-2z m1-1l-4 0 3 1 1 4-12 6-8 3-6-1-9 2-2 3-2 8-5 6 0 2-3 2-3 0-1-4-4-2-8 2-6 5-3 7-3 6-2 8 2 11 3 6-2 18 4 10 0 7 2 6-5-9-1 3-1-2-2 3 2 2 7 3 0 2-3-4-7-1 1 1-3 2-1 4-5 1-1 0-1 1 2 1-1 2-2-1-1-3-3 2-1-3-4 0-2 1 2 0-1 3 2 0-4 2 0 1-4 0-2 4-3 0-3-2-3 0-1 2 0-2-6 0 0 2-2 0-1 1 1 2-3 8-1 1-1-2-1 4-3 0-4-3-2 1 1-3 0-3 3 0 1-3 4 2-1-4 1 1 0-3 1 0 1-3 2-1 0-4-6-1-2-2 2-8-6 0-1 1-1-3-3 0 1-8-2-1-1 1-1 0-2 1 1-4-2 2-1-1-2 0 0 2-4 3 0 1-1-1-2 1 0 1-3-1 0 2-2 0-1 1 1-3-1-2-1 0 1-1-6 0-1-2-2 1 0-2-2 3 2 3-4 0-1-1-1 1-1-2 2-4-3-4 1-2-3-1 0-1 2-1 3 0 0 4 3 1 1 2 6-2 1 2 0 3 2 0 1-3-4-2 3-2-2-1 1-2 4 1 0-4-3-2-1 1 1 3-1 0-1-2-2 0 0-2-5-1-2 5-1-1-4 0 0-3-2-1 3-5-4 1-3-5 1-6 1 0 1-6 0-1-3 0 0-3 1-1 3 2 6 0 1 1 3-6-2-2 2-1-1-1-1-2-2 1-3-6 2-1 0-4 2-1 1 1 0-1-2-3 0-3-1 0 0-1 5-4 11 1 10 2 3-1 4 2 2-2 2 3 4-4 1-3 5-2 5 1 2-2 6 3 2-3 0-2 2 2 0-3 2-1 2-1 6 0 1-9 1-2 6-1 12-5 6 3 4-6-3-2 1-2 6-5 2 2 4 7 1-2 2 2 4 1 1 0-2-2 1-3-1-1-2 1-4-2 1-2-1-1 1-1 2 2 4-4 2 1 1 2 2 0 4 1 1-4 2 0-1-2 3 0 6-1 0-3 4-1 2-2 3 1 2-3 2-5-1 0 2-5 7-4 0-2 9-6 4 1 3 2 1-3 2 0 0-3 1 0-2-2 3-4-1 0 1-2-1-2 4-4 3 3-1 2 2 1 0 4 1 1 1-2 4-2 1-4 3 1 1 2 5 0-2-3 3-3-2-1-1-3 4-5 5 1 0-1 5-2 0-1-2-2 0-1-2-2 4 0 1 2 1-2 0-2 1 0 0 2 1 0 3-5 4 8 1 0-1-2 2-1 3 7 4 0 3 2 8-1 0-3 1 0 3-2-1-3 2 1 3-3 1 2 2-2-2-2 3 0 0-2 1 1 1 2 1 1-22 27-19 11-12 15-20 10-10 8-3 5 1 2 3 1-1 4z",
+    labelX: 430, labelY: 816,
+  },
+  {
+    name: "Arunachal Pradesh",
+    path: "M925 420l-1-2 1-2-2-3 2-2-2-5 2 1 7-4 0-3 3-2 2 1 9-2 1 1 4-4-1-3-4 0 1-4-3-2-1-5 7-9-13 0-3 3-4 2-2-2-16 6-1 1-11 5-8-1-1-1-1 1 1 3-3 2-7 7-5 5 1 3-6 4-22 2-5-3-7-1-1 1-2 1-16 3 0-3-3-4 0-3 2-3-1-1 2-1-2-2-1-5-8 0-3-1-2 0-3-3 0-2 3-5 0-2-3 0 1-2 8 2 1 3 2 0 3-2 2 1 5-4 2 0 2 3 6-2 2 0 7-6-3-3 1-3 4-2 0 1 3-1 2-3 1 2 1-3 7-2 0-2-1-2 3-2 2-5 4-2 1 1 0-1 4 1 4-1 2 1 2-2 3 1 3-4-1-2 6-5 2-5 7-5 5 0 2-5 5 4 1 3 2-1 5 2 0-1 4 2 4 0 1 2 6 1 2-4 1 1 0-4 2 0 0-2 3 0 3-3 1 0 3-2 2 1 5-4 5 9 2 0 2-2 1 2-1 3-3 0-5 3 2 4-1 2 1 1 6-5 6-1-2 3 2 1 3 8-1 1-4 2 1 2-3 3-2 0-1 1 1 2-3 3 4 0 0 2 2-3 8-2 3 2 0 2 5 0 3 2 3-2 3 3 4 1 4 3-3 1 0 3 3 3-1 1 0 3-2 1 0-2-2 1-6 4 0 2-2 1-5 4 2 4-1 2 9 13-1 1-3 0-7-4 1-2-3-4-3-1-3 1-3 3-8-1-9 4-3 5-4 2-3 5-1 0-1-1-2 4-3-1-4 6-4 1z",
+    labelX: 899, labelY: 367,
+  },
+  {
+    name: "Assam",
+    path: "M742 464l-1 2 0-2z m181-58l-6 5-4 0-3 4-4 3-3 0 0 1-4 2-2 2-1 3-3 3-1-4-3 4-1 4-2 1-3 5-2 7 1 3-6 4-1-5-3 2 1 2-13 11 2 3 2 1 1 5-3 2-2 6-3 3 0 4-2 4-3 0-1 8 1 1-2 1 0 5-2 0-3 0-2 1-3-5-2 6-2 1-1 3-2 0-1 3-3 1 0-4-5 0-2 0 2-5-2-4 2-9-1-7 5 2 3 0 0-3-2-1 0-2 2-3 1 0 0-1 3 1 2-3 5-1-2-1 1-4-7-5 3-4-3 1-1-2-4-3-1-2-6 1-2 2-1-6 3-3-2-1 0-1 5-5-11 2-2 1-2-1 0-3-2 0-3 2 0 4-2 2-2-2 1-3-2 0-4 6-5 2-3 4-2-2 1-3-7 1 1-2-5-3-3 0 0 2-3-2-3 1-1-1-2 2 0-2-2-2-1 1-3-1-2 2-6 0-6 5 0 2-2 1 4 6-4 1 0-3-2-7 2-5-2 0 2-1-6-7 0-5 2 0 1-2 2-1 0-13 0-1 7 0 4-1 2-4 3 1 3-2 5 4 5 1 12-1 1-1 9 1 2-2 3 2 6-1 4-1 2-3 7 3 2-2 16-3 2-1 1-1 7 1 5 3 22-2 6-4-1-3 5-5 7-7 3-2-1-3 1-1 1 1 8 1 11-5 1-1 16-6 2 2 4-2 3-3 13 0-7 9 1 5 3 2-1 4 4 0 1 3-4 4-1-1-9 2-2-1-3 2 0 3-7 4z",
+    labelX: 843, labelY: 443,
+  },
+  {
+    name: "Bihar",
+    path: "M681 426l1 1 4-2-2 2 2 3 0 1 2 2-8 6-4 1 1 3-3 0-2 2-1 5 4 2-1 2 5 4 0 5 1 2-1 1-4-2-2 2-3 1 0 4 3 2-1 3-2 0 0-1-2-1-1-2-4-1-2 2-1 0 0 4-5-1-2 5-2 0-3 3 1 4-3 3-1 8-4-1-1 3-3-1-1-2-4 3-2-2-3 3-2 6-5-4 0-4-6-1 0-4-3-3-3 2-3-3-5 0-1 3-2 2 1 4-3-1-2 3-8 0-5 2 1 1-3 2 0-2-6 3-1-4-2 0 0-2-1 0-4 2 0 3-3-1-2 1-1 4-7-6 1-2-1-3-4 1 0 1-1-1-1 2-2-4-2-1-2 3-2 1-6 1-7-1 1-4-1-2-1-2-3-2-2-9 1-7 12-7 3 0 4-6 6-3 0-3 2 0 2 2 3 0 2-3 2 2 1-1 3 1 1 0 0-2 2 0 0-1 0-1-3-2 0-1-12-5-5-5 0-4 5-1 0-4-4-1-1-2-4 0 0-3 5-1 1-3 6 1 5-1 0-1-3-1-1-3-2 1 0-5-1 0-1 1-1-2-3 0-1-6-1-1 1-1-3 1 1-5-2-2 0-3-3 0 1 0 2-1-1-2 6-1 2-3 3 3 2 0 1 2 11 2 3 4-2 7 11 4 0 1 3 1 0 2 5-1 1 4 4 1 10-5 3 2 1 7 3 1 1 1 5-3 6 3 5-1 13 7 2-1 3 0 7-5 1 5 2 2 3-1 1 2 2 1 1-2 4-2 4 2 3-1 2 1 2-3 2 2 1-2 4 4 3-3z",
+    labelX: 603, labelY: 449,
+  },
+  {
+    name: "Chandigarh",
+    path: "M296 264l-1 1-2-1-2-3 3-1 2 1z",
+    labelX: 294, labelY: 262,
+  },
+  {
+    name: "Chhattisgarh",
+    path: "M541 576l-1 1 2 3-1 2-5 1-4 4-3 0-3 5 1 1-2 1 0 1 0 2 2 2 0 2-2 1 0 1-1 0-1 2-2 3 2 1 0 1-1-1-2 1-1 5 2 5-5-1 0 4-1 0-2 4-2 2-6-3-11 1 0 4-5 5-1 3-3-2 0 9-1 3 3 4-1 4 1 2-1 5 0 3 11 2 0 6-4 2 0-3-5-2-4 3-3-6-2 1-4-3-2 1-2-3-3 3 0 5 3 1 1 2 3 1-1 10 2 0 1 3 2 0-1 2 1 1-1 4 3 11-2 1-1 4-2 1-1 1-3 1-1 2-2 0 2 3-2 0-4 5-1 3-3 0-4 3-2 10-1 4-2-1 0 3-8-2-4 3-3-11 1-3-4 1 0-3-1 0-1 2-2 0 0-2 1-1-5-10-5-3-5 1-2-5-1-1 3-3-3-4 1-1 4-10 6-5 1 3 2-1 1 2 2 0 3-3-2-2 4-2-2-3-6-2 0-3-4-3-1-2-2 1 1 1-3-1 3-2-3-3 4 0 1-5-1-2-4 0 1-2-1-2 8-3-2-2 2-8-4 1-1-2 3-2-1-8 0-1-3 0-1-3 0-3 1-3 6-3 1-2 0-1 2-5 0-9 1-1 2 0 1-7 2-6 2 0 0 2 2-1-1-2 1 0 0-4 3 0 1-2-1-6 2-1 2 1 2-2 1 1 1-2 3 3 3-3 3 0 3-4 1-1 1 1 1-1 0-8 6-3 0-4 6-1 1-2 0-3 1-3-2-1-1-2-2 0-2-1-2-4-3 1-3-2-4 2-1 0-1-3 4-5-3-5 0-2 2-1 2 3 3 2 4-3 4 2 6-1 1 2 8 0 1 1 1-2 3 0 1-3 5-2 5 3 6 0 2-2 5-6 3 0 3 3 2 5 5 2 1 3-1 2 2 3 6 2 0-2 2 0 1 3-2 6 3 0 0 1-1 8 3 2 1 4 1-2 1 2 6 0 0 1 0 2-5 6-1 2-4 1-3 3z",
+    labelX: 483, labelY: 633,
+  },
+  {
+    name: "Dadra & Nagar Haveli and Daman & Diu",
+    path: "M173 664l0 1-1 2-4-2-1 1-1-2-1 0-1-3-1-2 2 0 1-2 1 1 2-2 0 2 3 0-4 3 0 2 2 0 2-2 1 1z m-12-12l-1 2 1 1-1-1-1 1z m-65-10l1 1-4 0z m-4-1l0 1 1 1-5 0-2-2 2-8 5 1 1 3-2 1 2 1z",
+    labelX: 130, labelY: 650,
+  },
+  {
+    name: "NCT of Delhi",
+    path: "M314 349l-1 1-3 1 0 2-2 1-3-5-1 1-2-2 0 2-1-1-1 1-2 0-2-3 4-4 0-4 0-1 1-1 2 0 1-1 4 0 1 0 0 3 4 3 1 3-2 2z",
+    labelX: 305, labelY: 345,
+  },
+  {
+    name: "Goa",
+    path: "M204 825l4 0 1 4-1 2 3 7-2 1 2 2-2 8-6 2-2 0 0-3-4-3 1-2-2-7-4-3 4 0-4-2-2-4 1-1-2-4 5 0 1-2 0 1 3 1 2 4z",
+    labelX: 200, labelY: 836,
+  },
+  {
+    name: "Gujarat",
+    path: "M93 643l-1-1 0-1z m-34-66l1-2 1 2z m-46-29l1-1 2 2-2 0z m-12-12l3-1 3-6 2 0-2 8-2 0z m4-8l1 3-2 2z m5 3l0-2 2-1 0 3z m-2-5l2 2-2 1-2-1 1-1z m2 0l-2 0-1 1 0-2 2-1 1 0z m3-2l1 0 1 0-2 2-2 0z m-3 2l0-2-1 0 2-2 1 2-2 3z m-5 2l-2 5-2-1 1-2 0-2 2-4 2 1 1-3 1 1 1-1 0 2-2 1-1 3z m206 28l2 6 2 0 1 2-3 8-4 0-4 5-4-1 2 4 4-2 2 3-3 3-2-1-1-1-1 0 0 6 2 0 0 4 1 0-2 3 2 1 0 1-12 5 3 6-4 1 3 5 5-2 6 0 1 1 3-1 1 2-7 2-2-1-1 2-3 1 0 4-4 1 0 3-7 2-1-2 1 2 4 1 0 2 2 2 3 0 2 9-4 2 0 2-3 2-3 0-1-2-3-2-2 1 0-2-1 0-2 2 4 4-4 6 1 4 0 3-4-1-2 3-1 0 0-2-1-1-2 2-2 0 0-2 4-3-3 0 0-2-2 2-1-1-1 2-2 0 1 2-3 0-3 3-2 0 1-6 2-3 1-1 1 1-1-1 1-2 1-4-1-6-5-9 1-3-2 0 1-3-2 0 0 3-1-1-2-7 3-9-1 1-1-3 3-2 4-1-3-1-6 1-1-1 2-5-2-1-1-3 2-8 2-2 5 1 2-2 2 0 1 0-1 0-1-2-3 2-2 0-2-2-6 3 1-1-3-3 0-1-1 1 1 1 1 2-1 1-1-1 1 3-1-1-2 2-1 6-1-3 2-1 0-1-3 4 1 4 0 5 2 4-3 7-5 7 1 2-3 2 0-1-9 6-8 2-3 3-10 4-6 1-3 1-1-2 2-2-2-1 2-1-1-3-5-1-2 8-7-3-13-9-13-16 2-2-1-2-1 0 0 4-17-16-8-9-1-4 2-5 3-1-2 2 1 1 4-1-1 4 3 2 3-2 6-1 1-3 3 3 3-2-1-2 2 0 2 2 6-5 7-1 11-19-3 2-1 3-1 0-4-1-4 2-11 2-3 4-5-1-3 0-5-2-4 0-15-9-6-5 2-3-2-3-4-5 0-5 9-8-5 0-2 4 0-3 3-3-1-1-1 0-1 0 0-1 7 0 1-12 2-1 2 4 2-3 1 2 4-2 4 2 3-2 10 0 5 4 8 0 3 0 2-4 16-5 1 0-1 6 8 1 3-1-1-1 3-2 3 0 2-2 0-2-4 0 0-4 1-3 3-2 6 3 2-2 1 1 5-2 5 2 4-2 2 2 1-2 2 1 0 1 4-3 4 3 6 0-3 2 1 1 3 0 0 2 2 0 1 3 2 0 1-3 5 1 1 4 5 0 2 1 2-2-1 0 2-4 1 1 2-1-1 4 3 1 2 0-2 2-1 0-2 5 5 3-1 2 2 1 3-2 0-2 1 0 2 5-2 7 5 3 0 4 2-2 3 2-1 6 2 0 1 1 2-1 2 0 2 4 2-1 3 3 3 1 0 3 2 1 1-1 1 0z",
+    labelX: 108, labelY: 580,
+  },
+  {
+    name: "Haryana",
+    path: "M322 276l0 3-6 6 0 2-5 2-5 11 1 3-2 7 2 8-1 9 3 3-1 6-4 0-1 1-2 0-1 1 0 1 0 4-4 4 2 3 2 0 1-1 1 1 0-2 2 2 1-1 3 5 2-1 0-2 3-1 1 0 4 3 1 5-1 1 2 1 0 3-2 3 2 5-9 6-1 1-2-1-3 1-2-2 0 2 2 2-3-1-1 4-2 0-1-5 3-14-4-3-7 5 0 3-3 2-1-3-3 0 2-1-2-1 2-1-1-1-3 0-4-1 3 2-2 0 2 2-1 2-2-2-3 0 1 1-2 2 2 5-1 2-3-2-4 0 0-2-2-1 2 0 0-2-1-1 3-2-3-1 3-3 2 0-6-8-5-1 0-2-5-4 0-2-2 0-3-12 1-4-2 0-3-5 1-2 0-3-3 1 1-2-4 2-1-1-4 2-1-3-3 1-1-4-2-1-3 2-4-1-1 2-1 0-2-4 0-2 1 1 1-3-1-2 1-7-4 0-1-1 3-3-1-2 0-1 4 1 2-2 4-1 4 2 2 3 3-1 0-1 1 4 1 1 3-2 1 3-3 3 3 5 2 0 1-5 4-5 4 2 2-1 3 1 0-2 2-1 4 3 5 0 2-2 1 0 4-2-2-3 1 0 0-4 2-3-2-1 0-1 4 2 2-1 0-2 1 0 1 3 5 1 2-5-2-2-1 1 0-1 5-2 1-2-1-1 1-1 3-1 2 3 2-1-2-2 1-6-3-4 0-3 1-1-3-5 2 0 1 2 2-1 1 3 2 0 0 3 3 0 2 2 0 4-1 1 2 2 1 1 5 1 2 2 1-2 0 2 2-1z",
+    labelX: 269, labelY: 319,
+  },
+  {
+    name: "Himachal Pradesh",
+    path: "M367 241l3 6-4 1-3-4-5 0-1-2-5 2-4-4-12 5-3 0-3 5-1 3-2 0 0 2 2 0 0 2-2-1-1 5 2 5-1 1 3 3-9 5 1 1-3-2-2 1 0-2-1 2-2-2-5-1-1-1-2-2 1-1 0-4-2-2-3 0 0-3-2 0-1-3-2 1-1-2-2 0-5-3 0-5-1 0 0-3 2-1-2 0 0-1-1-1 0 1-4-2-3-6-2 5-4 1-2-4 1 0-8-17 1-1-2-4-8-5-3-1 3-2-1-4 4-1 7-6-3-3 0-3 1-1 1-2 0-5-4-5 0-2 5 2 5-5 5-1 1-3 4-3 6-1 3 2 3-1 1-3 2 0 0 1-1 3 3 2 1 3 3 2 5 0 0 3 4 2 3 2 1-3 2 0 3 0 5-4 4 3-1 2 2 1 3 2 0 4 3 4 6-4 1 1 3-2 0-1 3-1 0 6-3 1 0 3 1 1 3-2 1 2 0 1 3 2-3 7 4 0 1 1 1 4 6 5-3 8 1 4 2 0 1 3-4 4 3 3 0 2 1 1 0 2z",
+    labelX: 312, labelY: 218,
+  },
+  {
+    name: "Jharkhand",
+    path: "M670 476l0 4 3 2 4 6-4 5-2 0 3 1 1 5-1 1-3 0 0 7-2 3-4 4 2 2-4-1 1 2-1 1-3-1 1 4-2 0 0 1-7-2 2 6-2-1 0 3-4-2 1 2-2 1-7-3-3 2-1 5-11 2-3 2-1 5-1 1-6-2 0-3-3-1-1 1 1 3-6 1 1 3-3 4 1 3 2 2 5-1 6 6 11 0-1 2-3 0 1 2-1 4 6 4 2 3 3 1 1 1 0 2-1 0 0 2 3 1 0 3 2 1 0 1-3 0-1 2-2 0-8-5-2 1-5-5-6-1-2-3-3 4 2 3-2 5 2 2-4 8-5-1 1-3 2 0-1-1-5 2-1-2-2 1-6-3-3 1-3 5-1-2-4-2-3 0 1 0 2-6 1-2-1-1 0-5-7 2 0-1-4 0-1 1-8 0-2 3-5 0-5-2 0-3-5-2 0-1 3-3 4-1 1-2 5-6 0-2 0-1-6 0-1-2-1 2-1-4-3-2 1-8 0-1-3 0 2-6-1-3-2 0 0 2-6-2-2-3 1-2-1-3-5-2-2-5-3-3-3 0 3-6-1-2 2-2-2-4 0-1 4-1 7 1 6-1 2-1 2-3 2 1 2 4 1-2 1 1 0-1 4-1 1 3-1 2 7 6 1-4 2-1 3 1 0-3 4-2 1 0 0 2 2 0 1 4 6-3 0 2 3-2-1-1 5-2 8 0 2-3 3 1-1-4 2-2 1-3 5 0 3 3 3-2 3 3 0 4 6 1 0 4 5 4 2-6 3-3 2 2 4-3 1 2 3 1 1-3 4 1 1-8 3-3-1-4 3-3 2 0 2-5 5 1 0-4 1 0 2-2 4 1 1 2 2 1z",
+    labelX: 597, labelY: 534,
+  },
+  {
+    name: "Karnataka",
+    path: "M321 731l2 0-2 3 2 4-2 1 3 3-5 6 2 2-3 2-1 4 2 2 1-2 2 1 4 2-1 1-6 2 1 2-3 0 1 3-3 2-1 2 4 2 1 4-1 3 0 4-2 3 2 0 0 1-2 1 2 1 0 2-3 0 1 2-5 2 1 2 4 2 4-1 2 2-3 3 0 11-11-1-5 4 0 1 1 0 0 3 2 3 0 1-1-1-2 1 0 4-2 1 3 6 2-1 1 2 1 1-2 1 2 2-3 6-1-1-6 0-3-2-1 1 0 3 3 0 0 1-1 6-1 0-1 6 3 5 4-1-3 5 2 1 0 3 4 0 1 1 2-5 5 1 0 2 2 0 1 2 1 0-1-3 1-1 3 2 0 4-4-1-1 2 2 1-3 2 4 2-1 3-2 0 0-3-1-2-6 2-1-2-3-1 0-4-3 0-2 1 0 1 3 1-1 2 3 4-2 4 1 2 1-1 1 1 4 0-2-3 2-3 0 2 2-1 1 2 6 0-1 1 1 0 1 2-1 3 1-1 2 0 0-2 3 1 0-1 2-1 1 1 0-1 4-3 0-2 2 0 1 1 2-2-1 4 2-1 1 0 1-1 2 1-1 8 3 0 1 3 1-1 6 0-2 8 2 2 6 1 0 4-2 1-1 3-1 0 0 3-1-1 1 4-4-2-1 3-3 0 0 3-4-1-3-2-1 2-1-2-1 1-1-2-4 1 0 3-2 3-5 0-1 4 2 2-1 1 1 0 0 4-2 2-3 1 0 2 9 1 1 3-3 5-6 1-3 6-6-2-5 3-2-3-2 2-2-1-3 5 0 2-9-1-2-3-3 1 0-3-3 1-2-3-2 0-1-2-2 1 0-5-4 2-4-1-3-4-5-1-6-7-2 0 0-2-2-2 0-1 2-1 0-1-3 1-2-3 2-1-1-1-1 0-1 2-1-3-2 1 0-2-2-1-2 1 0-2-2 0 1-2-5 1-6-21-3-18-3-4-5-18 1-2-1 0-2 1-2-8-2 0-3-2 1-1-1-3 6-2 2-8-2-2 2-1-3-7 1-2-1-4-4 0-1-1 1 0 0-2 3-2 3 2 2-1 1-3-1 0 1-1 3-6-4-1 2-1 2 0 1-3 0-1-3-2-3 0 0-3 1-2-2-3-1 1 0-3 4 1 0-2 3-1 0-2 1 1 1 0 1 3 2-1 2-1-1-1 1-3 8-2 0-3 2-2-1-1 5 0 2 2 3 2 1-2 0-2 7-2 1 2 2-1 0-1 3 2 1-1-1-3 1-2-2-2 1-4-3-4 2 0 0-3 2 2 4 2 1-2 1 1 1-1 2 3 2-1 3 1 1-1 1 2 1-2 2 0 1 1 3-1 0 2 1 0 1-2-2 0 1-3-2 0 0-1 2 0-2-4 6-3 1-3 1 0 0 2 2-2 2 3 1-4 3-2-2-1 0-1 2 1 4-2 0-4 2-2-2-1 1-3 6 2-1-2 4-3 1-5 3-1 3 2-2 3 3 0 1 2 2-2z",
+    labelX: 279, labelY: 846,
+  },
+  {
+    name: "Kerala",
+    path: "M282 965l1 1-2 2-5 1 0 3 6 1 1 2 3 1-1 3-2 1 0 2 6 0 3-2 1 1-2 2 2 1 1 3-3 1-1 3 6 2 3 3-2 4 1 1-3 0 1 2 0 10 5 2 7-4 2 0 2 5-1 3-3 1 3 4-2 3 1 3-3 7 4 1 1-1 4 3-5 7 0 6-4 4 3 5-1 3-2 2 4 7-2 1 0 2-2 2 0 2-2 1-4-3-15-19-7-18-3-18 2 2-1 2 1-1 3 2 0 6-1 4 5 0-3-1-1-10-1-2-1 1-2-7-2-2 1 6-17-48-2-3-2-1-3-8-8-9-1-2 1-1 0-2 3-2-6 2 0 1 1 1-1 1-1-1-11-25 5-1-1 2 2 0 0 2 2-1 2 1 0 2 2-1 1 3 1-2 1 0 1 1-2 1 2 3 3-1 0 1-2 1 0 1 2 2 0 2 2 0 6 7 5 1 3 4 4 1 4-2 0 5 2-1 1 2 2 0 2 3 3-1z",
+    labelX: 272, labelY: 1004,
+  },
+  {
+    name: "Madhya Pradesh",
+    path: "M500 523l-5 2-1 3-3 0-1 2-1-1-8 0-1-2-6 1-4-2-4 3-3-2-2-3-2 1 0 2 3 5-4 5 1 3 1 0 4-2 3 2 3-1 2 4 2 1 2 0 1 2 2 1-1 3 0 3-1 2-6 1 0 4-6 3 0 8-1 1-1-1-1 1-3 4-3 0-3 3-3-3-1 2-1-1-2 2-2-1-2 1 1 6-1 2-3 0 0 4-1 0 1 2-2 1 0-2-2 0-2 6-1 7-2 0-1 1 0 9-2 5-2 1-3-3-4 0-1-5-4-3-2-1-4 3-5 0-1 1-6-3-6 2-2-4-8-2-1 3-3-1-1 2-7 1 1 4-5 0-1-1-1 1-5 0-1-2-4 1 0-4-2 0 0 1-4 0-3 1 0 2-8 4-5-1-3 2-2-1-1 1-4 0-3-6 7 0-1-1-1-5-3-3-7 1 1 0-3 2-1-1-4 0-6 4-3 1-1 2 1 2-6 5 1 2-1 3-4 0-2 3-6 2-3-1-2-3 2 0-1-2-2-5-1 0-6-1-12 1-11-2-4-2-1-3-6-3-3 1-7-2-3-2 1-7-3-2-1-2-4 3-4 0-1-1 0-1-2-1 2-3-1 0 0-4-2 0 0-6 1 0 1 1 2 1 3-3-2-3-4 2-2-4 4 1 4-5 4 0 3-8-1-2-2 0-2-6 2-1 4 0 5-4 3 0-2-1 1 0 0-1-6-1 0-3 3-3 8-4 3-3-2-9 3-6-3-7 0-1-5-1 4-6-5-3 3-6-1 0 1-4 3 5 4-2 0-2-5-2-1-6 4 4 3 0 3-1 1-6 7 0-1 5-2-2 0 3 5 0 0 1-4 2-2-2 0-1-1 0 1 2-2 2 1 2 8 2 5-2 1 2 4-3 3 1 1 4 2 3 0 3-3 2-1-2-2 2 1 4 1 0-2 6 3 1 0 2-2 0 0 3-2 1-1-3-2 2-2 0-2-2-2 4 4 3 1 2 3 1 2-3-1-2 2 2 7-3 0-3 5-3 0-4 2-5 2 4 1 0 2-1 3 2 2-1 2 2 2 0 1-3 3-1-1 3 1 1 2 0 1 2 4 0 1-3-3-5 0-5-1-3 3 0 0 2 3 1 2-2 0-5-3-4-4 0-2-2 5-2-2-3 0-3 3-2 4 1 3-2 3-1 1 2 3-2 1-2-2-3 1-2-1-1 0-3-2 0-3 4-4-1-5 2-2-1-7-1-4-4-3-10 2-1 0-2 2-3 7-3 3-5 7-4 1-2 5-1 2-3 4-1 0-1 3-1 7-5 3 0 0-2 2 0 1-2 3-2 3 1 0-4 3 0 0-1 1-1 2 1 1-2 2 0 7 4 6-1 3 1 2 2 3 1 0 1 1-1 0 5 2 2 0 2 3 0-2 3 1 1 1 1-3 1 0 2-3 2 1 1-2 1 2 2-4 6-1 3 1 2-2-1 0 1-2 2 2 2 0 2-6 3-1-1-6 1 0 3-3 1-2 3 3 7 2 1-3 2-1 4-5 5 3 7 0 5-1 1 5 5-2 2 2 2 5-4 5 5 3 0 2 3 2-2 3-5 1-3-3-1 0-1 2 0-3-5-4 1 1-8-1-2-3-1-1-3 0-3-1-2-1-6-5-1 2-1 1 0 0-2 2 1 1-3 2-1 1 1-1 1 3 1 0-2 1 0-2-3 4 2-1-2 2-2 2 0-1 4 2 0 0 3-2 0 1-1-2 0-3 4 2 2 1-4 3 0 0 2-3 2 0 3 3-2 1 0-1-1 2-1 1 1-1 4 2-2 2 3 1 0 1-2 1 2 1-2 0 1 2 0-1-3 0-1 2 0 0-1-3-1 1-2 2 0 0 3 1-1 3 1-3 4 1 1 2 0 1 2 3-4 2 2 4 0 4 1-1-5 5-1 1-3 4 0 4-3 2 1 0 4 3 2 1 2-3 2-2 4 2 1 2-3 4 1 0-2 1 1 2 0 0-3 0 2 3 1-1 1 4 0-2-3 3 0 1-2 1 0 1 1-3 8 4-1 1 1 4 0 2 2 1-2 2 0 2-8 3 0 4 3 0-2 1-1 0-1 2 0 2 1-1 1 1 1-1 1 1 1 1-1 8 4 0 3 2 2 2 0 4 2 3 0-1 1 2 0 0 3 2 1 0 2 4 0 0-4 4 2 4-2 2 2 2 0 1 4-3 0 0 6 2 1-1 7-3 1 4 3-1 2 2 0z",
+    labelX: 351, labelY: 521,
+  },
+  {
+    name: "Maharashtra",
+    path: "M427 620l0 1-1 2-6 3-1 3 0 3 1 3 3 0 0 1 1 8-3 2 1 2 4-1-2 8 2 2-8 3 1 2-1 2 4 0 1 2-1 5-4 0 3 3-3 2 3 1-1-1 2-1 1 2 4 3 0 3 6 2 2 3-4 2 2 2-3 3-2 0-1-2-2 1-1-3-6 5-4 10-1 1 3 4-3 3 1 1-6 2-7-6 1-1 0-6-2 0 0-3 3-2-1-2 2-6-7-8-5 1-1 3-2-2-3 2-8-4 0 3-1 3-3-3-5-1 0-3-3-1-1-3-4-1-4-2-4 1-6-4-1 2 3 3-1 2-3 2 2 2 0 5-4 3-1 5-4 0-4-3-3 1 2 2-2 2 0 4-2 0-1 2 6 8-3 0-2 4-2 1 0 4-5 0 0 4-2 1 1 0-1 2 1 3-1-1-2 2-1-2-3 0 2-3-3-2-3 1-1 5-4 3 1 2-6-2-1 3 2 1-2 2 0 4-4 2-2-1 0 1 2 1-3 2-1 4-2-3-2 2 0-2-1 0-1 3-6 3 2 4-2 0 0 1 2 0-1 3 2 0-1 2-1 0 0-2-3 1-1-1-2 0-1 2-1-2-1 1-3-1-2 1-2-3-1 1-1-1-1 2-4-2-2-2 0 3-2 0 3 4-1 4 2 2-1 2 1 3-1 1-3-2 0 1-2 1-1-2-7 2 0 2-1 2-3-2-2-2-5 0 1 1-2 2 0 3-8 2-1 3 1 1-2 1-2 1-1-3-1 0-1-1 0 2-3 1 0 2-4-1 0 3 1-1 2 3-1 2 0 3 3 0 3 2 0 1-1 3-2 0-2 1 4 1-3 6-1 1 1 0-1 3-2 1-3-2-3 2 0 2-1 0 1 1-4 1-2-4-3-1 0-1-1 2-5 0-4-6-2-1-7-22 1 0 1 1-2-3 1-1-1-3-1-10-1-1 1-3-3-6 2-1-3-4 1-2-2-3 0-6-4-8 0-3-1-1-2-8 2 1 3 1-6-5 0-3 1-3-3-6 1-3 3-2 0 2 1-3-2 0-1-1 2-1 0-2 2 0-1-3-1 0-1 2-2 0-1 3-1-2 1-2-2-7 1-4-2-4 1-2-2-1-1-10-1-1 1-1-1-3 2-2 0-5 2 0 3-3 3 0 1 3 1 0 1 2 1-1 4 2 1-2 0-1 1 0 2-3 4 1 0-3-1-4 4-6-4-4 2-2 1 0 0 2 2-1 3 2 1 2 3 0 3-2 0-2 4-2-2-9-3 0-2-2 0-2-4-1-1-2 1 2 7-2 0-3 4-1 0-4 3-1 1-2 2 1 7-2-1-2-3 1-1-1-6 0-5 2-3-5 4-1-3-6 12-5 1 1 4 0 4-3 1 2 3 2-1 7 3 2 7 2 3-1 6 3 1 3 4 2 11 2 12-1 6 1 1 0 2 5 1 2-2 0 2 3 3 1 6-2 2-3 4 0 1-3-1-2 6-5-1-2 1-2 3-1 6-4 4 0 1 1 3-2-1 0 7-1 3 3 1 5 1 1-7 0 3 6 4 0 1-1 2 1 3-2 5 1 8-4 0-2 3-1 4 0 0-1 2 0 0 4 4-1 1 2 5 0 1-1 1 1 5 0-1-4 7-1 1-2 3 1 1-3 8 2 2 4 6-2 6 3 1-1 5 0 4-3 2 1 4 3 1 5 4 0 3 3z",
+    labelX: 294, labelY: 711,
+  },
+  {
+    name: "Manipur",
+    path: "M906 467l-3 9 5 3-1 7-3 4-1 4-2 1 0 2-5 6 0 4-2 2-6 18-1 0-1-2-5-2-5 1-2-3-5 0 0 1-1 0-2 1-3-4-3-1 0 2-3 0 0-1-1-1 0 2-3-2-1 1-1-1-3-1 2-8-2-3 2 0 0-5 2-1-1-1 1-8 3 0 2-4 0-4 3-3 2-6 3-2 1 2 3 2 3-6 4-4-1-1 0-1 6-1 2-2 3 3 3-1 1 2 3 0 4-2 0-1 5-4 1 0-1 7z",
+    labelX: 878, labelY: 492,
+  },
+  {
+    name: "Meghalaya",
+    path: "M829 483l-13-6-10 0-4 2-1 0 0-2-5 2-7-3-14 2-2-1-3 1-1-1-8 2-11-4-5-2-5 0 1-7 1-2 0-1 4-1-4-6 2-1 0-2 6-5 6 0 2-2 3 1 1-1 2 2 0 2 2-2 1 1 3-1 3 2 0-2 3 0 5 3-1 2 7-1-1 3 2 2 3-4 5-2 4-6 2 0-1 3 2 2 2-2 0-4 3-2 2 0 0 3 2 1 2-1 11-2-5 5 0 1 2 1-3 3 1 6 2-2 6-1 1 2 4 3 1 2 3-1-3 4 7 5-1 4 2 1-5 1-2 3-3-1 0 1-1 0z",
+    labelX: 791, labelY: 462,
+  },
+  {
+    name: "Mizoram",
+    path: "M848 506l2 3-2 8 3 1 1 1 1-1 3 2 0-2 1 1 0 1 3 0 0 2 2 2 2 9-1 11-2 2 1 8-3 4-2 1-2-2-2 0 1 5-2 4 0 4 1 4-1 2 3 4 1 6-3 1 1 2-4 0 1 3-2 0 0 4-2-1-1 2-2-4-6-3-1 5-2 1-1-5 1-2-3-18-2-8-3-2 0-11 1 0-5-18 1-5 2-2 0-9-2-4 5 0 0 4 3-1 1-3 2 0 1-3 2-1 2-6 3 5 2-1z",
+    labelX: 843, labelY: 549,
+  },
+  {
+    name: "Nagaland",
+    path: "M925 420l-3 3-3 5 2 3 0 11 2 1-3 4-2 2 0 6-4 4-1 4-2 0-1 2-4 2-4-2 1-7-1 0-5 4 0 1-4 2-3 0-1-2-3 1-3-3-2 2-6 1 0 1 1 1-4 4-3 6-3-2-1-2-1-5-2-1-2-3 13-11-1-2 3-2 1 5 6-4-1-3 2-7 3-5 2-1 1-4 3-4 1 4 3-3 1-3 2-2 4-2 0-1 3 0 4-3 3-4 4 0 6-5 2 5-2 2 2 3-1 2z",
+    labelX: 892, labelY: 441,
+  },
+  {
+    name: "Odisha",
+    path: "M566 702l2-1-1 2z m71-57l-1 0 2-4 5 0 1 2-3 0-2 2-2-1z m-3-57l0 2 2 0 2 2 4 1 2 1-1 5 2 2 2 0 0-1 2-2 0-1 3 0 0 6 7 1 1 6-3 2-5 0-5 2-7 7-2 6 4 12 0 1-3 0-2 1-1 4 1 0 4-2 3 1-8 5-2 3 0 2 2 2 0 1-10 6 1 0-4 7-4-3-1 0 4 4-24 7-8 5-10 6-12 12-2-1 0 2-1-2-1-1 0 2-3 0 2 2-2 2-1-2-3 3-2-1 1 3-3 2-1 0 0 3-8 1-3-2-4 0-3-7-2 1 1 2-1 0-4-8-3 5-1 0 0-2-1 0 0 2-1 2-1-2-4 0 2 2 0 1 2 2 0 1-5 2 0 1-5-1-4 5 1 3 2 1-3 3 2 3-5 0-1-2-3-1-1 4-4 2-1 2-1-1 0-4-2-1 1-2-3-3-4 4 1 2-1 2 1 0-3 4 2 2-1 0 0 3-2 0-1 3-3-2-4-1-9 6-4 1-2 2-7 0 0-3 2 1 1-4 2-10 4-3 3 0 1-3 4-5 2 0-2-3 2 0 1-2 3-1 1-1 2-1 1-4 2-1-3-11 1-4-1-1 1-2-2 0-1-3-2 0 1-10-3-1-1-2-3-1 0-5 3-3 2 3 2-1 4 3 2-1 3 6 4-3 5 2 0 3 4-2 0-6-11-2 0-3 1-5-1-2 1-4-3-4 1-3 0-9 3 2 1-3 5-5 0-4 11-1 6 3 2-2 2-4 1 0 0-4 5 1-2-5 1-5 2-1 1 1 0-1-2-1 2-3 1-2 1 0 0-1 2-1 0-2-2-2 0-2 0-1 2-1-1-1 3-5 3 0 4-4 5-1 1-2-2-3 1-1 5 2 0 3 5 2 5 0 2-3 8 0 1-1 4 0 0 1 7-2 0 5 1 1-1 2-2 6-1 0 3 0 4 2 1 2 3-5 3-1 6 3 2-1 1 2 5-2 1 1-2 0-1 3 5 1 4-8-2-2 2-5-2-3 3-4 2 3 6 1 5 5 2-1z",
+    labelX: 556, labelY: 661,
+  },
+  {
+    name: "Puducherry",
+    path: "M399 989l0 6-1 0-4-5 2 0-1-1z m0-34l-1 5-2-2-3 0 2-1-1-1 0-2-2 0 2-1 0 1 2 0-1 0 1 3 2-2z m-155-3l-1 0 1 3-2-3-1-1 0-1 6-2-3 2z m239-164l-1 0z m0-1l-2 0 1 1-3-1z",
+    labelX: 362, labelY: 890,
+  },
+  {
+    name: "Punjab",
+    path: "M294 255l3 5-1 1-2-1-3 1 2 3 2 1 1-1 3 4-1 6 2 2-2 1-2-3-3 1-1 1 1 1-1 2-5 2 0 1 1-1 2 2-2 5-5-1-1-3-1 0 0 2-2 1-4-2 0 1 2 1-2 3 0 4-1 0 2 3-4 2-1 0-2 2-5 0-4-3-2 1 0 2-3-1-2 1-4-2-4 5-1 5-2 0-3-5 3-3-1-3-3 2-1-1-1-4 0 1-3 1-2-3-4-2-4 1-2 2-4-1-21-1 2-9 0-3-3-4 2-4 4-3 1 0 1-2 6-6 1-4 2 0 0-2 6-4 0-3 4 1 1-2-2-2-3 2-1-2 0-5 5-8-3-1 1-3-3-6 2-4 1-3 4-1 0-2 1 1 2-1 4-4 3 2 4-3 1 1 1-2 2 1 4-6-1-4 5 0 1 2 1-3 5-1 7-8-1 1 0 3 3 3-7 6-4 1 1 4-3 2 3 1 8 5 2 4-1 1 8 17-1 0 2 4 4-1 2-5 3 6 4 2 0-1 1 1 0 1 2 0-2 1 0 3 1 0 0 5z",
+    labelX: 247, labelY: 249,
+  },
+  {
+    name: "Rajasthan",
+    path: "M217 294l0 1 1 2-3 3 1 1 4 0-1 7 1 2-1 3-1-1 0 2 2 4 1 0 1-2 4 1 3-2 2 1 1 4 3-1 1 3 4-2 1 1 4-2-1 2 3-1 0 3-1 2 3 5 2 0-1 4 3 12 2 0 0 2 5 4 0 2 5 1 6 8-2 0-3 3 3 1-3 2 1 1 0 2-2 0 2 1 0 2 4 0 3 2 1-2-2-5 2-2-1-1 3 0 2 2 1-2-2-2 2 0-3-2 4 1 3 0 1 1-2 1 2 1-2 1 3 0 1 3 3-2 0-3 7-5 4 3-3 14 1 5 2 0 1-4 3 1-2-2 0-2 2 2 3-1 2 1 1-1 1 1 0 3 1 0 0 3 1 1 0 3 3 2 0 3 5 2 1 0-1 1 3 4-4 4-1 1 1 0 0 1 3 1 1-1 1 2 1-1-11 6 1 5 2-1 0-3 4 0 5-4 4 2 1-1 4 0 0 2 1-2 2 0 0-1 5 1-2 2 0 1-1 1 0 1-3 0 0 4-3-1-3 2-1 2-2 0 0 2-3 0-7 5-3 1 0 1-4 1-2 3-5 1-1 2-7 4-3 5-7 3-2 3 0 2-2 1 3 10 4 4 7 1 2 1 5-2 4 1 3-4 2 0 0 3 1 1-1 2 2 3-1 2-3 2-1-2-3 1-3 2-4-1-3 2 0 3 2 3-5 2 2 2 4 0 3 4 0 5-2 2-3-1 0-2-3 0 1 3 0 5 3 5-1 3-4 0-1-2-2 0-1-1 1-3-3 1-1 3-2 0-2-2-2 1-3-2-2 1-1 0-2-4-2 5 0 4-5 3 0 3-7 3-2-2 1 2-2 3-3-1-1-2-4-3 2-4 2 2 2 0 2-2 1 3 2-1 0-3 2 0 0-2-3-1 2-6-1 0-1-4 2-2 1 2 3-2 0-3-2-3-1-4-3-1-4 3-1-2-5 2-8-2-1-2 2-2-1-2 1 0 0 1 2 2 4-2 0-1-5 0 0-3 2 2 1-5-7 0-1 6-3 1-3 0-4-4 1 6 5 2 0 2-4 2-3-5-1 4 1 0-3 6 5 3-4 6 5 1 0 1 3 7-3 6 2 9-3 3-8 4-3 3 0 3 6 1 0 1-1 0 2 1-3 0-5 4-4 0-2 1-3-4-1 0-1 1-2-1 0-3-3-1-3-3-2 1-2-4-2 0-2 1-1-1-2 0 1-6-3-2-2 2 0-4-5-3 2-7-2-5-1 0 0 2-3 2-2-1 1-2-5-3 2-5 1 0 2-2-2 0-3-1 1-4-2 1-1-1-2 4 1 0-2 2-2-1-5 0-1-4-5-1-1 3-2 0-1-3-2 0 0-2-3 0-1-1 3-2-6 0-4-3-4 3 0-1-2-1-1 2-2-2-4 2-5-2-5 2-1-1-2 2-6-3-6-10-1-7-8-10 0-11-9 1-4-1-6-9-1-5 3-7 0-12-4-2-8 1-11-6-1-3 1-8 2-4 16-16 4-11 7-7 7 0 4 4 0 3 3 4 4 1 13-5 14-1 8-4 1-6 9-9 4-12 2-4 20-11 11-20 4-15 14-5 5-5-2 9z",
+    labelX: 195, labelY: 420,
+  },
+  {
+    name: "Sikkim",
+    path: "M703 402l-7-1-4 4-4-2-6 1-1-1-1-3-2 0 2-9-1-2 5-11 0-3-2-1 0-3 9-1 3-2 2 0 3-4 1 3 3 0 3 2 0 3 2 2-1 8-3 4 1 6 4 3-1 2-3 1z",
+    labelX: 694, labelY: 385,
+  },
+  {
+    name: "Tamil Nadu",
+    path: "M377 1048l4-2 3 5z m38-145l1 5-3 18-3 11-3 4-1 0-7 14-1 0-2 2-1-3 1 0-2 0 0-1-2 1 2 0 0 2 1 1-2 1 3 0 2 2-2 8 3 8 0 13-4 0 1 1-2 0 4 5 1 0 2 17-5 1 0-1-4-1-2 1 5 1-7-1 2 0-1-1-1 1-5 0-3 2-2 4 1 3-11 16-1 4 1 2 5 4 3 1-7 0-10 3-3 2-6 1-6 4-2 4 0 3 1 1-3 4 1 2 0 3-3 2 0 2-8 5-3 2-5 1-1 2-9-1-7-6 2-1 0-2 2-2 0-2 2-1-4-7 2-2 1-3-3-5 4-4 0-6 5-7-4-3-1 1-4-1 3-7-1-3 2-3-3-4 3-1 1-3-2-5-2 0-7 4-5-2 0-10-1-2 3 0-1-1 2-4-3-3-6-2 1-3 3-1-1-3-2-1 2-2-1-1-3 2-6 0 0-2 2-1 1-3-3-1-1-2-6-1 0-3 5-1 2-2-1-1 3-1 2 3 9 1 0-2 3-5 2 1 2-2 2 3 5-3 6 2 3-6 6-1 3-5-1-3-9-1 0-2 3-1 2-2 0-4-1 0 1-1-2-2 1-4 5 0 2-3 0-3 4-1 1 2 1-1 1 2 1-2 3 2 4 1-1 3 2-1 4 3 3 0 1-4 1 2 1-1 3-8-1-2 1-1 2 0 0-2 6 0 0 2 1-2 3 0 3 2 3 0 2-4 4 0 0-1 4-2-2 0 1-3-2 0 2-1 4 0 1 3 3-2 1 3 2 1 1-2-2-1 1-1 1 0 5-1 1-4 3-2-1-1 7 1 3 4z",
+    labelX: 346, labelY: 994,
+  },
+  {
+    name: "Tripura",
+    path: "M822 503l2 4-2 5 2 0 2 4 0 9-2 2-1 5-1 2-2-3-1 0-2 4-4-3 0 8-1 2-3 2-2 3-1 2 3 6-2 1 0 1-6 4-2-1-2-8-2-3-2 3 2 5-2-1-2-3 0-7-5-11 1 0-2-3 1-1 2 0 0-7 2 0 1-2 2 0 0-5 7 2 2-2 0-4 4 3-1-4 4 1 2 3 1-5 0-2 1-1 1 1 0-2 4 0 2-2 0-3z",
+    labelX: 806, labelY: 531,
+  },
+  {
+    name: "Uttar Pradesh",
+    path: "M407 337l6 3 4 5 2 0 3 2 0-3 2-1 1 2 2 0 2 2 7 3-1 1 3 2 1-1 2 3 5 1 4 6 0 2 1 0 0-1 3 0 1 3 14 9 3-3 3 0 13 10 9-2 2 5-1 4 7 0 3 2 5 0 4 4 3-1 0-4 8 0 8 5-1 0 3 0 0 3 2 2-1 5 3-1-1 1 1 1 1 6 3 0 1 2 1-1 1 0 0 5 2-1 1 3 3 1 0 1-5 1-6-1-1 3-5 1 0 3 4 0 1 2 4 1 0 4-5 1 0 4 5 5 12 5 0 1 3 2 0 1 0 1-2 0 0 2-1 0-3-1-1 1-2-2-2 3-3 0-2-2-2 0 0 3-6 3-4 6-3 0-12 7-1 7 2 9 3 2 1 2 1 2-1 4-4 1 0 1 2 4-2 2 1 2-3 6-5 6-2 2-6 0-5-3 0-2-2 0 1-2-4-3 3-1 1-7-2-1 0-6 3 0-1-4-2 0-2-2-4 2-4-2 0 4-4 0 0-2-2-1 0-3-2 0 1-1-3 0-4-2-2 0-2-2 0-3-8-4-1 1-1-1 1-1-1-1 1-1-2-1-2 0 0 1-1 1 0 2-4-3-3 0-2 8-2 0-1 2-2-2-4 0-1-1-4 1 3-8-1-1-1 0-1 2-3 0 2 3-4 0 1-1-3-1 0-2 0 3-2 0-1-1 0 2-4-1-2 3-2-1 2-4 3-2-1-2-3-2 0-4-2-1-4 3-4 0-1 3-5 1 1 5-4-1-4 0-2-2-3 4-1-2-2 0-1-1 3-4-3-1-1 1 0-3-2 0-1 2 3 1 0 1-2 0 0 1 1 3-2 0 0-1-1 2-1-2-1 2-1 0-2-3-2 2 1-4-1-1-2 1 1 1-1 0-3 2 0-3 3-2 0-2-3 0-1 4-2-2 3-4 2 0-1 1 2 0 0-3-2 0 1-4-2 0-2 2 1 2-4-2 2 3-1 0 0 2-3-1 1-1-1-1-2 1-1 3-2-1 0 2-1 0-2 1 5 1 1 6 1 2 0 3 1 3 3 1 1 2-1 8 4-1 3 5-2 0 0 1 3 1-1 3-3 5-2 2-2-3-3 0-5-5-5 4-2-2 2-2-5-5 1-1 0-5-3-7 5-5 1-4 3-2-2-1-3-7 2-3 3-1 0-3 6-1 1 1 6-3 0-2-2-2 2-2 0-1 2 1-1-2 1-3 4-6-2-2 2-1-1-1 3-2 0-2 3-1-1-1-1-1 2-3-3 0 0-2-2-2 0-5-1 1 0-1-3-1-2-2-3-1-6 1-7-4-2 0-1 2-2-1 0-1 2-2-5-1 0 1-2 0-1 2 0-2-4 0-1 1-4-2-5 4-4 0 0 3-2 1-1-5 11-6-1 1-1-2-1 1-3-1 0-1-1 0 1-1 4-4-3-4 1-1-1 0-5-2 0-3-3-2 0-3-1-1 0-3-1 0 0-3-1-1 9-6-2-5 2-3 0-3-2-1 1-1-1-5-4-3 0-1-2-2 2-2-1-3-4-3 0-3-1 0 1-6-3-3 1-9-2-8 2-7-1-3 5-11 5-2 0-2 6-6 0-3-1-1 3 0 2 3 8 4-4 6-1-1-3 10 3 7 5-1 1 6 2 0 4-5 3-1 4-4 2 1 3 2 1 3 2 3 4 3 7 2-2 3-4 2 1 1 4 2 1 3 2 0 1 2 2-1 3 1 1 4 1-1 3 3 3 0 1 4 5-1 0 2 2-1 2 1 4-2 1 1-1 2 1-1 2 0-1 1 2 0 2 4 2-1 0-3z",
+    labelX: 434, labelY: 401,
+  },
+  {
+    name: "Uttarakhand",
+    path: "M407 337l-2 1 0 3-2 1-2-4-2 0 1-1-2 0-1 1 1-2-1-1-4 2-2-1-2 1 0-2-5 1-1-4-3 0-3-3-1 1-1-4-3-1-2 1-1-2-2 0-1-3-4-2-1-1 4-2 2-3-7-2-4-3-2-3-1-3-3-2-2-1-4 4-3 1-4 5-2 0-1-6-5 1-3-7 3-10 1 1 4-6-8-4-2-3-3 0 9-5-3-3 1-1-2-5 1-5 2 1 0-2-2 0 0-2 2 0 1-3 3-5 3 0 12-5 4 4 5-2 1 2 5 0 3 4 4-1-3-6 1-3 2-1 2-4 6 5 3 8 2 1 1 3 3 0 3 4 6-2 4 1 2 3 4 2 2 3 2-2 2 2 0 3-1 1 1 3 11 5 2-1 7 7 7 2 0 1-3 1-2 2 1 1-5 5-2 2-3 0-4 6-3 1-1 2 2 4-6 9 2 3 0 5-2 0 1 2-2 1-1-1-2 2 0 4-2 3z",
+    labelX: 380, labelY: 287,
+  },
+  {
+    name: "West Bengal",
+    path: "M694 612l1-2 1 1 0 2z m8-1l1-2 1 1-1 1z m-7-1l1-1 2 2-2 1z m8-1l1-1 1 3-2 0z m8 0l-1-2 1 0 2 3z m-8-2l2-1 0 2z m-15 2l1-2 1 2z m5-3l0 4-1-3z m-9 1l1-1 1 3-1 1z m28-1l2 0 1 2-1 2-1-1z m-17 0l1-1 2 1-2 3z m14 0l1 1-1 2-2-2 1-2z m-18 1l1-1 0 3-1 2z m-7 0l1-3 2 1 1 3 0 4-2-1 0-3z m27-2l0 2-2-1 0-2z m-21 0l1 1-1 1z m15 0l2-1-1 6z m-15 0l1-1z m7-1l2 2-2 0z m-4 2l-1-1 1-2 1 0z m10-2l1 2-1 1 0 1-2-3 1-2z m-8 0l1-1 1 2-1 1z m-4 0l2-1-1 3z m13-2l1 3-2 1z m5 1l1-2 1 1-1 2z m-12-1l1-1 1 1 0 1z m-10 1l1-1 2-1 1 3-2 2z m20-2l1 0 1 5-3-2z m-28 7l3-8 1 2 0 6-2 1z m26-8l1 1 0 1-2 0 0-1z m5 4l1-2-1 0 1-2 2 1 0 1z m-12-3l1-2 1 2-1 3z m-7 1l1-3 2 1 0 1-1 2-2 0z m13-2l0 1 0 3-1-2-1 1-1-1 1-3z m4 1l-1 0-1-2 5 0-3 4z m-3-1l-1 0-2-2 3 1z m-3-2l1-2 2 2z m-3-1l1-2 2 1-1 2z m-20 2l1-3 2-1z m24-3l1-1 3 0 1 0 1 3-5 0z m8-1l1-1 1 0 1 2 0 2-2 0 0-1z m-5-2l-1 0 1-2 1 2z m2-4l2 0 1 1-2 5 1 1 0-3 1 1 1 5-3-1z m3 4l1-2-1-2 1-1 1 6z m-12-1l2-4 4 1-4 3 2 3-1 0-2 0z m3 1l5-5 0 2-4 4z m4-6l-1 2-2-1 1-2 1 0 0-1z m0 0l-1-4 2-1 3 3 0 2-1 0-1 3-1-2-2 0z m4-1l1-5 2 4-1 0 2 3 0 3z m-3-6l0-4 1-1 1 6-1 1z m1-5l2 0 2 3-2 6-2-2 1-1z m-5-173l4 2 0 6 2-2 2 3 2-1 3 5 9-2 2 2 3 0 4 1-1 2 8 1 0 13-2 1-1 2-2 0 0 5-1 0-1-3 0 2-2 2 2 3-2 1-1 2-1-1-3 0 0-1-3 1-3-2-1-3-3 0-2-10-4-2-2 3 3 1 0 2 2 0 0 1-3 1-1-2-2 0 0 2-1 0-2-3-1 1-1-2-2 0 0-2-2-3-2 1-3-3-1 0-2-4-2 6 5 1 2 3-6 3 0 3-6 3 0 4-3 4 0 4 2 2 4-2 3 5 3 1 0 2 2 3 5 2 5-2 1 6 3 2 3 1-3 5-2-2-2 1-3-1-5 1-3-1-1 1 0 5-2 4-2 0 0 3-2-1-1-2-4 1 1 2-5 7 5 7 6 4 4 0 4 3 0-1 5 1 1 1-2 7 1 0 2 4-1 0 0 3-6 2 1 1-1 2 0 5 1 1 2 0 0 2 3 3 2-1-2 7-2 1 1 1 2 2 1 0 0-2 5 2 1 0-4 5 0 4 4 5-2 2 1 6-3 3 0 4-2-2-4-2 3 1 1 2 2 1-2 6-1 0-1 2-2 0-2 2 0 8-2 1-1 2-1-1 0-1-3 0-1 4-1-2-2 0 0 1-1 0 0 1 0 2-2-1-2-4 0-3 2-5 0-2-2-2-3 0 1-4-2 4-2-1-2-6 1 5 1 2 5 1 2 3-4 3-2-2 1 2-2 6-6 6-11 3-1-6-7-1 0-6-3 0 0 1-2 2 0 1-2 0-2-2 1-5-2-1-4-1-2-2-2 0 0-2 2 0 1-2 3 0 0-1-2-1 0-3-3-1 0-2 1 0 0-2-1-1-3-1-2-3-6-4 1-4-1-2 3 0 1-2-11 0-6-6-5 1-2-2-1-3 3-4-1-3 6-1-1-3 1-1 3 1 0 3 6 2 1-1 1-5 3-2 11-2 1-5 3-2 7 3 2-1-1-2 4 2 0-3 2 1-2-6 7 2 0-1 2 0-1-4 3 1 1-1-1-2 4 1-2-2 4-4 2-3 0-7 3 0 1-1-1-5-3-1 2 0 4-5-4-6-3-2 0-4 2 0 1-3-3-2 0-4 3-1 2-2 4 2 1-1-1-2 0-5-5-4 1-2-4-2 1-5 2-2 3 0-1-3 4-1 8-6-2-2 0-1-2-3 2-2-4 2-1-1 3-9-2-9-5-4 1-4 2 0 1 3 1 1 6-1 4 2 4-4z",
+    labelX: 673, labelY: 506,
+  },
+  {
+    name: "Lakshadweep",
+    path: "M168 1081l0 1-2 1 1 0 1-1z",
+    labelX: 162, labelY: 1023,
+  },
+  {
+    name: "Jammu & Kashmir",
+    path: "M204 84l6-1 6 3 5-4 6 5 0 5 1 0 8 4 0-3 1 0 2 3 3 2 0 4-1 2 2 0-1 1 4 2 2 4-2 3 1 5 3 0 1 2 3 1 2-2 1 1 1 5 5 3 0 2 6-1 5 9 3 1 1 4-2 2 0 3 2-1 1-2 1 1 2 2 1-1 5 6 1-1 1 4 4 4-1 3-4 1-2-2-5 1-4 2-1 4-5 1-1 2-4 3-5-2-1 3 4 4 1 5-3 3-5 7-6 2 0 2-2-2-5 0-5-3-2 0-1-2-2-1-3 2-2-2-7 0-2-5 2-2-1-1 2-6-2 0-2 4-3 0-2-2-3 1-7-5-6-2-1-2-4-1-2 1-1-4-4-1 1-4-3-7 2-6-2-4 1-4-1-3 1-4-3-5-1-9-3-7 2-8 7 1 1-4-1 0 2-5 7-2 4-3 1-4 1-1-1-1z",
+    labelX: 237, labelY: 141,
+  },
+  {
+    name: "Ladakh",
+    path: "M204 84l-11-5-3 1-1-6 4-4-1-3-5-2-8 0-3-2-6-4 1-5-2-2-7 1 0-1-2 0-5 2-3-2-3-2 3-4-3-2 2-3-1-3 2-2 3 0 6-5 0-3 4-1 0-2 4-4-1-3 12-3 7 3 9-1-1-3-5-2-1-4 8 2 4 3 3-2 1-2 4 0 5-4 4 0 1 1 1-4 3-1 2 3 3-1 3 5 3-3 4 2 3-4 5-1 0 3 2 1 0 3 1 0 1 4 5 2 4 7 6 4 6 1 6 5 3 0 3 2 1 4 3 2 3-1 6 7-3 3 2 4 5 3 6-1 2 3 5 2 1-1 3 3 0 1 2 4-6 0 2 2 12 0 0-2 1 1 2-1 3 2 0-1 2 1-1-2 1-3 6 2 2-5 2 1 1-4 3 0 1-2 4 0 5-3 6 0 4-2 2 2 4 1 3-7 5 0 2 4 10 4 5 1 2-2 3 0 3 6 6 3 2 6-2 1-3 12-1 7-3 6 0 6-4 1-3 0-3 3 0 1-1 1 2 2 0 1-10 1 1 2 1 7-2 2-1 3-2 2 0 2-9-2-1 2-4-1-3 1-1 2 4 8 2 1-2 2 2 1 1 3-6-1 1 11 1 2 4 1 5 0 7 2-3 7 1 2-2 1 10 11-6 8-5-2-2 3-4 2-1 3-3 0-1 2-6-4-2-10-3 1-1 3-2-1-4 1-2 2-3 3-1-2 1-2 3-2-1-6-5 4-2-1-4 2 0 2-2 0-3-4 1-3-1-1-1-1-2-1-1-1 1-2-5-3-5 4-3 0-3 3-1-2-2 0-2-3-1 1-1-3-4 0-3-2-2-3-2-2 0-4 0 1 0-1-2 0-4-4-1-4-1 1-5-6-1 1-2-2-1-1-1 2-2 1 0-3 2-2-1-4-3-1-5-9-6 1 0-2-5-3-1-5-1-1-2 2-3-1-1-2-3 0-1-5 2-3-2-4-4-2 1-1-2 0 1-2 0-4-3-2-2-3-1 0 0 3-8-4-1 0 0-5-6-5-5 4-6-3z",
+    labelX: 283, labelY: 99,
+  },
+];
+
+export default indiaMapPaths;
@@ -1,540 +1,550 @@
 // Parliamentary Constituency → Assembly Constituency mapping
 // Each Lok Sabha PC ID maps to its constituent Vidhan Sabha AC IDs
 // 532 PCs mapped, 4123 ACs total
+// Dictionary-encoded against stringTable.js; decoded once below
 
-const pcToAcMapping = {
-  'AP-01': ['AP-AC-010', 'AP-AC-011', 'AP-AC-012', 'AP-AC-013', 'AP-AC-028', 'AP-AC-029', 'AP-AC-053'],
-  'AP-02': ['AP-AC-001', 'AP-AC-002', 'AP-AC-003', 'AP-AC-004', 'AP-AC-005', 'AP-AC-006', 'AP-AC-008'],
-  'AP-03': ['AP-AC-007', 'AP-AC-009', 'AP-AC-014', 'AP-AC-015', 'AP-AC-016', 'AP-AC-017', 'AP-AC-018'],
-  'AP-04': ['AP-AC-019', 'AP-AC-020', 'AP-AC-021', 'AP-AC-022', 'AP-AC-023', 'AP-AC-024', 'AP-AC-025'],
-  'AP-05': ['AP-AC-026', 'AP-AC-027', 'AP-AC-030', 'AP-AC-031', 'AP-AC-032', 'AP-AC-033', 'AP-AC-034'],
-  'AP-06': ['AP-AC-035', 'AP-AC-036', 'AP-AC-037', 'AP-AC-038', 'AP-AC-039', 'AP-AC-041', 'AP-AC-052'],
-  'AP-07': ['AP-AC-042', 'AP-AC-043', 'AP-AC-044', 'AP-AC-045', 'AP-AC-046', 'AP-AC-047', 'AP-AC-048'],
-  'AP-08': ['AP-AC-040', 'AP-AC-049', 'AP-AC-050', 'AP-AC-051', 'AP-AC-054', 'AP-AC-055', 'AP-AC-066'],
-  'AP-09': ['AP-AC-056', 'AP-AC-057', 'AP-AC-058', 'AP-AC-059', 'AP-AC-060', 'AP-AC-061', 'AP-AC-062'],
-  'AP-10': ['AP-AC-063', 'AP-AC-064', 'AP-AC-065', 'AP-AC-067', 'AP-AC-068', 'AP-AC-070', 'AP-AC-073'],
-  'AP-11': ['AP-AC-071', 'AP-AC-072', 'AP-AC-074', 'AP-AC-075', 'AP-AC-076', 'AP-AC-077', 'AP-AC-078'],
-  'AP-12': ['AP-AC-069', 'AP-AC-079', 'AP-AC-080', 'AP-AC-081', 'AP-AC-082', 'AP-AC-083', 'AP-AC-084'],
-  'AP-13': ['AP-AC-086', 'AP-AC-087', 'AP-AC-088', 'AP-AC-091', 'AP-AC-093', 'AP-AC-094', 'AP-AC-095'],
-  'AP-14': ['AP-AC-085', 'AP-AC-096', 'AP-AC-097', 'AP-AC-098', 'AP-AC-099', 'AP-AC-100', 'AP-AC-101'],
-  'AP-15': ['AP-AC-089', 'AP-AC-090', 'AP-AC-092', 'AP-AC-104', 'AP-AC-105', 'AP-AC-106', 'AP-AC-107'],
-  'AP-16': ['AP-AC-102', 'AP-AC-103', 'AP-AC-108', 'AP-AC-110', 'AP-AC-111', 'AP-AC-112', 'AP-AC-113'],
-  'AP-17': ['AP-AC-134', 'AP-AC-135', 'AP-AC-136', 'AP-AC-138', 'AP-AC-139', 'AP-AC-140', 'AP-AC-141'],
-  'AP-18': ['AP-AC-137', 'AP-AC-142', 'AP-AC-143', 'AP-AC-144', 'AP-AC-145', 'AP-AC-146', 'AP-AC-147'],
-  'AP-19': ['AP-AC-148', 'AP-AC-149', 'AP-AC-150', 'AP-AC-151', 'AP-AC-152', 'AP-AC-153', 'AP-AC-154'],
-  'AP-20': ['AP-AC-155', 'AP-AC-156', 'AP-AC-157', 'AP-AC-158', 'AP-AC-159', 'AP-AC-160', 'AP-AC-161'],
-  'AP-21': ['AP-AC-124', 'AP-AC-126', 'AP-AC-129', 'AP-AC-130', 'AP-AC-131', 'AP-AC-132', 'AP-AC-133'],
-  'AP-22': ['AP-AC-109', 'AP-AC-114', 'AP-AC-115', 'AP-AC-116', 'AP-AC-117', 'AP-AC-118', 'AP-AC-123'],
-  'AP-23': ['AP-AC-119', 'AP-AC-120', 'AP-AC-121', 'AP-AC-122', 'AP-AC-167', 'AP-AC-168', 'AP-AC-169'],
-  'AP-24': ['AP-AC-125', 'AP-AC-127', 'AP-AC-128', 'AP-AC-162', 'AP-AC-163', 'AP-AC-164', 'AP-AC-165'],
-  'AP-25': ['AP-AC-166', 'AP-AC-170', 'AP-AC-171', 'AP-AC-172', 'AP-AC-173', 'AP-AC-174', 'AP-AC-175'],
-  'AR-01': ['AR-AC-001', 'AR-AC-002', 'AR-AC-003', 'AR-AC-004', 'AR-AC-005', 'AR-AC-006', 'AR-AC-007', 'AR-AC-008', 'AR-AC-009', 'AR-AC-010', 'AR-AC-011', 'AR-AC-012', 'AR-AC-013', 'AR-AC-014', 'AR-AC-015', 'AR-AC-016', 'AR-AC-017', 'AR-AC-018', 'AR-AC-019', 'AR-AC-020', 'AR-AC-021', 'AR-AC-022', 'AR-AC-023', 'AR-AC-024', 'AR-AC-025', 'AR-AC-026', 'AR-AC-027', 'AR-AC-028', 'AR-AC-029', 'AR-AC-030', 'AR-AC-031', 'AR-AC-032', 'AR-AC-033'],
-  'AR-02': ['AR-AC-034', 'AR-AC-035', 'AR-AC-036', 'AR-AC-037', 'AR-AC-038', 'AR-AC-039', 'AR-AC-040', 'AR-AC-041', 'AR-AC-042', 'AR-AC-043', 'AR-AC-044', 'AR-AC-045', 'AR-AC-046', 'AR-AC-047', 'AR-AC-048', 'AR-AC-049', 'AR-AC-050', 'AR-AC-051', 'AR-AC-052', 'AR-AC-053', 'AR-AC-054', 'AR-AC-055', 'AR-AC-056', 'AR-AC-057', 'AR-AC-058', 'AR-AC-059', 'AR-AC-060'],
-  'AS-01': ['AS-AC-121', 'AS-AC-122', 'AS-AC-123', 'AS-AC-124', 'AS-AC-125', 'AS-AC-126'],
-  'AS-02': ['AS-AC-114', 'AS-AC-115', 'AS-AC-116', 'AS-AC-117', 'AS-AC-118', 'AS-AC-119', 'AS-AC-120'],
-  'AS-03': ['AS-AC-108', 'AS-AC-109', 'AS-AC-110', 'AS-AC-111', 'AS-AC-112', 'AS-AC-113'],
-  'AS-04': ['AS-AC-006', 'AS-AC-007', 'AS-AC-008', 'AS-AC-009', 'AS-AC-010', 'AS-AC-011', 'AS-AC-012', 'AS-AC-014', 'AS-AC-017', 'AS-AC-022', 'AS-AC-023'],
-  'AS-05': ['AS-AC-001', 'AS-AC-002', 'AS-AC-003', 'AS-AC-004', 'AS-AC-005', 'AS-AC-019', 'AS-AC-020', 'AS-AC-041', 'AS-AC-042'],
-  'AS-06': ['AS-AC-016', 'AS-AC-018', 'AS-AC-021', 'AS-AC-024', 'AS-AC-025', 'AS-AC-026', 'AS-AC-030', 'AS-AC-038', 'AS-AC-039', 'AS-AC-040'],
-  'AS-07': ['AS-AC-013', 'AS-AC-015', 'AS-AC-027', 'AS-AC-028', 'AS-AC-029', 'AS-AC-033', 'AS-AC-034', 'AS-AC-035', 'AS-AC-036', 'AS-AC-037'],
-  'AS-08': ['AS-AC-031', 'AS-AC-032', 'AS-AC-043', 'AS-AC-044', 'AS-AC-045', 'AS-AC-046', 'AS-AC-047', 'AS-AC-048', 'AS-AC-049', 'AS-AC-050', 'AS-AC-051'],
-  'AS-09': ['AS-AC-065', 'AS-AC-066', 'AS-AC-067', 'AS-AC-068', 'AS-AC-069', 'AS-AC-070', 'AS-AC-071', 'AS-AC-072', 'AS-AC-073'],
-  'AS-10': ['AS-AC-052', 'AS-AC-053', 'AS-AC-054', 'AS-AC-055', 'AS-AC-056', 'AS-AC-058', 'AS-AC-060', 'AS-AC-061'],
-  'AS-11': ['AS-AC-057', 'AS-AC-059', 'AS-AC-062', 'AS-AC-063', 'AS-AC-064', 'AS-AC-103', 'AS-AC-104', 'AS-AC-105', 'AS-AC-106', 'AS-AC-107'],
-  'AS-12': ['AS-AC-093', 'AS-AC-094', 'AS-AC-095', 'AS-AC-096', 'AS-AC-097', 'AS-AC-098', 'AS-AC-099', 'AS-AC-100', 'AS-AC-101', 'AS-AC-102'],
-  'AS-13': ['AS-AC-083', 'AS-AC-084', 'AS-AC-085', 'AS-AC-086', 'AS-AC-087', 'AS-AC-088', 'AS-AC-089', 'AS-AC-090', 'AS-AC-091', 'AS-AC-092'],
-  'AS-14': ['AS-AC-074', 'AS-AC-075', 'AS-AC-076', 'AS-AC-077', 'AS-AC-078', 'AS-AC-079', 'AS-AC-080', 'AS-AC-081', 'AS-AC-082'],
-  'BR-01': ['BR-AC-001', 'BR-AC-002', 'BR-AC-003', 'BR-AC-004', 'BR-AC-005', 'BR-AC-009'],
-  'BR-02': ['BR-AC-006', 'BR-AC-007', 'BR-AC-008', 'BR-AC-010', 'BR-AC-011', 'BR-AC-012'],
-  'BR-03': ['BR-AC-013', 'BR-AC-014', 'BR-AC-015', 'BR-AC-016', 'BR-AC-017', 'BR-AC-019'],
-  'BR-04': ['BR-AC-018', 'BR-AC-020', 'BR-AC-021', 'BR-AC-022', 'BR-AC-023', 'BR-AC-030'],
-  'BR-05': ['BR-AC-024', 'BR-AC-025', 'BR-AC-026', 'BR-AC-027', 'BR-AC-028', 'BR-AC-029'],
-  'BR-06': ['BR-AC-031', 'BR-AC-032', 'BR-AC-035', 'BR-AC-036', 'BR-AC-086', 'BR-AC-087'],
-  'BR-07': ['BR-AC-033', 'BR-AC-034', 'BR-AC-037', 'BR-AC-038', 'BR-AC-039', 'BR-AC-040'],
-  'BR-08': ['BR-AC-041', 'BR-AC-042', 'BR-AC-043', 'BR-AC-044', 'BR-AC-045', 'BR-AC-072'],
-  'BR-09': ['BR-AC-046', 'BR-AC-047', 'BR-AC-048', 'BR-AC-049', 'BR-AC-050', 'BR-AC-051'],
-  'BR-10': ['BR-AC-052', 'BR-AC-053', 'BR-AC-054', 'BR-AC-055', 'BR-AC-056', 'BR-AC-057'],
-  'BR-11': ['BR-AC-063', 'BR-AC-064', 'BR-AC-065', 'BR-AC-066', 'BR-AC-067', 'BR-AC-068'],
-  'BR-12': ['BR-AC-058', 'BR-AC-059', 'BR-AC-060', 'BR-AC-061', 'BR-AC-062', 'BR-AC-069'],
-  'BR-13': ['BR-AC-070', 'BR-AC-071', 'BR-AC-073', 'BR-AC-074', 'BR-AC-075', 'BR-AC-077'],
-  'BR-14': ['BR-AC-079', 'BR-AC-080', 'BR-AC-081', 'BR-AC-082', 'BR-AC-083', 'BR-AC-085'],
-  'BR-15': ['BR-AC-088', 'BR-AC-089', 'BR-AC-090', 'BR-AC-091', 'BR-AC-092', 'BR-AC-093', 'BR-AC-094'],
-  'BR-16': ['BR-AC-095', 'BR-AC-096', 'BR-AC-097', 'BR-AC-098', 'BR-AC-125'],
-  'BR-17': ['BR-AC-099', 'BR-AC-100', 'BR-AC-101', 'BR-AC-102', 'BR-AC-103', 'BR-AC-104'],
-  'BR-18': ['BR-AC-105', 'BR-AC-106', 'BR-AC-107', 'BR-AC-108', 'BR-AC-109', 'BR-AC-110'],
-  'BR-20': ['BR-AC-117', 'BR-AC-118', 'BR-AC-119', 'BR-AC-120', 'BR-AC-121', 'BR-AC-122'],
-  'BR-21': ['BR-AC-123', 'BR-AC-124', 'BR-AC-126', 'BR-AC-127', 'BR-AC-128', 'BR-AC-129'],
-  'BR-22': ['BR-AC-130', 'BR-AC-134', 'BR-AC-135', 'BR-AC-136', 'BR-AC-137', 'BR-AC-138'],
-  'BR-23': ['BR-AC-078', 'BR-AC-084', 'BR-AC-131', 'BR-AC-132', 'BR-AC-133', 'BR-AC-139'],
-  'BR-24': ['BR-AC-141', 'BR-AC-142', 'BR-AC-143', 'BR-AC-144', 'BR-AC-145', 'BR-AC-146', 'BR-AC-147'],
-  'BR-25': ['BR-AC-076', 'BR-AC-140', 'BR-AC-148', 'BR-AC-149', 'BR-AC-150', 'BR-AC-151'],
-  'BR-26': ['BR-AC-152', 'BR-AC-153', 'BR-AC-154', 'BR-AC-155', 'BR-AC-156', 'BR-AC-158'],
-  'BR-27': ['BR-AC-157', 'BR-AC-159', 'BR-AC-160', 'BR-AC-161', 'BR-AC-162', 'BR-AC-163'],
-  'BR-28': ['BR-AC-165', 'BR-AC-166', 'BR-AC-167', 'BR-AC-168', 'BR-AC-178', 'BR-AC-179'],
-  'BR-29': ['BR-AC-171', 'BR-AC-172', 'BR-AC-173', 'BR-AC-174', 'BR-AC-175', 'BR-AC-176', 'BR-AC-177'],
-  'BR-30': ['BR-AC-180', 'BR-AC-181', 'BR-AC-182', 'BR-AC-183', 'BR-AC-184', 'BR-AC-185'],
-  'BR-31': ['BR-AC-186', 'BR-AC-187', 'BR-AC-188', 'BR-AC-189', 'BR-AC-190', 'BR-AC-191'],
-  'BR-32': ['BR-AC-192', 'BR-AC-193', 'BR-AC-194', 'BR-AC-195', 'BR-AC-196', 'BR-AC-197', 'BR-AC-198'],
-  'BR-33': ['BR-AC-199', 'BR-AC-200', 'BR-AC-201', 'BR-AC-202', 'BR-AC-203', 'BR-AC-210'],
-  'BR-34': ['BR-AC-204', 'BR-AC-205', 'BR-AC-206', 'BR-AC-207', 'BR-AC-208', 'BR-AC-209'],
-  'BR-35': ['BR-AC-211', 'BR-AC-212', 'BR-AC-213', 'BR-AC-219', 'BR-AC-220', 'BR-AC-221'],
-  'BR-36': ['BR-AC-214', 'BR-AC-215', 'BR-AC-216', 'BR-AC-217', 'BR-AC-218', 'BR-AC-233'],
-  'BR-38': ['BR-AC-226', 'BR-AC-228', 'BR-AC-229', 'BR-AC-230', 'BR-AC-232', 'BR-AC-234'],
-  'BR-39': ['BR-AC-170', 'BR-AC-235', 'BR-AC-236', 'BR-AC-237', 'BR-AC-238', 'BR-AC-239'],
-  'BR-40': ['BR-AC-164', 'BR-AC-169', 'BR-AC-240', 'BR-AC-241', 'BR-AC-242', 'BR-AC-243'],
-  'CG-01': ['CG-AC-004', 'CG-AC-005', 'CG-AC-006', 'CG-AC-007', 'CG-AC-008', 'CG-AC-009', 'CG-AC-010', 'CG-AC-011'],
-  'CG-02': ['CG-AC-012', 'CG-AC-013', 'CG-AC-014', 'CG-AC-015', 'CG-AC-016', 'CG-AC-017', 'CG-AC-018', 'CG-AC-019'],
-  'CG-03': ['CG-AC-033', 'CG-AC-034', 'CG-AC-035', 'CG-AC-036', 'CG-AC-037', 'CG-AC-038', 'CG-AC-043', 'CG-AC-044'],
-  'CG-04': ['CG-AC-001', 'CG-AC-002', 'CG-AC-003', 'CG-AC-020', 'CG-AC-021', 'CG-AC-022', 'CG-AC-023', 'CG-AC-024'],
-  'CG-05': ['CG-AC-025', 'CG-AC-026', 'CG-AC-027', 'CG-AC-028', 'CG-AC-029', 'CG-AC-030', 'CG-AC-031', 'CG-AC-032'],
-  'CG-06': ['CG-AC-071', 'CG-AC-072', 'CG-AC-073', 'CG-AC-074', 'CG-AC-075', 'CG-AC-076', 'CG-AC-077', 'CG-AC-078'],
-  'CG-07': ['CG-AC-062', 'CG-AC-063', 'CG-AC-064', 'CG-AC-065', 'CG-AC-066', 'CG-AC-067', 'CG-AC-068', 'CG-AC-069', 'CG-AC-070'],
-  'CG-08': ['CG-AC-045', 'CG-AC-046', 'CG-AC-047', 'CG-AC-048', 'CG-AC-049', 'CG-AC-050', 'CG-AC-051', 'CG-AC-052', 'CG-AC-053'],
-  'CG-09': ['CG-AC-039', 'CG-AC-040', 'CG-AC-041', 'CG-AC-042', 'CG-AC-054', 'CG-AC-055', 'CG-AC-057', 'CG-AC-058'],
-  'CG-10': ['CG-AC-083', 'CG-AC-084', 'CG-AC-085', 'CG-AC-086', 'CG-AC-087', 'CG-AC-088', 'CG-AC-089', 'CG-AC-090'],
-  'CG-11': ['CG-AC-056', 'CG-AC-059', 'CG-AC-060', 'CG-AC-061', 'CG-AC-079', 'CG-AC-080', 'CG-AC-081', 'CG-AC-082'],
-  'DL-01': ['DL-AC-004', 'DL-AC-014', 'DL-AC-015', 'DL-AC-016', 'DL-AC-017', 'DL-AC-018', 'DL-AC-019', 'DL-AC-020', 'DL-AC-021', 'DL-AC-022'],
-  'DL-02': ['DL-AC-002', 'DL-AC-003', 'DL-AC-065', 'DL-AC-066', 'DL-AC-067', 'DL-AC-068', 'DL-AC-069', 'DL-AC-070'],
-  'DL-03': ['DL-AC-041', 'DL-AC-054', 'DL-AC-055', 'DL-AC-056', 'DL-AC-057', 'DL-AC-058', 'DL-AC-059', 'DL-AC-060', 'DL-AC-061', 'DL-AC-062', 'DL-AC-063', 'DL-AC-064'],
-  'DL-04': ['DL-AC-023', 'DL-AC-024', 'DL-AC-025', 'DL-AC-038', 'DL-AC-039', 'DL-AC-040', 'DL-AC-042', 'DL-AC-043', 'DL-AC-044', 'DL-AC-050'],
-  'DL-05': ['DL-AC-001', 'DL-AC-005', 'DL-AC-006', 'DL-AC-007', 'DL-AC-008', 'DL-AC-009', 'DL-AC-010', 'DL-AC-011', 'DL-AC-012', 'DL-AC-013'],
-  'DL-06': ['DL-AC-026', 'DL-AC-027', 'DL-AC-028', 'DL-AC-029', 'DL-AC-030', 'DL-AC-031', 'DL-AC-032', 'DL-AC-033', 'DL-AC-034', 'DL-AC-035'],
-  'DL-07': ['DL-AC-036', 'DL-AC-037', 'DL-AC-045', 'DL-AC-046', 'DL-AC-047', 'DL-AC-048', 'DL-AC-049', 'DL-AC-051', 'DL-AC-052', 'DL-AC-053'],
-  'GA-01': ['GA-AC-001', 'GA-AC-002', 'GA-AC-003', 'GA-AC-004', 'GA-AC-005', 'GA-AC-006', 'GA-AC-007', 'GA-AC-008', 'GA-AC-009', 'GA-AC-010', 'GA-AC-011', 'GA-AC-012', 'GA-AC-013', 'GA-AC-014', 'GA-AC-015', 'GA-AC-016', 'GA-AC-017', 'GA-AC-018', 'GA-AC-019', 'GA-AC-020'],
-  'GA-02': ['GA-AC-021', 'GA-AC-022', 'GA-AC-023', 'GA-AC-024', 'GA-AC-025', 'GA-AC-026', 'GA-AC-027', 'GA-AC-028', 'GA-AC-029', 'GA-AC-030', 'GA-AC-031', 'GA-AC-032', 'GA-AC-033', 'GA-AC-034', 'GA-AC-035', 'GA-AC-036', 'GA-AC-037', 'GA-AC-038', 'GA-AC-039', 'GA-AC-040'],
-  'GJ-01': ['GJ-AC-001', 'GJ-AC-002', 'GJ-AC-003', 'GJ-AC-004', 'GJ-AC-005', 'GJ-AC-006', 'GJ-AC-065'],
-  'GJ-02': ['GJ-AC-007', 'GJ-AC-008', 'GJ-AC-009', 'GJ-AC-010', 'GJ-AC-012', 'GJ-AC-013', 'GJ-AC-014'],
-  'GJ-03': ['GJ-AC-011', 'GJ-AC-015', 'GJ-AC-016', 'GJ-AC-017', 'GJ-AC-018', 'GJ-AC-019', 'GJ-AC-020'],
-  'GJ-04': ['GJ-AC-021', 'GJ-AC-022', 'GJ-AC-023', 'GJ-AC-024', 'GJ-AC-025', 'GJ-AC-026', 'GJ-AC-037'],
-  'GJ-05': ['GJ-AC-027', 'GJ-AC-028', 'GJ-AC-029', 'GJ-AC-030', 'GJ-AC-031', 'GJ-AC-032', 'GJ-AC-033'],
-  'GJ-06': ['GJ-AC-036', 'GJ-AC-038', 'GJ-AC-040', 'GJ-AC-041', 'GJ-AC-042', 'GJ-AC-045', 'GJ-AC-055'],
-  'GJ-07': ['GJ-AC-034', 'GJ-AC-035', 'GJ-AC-043', 'GJ-AC-046', 'GJ-AC-047', 'GJ-AC-048', 'GJ-AC-049'],
-  'GJ-08': ['GJ-AC-044', 'GJ-AC-050', 'GJ-AC-051', 'GJ-AC-052', 'GJ-AC-053', 'GJ-AC-054', 'GJ-AC-056'],
-  'GJ-09': ['GJ-AC-039', 'GJ-AC-059', 'GJ-AC-060', 'GJ-AC-061', 'GJ-AC-062', 'GJ-AC-063', 'GJ-AC-064'],
-  'GJ-10': ['GJ-AC-066', 'GJ-AC-067', 'GJ-AC-068', 'GJ-AC-069', 'GJ-AC-070', 'GJ-AC-071', 'GJ-AC-072'],
-  'GJ-11': ['GJ-AC-073', 'GJ-AC-074', 'GJ-AC-075', 'GJ-AC-083', 'GJ-AC-084', 'GJ-AC-085', 'GJ-AC-088'],
-  'GJ-12': ['GJ-AC-076', 'GJ-AC-077', 'GJ-AC-078', 'GJ-AC-079', 'GJ-AC-080', 'GJ-AC-081', 'GJ-AC-082'],
-  'GJ-13': ['GJ-AC-086', 'GJ-AC-087', 'GJ-AC-089', 'GJ-AC-090', 'GJ-AC-091', 'GJ-AC-092', 'GJ-AC-093'],
-  'GJ-14': ['GJ-AC-094', 'GJ-AC-095', 'GJ-AC-096', 'GJ-AC-097', 'GJ-AC-098', 'GJ-AC-099', 'GJ-AC-101'],
-  'GJ-15': ['GJ-AC-100', 'GJ-AC-102', 'GJ-AC-103', 'GJ-AC-104', 'GJ-AC-105', 'GJ-AC-106', 'GJ-AC-107'],
-  'GJ-16': ['GJ-AC-108', 'GJ-AC-109', 'GJ-AC-110', 'GJ-AC-111', 'GJ-AC-112', 'GJ-AC-113', 'GJ-AC-114'],
-  'GJ-17': ['GJ-AC-057', 'GJ-AC-058', 'GJ-AC-115', 'GJ-AC-116', 'GJ-AC-117', 'GJ-AC-118', 'GJ-AC-120'],
-  'GJ-18': ['GJ-AC-119', 'GJ-AC-121', 'GJ-AC-122', 'GJ-AC-124', 'GJ-AC-125', 'GJ-AC-126', 'GJ-AC-127'],
-  'GJ-19': ['GJ-AC-123', 'GJ-AC-129', 'GJ-AC-130', 'GJ-AC-131', 'GJ-AC-132', 'GJ-AC-133', 'GJ-AC-134'],
-  'GJ-20': ['GJ-AC-135', 'GJ-AC-136', 'GJ-AC-141', 'GJ-AC-142', 'GJ-AC-143', 'GJ-AC-144', 'GJ-AC-145'],
-  'GJ-21': ['GJ-AC-128', 'GJ-AC-137', 'GJ-AC-138', 'GJ-AC-139', 'GJ-AC-140', 'GJ-AC-146', 'GJ-AC-148'],
-  'GJ-22': ['GJ-AC-147', 'GJ-AC-149', 'GJ-AC-150', 'GJ-AC-151', 'GJ-AC-152', 'GJ-AC-153', 'GJ-AC-154'],
-  'GJ-23': ['GJ-AC-156', 'GJ-AC-157', 'GJ-AC-158', 'GJ-AC-169', 'GJ-AC-170', 'GJ-AC-171', 'GJ-AC-172'],
-  'GJ-24': ['GJ-AC-155', 'GJ-AC-159', 'GJ-AC-160', 'GJ-AC-161', 'GJ-AC-162', 'GJ-AC-166', 'GJ-AC-167'],
-  'GJ-25': ['GJ-AC-163', 'GJ-AC-164', 'GJ-AC-165', 'GJ-AC-168', 'GJ-AC-174', 'GJ-AC-175', 'GJ-AC-176'],
-  'GJ-26': ['GJ-AC-173', 'GJ-AC-177', 'GJ-AC-178', 'GJ-AC-179', 'GJ-AC-180', 'GJ-AC-181', 'GJ-AC-182'],
-  'HP-01': ['HP-AC-001', 'HP-AC-003', 'HP-AC-004', 'HP-AC-005', 'HP-AC-006', 'HP-AC-007', 'HP-AC-008', 'HP-AC-009', 'HP-AC-012', 'HP-AC-013', 'HP-AC-014', 'HP-AC-015', 'HP-AC-016', 'HP-AC-017', 'HP-AC-018', 'HP-AC-019', 'HP-AC-020'],
-  'HP-02': ['HP-AC-002', 'HP-AC-021', 'HP-AC-022', 'HP-AC-023', 'HP-AC-024', 'HP-AC-025', 'HP-AC-026', 'HP-AC-027', 'HP-AC-028', 'HP-AC-029', 'HP-AC-030', 'HP-AC-031', 'HP-AC-033', 'HP-AC-034', 'HP-AC-035', 'HP-AC-066', 'HP-AC-068'],
-  'HP-04': ['HP-AC-050', 'HP-AC-051', 'HP-AC-052', 'HP-AC-053', 'HP-AC-054', 'HP-AC-055', 'HP-AC-056', 'HP-AC-057', 'HP-AC-058', 'HP-AC-059', 'HP-AC-060', 'HP-AC-061', 'HP-AC-062', 'HP-AC-063', 'HP-AC-064', 'HP-AC-065', 'HP-AC-067'],
-  'HR-01': ['HR-AC-001', 'HR-AC-002', 'HR-AC-003', 'HR-AC-004', 'HR-AC-005', 'HR-AC-006', 'HR-AC-007', 'HR-AC-008', 'HR-AC-009'],
-  'HR-02': ['HR-AC-010', 'HR-AC-011', 'HR-AC-012', 'HR-AC-013', 'HR-AC-014', 'HR-AC-015', 'HR-AC-016', 'HR-AC-017', 'HR-AC-018'],
-  'HR-03': ['HR-AC-038', 'HR-AC-039', 'HR-AC-040', 'HR-AC-041', 'HR-AC-042', 'HR-AC-043', 'HR-AC-044', 'HR-AC-045', 'HR-AC-046'],
-  'HR-04': ['HR-AC-037', 'HR-AC-047', 'HR-AC-048', 'HR-AC-049', 'HR-AC-050', 'HR-AC-051', 'HR-AC-052', 'HR-AC-053', 'HR-AC-059'],
-  'HR-05': ['HR-AC-019', 'HR-AC-020', 'HR-AC-021', 'HR-AC-022', 'HR-AC-023', 'HR-AC-024', 'HR-AC-025', 'HR-AC-026', 'HR-AC-027'],
-  'HR-06': ['HR-AC-028', 'HR-AC-029', 'HR-AC-030', 'HR-AC-031', 'HR-AC-032', 'HR-AC-033', 'HR-AC-034', 'HR-AC-035', 'HR-AC-036'],
-  'HR-07': ['HR-AC-060', 'HR-AC-061', 'HR-AC-062', 'HR-AC-063', 'HR-AC-064', 'HR-AC-065', 'HR-AC-066', 'HR-AC-067', 'HR-AC-073'],
-  'HR-08': ['HR-AC-054', 'HR-AC-055', 'HR-AC-056', 'HR-AC-057', 'HR-AC-058', 'HR-AC-068', 'HR-AC-069', 'HR-AC-070', 'HR-AC-071'],
-  'HR-09': ['HR-AC-072', 'HR-AC-074', 'HR-AC-075', 'HR-AC-076', 'HR-AC-077', 'HR-AC-078', 'HR-AC-079', 'HR-AC-080', 'HR-AC-081'],
-  'HR-10': ['HR-AC-082', 'HR-AC-083', 'HR-AC-084', 'HR-AC-085', 'HR-AC-086', 'HR-AC-087', 'HR-AC-088', 'HR-AC-089', 'HR-AC-090'],
-  'JH-01': ['JH-AC-001', 'JH-AC-002', 'JH-AC-003', 'JH-AC-004', 'JH-AC-005', 'JH-AC-006'],
-  'JH-02': ['JH-AC-007', 'JH-AC-008', 'JH-AC-009', 'JH-AC-010', 'JH-AC-011', 'JH-AC-014'],
-  'JH-03': ['JH-AC-012', 'JH-AC-013', 'JH-AC-015', 'JH-AC-016', 'JH-AC-017', 'JH-AC-018'],
-  'JH-04': ['JH-AC-026', 'JH-AC-027', 'JH-AC-073', 'JH-AC-074', 'JH-AC-075'],
-  'JH-05': ['JH-AC-019', 'JH-AC-020', 'JH-AC-028', 'JH-AC-029', 'JH-AC-030', 'JH-AC-031'],
-  'JH-06': ['JH-AC-032', 'JH-AC-033', 'JH-AC-034', 'JH-AC-035', 'JH-AC-042', 'JH-AC-043'],
-  'JH-07': ['JH-AC-036', 'JH-AC-037', 'JH-AC-038', 'JH-AC-039', 'JH-AC-040', 'JH-AC-041'],
-  'JH-08': ['JH-AC-050', 'JH-AC-061', 'JH-AC-062', 'JH-AC-063', 'JH-AC-064', 'JH-AC-065'],
-  'JH-09': ['JH-AC-044', 'JH-AC-045', 'JH-AC-046', 'JH-AC-047', 'JH-AC-048', 'JH-AC-049'],
-  'JH-10': ['JH-AC-051', 'JH-AC-052', 'JH-AC-053', 'JH-AC-054', 'JH-AC-055', 'JH-AC-056'],
-  'JH-11': ['JH-AC-057', 'JH-AC-058', 'JH-AC-059', 'JH-AC-060', 'JH-AC-070', 'JH-AC-071'],
-  'JH-12': ['JH-AC-066', 'JH-AC-067', 'JH-AC-068', 'JH-AC-069', 'JH-AC-072'],
-  'JH-13': ['JH-AC-076', 'JH-AC-077', 'JH-AC-078', 'JH-AC-079', 'JH-AC-080', 'JH-AC-081'],
-  'JH-14': ['JH-AC-021', 'JH-AC-022', 'JH-AC-023', 'JH-AC-024', 'JH-AC-025'],
-  'JK-01': ['JK-AC-001', 'JK-AC-002', 'JK-AC-003', 'JK-AC-004', 'JK-AC-005', 'JK-AC-006', 'JK-AC-007', 'JK-AC-008', 'JK-AC-009', 'JK-AC-010', 'JK-AC-011', 'JK-AC-012', 'JK-AC-013', 'JK-AC-014', 'JK-AC-015', 'JK-AC-016', 'JK-AC-027', 'JK-AC-028'],
-  'JK-02': ['JK-AC-017', 'JK-AC-018', 'JK-AC-019', 'JK-AC-020', 'JK-AC-021', 'JK-AC-022', 'JK-AC-023', 'JK-AC-024', 'JK-AC-025', 'JK-AC-026', 'JK-AC-029', 'JK-AC-030', 'JK-AC-031', 'JK-AC-032', 'JK-AC-033', 'JK-AC-034', 'JK-AC-035', 'JK-AC-037'],
-  'JK-03': ['JK-AC-036', 'JK-AC-038', 'JK-AC-039', 'JK-AC-040', 'JK-AC-041', 'JK-AC-042', 'JK-AC-043', 'JK-AC-044', 'JK-AC-045', 'JK-AC-046', 'JK-AC-047', 'JK-AC-084', 'JK-AC-085', 'JK-AC-086', 'JK-AC-087', 'JK-AC-088', 'JK-AC-089', 'JK-AC-090'],
-  'JK-04': ['JK-AC-048', 'JK-AC-049', 'JK-AC-050', 'JK-AC-051', 'JK-AC-052', 'JK-AC-053', 'JK-AC-054', 'JK-AC-055', 'JK-AC-059', 'JK-AC-060', 'JK-AC-061', 'JK-AC-062', 'JK-AC-063', 'JK-AC-064', 'JK-AC-065', 'JK-AC-066', 'JK-AC-067', 'JK-AC-068'],
-  'JK-05': ['JK-AC-056', 'JK-AC-057', 'JK-AC-058', 'JK-AC-069', 'JK-AC-070', 'JK-AC-071', 'JK-AC-072', 'JK-AC-073', 'JK-AC-074', 'JK-AC-075', 'JK-AC-076', 'JK-AC-077', 'JK-AC-078', 'JK-AC-079', 'JK-AC-080', 'JK-AC-081', 'JK-AC-082', 'JK-AC-083'],
-  'KA-01': ['KA-AC-001', 'KA-AC-002', 'KA-AC-003', 'KA-AC-004', 'KA-AC-005', 'KA-AC-006', 'KA-AC-007', 'KA-AC-010'],
-  'KA-02': ['KA-AC-008', 'KA-AC-009', 'KA-AC-011', 'KA-AC-012', 'KA-AC-013', 'KA-AC-016', 'KA-AC-017', 'KA-AC-018'],
-  'KA-03': ['KA-AC-019', 'KA-AC-020', 'KA-AC-021', 'KA-AC-022', 'KA-AC-023', 'KA-AC-024', 'KA-AC-025', 'KA-AC-068'],
-  'KA-04': ['KA-AC-026', 'KA-AC-027', 'KA-AC-028', 'KA-AC-029', 'KA-AC-030', 'KA-AC-031', 'KA-AC-032', 'KA-AC-033'],
-  'KA-05': ['KA-AC-034', 'KA-AC-035', 'KA-AC-039', 'KA-AC-040', 'KA-AC-041', 'KA-AC-043', 'KA-AC-044', 'KA-AC-045'],
-  'KA-06': ['KA-AC-036', 'KA-AC-037', 'KA-AC-038', 'KA-AC-053', 'KA-AC-054', 'KA-AC-055', 'KA-AC-056', 'KA-AC-057'],
-  'KA-07': ['KA-AC-042', 'KA-AC-046', 'KA-AC-047', 'KA-AC-048', 'KA-AC-049', 'KA-AC-050', 'KA-AC-051', 'KA-AC-052'],
-  'KA-08': ['KA-AC-058', 'KA-AC-059', 'KA-AC-060', 'KA-AC-061', 'KA-AC-062', 'KA-AC-063', 'KA-AC-064', 'KA-AC-092'],
-  'KA-09': ['KA-AC-088', 'KA-AC-089', 'KA-AC-090', 'KA-AC-091', 'KA-AC-093', 'KA-AC-094', 'KA-AC-095', 'KA-AC-096'],
-  'KA-10': ['KA-AC-065', 'KA-AC-066', 'KA-AC-067', 'KA-AC-082', 'KA-AC-084', 'KA-AC-085', 'KA-AC-086', 'KA-AC-087'],
-  'KA-11': ['KA-AC-069', 'KA-AC-070', 'KA-AC-071', 'KA-AC-072', 'KA-AC-073', 'KA-AC-074', 'KA-AC-075', 'KA-AC-083'],
-  'KA-12': ['KA-AC-014', 'KA-AC-015', 'KA-AC-076', 'KA-AC-077', 'KA-AC-078', 'KA-AC-079', 'KA-AC-080', 'KA-AC-081'],
-  'KA-13': ['KA-AC-103', 'KA-AC-104', 'KA-AC-105', 'KA-AC-106', 'KA-AC-107', 'KA-AC-108', 'KA-AC-109', 'KA-AC-110'],
-  'KA-14': ['KA-AC-111', 'KA-AC-112', 'KA-AC-113', 'KA-AC-114', 'KA-AC-115', 'KA-AC-116', 'KA-AC-117', 'KA-AC-118'],
-  'KA-15': ['KA-AC-119', 'KA-AC-120', 'KA-AC-121', 'KA-AC-122', 'KA-AC-123', 'KA-AC-124', 'KA-AC-125', 'KA-AC-126'],
-  'KA-16': ['KA-AC-127', 'KA-AC-193', 'KA-AC-194', 'KA-AC-195', 'KA-AC-196', 'KA-AC-197', 'KA-AC-198', 'KA-AC-199'],
-  'KA-17': ['KA-AC-200', 'KA-AC-201', 'KA-AC-202', 'KA-AC-203', 'KA-AC-204', 'KA-AC-205', 'KA-AC-206', 'KA-AC-207'],
-  'KA-18': ['KA-AC-097', 'KA-AC-098', 'KA-AC-099', 'KA-AC-100', 'KA-AC-101', 'KA-AC-102', 'KA-AC-136', 'KA-AC-137'],
-  'KA-19': ['KA-AC-128', 'KA-AC-129', 'KA-AC-130', 'KA-AC-132', 'KA-AC-133', 'KA-AC-134', 'KA-AC-135', 'KA-AC-138'],
-  'KA-20': ['KA-AC-186', 'KA-AC-187', 'KA-AC-188', 'KA-AC-189', 'KA-AC-190', 'KA-AC-191', 'KA-AC-192', 'KA-AC-211'],
-  'KA-21': ['KA-AC-208', 'KA-AC-209', 'KA-AC-210', 'KA-AC-212', 'KA-AC-215', 'KA-AC-216', 'KA-AC-217', 'KA-AC-218'],
-  'KA-22': ['KA-AC-213', 'KA-AC-214', 'KA-AC-219', 'KA-AC-220', 'KA-AC-221', 'KA-AC-222', 'KA-AC-223', 'KA-AC-224'],
-  'KA-23': ['KA-AC-131', 'KA-AC-154', 'KA-AC-176', 'KA-AC-177', 'KA-AC-182', 'KA-AC-183', 'KA-AC-184', 'KA-AC-185'],
-  'KA-24': ['KA-AC-151', 'KA-AC-152', 'KA-AC-153', 'KA-AC-155', 'KA-AC-156', 'KA-AC-157', 'KA-AC-158', 'KA-AC-159'],
-  'KA-25': ['KA-AC-160', 'KA-AC-161', 'KA-AC-162', 'KA-AC-163', 'KA-AC-164', 'KA-AC-165', 'KA-AC-168', 'KA-AC-174'],
-  'KA-26': ['KA-AC-166', 'KA-AC-167', 'KA-AC-169', 'KA-AC-170', 'KA-AC-171', 'KA-AC-172', 'KA-AC-173', 'KA-AC-175'],
-  'KA-27': ['KA-AC-139', 'KA-AC-140', 'KA-AC-141', 'KA-AC-150', 'KA-AC-178', 'KA-AC-179', 'KA-AC-180', 'KA-AC-181'],
-  'KA-28': ['KA-AC-142', 'KA-AC-143', 'KA-AC-144', 'KA-AC-145', 'KA-AC-146', 'KA-AC-147', 'KA-AC-148', 'KA-AC-149'],
-  'KL-01': ['KL-AC-001', 'KL-AC-002', 'KL-AC-003', 'KL-AC-004', 'KL-AC-005', 'KL-AC-006', 'KL-AC-007'],
-  'KL-02': ['KL-AC-008', 'KL-AC-009', 'KL-AC-010', 'KL-AC-011', 'KL-AC-012', 'KL-AC-015', 'KL-AC-016'],
-  'KL-03': ['KL-AC-013', 'KL-AC-014', 'KL-AC-020', 'KL-AC-021', 'KL-AC-022', 'KL-AC-023', 'KL-AC-024'],
-  'KL-04': ['KL-AC-017', 'KL-AC-018', 'KL-AC-019', 'KL-AC-032', 'KL-AC-034', 'KL-AC-035', 'KL-AC-036'],
-  'KL-05': ['KL-AC-025', 'KL-AC-026', 'KL-AC-027', 'KL-AC-028', 'KL-AC-029', 'KL-AC-030', 'KL-AC-031'],
-  'KL-06': ['KL-AC-033', 'KL-AC-037', 'KL-AC-038', 'KL-AC-039', 'KL-AC-040', 'KL-AC-041', 'KL-AC-042'],
-  'KL-07': ['KL-AC-043', 'KL-AC-044', 'KL-AC-045', 'KL-AC-046', 'KL-AC-047', 'KL-AC-048', 'KL-AC-049'],
-  'KL-08': ['KL-AC-050', 'KL-AC-051', 'KL-AC-052', 'KL-AC-053', 'KL-AC-054', 'KL-AC-055', 'KL-AC-056'],
-  'KL-09': ['KL-AC-057', 'KL-AC-058', 'KL-AC-059', 'KL-AC-060', 'KL-AC-061', 'KL-AC-062', 'KL-AC-065'],
-  'KL-10': ['KL-AC-063', 'KL-AC-064', 'KL-AC-066', 'KL-AC-067', 'KL-AC-068', 'KL-AC-070', 'KL-AC-071'],
-  'KL-11': ['KL-AC-069', 'KL-AC-072', 'KL-AC-073', 'KL-AC-074', 'KL-AC-075', 'KL-AC-076', 'KL-AC-084'],
-  'KL-12': ['KL-AC-077', 'KL-AC-078', 'KL-AC-079', 'KL-AC-080', 'KL-AC-081', 'KL-AC-082', 'KL-AC-083'],
-  'KL-13': ['KL-AC-086', 'KL-AC-087', 'KL-AC-088', 'KL-AC-089', 'KL-AC-090', 'KL-AC-091', 'KL-AC-092'],
-  'KL-14': ['KL-AC-085', 'KL-AC-093', 'KL-AC-094', 'KL-AC-095', 'KL-AC-096', 'KL-AC-097', 'KL-AC-098'],
-  'KL-15': ['KL-AC-102', 'KL-AC-103', 'KL-AC-104', 'KL-AC-105', 'KL-AC-107', 'KL-AC-108', 'KL-AC-116'],
-  'KL-16': ['KL-AC-099', 'KL-AC-106', 'KL-AC-109', 'KL-AC-110', 'KL-AC-118', 'KL-AC-119', 'KL-AC-120'],
-  'KL-17': ['KL-AC-100', 'KL-AC-101', 'KL-AC-111', 'KL-AC-112', 'KL-AC-113', 'KL-AC-114', 'KL-AC-115'],
-  'KL-18': ['KL-AC-117', 'KL-AC-121', 'KL-AC-122', 'KL-AC-123', 'KL-AC-124', 'KL-AC-125', 'KL-AC-126'],
-  'KL-19': ['KL-AC-127', 'KL-AC-128', 'KL-AC-129', 'KL-AC-130', 'KL-AC-131', 'KL-AC-136', 'KL-AC-138'],
-  'KL-20': ['KL-AC-132', 'KL-AC-133', 'KL-AC-134', 'KL-AC-135', 'KL-AC-137', 'KL-AC-139', 'KL-AC-140'],
-  'MH-01': ['MH-AC-001', 'MH-AC-002', 'MH-AC-003', 'MH-AC-004', 'MH-AC-005', 'MH-AC-009'],
-  'MH-02': ['MH-AC-006', 'MH-AC-007', 'MH-AC-008', 'MH-AC-114', 'MH-AC-115', 'MH-AC-116'],
-  'MH-03': ['MH-AC-013', 'MH-AC-014', 'MH-AC-015', 'MH-AC-016', 'MH-AC-017', 'MH-AC-018'],
-  'MH-04': ['MH-AC-010', 'MH-AC-011', 'MH-AC-012', 'MH-AC-019', 'MH-AC-020', 'MH-AC-021'],
-  'MH-05': ['MH-AC-022', 'MH-AC-023', 'MH-AC-024', 'MH-AC-025', 'MH-AC-026', 'MH-AC-027'],
-  'MH-06': ['MH-AC-028', 'MH-AC-029', 'MH-AC-030', 'MH-AC-031', 'MH-AC-032', 'MH-AC-033'],
-  'MH-07': ['MH-AC-037', 'MH-AC-038', 'MH-AC-039', 'MH-AC-040', 'MH-AC-041', 'MH-AC-042'],
-  'MH-08': ['MH-AC-036', 'MH-AC-043', 'MH-AC-044', 'MH-AC-045', 'MH-AC-046', 'MH-AC-047'],
-  'MH-09': ['MH-AC-048', 'MH-AC-049', 'MH-AC-050', 'MH-AC-051', 'MH-AC-058', 'MH-AC-059'],
-  'MH-10': ['MH-AC-052', 'MH-AC-053', 'MH-AC-054', 'MH-AC-055', 'MH-AC-056', 'MH-AC-057'],
-  'MH-11': ['MH-AC-060', 'MH-AC-061', 'MH-AC-062', 'MH-AC-063', 'MH-AC-064', 'MH-AC-065'],
-  'MH-12': ['MH-AC-066', 'MH-AC-067', 'MH-AC-068', 'MH-AC-069', 'MH-AC-073', 'MH-AC-074'],
-  'MH-13': ['MH-AC-070', 'MH-AC-071', 'MH-AC-072', 'MH-AC-075', 'MH-AC-076', 'MH-AC-080'],
-  'MH-14': ['MH-AC-034', 'MH-AC-035', 'MH-AC-077', 'MH-AC-078', 'MH-AC-079', 'MH-AC-081'],
-  'MH-15': ['MH-AC-082', 'MH-AC-083', 'MH-AC-084', 'MH-AC-092', 'MH-AC-093', 'MH-AC-094'],
-  'MH-16': ['MH-AC-085', 'MH-AC-086', 'MH-AC-087', 'MH-AC-089', 'MH-AC-090', 'MH-AC-091'],
-  'MH-17': ['MH-AC-095', 'MH-AC-096', 'MH-AC-097', 'MH-AC-098', 'MH-AC-099', 'MH-AC-100'],
-  'MH-18': ['MH-AC-101', 'MH-AC-102', 'MH-AC-103', 'MH-AC-104', 'MH-AC-110'],
-  'MH-19': ['BR-AC-222', 'BR-AC-223', 'BR-AC-224', 'BR-AC-225', 'BR-AC-227', 'BR-AC-231', 'MH-AC-105', 'MH-AC-106', 'MH-AC-107', 'MH-AC-108', 'MH-AC-109', 'MH-AC-111', 'MH-AC-112'],
-  'MH-20': ['MH-AC-113', 'MH-AC-117', 'MH-AC-118', 'MH-AC-119', 'MH-AC-121', 'MH-AC-122'],
-  'MH-21': ['MH-AC-120', 'MH-AC-123', 'MH-AC-124', 'MH-AC-125', 'MH-AC-126', 'MH-AC-127'],
-  'MH-22': ['MH-AC-128', 'MH-AC-129', 'MH-AC-130', 'MH-AC-131', 'MH-AC-132', 'MH-AC-133'],
-  'MH-23': ['MH-AC-134', 'MH-AC-135', 'MH-AC-136', 'MH-AC-137', 'MH-AC-138', 'MH-AC-139'],
-  'MH-24': ['MH-AC-140', 'MH-AC-141', 'MH-AC-142', 'MH-AC-143', 'MH-AC-144', 'MH-AC-149'],
-  'MH-25': ['MH-AC-145', 'MH-AC-146', 'MH-AC-147', 'MH-AC-148', 'MH-AC-150', 'MH-AC-151'],
-  'MH-26': ['MH-AC-152', 'MH-AC-153', 'MH-AC-154', 'MH-AC-160', 'MH-AC-161', 'MH-AC-162'],
-  'MH-27': ['MH-AC-158', 'MH-AC-159', 'MH-AC-163', 'MH-AC-164', 'MH-AC-165', 'MH-AC-166'],
-  'MH-28': ['MH-AC-155', 'MH-AC-156', 'MH-AC-157', 'MH-AC-169', 'MH-AC-170', 'MH-AC-171'],
-  'MH-29': ['MH-AC-167', 'MH-AC-168', 'MH-AC-174', 'MH-AC-175', 'MH-AC-176', 'MH-AC-177'],
-  'MH-30': ['MH-AC-172', 'MH-AC-173', 'MH-AC-178', 'MH-AC-179', 'MH-AC-180', 'MH-AC-181'],
-  'MH-31': ['MH-AC-182', 'MH-AC-183', 'MH-AC-184', 'MH-AC-185', 'MH-AC-186', 'MH-AC-187'],
-  'MH-32': ['MH-AC-191', 'MH-AC-192', 'MH-AC-193', 'MH-AC-194', 'MH-AC-263', 'MH-AC-264'],
-  'MH-33': ['MH-AC-188', 'MH-AC-189', 'MH-AC-190', 'MH-AC-204', 'MH-AC-205', 'MH-AC-206'],
-  'MH-34': ['MH-AC-208', 'MH-AC-209', 'MH-AC-210', 'MH-AC-212', 'MH-AC-214', 'MH-AC-215'],
-  'MH-35': ['MH-AC-199', 'MH-AC-200', 'MH-AC-201', 'MH-AC-202', 'MH-AC-203', 'MH-AC-211'],
-  'MH-36': ['MH-AC-195', 'MH-AC-196', 'MH-AC-197', 'MH-AC-198', 'MH-AC-207', 'MH-AC-213'],
-  'MH-37': ['MH-AC-222', 'MH-AC-223', 'MH-AC-224', 'MH-AC-225', 'MH-AC-226', 'MH-AC-227'],
-  'MH-38': ['MH-AC-216', 'MH-AC-217', 'MH-AC-218', 'MH-AC-219', 'MH-AC-220', 'MH-AC-221'],
-  'MH-39': ['MH-AC-228', 'MH-AC-229', 'MH-AC-230', 'MH-AC-231', 'MH-AC-232', 'MH-AC-233'],
-  'MH-40': ['MH-AC-239', 'MH-AC-240', 'MH-AC-241', 'MH-AC-242', 'MH-AC-243', 'MH-AC-246'],
-  'MH-41': ['MH-AC-088', 'MH-AC-234', 'MH-AC-235', 'MH-AC-236', 'MH-AC-237', 'MH-AC-238'],
-  'MH-42': ['MH-AC-247', 'MH-AC-248', 'MH-AC-249', 'MH-AC-250', 'MH-AC-251', 'MH-AC-252'],
-  'MH-43': ['MH-AC-244', 'MH-AC-245', 'MH-AC-253', 'MH-AC-254', 'MH-AC-255'],
-  'MH-44': ['MH-AC-281', 'MH-AC-282', 'MH-AC-285', 'MH-AC-286', 'MH-AC-287', 'MH-AC-288'],
-  'MH-45': ['MH-AC-256', 'MH-AC-257', 'MH-AC-258', 'MH-AC-259', 'MH-AC-260', 'MH-AC-261', 'MH-AC-262'],
-  'MH-46': ['MH-AC-265', 'MH-AC-266', 'MH-AC-267', 'MH-AC-268', 'MH-AC-269', 'MH-AC-270'],
-  'MH-47': ['MH-AC-271', 'MH-AC-272', 'MH-AC-273', 'MH-AC-274', 'MH-AC-275', 'MH-AC-276'],
-  'MH-48': ['MH-AC-277', 'MH-AC-278', 'MH-AC-279', 'MH-AC-280', 'MH-AC-283', 'MH-AC-284'],
-  'ML-01': ['ML-AC-001', 'ML-AC-002', 'ML-AC-003', 'ML-AC-004', 'ML-AC-005', 'ML-AC-006', 'ML-AC-007', 'ML-AC-008', 'ML-AC-009', 'ML-AC-010', 'ML-AC-011', 'ML-AC-012', 'ML-AC-013', 'ML-AC-014', 'ML-AC-015', 'ML-AC-016', 'ML-AC-017', 'ML-AC-018', 'ML-AC-019', 'ML-AC-020', 'ML-AC-021', 'ML-AC-022', 'ML-AC-023', 'ML-AC-024', 'ML-AC-025', 'ML-AC-026', 'ML-AC-027', 'ML-AC-028', 'ML-AC-029', 'ML-AC-030', 'ML-AC-031', 'ML-AC-032', 'ML-AC-033', 'ML-AC-034', 'ML-AC-035', 'ML-AC-036'],
-  'ML-02': ['ML-AC-037', 'ML-AC-038', 'ML-AC-039', 'ML-AC-040', 'ML-AC-041', 'ML-AC-042', 'ML-AC-043', 'ML-AC-044', 'ML-AC-045', 'ML-AC-046', 'ML-AC-047', 'ML-AC-048', 'ML-AC-049', 'ML-AC-050', 'ML-AC-051', 'ML-AC-052', 'ML-AC-053', 'ML-AC-054', 'ML-AC-055', 'ML-AC-056', 'ML-AC-057', 'ML-AC-058', 'ML-AC-059', 'ML-AC-060'],
-  'MN-01': ['MN-AC-001', 'MN-AC-002', 'MN-AC-003', 'MN-AC-004', 'MN-AC-005', 'MN-AC-006', 'MN-AC-007', 'MN-AC-008', 'MN-AC-009', 'MN-AC-010', 'MN-AC-011', 'MN-AC-012', 'MN-AC-013', 'MN-AC-014', 'MN-AC-015', 'MN-AC-016', 'MN-AC-017', 'MN-AC-018', 'MN-AC-019', 'MN-AC-020', 'MN-AC-021', 'MN-AC-022', 'MN-AC-023', 'MN-AC-024', 'MN-AC-025', 'MN-AC-026', 'MN-AC-027', 'MN-AC-028', 'MN-AC-029', 'MN-AC-030', 'MN-AC-031', 'MN-AC-032'],
-  'MN-02': ['MN-AC-033', 'MN-AC-034', 'MN-AC-035', 'MN-AC-036', 'MN-AC-037', 'MN-AC-038', 'MN-AC-039', 'MN-AC-040', 'MN-AC-041', 'MN-AC-042', 'MN-AC-043', 'MN-AC-044', 'MN-AC-045', 'MN-AC-046', 'MN-AC-047', 'MN-AC-048', 'MN-AC-049', 'MN-AC-050', 'MN-AC-051', 'MN-AC-052', 'MN-AC-053', 'MN-AC-054', 'MN-AC-055', 'MN-AC-056', 'MN-AC-057', 'MN-AC-058', 'MN-AC-059', 'MN-AC-060'],
-  'MP-01': ['MP-AC-001', 'MP-AC-002', 'MP-AC-003', 'MP-AC-004', 'MP-AC-005', 'MP-AC-006', 'MP-AC-007', 'MP-AC-008'],
-  'MP-02': ['MP-AC-009', 'MP-AC-010', 'MP-AC-011', 'MP-AC-012', 'MP-AC-013', 'MP-AC-020', 'MP-AC-021', 'MP-AC-022'],
-  'MP-03': ['MP-AC-014', 'MP-AC-015', 'MP-AC-016', 'MP-AC-017', 'MP-AC-018', 'MP-AC-019', 'MP-AC-023', 'MP-AC-024'],
-  'MP-04': ['MP-AC-025', 'MP-AC-026', 'MP-AC-027', 'MP-AC-028', 'MP-AC-029', 'MP-AC-032', 'MP-AC-033', 'MP-AC-034'],
-  'MP-05': ['MP-AC-035', 'MP-AC-036', 'MP-AC-037', 'MP-AC-040', 'MP-AC-041', 'MP-AC-146', 'MP-AC-147', 'MP-AC-148'],
-  'MP-06': ['MP-AC-043', 'MP-AC-044', 'MP-AC-045', 'MP-AC-046', 'MP-AC-047', 'MP-AC-048', 'MP-AC-051', 'MP-AC-052'],
-  'MP-07': ['MP-AC-038', 'MP-AC-039', 'MP-AC-042', 'MP-AC-053', 'MP-AC-054', 'MP-AC-055', 'MP-AC-056', 'MP-AC-057'],
-  'MP-08': ['MP-AC-049', 'MP-AC-050', 'MP-AC-058', 'MP-AC-059', 'MP-AC-060', 'MP-AC-092', 'MP-AC-093', 'MP-AC-094'],
-  'MP-09': ['MP-AC-061', 'MP-AC-062', 'MP-AC-063', 'MP-AC-064', 'MP-AC-065', 'MP-AC-066', 'MP-AC-067'],
-  'MP-10': ['MP-AC-068', 'MP-AC-069', 'MP-AC-070', 'MP-AC-071', 'MP-AC-072', 'MP-AC-073', 'MP-AC-074', 'MP-AC-075'],
-  'MP-11': ['MP-AC-076', 'MP-AC-077', 'MP-AC-078', 'MP-AC-079', 'MP-AC-080', 'MP-AC-081', 'MP-AC-082', 'MP-AC-083'],
-  'MP-12': ['MP-AC-084', 'MP-AC-085', 'MP-AC-086', 'MP-AC-087', 'MP-AC-088', 'MP-AC-089', 'MP-AC-090', 'MP-AC-091'],
-  'MP-13': ['MP-AC-095', 'MP-AC-096', 'MP-AC-097', 'MP-AC-098', 'MP-AC-099', 'MP-AC-100', 'MP-AC-101', 'MP-AC-102'],
-  'MP-14': ['MP-AC-103', 'MP-AC-104', 'MP-AC-105', 'MP-AC-106', 'MP-AC-107', 'MP-AC-116', 'MP-AC-117', 'MP-AC-118'],
-  'MP-15': ['MP-AC-108', 'MP-AC-109', 'MP-AC-110', 'MP-AC-111', 'MP-AC-112', 'MP-AC-113', 'MP-AC-114', 'MP-AC-115'],
-  'MP-16': ['MP-AC-122', 'MP-AC-123', 'MP-AC-124', 'MP-AC-125', 'MP-AC-126', 'MP-AC-127', 'MP-AC-128'],
-  'MP-17': ['MP-AC-119', 'MP-AC-120', 'MP-AC-121', 'MP-AC-136', 'MP-AC-137', 'MP-AC-138', 'MP-AC-139', 'MP-AC-140'],
-  'MP-18': ['MP-AC-141', 'MP-AC-142', 'MP-AC-143', 'MP-AC-144', 'MP-AC-145', 'MP-AC-156', 'MP-AC-158', 'MP-AC-173'],
-  'MP-19': ['MP-AC-149', 'MP-AC-150', 'MP-AC-151', 'MP-AC-152', 'MP-AC-153', 'MP-AC-154', 'MP-AC-155', 'MP-AC-159'],
-  'MP-20': ['MP-AC-030', 'MP-AC-031', 'MP-AC-160', 'MP-AC-161', 'MP-AC-162', 'MP-AC-163', 'MP-AC-164', 'MP-AC-165'],
-  'MP-21': ['MP-AC-157', 'MP-AC-166', 'MP-AC-167', 'MP-AC-168', 'MP-AC-169', 'MP-AC-170', 'MP-AC-171', 'MP-AC-172'],
-  'MP-22': ['MP-AC-212', 'MP-AC-213', 'MP-AC-214', 'MP-AC-215', 'MP-AC-216', 'MP-AC-217', 'MP-AC-218', 'MP-AC-223'],
-  'MP-23': ['MP-AC-222', 'MP-AC-224', 'MP-AC-225', 'MP-AC-226', 'MP-AC-227', 'MP-AC-228', 'MP-AC-229', 'MP-AC-230'],
-  'MP-24': ['MP-AC-191', 'MP-AC-192', 'MP-AC-193', 'MP-AC-194', 'MP-AC-195', 'MP-AC-219', 'MP-AC-220', 'MP-AC-221'],
-  'MP-25': ['MP-AC-196', 'MP-AC-197', 'MP-AC-198', 'MP-AC-199', 'MP-AC-200', 'MP-AC-201', 'MP-AC-202', 'MP-AC-209'],
-  'MP-26': ['MP-AC-203', 'MP-AC-204', 'MP-AC-205', 'MP-AC-206', 'MP-AC-207', 'MP-AC-208', 'MP-AC-210', 'MP-AC-211'],
-  'MP-27': ['MP-AC-183', 'MP-AC-184', 'MP-AC-185', 'MP-AC-186', 'MP-AC-187', 'MP-AC-188', 'MP-AC-189', 'MP-AC-190'],
-  'MP-28': ['MP-AC-174', 'MP-AC-175', 'MP-AC-177', 'MP-AC-178', 'MP-AC-179', 'MP-AC-180', 'MP-AC-181', 'MP-AC-182'],
-  'MP-29': ['MP-AC-129', 'MP-AC-130', 'MP-AC-131', 'MP-AC-132', 'MP-AC-133', 'MP-AC-134', 'MP-AC-135', 'MP-AC-176'],
-  'MZ-01': ['MZ-AC-001', 'MZ-AC-002', 'MZ-AC-003', 'MZ-AC-004', 'MZ-AC-005', 'MZ-AC-006', 'MZ-AC-007', 'MZ-AC-008', 'MZ-AC-009', 'MZ-AC-010', 'MZ-AC-011', 'MZ-AC-012', 'MZ-AC-013', 'MZ-AC-014', 'MZ-AC-015', 'MZ-AC-016', 'MZ-AC-017', 'MZ-AC-018', 'MZ-AC-019', 'MZ-AC-020', 'MZ-AC-021', 'MZ-AC-022', 'MZ-AC-023', 'MZ-AC-024', 'MZ-AC-025', 'MZ-AC-026', 'MZ-AC-027', 'MZ-AC-028', 'MZ-AC-029', 'MZ-AC-030', 'MZ-AC-031', 'MZ-AC-032', 'MZ-AC-033', 'MZ-AC-034', 'MZ-AC-035', 'MZ-AC-036', 'MZ-AC-037', 'MZ-AC-038', 'MZ-AC-039', 'MZ-AC-040'],
-  'NL-01': ['NL-AC-001', 'NL-AC-002', 'NL-AC-003', 'NL-AC-004', 'NL-AC-005', 'NL-AC-006', 'NL-AC-007', 'NL-AC-008', 'NL-AC-009', 'NL-AC-010', 'NL-AC-011', 'NL-AC-012', 'NL-AC-013', 'NL-AC-014', 'NL-AC-015', 'NL-AC-016', 'NL-AC-017', 'NL-AC-018', 'NL-AC-019', 'NL-AC-020', 'NL-AC-021', 'NL-AC-022', 'NL-AC-023', 'NL-AC-024', 'NL-AC-025', 'NL-AC-026', 'NL-AC-027', 'NL-AC-028', 'NL-AC-029', 'NL-AC-030', 'NL-AC-031', 'NL-AC-032', 'NL-AC-033', 'NL-AC-034', 'NL-AC-035', 'NL-AC-036', 'NL-AC-037', 'NL-AC-038', 'NL-AC-039', 'NL-AC-040', 'NL-AC-041', 'NL-AC-042', 'NL-AC-043', 'NL-AC-044', 'NL-AC-045', 'NL-AC-046', 'NL-AC-047', 'NL-AC-048', 'NL-AC-049', 'NL-AC-050', 'NL-AC-051', 'NL-AC-052', 'NL-AC-053', 'NL-AC-054', 'NL-AC-055', 'NL-AC-056', 'NL-AC-057', 'NL-AC-058', 'NL-AC-059', 'NL-AC-060'],
-  'OD-01': ['OD-AC-001', 'OD-AC-002', 'OD-AC-003', 'OD-AC-004', 'OD-AC-005', 'OD-AC-006', 'OD-AC-007'],
-  'OD-02': ['OD-AC-008', 'OD-AC-009', 'OD-AC-010', 'OD-AC-011', 'OD-AC-012', 'OD-AC-013', 'OD-AC-014'],
-  'OD-03': ['OD-AC-015', 'OD-AC-016', 'OD-AC-017', 'OD-AC-018', 'OD-AC-019', 'OD-AC-062', 'OD-AC-063'],
-  'OD-04': ['OD-AC-020', 'OD-AC-021', 'OD-AC-022', 'OD-AC-023', 'OD-AC-024', 'OD-AC-025', 'OD-AC-030'],
-  'OD-05': ['OD-AC-026', 'OD-AC-027', 'OD-AC-028', 'OD-AC-029', 'OD-AC-031', 'OD-AC-033', 'OD-AC-034'],
-  'OD-06': ['OD-AC-032', 'OD-AC-035', 'OD-AC-036', 'OD-AC-037', 'OD-AC-038', 'OD-AC-039', 'OD-AC-040'],
-  'OD-07': ['OD-AC-041', 'OD-AC-042', 'OD-AC-043', 'OD-AC-044', 'OD-AC-045', 'OD-AC-046', 'OD-AC-047'],
-  'OD-08': ['OD-AC-048', 'OD-AC-049', 'OD-AC-050', 'OD-AC-051', 'OD-AC-052', 'OD-AC-053', 'OD-AC-054'],
-  'OD-09': ['OD-AC-055', 'OD-AC-056', 'OD-AC-057', 'OD-AC-058', 'OD-AC-059', 'OD-AC-060', 'OD-AC-061'],
-  'OD-10': ['OD-AC-064', 'OD-AC-065', 'OD-AC-066', 'OD-AC-067', 'OD-AC-068', 'OD-AC-069', 'OD-AC-070'],
-  'OD-11': ['OD-AC-071', 'OD-AC-072', 'OD-AC-077', 'OD-AC-078', 'OD-AC-079', 'OD-AC-080', 'OD-AC-081'],
-  'OD-12': ['OD-AC-073', 'OD-AC-074', 'OD-AC-075', 'OD-AC-076', 'OD-AC-142', 'OD-AC-146', 'OD-AC-147'],
-  'OD-13': ['OD-AC-082', 'OD-AC-083', 'OD-AC-084', 'OD-AC-085', 'OD-AC-086', 'OD-AC-121', 'OD-AC-123'],
-  'OD-14': ['OD-AC-087', 'OD-AC-088', 'OD-AC-089', 'OD-AC-090', 'OD-AC-091', 'OD-AC-093', 'OD-AC-120'],
-  'OD-15': ['OD-AC-094', 'OD-AC-095', 'OD-AC-096', 'OD-AC-097', 'OD-AC-098', 'OD-AC-099', 'OD-AC-100'],
-  'OD-16': ['OD-AC-092', 'OD-AC-101', 'OD-AC-102', 'OD-AC-103', 'OD-AC-104', 'OD-AC-105', 'OD-AC-106'],
-  'OD-17': ['OD-AC-107', 'OD-AC-108', 'OD-AC-109', 'OD-AC-110', 'OD-AC-118', 'OD-AC-119', 'OD-AC-122'],
-  'OD-18': ['OD-AC-111', 'OD-AC-112', 'OD-AC-113', 'OD-AC-114', 'OD-AC-115', 'OD-AC-116', 'OD-AC-117'],
-  'OD-19': ['OD-AC-124', 'OD-AC-125', 'OD-AC-126', 'OD-AC-128', 'OD-AC-129', 'OD-AC-130', 'OD-AC-131'],
-  'OD-20': ['OD-AC-127', 'OD-AC-132', 'OD-AC-133', 'OD-AC-134', 'OD-AC-135', 'OD-AC-136', 'OD-AC-137'],
-  'OD-21': ['OD-AC-138', 'OD-AC-139', 'OD-AC-140', 'OD-AC-141', 'OD-AC-143', 'OD-AC-144', 'OD-AC-145'],
-  'PB-01': ['PB-AC-001', 'PB-AC-002', 'PB-AC-003', 'PB-AC-004', 'PB-AC-005', 'PB-AC-006', 'PB-AC-007', 'PB-AC-009', 'PB-AC-010'],
-  'PB-02': ['PB-AC-011', 'PB-AC-012', 'PB-AC-013', 'PB-AC-015', 'PB-AC-016', 'PB-AC-017', 'PB-AC-018', 'PB-AC-019', 'PB-AC-020'],
-  'PB-03': ['PB-AC-014', 'PB-AC-021', 'PB-AC-022', 'PB-AC-023', 'PB-AC-024', 'PB-AC-025', 'PB-AC-027', 'PB-AC-028', 'PB-AC-075'],
-  'PB-04': ['PB-AC-030', 'PB-AC-031', 'PB-AC-032', 'PB-AC-033', 'PB-AC-034', 'PB-AC-035', 'PB-AC-036', 'PB-AC-037', 'PB-AC-038'],
-  'PB-05': ['PB-AC-008', 'PB-AC-026', 'PB-AC-029', 'PB-AC-039', 'PB-AC-040', 'PB-AC-041', 'PB-AC-042', 'PB-AC-043', 'PB-AC-044'],
-  'PB-06': ['PB-AC-045', 'PB-AC-046', 'PB-AC-047', 'PB-AC-048', 'PB-AC-049', 'PB-AC-050', 'PB-AC-051', 'PB-AC-052', 'PB-AC-053'],
-  'PB-07': ['PB-AC-060', 'PB-AC-061', 'PB-AC-062', 'PB-AC-063', 'PB-AC-064', 'PB-AC-065', 'PB-AC-066', 'PB-AC-068', 'PB-AC-070'],
-  'PB-08': ['PB-AC-054', 'PB-AC-055', 'PB-AC-056', 'PB-AC-057', 'PB-AC-058', 'PB-AC-059', 'PB-AC-067', 'PB-AC-069', 'PB-AC-106'],
-  'PB-09': ['PB-AC-109', 'PB-AC-110', 'PB-AC-111', 'PB-AC-112', 'PB-AC-113', 'PB-AC-114', 'PB-AC-115', 'PB-AC-116', 'PB-AC-117'],
-  'PB-10': ['PB-AC-099', 'PB-AC-100', 'PB-AC-101', 'PB-AC-102', 'PB-AC-103', 'PB-AC-104', 'PB-AC-105', 'PB-AC-107', 'PB-AC-108'],
-  'PB-11': ['PB-AC-083', 'PB-AC-091', 'PB-AC-092', 'PB-AC-093', 'PB-AC-094', 'PB-AC-095', 'PB-AC-096', 'PB-AC-097', 'PB-AC-098'],
-  'PB-12': ['PB-AC-076', 'PB-AC-077', 'PB-AC-078', 'PB-AC-079', 'PB-AC-080', 'PB-AC-081', 'PB-AC-082', 'PB-AC-085', 'PB-AC-086'],
-  'PB-13': ['PB-AC-071', 'PB-AC-072', 'PB-AC-073', 'PB-AC-074', 'PB-AC-084', 'PB-AC-087', 'PB-AC-088', 'PB-AC-089', 'PB-AC-090'],
-  'PY-01': ['PY-AC-001', 'PY-AC-002', 'PY-AC-003', 'PY-AC-004', 'PY-AC-005', 'PY-AC-006', 'PY-AC-007', 'PY-AC-008', 'PY-AC-009', 'PY-AC-010', 'PY-AC-011', 'PY-AC-012', 'PY-AC-013', 'PY-AC-014', 'PY-AC-015', 'PY-AC-016', 'PY-AC-017', 'PY-AC-018', 'PY-AC-019', 'PY-AC-020', 'PY-AC-021', 'PY-AC-022', 'PY-AC-023', 'PY-AC-024', 'PY-AC-025', 'PY-AC-026', 'PY-AC-027', 'PY-AC-028', 'PY-AC-029', 'PY-AC-030'],
-  'RJ-01': ['RJ-AC-001', 'RJ-AC-002', 'RJ-AC-003', 'RJ-AC-004', 'RJ-AC-005', 'RJ-AC-007', 'RJ-AC-008', 'RJ-AC-009'],
-  'RJ-02': ['RJ-AC-006', 'RJ-AC-012', 'RJ-AC-013', 'RJ-AC-014', 'RJ-AC-015', 'RJ-AC-016', 'RJ-AC-017', 'RJ-AC-018'],
-  'RJ-03': ['RJ-AC-010', 'RJ-AC-011', 'RJ-AC-019', 'RJ-AC-020', 'RJ-AC-021', 'RJ-AC-022', 'RJ-AC-023', 'RJ-AC-024'],
-  'RJ-04': ['RJ-AC-025', 'RJ-AC-026', 'RJ-AC-027', 'RJ-AC-028', 'RJ-AC-029', 'RJ-AC-030', 'RJ-AC-031', 'RJ-AC-032'],
-  'RJ-05': ['RJ-AC-033', 'RJ-AC-034', 'RJ-AC-035', 'RJ-AC-036', 'RJ-AC-037', 'RJ-AC-038', 'RJ-AC-039', 'RJ-AC-043'],
-  'RJ-06': ['RJ-AC-040', 'RJ-AC-041', 'RJ-AC-042', 'RJ-AC-044', 'RJ-AC-046', 'RJ-AC-047', 'RJ-AC-048', 'RJ-AC-063'],
-  'RJ-07': ['RJ-AC-049', 'RJ-AC-050', 'RJ-AC-051', 'RJ-AC-052', 'RJ-AC-053', 'RJ-AC-054', 'RJ-AC-055', 'RJ-AC-056'],
-  'RJ-08': ['RJ-AC-059', 'RJ-AC-060', 'RJ-AC-061', 'RJ-AC-062', 'RJ-AC-065', 'RJ-AC-066', 'RJ-AC-067', 'RJ-AC-068'],
-  'RJ-09': ['RJ-AC-069', 'RJ-AC-070', 'RJ-AC-071', 'RJ-AC-072', 'RJ-AC-073', 'RJ-AC-074', 'RJ-AC-075', 'RJ-AC-076'],
-  'RJ-10': ['RJ-AC-077', 'RJ-AC-078', 'RJ-AC-079', 'RJ-AC-080', 'RJ-AC-081', 'RJ-AC-082', 'RJ-AC-083', 'RJ-AC-084'],
-  'RJ-11': ['RJ-AC-057', 'RJ-AC-058', 'RJ-AC-064', 'RJ-AC-085', 'RJ-AC-086', 'RJ-AC-087', 'RJ-AC-088', 'RJ-AC-089'],
-  'RJ-12': ['RJ-AC-090', 'RJ-AC-091', 'RJ-AC-092', 'RJ-AC-093', 'RJ-AC-094', 'RJ-AC-095', 'RJ-AC-096', 'RJ-AC-097'],
-  'RJ-13': ['RJ-AC-045', 'RJ-AC-098', 'RJ-AC-099', 'RJ-AC-100', 'RJ-AC-101', 'RJ-AC-102', 'RJ-AC-104', 'RJ-AC-105'],
-  'RJ-14': ['RJ-AC-106', 'RJ-AC-107', 'RJ-AC-108', 'RJ-AC-109', 'RJ-AC-110', 'RJ-AC-113', 'RJ-AC-114', 'RJ-AC-115'],
-  'RJ-15': ['RJ-AC-117', 'RJ-AC-118', 'RJ-AC-119', 'RJ-AC-120', 'RJ-AC-121', 'RJ-AC-125', 'RJ-AC-126', 'RJ-AC-131'],
-  'RJ-16': ['RJ-AC-122', 'RJ-AC-123', 'RJ-AC-124', 'RJ-AC-127', 'RJ-AC-128', 'RJ-AC-129', 'RJ-AC-130', 'RJ-AC-133'],
-  'RJ-17': ['RJ-AC-132', 'RJ-AC-134', 'RJ-AC-135', 'RJ-AC-136', 'RJ-AC-137', 'RJ-AC-138', 'RJ-AC-139', 'RJ-AC-140'],
-  'RJ-18': ['RJ-AC-141', 'RJ-AC-142', 'RJ-AC-143', 'RJ-AC-144', 'RJ-AC-145', 'RJ-AC-146', 'RJ-AC-147', 'RJ-AC-148'],
-  'RJ-19': ['RJ-AC-149', 'RJ-AC-150', 'RJ-AC-151', 'RJ-AC-152', 'RJ-AC-153', 'RJ-AC-156', 'RJ-AC-157', 'RJ-AC-159'],
-  'RJ-20': ['RJ-AC-158', 'RJ-AC-160', 'RJ-AC-161', 'RJ-AC-162', 'RJ-AC-163', 'RJ-AC-164', 'RJ-AC-165', 'RJ-AC-166'],
-  'RJ-21': ['RJ-AC-154', 'RJ-AC-155', 'RJ-AC-167', 'RJ-AC-168', 'RJ-AC-169', 'RJ-AC-170', 'RJ-AC-171', 'RJ-AC-172'],
-  'RJ-22': ['RJ-AC-103', 'RJ-AC-111', 'RJ-AC-112', 'RJ-AC-116', 'RJ-AC-173', 'RJ-AC-174', 'RJ-AC-175', 'RJ-AC-176'],
-  'RJ-23': ['RJ-AC-177', 'RJ-AC-178', 'RJ-AC-179', 'RJ-AC-180', 'RJ-AC-181', 'RJ-AC-182', 'RJ-AC-183', 'RJ-AC-184'],
-  'RJ-24': ['RJ-AC-185', 'RJ-AC-186', 'RJ-AC-187', 'RJ-AC-188', 'RJ-AC-189', 'RJ-AC-190', 'RJ-AC-191', 'RJ-AC-192'],
-  'RJ-25': ['RJ-AC-193', 'RJ-AC-194', 'RJ-AC-195', 'RJ-AC-196', 'RJ-AC-197', 'RJ-AC-198', 'RJ-AC-199', 'RJ-AC-200'],
-  'SK-01': ['SK-AC-001', 'SK-AC-002', 'SK-AC-003', 'SK-AC-004', 'SK-AC-005', 'SK-AC-006', 'SK-AC-007', 'SK-AC-008', 'SK-AC-009', 'SK-AC-010', 'SK-AC-011', 'SK-AC-012', 'SK-AC-013', 'SK-AC-014', 'SK-AC-015', 'SK-AC-016', 'SK-AC-017', 'SK-AC-018', 'SK-AC-019', 'SK-AC-020', 'SK-AC-021', 'SK-AC-022', 'SK-AC-023', 'SK-AC-024', 'SK-AC-025', 'SK-AC-026', 'SK-AC-027', 'SK-AC-028', 'SK-AC-029', 'SK-AC-030', 'SK-AC-031', 'SK-AC-032'],
-  'TN-01': ['TN-AC-001', 'TN-AC-002', 'TN-AC-004', 'TN-AC-005', 'TN-AC-006', 'TN-AC-009'],
-  'TN-02': ['TN-AC-010', 'TN-AC-011', 'TN-AC-012', 'TN-AC-013', 'TN-AC-015', 'TN-AC-017'],
-  'TN-03': ['TN-AC-022', 'TN-AC-023', 'TN-AC-024', 'TN-AC-025', 'TN-AC-026', 'TN-AC-027'],
-  'TN-04': ['TN-AC-014', 'TN-AC-016', 'TN-AC-018', 'TN-AC-019', 'TN-AC-020', 'TN-AC-021'],
-  'TN-05': ['TN-AC-007', 'TN-AC-008', 'TN-AC-028', 'TN-AC-029', 'TN-AC-030', 'TN-AC-031'],
-  'TN-06': ['TN-AC-032', 'TN-AC-033', 'TN-AC-034', 'TN-AC-035', 'TN-AC-036', 'TN-AC-037'],
-  'TN-07': ['TN-AC-003', 'TN-AC-038', 'TN-AC-039', 'TN-AC-040', 'TN-AC-041', 'TN-AC-042'],
-  'TN-08': ['TN-AC-043', 'TN-AC-044', 'TN-AC-045', 'TN-AC-046', 'TN-AC-047', 'TN-AC-048'],
-  'TN-09': ['TN-AC-051', 'TN-AC-052', 'TN-AC-053', 'TN-AC-054', 'TN-AC-055', 'TN-AC-056'],
-  'TN-10': ['TN-AC-057', 'TN-AC-058', 'TN-AC-059', 'TN-AC-060', 'TN-AC-061', 'TN-AC-085'],
-  'TN-11': ['TN-AC-049', 'TN-AC-050', 'TN-AC-062', 'TN-AC-063', 'TN-AC-064', 'TN-AC-065'],
-  'TN-12': ['TN-AC-066', 'TN-AC-067', 'TN-AC-068', 'TN-AC-069', 'TN-AC-070', 'TN-AC-071'],
-  'TN-13': ['TN-AC-072', 'TN-AC-073', 'TN-AC-074', 'TN-AC-075', 'TN-AC-076', 'TN-AC-077'],
-  'TN-14': ['TN-AC-078', 'TN-AC-079', 'TN-AC-080', 'TN-AC-081', 'TN-AC-082', 'TN-AC-083'],
-  'TN-15': ['TN-AC-084', 'TN-AC-086', 'TN-AC-088', 'TN-AC-089', 'TN-AC-090', 'TN-AC-091'],
-  'TN-16': ['TN-AC-087', 'TN-AC-092', 'TN-AC-093', 'TN-AC-094', 'TN-AC-095', 'TN-AC-096'],
-  'TN-17': ['TN-AC-097', 'TN-AC-098', 'TN-AC-099', 'TN-AC-100', 'TN-AC-101', 'TN-AC-102'],
-  'TN-18': ['TN-AC-103', 'TN-AC-104', 'TN-AC-105', 'TN-AC-106', 'TN-AC-113', 'TN-AC-114'],
-  'TN-19': ['TN-AC-107', 'TN-AC-108', 'TN-AC-109', 'TN-AC-110', 'TN-AC-111', 'TN-AC-112'],
-  'TN-20': ['TN-AC-115', 'TN-AC-116', 'TN-AC-117', 'TN-AC-118', 'TN-AC-120', 'TN-AC-121'],
-  'TN-21': ['TN-AC-119', 'TN-AC-122', 'TN-AC-123', 'TN-AC-124', 'TN-AC-125', 'TN-AC-126'],
-  'TN-22': ['TN-AC-127', 'TN-AC-128', 'TN-AC-129', 'TN-AC-130', 'TN-AC-131', 'TN-AC-132'],
-  'TN-23': ['TN-AC-133', 'TN-AC-134', 'TN-AC-135', 'TN-AC-136', 'TN-AC-138', 'TN-AC-179'],
-  'TN-24': ['TN-AC-139', 'TN-AC-140', 'TN-AC-141', 'TN-AC-142', 'TN-AC-178', 'TN-AC-180'],
-  'TN-25': ['TN-AC-137', 'TN-AC-143', 'TN-AC-144', 'TN-AC-145', 'TN-AC-146', 'TN-AC-147'],
-  'TN-26': ['TN-AC-151', 'TN-AC-152', 'TN-AC-153', 'TN-AC-154', 'TN-AC-155', 'TN-AC-156'],
-  'TN-27': ['TN-AC-148', 'TN-AC-149', 'TN-AC-150', 'TN-AC-157', 'TN-AC-158', 'TN-AC-159'],
-  'TN-28': ['TN-AC-160', 'TN-AC-161', 'TN-AC-162', 'TN-AC-170', 'TN-AC-171', 'TN-AC-172'],
-  'TN-29': ['TN-AC-163', 'TN-AC-164', 'TN-AC-165', 'TN-AC-166', 'TN-AC-168', 'TN-AC-169'],
-  'TN-30': ['TN-AC-167', 'TN-AC-173', 'TN-AC-174', 'TN-AC-175', 'TN-AC-176', 'TN-AC-177'],
-  'TN-31': ['TN-AC-181', 'TN-AC-182', 'TN-AC-184', 'TN-AC-185', 'TN-AC-186', 'TN-AC-187'],
-  'TN-32': ['TN-AC-188', 'TN-AC-189', 'TN-AC-191', 'TN-AC-192', 'TN-AC-193', 'TN-AC-194'],
-  'TN-33': ['TN-AC-190', 'TN-AC-197', 'TN-AC-198', 'TN-AC-199', 'TN-AC-200', 'TN-AC-201'],
-  'TN-34': ['TN-AC-195', 'TN-AC-196', 'TN-AC-204', 'TN-AC-205', 'TN-AC-206', 'TN-AC-207'],
-  'TN-35': ['TN-AC-183', 'TN-AC-208', 'TN-AC-209', 'TN-AC-210', 'TN-AC-211', 'TN-AC-212'],
-  'TN-36': ['TN-AC-213', 'TN-AC-214', 'TN-AC-215', 'TN-AC-216', 'TN-AC-217', 'TN-AC-218'],
-  'TN-37': ['TN-AC-202', 'TN-AC-203', 'TN-AC-219', 'TN-AC-220', 'TN-AC-221', 'TN-AC-222'],
-  'TN-38': ['TN-AC-223', 'TN-AC-224', 'TN-AC-225', 'TN-AC-226', 'TN-AC-227', 'TN-AC-228'],
-  'TN-39': ['TN-AC-229', 'TN-AC-230', 'TN-AC-231', 'TN-AC-232', 'TN-AC-233', 'TN-AC-234'],
-  'TR-01': ['TR-AC-001', 'TR-AC-002', 'TR-AC-003', 'TR-AC-004', 'TR-AC-005', 'TR-AC-006', 'TR-AC-007', 'TR-AC-008', 'TR-AC-009', 'TR-AC-010', 'TR-AC-011', 'TR-AC-012', 'TR-AC-013', 'TR-AC-014', 'TR-AC-015', 'TR-AC-016', 'TR-AC-017', 'TR-AC-018', 'TR-AC-019', 'TR-AC-020', 'TR-AC-021', 'TR-AC-022', 'TR-AC-023', 'TR-AC-030', 'TR-AC-031', 'TR-AC-032', 'TR-AC-033', 'TR-AC-034', 'TR-AC-035', 'TR-AC-036'],
-  'TR-02': ['TR-AC-024', 'TR-AC-025', 'TR-AC-026', 'TR-AC-027', 'TR-AC-028', 'TR-AC-029', 'TR-AC-037', 'TR-AC-038', 'TR-AC-039', 'TR-AC-040', 'TR-AC-041', 'TR-AC-042', 'TR-AC-043', 'TR-AC-044', 'TR-AC-045', 'TR-AC-046', 'TR-AC-047', 'TR-AC-048', 'TR-AC-049', 'TR-AC-050', 'TR-AC-051', 'TR-AC-052', 'TR-AC-053', 'TR-AC-054', 'TR-AC-055', 'TR-AC-056', 'TR-AC-057', 'TR-AC-058', 'TR-AC-059', 'TR-AC-060'],
-  'TS-01': ['TS-AC-001', 'TS-AC-005', 'TS-AC-006', 'TS-AC-007', 'TS-AC-008', 'TS-AC-009', 'TS-AC-010'],
-  'TS-02': ['TS-AC-002', 'TS-AC-003', 'TS-AC-004', 'TS-AC-022', 'TS-AC-023', 'TS-AC-024', 'TS-AC-025'],
-  'TS-03': ['TS-AC-026', 'TS-AC-027', 'TS-AC-028', 'TS-AC-029', 'TS-AC-030', 'TS-AC-031', 'TS-AC-032'],
-  'TS-04': ['TS-AC-011', 'TS-AC-012', 'TS-AC-017', 'TS-AC-018', 'TS-AC-019', 'TS-AC-020', 'TS-AC-021'],
-  'TS-05': ['TS-AC-013', 'TS-AC-014', 'TS-AC-015', 'TS-AC-016', 'TS-AC-035', 'TS-AC-036', 'TS-AC-038'],
-  'TS-06': ['TS-AC-033', 'TS-AC-034', 'TS-AC-037', 'TS-AC-039', 'TS-AC-040', 'TS-AC-041', 'TS-AC-042'],
-  'TS-07': ['TS-AC-043', 'TS-AC-044', 'TS-AC-045', 'TS-AC-046', 'TS-AC-047', 'TS-AC-049', 'TS-AC-071'],
-  'TS-08': ['TS-AC-057', 'TS-AC-059', 'TS-AC-060', 'TS-AC-061', 'TS-AC-062', 'TS-AC-063', 'TS-AC-070'],
-  'TS-09': ['TS-AC-058', 'TS-AC-064', 'TS-AC-065', 'TS-AC-066', 'TS-AC-067', 'TS-AC-068', 'TS-AC-069'],
-  'TS-10': ['TS-AC-050', 'TS-AC-051', 'TS-AC-052', 'TS-AC-053', 'TS-AC-054', 'TS-AC-055', 'TS-AC-056'],
-  'TS-11': ['TS-AC-072', 'TS-AC-073', 'TS-AC-074', 'TS-AC-075', 'TS-AC-076', 'TS-AC-077', 'TS-AC-084'],
-  'TS-12': ['TS-AC-078', 'TS-AC-079', 'TS-AC-080', 'TS-AC-081', 'TS-AC-082', 'TS-AC-083', 'TS-AC-085'],
-  'TS-13': ['TS-AC-086', 'TS-AC-087', 'TS-AC-088', 'TS-AC-089', 'TS-AC-090', 'TS-AC-091', 'TS-AC-092'],
-  'TS-14': ['TS-AC-048', 'TS-AC-093', 'TS-AC-094', 'TS-AC-095', 'TS-AC-096', 'TS-AC-097', 'TS-AC-098'],
-  'TS-15': ['TS-AC-099', 'TS-AC-100', 'TS-AC-104', 'TS-AC-105', 'TS-AC-106', 'TS-AC-107', 'TS-AC-108'],
-  'TS-16': ['TS-AC-101', 'TS-AC-102', 'TS-AC-103', 'TS-AC-109', 'TS-AC-110', 'TS-AC-111', 'TS-AC-119'],
-  'TS-17': ['TS-AC-112', 'TS-AC-113', 'TS-AC-114', 'TS-AC-115', 'TS-AC-116', 'TS-AC-117', 'TS-AC-118'],
-  'UK-01': ['UK-AC-001', 'UK-AC-002', 'UK-AC-003', 'UK-AC-009', 'UK-AC-012', 'UK-AC-013', 'UK-AC-014', 'UK-AC-015', 'UK-AC-016', 'UK-AC-017', 'UK-AC-019', 'UK-AC-020', 'UK-AC-021', 'UK-AC-022'],
-  'UK-02': ['UK-AC-004', 'UK-AC-005', 'UK-AC-006', 'UK-AC-007', 'UK-AC-008', 'UK-AC-010', 'UK-AC-011', 'UK-AC-036', 'UK-AC-037', 'UK-AC-038', 'UK-AC-039', 'UK-AC-040', 'UK-AC-041', 'UK-AC-061'],
-  'UK-03': ['UK-AC-042', 'UK-AC-043', 'UK-AC-044', 'UK-AC-045', 'UK-AC-046', 'UK-AC-047', 'UK-AC-048', 'UK-AC-049', 'UK-AC-050', 'UK-AC-051', 'UK-AC-052', 'UK-AC-053', 'UK-AC-054', 'UK-AC-055'],
-  'UK-04': ['UK-AC-056', 'UK-AC-057', 'UK-AC-058', 'UK-AC-059', 'UK-AC-060', 'UK-AC-062', 'UK-AC-063', 'UK-AC-064', 'UK-AC-065', 'UK-AC-066', 'UK-AC-067', 'UK-AC-068', 'UK-AC-069', 'UK-AC-070'],
-  'UK-05': ['UK-AC-018', 'UK-AC-023', 'UK-AC-024', 'UK-AC-025', 'UK-AC-026', 'UK-AC-027', 'UK-AC-028', 'UK-AC-029', 'UK-AC-030', 'UK-AC-031', 'UK-AC-032', 'UK-AC-033', 'UK-AC-034', 'UK-AC-035'],
-  'UP-01': ['UP-AC-001', 'UP-AC-003', 'UP-AC-004', 'UP-AC-005', 'UP-AC-006'],
-  'UP-02': ['UP-AC-002', 'UP-AC-007', 'UP-AC-008', 'UP-AC-009', 'UP-AC-010'],
-  'UP-03': ['UP-AC-011', 'UP-AC-012', 'UP-AC-014', 'UP-AC-015', 'UP-AC-044'],
-  'UP-04': ['UP-AC-013', 'UP-AC-016', 'UP-AC-022', 'UP-AC-023', 'UP-AC-045'],
-  'UP-05': ['UP-AC-017', 'UP-AC-018', 'UP-AC-020', 'UP-AC-021', 'UP-AC-024'],
-  'UP-06': ['UP-AC-019', 'UP-AC-025', 'UP-AC-026', 'UP-AC-027', 'UP-AC-028'],
-  'UP-07': ['UP-AC-034', 'UP-AC-035', 'UP-AC-036', 'UP-AC-037', 'UP-AC-038'],
-  'UP-08': ['UP-AC-029', 'UP-AC-030', 'UP-AC-031', 'UP-AC-032', 'UP-AC-033'],
-  'UP-09': ['UP-AC-039', 'UP-AC-040', 'UP-AC-041', 'UP-AC-042', 'UP-AC-060'],
-  'UP-10': ['UP-AC-046', 'UP-AC-047', 'UP-AC-048', 'UP-AC-049', 'UP-AC-059'],
-  'UP-11': ['UP-AC-043', 'UP-AC-050', 'UP-AC-051', 'UP-AC-052', 'UP-AC-057'],
-  'UP-12': ['UP-AC-053', 'UP-AC-054', 'UP-AC-055', 'UP-AC-056', 'UP-AC-058'],
-  'UP-13': ['UP-AC-061', 'UP-AC-062', 'UP-AC-063', 'UP-AC-064', 'UP-AC-070'],
-  'UP-14': ['UP-AC-065', 'UP-AC-066', 'UP-AC-067', 'UP-AC-068', 'UP-AC-069'],
-  'UP-15': ['UP-AC-071', 'UP-AC-072', 'UP-AC-073', 'UP-AC-075', 'UP-AC-076'],
-  'UP-16': ['UP-AC-074', 'UP-AC-077', 'UP-AC-078', 'UP-AC-079', 'UP-AC-080'],
-  'UP-17': ['UP-AC-081', 'UP-AC-082', 'UP-AC-083', 'UP-AC-084', 'UP-AC-085'],
-  'UP-18': ['UP-AC-086', 'UP-AC-087', 'UP-AC-088', 'UP-AC-089', 'UP-AC-106', 'UP-AC-259', 'UP-AC-260', 'UP-AC-263', 'UP-AC-264', 'UP-AC-265'],
-  'UP-19': ['UP-AC-090', 'UP-AC-091', 'UP-AC-092', 'UP-AC-093', 'UP-AC-094'],
-  'UP-20': ['UP-AC-095', 'UP-AC-096', 'UP-AC-097', 'UP-AC-098', 'UP-AC-099'],
-  'UP-21': ['UP-AC-107', 'UP-AC-108', 'UP-AC-109', 'UP-AC-110', 'UP-AC-199'],
-  'UP-22': ['UP-AC-100', 'UP-AC-101', 'UP-AC-102', 'UP-AC-104', 'UP-AC-105'],
-  'UP-23': ['UP-AC-111', 'UP-AC-112', 'UP-AC-113', 'UP-AC-114', 'UP-AC-115'],
-  'UP-24': ['UP-AC-116', 'UP-AC-117', 'UP-AC-119', 'UP-AC-120', 'UP-AC-121', 'UP-AC-122', 'UP-AC-123', 'UP-AC-124', 'UP-AC-125', 'UP-AC-126'],
-  'UP-25': ['UP-AC-118', 'UP-AC-127', 'UP-AC-128', 'UP-AC-129', 'UP-AC-130'],
-  'UP-26': ['UP-AC-131', 'UP-AC-132', 'UP-AC-133', 'UP-AC-134', 'UP-AC-135', 'UP-AC-136'],
-  'UP-27': ['UP-AC-137', 'UP-AC-138', 'UP-AC-139', 'UP-AC-140', 'UP-AC-142'],
-  'UP-28': ['UP-AC-141', 'UP-AC-143', 'UP-AC-144', 'UP-AC-145', 'UP-AC-147'],
-  'UP-29': ['UP-AC-146', 'UP-AC-148', 'UP-AC-149', 'UP-AC-150', 'UP-AC-151'],
-  'UP-30': ['UP-AC-154', 'UP-AC-155', 'UP-AC-156', 'UP-AC-157', 'UP-AC-158'],
-  'UP-31': ['UP-AC-153', 'UP-AC-159', 'UP-AC-160', 'UP-AC-161', 'UP-AC-209'],
-  'UP-32': ['UP-AC-162', 'UP-AC-163', 'UP-AC-164', 'UP-AC-165', 'UP-AC-166', 'UP-AC-167'],
-  'UP-33': ['UP-AC-152', 'UP-AC-168', 'UP-AC-169', 'UP-AC-170', 'UP-AC-176'],
-  'UP-34': ['UP-AC-171', 'UP-AC-172', 'UP-AC-173', 'UP-AC-174', 'UP-AC-175'],
-  'UP-35': ['UP-AC-177', 'UP-AC-179', 'UP-AC-180', 'UP-AC-183'],
-  'UP-36': ['UP-AC-178', 'UP-AC-181', 'UP-AC-182', 'UP-AC-184', 'UP-AC-185', 'UP-AC-186'],
-  'UP-37': ['UP-AC-187', 'UP-AC-188', 'UP-AC-189', 'UP-AC-190', 'UP-AC-191'],
-  'UP-38': ['UP-AC-244', 'UP-AC-247', 'UP-AC-248', 'UP-AC-249', 'UP-AC-250'],
-  'UP-39': ['UP-AC-103', 'UP-AC-192', 'UP-AC-193', 'UP-AC-194', 'UP-AC-195'],
-  'UP-40': ['UP-AC-200', 'UP-AC-201', 'UP-AC-203', 'UP-AC-204', 'UP-AC-207'],
-  'UP-41': ['UP-AC-196', 'UP-AC-197', 'UP-AC-198', 'UP-AC-202', 'UP-AC-205'],
-  'UP-42': ['UP-AC-212', 'UP-AC-213', 'UP-AC-214', 'UP-AC-215', 'UP-AC-216'],
-  'UP-43': ['UP-AC-206', 'UP-AC-210', 'UP-AC-211', 'UP-AC-217', 'UP-AC-218'],
-  'UP-44': ['UP-AC-208', 'UP-AC-219', 'UP-AC-220', 'UP-AC-221', 'UP-AC-225'],
-  'UP-45': ['UP-AC-222', 'UP-AC-223', 'UP-AC-224', 'UP-AC-226', 'UP-AC-227'],
-  'UP-46': ['HP-AC-010', 'HP-AC-011', 'HP-AC-032', 'HP-AC-036', 'HP-AC-037', 'HP-AC-038', 'HP-AC-039', 'HP-AC-040', 'HP-AC-041', 'HP-AC-042', 'HP-AC-043', 'HP-AC-044', 'HP-AC-045', 'HP-AC-046', 'HP-AC-047', 'HP-AC-048', 'HP-AC-049', 'UP-AC-228', 'UP-AC-229', 'UP-AC-230', 'UP-AC-231', 'UP-AC-232'],
-  'UP-47': ['UP-AC-233', 'UP-AC-234', 'UP-AC-235', 'UP-AC-236', 'UP-AC-237'],
-  'UP-48': ['UP-AC-238', 'UP-AC-239', 'UP-AC-240', 'UP-AC-241', 'UP-AC-242', 'UP-AC-243'],
-  'UP-49': ['UP-AC-245', 'UP-AC-246', 'UP-AC-251', 'UP-AC-252', 'UP-AC-253'],
-  'UP-50': ['UP-AC-254', 'UP-AC-255', 'UP-AC-256', 'UP-AC-261', 'UP-AC-262'],
-  'UP-52': ['UP-AC-266', 'UP-AC-267', 'UP-AC-268', 'UP-AC-269', 'UP-AC-272'],
-  'UP-53': ['UP-AC-270', 'UP-AC-271', 'UP-AC-273', 'UP-AC-274', 'UP-AC-275'],
-  'UP-54': ['UP-AC-276', 'UP-AC-277', 'UP-AC-278', 'UP-AC-280', 'UP-AC-281'],
-  'UP-55': ['UP-AC-282', 'UP-AC-283', 'UP-AC-284', 'UP-AC-285', 'UP-AC-286'],
-  'UP-56': ['UP-AC-287', 'UP-AC-288', 'UP-AC-297', 'UP-AC-298', 'UP-AC-299'],
-  'UP-57': ['UP-AC-289', 'UP-AC-290', 'UP-AC-291', 'UP-AC-292', 'UP-AC-294'],
-  'UP-58': ['UP-AC-293', 'UP-AC-295', 'UP-AC-296', 'UP-AC-300', 'UP-AC-301'],
-  'UP-59': ['UP-AC-302', 'UP-AC-303', 'UP-AC-304', 'UP-AC-305', 'UP-AC-306'],
-  'UP-60': ['UP-AC-307', 'UP-AC-308', 'UP-AC-309', 'UP-AC-310', 'UP-AC-311'],
-  'UP-61': ['UP-AC-279', 'UP-AC-312', 'UP-AC-313', 'UP-AC-314', 'UP-AC-325'],
-  'UP-62': ['BR-AC-111', 'BR-AC-112', 'BR-AC-113', 'BR-AC-114', 'BR-AC-115', 'BR-AC-116', 'UP-AC-315', 'UP-AC-316', 'UP-AC-317', 'UP-AC-318', 'UP-AC-319'],
-  'UP-63': ['UP-AC-320', 'UP-AC-321', 'UP-AC-322', 'UP-AC-323', 'UP-AC-324'],
-  'UP-64': ['UP-AC-329', 'UP-AC-330', 'UP-AC-333', 'UP-AC-334', 'UP-AC-335'],
-  'UP-65': ['UP-AC-331', 'UP-AC-332', 'UP-AC-337', 'UP-AC-338', 'UP-AC-339'],
-  'UP-66': ['UP-AC-326', 'UP-AC-327', 'UP-AC-328', 'UP-AC-336', 'UP-AC-342'],
-  'UP-68': ['UP-AC-360', 'UP-AC-361', 'UP-AC-363', 'UP-AC-377', 'UP-AC-378'],
-  'UP-69': ['UP-AC-353', 'UP-AC-354', 'UP-AC-355', 'UP-AC-356', 'UP-AC-358'],
-  'UP-70': ['UP-AC-344', 'UP-AC-345', 'UP-AC-346', 'UP-AC-347', 'UP-AC-352'],
-  'UP-71': ['UP-AC-343', 'UP-AC-348', 'UP-AC-349', 'UP-AC-350', 'UP-AC-351'],
-  'UP-72': ['UP-AC-364', 'UP-AC-365', 'UP-AC-366', 'UP-AC-367', 'UP-AC-368'],
-  'UP-73': ['UP-AC-369', 'UP-AC-370', 'UP-AC-371', 'UP-AC-372', 'UP-AC-384'],
-  'UP-74': ['UP-AC-373', 'UP-AC-374', 'UP-AC-375', 'UP-AC-376', 'UP-AC-379'],
-  'UP-75': ['UP-AC-380', 'UP-AC-381', 'UP-AC-382', 'UP-AC-385', 'UP-AC-386'],
-  'UP-76': ['UP-AC-387', 'UP-AC-388', 'UP-AC-389', 'UP-AC-390', 'UP-AC-391'],
-  'UP-77': ['UP-AC-257', 'UP-AC-258', 'UP-AC-392', 'UP-AC-393', 'UP-AC-394'],
-  'UP-78': ['UP-AC-395', 'UP-AC-396', 'UP-AC-397', 'UP-AC-398', 'UP-AC-399'],
-  'UP-79': ['UP-AC-383', 'UP-AC-400', 'UP-AC-401', 'UP-AC-402', 'UP-AC-403'],
-  'UP-80': ['UP-AC-340', 'UP-AC-341', 'UP-AC-357', 'UP-AC-359', 'UP-AC-362'],
-  'WB-01': ['WB-AC-002', 'WB-AC-003', 'WB-AC-004', 'WB-AC-005', 'WB-AC-006', 'WB-AC-007', 'WB-AC-008'],
-  'WB-02': ['WB-AC-009', 'WB-AC-010', 'WB-AC-011', 'WB-AC-012', 'WB-AC-013', 'WB-AC-014', 'WB-AC-021'],
-  'WB-03': ['WB-AC-001', 'WB-AC-015', 'WB-AC-016', 'WB-AC-017', 'WB-AC-018', 'WB-AC-019', 'WB-AC-020'],
-  'WB-04': ['WB-AC-022', 'WB-AC-023', 'WB-AC-024', 'WB-AC-025', 'WB-AC-026', 'WB-AC-027', 'WB-AC-028'],
-  'WB-05': ['WB-AC-029', 'WB-AC-030', 'WB-AC-031', 'WB-AC-032', 'WB-AC-033', 'WB-AC-034', 'WB-AC-035'],
-  'WB-06': ['WB-AC-036', 'WB-AC-037', 'WB-AC-038', 'WB-AC-039', 'WB-AC-040', 'WB-AC-041', 'WB-AC-042'],
-  'WB-07': ['WB-AC-043', 'WB-AC-044', 'WB-AC-045', 'WB-AC-046', 'WB-AC-047', 'WB-AC-048', 'WB-AC-050'],
-  'WB-08': ['WB-AC-049', 'WB-AC-051', 'WB-AC-052', 'WB-AC-053', 'WB-AC-054', 'WB-AC-055', 'WB-AC-056'],
-  'WB-09': ['WB-AC-057', 'WB-AC-058', 'WB-AC-059', 'WB-AC-060', 'WB-AC-061', 'WB-AC-065', 'WB-AC-066'],
-  'WB-10': ['WB-AC-067', 'WB-AC-068', 'WB-AC-069', 'WB-AC-070', 'WB-AC-071', 'WB-AC-072', 'WB-AC-074'],
-  'WB-11': ['WB-AC-062', 'WB-AC-063', 'WB-AC-064', 'WB-AC-073', 'WB-AC-075', 'WB-AC-076', 'WB-AC-077'],
-  'WB-12': ['WB-AC-078', 'WB-AC-079', 'WB-AC-080', 'WB-AC-081', 'WB-AC-082', 'WB-AC-083', 'WB-AC-085'],
-  'WB-13': ['WB-AC-084', 'WB-AC-086', 'WB-AC-087', 'WB-AC-088', 'WB-AC-089', 'WB-AC-090', 'WB-AC-091'],
-  'WB-14': ['WB-AC-092', 'WB-AC-093', 'WB-AC-094', 'WB-AC-095', 'WB-AC-096', 'WB-AC-097', 'WB-AC-098'],
-  'WB-15': ['WB-AC-102', 'WB-AC-103', 'WB-AC-104', 'WB-AC-105', 'WB-AC-106', 'WB-AC-107', 'WB-AC-108'],
-  'WB-16': ['WB-AC-109', 'WB-AC-110', 'WB-AC-111', 'WB-AC-112', 'WB-AC-113', 'WB-AC-114', 'WB-AC-117'],
-  'WB-17': ['WB-AC-100', 'WB-AC-101', 'WB-AC-115', 'WB-AC-116', 'WB-AC-118', 'WB-AC-119', 'WB-AC-120'],
-  'WB-18': ['WB-AC-099', 'WB-AC-121', 'WB-AC-122', 'WB-AC-123', 'WB-AC-124', 'WB-AC-125', 'WB-AC-126'],
-  'WB-19': ['WB-AC-127', 'WB-AC-128', 'WB-AC-129', 'WB-AC-136', 'WB-AC-138', 'WB-AC-139', 'WB-AC-141'],
-  'WB-20': ['WB-AC-130', 'WB-AC-131', 'WB-AC-132', 'WB-AC-133', 'WB-AC-134', 'WB-AC-135', 'WB-AC-142'],
-  'WB-21': ['WB-AC-143', 'WB-AC-144', 'WB-AC-145', 'WB-AC-146', 'WB-AC-155', 'WB-AC-156', 'WB-AC-157'],
-  'WB-22': ['WB-AC-137', 'WB-AC-140', 'WB-AC-147', 'WB-AC-148', 'WB-AC-150', 'WB-AC-151', 'WB-AC-152'],
-  'WB-23': ['WB-AC-149', 'WB-AC-153', 'WB-AC-154', 'WB-AC-158', 'WB-AC-159', 'WB-AC-160', 'WB-AC-161'],
-  'WB-24': ['WB-AC-162', 'WB-AC-163', 'WB-AC-164', 'WB-AC-165', 'WB-AC-166', 'WB-AC-167', 'WB-AC-168'],
-  'WB-25': ['WB-AC-169', 'WB-AC-170', 'WB-AC-171', 'WB-AC-172', 'WB-AC-173', 'WB-AC-174', 'WB-AC-175'],
-  'WB-26': ['WB-AC-176', 'WB-AC-177', 'WB-AC-178', 'WB-AC-179', 'WB-AC-180', 'WB-AC-181', 'WB-AC-182'],
-  'WB-27': ['WB-AC-183', 'WB-AC-184', 'WB-AC-185', 'WB-AC-186', 'WB-AC-187', 'WB-AC-194', 'WB-AC-195'],
-  'WB-28': ['WB-AC-188', 'WB-AC-189', 'WB-AC-190', 'WB-AC-191', 'WB-AC-192', 'WB-AC-193', 'WB-AC-197'],
-  'WB-29': ['WB-AC-196', 'WB-AC-198', 'WB-AC-199', 'WB-AC-200', 'WB-AC-201', 'WB-AC-202', 'WB-AC-232'],
-  'WB-30': ['WB-AC-203', 'WB-AC-204', 'WB-AC-206', 'WB-AC-207', 'WB-AC-208', 'WB-AC-209', 'WB-AC-210'],
-  'WB-31': ['WB-AC-211', 'WB-AC-212', 'WB-AC-213', 'WB-AC-214', 'WB-AC-215', 'WB-AC-216', 'WB-AC-217'],
-  'WB-32': ['WB-AC-205', 'WB-AC-226', 'WB-AC-227', 'WB-AC-229', 'WB-AC-230', 'WB-AC-231', 'WB-AC-235'],
-  'WB-33': ['WB-AC-220', 'WB-AC-221', 'WB-AC-222', 'WB-AC-233', 'WB-AC-234', 'WB-AC-237', 'WB-AC-238'],
-  'WB-34': ['WB-AC-218', 'WB-AC-219', 'WB-AC-223', 'WB-AC-224', 'WB-AC-225', 'WB-AC-228', 'WB-AC-236'],
-  'WB-35': ['WB-AC-239', 'WB-AC-240', 'WB-AC-241', 'WB-AC-242', 'WB-AC-243', 'WB-AC-244', 'WB-AC-245'],
-  'WB-36': ['WB-AC-246', 'WB-AC-247', 'WB-AC-248', 'WB-AC-249', 'WB-AC-250', 'WB-AC-251', 'WB-AC-252'],
-  'WB-37': ['WB-AC-253', 'WB-AC-254', 'WB-AC-255', 'WB-AC-256', 'WB-AC-257', 'WB-AC-258', 'WB-AC-259'],
-  'WB-38': ['WB-AC-261', 'WB-AC-262', 'WB-AC-264', 'WB-AC-265', 'WB-AC-268', 'WB-AC-269', 'WB-AC-270'],
-  'WB-39': ['WB-AC-260', 'WB-AC-263', 'WB-AC-266', 'WB-AC-267', 'WB-AC-274', 'WB-AC-276', 'WB-AC-277'],
-  'WB-40': ['WB-AC-275', 'WB-AC-278', 'WB-AC-279', 'WB-AC-280', 'WB-AC-281', 'WB-AC-282', 'WB-AC-283'],
-  'WB-41': ['WB-AC-271', 'WB-AC-272', 'WB-AC-273', 'WB-AC-286', 'WB-AC-287', 'WB-AC-288', 'WB-AC-290'],
-  'WB-42': ['WB-AC-284', 'WB-AC-285', 'WB-AC-289', 'WB-AC-291', 'WB-AC-292', 'WB-AC-293', 'WB-AC-294'],
-};
+import _s, { acId } from './stringTable';
+// Encoded against stringTable.js stableDigest 477f5c8b8e
+
+// Per PC: PC ID (string index), AC count, then its ACs as numbers
+const _m = [
+  62,7,31010,31011,31012,31013,31028,31029,31053,
+  63,7,31001,31002,31003,31004,31005,31006,31008,
+  64,7,31007,31009,31014,31015,31016,31017,31018,
+  65,7,31019,31020,31021,31022,31023,31024,31025,
+  66,7,31026,31027,31030,31031,31032,31033,31034,
+  67,7,31035,31036,31037,31038,31039,31041,31052,
+  68,7,31042,31043,31044,31045,31046,31047,31048,
+  69,7,31040,31049,31050,31051,31054,31055,31066,
+  70,7,31056,31057,31058,31059,31060,31061,31062,
+  71,7,31063,31064,31065,31067,31068,31070,31073,
+  72,7,31071,31072,31074,31075,31076,31077,31078,
+  73,7,31069,31079,31080,31081,31082,31083,31084,
+  74,7,31086,31087,31088,31091,31093,31094,31095,
+  75,7,31085,31096,31097,31098,31099,31100,31101,
+  76,7,31089,31090,31092,31104,31105,31106,31107,
+  77,7,31102,31103,31108,31110,31111,31112,31113,
+  78,7,31134,31135,31136,31138,31139,31140,31141,
+  79,7,31137,31142,31143,31144,31145,31146,31147,
+  80,7,31148,31149,31150,31151,31152,31153,31154,
+  81,7,31155,31156,31157,31158,31159,31160,31161,
+  82,7,31124,31126,31129,31130,31131,31132,31133,
+  83,7,31109,31114,31115,31116,31117,31118,31123,
+  84,7,31119,31120,31121,31122,31167,31168,31169,
+  85,7,31125,31127,31128,31162,31163,31164,31165,
+  86,7,31166,31170,31171,31172,31173,31174,31175,
+  87,33,32001,32002,32003,32004,32005,32006,32007,32008,32009,32010,32011,32012,32013,32014,32015,32016,32017,32018,32019,32020,32021,32022,32023,32024,32025,32026,32027,32028,32029,32030,32031,32032,32033,
+  88,27,32034,32035,32036,32037,32038,32039,32040,32041,32042,32043,32044,32045,32046,32047,32048,32049,32050,32051,32052,32053,32054,32055,32056,32057,32058,32059,32060,
+  89,6,33121,33122,33123,33124,33125,33126,
+  90,7,33114,33115,33116,33117,33118,33119,33120,
+  91,6,33108,33109,33110,33111,33112,33113,
+  92,11,33006,33007,33008,33009,33010,33011,33012,33014,33017,33022,33023,
+  93,9,33001,33002,33003,33004,33005,33019,33020,33041,33042,
+  94,10,33016,33018,33021,33024,33025,33026,33030,33038,33039,33040,
+  95,10,33013,33015,33027,33028,33029,33033,33034,33035,33036,33037,
+  96,11,33031,33032,33043,33044,33045,33046,33047,33048,33049,33050,33051,
+  97,9,33065,33066,33067,33068,33069,33070,33071,33072,33073,
+  98,8,33052,33053,33054,33055,33056,33058,33060,33061,
+  99,10,33057,33059,33062,33063,33064,33103,33104,33105,33106,33107,
+  100,10,33093,33094,33095,33096,33097,33098,33099,33100,33101,33102,
+  101,10,33083,33084,33085,33086,33087,33088,33089,33090,33091,33092,
+  102,9,33074,33075,33076,33077,33078,33079,33080,33081,33082,
+  103,6,34001,34002,34003,34004,34005,34009,
+  104,6,34006,34007,34008,34010,34011,34012,
+  105,6,34013,34014,34015,34016,34017,34019,
+  106,6,34018,34020,34021,34022,34023,34030,
+  107,6,34024,34025,34026,34027,34028,34029,
+  108,6,34031,34032,34035,34036,34086,34087,
+  109,6,34033,34034,34037,34038,34039,34040,
+  110,6,34041,34042,34043,34044,34045,34072,
+  111,6,34046,34047,34048,34049,34050,34051,
+  112,6,34052,34053,34054,34055,34056,34057,
+  113,6,34063,34064,34065,34066,34067,34068,
+  114,6,34058,34059,34060,34061,34062,34069,
+  115,6,34070,34071,34073,34074,34075,34077,
+  116,6,34079,34080,34081,34082,34083,34085,
+  117,7,34088,34089,34090,34091,34092,34093,34094,
+  118,5,34095,34096,34097,34098,34125,
+  119,6,34099,34100,34101,34102,34103,34104,
+  120,6,34105,34106,34107,34108,34109,34110,
+  122,6,34117,34118,34119,34120,34121,34122,
+  123,6,34123,34124,34126,34127,34128,34129,
+  124,6,34130,34134,34135,34136,34137,34138,
+  125,6,34078,34084,34131,34132,34133,34139,
+  126,7,34141,34142,34143,34144,34145,34146,34147,
+  127,6,34076,34140,34148,34149,34150,34151,
+  128,6,34152,34153,34154,34155,34156,34158,
+  129,6,34157,34159,34160,34161,34162,34163,
+  130,6,34165,34166,34167,34168,34178,34179,
+  131,7,34171,34172,34173,34174,34175,34176,34177,
+  132,6,34180,34181,34182,34183,34184,34185,
+  133,6,34186,34187,34188,34189,34190,34191,
+  134,7,34192,34193,34194,34195,34196,34197,34198,
+  135,6,34199,34200,34201,34202,34203,34210,
+  136,6,34204,34205,34206,34207,34208,34209,
+  137,6,34211,34212,34213,34219,34220,34221,
+  138,6,34214,34215,34216,34217,34218,34233,
+  140,6,34226,34228,34229,34230,34232,34234,
+  141,6,34170,34235,34236,34237,34238,34239,
+  142,6,34164,34169,34240,34241,34242,34243,
+  143,8,35004,35005,35006,35007,35008,35009,35010,35011,
+  144,8,35012,35013,35014,35015,35016,35017,35018,35019,
+  145,8,35033,35034,35035,35036,35037,35038,35043,35044,
+  146,8,35001,35002,35003,35020,35021,35022,35023,35024,
+  147,8,35025,35026,35027,35028,35029,35030,35031,35032,
+  148,8,35071,35072,35073,35074,35075,35076,35077,35078,
+  149,9,35062,35063,35064,35065,35066,35067,35068,35069,35070,
+  150,9,35045,35046,35047,35048,35049,35050,35051,35052,35053,
+  151,8,35039,35040,35041,35042,35054,35055,35057,35058,
+  152,8,35083,35084,35085,35086,35087,35088,35089,35090,
+  153,8,35056,35059,35060,35061,35079,35080,35081,35082,
+  590,10,59004,59014,59015,59016,59017,59018,59019,59020,59021,59022,
+  591,8,59002,59003,59065,59066,59067,59068,59069,59070,
+  592,12,59041,59054,59055,59056,59057,59058,59059,59060,59061,59062,59063,59064,
+  593,10,59023,59024,59025,59038,59039,59040,59042,59043,59044,59050,
+  594,10,59001,59005,59006,59007,59008,59009,59010,59011,59012,59013,
+  595,10,59026,59027,59028,59029,59030,59031,59032,59033,59034,59035,
+  596,10,59036,59037,59045,59046,59047,59048,59049,59051,59052,59053,
+  154,20,36001,36002,36003,36004,36005,36006,36007,36008,36009,36010,36011,36012,36013,36014,36015,36016,36017,36018,36019,36020,
+  155,20,36021,36022,36023,36024,36025,36026,36027,36028,36029,36030,36031,36032,36033,36034,36035,36036,36037,36038,36039,36040,
+  156,7,37001,37002,37003,37004,37005,37006,37065,
+  157,7,37007,37008,37009,37010,37012,37013,37014,
+  158,7,37011,37015,37016,37017,37018,37019,37020,
+  159,7,37021,37022,37023,37024,37025,37026,37037,
+  160,7,37027,37028,37029,37030,37031,37032,37033,
+  161,7,37036,37038,37040,37041,37042,37045,37055,
+  162,7,37034,37035,37043,37046,37047,37048,37049,
+  163,7,37044,37050,37051,37052,37053,37054,37056,
+  164,7,37039,37059,37060,37061,37062,37063,37064,
+  165,7,37066,37067,37068,37069,37070,37071,37072,
+  166,7,37073,37074,37075,37083,37084,37085,37088,
+  167,7,37076,37077,37078,37079,37080,37081,37082,
+  168,7,37086,37087,37089,37090,37091,37092,37093,
+  169,7,37094,37095,37096,37097,37098,37099,37101,
+  170,7,37100,37102,37103,37104,37105,37106,37107,
+  171,7,37108,37109,37110,37111,37112,37113,37114,
+  172,7,37057,37058,37115,37116,37117,37118,37120,
+  173,7,37119,37121,37122,37124,37125,37126,37127,
+  174,7,37123,37129,37130,37131,37132,37133,37134,
+  175,7,37135,37136,37141,37142,37143,37144,37145,
+  176,7,37128,37137,37138,37139,37140,37146,37148,
+  177,7,37147,37149,37150,37151,37152,37153,37154,
+  178,7,37156,37157,37158,37169,37170,37171,37172,
+  179,7,37155,37159,37160,37161,37162,37166,37167,
+  180,7,37163,37164,37165,37168,37174,37175,37176,
+  181,7,37173,37177,37178,37179,37180,37181,37182,
+  192,17,39001,39003,39004,39005,39006,39007,39008,39009,39012,39013,39014,39015,39016,39017,39018,39019,39020,
+  193,17,39002,39021,39022,39023,39024,39025,39026,39027,39028,39029,39030,39031,39033,39034,39035,39066,39068,
+  195,17,39050,39051,39052,39053,39054,39055,39056,39057,39058,39059,39060,39061,39062,39063,39064,39065,39067,
+  182,9,38001,38002,38003,38004,38005,38006,38007,38008,38009,
+  183,9,38010,38011,38012,38013,38014,38015,38016,38017,38018,
+  184,9,38038,38039,38040,38041,38042,38043,38044,38045,38046,
+  185,9,38037,38047,38048,38049,38050,38051,38052,38053,38059,
+  186,9,38019,38020,38021,38022,38023,38024,38025,38026,38027,
+  187,9,38028,38029,38030,38031,38032,38033,38034,38035,38036,
+  188,9,38060,38061,38062,38063,38064,38065,38066,38067,38073,
+  189,9,38054,38055,38056,38057,38058,38068,38069,38070,38071,
+  190,9,38072,38074,38075,38076,38077,38078,38079,38080,38081,
+  191,9,38082,38083,38084,38085,38086,38087,38088,38089,38090,
+  196,6,40001,40002,40003,40004,40005,40006,
+  197,6,40007,40008,40009,40010,40011,40014,
+  198,6,40012,40013,40015,40016,40017,40018,
+  199,5,40026,40027,40073,40074,40075,
+  200,6,40019,40020,40028,40029,40030,40031,
+  201,6,40032,40033,40034,40035,40042,40043,
+  202,6,40036,40037,40038,40039,40040,40041,
+  203,6,40050,40061,40062,40063,40064,40065,
+  204,6,40044,40045,40046,40047,40048,40049,
+  205,6,40051,40052,40053,40054,40055,40056,
+  206,6,40057,40058,40059,40060,40070,40071,
+  207,5,40066,40067,40068,40069,40072,
+  208,6,40076,40077,40078,40079,40080,40081,
+  209,5,40021,40022,40023,40024,40025,
+  597,18,60001,60002,60003,60004,60005,60006,60007,60008,60009,60010,60011,60012,60013,60014,60015,60016,60027,60028,
+  598,18,60017,60018,60019,60020,60021,60022,60023,60024,60025,60026,60029,60030,60031,60032,60033,60034,60035,60037,
+  599,18,60036,60038,60039,60040,60041,60042,60043,60044,60045,60046,60047,60084,60085,60086,60087,60088,60089,60090,
+  600,18,60048,60049,60050,60051,60052,60053,60054,60055,60059,60060,60061,60062,60063,60064,60065,60066,60067,60068,
+  601,18,60056,60057,60058,60069,60070,60071,60072,60073,60074,60075,60076,60077,60078,60079,60080,60081,60082,60083,
+  210,8,41001,41002,41003,41004,41005,41006,41007,41010,
+  211,8,41008,41009,41011,41012,41013,41016,41017,41018,
+  212,8,41019,41020,41021,41022,41023,41024,41025,41068,
+  213,8,41026,41027,41028,41029,41030,41031,41032,41033,
+  214,8,41034,41035,41039,41040,41041,41043,41044,41045,
+  215,8,41036,41037,41038,41053,41054,41055,41056,41057,
+  216,8,41042,41046,41047,41048,41049,41050,41051,41052,
+  217,8,41058,41059,41060,41061,41062,41063,41064,41092,
+  218,8,41088,41089,41090,41091,41093,41094,41095,41096,
+  219,8,41065,41066,41067,41082,41084,41085,41086,41087,
+  220,8,41069,41070,41071,41072,41073,41074,41075,41083,
+  221,8,41014,41015,41076,41077,41078,41079,41080,41081,
+  222,8,41103,41104,41105,41106,41107,41108,41109,41110,
+  223,8,41111,41112,41113,41114,41115,41116,41117,41118,
+  224,8,41119,41120,41121,41122,41123,41124,41125,41126,
+  225,8,41127,41193,41194,41195,41196,41197,41198,41199,
+  226,8,41200,41201,41202,41203,41204,41205,41206,41207,
+  227,8,41097,41098,41099,41100,41101,41102,41136,41137,
+  228,8,41128,41129,41130,41132,41133,41134,41135,41138,
+  229,8,41186,41187,41188,41189,41190,41191,41192,41211,
+  230,8,41208,41209,41210,41212,41215,41216,41217,41218,
+  231,8,41213,41214,41219,41220,41221,41222,41223,41224,
+  232,8,41131,41154,41176,41177,41182,41183,41184,41185,
+  233,8,41151,41152,41153,41155,41156,41157,41158,41159,
+  234,8,41160,41161,41162,41163,41164,41165,41168,41174,
+  235,8,41166,41167,41169,41170,41171,41172,41173,41175,
+  236,8,41139,41140,41141,41150,41178,41179,41180,41181,
+  237,8,41142,41143,41144,41145,41146,41147,41148,41149,
+  238,7,42001,42002,42003,42004,42005,42006,42007,
+  239,7,42008,42009,42010,42011,42012,42015,42016,
+  240,7,42013,42014,42020,42021,42022,42023,42024,
+  241,7,42017,42018,42019,42032,42034,42035,42036,
+  242,7,42025,42026,42027,42028,42029,42030,42031,
+  243,7,42033,42037,42038,42039,42040,42041,42042,
+  244,7,42043,42044,42045,42046,42047,42048,42049,
+  245,7,42050,42051,42052,42053,42054,42055,42056,
+  246,7,42057,42058,42059,42060,42061,42062,42065,
+  247,7,42063,42064,42066,42067,42068,42070,42071,
+  248,7,42069,42072,42073,42074,42075,42076,42084,
+  249,7,42077,42078,42079,42080,42081,42082,42083,
+  250,7,42086,42087,42088,42089,42090,42091,42092,
+  251,7,42085,42093,42094,42095,42096,42097,42098,
+  252,7,42102,42103,42104,42105,42107,42108,42116,
+  253,7,42099,42106,42109,42110,42118,42119,42120,
+  254,7,42100,42101,42111,42112,42113,42114,42115,
+  255,7,42117,42121,42122,42123,42124,42125,42126,
+  256,7,42127,42128,42129,42130,42131,42136,42138,
+  257,7,42132,42133,42134,42135,42137,42139,42140,
+  287,6,44001,44002,44003,44004,44005,44009,
+  288,6,44006,44007,44008,44114,44115,44116,
+  289,6,44013,44014,44015,44016,44017,44018,
+  290,6,44010,44011,44012,44019,44020,44021,
+  291,6,44022,44023,44024,44025,44026,44027,
+  292,6,44028,44029,44030,44031,44032,44033,
+  293,6,44037,44038,44039,44040,44041,44042,
+  294,6,44036,44043,44044,44045,44046,44047,
+  295,6,44048,44049,44050,44051,44058,44059,
+  296,6,44052,44053,44054,44055,44056,44057,
+  297,6,44060,44061,44062,44063,44064,44065,
+  298,6,44066,44067,44068,44069,44073,44074,
+  299,6,44070,44071,44072,44075,44076,44080,
+  300,6,44034,44035,44077,44078,44079,44081,
+  301,6,44082,44083,44084,44092,44093,44094,
+  302,6,44085,44086,44087,44089,44090,44091,
+  303,6,44095,44096,44097,44098,44099,44100,
+  304,5,44101,44102,44103,44104,44110,
+  305,13,34222,34223,34224,34225,34227,34231,44105,44106,44107,44108,44109,44111,44112,
+  306,6,44113,44117,44118,44119,44121,44122,
+  307,6,44120,44123,44124,44125,44126,44127,
+  308,6,44128,44129,44130,44131,44132,44133,
+  309,6,44134,44135,44136,44137,44138,44139,
+  310,6,44140,44141,44142,44143,44144,44149,
+  311,6,44145,44146,44147,44148,44150,44151,
+  312,6,44152,44153,44154,44160,44161,44162,
+  313,6,44158,44159,44163,44164,44165,44166,
+  314,6,44155,44156,44157,44169,44170,44171,
+  315,6,44167,44168,44174,44175,44176,44177,
+  316,6,44172,44173,44178,44179,44180,44181,
+  317,6,44182,44183,44184,44185,44186,44187,
+  318,6,44191,44192,44193,44194,44263,44264,
+  319,6,44188,44189,44190,44204,44205,44206,
+  320,6,44208,44209,44210,44212,44214,44215,
+  321,6,44199,44200,44201,44202,44203,44211,
+  322,6,44195,44196,44197,44198,44207,44213,
+  323,6,44222,44223,44224,44225,44226,44227,
+  324,6,44216,44217,44218,44219,44220,44221,
+  325,6,44228,44229,44230,44231,44232,44233,
+  326,6,44239,44240,44241,44242,44243,44246,
+  327,6,44088,44234,44235,44236,44237,44238,
+  328,6,44247,44248,44249,44250,44251,44252,
+  329,5,44244,44245,44253,44254,44255,
+  330,6,44281,44282,44285,44286,44287,44288,
+  331,7,44256,44257,44258,44259,44260,44261,44262,
+  332,6,44265,44266,44267,44268,44269,44270,
+  333,6,44271,44272,44273,44274,44275,44276,
+  334,6,44277,44278,44279,44280,44283,44284,
+  337,36,46001,46002,46003,46004,46005,46006,46007,46008,46009,46010,46011,46012,46013,46014,46015,46016,46017,46018,46019,46020,46021,46022,46023,46024,46025,46026,46027,46028,46029,46030,46031,46032,46033,46034,46035,46036,
+  338,24,46037,46038,46039,46040,46041,46042,46043,46044,46045,46046,46047,46048,46049,46050,46051,46052,46053,46054,46055,46056,46057,46058,46059,46060,
+  335,32,45001,45002,45003,45004,45005,45006,45007,45008,45009,45010,45011,45012,45013,45014,45015,45016,45017,45018,45019,45020,45021,45022,45023,45024,45025,45026,45027,45028,45029,45030,45031,45032,
+  336,28,45033,45034,45035,45036,45037,45038,45039,45040,45041,45042,45043,45044,45045,45046,45047,45048,45049,45050,45051,45052,45053,45054,45055,45056,45057,45058,45059,45060,
+  258,8,43001,43002,43003,43004,43005,43006,43007,43008,
+  259,8,43009,43010,43011,43012,43013,43020,43021,43022,
+  260,8,43014,43015,43016,43017,43018,43019,43023,43024,
+  261,8,43025,43026,43027,43028,43029,43032,43033,43034,
+  262,8,43035,43036,43037,43040,43041,43146,43147,43148,
+  263,8,43043,43044,43045,43046,43047,43048,43051,43052,
+  264,8,43038,43039,43042,43053,43054,43055,43056,43057,
+  265,8,43049,43050,43058,43059,43060,43092,43093,43094,
+  266,7,43061,43062,43063,43064,43065,43066,43067,
+  267,8,43068,43069,43070,43071,43072,43073,43074,43075,
+  268,8,43076,43077,43078,43079,43080,43081,43082,43083,
+  269,8,43084,43085,43086,43087,43088,43089,43090,43091,
+  270,8,43095,43096,43097,43098,43099,43100,43101,43102,
+  271,8,43103,43104,43105,43106,43107,43116,43117,43118,
+  272,8,43108,43109,43110,43111,43112,43113,43114,43115,
+  273,7,43122,43123,43124,43125,43126,43127,43128,
+  274,8,43119,43120,43121,43136,43137,43138,43139,43140,
+  275,8,43141,43142,43143,43144,43145,43156,43158,43173,
+  276,8,43149,43150,43151,43152,43153,43154,43155,43159,
+  277,8,43030,43031,43160,43161,43162,43163,43164,43165,
+  278,8,43157,43166,43167,43168,43169,43170,43171,43172,
+  279,8,43212,43213,43214,43215,43216,43217,43218,43223,
+  280,8,43222,43224,43225,43226,43227,43228,43229,43230,
+  281,8,43191,43192,43193,43194,43195,43219,43220,43221,
+  282,8,43196,43197,43198,43199,43200,43201,43202,43209,
+  283,8,43203,43204,43205,43206,43207,43208,43210,43211,
+  284,8,43183,43184,43185,43186,43187,43188,43189,43190,
+  285,8,43174,43175,43177,43178,43179,43180,43181,43182,
+  286,8,43129,43130,43131,43132,43133,43134,43135,43176,
+  339,40,47001,47002,47003,47004,47005,47006,47007,47008,47009,47010,47011,47012,47013,47014,47015,47016,47017,47018,47019,47020,47021,47022,47023,47024,47025,47026,47027,47028,47029,47030,47031,47032,47033,47034,47035,47036,47037,47038,47039,47040,
+  340,60,48001,48002,48003,48004,48005,48006,48007,48008,48009,48010,48011,48012,48013,48014,48015,48016,48017,48018,48019,48020,48021,48022,48023,48024,48025,48026,48027,48028,48029,48030,48031,48032,48033,48034,48035,48036,48037,48038,48039,48040,48041,48042,48043,48044,48045,48046,48047,48048,48049,48050,48051,48052,48053,48054,48055,48056,48057,48058,48059,48060,
+  341,7,49001,49002,49003,49004,49005,49006,49007,
+  342,7,49008,49009,49010,49011,49012,49013,49014,
+  343,7,49015,49016,49017,49018,49019,49062,49063,
+  344,7,49020,49021,49022,49023,49024,49025,49030,
+  345,7,49026,49027,49028,49029,49031,49033,49034,
+  346,7,49032,49035,49036,49037,49038,49039,49040,
+  347,7,49041,49042,49043,49044,49045,49046,49047,
+  348,7,49048,49049,49050,49051,49052,49053,49054,
+  349,7,49055,49056,49057,49058,49059,49060,49061,
+  350,7,49064,49065,49066,49067,49068,49069,49070,
+  351,7,49071,49072,49077,49078,49079,49080,49081,
+  352,7,49073,49074,49075,49076,49142,49146,49147,
+  353,7,49082,49083,49084,49085,49086,49121,49123,
+  354,7,49087,49088,49089,49090,49091,49093,49120,
+  355,7,49094,49095,49096,49097,49098,49099,49100,
+  356,7,49092,49101,49102,49103,49104,49105,49106,
+  357,7,49107,49108,49109,49110,49118,49119,49122,
+  358,7,49111,49112,49113,49114,49115,49116,49117,
+  359,7,49124,49125,49126,49128,49129,49130,49131,
+  360,7,49127,49132,49133,49134,49135,49136,49137,
+  361,7,49138,49139,49140,49141,49143,49144,49145,
+  362,9,50001,50002,50003,50004,50005,50006,50007,50009,50010,
+  363,9,50011,50012,50013,50015,50016,50017,50018,50019,50020,
+  364,9,50014,50021,50022,50023,50024,50025,50027,50028,50075,
+  365,9,50030,50031,50032,50033,50034,50035,50036,50037,50038,
+  366,9,50008,50026,50029,50039,50040,50041,50042,50043,50044,
+  367,9,50045,50046,50047,50048,50049,50050,50051,50052,50053,
+  368,9,50060,50061,50062,50063,50064,50065,50066,50068,50070,
+  369,9,50054,50055,50056,50057,50058,50059,50067,50069,50106,
+  370,9,50109,50110,50111,50112,50113,50114,50115,50116,50117,
+  371,9,50099,50100,50101,50102,50103,50104,50105,50107,50108,
+  372,9,50083,50091,50092,50093,50094,50095,50096,50097,50098,
+  373,9,50076,50077,50078,50079,50080,50081,50082,50085,50086,
+  374,9,50071,50072,50073,50074,50084,50087,50088,50089,50090,
+  604,30,61001,61002,61003,61004,61005,61006,61007,61008,61009,61010,61011,61012,61013,61014,61015,61016,61017,61018,61019,61020,61021,61022,61023,61024,61025,61026,61027,61028,61029,61030,
+  375,8,51001,51002,51003,51004,51005,51007,51008,51009,
+  376,8,51006,51012,51013,51014,51015,51016,51017,51018,
+  377,8,51010,51011,51019,51020,51021,51022,51023,51024,
+  378,8,51025,51026,51027,51028,51029,51030,51031,51032,
+  379,8,51033,51034,51035,51036,51037,51038,51039,51043,
+  380,8,51040,51041,51042,51044,51046,51047,51048,51063,
+  381,8,51049,51050,51051,51052,51053,51054,51055,51056,
+  382,8,51059,51060,51061,51062,51065,51066,51067,51068,
+  383,8,51069,51070,51071,51072,51073,51074,51075,51076,
+  384,8,51077,51078,51079,51080,51081,51082,51083,51084,
+  385,8,51057,51058,51064,51085,51086,51087,51088,51089,
+  386,8,51090,51091,51092,51093,51094,51095,51096,51097,
+  387,8,51045,51098,51099,51100,51101,51102,51104,51105,
+  388,8,51106,51107,51108,51109,51110,51113,51114,51115,
+  389,8,51117,51118,51119,51120,51121,51125,51126,51131,
+  390,8,51122,51123,51124,51127,51128,51129,51130,51133,
+  391,8,51132,51134,51135,51136,51137,51138,51139,51140,
+  392,8,51141,51142,51143,51144,51145,51146,51147,51148,
+  393,8,51149,51150,51151,51152,51153,51156,51157,51159,
+  394,8,51158,51160,51161,51162,51163,51164,51165,51166,
+  395,8,51154,51155,51167,51168,51169,51170,51171,51172,
+  396,8,51103,51111,51112,51116,51173,51174,51175,51176,
+  397,8,51177,51178,51179,51180,51181,51182,51183,51184,
+  398,8,51185,51186,51187,51188,51189,51190,51191,51192,
+  399,8,51193,51194,51195,51196,51197,51198,51199,51200,
+  400,32,52001,52002,52003,52004,52005,52006,52007,52008,52009,52010,52011,52012,52013,52014,52015,52016,52017,52018,52019,52020,52021,52022,52023,52024,52025,52026,52027,52028,52029,52030,52031,52032,
+  401,6,53001,53002,53004,53005,53006,53009,
+  402,6,53010,53011,53012,53013,53015,53017,
+  403,6,53022,53023,53024,53025,53026,53027,
+  404,6,53014,53016,53018,53019,53020,53021,
+  405,6,53007,53008,53028,53029,53030,53031,
+  406,6,53032,53033,53034,53035,53036,53037,
+  407,6,53003,53038,53039,53040,53041,53042,
+  408,6,53043,53044,53045,53046,53047,53048,
+  409,6,53051,53052,53053,53054,53055,53056,
+  410,6,53057,53058,53059,53060,53061,53085,
+  411,6,53049,53050,53062,53063,53064,53065,
+  412,6,53066,53067,53068,53069,53070,53071,
+  413,6,53072,53073,53074,53075,53076,53077,
+  414,6,53078,53079,53080,53081,53082,53083,
+  415,6,53084,53086,53088,53089,53090,53091,
+  416,6,53087,53092,53093,53094,53095,53096,
+  417,6,53097,53098,53099,53100,53101,53102,
+  418,6,53103,53104,53105,53106,53113,53114,
+  419,6,53107,53108,53109,53110,53111,53112,
+  420,6,53115,53116,53117,53118,53120,53121,
+  421,6,53119,53122,53123,53124,53125,53126,
+  422,6,53127,53128,53129,53130,53131,53132,
+  423,6,53133,53134,53135,53136,53138,53179,
+  424,6,53139,53140,53141,53142,53178,53180,
+  425,6,53137,53143,53144,53145,53146,53147,
+  426,6,53151,53152,53153,53154,53155,53156,
+  427,6,53148,53149,53150,53157,53158,53159,
+  428,6,53160,53161,53162,53170,53171,53172,
+  429,6,53163,53164,53165,53166,53168,53169,
+  430,6,53167,53173,53174,53175,53176,53177,
+  431,6,53181,53182,53184,53185,53186,53187,
+  432,6,53188,53189,53191,53192,53193,53194,
+  433,6,53190,53197,53198,53199,53200,53201,
+  434,6,53195,53196,53204,53205,53206,53207,
+  435,6,53183,53208,53209,53210,53211,53212,
+  436,6,53213,53214,53215,53216,53217,53218,
+  437,6,53202,53203,53219,53220,53221,53222,
+  438,6,53223,53224,53225,53226,53227,53228,
+  439,6,53229,53230,53231,53232,53233,53234,
+  457,30,55001,55002,55003,55004,55005,55006,55007,55008,55009,55010,55011,55012,55013,55014,55015,55016,55017,55018,55019,55020,55021,55022,55023,55030,55031,55032,55033,55034,55035,55036,
+  458,30,55024,55025,55026,55027,55028,55029,55037,55038,55039,55040,55041,55042,55043,55044,55045,55046,55047,55048,55049,55050,55051,55052,55053,55054,55055,55056,55057,55058,55059,55060,
+  440,7,54001,54005,54006,54007,54008,54009,54010,
+  441,7,54002,54003,54004,54022,54023,54024,54025,
+  442,7,54026,54027,54028,54029,54030,54031,54032,
+  443,7,54011,54012,54017,54018,54019,54020,54021,
+  444,7,54013,54014,54015,54016,54035,54036,54038,
+  445,7,54033,54034,54037,54039,54040,54041,54042,
+  446,7,54043,54044,54045,54046,54047,54049,54071,
+  447,7,54057,54059,54060,54061,54062,54063,54070,
+  448,7,54058,54064,54065,54066,54067,54068,54069,
+  449,7,54050,54051,54052,54053,54054,54055,54056,
+  450,7,54072,54073,54074,54075,54076,54077,54084,
+  451,7,54078,54079,54080,54081,54082,54083,54085,
+  452,7,54086,54087,54088,54089,54090,54091,54092,
+  453,7,54048,54093,54094,54095,54096,54097,54098,
+  454,7,54099,54100,54104,54105,54106,54107,54108,
+  455,7,54101,54102,54103,54109,54110,54111,54119,
+  456,7,54112,54113,54114,54115,54116,54117,54118,
+  539,14,57001,57002,57003,57009,57012,57013,57014,57015,57016,57017,57019,57020,57021,57022,
+  540,14,57004,57005,57006,57007,57008,57010,57011,57036,57037,57038,57039,57040,57041,57061,
+  541,14,57042,57043,57044,57045,57046,57047,57048,57049,57050,57051,57052,57053,57054,57055,
+  542,14,57056,57057,57058,57059,57060,57062,57063,57064,57065,57066,57067,57068,57069,57070,
+  543,14,57018,57023,57024,57025,57026,57027,57028,57029,57030,57031,57032,57033,57034,57035,
+  459,5,56001,56003,56004,56005,56006,
+  460,5,56002,56007,56008,56009,56010,
+  461,5,56011,56012,56014,56015,56044,
+  462,5,56013,56016,56022,56023,56045,
+  463,5,56017,56018,56020,56021,56024,
+  464,5,56019,56025,56026,56027,56028,
+  465,5,56034,56035,56036,56037,56038,
+  466,5,56029,56030,56031,56032,56033,
+  467,5,56039,56040,56041,56042,56060,
+  468,5,56046,56047,56048,56049,56059,
+  469,5,56043,56050,56051,56052,56057,
+  470,5,56053,56054,56055,56056,56058,
+  471,5,56061,56062,56063,56064,56070,
+  472,5,56065,56066,56067,56068,56069,
+  473,5,56071,56072,56073,56075,56076,
+  474,5,56074,56077,56078,56079,56080,
+  475,5,56081,56082,56083,56084,56085,
+  476,10,56086,56087,56088,56089,56106,56259,56260,56263,56264,56265,
+  477,5,56090,56091,56092,56093,56094,
+  478,5,56095,56096,56097,56098,56099,
+  479,5,56107,56108,56109,56110,56199,
+  480,5,56100,56101,56102,56104,56105,
+  481,5,56111,56112,56113,56114,56115,
+  482,10,56116,56117,56119,56120,56121,56122,56123,56124,56125,56126,
+  483,5,56118,56127,56128,56129,56130,
+  484,6,56131,56132,56133,56134,56135,56136,
+  485,5,56137,56138,56139,56140,56142,
+  486,5,56141,56143,56144,56145,56147,
+  487,5,56146,56148,56149,56150,56151,
+  488,5,56154,56155,56156,56157,56158,
+  489,5,56153,56159,56160,56161,56209,
+  490,6,56162,56163,56164,56165,56166,56167,
+  491,5,56152,56168,56169,56170,56176,
+  492,5,56171,56172,56173,56174,56175,
+  493,4,56177,56179,56180,56183,
+  494,6,56178,56181,56182,56184,56185,56186,
+  495,5,56187,56188,56189,56190,56191,
+  496,5,56244,56247,56248,56249,56250,
+  497,5,56103,56192,56193,56194,56195,
+  498,5,56200,56201,56203,56204,56207,
+  499,5,56196,56197,56198,56202,56205,
+  500,5,56212,56213,56214,56215,56216,
+  501,5,56206,56210,56211,56217,56218,
+  502,5,56208,56219,56220,56221,56225,
+  503,5,56222,56223,56224,56226,56227,
+  504,22,39010,39011,39032,39036,39037,39038,39039,39040,39041,39042,39043,39044,39045,39046,39047,39048,39049,56228,56229,56230,56231,56232,
+  505,5,56233,56234,56235,56236,56237,
+  506,6,56238,56239,56240,56241,56242,56243,
+  507,5,56245,56246,56251,56252,56253,
+  508,5,56254,56255,56256,56261,56262,
+  510,5,56266,56267,56268,56269,56272,
+  511,5,56270,56271,56273,56274,56275,
+  512,5,56276,56277,56278,56280,56281,
+  513,5,56282,56283,56284,56285,56286,
+  514,5,56287,56288,56297,56298,56299,
+  515,5,56289,56290,56291,56292,56294,
+  516,5,56293,56295,56296,56300,56301,
+  517,5,56302,56303,56304,56305,56306,
+  518,5,56307,56308,56309,56310,56311,
+  519,5,56279,56312,56313,56314,56325,
+  520,11,34111,34112,34113,34114,34115,34116,56315,56316,56317,56318,56319,
+  521,5,56320,56321,56322,56323,56324,
+  522,5,56329,56330,56333,56334,56335,
+  523,5,56331,56332,56337,56338,56339,
+  524,5,56326,56327,56328,56336,56342,
+  526,5,56360,56361,56363,56377,56378,
+  527,5,56353,56354,56355,56356,56358,
+  528,5,56344,56345,56346,56347,56352,
+  529,5,56343,56348,56349,56350,56351,
+  530,5,56364,56365,56366,56367,56368,
+  531,5,56369,56370,56371,56372,56384,
+  532,5,56373,56374,56375,56376,56379,
+  533,5,56380,56381,56382,56385,56386,
+  534,5,56387,56388,56389,56390,56391,
+  535,5,56257,56258,56392,56393,56394,
+  536,5,56395,56396,56397,56398,56399,
+  537,5,56383,56400,56401,56402,56403,
+  538,5,56340,56341,56357,56359,56362,
+  544,7,58002,58003,58004,58005,58006,58007,58008,
+  545,7,58009,58010,58011,58012,58013,58014,58021,
+  546,7,58001,58015,58016,58017,58018,58019,58020,
+  547,7,58022,58023,58024,58025,58026,58027,58028,
+  548,7,58029,58030,58031,58032,58033,58034,58035,
+  549,7,58036,58037,58038,58039,58040,58041,58042,
+  550,7,58043,58044,58045,58046,58047,58048,58050,
+  551,7,58049,58051,58052,58053,58054,58055,58056,
+  552,7,58057,58058,58059,58060,58061,58065,58066,
+  553,7,58067,58068,58069,58070,58071,58072,58074,
+  554,7,58062,58063,58064,58073,58075,58076,58077,
+  555,7,58078,58079,58080,58081,58082,58083,58085,
+  556,7,58084,58086,58087,58088,58089,58090,58091,
+  557,7,58092,58093,58094,58095,58096,58097,58098,
+  558,7,58102,58103,58104,58105,58106,58107,58108,
+  559,7,58109,58110,58111,58112,58113,58114,58117,
+  560,7,58100,58101,58115,58116,58118,58119,58120,
+  561,7,58099,58121,58122,58123,58124,58125,58126,
+  562,7,58127,58128,58129,58136,58138,58139,58141,
+  563,7,58130,58131,58132,58133,58134,58135,58142,
+  564,7,58143,58144,58145,58146,58155,58156,58157,
+  565,7,58137,58140,58147,58148,58150,58151,58152,
+  566,7,58149,58153,58154,58158,58159,58160,58161,
+  567,7,58162,58163,58164,58165,58166,58167,58168,
+  568,7,58169,58170,58171,58172,58173,58174,58175,
+  569,7,58176,58177,58178,58179,58180,58181,58182,
+  570,7,58183,58184,58185,58186,58187,58194,58195,
+  571,7,58188,58189,58190,58191,58192,58193,58197,
+  572,7,58196,58198,58199,58200,58201,58202,58232,
+  573,7,58203,58204,58206,58207,58208,58209,58210,
+  574,7,58211,58212,58213,58214,58215,58216,58217,
+  575,7,58205,58226,58227,58229,58230,58231,58235,
+  576,7,58220,58221,58222,58233,58234,58237,58238,
+  577,7,58218,58219,58223,58224,58225,58228,58236,
+  578,7,58239,58240,58241,58242,58243,58244,58245,
+  579,7,58246,58247,58248,58249,58250,58251,58252,
+  580,7,58253,58254,58255,58256,58257,58258,58259,
+  581,7,58261,58262,58264,58265,58268,58269,58270,
+  582,7,58260,58263,58266,58267,58274,58276,58277,
+  583,7,58275,58278,58279,58280,58281,58282,58283,
+  584,7,58271,58272,58273,58286,58287,58288,58290,
+  585,7,58284,58285,58289,58291,58292,58293,58294,
+];
+
+const pcToAcMapping = {};
+for (let i = 0; i < _m.length; i += 2 + _m[i + 1]) {
+  pcToAcMapping[_s[_m[i]]] = _m.slice(i + 2, i + 2 + _m[i + 1]).map(acId);
+}
 
 export default pcToAcMapping;
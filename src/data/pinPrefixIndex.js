@@ -0,0 +1,374 @@
+// PIN prefix → Lok Sabha PC → Assembly AC lookup index
+// prefix: [PC IDs in constituencies.js order, [[PC ID, [AC IDs]], ...]]
+// ACs are pre-sorted by state, then name; PC groups follow their first AC
+// 352 prefixes, 536 PC groups
+// Dictionary-encoded against stringTable.js; decoded once below
+
+import _s, { acId } from './stringTable';
+// Encoded against stringTable.js stableDigest 477f5c8b8e
+
+const _p = {
+  '110': [[590,591,592,593,594,595,596],[[590,[59004,59022,59020,59021,59018,59019,59015,59014,59016,59017]],[596,[59048,59053,59036,59046,59047,59051,59045,59037,59049,59052]],[591,[59067,59002,59066,59068,59070,59069,59065,59003]],[594,[59005,59007,59009,59012,59008,59011,59001,59006,59013,59010]],[593,[59038,59050,59023,59042,59043,59025,59040,59024,59044,59039]],[595,[59033,59028,59030,59026,59034,59035,59027,59029,59032,59031]],[592,[59061,59041,59056,59060,59058,59054,59057,59064,59063,59062,59055,59059]]]],
+  '121': [[191],[[191,[38087,38088,38089,38086,38082,38083,38084,38085,38090]]]],
+  '122': [[190],[[190,[38076,38072,38080,38077,38079,38075,38081,38074,38078]]]],
+  '124': [[188],[[188,[38065,38064,38067,38061,38066,38063,38073,38060,38062]]]],
+  '125': [[184,185],[[185,[38047,38051,38059,38050,38052,38053,38049,38037,38048]],[184,[38043,38046,38040,38042,38038,38044,38041,38045,38039]]]],
+  '127': [[189],[[189,[38068,38055,38057,38056,38054,38069,38071,38070,38058]]]],
+  '131': [[187],[[187,[38033,38028,38032,38036,38034,38030,38029,38035,38031]]]],
+  '132': [[186],[[186,[38023,38022,38020,38026,38021,38019,38025,38024,38027]]]],
+  '133': [[182],[[182,[38004,38005,38008,38001,38006,38003,38002,38007,38009]]]],
+  '134': [[182],[[182,[38004,38005,38008,38001,38006,38003,38002,38007,38009]]]],
+  '136': [[183],[[183,[38015,38017,38016,38011,38014,38018,38010,38012,38013]]]],
+  '140': [[367,369],[[369,[50106,50056,50054,50055,50057,50067,50069,50059,50058]],[367,[50049,50048,50046,50051,50045,50052,50047,50050,50053]]]],
+  '141': [[368],[[368,[50062,50068,50066,50070,50063,50060,50065,50061,50064]]]],
+  '143': [[362,363,364],[[363,[50011,50017,50018,50015,50019,50016,50020,50013,50012]],[364,[50025,50014,50027,50024,50022,50023,50028,50021,50075]],[362,[50007,50002,50010,50005,50009,50004,50003,50006,50001]]]],
+  '144': [[365],[[365,[50038,50037,50035,50036,50034,50033,50031,50030,50032]]]],
+  '146': [[366],[[366,[50026,50044,50040,50043,50039,50029,50042,50008,50041]]]],
+  '147': [[370],[[370,[50112,50113,50109,50115,50110,50111,50116,50114,50117]]]],
+  '148': [[371],[[371,[50103,50102,50107,50100,50099,50105,50104,50108,50101]]]],
+  '151': [[372,374],[[372,[50093,50092,50091,50098,50083,50096,50095,50097,50094]],[374,[50072,50074,50087,50084,50089,50088,50073,50071,50090]]]],
+  '152': [[373],[[373,[50081,50082,50080,50076,50077,50078,50079,50085,50086]]]],
+  '160': [[587],[]],
+  '171': [[195],[[195,[39050,39060,39052,39065,39054,39062,39056,39051,39055,39058,39067,39059,39063,39064,39053,39057,39061]]]],
+  '175': [[193],[[193,[39025,39034,39024,39002,39030,39031,39026,39068,39023,39021,39022,39033,39028,39066,39035,39029,39027]]]],
+  '176': [[192],[[192,[39020,39005,39003,39001,39004,39018,39008,39007,39013,39012,39009,39016,39015,39006,39019,39017,39014]]]],
+  '177': [[194],[]],
+  '180': [[601],[[601,[60081,60075,60072,60082,60056,60076,60079,60078,60083,60080,60077,60074,60069,60057,60070,60058,60073,60071]]]],
+  '182': [[600],[[600,[60063,60055,60065,60051,60064,60061,60052,60053,60068,60048,60066,60067,60049,60050,60054,60062,60060,60059]]]],
+  '190': [[598],[[598,[60026,60031,60023,60030,60025,60018,60021,60019,60017,60029,60020,60022,60032,60034,60035,60037,60033,60024]]]],
+  '192': [[599],[[599,[60044,60043,60086,60038,60040,60041,60042,60039,60090,60084,60047,60089,60085,60046,60045,60088,60087,60036]]]],
+  '193': [[597],[[597,[60015,60010,60028,60027,60011,60016,60005,60001,60003,60006,60004,60013,60008,60014,60007,60002,60009,60012]]]],
+  '194': [[602],[]],
+  '201': [[470,471],[[471,[56062,56063,56070,56061,56064]],[470,[56058,56056,56053,56054,56055]]]],
+  '202': [[473],[[473,[56076,56073,56072,56071,56075]]]],
+  '203': [[472],[[472,[56067,56065,56068,56069,56066]]]],
+  '204': [[474],[[474,[56074,56078,56077,56079,56080]]]],
+  '205': [[479],[[479,[56108,56199,56110,56109,56107]]]],
+  '206': [[498],[[498,[56204,56201,56203,56200,56207]]]],
+  '207': [[480],[[480,[56101,56104,56100,56105,56102]]]],
+  '208': [[500],[[500,[56214,56212,56216,56215,56213]]]],
+  '209': [[490,497,499],[[497,[56103,56193,56195,56194,56192]],[490,[56162,56166,56164,56167,56163,56165]],[499,[56202,56196,56198,56205,56197]]]],
+  '210': [[504,505],[[504,[39039,39036,39048,39041,39010,39032,39042,39047,39038,39043,39011,39046,39045,39040,39049,39037,39044,56231,56228,56230,56229,56232]],[505,[56233,56235,56236,56237,56234]]]],
+  '211': [[508,509],[[508,[56254,56256,56262,56261,56255]]]],
+  '212': [[506,507],[[506,[56241,56239,56240,56242,56238,56243]],[507,[56245,56253,56246,56252,56251]]]],
+  '221': [[534,535],[[535,[56394,56392,56393,56258,56257]],[534,[56387,56391,56390,56388,56389]]]],
+  '222': [[530,531],[[530,[56364,56366,56367,56368,56365]],[531,[56372,56369,56370,56384,56371]]]],
+  '224': [[501,511,512],[[512,[56281,56276,56280,56277,56278]],[501,[56206,56210,56218,56211,56217]],[511,[56275,56274,56270,56273,56271]]]],
+  '225': [[510],[[510,[56268,56272,56266,56267,56269]]]],
+  '226': [[491,492],[[491,[56169,56168,56176,56170,56152]],[492,[56175,56174,56173,56172,56171]]]],
+  '227': [[494],[[494,[56186,56185,56184,56181,56182,56178]]]],
+  '228': [[495],[[495,[56187,56191,56190,56189,56188]]]],
+  '229': [[493,529],[[529,[56343,56350,56351,56348,56349]],[493,[56177,56179,56180,56183]]]],
+  '230': [[496],[[496,[56249,56248,56244,56250,56247]]]],
+  '231': [[536,537],[[537,[56383,56403,56400,56402,56401]],[536,[56395,56398,56397,56399,56396]]]],
+  '232': [[533],[[533,[56385,56380,56382,56381,56386]]]],
+  '233': [[532],[[532,[56375,56373,56376,56374,56379]]]],
+  '241': [[488],[[488,[56157,56156,56158,56154,56155]]]],
+  '242': [[484],[[484,[56136,56132,56131,56134,56135,56133]]]],
+  '243': [[481,482],[[482,[56126,56124,56125,56120,56123,56117,56122,56119,56121,56116]],[481,[56115,56114,56112,56111,56113]]]],
+  '244': [[464,465,466,467],[[467,[56041,56039,56060,56042,56040]],[466,[56032,56030,56031,56029,56033]],[464,[56019,56025,56028,56027,56026]],[465,[56036,56035,56038,56037,56034]]]],
+  '246': [[462,463,540],[[462,[56022,56023,56045,56016,56013]],[463,[56020,56018,56017,56021,56024]],[540,[57004,57039,57010,57006,57007,57041,57040,57011,57037,57061,57008,57038,57005,57036]]]],
+  '247': [[459,460],[[459,[56001,56005,56006,56004,56003]],[460,[56007,56008,56002,56010,56009]]]],
+  '249': [[539,543],[[543,[57028,57026,57018,57023,57025,57035,57029,57027,57032,57034,57033,57030,57024,57031]],[539,[57015,57021,57014,57003,57009,57022,57012,57001,57019,57020,57017,57013,57016,57002]]]],
+  '250': [[468,469],[[469,[56052,56051,56050,56057,56043]],[468,[56059,56046,56048,56047,56049]]]],
+  '251': [[461],[[461,[56011,56012,56015,56014,56044]]]],
+  '261': [[487,489],[[489,[56160,56159,56209,56153,56161]],[487,[56149,56148,56151,56150,56146]]]],
+  '262': [[483,485,486],[[483,[56118,56128,56130,56127,56129]],[486,[56141,56147,56143,56145,56144]],[485,[56139,56142,56138,56137,56140]]]],
+  '263': [[541,542],[[541,[57052,57047,57055,57042,57043,57048,57045,57053,57046,57054,57044,57050,57049,57051]],[542,[57064,57057,57065,57059,57062,57060,57063,57070,57067,57056,57058,57069,57066,57068]]]],
+  '271': [[513,514,515,516],[[513,[56286,56282,56285,56284,56283]],[515,[56294,56289,56292,56290,56291]],[514,[56298,56288,56297,56287,56299]],[516,[56301,56296,56300,56295,56293]]]],
+  '272': [[517,518,519],[[519,[56279,56314,56325,56313,56312]],[517,[56304,56306,56305,56303,56302]],[518,[56310,56307,56308,56311,56309]]]],
+  '273': [[520,521,524],[[520,[34115,34113,34111,34112,34114,34116,56318,56316,56319,56315,56317]],[524,[56327,56342,56326,56328,56336]],[521,[56320,56323,56322,56321,56324]]]],
+  '274': [[522,523],[[523,[56337,56332,56338,56339,56331]],[522,[56334,56329,56333,56330,56335]]]],
+  '275': [[527],[[527,[56354,56353,56356,56355,56358]]]],
+  '276': [[525,528,538],[[528,[56347,56344,56352,56346,56345]],[538,[56362,56357,56340,56341,56359]]]],
+  '277': [[526],[[526,[56363,56361,56378,56360,56377]]]],
+  '281': [[475],[[475,[56085,56081,56083,56082,56084]]]],
+  '282': [[476],[[476,[56087,56089,56088,56264,56086,56106,56260,56265,56259,56263]]]],
+  '283': [[477,478],[[477,[56090,56094,56093,56091,56092]],[478,[56097,56096,56098,56099,56095]]]],
+  '284': [[503],[[503,[56222,56223,56226,56224,56227]]]],
+  '285': [[502],[[502,[56208,56225,56220,56219,56221]]]],
+  '301': [[382],[[382,[51065,51066,51062,51060,51061,51068,51067,51059]]]],
+  '302': [[381],[[381,[51053,51056,51051,51049,51052,51054,51055,51050]]]],
+  '303': [[380,385],[[380,[51047,51063,51048,51046,51040,51044,51042,51041]],[385,[51085,51057,51058,51088,51089,51086,51087,51064]]]],
+  '304': [[386],[[386,[51091,51097,51090,51093,51094,51095,51092,51096]]]],
+  '305': [[387],[[387,[51100,51101,51045,51105,51098,51104,51102,51099]]]],
+  '306': [[389],[[389,[51120,51126,51131,51119,51125,51118,51117,51121]]]],
+  '311': [[397],[[397,[51177,51180,51184,51182,51178,51183,51179,51181]]]],
+  '312': [[395],[[395,[51171,51168,51169,51167,51154,51170,51172,51155]]]],
+  '313': [[393,396],[[393,[51159,51157,51149,51150,51151,51156,51153,51152]],[396,[51103,51173,51112,51116,51174,51111,51176,51175]]]],
+  '321': [[383],[[383,[51076,51073,51072,51070,51069,51074,51071,51075]]]],
+  '324': [[398],[[398,[51186,51185,51189,51190,51191,51187,51192,51188]]]],
+  '326': [[399],[[399,[51193,51195,51196,51197,51198,51199,51194,51200]]]],
+  '327': [[394],[[394,[51165,51164,51161,51158,51163,51162,51166,51160]]]],
+  '328': [[384],[[384,[51078,51077,51079,51082,51083,51080,51084,51081]]]],
+  '331': [[377],[[377,[51011,51022,51010,51023,51019,51021,51024,51020]]]],
+  '332': [[379],[[379,[51043,51036,51034,51037,51033,51038,51035,51039]]]],
+  '333': [[378],[[378,[51032,51027,51031,51028,51029,51025,51026,51030]]]],
+  '334': [[376],[[376,[51006,51014,51013,51017,51012,51015,51016,51018]]]],
+  '335': [[375],[[375,[51002,51008,51003,51009,51005,51001,51007,51004]]]],
+  '341': [[388],[[388,[51107,51108,51110,51106,51113,51109,51115,51114]]]],
+  '342': [[390],[[390,[51128,51123,51130,51122,51133,51127,51124,51129]]]],
+  '343': [[392],[[392,[51141,51143,51142,51147,51145,51148,51144,51146]]]],
+  '344': [[391],[[391,[51135,51136,51140,51139,51132,51137,51134,51138]]]],
+  '360': [[165,166],[[166,[37075,37073,37074,37088,37084,37085,37083]],[165,[37072,37068,37071,37070,37069,37066,37067]]]],
+  '361': [[167],[[167,[37082,37080,37078,37077,37079,37076,37081]]]],
+  '362': [[168],[[168,[37086,37092,37089,37090,37091,37093,37087]]]],
+  '363': [[164],[[164,[37063,37060,37059,37064,37061,37039,37062]]]],
+  '364': [[170],[[170,[37104,37103,37105,37107,37106,37102,37100]]]],
+  '365': [[169],[[169,[37095,37094,37101,37096,37099,37098,37097]]]],
+  '370': [[156],[[156,[37001,37004,37003,37005,37002,37065,37006]]]],
+  '380': [[162,163],[[163,[37050,37056,37054,37051,37044,37052,37053]],[162,[37049,37034,37035,37047,37046,37048,37043]]]],
+  '382': [[161],[[161,[37036,37041,37038,37045,37055,37040,37042]]]],
+  '383': [[160],[[160,[37032,37030,37027,37028,37029,37031,37033]]]],
+  '384': [[158,159],[[159,[37023,37024,37025,37037,37021,37026,37022]],[158,[37017,37015,37020,37018,37016,37019,37011]]]],
+  '385': [[157],[[157,[37010,37013,37014,37009,37012,37008,37007]]]],
+  '387': [[172],[[172,[37057,37058,37120,37118,37115,37117,37116]]]],
+  '388': [[171],[[171,[37112,37110,37109,37108,37113,37114,37111]]]],
+  '389': [[173,174],[[173,[37121,37126,37127,37122,37125,37124,37119]],[174,[37132,37134,37129,37133,37130,37131,37123]]]],
+  '390': [[175],[[175,[37143,37145,37144,37135,37142,37141,37136]]]],
+  '391': [[176],[[176,[37137,37140,37128,37138,37148,37146,37139]]]],
+  '392': [[177],[[177,[37154,37153,37149,37150,37152,37147,37151]]]],
+  '394': [[178],[[178,[37169,37158,37170,37157,37156,37172,37171]]]],
+  '395': [[179],[[179,[37162,37166,37155,37159,37160,37167,37161]]]],
+  '396': [[180,181,588,589],[[180,[37168,37176,37174,37163,37165,37175,37164]],[181,[37173,37178,37181,37180,37182,37179,37177]]]],
+  '400': [[311,312,313,314,315,316,317],[[311,[44150,44151,44147,44145,44146,44148]],[313,[44166,44165,44159,44163,44158,44164]],[316,[44172,44173,44178,44181,44179,44180]],[314,[44157,44170,44169,44171,44155,44156]],[312,[44152,44161,44153,44160,44154,44162]],[317,[44184,44187,44185,44186,44183,44182]],[315,[44168,44175,44174,44176,44177,44167]]]],
+  '401': [[308],[[308,[44131,44128,44132,44130,44133,44129]]]],
+  '403': [[154,155],[[154,[36010,36003,36008,36015,36016,36001,36005,36011,36002,36018,36009,36020,36007,36017,36013,36006,36014,36012,36004,36019]],[155,[36032,36040,36027,36034,36037,36029,36026,36030,36023,36031,36024,36033,36028,36021,36036,36039,36038,36022,36025,36035]]]],
+  '410': [[318,319],[[318,[44192,44263,44264,44194,44191,44193]],[319,[44205,44189,44204,44188,44206,44190]]]],
+  '411': [[320],[[320,[44215,44210,44212,44214,44209,44208]]]],
+  '412': [[322],[[322,[44196,44207,44213,44195,44197,44198]]]],
+  '413': [[321,326,327,328,329],[[327,[44236,44235,44234,44088,44238,44237]],[328,[44250,44247,44252,44249,44248,44251]],[326,[44239,44246,44242,44243,44241,44240]],[321,[44201,44203,44199,44200,44211,44202]],[329,[44244,44245,44254,44255,44253]]]],
+  '414': [[323],[[323,[44225,44227,44224,44223,44222,44226]]]],
+  '415': [[331,332],[[332,[44265,44268,44269,44267,44266,44270]],[331,[44259,44260,44257,44258,44261,44262,44256]]]],
+  '416': [[330,333,334],[[333,[44271,44273,44275,44276,44274,44272]],[334,[44278,44279,44283,44277,44284,44280]],[330,[44288,44286,44281,44285,44282,44287]]]],
+  '421': [[309,310],[[310,[44140,44143,44142,44144,44149,44141]],[309,[44137,44134,44136,44138,44139,44135]]]],
+  '422': [[306,307],[[306,[44118,44122,44117,44113,44121,44119]],[307,[44126,44127,44124,44123,44125,44120]]]],
+  '423': [[324],[[324,[44216,44219,44221,44217,44218,44220]]]],
+  '424': [[288],[[288,[44116,44007,44006,44114,44115,44008]]]],
+  '425': [[287,289,290],[[287,[44001,44003,44004,44005,44002,44009]],[289,[44015,44017,44016,44013,44014,44018]],[290,[44012,44010,44019,44021,44020,44011]]]],
+  '431': [[301,302,303,304,305,325],[[305,[34223,34225,34227,34222,34224,34231,44107,44109,44108,44111,44105,44106,44112]],[325,[44231,44230,44228,44232,44229,44233]],[304,[44102,44103,44101,44110,44104]],[301,[44092,44084,44094,44093,44083,44082]],[302,[44085,44090,44091,44089,44086,44087]],[303,[44097,44100,44095,44096,44099,44098]]]],
+  '440': [[296],[[296,[44055,44054,44057,44053,44052,44056]]]],
+  '441': [[295,297],[[297,[44063,44061,44065,44062,44064,44060]],[295,[44050,44058,44048,44059,44049,44051]]]],
+  '442': [[294,298,299],[[298,[44069,44066,44067,44073,44074,44068]],[299,[44080,44072,44071,44070,44076,44075]],[294,[44044,44045,44036,44046,44043,44047]]]],
+  '443': [[291],[[291,[44022,44023,44027,44026,44025,44024]]]],
+  '444': [[292,293],[[293,[44042,44038,44037,44040,44041,44039]],[292,[44031,44030,44028,44029,44032,44033]]]],
+  '445': [[300],[[300,[44079,44035,44081,44077,44034,44078]]]],
+  '450': [[285],[[285,[43182,43174,43181,43180,43177,43175,43179,43178]]]],
+  '451': [[284],[[284,[43190,43186,43184,43185,43183,43189,43188,43187]]]],
+  '452': [[283],[[283,[43203,43204,43205,43206,43207,43208,43210,43211]]]],
+  '454': [[282],[[282,[43202,43201,43200,43209,43197,43198,43199,43196]]]],
+  '455': [[278],[[278,[43166,43157,43171,43172,43169,43167,43168,43170]]]],
+  '456': [[279],[[279,[43223,43218,43215,43213,43212,43214,43216,43217]]]],
+  '457': [[281],[[281,[43191,43193,43192,43195,43220,43219,43221,43194]]]],
+  '458': [[280],[[280,[43227,43222,43230,43225,43228,43224,43229,43226]]]],
+  '460': [[286],[[286,[43130,43131,43133,43132,43135,43176,43129,43134]]]],
+  '461': [[274],[[274,[43121,43137,43119,43139,43136,43138,43120,43140]]]],
+  '462': [[276],[[276,[43149,43152,43153,43150,43154,43155,43151,43159]]]],
+  '464': [[275],[[275,[43145,43141,43156,43158,43173,43142,43143,43144]]]],
+  '465': [[277],[[277,[43161,43030,43163,43160,43031,43162,43164,43165]]]],
+  '470': [[262,264],[[264,[43042,43055,43038,43057,43056,43053,43054,43039]],[262,[43035,43036,43146,43040,43041,43148,43147,43037]]]],
+  '471': [[265],[[265,[43094,43049,43059,43093,43060,43058,43050,43092]]]],
+  '472': [[263],[[263,[43052,43051,43044,43047,43048,43046,43045,43043]]]],
+  '473': [[261],[[261,[43032,43028,43033,43029,43027,43034,43026,43025]]]],
+  '474': [[260],[[260,[43018,43019,43015,43016,43014,43017,43023,43024]]]],
+  '476': [[258],[[258,[43008,43007,43004,43006,43003,43001,43005,43002]]]],
+  '477': [[259],[[259,[43009,43021,43010,43022,43013,43011,43012,43020]]]],
+  '480': [[273],[[273,[43123,43126,43124,43122,43128,43127,43125]]]],
+  '481': [[271,272],[[272,[43108,43111,43114,43113,43109,43110,43115,43112]],[271,[43105,43104,43118,43116,43117,43107,43106,43103]]]],
+  '482': [[270],[[270,[43096,43099,43097,43098,43100,43101,43095,43102]]]],
+  '484': [[269],[[269,[43087,43089,43091,43084,43085,43086,43090,43088]]]],
+  '485': [[266],[[266,[43066,43061,43065,43064,43062,43067,43063]]]],
+  '486': [[267,268],[[268,[43083,43079,43076,43081,43082,43077,43078,43080]],[267,[43072,43075,43073,43071,43074,43069,43068,43070]]]],
+  '491': [[148,149],[[149,[35067,35069,35065,35064,35063,35070,35062,35068,35066]],[148,[35076,35074,35072,35073,35077,35078,35071,35075]]]],
+  '492': [[150],[[150,[35053,35052,35045,35046,35047,35048,35050,35051,35049]]]],
+  '493': [[151],[[151,[35040,35055,35058,35041,35057,35042,35054,35039]]]],
+  '494': [[152,153],[[153,[35079,35080,35060,35061,35081,35082,35059,35056]],[152,[35085,35089,35087,35088,35086,35083,35090,35084]]]],
+  '495': [[145,146,147],[[145,[35033,35043,35036,35037,35034,35044,35038,35035]],[146,[35003,35001,35022,35021,35002,35024,35023,35020]],[147,[35031,35030,35029,35025,35026,35032,35027,35028]]]],
+  '496': [[144],[[144,[35019,35012,35018,35013,35015,35014,35016,35017]]]],
+  '497': [[143],[[143,[35010,35005,35009,35006,35004,35007,35008,35011]]]],
+  '500': [[446,447,448],[[447,[54059,54061,54060,54057,54063,54062,54070]],[448,[54069,54067,54066,54065,54064,54058,54068]],[446,[54046,54049,54044,54043,54045,54071,54047]]]],
+  '501': [[449],[[449,[54053,54050,54054,54051,54052,54056,54055]]]],
+  '502': [[444,445],[[444,[54036,54014,54013,54016,54035,54015,54038]],[445,[54041,54042,54034,54037,54040,54039,54033]]]],
+  '503': [[443],[[443,[54011,54019,54012,54021,54020,54018,54017]]]],
+  '504': [[440],[[440,[54007,54005,54008,54006,54010,54009,54001]]]],
+  '505': [[441,442],[[441,[54003,54002,54022,54004,54024,54025,54023]],[442,[54027,54032,54031,54026,54030,54029,54028]]]],
+  '506': [[454,455],[[455,[54119,54101,54102,54109,54103,54110,54111]],[454,[54108,54099,54100,54104,54107,54106,54105]]]],
+  '507': [[456],[[456,[54118,54112,54117,54114,54113,54116,54115]]]],
+  '508': [[452,453],[[453,[54097,54094,54048,54098,54093,54095,54096]],[452,[54086,54089,54090,54088,54087,54092,54091]]]],
+  '509': [[450,451],[[451,[54082,54080,54079,54083,54085,54081,54078]],[450,[54076,54075,54072,54074,54077,54073,54084]]]],
+  '515': [[80,81],[[80,[31153,31150,31154,31148,31152,31151,31149]],[81,[31160,31157,31161,31156,31158,31159,31155]]]],
+  '516': [[82,85],[[82,[31124,31131,31126,31130,31133,31132,31129]],[85,[31127,31164,31163,31165,31125,31128,31162]]]],
+  '517': [[84,86],[[86,[31166,31172,31171,31175,31170,31174,31173]],[84,[31120,31119,31169,31168,31121,31167,31122]]]],
+  '518': [[78,79],[[79,[31146,31147,31143,31137,31145,31142,31144]],[78,[31134,31140,31141,31136,31139,31138,31135]]]],
+  '520': [[73],[[73,[31084,31082,31083,31069,31080,31081,31079]]]],
+  '521': [[72],[[72,[31076,31071,31072,31075,31077,31074,31078]]]],
+  '522': [[74,75],[[75,[31096,31100,31101,31097,31085,31098,31099]],[74,[31095,31094,31087,31088,31093,31086,31091]]]],
+  '523': [[76,77],[[76,[31105,31092,31106,31104,31090,31107,31089]],[77,[31103,31112,31113,31110,31111,31108,31102]]]],
+  '524': [[83],[[83,[31115,31109,31114,31116,31117,31118,31123]]]],
+  '530': [[65],[[65,[31025,31021,31020,31024,31023,31019,31022]]]],
+  '531': [[62,66],[[66,[31030,31032,31034,31033,31031,31027,31026]],[62,[31011,31013,31028,31012,31029,31053,31010]]]],
+  '532': [[62,63],[[63,[31006,31005,31008,31003,31001,31004,31002]],[62,[31011,31013,31028,31012,31029,31053,31010]]]],
+  '533': [[62,67,68,69],[[68,[31044,31046,31047,31048,31043,31042,31045]],[69,[31040,31066,31054,31055,31050,31051,31049]],[62,[31011,31013,31028,31012,31029,31053,31010]],[67,[31052,31041,31038,31039,31037,31036,31035]]]],
+  '534': [[70,71],[[70,[31056,31059,31058,31057,31062,31061,31060]],[71,[31068,31064,31065,31073,31070,31067,31063]]]],
+  '535': [[64],[[64,[31016,31014,31007,31009,31018,31015,31017]]]],
+  '560': [[233,234,235],[[235,[41172,41170,41175,41169,41166,41173,41171,41167]],[233,[41152,41155,41158,41151,41156,41157,41159,41153]],[234,[41161,41168,41164,41174,41165,41160,41163,41162]]]],
+  '562': [[232,236],[[232,[41177,41176,41185,41184,41131,41182,41154,41183]],[236,[41140,41141,41179,41180,41139,41178,41181,41150]]]],
+  '563': [[237],[[237,[41147,41143,41148,41146,41149,41145,41142,41144]]]],
+  '570': [[230],[[230,[41217,41215,41212,41216,41208,41218,41210,41209]]]],
+  '571': [[229,231],[[231,[41223,41224,41221,41213,41222,41214,41220,41219]],[229,[41211,41192,41187,41186,41189,41188,41191,41190]]]],
+  '572': [[228],[[228,[41128,41135,41134,41138,41129,41132,41133,41130]]]],
+  '573': [[225],[[225,[41198,41194,41195,41196,41197,41127,41199,41193]]]],
+  '575': [[226],[[226,[41205,41200,41204,41202,41203,41201,41206,41207]]]],
+  '576': [[224],[[224,[41125,41121,41122,41119,41124,41123,41126,41120]]]],
+  '577': [[222,223,227],[[223,[41112,41118,41117,41115,41113,41111,41116,41114]],[227,[41098,41099,41100,41102,41101,41097,41137,41136]],[222,[41109,41106,41107,41104,41105,41110,41103,41108]]]],
+  '580': [[220],[[220,[41071,41073,41072,41074,41075,41070,41069,41083]]]],
+  '581': [[219,221],[[221,[41079,41076,41077,41014,41015,41078,41080,41081]],[219,[41085,41066,41082,41084,41086,41087,41067,41065]]]],
+  '583': [[217,218],[[218,[41094,41093,41089,41088,41091,41096,41095,41090]],[217,[41062,41061,41064,41060,41059,41058,41092,41063]]]],
+  '584': [[215],[[215,[41056,41057,41055,41054,41053,41037,41036,41038]]]],
+  '585': [[214,216],[[214,[41034,41040,41044,41043,41045,41039,41035,41041]],[216,[41046,41052,41047,41051,41050,41049,41042,41048]]]],
+  '586': [[213],[[213,[41029,41028,41030,41027,41032,41026,41031,41033]]]],
+  '587': [[212],[[212,[41023,41024,41022,41025,41021,41019,41068,41020]]]],
+  '590': [[211],[[211,[41008,41016,41012,41013,41011,41009,41018,41017]]]],
+  '591': [[210],[[210,[41003,41002,41007,41004,41005,41001,41006,41010]]]],
+  '600': [[402,403,404],[[404,[53021,53019,53016,53018,53020,53014]],[402,[53011,53013,53012,53017,53015,53010]],[403,[53025,53023,53027,53024,53026,53022]]]],
+  '601': [[401],[[401,[53006,53001,53009,53002,53005,53004]]]],
+  '602': [[405],[[405,[53028,53008,53007,53030,53029,53031]]]],
+  '605': [[413,604],[[604,[61019,61023,61021,61008,61007,61012,61010,61026,61027,61011,61029,61020,61004,61001,61018,61013,61024,61017,61028,61022,61016,61003,61015,61006,61014,61009,61002,61025,61005,61030]],[413,[53072,53076,53077,53073,53075,53074]]]],
+  '606': [[411,414],[[414,[53082,53081,53080,53078,53079,53083]],[411,[53062,53049,53065,53064,53050,53063]]]],
+  '607': [[426],[[426,[53155,53156,53153,53154,53151,53152]]]],
+  '608': [[427],[[427,[53149,53157,53158,53150,53159,53148]]]],
+  '609': [[428],[[428,[53171,53161,53172,53162,53160,53170]]]],
+  '611': [[429],[[429,[53164,53163,53169,53166,53168,53165]]]],
+  '613': [[430],[[430,[53167,53175,53176,53177,53174,53173]]]],
+  '620': [[424],[[424,[53178,53180,53139,53142,53140,53141]]]],
+  '621': [[425],[[425,[53137,53143,53144,53145,53147,53146]]]],
+  '623': [[431,435],[[431,[53182,53184,53187,53186,53181,53185]],[435,[53183,53212,53209,53211,53208,53210]]]],
+  '624': [[422],[[422,[53129,53132,53131,53130,53128,53127]]]],
+  '625': [[432,433],[[433,[53198,53200,53201,53199,53190,53197]],[432,[53193,53189,53191,53192,53194,53188]]]],
+  '626': [[434],[[434,[53207,53204,53205,53196,53195,53206]]]],
+  '627': [[437,438],[[438,[53223,53225,53227,53226,53228,53224]],[437,[53221,53202,53219,53203,53222,53220]]]],
+  '628': [[436],[[436,[53218,53217,53216,53214,53215,53213]]]],
+  '629': [[439],[[439,[53231,53229,53234,53230,53232,53233]]]],
+  '631': [[406,407],[[407,[53038,53042,53040,53041,53039,53003]],[406,[53032,53034,53037,53035,53033,53036]]]],
+  '632': [[408,412],[[408,[53048,53044,53046,53045,53047,53043]],[412,[53067,53068,53070,53071,53066,53069]]]],
+  '635': [[409],[[409,[53052,53055,53053,53056,53051,53054]]]],
+  '636': [[410,415],[[410,[53059,53061,53085,53057,53060,53058]],[415,[53086,53084,53088,53089,53090,53091]]]],
+  '637': [[416],[[416,[53094,53095,53092,53087,53093,53096]]]],
+  '638': [[417],[[417,[53101,53098,53099,53102,53097,53100]]]],
+  '639': [[423],[[423,[53134,53135,53136,53138,53133,53179]]]],
+  '641': [[418,420],[[418,[53105,53104,53106,53103,53113,53114]],[420,[53118,53120,53117,53115,53121,53116]]]],
+  '642': [[421],[[421,[53122,53126,53123,53119,53125,53124]]]],
+  '643': [[419],[[419,[53112,53107,53110,53109,53111,53108]]]],
+  '670': [[239],[[239,[42010,42012,42009,42011,42015,42016,42008]]]],
+  '671': [[238],[[238,[42007,42004,42002,42001,42006,42005,42003]]]],
+  '673': [[240,241,242],[[242,[42025,42029,42026,42031,42027,42028,42030]],[241,[42034,42019,42017,42035,42018,42032,42036]],[240,[42023,42021,42014,42022,42024,42013,42020]]]],
+  '676': [[243],[[243,[42033,42040,42037,42039,42038,42042,42041]]]],
+  '678': [[245,246],[[246,[42060,42061,42058,42062,42059,42057,42065]],[245,[42053,42055,42054,42052,42056,42050,42051]]]],
+  '679': [[244],[[244,[42046,42048,42044,42047,42049,42045,42043]]]],
+  '680': [[247,248],[[248,[42076,42075,42072,42069,42073,42084,42074]],[247,[42063,42070,42064,42068,42066,42071,42067]]]],
+  '682': [[249,603],[[249,[42082,42077,42080,42078,42083,42081,42079]]]],
+  '685': [[250],[[250,[42088,42091,42087,42086,42092,42090,42089]]]],
+  '686': [[251],[[251,[42096,42094,42097,42093,42085,42098,42095]]]],
+  '688': [[252],[[252,[42104,42105,42102,42103,42107,42116,42108]]]],
+  '689': [[254],[[254,[42115,42113,42100,42114,42101,42112,42111]]]],
+  '690': [[253],[[253,[42099,42110,42119,42118,42106,42109,42120]]]],
+  '691': [[255],[[255,[42122,42126,42117,42125,42124,42123,42121]]]],
+  '695': [[256,257],[[256,[42136,42128,42129,42138,42130,42131,42127]],[257,[42132,42139,42135,42140,42137,42134,42133]]]],
+  '700': [[558,559,560,565,566,567],[[558,[58102,58108,58105,58103,58106,58104,58107]],[560,[58101,58119,58116,58120,58100,58118,58115]],[566,[58161,58154,58153,58159,58149,58158,58160]],[559,[58113,58114,58110,58112,58109,58111,58117]],[565,[58140,58137,58148,58150,58147,58151,58152]],[567,[58164,58162,58163,58165,58168,58167,58166]]]],
+  '711': [[568,569],[[569,[58181,58180,58179,58182,58178,58176,58177]],[568,[58169,58173,58171,58170,58175,58174,58172]]]],
+  '712': [[570,571,572],[[572,[58200,58232,58201,58196,58202,58199,58198]],[571,[58191,58189,58190,58197,58192,58193,58188]],[570,[58187,58194,58184,58183,58195,58186,58185]]]],
+  '713': [[581,582,583],[[583,[58280,58281,58283,58279,58282,58275,58278]],[582,[58267,58260,58266,58277,58276,58274,58263]],[581,[58262,58264,58270,58265,58268,58269,58261]]]],
+  '721': [[573,574,575,576,577],[[576,[58238,58237,58233,58221,58222,58220,58234]],[574,[58214,58211,58216,58213,58215,58212,58217]],[577,[58219,58218,58223,58228,58224,58236,58225]],[575,[58230,58229,58231,58235,58205,58227,58226]],[573,[58209,58208,58206,58207,58210,58204,58203]]]],
+  '722': [[579,580],[[579,[58252,58248,58246,58250,58249,58247,58251]],[580,[58253,58255,58257,58256,58259,58254,58258]]]],
+  '723': [[578],[[578,[58240,58239,58241,58244,58243,58245,58242]]]],
+  '731': [[584,585],[[584,[58273,58286,58271,58288,58272,58290,58287]],[585,[58284,58292,58294,58293,58291,58289,58285]]]],
+  '732': [[550,551],[[551,[58054,58051,58055,58049,58052,58056,58053]],[550,[58045,58044,58043,58046,58047,58050,58048]]]],
+  '733': [[548,549],[[549,[58039,58041,58042,58036,58038,58037,58040]],[548,[58031,58030,58033,58029,58034,58032,58035]]]],
+  '734': [[547],[[547,[58028,58023,58022,58024,58025,58027,58026]]]],
+  '735': [[546],[[546,[58019,58015,58017,58020,58016,58001,58018]]]],
+  '736': [[544,545],[[545,[58012,58013,58011,58010,58014,58021,58009]],[544,[58004,58003,58007,58002,58008,58006,58005]]]],
+  '737': [[400],[[400,[52026,52009,52020,52006,52030,52027,52021,52004,52029,52017,52031,52003,52024,52012,52022,52011,52013,52010,52015,52019,52005,52008,52032,52023,52007,52014,52016,52028,52025,52018,52002,52001]]]],
+  '741': [[555,556],[[556,[58091,58088,58084,58090,58087,58089,58086]],[555,[58082,58080,58085,58083,58081,58079,58078]]]],
+  '742': [[552,553,554],[[553,[58072,58071,58069,58067,58068,58074,58070]],[554,[58062,58075,58073,58076,58077,58064,58063]],[552,[58058,58066,58061,58065,58059,58060,58057]]]],
+  '743': [[557,561,562,563,564],[[561,[58099,58124,58125,58121,58126,58122,58123]],[557,[58094,58096,58095,58097,58093,58092,58098]],[562,[58128,58138,58139,58127,58136,58129,58141]],[564,[58146,58156,58143,58144,58155,58157,58145]],[563,[58131,58133,58142,58135,58130,58134,58132]]]],
+  '744': [[586],[]],
+  '751': [[358],[[358,[49116,49112,49113,49114,49115,49111,49117]]]],
+  '752': [[357],[[357,[49108,49118,49122,49110,49107,49119,49109]]]],
+  '753': [[354],[[354,[49089,49088,49090,49087,49091,49093,49120]]]],
+  '754': [[355,356],[[355,[49098,49097,49100,49095,49096,49099,49094]],[356,[49103,49104,49105,49092,49106,49101,49102]]]],
+  '755': [[348],[[348,[49050,49049,49048,49051,49052,49053,49054]]]],
+  '756': [[346,347],[[346,[49032,49038,49037,49036,49035,49040,49039]],[347,[49045,49044,49043,49047,49046,49042,49041]]]],
+  '757': [[345],[[345,[49029,49033,49026,49034,49028,49027,49031]]]],
+  '758': [[344],[[344,[49022,49025,49021,49030,49024,49023,49020]]]],
+  '759': [[349],[[349,[49061,49055,49056,49057,49059,49058,49060]]]],
+  '760': [[360],[[360,[49133,49127,49135,49134,49132,49136,49137]]]],
+  '761': [[359],[[359,[49128,49131,49125,49126,49124,49130,49129]]]],
+  '762': [[353],[[353,[49082,49123,49086,49121,49083,49085,49084]]]],
+  '764': [[352,361],[[361,[49139,49138,49143,49144,49141,49145,49140]],[352,[49147,49076,49074,49142,49146,49075,49073]]]],
+  '766': [[351],[[351,[49080,49079,49078,49072,49077,49081,49071]]]],
+  '767': [[350],[[350,[49064,49068,49070,49066,49067,49065,49069]]]],
+  '768': [[341,343],[[343,[49063,49062,49019,49015,49018,49016,49017]],[341,[49004,49003,49005,49002,49006,49007,49001]]]],
+  '769': [[342],[[342,[49010,49014,49011,49013,49012,49009,49008]]]],
+  '781': [[94,95],[[94,[33016,33026,33038,33024,33021,33018,33030,33039,33025,33040]],[95,[33028,33027,33034,33033,33015,33013,33036,33037,33035,33029]]]],
+  '782': [[98,99],[[99,[33059,33062,33105,33104,33103,33063,33057,33106,33064,33107]],[98,[33055,33052,33053,33054,33060,33061,33056,33058]]]],
+  '783': [[92,93],[[93,[33042,33004,33020,33002,33001,33003,33041,33005,33019]],[92,[33010,33009,33023,33008,33007,33014,33006,33012,33022,33011,33017]]]],
+  '784': [[96,97],[[97,[33066,33071,33073,33070,33065,33072,33069,33068,33067]],[96,[33045,33051,33044,33032,33047,33050,33031,33049,33043,33048,33046]]]],
+  '785': [[100],[[100,[33095,33100,33094,33098,33101,33097,33096,33093,33099,33102]]]],
+  '786': [[101],[[101,[33087,33088,33084,33090,33089,33085,33083,33092,33091,33086]]]],
+  '787': [[102],[[102,[33077,33078,33082,33080,33076,33075,33074,33081,33079]]]],
+  '788': [[89,90,91],[[89,[33122,33121,33123,33124,33125,33126]],[91,[33112,33108,33110,33113,33109,33111]],[90,[33117,33120,33116,33114,33118,33119,33115]]]],
+  '790': [[87],[[87,[32031,32030,32008,32029,32007,32009,32024,32004,32014,32026,32013,32005,32021,32028,32027,32001,32033,32003,32022,32019,32012,32018,32025,32032,32015,32010,32011,32020,32023,32002,32006,32016,32017]]]],
+  '791': [[87],[[87,[32031,32030,32008,32029,32007,32009,32024,32004,32014,32026,32013,32005,32021,32028,32027,32001,32033,32003,32022,32019,32012,32018,32025,32032,32015,32010,32011,32020,32023,32002,32006,32016,32017]]]],
+  '792': [[88],[[88,[32041,32049,32057,32053,32052,32046,32042,32045,32058,32055,32056,32048,32059,32040,32039,32050,32051,32047,32054,32036,32035,32038,32037,32060,32043,32044,32034]]]],
+  '793': [[337],[[337,[46007,46016,46010,46002,46006,46030,46008,46029,46036,46015,46024,46013,46034,46025,46031,46004,46020,46001,46022,46009,46032,46021,46017,46014,46027,46003,46033,46035,46026,46023,46028,46019,46005,46012,46011,46018]]]],
+  '794': [[338],[[338,[46053,46060,46040,46059,46049,46057,46056,46037,46054,46038,46050,46046,46047,46044,46052,46039,46058,46042,46055,46048,46041,46051,46045,46043]]]],
+  '795': [[335,336],[[335,[45007,45026,45002,45006,45012,45001,45003,45018,45004,45029,45008,45017,45020,45030,45023,45027,45024,45021,45025,45019,45011,45016,45013,45028,45009,45005,45031,45010,45015,45032,45022,45014]],[336,[45041,45045,45058,45033,45057,45038,45040,45037,45050,45047,45035,45048,45054,45043,45059,45046,45051,45060,45039,45049,45052,45053,45042,45056,45055,45044,45036,45034]]]],
+  '796': [[339],[[339,[47013,47014,47010,47011,47012,47018,47019,47020,47015,47016,47017,47008,47023,47024,47002,47025,47001,47028,47005,47038,47037,47021,47031,47030,47033,47032,47003,47040,47039,47026,47006,47029,47009,47034,47022,47036,47027,47004,47007,47035]]]],
+  '797': [[340],[[340,[48047,48034,48031,48030,48024,48026,48022,48032,48040,48017,48018,48001,48002,48003,48004,48005,48023,48029,48009,48028,48052,48050,48020,48048,48027,48046,48025,48056,48051,48010,48011,48007,48016,48019,48044,48013,48060,48039,48036,48059,48058,48014,48015,48033,48049,48043,48045,48006,48057,48041,48055,48012,48053,48054,48021,48037,48042,48008,48038,48035]]]],
+  '799': [[457,458],[[457,[55006,55014,55030,55003,55009,55004,55035,55016,55020,55019,55023,55017,55033,55015,55005,55010,55011,55032,55002,55021,55013,55031,55034,55007,55036,55001,55022,55018,55012,55008]],[458,[55042,55047,55041,55026,55055,55052,55049,55056,55051,55037,55038,55057,55054,55053,55027,55045,55060,55048,55043,55025,55029,55039,55050,55058,55059,55044,55024,55040,55046,55028]]]],
+  '800': [[132],[[132,[34180,34182,34181,34185,34183,34184]]]],
+  '801': [[133],[[133,[34191,34186,34187,34189,34190,34188]]]],
+  '802': [[134,135],[[134,[34195,34194,34193,34197,34192,34198,34196]],[135,[34199,34200,34210,34201,34202,34203]]]],
+  '803': [[131],[[131,[34171,34172,34177,34175,34174,34176,34173]]]],
+  '804': [[138],[[138,[34214,34233,34217,34216,34215,34218]]]],
+  '805': [[137,141],[[141,[34170,34238,34236,34237,34235,34239]],[137,[34212,34219,34213,34221,34211,34220]]]],
+  '811': [[130,142],[[130,[34179,34166,34168,34178,34165,34167]],[142,[34243,34241,34242,34169,34240,34164]]]],
+  '812': [[128],[[128,[34156,34152,34153,34155,34158,34154]]]],
+  '813': [[129],[[129,[34159,34161,34163,34160,34162,34157]]]],
+  '814': [[197,198],[[198,[40015,40017,40012,40013,40018,40016]],[197,[40010,40011,40009,40008,40014,40007]]]],
+  '815': [[201],[[201,[40043,40035,40033,40032,40034,40042]]]],
+  '816': [[196],[[196,[40003,40002,40004,40006,40005,40001]]]],
+  '821': [[136],[[136,[34205,34206,34207,34209,34204,34208]]]],
+  '822': [[208],[[208,[40081,40077,40078,40076,40080,40079]]]],
+  '823': [[140],[[140,[34228,34232,34229,34230,34226,34234]]]],
+  '824': [[139],[]],
+  '825': [[199,200,209],[[200,[40029,40020,40028,40031,40030,40019]],[209,[40021,40022,40025,40024,40023]],[199,[40027,40074,40073,40075,40026]]]],
+  '826': [[202],[[202,[40036,40037,40040,40041,40039,40038]]]],
+  '831': [[204],[[204,[40044,40045,40048,40049,40047,40046]]]],
+  '833': [[205],[[205,[40052,40056,40054,40053,40055,40051]]]],
+  '834': [[203],[[203,[40064,40050,40065,40062,40063,40061]]]],
+  '835': [[206,207],[[207,[40069,40068,40072,40066,40067]],[206,[40057,40060,40071,40070,40058,40059]]]],
+  '841': [[119,120,121,122],[[122,[34120,34118,34119,34117,34121,34122]],[119,[34099,34100,34103,34101,34104,34102]],[120,[34110,34107,34109,34108,34105,34106]]]],
+  '842': [[117],[[117,[34089,34091,34088,34093,34090,34094,34092]]]],
+  '843': [[106,107],[[107,[34027,34024,34025,34029,34028,34026]],[106,[34030,34020,34021,34018,34023,34022]]]],
+  '844': [[118,123],[[118,[34096,34095,34097,34098,34125]],[123,[34123,34124,34129,34126,34128,34127]]]],
+  '845': [[103,104,105],[[103,[34004,34005,34003,34002,34009,34001]],[104,[34008,34007,34012,34006,34010,34011]],[105,[34014,34013,34016,34015,34019,34017]]]],
+  '846': [[116],[[116,[34081,34085,34080,34083,34082,34079]]]],
+  '847': [[108,109],[[109,[34034,34038,34033,34040,34039,34037]],[108,[34032,34035,34031,34087,34086,34036]]]],
+  '848': [[124,125],[[124,[34138,34137,34135,34130,34136,34134]],[125,[34084,34131,34078,34139,34133,34132]]]],
+  '851': [[126,127],[[127,[34148,34150,34140,34149,34151,34076]],[126,[34142,34147,34146,34141,34144,34145,34143]]]],
+  '852': [[110,115],[[115,[34070,34071,34073,34077,34075,34074]],[110,[34045,34041,34042,34072,34043,34044]]]],
+  '854': [[111,113,114],[[111,[34049,34048,34050,34046,34047,34051]],[113,[34065,34068,34064,34063,34067,34066]],[114,[34059,34061,34058,34069,34062,34060]]]],
+  '855': [[112],[[112,[34056,34052,34057,34054,34055,34053]]]],
+};
+
+const pinPrefixIndex = {};
+for (const prefix in _p) {
+  const [pcs, groups] = _p[prefix];
+  pinPrefixIndex[prefix] = [
+    pcs.map((i) => _s[i]),
+    groups.map(([pc, acs]) => [_s[pc], acs.map(acId)]),
+  ];
+}
+
+export default pinPrefixIndex;
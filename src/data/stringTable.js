@@ -0,0 +1,181 @@
+// Shared string table for the generated data modules
+// Generated by scripts/string_table.py: states, state codes, PC IDs, then districts
+// 1309 strings, first 605 stable across runs
+
+const strings = [
+  'Andhra Pradesh','Arunachal Pradesh','Assam','Bihar','Chhattisgarh','Goa','Gujarat','Haryana',
+  'Himachal Pradesh','Jharkhand','Karnataka','Kerala','Madhya Pradesh','Maharashtra','Manipur','Meghalaya',
+  'Mizoram','Nagaland','Odisha','Punjab','Rajasthan','Sikkim','Tamil Nadu','Telangana',
+  'Tripura','Uttar Pradesh','Uttarakhand','West Bengal','NCT of Delhi','Jammu & Kashmir','Puducherry','AP',
+  'AR','AS','BR','CG','GA','GJ','HR','HP',
+  'JH','KA','KL','MP','MH','MN','ML','MZ',
+  'NL','OD','PB','RJ','SK','TN','TS','TR',
+  'UP','UK','WB','DL','JK','PY','AP-01','AP-02',
+  'AP-03','AP-04','AP-05','AP-06','AP-07','AP-08','AP-09','AP-10',
+  'AP-11','AP-12','AP-13','AP-14','AP-15','AP-16','AP-17','AP-18',
+  'AP-19','AP-20','AP-21','AP-22','AP-23','AP-24','AP-25','AR-01',
+  'AR-02','AS-01','AS-02','AS-03','AS-04','AS-05','AS-06','AS-07',
+  'AS-08','AS-09','AS-10','AS-11','AS-12','AS-13','AS-14','BR-01',
+  'BR-02','BR-03','BR-04','BR-05','BR-06','BR-07','BR-08','BR-09',
+  'BR-10','BR-11','BR-12','BR-13','BR-14','BR-15','BR-16','BR-17',
+  'BR-18','BR-19','BR-20','BR-21','BR-22','BR-23','BR-24','BR-25',
+  'BR-26','BR-27','BR-28','BR-29','BR-30','BR-31','BR-32','BR-33',
+  'BR-34','BR-35','BR-36','BR-37','BR-38','BR-39','BR-40','CG-01',
+  'CG-02','CG-03','CG-04','CG-05','CG-06','CG-07','CG-08','CG-09',
+  'CG-10','CG-11','GA-01','GA-02','GJ-01','GJ-02','GJ-03','GJ-04',
+  'GJ-05','GJ-06','GJ-07','GJ-08','GJ-09','GJ-10','GJ-11','GJ-12',
+  'GJ-13','GJ-14','GJ-15','GJ-16','GJ-17','GJ-18','GJ-19','GJ-20',
+  'GJ-21','GJ-22','GJ-23','GJ-24','GJ-25','GJ-26','HR-01','HR-02',
+  'HR-03','HR-04','HR-05','HR-06','HR-07','HR-08','HR-09','HR-10',
+  'HP-01','HP-02','HP-03','HP-04','JH-01','JH-02','JH-03','JH-04',
+  'JH-05','JH-06','JH-07','JH-08','JH-09','JH-10','JH-11','JH-12',
+  'JH-13','JH-14','KA-01','KA-02','KA-03','KA-04','KA-05','KA-06',
+  'KA-07','KA-08','KA-09','KA-10','KA-11','KA-12','KA-13','KA-14',
+  'KA-15','KA-16','KA-17','KA-18','KA-19','KA-20','KA-21','KA-22',
+  'KA-23','KA-24','KA-25','KA-26','KA-27','KA-28','KL-01','KL-02',
+  'KL-03','KL-04','KL-05','KL-06','KL-07','KL-08','KL-09','KL-10',
+  'KL-11','KL-12','KL-13','KL-14','KL-15','KL-16','KL-17','KL-18',
+  'KL-19','KL-20','MP-01','MP-02','MP-03','MP-04','MP-05','MP-06',
+  'MP-07','MP-08','MP-09','MP-10','MP-11','MP-12','MP-13','MP-14',
+  'MP-15','MP-16','MP-17','MP-18','MP-19','MP-20','MP-21','MP-22',
+  'MP-23','MP-24','MP-25','MP-26','MP-27','MP-28','MP-29','MH-01',
+  'MH-02','MH-03','MH-04','MH-05','MH-06','MH-07','MH-08','MH-09',
+  'MH-10','MH-11','MH-12','MH-13','MH-14','MH-15','MH-16','MH-17',
+  'MH-18','MH-19','MH-20','MH-21','MH-22','MH-23','MH-24','MH-25',
+  'MH-26','MH-27','MH-28','MH-29','MH-30','MH-31','MH-32','MH-33',
+  'MH-34','MH-35','MH-36','MH-37','MH-38','MH-39','MH-40','MH-41',
+  'MH-42','MH-43','MH-44','MH-45','MH-46','MH-47','MH-48','MN-01',
+  'MN-02','ML-01','ML-02','MZ-01','NL-01','OD-01','OD-02','OD-03',
+  'OD-04','OD-05','OD-06','OD-07','OD-08','OD-09','OD-10','OD-11',
+  'OD-12','OD-13','OD-14','OD-15','OD-16','OD-17','OD-18','OD-19',
+  'OD-20','OD-21','PB-01','PB-02','PB-03','PB-04','PB-05','PB-06',
+  'PB-07','PB-08','PB-09','PB-10','PB-11','PB-12','PB-13','RJ-01',
+  'RJ-02','RJ-03','RJ-04','RJ-05','RJ-06','RJ-07','RJ-08','RJ-09',
+  'RJ-10','RJ-11','RJ-12','RJ-13','RJ-14','RJ-15','RJ-16','RJ-17',
+  'RJ-18','RJ-19','RJ-20','RJ-21','RJ-22','RJ-23','RJ-24','RJ-25',
+  'SK-01','TN-01','TN-02','TN-03','TN-04','TN-05','TN-06','TN-07',
+  'TN-08','TN-09','TN-10','TN-11','TN-12','TN-13','TN-14','TN-15',
+  'TN-16','TN-17','TN-18','TN-19','TN-20','TN-21','TN-22','TN-23',
+  'TN-24','TN-25','TN-26','TN-27','TN-28','TN-29','TN-30','TN-31',
+  'TN-32','TN-33','TN-34','TN-35','TN-36','TN-37','TN-38','TN-39',
+  'TS-01','TS-02','TS-03','TS-04','TS-05','TS-06','TS-07','TS-08',
+  'TS-09','TS-10','TS-11','TS-12','TS-13','TS-14','TS-15','TS-16',
+  'TS-17','TR-01','TR-02','UP-01','UP-02','UP-03','UP-04','UP-05',
+  'UP-06','UP-07','UP-08','UP-09','UP-10','UP-11','UP-12','UP-13',
+  'UP-14','UP-15','UP-16','UP-17','UP-18','UP-19','UP-20','UP-21',
+  'UP-22','UP-23','UP-24','UP-25','UP-26','UP-27','UP-28','UP-29',
+  'UP-30','UP-31','UP-32','UP-33','UP-34','UP-35','UP-36','UP-37',
+  'UP-38','UP-39','UP-40','UP-41','UP-42','UP-43','UP-44','UP-45',
+  'UP-46','UP-47','UP-48','UP-49','UP-50','UP-51','UP-52','UP-53',
+  'UP-54','UP-55','UP-56','UP-57','UP-58','UP-59','UP-60','UP-61',
+  'UP-62','UP-63','UP-64','UP-65','UP-66','UP-67','UP-68','UP-69',
+  'UP-70','UP-71','UP-72','UP-73','UP-74','UP-75','UP-76','UP-77',
+  'UP-78','UP-79','UP-80','UK-01','UK-02','UK-03','UK-04','UK-05',
+  'WB-01','WB-02','WB-03','WB-04','WB-05','WB-06','WB-07','WB-08',
+  'WB-09','WB-10','WB-11','WB-12','WB-13','WB-14','WB-15','WB-16',
+  'WB-17','WB-18','WB-19','WB-20','WB-21','WB-22','WB-23','WB-24',
+  'WB-25','WB-26','WB-27','WB-28','WB-29','WB-30','WB-31','WB-32',
+  'WB-33','WB-34','WB-35','WB-36','WB-37','WB-38','WB-39','WB-40',
+  'WB-41','WB-42','AN-01','CH-01','DD-01','DD-02','DL-01','DL-02',
+  'DL-03','DL-04','DL-05','DL-06','DL-07','JK-01','JK-02','JK-03',
+  'JK-04','JK-05','LA-01','LD-01','PY-01','Adilabad','Agar Malwa','Agra',
+  'Ahmedabad','Ahmednagar','Aizawl','Ajmer','Akola','Alappuzha','Aligarh','Alipurduar',
+  'Alirajpur','Alluri Sitharama Raju','Alwar','Ambala','Ambedkar Nagar','Amethi','Amravati','Amreli',
+  'Amritsar','Amroha','Anakapalli','Anand','Ananthapuramu','Anantnag','Anjaw','Annamayya',
+  'Anupgarh','Anuppur','Araria','Aravalli','Ariyalur','Arwal','Ashok Nagar','Auraiya',
+  'Aurangabad','Ayodhya','Azamgarh','Bagpat','Bahraich','Bajali','Baksa','Balaghat',
+  'Balangir','Ballia','Balod','Baloda Bazar','Balotra','Balrampur','Banaskantha','Banda',
+  'Bandipora','Banka','Bankura','Banswara','Bapatla','Barabanki','Baramulla','Baran',
+  'Bareilly','Bargarh','Barmer','Barnala','Barpeta','Barwani','Bastar','Basti',
+  'Bathinda','Beawar','Beed','Begusarai','Bemetara','Betul','Bhadohi','Bhadradri Kothagudem',
+  'Bhagalpur','Bhandara','Bharatpur','Bharuch','Bhavnagar','Bhilwara','Bhind','Bhiwani',
+  'Bhojpur','Bhopal','Bichom','Bijapur','Bijnor','Bikaner','Bilaspur','Birbhum',
+  'Bishnupur','Biswanath','Bokaro','Bongaigaon','Botad','Budaun','Buddhist Monasteries','Budgam',
+  'Bulandshahr','Buldhana','Bundi','Burhanpur','Buxar','Cachar','Central Delhi','Chamba',
+  'Champhai','Chandauli','Chandel','Chandrapur','Changlang','Charaideo','Charkhi Dadri','Chatra',
+  'Chengalpattu','Chennai','Chhatarpur','Chhindwara','Chhota Udaipur','Chirang','Chitrakoot','Chittoor',
+  'Chittorgarh','Churachandpur','Churu','Chümoukedima','Chümoukedima and Niuland','Coimbatore','Cooch Behar','Cuddalore',
+  'Cuttack','Dahod','Dakshin Dinajpur','Damoh','Dang','Dantewada','Darbhanga','Darjeeling',
+  'Darrang','Datia','Dausa','Deeg','Deoghar','Deoria','DevbhoomiDwarka','Dewas',
+  'Dhalai','Dhamtari','Dhanbad','Dhar','Dharmapuri','Dhemaji','Dhenkanal','Dholpur',
+  'Dhubri','Dhule','Dibang Valley','Dibrugarh','Didwana Kuchaman','Dima Hasao','Dimapur','Dindigul',
+  'Dindori','Doda','Dudu','Dumka','Dungarpur','Durg','East Champaran','East Delhi',
+  'East Garo Hills','East Godavari','East Jaintia Hill','East Kameng','East Khasi Hills','East Siang','East Singhbhum','Eastern West Khasi Hills',
+  'Eluru','Ernakulam','Erode','Etah','Etawah','Faridabad','Faridkot','Farrukhabad',
+  'Fatehabad','Fatehgarh Sahib','Fatehpur','Fazilka','Firozabad','Firozpur','Gadchiroli','Gajapati',
+  'Ganderbal','Gandhinagar','Ganganagar','Gangapur City','Gangtok','Ganjam','Garhwa','Gariaband',
+  'Gaurela-Pendra-Marwahi','Gautam Budh Nagar','Gaya','Ghaziabad','Ghazipur','Gir Somnath','Giridih','Goalpara',
+  'Godda','Golaghat','Gomati','Gonda','Gondiya','Gopalganj','Gorakhpur','Gumla',
+  'Guna','Guntur','Gurdaspur','Gurgaon','Gwalior','Gyalshing','Hailakandi','Hamirpur',
+  'Hanumakonda','Hanumangarh','Hapur','Harda','Hardoi','Hathras','Hazaribagh','Hingoli',
+  'Hisar','Hnahthial','Hojai','Hooghly','Hoshiarpur','Howrah','Hyderabad','Idukki',
+  'Imphal East','Imphal West','Indore','Jabalpur','Jagatsinghpur','Jagtial','Jaipur','Jaipur Rural',
+  'Jaisalmer','Jalandhar','Jalaun','Jalgaon','Jalna','Jalore','Jalpaiguri','Jammu',
+  'Jamnagar','Jamtara','Jamui','Jangaon','Janjgir–Champa','Jashpur','Jaunpur','Jayashankar Bhupalpally',
+  'Jehanabad','Jhabua','Jhajjar','Jhalawar','Jhansi','Jhargram','Jharsuguda','Jhunjhunu',
+  'Jind','Jodhpur','Jodhpur Rural','Jogulamba Gadwal','Jorhat','Junagadh','Kabirdham','Kachchh',
+  'Kaimur','Kaithal','Kakinada','Kalahandi','Kalimpong','Kallakurichi','Kamareddy','Kamle',
+  'Kamrup','Kamrup Metro','Kancheepuram','Kangra','Kanker','Kannauj','Kanniyakumari','Kannur',
+  'Kanpur Dehat','Kanpur Nagar','Kapurthala','Karaikal','Karauli','Karbi Anglong','Karimganj','Karimnagar',
+  'Karnal','Karur','Kasargod','Kasganj','Kathua','Katihar','Katni','Kaushambi',
+  'Kekri','Kendrapara','Kendujhar','Keyi Panyor','Khagaria','Khairthal-Tijara','Khammam','Khandwa',
+  'Khargone','Khawzawl','Kheda','Khordha','Khowai','Khunti','Kinnaur','Kiphire',
+  'Kishanganj','Kishtawar','Kodarma','Kohima','Kokrajhar','Kolasib','Kolhapur','Kolkata',
+  'Kollam','Komaram Bheem Asifabad','Konaseema','Kondagaon','Koraput','Korba','Koriya','Kota',
+  'Kotputli-Behror','Kottayam','Kozhikode','Kra-Daadi','Krishna','Krishnagiri','Kulgam','Kullu',
+  'Kupwara','Kurnool','Kurukshetra','Kurung Kumey','Kushinagar','Lahaul and Spiti','Lakhimpur','Lakhimpur Kheri',
+  'Lakhisarai','Lalitpur','Latehar','Latur','Lawngtlai','Lepa Rada','Lohardaga','Lohit',
+  'Longding','Longleng','Lower Dibang Valley','Lower Siang','Lower Subansiri','Lucknow','Ludhiana','Lunglei',
+  'Madhepura','Madhubani','Madurai','Mahabubnagar','Maharajganj','Mahasamund','Mahbubabad','Mahbubnagar',
+  'Mahe','Mahendragarh','Mahesana','Mahisagar','Mahoba','Mainpuri','Majuli','Malappuram',
+  'Maldah','Malerkotla','Mamit','Mancherial','Mandi','Mandla','Mandsaur','Manendragarh-Chirmiri-Bharatpur',
+  'Mangan','Mansa','Marigaon','Markapuram','Mathura','Mau','Mauganj','Mayiladuthurai',
+  'Mayurbhanj','Medak','Medchal-Malkajgiri','Meerut','Mirzapur','Moga','Mohali','Mokokchung',
+  'Mon','Moradabad','Morbi','Morena','Mulugu','Mumbai City','Mumbai Suburban','Mungeli',
+  'Munger','Murshidabad','Muzaffarnagar','Muzaffarpur','NTR','Nabarangpur','Nadia','Nagaon',
+  'Nagapattinam','Nagarkurnool','Nagaur','Nagpur','Nalanda','Nalbari','Nalgonda','Namakkal',
+  'Namchi','Namsai','Nanded','Nandurbar','Nandyal','Narayanpet','Narayanpur','Narmada',
+  'Narmadapuram','Narsinghpur','Nashik','Navsari','Nawada','Neem Ka Thana','Neemuch','Nellore',
+  'New Delhi','Nilgiris','Nirmal','Niwari','Nizamabad','Noklak','North 24 Parganas','North Delhi',
+  'North East Delhi','North Garo Hills','North Goa','North Tripura','North West Delhi','Nuh','Osmanabad','Pakke-Kessang',
+  'Pakur','Pakyong','Palakkad','Palamu','Palghar','Pali','Palnadu','Palwal',
+  'Panchkula','Panchmahal','Panipat','Panna','Papum Pare','Parbhani','Parvathipuram Manyam','Paschim Bardhaman',
+  'Paschim Medinipur','Patan','Pathanamthitta','Pathankot','Patiala','Patna','Peddapalli','Perambalur',
+  'Peren','Phalodi','Phek','Pilibhit','Polavaram','Poonch','Porbandar','Prakasam',
+  'Pratapgarh','Prayagraj','Pudukkottai','Pulwama','Pune','Purba Bardhaman','Purba Medinipur','Purnia',
+  'Purulia','Raebareli','Raigad','Raigarh','Raipur','Raisen','Rajanna Sircilla','Rajgarh',
+  'Rajkot','Rajnandgaon','Rajouri','Rajsamand','Ramanathapuram','Ramban','Ramgarh','Rampur',
+  'Ranchi','Ranga Reddy','Ranipet','Ratlam','Ratnagiri','Reasi','Rewa','Rewari',
+  'Ri Bhoi','Rohtak','Rohtas','Rupnagar','S.B.S. Nagar','Sabarkantha','Sagar','Saharanpur',
+  'Saharsa','Sahibganj','Saiha','Saitual','Salem','Salumbar','Samastipur','Samba',
+  'Sambalpur','Sambhal','Sanchore','Sangareddy','Sangli','Sangrur','Sant Kabir Nagar','Saran',
+  'Satara','Satna','Sawai Madhopur','Sehore','Senapati','Seoni','Seraikela Kharsawan','Serchhip',
+  'Shahdara','Shahdol','Shahjahanpur','Shahpura','Shajapur','Shamator','Shamli','Sheikhpura',
+  'Sheohar','Sheopur','Shi Yomi','Shimla','Shivpuri','Shopian','Shrawasti','Siang',
+  'Sibsagar','Siddharthnagar','Siddipet','Sidhi','Sikar','Simdega','Sindhudurg','Singrauli',
+  'Sipahijala','Sirmaur','Sirohi','Sirsa','Sitamarhi','Sitapur','Sivaganga','Siwan',
+  'Solan','Solapur','Sonbhadra','Sonipat','Sonitpur','Soreng','South 24 Parganas','South Delhi',
+  'South East Delhi','South Garo Hills','South Goa','South Salmara Mankachar','South Tripura','South West Garo Hills','South West Khasi Hills','Sri Muktsar Sahib',
+  'Sri Sathya Sai','Srikakulam','Srinagar','Subarnapur','Sukma','Sultanpur','Sundargarh','Supaul',
+  'Surajpur','Surat','Surendranagar','Surguja','Suryapet','Tamenglong','Tapi','Tarn Taran',
+  'Tawang','Tenkasi','Thane','Thanjavur','Theni','Thiruvallur','Thiruvananthapuram','Thiruvarur',
+  'Thoothukudi','Thoubal','Thrissur','Tikamgarh','Tinsukia','Tirap','Tiruchirappalli','Tirunelveli',
+  'Tirupati','Tirupattur','Tiruppur','Tiruvannamalai','Tonk','Tseminyü','Tuensang','Udaipur',
+  'Udalguri','Udhampur','Ujjain','Ukhrul','Umaria','Una','Unakoti','Unnao',
+  'Upper Siang','Upper Subansiri','Uttar Dinajpur','Vadodara','Vaishali','Valsad','Varanasi','Vav-Tharad',
+  'Vellore','Vidisha','Vikarabad','Viluppuram','Virudhunagar','Visakhapatnam','Vizianagaram','Warangal',
+  'Wardha','Washim','Wayanad','West Champaran','West Delhi','West Garo Hills','West Godavari','West Jaintia Hill',
+  'West Kameng','West Karbi Anglong','West Khasi Hills','West Siang','West Singhbhum','West Tripura','Wokha','YSR Kadapa',
+  'Yadadri Bhuvanagiri','Yamunanagar','Yanam','Yavatmal','Zünheboto',
+];
+
+// AC IDs are stored as numbers: state code index * 1000 + AC number
+export function acId(key) {
+  return `${strings[Math.floor(key / 1000)]}-AC-${String(key % 1000).padStart(3, '0')}`;
+}
+
+// Digests recorded by the dependent modules (checked by scripts/validate_data.py)
+// tableDigest 05cb28c7c3
+// stableDigest 477f5c8b8e
+
+export default strings;
@@ -0,0 +1,87 @@
+import dataAssets from '../data/dataAssets';
+
+const ARRAY_TYPES = { Uint8: Uint8Array, Uint16: Uint16Array, Uint32: Uint32Array };
+const loaded = {};
+
+/**
+ * Decode a columnar binary table written by scripts/data_assets.py.
+ * Returns an array of row objects, or { key: [values] } when the table
+ * was written with groupBy.
+ */
+export function decodeTable(buffer) {
+  const headerLength = new DataView(buffer).getUint32(4, true);
+  const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 8, headerLength)));
+  const dataStart = (8 + headerLength + 3) & ~3;
+  const columns = header.fields.map(field => [
+    field,
+    new ARRAY_TYPES[field.array](buffer, dataStart + field.offset, header.rows),
+  ]);
+
+  const rows = new Array(header.rows);
+  for (let i = 0; i < header.rows; i++) {
+    const row = {};
+    for (const [field, values] of columns) {
+      const value = values[i];
+      if (field.type !== 'str') row[field.name] = value;
+      else if (value) row[field.name] = header.strings[value - 1];
+    }
+    rows[i] = row;
+  }
+  if (!header.groupBy) return rows;
+
+  const { key, value } = header.groupBy;
+  const grouped = {};
+  for (const row of rows) {
+    (grouped[row[key]] ||= []).push(row[value]);
+  }
+  return grouped;
+}
+
+function loadFile(file) {
+  if (!loaded[file]) {
+    loaded[file] = fetch(import.meta.env.BASE_URL + file).then(res => {
+      if (!res.ok) throw new Error(`Failed to load ${file}: ${res.status}`);
+      return file.endsWith('.bin') ? res.arrayBuffer().then(decodeTable) : res.json();
+    });
+  }
+  return loaded[file];
+}
+
+/**
+ * Fetch a content-hashed data asset by name (e.g. 'pcToAcMapping').
+ * The promise is cached, so each asset is fetched and decoded once.
+ */
+export function loadDataAsset(name) {
+  const file = dataAssets[name];
+  if (!file) return Promise.reject(new Error(`Unknown data asset: ${name}`));
+  return loadFile(file);
+}
+
+/**
+ * Fetch one state's shard of a sharded asset, e.g.
+ * loadStateShard('assemblyConstituencies', 'AP'). Resolves to [] for a
+ * state the index does not list.
+ */
+export function loadStateShard(name, stateCode) {
+  return loadDataAsset(`${name}Index`).then(index => {
+    const shard = index.states[stateCode];
+    return shard ? loadFile(shard.file) : [];
+  });
+}
+
+/**
+ * Fetch the tiles of a tiled asset (e.g. 'acGeometry') whose bounding box
+ * intersects view = [x0, y0, x1, y1], in map viewBox units. Resolves to
+ * { scale, features }, features being { id, path, labelX, labelY } in
+ * 1/scale viewBox units (draw them inside a scale(1 / scale) transform).
+ */
+export function loadTilesInView(name, view) {
+  const [x0, y0, x1, y1] = view;
+  return loadDataAsset(`${name}Index`).then(index => {
+    const files = Object.values(index.tiles)
+      .filter(({ bbox }) => bbox[0] <= x1 && bbox[2] >= x0 && bbox[1] <= y1 && bbox[3] >= y0)
+      .map(tile => tile.file);
+    return Promise.all(files.map(loadFile))
+      .then(tiles => ({ scale: index.scale, features: tiles.flat() }));
+  });
+}